@@ -1,7 +1,24 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithMibIndex(build_py):
+	"""Regenerate the precompiled MIB symbol index and the slim MIB if the MIB is newer"""
+	def run(self):
+		from ups_apc_snmp import mibindex, mibtrim
+		mib_path = os.path.join(os.path.dirname(mibindex.INDEX_DIR), 'PowerNet-MIB.py')
+		if not os.path.exists(mibindex.INDEX_PATH) or os.path.getmtime(mib_path) > os.path.getmtime(mibindex.INDEX_PATH):
+			mibindex.build_index(os.path.dirname(mib_path))
+		slim_mib_path = os.path.join(mibtrim.SLIM_MIB_DIR, mibtrim.MIB_FILE)
+		if not os.path.exists(slim_mib_path) or os.path.getmtime(mib_path) > os.path.getmtime(slim_mib_path):
+			mibtrim.trim_mib(mib_path, slim_mib_path)
+		build_py.run(self)
+
 
 setup(name='check_ups_apc.py',
 	version='0.14',
@@ -9,7 +26,14 @@ setup(name='check_ups_apc.py',
 	author='Lukas Schauer, Dr. Torge Szczepanek',
 	author_email='debian@cygnusnetworks.de',
 	license='Apache 2.0',
-	packages=['ups_apc_snmp'],
-	entry_points={'console_scripts': ["check_ups_apc = ups_apc_snmp.nagios_plugin:main"]},
+	packages=['ups_apc_snmp', 'ups_apc_snmp.mibsymbols'],
+	package_data={'ups_apc_snmp': ['slimmib/PowerNet-MIB.py']},
+	entry_points={'console_scripts': [
+		"check_ups_apc = ups_apc_snmp.nagios_plugin:main",
+		"check_ups_apc_daemon = ups_apc_snmp.daemon:main",
+		"check_ups_apc_client = ups_apc_snmp.client:main",
+		"check_ups_apc_capabilities = ups_apc_snmp.capabilities:main",
+	]},
+	cmdclass={'build_py': BuildPyWithMibIndex},
 	zip_safe=False,
-	install_requires=['configparser', 'nagiosplugin', 'pysnmp'])
+	install_requires=['configparser', 'futures; python_version < "3"', 'nagiosplugin', 'pysnmp'])
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Minimal SNMPv2c agent on a local UDP port, answering GET, GETNEXT and GETBULK from a dict of oid to value"""
+
+import bisect
+import socket
+import threading
+
+from pyasn1.codec.ber import decoder, encoder
+from pysnmp.proto import api, rfc1902, rfc1905
+
+
+class SnmpAgent(object):
+	"""Agent answering requests of one community, keeping the oids of each request received in requests"""
+
+	def __init__(self, objects, community='public'):
+		self.objects = dict((rfc1902.ObjectName(oid), value) for oid, value in objects.items())
+		self.sorted_oids = sorted(self.objects)
+		self.community = community
+		self.requests = []
+		self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		self.socket.bind(('127.0.0.1', 0))
+		self.socket.settimeout(0.1)
+		self.port = self.socket.getsockname()[1]
+		self.__stopped = threading.Event()
+		self.__thread = threading.Thread(target=self.__serve)
+		self.__thread.daemon = True
+
+	def __enter__(self):
+		self.__thread.start()
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.__stopped.set()
+		self.__thread.join()
+		self.socket.close()
+
+	def __serve(self):
+		while not self.__stopped.is_set():
+			try:
+				message, address = self.socket.recvfrom(65536)
+			except socket.timeout:
+				continue
+			response = self.respond(message)
+			if response is not None:
+				self.socket.sendto(response, address)
+
+	def __next(self, oid):
+		position = bisect.bisect_right(self.sorted_oids, oid)
+		if position < len(self.sorted_oids):
+			return self.sorted_oids[position], self.objects[self.sorted_oids[position]]
+		return oid, rfc1905.endOfMibView
+
+	def respond(self, message):
+		"""Encoded response to an encoded request, None for requests of other communities"""
+		proto = api.protoModules[api.protoVersion2c]
+		request, _ = decoder.decode(message, asn1Spec=proto.Message())
+		request_pdu = proto.apiMessage.getPDU(request)
+		oids = [rfc1902.ObjectName(oid) for oid, _ in proto.apiPDU.getVarBinds(request_pdu)]
+		self.requests.append(oids)
+		if str(proto.apiMessage.getCommunity(request)) != self.community:
+			return None
+		if request_pdu.isSameTypeWith(proto.GetRequestPDU()):
+			varbinds = [(oid, self.objects.get(oid, rfc1905.noSuchObject)) for oid in oids]
+		elif request_pdu.isSameTypeWith(proto.GetNextRequestPDU()):
+			varbinds = [self.__next(oid) for oid in oids]
+		else:
+			non_repeaters = int(proto.apiBulkPDU.getNonRepeaters(request_pdu))
+			varbinds = [self.__next(oid) for oid in oids[:non_repeaters]]
+			current = oids[non_repeaters:]
+			for _ in range(int(proto.apiBulkPDU.getMaxRepetitions(request_pdu))):
+				row = [self.__next(oid) for oid in current]
+				varbinds.extend(row)
+				current = [oid for oid, _ in row]
+		response = proto.apiMessage.getResponse(request)
+		response_pdu = proto.apiMessage.getPDU(response)
+		proto.apiPDU.setVarBinds(response_pdu, varbinds)
+		return encoder.encode(response)
+
+
+# Objects of a healthy UPS with HighPrec objects and state flags, by name
+UPS_OBJECTS = {
+	'SNMPv2-MIB::sysDescr.0': rfc1902.OctetString('APC Web/SNMP Management Card (MB:v4.1.0 PF:v6.4.6 PN:apc_hw05_aos_646.bin AF1:v6.4.6 AN1:apc_hw05_sumx_646.bin MN:AP9630 HR:05 SN: ZA1234567890 MD:01/01/2020)'),
+	'SNMPv2-MIB::sysName.0': rfc1902.OctetString('ups1'),
+	'SNMPv2-MIB::sysUpTime.0': rfc1902.TimeTicks(360000000),
+	'PowerNet-MIB::upsBasicIdentModel.0': rfc1902.OctetString('Smart-UPS 1500'),
+	'PowerNet-MIB::upsAdvIdentFirmwareRevision.0': rfc1902.OctetString('UPS 09.3 (ID18)'),
+	'PowerNet-MIB::upsAdvTestLastDiagnosticsDate.0': rfc1902.OctetString('01/01/2030'),
+	'PowerNet-MIB::upsAdvTestDiagnosticsResults.0': rfc1902.Integer(1),
+	'PowerNet-MIB::upsHighPrecBatteryCapacity.0': rfc1902.Gauge32(1000),
+	'PowerNet-MIB::upsHighPrecBatteryActualVoltage.0': rfc1902.Integer(272),
+	'PowerNet-MIB::upsHighPrecBatteryTemperature.0': rfc1902.Gauge32(250),
+	'PowerNet-MIB::upsAdvBatteryRunTimeRemaining.0': rfc1902.TimeTicks(360000),
+	'PowerNet-MIB::upsHighPrecInputLineVoltage.0': rfc1902.Gauge32(2300),
+	'PowerNet-MIB::upsHighPrecInputMinLineVoltage.0': rfc1902.Gauge32(2280),
+	'PowerNet-MIB::upsHighPrecInputMaxLineVoltage.0': rfc1902.Gauge32(2320),
+	'PowerNet-MIB::upsHighPrecInputFrequency.0': rfc1902.Gauge32(500),
+	'PowerNet-MIB::upsAdvInputLineFailCause.0': rfc1902.Integer(1),
+	'PowerNet-MIB::upsHighPrecOutputVoltage.0': rfc1902.Gauge32(2300),
+	'PowerNet-MIB::upsHighPrecOutputCurrent.0': rfc1902.Gauge32(21),
+	'PowerNet-MIB::upsHighPrecOutputLoad.0': rfc1902.Gauge32(150),
+	'PowerNet-MIB::upsHighPrecOutputFrequency.0': rfc1902.Gauge32(500),
+	'PowerNet-MIB::upsHighPrecOutputEfficiency.0': rfc1902.Integer(950),
+	'PowerNet-MIB::upsBasicStateOutputState.0': rfc1902.OctetString('0001' + '0' * 60),
+	'PowerNet-MIB::upsBasicOutputStatus.0': rfc1902.Integer(2),
+	'PowerNet-MIB::upsBasicBatteryStatus.0': rfc1902.Integer(2),
+	'PowerNet-MIB::upsAdvBatteryReplaceIndicator.0': rfc1902.Integer(1),
+}
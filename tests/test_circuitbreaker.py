@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from ups_apc_snmp.circuitbreaker import CircuitBreaker
+
+ERROR = dict(status=False, error_indication='No SNMP response received before timeout')
+
+
+class CircuitBreakerTest(unittest.TestCase):
+	def test_closed(self):
+		breaker = CircuitBreaker()
+		self.assertFalse(breaker.is_open(now=1000))
+		self.assertEqual(breaker.failures, 0)
+
+	def test_open_half_open_closed(self):
+		breaker = CircuitBreaker()
+		breaker.record_failure(ERROR, 60, 1800, now=1000)
+		self.assertTrue(breaker.is_open(now=1000))
+		self.assertTrue(breaker.is_open(now=1059))
+		self.assertEqual(breaker.error, ERROR)
+		# half open: the backoff is over, the failures are kept until the next poll tells
+		self.assertFalse(breaker.is_open(now=1060))
+		self.assertEqual(breaker.failures, 1)
+		breaker.record_success()
+		self.assertFalse(breaker.is_open(now=1060))
+		self.assertEqual((breaker.failures, breaker.retry_at, breaker.error), (0, 0, None))
+
+	def test_failed_probe_opens_again(self):
+		breaker = CircuitBreaker()
+		breaker.record_failure(ERROR, 60, 1800, now=1000)
+		breaker.record_failure(ERROR, 60, 1800, now=1060)
+		self.assertTrue(breaker.is_open(now=1179))
+		self.assertFalse(breaker.is_open(now=1180))
+
+	def test_backoff_doubles_up_to_maximum(self):
+		breaker = CircuitBreaker()
+		backoffs = []
+		for _ in range(8):
+			breaker.record_failure(ERROR, 60, 1800, now=1000)
+			backoffs.append(breaker.retry_at - 1000)
+		self.assertEqual(backoffs, [60, 120, 240, 480, 960, 1800, 1800, 1800])
+
+	def test_backoff_after_many_failures(self):
+		breaker = CircuitBreaker(failures=10000)
+		breaker.record_failure(ERROR, 60, 1800, now=1000)
+		self.assertEqual(breaker.retry_at, 2800)
+
+	def test_success_resets_backoff(self):
+		breaker = CircuitBreaker()
+		for _ in range(3):
+			breaker.record_failure(ERROR, 60, 1800, now=1000)
+		breaker.record_success()
+		breaker.record_failure(ERROR, 60, 1800, now=2000)
+		self.assertEqual(breaker.retry_at, 2060)
+
+	def test_persistence(self):
+		breaker = CircuitBreaker()
+		breaker.record_failure(ERROR, 60, 1800, now=1000)
+		breaker.record_failure(ERROR, 60, 1800, now=1060)
+		restored = CircuitBreaker.from_dict(breaker.to_dict())
+		self.assertEqual((restored.failures, restored.retry_at, restored.error), (2, 1180, ERROR))
+		self.assertTrue(restored.is_open(now=1179))
+
+	def test_invalid_saved_state(self):
+		for saved in (None, {}, dict(failures='x', retry_at=0), dict(failures=1), 'breaker'):
+			breaker = CircuitBreaker.from_dict(saved)
+			self.assertEqual((breaker.failures, breaker.retry_at, breaker.error), (0, 0, None), saved)
+
+
+if __name__ == '__main__':
+	unittest.main()
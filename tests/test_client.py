@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+try:
+	from StringIO import StringIO
+except ImportError:
+	from io import StringIO
+
+try:
+	from unittest import mock
+except ImportError:
+	import mock
+
+import ups_apc_snmp.client
+import ups_apc_snmp.daemon
+import ups_apc_snmp.nagios_plugin
+import ups_apc_snmp.snmpclient
+from ups_apc_snmp.snmpclient import nodeid
+
+from snmpagent import SnmpAgent, UPS_OBJECTS
+
+ups_apc_snmp.nagios_plugin.add_mib_paths()
+
+
+def run_client(argv):
+	"""Exit code and output of the client for a command line"""
+	with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+		try:
+			ups_apc_snmp.client.main(argv)
+		except SystemExit as e:
+			return e.code, stdout.getvalue()
+	raise AssertionError("The client did not exit")
+
+
+class ClientTest(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.directory)
+		self.socket = os.path.join(self.directory, 'check_ups_apc.sock')
+
+	def check_args(self, *argv):
+		return list(argv) + ['-c', os.path.join(self.directory, 'check_ups_apc.conf'), '--cache-dir', self.directory, '-s', '1', '-r', '1']
+
+	def test_round_trip(self):
+		with SnmpAgent(dict((nodeid(name), value) for name, value in UPS_OBJECTS.items())) as agent, mock.patch.object(ups_apc_snmp.snmpclient, 'resolve', lambda host, port=161: ('127.0.0.1', agent.port)):
+			server = ups_apc_snmp.daemon.CheckDaemon(self.socket)
+			thread = threading.Thread(target=server.serve_forever)
+			thread.start()
+			try:
+				exitcode, output = run_client(self.check_args('--socket', self.socket, '-H', 'ups1', '-t', '10'))
+			finally:
+				server.shutdown()
+				thread.join()
+				server.server_close()
+		self.assertEqual(exitcode, 0, output)
+		self.assertTrue(output.startswith('UPSAPC OK - Smart-UPS 1500'), output)
+		self.assertIn('snmp_requests=2', output)
+
+	def test_daemon_down(self):
+		exitcode, output = run_client(['--socket', self.socket, '-H', 'ups1'])
+		self.assertEqual(exitcode, 3)
+		self.assertTrue(output.startswith('UPSAPC UNKNOWN - Check daemon on %s is not available' % self.socket), output)
+
+	def test_socket_from_environment(self):
+		with mock.patch.dict(os.environ, CHECK_UPS_APC_SOCKET=self.socket):
+			exitcode, output = run_client(['-H', 'ups1'])
+		self.assertEqual(exitcode, 3)
+		self.assertIn(self.socket, output)
+
+	def test_socket_without_path(self):
+		exitcode, output = run_client(['-H', 'ups1', '--socket'])
+		self.assertEqual(exitcode, 3)
+		self.assertTrue(output.startswith('UPSAPC UNKNOWN - argument -S/--socket: expected one argument'), output)
+
+	def test_help_lists_socket(self):
+		exitcode, output = run_client(['--help'])
+		self.assertEqual(exitcode, 0)
+		self.assertIn('--socket', output)
+
+	def test_check_options_are_passed_on(self):
+		sent = []
+		connection = mock.Mock()
+		connection.sendall.side_effect = sent.append
+		connection.recv.side_effect = [b'{"exitcode": 0, "output": "UPSAPC OK"}', b'']
+		with mock.patch('socket.socket', return_value=connection):
+			exitcode, output = run_client(['-H', 'ups1', '--socket', self.socket, '-C', 'private', '-t', '12'])
+		self.assertEqual((exitcode, output), (0, 'UPSAPC OK\n'))
+		self.assertEqual(sent, [b'{"argv": ["-H", "ups1", "-C", "private", "--timeout", "12"]}'])
+		connection.connect.assert_called_once_with(self.socket)
+		connection.settimeout.assert_called_once_with(17)
+
+
+if __name__ == '__main__':
+	unittest.main()
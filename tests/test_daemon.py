@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+	from unittest import mock
+except ImportError:
+	import mock
+
+import ups_apc_snmp.daemon
+import ups_apc_snmp.nagios_plugin
+import ups_apc_snmp.snmpclient
+from ups_apc_snmp.snmpclient import nodeid
+
+from snmpagent import SnmpAgent, UPS_OBJECTS
+
+ups_apc_snmp.nagios_plugin.add_mib_paths()
+
+
+class DaemonTest(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.agent = SnmpAgent(dict((nodeid(name), value) for name, value in UPS_OBJECTS.items()))
+		self.agent.__enter__()
+		resolve = mock.patch.object(ups_apc_snmp.snmpclient, 'resolve', lambda host, port=161: ('127.0.0.1', self.agent.port))
+		resolve.start()
+		self.addCleanup(resolve.stop)
+		self.server = ups_apc_snmp.daemon.CheckDaemon(os.path.join(self.directory, 'check_ups_apc.sock'))
+
+	def tearDown(self):
+		self.server.server_close()
+		self.agent.__exit__(None, None, None)
+		shutil.rmtree(self.directory)
+
+	def check(self, host='ups1'):
+		return self.server.check(['-H', host, '-c', os.path.join(self.directory, 'check_ups_apc.conf'), '--cache-dir', self.directory, '-s', '1', '-r', '1'])
+
+	def test_repeated_checks_share_one_engine(self):
+		for _ in range(5):
+			exitcode, output = self.check()
+			self.assertEqual(exitcode, 0, output)
+			self.assertTrue(output.startswith('UPSAPC OK - Smart-UPS 1500'), output)
+		snmp_engine = self.server.acquire_engine()
+		self.assertTrue(self.server.engines.empty())
+		# the community is configured in the engine once, not once per check
+		lcd = snmp_engine.getUserContext('CommandGeneratorLcdConfigurator')
+		self.assertEqual(len(lcd['auth']), 1)
+		self.assertEqual(len(lcd['parm']), 1)
+
+	def test_single_host_only(self):
+		exitcode, output = self.server.check(['--hosts', 'ups1,ups2'])
+		self.assertEqual(exitcode, 3)
+		self.assertIn('only checks a single host', output)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+	from unittest import mock
+except ImportError:
+	import mock
+
+from ups_apc_snmp.hoststate import HostState, write_json_atomic
+
+
+class WriteJsonAtomicTest(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.directory)
+		self.path = os.path.join(self.directory, 'state.json')
+
+	def test_write(self):
+		write_json_atomic(self.path, dict(failures=1))
+		with open(self.path) as state_file:
+			self.assertEqual(json.load(state_file), dict(failures=1))
+		self.assertEqual(os.listdir(self.directory), ['state.json'])
+
+	def test_failed_write_keeps_old_file(self):
+		write_json_atomic(self.path, dict(failures=1))
+		self.assertRaises(TypeError, write_json_atomic, self.path, dict(failures=object()))
+		with open(self.path) as state_file:
+			self.assertEqual(json.load(state_file), dict(failures=1))
+		self.assertEqual(os.listdir(self.directory), ['state.json'])
+
+	def test_interrupted_write(self):
+		with mock.patch('json.dump', side_effect=KeyboardInterrupt):
+			self.assertRaises(KeyboardInterrupt, write_json_atomic, self.path, dict(failures=1))
+		self.assertEqual(os.listdir(self.directory), [])
+
+
+class HostStateTest(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.directory)
+
+	def test_round_trip(self):
+		state = HostState(os.path.join(self.directory, 'state'), 'ups1.example.com')
+		self.assertEqual(state.load(), {})
+		state.save(dict(pdu_budget=dict(max_oids=30)))
+		self.assertEqual(HostState(os.path.join(self.directory, 'state'), 'ups1.example.com').load(), dict(pdu_budget=dict(max_oids=30)))
+
+	def test_host_names_as_file_names(self):
+		state = HostState(self.directory, '../ups1/x')
+		self.assertEqual(os.path.dirname(state.path), self.directory)
+
+	def test_invalid_file(self):
+		state = HostState(self.directory, 'ups1')
+		with open(state.path, 'w') as state_file:
+			state_file.write('{')
+		self.assertEqual(state.load(), {})
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import marshal
+import os
+import shutil
+import tempfile
+import unittest
+
+from ups_apc_snmp import mibindex
+
+TABLE = ({'upsBasicIdentModel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 1, 1)}, {}, {})
+
+
+class WriteCacheTest(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.directory)
+
+	def cache_path(self, digest):
+		return os.path.join(self.directory, 'mib-PowerNet-MIB-%s-py27.marshal' % digest)
+
+	def test_write(self):
+		mibindex._write_cache(self.cache_path('aaaa'), TABLE)  # pylint: disable=W0212
+		with open(self.cache_path('aaaa'), 'rb') as cache_file:
+			self.assertEqual(marshal.loads(cache_file.read()), TABLE)
+
+	def test_replaces_other_versions(self):
+		mibindex._write_cache(self.cache_path('aaaa'), TABLE)  # pylint: disable=W0212
+		mibindex._write_cache(self.cache_path('bbbb'), TABLE)  # pylint: disable=W0212
+		self.assertEqual(os.listdir(self.directory), [os.path.basename(self.cache_path('bbbb'))])
+
+	def test_failed_write(self):
+		self.assertRaises(ValueError, mibindex._write_cache, self.cache_path('aaaa'), ({'upsBasicIdentModel': object()}, {}, {}))  # pylint: disable=W0212
+		self.assertEqual(os.listdir(self.directory), [])
+
+
+if __name__ == '__main__':
+	unittest.main()
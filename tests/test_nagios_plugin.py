@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import shutil
+import tempfile
+import time
+import unittest
+
+try:
+	from StringIO import StringIO
+except ImportError:
+	from io import StringIO
+
+try:
+	from unittest import mock
+except ImportError:
+	import mock
+
+from pysnmp.proto import rfc1902
+
+import ups_apc_snmp.capabilities
+import ups_apc_snmp.circuitbreaker
+import ups_apc_snmp.hoststate
+import ups_apc_snmp.nagios_plugin
+import ups_apc_snmp.snmpclient
+from ups_apc_snmp.nagios_plugin import build_argument_parser, check_fleet, check_host
+from ups_apc_snmp.snmpclient import Deadline, nodeid
+
+from snmpagent import SnmpAgent, UPS_OBJECTS
+
+ups_apc_snmp.nagios_plugin.add_mib_paths()
+
+
+def ups_objects():
+	return dict((nodeid(name), value) for name, value in UPS_OBJECTS.items())
+
+
+class AgentTest(unittest.TestCase):
+	"""Checks of the hosts ups1 and ups2 answered by one local agent, and of the host down answered by none"""
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.directory)
+		self.agent = SnmpAgent(self.objects())
+		# answers no request of the community checked
+		self.down = SnmpAgent(ups_objects(), community='private')
+		for agent in (self.agent, self.down):
+			agent.__enter__()
+			self.addCleanup(agent.__exit__, None, None, None)
+		ports = dict(ups1=self.agent.port, ups2=self.agent.port, down=self.down.port)
+		resolve = mock.patch.object(ups_apc_snmp.snmpclient, 'resolve', lambda host, port=161: ('127.0.0.1', ports[host]))
+		resolve.start()
+		self.addCleanup(resolve.stop)
+
+	@staticmethod
+	def objects():
+		return ups_objects()
+
+	def args(self, *argv):
+		return build_argument_parser().parse_args(['-c', os.path.join(self.directory, 'check_ups_apc.conf'), '--cache-dir', self.directory] + list(argv))
+
+	def check_fleet(self, args, hosts):
+		with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+			exitcode = check_fleet(args, hosts)
+		return exitcode, stdout.getvalue().splitlines()
+
+	def check(self, *argv):
+		"""Exit code and plugin output of a check of ups1"""
+		exitcode, lines = self.check_fleet(self.args('-s', '1', '-r', '0', *argv), ['ups1'])
+		return exitcode, lines[0].split(';', 4)[4]
+
+
+class FleetTest(AgentTest):
+	def test_passive_results(self):
+		exitcode, lines = self.check_fleet(self.args('--hosts', 'ups1,ups2', '-s', '1', '-r', '0'), ['ups1', 'ups2', 'down'])
+		self.assertEqual(exitcode, 2)
+		self.assertEqual(len(lines), 3)
+		results = dict((line.split(';')[1], line.split(';', 4)[3:]) for line in lines)
+		self.assertEqual(results['ups1'][0], '0')
+		self.assertTrue(results['ups1'][1].startswith('UPSAPC OK - Smart-UPS 1500'), results['ups1'])
+		self.assertEqual(results['ups2'][0], '0')
+		self.assertEqual(results['down'][0], '2')
+		self.assertTrue(results['down'][1].startswith('UPSAPC CRITICAL - Unreachable'), results['down'])
+		for line in lines:
+			self.assertTrue(re.match(r'\[\d+\] PROCESS_SERVICE_CHECK_RESULT;\w+;check_ups_apc;\d;', line), line)
+
+	def test_units_of_measure(self):
+		exitcode, output = self.check()
+		self.assertEqual(exitcode, 0, output)
+		self.assertTrue(re.search(r"'?battery_capacity'?=[\d.]+%;", output), output)
+		self.assertTrue(re.search(r"'?battery_run_time_remaining'?=[\d.]+s\b", output), output)
+
+	def test_fleet_timeout_stops_running_polls(self):
+		# without the fleet deadline the down host would be polled for 4 seconds
+		started = time.time()
+		exitcode, lines = self.check_fleet(self.args('--hosts', 'ups1', '-s', '1', '-r', '3', '--fleet-timeout', '2'), ['ups1', 'down'])
+		self.assertLess(time.time() - started, 2)
+		self.assertEqual(exitcode, 3)
+		results = dict((line.split(';')[1], line.split(';', 4)[3:]) for line in lines)
+		self.assertEqual(results['ups1'][0], '0')
+		self.assertEqual(results['down'][0], '3')
+		self.assertTrue(results['down'][1].startswith('UPSAPC UNKNOWN - Poll incomplete - Deadline of 1s reached'), results['down'])
+
+
+class CapabilityTest(AgentTest):
+	def test_profile_shared_by_model(self):
+		state_dir = os.path.join(self.directory, 'state')
+		args = self.args('--state-dir', state_dir, '-s', '1', '-r', '0')
+		self.assertEqual(self.check_fleet(args, ['ups1'])[0], 0)
+		registry = ups_apc_snmp.capabilities.CapabilityRegistry(ups_apc_snmp.capabilities.registry_dir(state_dir))
+		shared = registry.get('Smart-UPS 1500', 'UPS 09.3 (ID18)')
+		self.assertEqual(shared.model, 'Smart-UPS 1500')
+		self.assertIn('PowerNet-MIB::upsAdvBatteryCapacity.0', shared.missing)
+		self.assertNotIn('PowerNet-MIB::upsHighPrecBatteryCapacity.0', shared.missing)
+
+		self.assertEqual(self.check_fleet(args, ['ups2'])[0], 0)
+		profile = ups_apc_snmp.capabilities.CapabilityProfile.from_dict(ups_apc_snmp.hoststate.HostState(state_dir, 'ups2').load()['capabilities'])
+		self.assertEqual(profile.key, str(UPS_OBJECTS['SNMPv2-MIB::sysDescr.0']))
+		self.assertEqual(profile.missing, shared.missing)
+		self.assertEqual(profile.probed, shared.probed)
+
+
+class StateFlagsTest(AgentTest):
+	STATE_OIDS = [nodeid(name) for name in ('PowerNet-MIB::upsBasicOutputStatus.0', 'PowerNet-MIB::upsBasicBatteryStatus.0', 'PowerNet-MIB::upsAdvBatteryReplaceIndicator.0')]
+	FLAGS_OID = nodeid('PowerNet-MIB::upsBasicStateOutputState.0')
+
+	def set_flags(self, value):
+		if value is None:
+			del self.agent.objects[self.FLAGS_OID]
+			self.agent.sorted_oids.remove(self.FLAGS_OID)
+		else:
+			self.agent.objects[self.FLAGS_OID] = rfc1902.OctetString(value)
+
+	def test_states_from_flags(self):
+		# on battery by the flags, online by the state objects
+		self.set_flags('01' + '0' * 62)
+		exitcode, output = self.check()
+		self.assertEqual(exitcode, 1, output)
+		self.assertIn('snmp_requests=2', output)
+
+	def test_without_flags(self):
+		self.set_flags(None)
+		exitcode, output = self.check()
+		self.assertEqual(exitcode, 0, output)
+		# the state objects are read in the first request, not in one of their own
+		self.assertIn('snmp_requests=2', output)
+		self.assertEqual(len(self.agent.requests), 2)
+
+	def test_inconclusive_flags(self):
+		self.set_flags('0' * 64)
+		exitcode, output = self.check()
+		self.assertEqual(exitcode, 0, output)
+		self.assertIn('snmp_requests=2', output)
+
+	def test_profile_leaves_out_state_objects(self):
+		state_dir = os.path.join(self.directory, 'state')
+		self.check('--state-dir', state_dir)
+		self.assertTrue(set(self.STATE_OIDS) <= set(self.agent.requests[0]))
+		del self.agent.requests[:]
+		exitcode, output = self.check('--state-dir', state_dir)
+		self.assertEqual(exitcode, 0, output)
+		self.assertIn(self.FLAGS_OID, self.agent.requests[0])
+		self.assertFalse(set(self.STATE_OIDS) & set(self.agent.requests[0]))
+
+	def test_profile_without_flags(self):
+		self.set_flags(None)
+		state_dir = os.path.join(self.directory, 'state')
+		self.check('--state-dir', state_dir)
+		del self.agent.requests[:]
+		exitcode, output = self.check('--state-dir', state_dir)
+		self.assertEqual(exitcode, 0, output)
+		self.assertNotIn(self.FLAGS_OID, self.agent.requests[0])
+		self.assertTrue(set(self.STATE_OIDS) <= set(self.agent.requests[0]))
+
+
+class BreakerTest(AgentTest):
+	def check_down(self, *argv):
+		exitcode, lines = self.check_fleet(self.args('--state-dir', os.path.join(self.directory, 'state'), '-s', '1', *argv), ['down'])
+		return exitcode, lines[0].split(';', 4)[4]
+
+	def breaker(self):
+		return ups_apc_snmp.circuitbreaker.CircuitBreaker.from_dict(ups_apc_snmp.hoststate.HostState(os.path.join(self.directory, 'state'), 'down').load()['breaker'])
+
+	def end_backoff(self):
+		host_state = ups_apc_snmp.hoststate.HostState(os.path.join(self.directory, 'state'), 'down')
+		state = host_state.load()
+		state['breaker']['retry_at'] = time.time() - 1
+		host_state.save(state)
+
+	def test_open_half_open_closed(self):
+		exitcode, output = self.check_down('-r', '0')
+		self.assertEqual(exitcode, 2, output)
+		self.assertEqual(len(self.down.requests), 1)
+		self.assertEqual(self.breaker().failures, 1)
+
+		# open: the last error is reported without sending anything
+		exitcode, output_open = self.check_down('-r', '0')
+		self.assertEqual((exitcode, output_open), (2, output))
+		self.assertEqual(len(self.down.requests), 1)
+
+		# half open: a single packet despite retries, which fails again and doubles the backoff
+		self.end_backoff()
+		started = time.time()
+		exitcode, output = self.check_down('-r', '3')
+		self.assertEqual(exitcode, 2, output)
+		self.assertEqual(len(self.down.requests), 2)
+		breaker = self.breaker()
+		self.assertEqual(breaker.failures, 2)
+		self.assertAlmostEqual(breaker.retry_at - started, 120, delta=5)
+
+		# closed: the probe is the first request of a complete poll
+		self.end_backoff()
+		self.down.community = 'public'
+		del self.down.requests[:]
+		exitcode, output = self.check_down('-r', '3')
+		self.assertEqual(exitcode, 0, output)
+		self.assertIn(nodeid('SNMPv2-MIB::sysName.0'), self.down.requests[0])
+		self.assertIn(nodeid('PowerNet-MIB::upsBasicIdentModel.0'), self.down.requests[0])
+		self.assertIn('snmp_requests=2', output)
+		self.assertEqual(self.breaker().failures, 0)
+
+
+class CheckHostTest(unittest.TestCase):
+	def deadline(self, args, fleet_deadline):
+		with mock.patch.object(ups_apc_snmp.nagios_plugin, 'build_check') as build_check, mock.patch.object(ups_apc_snmp.nagios_plugin, 'run_check'):
+			check_host(args, None, 'ups1', fleet_deadline)
+		self.assertEqual(build_check.call_args[0][0].host, 'ups1')
+		return build_check.call_args[1]['deadline']
+
+	def test_check_timeout(self):
+		self.assertEqual(self.deadline(build_argument_parser().parse_args(['-t', '10']), Deadline(100)).seconds, 9)
+
+	def test_fleet_deadline(self):
+		self.assertAlmostEqual(self.deadline(build_argument_parser().parse_args(['-t', '10']), Deadline(5)).seconds, 5, places=1)
+
+	def test_at_least_one_second(self):
+		self.assertEqual(self.deadline(build_argument_parser().parse_args(['-t', '1']), Deadline(100)).seconds, 1)
+		self.assertEqual(self.deadline(build_argument_parser().parse_args(['-t', '10']), Deadline(0)).seconds, 1)
+
+	def test_workers_option(self):
+		self.assertEqual(build_argument_parser().parse_args(['--workers', '80']).workers, 80)
+		with mock.patch('sys.stderr', new_callable=StringIO):
+			self.assertRaises(SystemExit, build_argument_parser().parse_args, ['-w', '80'])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import unittest
+
+try:
+	from unittest import mock
+except ImportError:
+	import mock
+
+from pysnmp.entity import engine
+from pysnmp.proto import errind, rfc1902, rfc1905
+
+import ups_apc_snmp.snmpclient
+from ups_apc_snmp.snmpclient import Deadline, DeadlineExceeded, RttEstimator, SnmpClient, SnmpError, nodeid, snmp_auth_data_v2c
+
+ups_apc_snmp.snmpclient.add_mib_path(os.path.dirname(os.path.realpath(ups_apc_snmp.snmpclient.__file__)))
+
+
+class FakeTransport(object):
+	def __init__(self, address, timeout=1, retries=5):
+		self.transportAddr = address
+		self.timeout = timeout
+		self.retries = retries
+
+
+class FakeClock(object):
+	"""Stand-in for the time module, advanced by the FakeAgent"""
+
+	def __init__(self):
+		self.now = 1000.0
+
+	def time(self):
+		return self.now
+
+
+class FakeAgent(object):
+	"""Stand-in for the CommandGenerator of pysnmp, answering from a dict of oid to value like an SNMPv2c agent
+
+	The requests are sent through the observer of a real SNMP engine, with the
+	configuration of the engine taking configure_time and responses taking rtt
+	on the clock, the first lost packets and those slower than the timeout are not answered."""
+
+	def __init__(self, objects, max_oids=None, down=False, clock=None, rtt=0.01, configure_time=0, lost=0):  # pylint: disable=R0913
+		self.down = down
+		self.objects = dict((rfc1902.ObjectName(oid), value) for oid, value in objects.items())
+		self.sorted_oids = sorted(self.objects)
+		self.max_oids = max_oids
+		self.clock = clock if clock is not None else FakeClock()
+		self.rtt = rtt
+		self.configure_time = configure_time
+		self.lost = lost
+		self.requests = []
+		self.transports = []
+		self.snmpEngine = engine.SnmpEngine()
+
+	def __call__(self, snmp_engine=None):
+		return self
+
+	def __exchange(self, transport, size):
+		"""Send the packets of a request, whether it was answered"""
+		self.requests.append(size)
+		self.transports.append((transport.timeout, transport.retries))
+		self.clock.now += self.configure_time
+		for _ in range(transport.retries + 1):
+			self.snmpEngine.observer.storeExecutionContext(self.snmpEngine, 'rfc3412.sendPdu', {})
+			if self.down or self.lost or self.rtt >= transport.timeout:
+				self.lost = max(0, self.lost - 1)
+				self.clock.now += transport.timeout
+				continue
+			self.clock.now += self.rtt
+			self.snmpEngine.observer.storeExecutionContext(self.snmpEngine, 'rfc3412.receiveMessage:response', {})
+			return True
+		return False
+
+	def getCmd(self, auth, transport, *oids):  # pylint: disable=C0103,W0613
+		if not self.__exchange(transport, len(oids)):
+			return errind.requestTimedOut, 0, 0, []
+		if self.max_oids is not None and len(oids) > self.max_oids:
+			return None, rfc1902.Integer(ups_apc_snmp.snmpclient.TOO_BIG), 0, []
+		return None, 0, 0, [(rfc1902.ObjectName(oid), self.objects.get(rfc1902.ObjectName(oid), rfc1905.noSuchObject)) for oid in oids]
+
+	def bulkCmd(self, auth, transport, non_repeaters, max_repetitions, *oids, **kwargs):  # pylint: disable=C0103,W0613
+		if not self.__exchange(transport, len(oids)):
+			return errind.requestTimedOut, 0, 0, []
+		current = [rfc1902.ObjectName(oid) for oid in oids]
+		table = []
+		for _ in range(max_repetitions):
+			row = []
+			for position, oid in enumerate(current):
+				following = [candidate for candidate in self.sorted_oids if candidate > oid]
+				if following:
+					current[position] = following[0]
+					row.append((following[0], self.objects[following[0]]))
+				else:
+					row.append((oid, rfc1905.endOfMibView))
+			table.append(row)
+		return None, 0, 0, table
+
+
+def client(agent, **kwargs):
+	with mock.patch.object(ups_apc_snmp.snmpclient.cmdgen, 'CommandGenerator', agent), mock.patch.object(ups_apc_snmp.snmpclient.cmdgen, 'UdpTransportTarget', FakeTransport):
+		return SnmpClient('127.0.0.1', snmp_auth_data_v2c('public'), pdu_budget=ups_apc_snmp.snmpclient.PduBudget(), **kwargs)
+
+
+def use_clock(test, clock):
+	"""Let the client and its deadlines take the time from clock for the rest of the test"""
+	patch = mock.patch.object(ups_apc_snmp.snmpclient, 'time', clock)
+	patch.start()
+	test.addCleanup(patch.stop)
+
+
+SYSTEM = {
+	nodeid('SNMPv2-MIB::sysDescr.0'): rfc1902.OctetString('APC Web/SNMP Management Card'),
+	nodeid('SNMPv2-MIB::sysName.0'): rfc1902.OctetString('ups1'),
+}
+
+BATTERY_PACK_COLUMNS = (
+	'PowerNet-MIB::upsHighPrecBatteryPackIndex',
+	'PowerNet-MIB::upsHighPrecBatteryPackSerialNumber',
+	'PowerNet-MIB::upsHighPrecBatteryPackCartridgeReplaceDate',
+	'PowerNet-MIB::upsHighPrecBatteryPackCartridgeStatus',
+)
+
+
+def battery_packs(count):
+	objects = dict(SYSTEM)
+	for pack in range(1, count + 1):
+		index = (pack, 1)
+		objects[nodeid(BATTERY_PACK_COLUMNS[0]) + index] = rfc1902.Integer(pack)
+		objects[nodeid(BATTERY_PACK_COLUMNS[1]) + index] = rfc1902.OctetString('SER%d' % pack)
+		objects[nodeid(BATTERY_PACK_COLUMNS[2]) + index] = rfc1902.OctetString('01/0%d/2030' % pack)
+		objects[nodeid(BATTERY_PACK_COLUMNS[3]) + index] = rfc1902.OctetString('0000000000000000')
+	return objects
+
+
+SCALARS = dict(SYSTEM)
+SCALARS.update({
+	nodeid('SNMPv2-MIB::sysUpTime.0'): rfc1902.TimeTicks(123456),
+	nodeid('PowerNet-MIB::upsBasicIdentModel.0'): rfc1902.OctetString('Smart-UPS 1500'),
+	nodeid('PowerNet-MIB::upsHighPrecBatteryCapacity.0'): rfc1902.Gauge32(1000),
+})
+
+
+class HandshakeTest(unittest.TestCase):
+	def test_open_takes_values_by_oid(self):
+		snmp = client(FakeAgent(SCALARS))
+		self.assertTrue(snmp.alive)
+		self.assertEqual(str(snmp.sysname), 'ups1')
+		self.assertEqual(str(snmp.sysdescr), 'APC Web/SNMP Management Card')
+
+	def test_lazy_handshake_with_first_getmany(self):
+		agent = FakeAgent(SCALARS)
+		snmp = client(agent, lazy=True)
+		self.assertIsNone(snmp.alive)
+		self.assertEqual(agent.requests, [])
+		oids = ['PowerNet-MIB::upsBasicIdentModel.0', 'SNMPv2-MIB::sysUpTime.0', 'PowerNet-MIB::upsHighPrecBatteryCapacity.0']
+		scalars = snmp.getmany(oids)
+		self.assertEqual(agent.requests, [5])
+		self.assertTrue(snmp.alive)
+		self.assertEqual(str(snmp.sysname), 'ups1')
+		self.assertEqual(str(snmp.sysdescr), 'APC Web/SNMP Management Card')
+		self.assertEqual(str(scalars.get_value('PowerNet-MIB::upsBasicIdentModel.0')), 'Smart-UPS 1500')
+		self.assertEqual(int(scalars.get_value('SNMPv2-MIB::sysUpTime.0')), 123456)
+		self.assertEqual(int(scalars.get_value('PowerNet-MIB::upsHighPrecBatteryCapacity.0')), 1000)
+		self.assertFalse(scalars.has_value('SNMPv2-MIB::sysName.0'))
+		self.assertFalse(scalars.has_value('SNMPv2-MIB::sysDescr.0'))
+
+	def test_lazy_handshake_keeps_requested_handshake_objects(self):
+		agent = FakeAgent(SCALARS)
+		snmp = client(agent, lazy=True)
+		scalars = snmp.getmany(['SNMPv2-MIB::sysDescr.0', 'PowerNet-MIB::upsBasicIdentModel.0'])
+		self.assertEqual(agent.requests, [3])
+		self.assertEqual(str(scalars.get_value('SNMPv2-MIB::sysDescr.0')), 'APC Web/SNMP Management Card')
+		self.assertFalse(scalars.has_value('SNMPv2-MIB::sysName.0'))
+
+	def test_lazy_handshake_unreachable(self):
+		snmp = client(FakeAgent(SCALARS, down=True), lazy=True)
+		self.assertRaises(SnmpError, snmp.getmany, ['PowerNet-MIB::upsBasicIdentModel.0'])
+		self.assertFalse(snmp.alive)
+
+
+class GetManyTest(unittest.TestCase):
+	def test_chunks_shrink_after_too_big(self):
+		objects = dict(SYSTEM)
+		oids = []
+		for pack in range(1, 101):
+			oid = nodeid('PowerNet-MIB::upsHighPrecBatteryPackSerialNumber') + (pack, 1)
+			objects[oid] = rfc1902.OctetString('SER%d' % pack)
+			oids.append(oid)
+		agent = FakeAgent(objects, max_oids=10)
+		snmp = client(agent)
+		scalars = snmp.getmany(oids)
+		self.assertEqual(len(scalars.get_dict()), 100)
+		self.assertEqual(snmp.pdu_budget.max_oids, 7)
+		# the first chunk of 60 is split until it fits, the remaining 40 oids are sent at the learned size right away
+		self.assertEqual(agent.requests[0], 2)
+		self.assertEqual(agent.requests[1:], [60, 30, 15, 7, 8, 15, 7, 8, 30, 15, 7, 8, 15, 7, 8, 7, 7, 7, 7, 7, 5])
+
+
+class GetColumnsTest(unittest.TestCase):
+	def test_columns_keep_their_names(self):
+		snmp = client(FakeAgent(battery_packs(3)))
+		table = snmp.getcolumns(*BATTERY_PACK_COLUMNS)
+		self.assertEqual(len(table), 3)
+		self.assertEqual(list(table.column(BATTERY_PACK_COLUMNS[0])), [1, 2, 3])
+		self.assertEqual(list(table.column(BATTERY_PACK_COLUMNS[1])), ['SER1', 'SER2', 'SER3'])
+		self.assertEqual(list(table.column(BATTERY_PACK_COLUMNS[2])), ['01/01/2030', '01/02/2030', '01/03/2030'])
+		self.assertEqual(list(table.column(BATTERY_PACK_COLUMNS[3])), ['0000000000000000'] * 3)
+
+	def test_reversed_columns_keep_their_names(self):
+		snmp = client(FakeAgent(battery_packs(2)))
+		table = snmp.getcolumns(*reversed(BATTERY_PACK_COLUMNS))
+		self.assertEqual(list(table.column(BATTERY_PACK_COLUMNS[1])), ['SER1', 'SER2'])
+		self.assertEqual(list(table.column(BATTERY_PACK_COLUMNS[0])), [1, 2])
+
+	def test_matchtables_by_index_column(self):
+		snmp = client(FakeAgent(battery_packs(2)))
+		table = snmp.matchtables(BATTERY_PACK_COLUMNS[0], *BATTERY_PACK_COLUMNS[1:])
+		self.assertEqual(table.indices, [1, 2])
+		self.assertEqual(table.row(2)[BATTERY_PACK_COLUMNS[1]], 'SER2')
+
+
+
+class RttEstimatorTest(unittest.TestCase):
+	def test_without_samples(self):
+		self.assertEqual(RttEstimator().timeout(2), 2)
+		estimator = RttEstimator()
+		estimator.backoff()
+		self.assertEqual(estimator.timeout(2), 2)
+
+	def test_first_sample(self):
+		estimator = RttEstimator()
+		estimator.sample(0.2)
+		self.assertEqual((estimator.srtt, estimator.rttvar), (0.2, 0.1))
+		self.assertEqual(estimator.timeout(2), 0.6)
+
+	def test_smoothing(self):
+		estimator = RttEstimator()
+		estimator.sample(0.2)
+		estimator.sample(0.4)
+		self.assertAlmostEqual(estimator.srtt, 0.225)
+		self.assertAlmostEqual(estimator.rttvar, 0.125)
+		self.assertEqual(estimator.timeout(2), 0.8)
+
+	def test_bounds(self):
+		for rtt, timeout in ((0.01, 0.5), (0.05, 0.5), (0.3, 0.9), (0.33, 1.0), (0.34, 1.1), (1.5, 2)):
+			estimator = RttEstimator()
+			estimator.sample(rtt)
+			self.assertEqual(estimator.timeout(2), timeout, rtt)
+
+	def test_backoff(self):
+		estimator = RttEstimator()
+		estimator.sample(0.2)
+		estimator.backoff()
+		self.assertEqual(estimator.timeout(2), 1.0)
+		estimator.backoff()
+		self.assertEqual(estimator.timeout(2), 1.8)
+		estimator.backoff()
+		self.assertEqual(estimator.timeout(2), 2)
+		self.assertEqual(estimator.srtt, 0.2)
+
+	def test_persistence(self):
+		estimator = RttEstimator()
+		estimator.sample(0.2)
+		restored = RttEstimator.from_dict(estimator.to_dict())
+		self.assertEqual((restored.srtt, restored.rttvar), (0.2, 0.1))
+		for saved in ({}, dict(srtt=None, rttvar=None), dict(srtt='x', rttvar=1), None):
+			self.assertIsNone(RttEstimator.from_dict(saved).srtt, saved)
+
+
+class LearnedTimeoutTest(unittest.TestCase):
+	def setUp(self):
+		self.clock = FakeClock()
+		use_clock(self, self.clock)
+
+	def test_sample_excludes_configuration(self):
+		agent = FakeAgent(SCALARS, clock=self.clock, rtt=0.05, configure_time=0.3)
+		estimator = RttEstimator()
+		snmp = client(agent, rtt_estimator=estimator)
+		self.assertAlmostEqual(estimator.srtt, 0.05)
+		snmp.getmany(['SNMPv2-MIB::sysUpTime.0'])
+		self.assertEqual(agent.transports, [(2, 3), (0.5, 3)])
+
+	def test_retransmitted_request_not_sampled(self):
+		estimator = RttEstimator()
+		client(FakeAgent(SCALARS, clock=self.clock, lost=1), rtt_estimator=estimator)
+		self.assertIsNone(estimator.srtt)
+
+	def test_full_timeout_after_learned_one(self):
+		agent = FakeAgent(SCALARS, clock=self.clock, down=True)
+		estimator = RttEstimator(0.05, 0.025)
+		snmp = client(agent, rtt_estimator=estimator)
+		self.assertFalse(snmp.alive)
+		# the learned timeout with all retries, then once more with the full timeout
+		self.assertEqual(agent.transports, [(0.5, 3), (2, 0)])
+		self.assertEqual(estimator.rttvar, 0.05)
+
+	def test_fixed_timeout(self):
+		agent = FakeAgent(SCALARS, clock=self.clock)
+		client(agent, timeout=1, retries=2).getmany(['SNMPv2-MIB::sysUpTime.0'])
+		self.assertEqual(agent.transports, [(1, 2), (1, 2)])
+
+
+class DeadlineTest(unittest.TestCase):
+	def setUp(self):
+		self.clock = FakeClock()
+		use_clock(self, self.clock)
+
+	def transports(self, seconds, down=False):
+		self.agent = FakeAgent(SCALARS, clock=self.clock, down=down)
+		snmp = client(self.agent, lazy=True, timeout=2, retries=3, deadline=Deadline(seconds))
+		snmp.getmany(['SNMPv2-MIB::sysUpTime.0'])
+		return self.agent.transports
+
+	def test_not_capped(self):
+		self.assertEqual(self.transports(10), [(2, 3)])
+		self.assertEqual(self.transports(8), [(2, 3)])
+
+	def test_fewer_retries(self):
+		self.assertEqual(self.transports(7.9), [(2, 2)])
+		self.assertEqual(self.transports(5), [(2, 1)])
+		self.assertEqual(self.transports(2), [(2, 0)])
+
+	def test_shorter_timeout(self):
+		self.assertEqual(self.transports(1.5), [(1.5, 0)])
+		# in tenths, rounded down
+		self.assertEqual(self.transports(1.57), [(1.5, 0)])
+
+	def test_timeout_of_capped_request(self):
+		self.assertRaises(DeadlineExceeded, self.transports, 5, down=True)
+		self.assertEqual(self.agent.transports, [(2, 1)])
+
+	def test_timeout_of_request_within_deadline(self):
+		self.assertRaises(SnmpError, self.transports, 10, down=True)
+		self.assertEqual(self.agent.transports, [(2, 3)])
+
+	def test_deadline_reached(self):
+		self.assertRaises(DeadlineExceeded, self.transports, 0)
+		self.assertEqual(self.agent.transports, [])
+		self.assertRaises(DeadlineExceeded, self.transports, 0.05)
+		self.assertEqual(self.agent.transports, [])
+
+	def test_shared_by_requests(self):
+		agent = FakeAgent(SCALARS, clock=self.clock, rtt=1.5)
+		snmp = client(agent, timeout=2, retries=3, deadline=Deadline(4))
+		snmp.getmany(['SNMPv2-MIB::sysUpTime.0'])
+		self.assertRaises(DeadlineExceeded, snmp.getmany, ['PowerNet-MIB::upsBasicIdentModel.0'])
+		self.assertEqual(agent.transports, [(2, 1), (2, 0), (1.0, 0)])
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from ups_apc_snmp.stateflags import STATE_FLAGS, decode_state_flags, derive_states
+
+
+def flags(*positions):
+	"""Flag string with the flags at the 1-based positions set, as documented in PowerNet-MIB"""
+	return ''.join('1' if position in positions else '0' for position in range(1, 65))
+
+
+# upsBasicStateOutputState strings, the flags they decode to and the states derived from them
+STATES = (
+	('online', flags(4, 6, 19), ['onLine', 'serialCommunication', 'on'], ('onLine', 'batteryNormal', True)),
+	('on battery', flags(2, 6, 19), ['onBattery', 'serialCommunication', 'on'], ('onBattery', 'batteryNormal', True)),
+	('on battery, low', flags(1, 2, 3, 6, 19, 30), ['abnormalCondition', 'onBattery', 'lowBattery', 'serialCommunication', 'on', 'lowBatteryOnBattery'], ('onBattery', 'batteryLow', True)),
+	('online, replace battery', flags(1, 4, 5, 6, 19), ['abnormalCondition', 'onLine', 'replaceBattery', 'serialCommunication', 'on'], ('onLine', 'batteryNormal', False)),
+	('boost', flags(4, 6, 7, 19), ['onLine', 'serialCommunication', 'avrBoost', 'on'], ('onSmartBoost', 'batteryNormal', True)),
+	('trim', flags(4, 6, 8, 19), ['onLine', 'serialCommunication', 'avrTrim', 'on'], ('onSmartTrim', 'batteryNormal', True)),
+	('charger failure', flags(1, 4, 6, 19, 25), ['abnormalCondition', 'onLine', 'serialCommunication', 'on', 'batteryChargerFailure'], ('onLine', 'batteryInFaultCondition', True)),
+	('no batteries', flags(1, 4, 33), ['abnormalCondition', 'onLine', 'noBatteriesAttached'], ('onLine', 'batteryInFaultCondition', True)),
+	('bypass fault', flags(1, 14), ['abnormalCondition', 'bypassInternalFault'], ('hardwareFailureBypass', 'batteryNormal', True)),
+	('manual bypass', flags(12, 19), ['manualBypass', 'on'], ('switchedBypass', 'batteryNormal', True)),
+	('sleeping', flags(17, 6), ['serialCommunication', 'sleepingOnTimer'], ('timedSleeping', 'batteryNormal', True)),
+	('rebooting', flags(4, 20), ['onLine', 'rebooting'], ('rebooting', 'batteryNormal', True)),
+	('eco mode', flags(4, 19, 51), ['onLine', 'on', 'ecoMode'], ('ecoMode', 'batteryNormal', True)),
+	('hot standby', flags(19, 52), ['on', 'hotStandby'], ('hotStandby', 'batteryNormal', True)),
+	('off', flags(6, 58), ['serialCommunication', 'off'], ('off', 'batteryNormal', True)),
+	('unused flags', flags(4, 60, 61, 62, 63, 64), ['onLine'], ('onLine', 'batteryNormal', True)),
+)
+
+
+class DecodeStateFlagsTest(unittest.TestCase):
+	def test_table(self):
+		self.assertEqual(len(STATE_FLAGS), 64)
+		names = [name for name in STATE_FLAGS if name is not None]
+		self.assertEqual(len(names), len(set(names)))
+
+	def test_known_strings(self):
+		for description, value, names, _ in STATES:
+			self.assertEqual(decode_state_flags(value), frozenset(names), description)
+
+	def test_invalid_strings(self):
+		for value in ('', flags(4)[:-1], flags(4) + '0', flags(4).replace('1', '2'), ' ' + flags(4)[1:], 'noSuchObject'):
+			self.assertIsNone(decode_state_flags(value), value)
+
+	def test_none_set(self):
+		self.assertEqual(decode_state_flags(flags()), frozenset())
+
+
+class DeriveStatesTest(unittest.TestCase):
+	def test_known_strings(self):
+		for description, value, _, (output_status, battery_status, battery_replace_indicator) in STATES:
+			self.assertEqual(derive_states(decode_state_flags(value)), dict(output_status=output_status, battery_status=battery_status, battery_replace_indicator=battery_replace_indicator), description)
+
+	def test_without_output_status(self):
+		self.assertIsNone(derive_states(frozenset()))
+		self.assertIsNone(derive_states(decode_state_flags(flags(1, 3, 5, 6))))
+
+
+if __name__ == '__main__':
+	unittest.main()
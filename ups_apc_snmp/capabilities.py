@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+from ups_apc_snmp.hoststate import makedirs, write_json_atomic
+
+
+class CapabilityProfile(object):
+	"""Objects and tables an agent was found to support, for the hardware and firmware described by key
+
+	A profile is built by a full poll and lets later polls skip the objects
+	the agent does not have, until it is re-probed after a ttl or the agent
+	reports a different key."""
+
+	def __init__(self, key, model=None, firmware=None, missing=None, tables=None, probed=None):  # pylint: disable=R0913
+		self.key = key
+		self.model = model
+		self.firmware = firmware
+		self.missing = set(missing or [])
+		self.tables = dict(tables or {})
+		self.probed = time.time() if probed is None else probed
+
+	def __repr__(self):
+		return "CapabilityProfile(key=%r, model=%r, firmware=%r, missing=%r, tables=%r)" % (self.key, self.model, self.firmware, sorted(self.missing), self.tables)
+
+	def is_fresh(self, key, ttl, now=None):
+		"""Whether the profile describes the agent with key and was probed less than ttl seconds ago"""
+		now = time.time() if now is None else now
+		return self.key == key and 0 <= now - self.probed <= ttl
+
+	def supports(self, oid):
+		return oid not in self.missing
+
+	def add_missing(self, oid):
+		self.missing.add(oid)
+
+	def has_table(self, name):
+		"""Whether the table had rows when probed, tables never probed are assumed to have rows"""
+		return self.tables.get(name, True)
+
+	def set_table(self, name, has_rows):
+		self.tables[name] = bool(has_rows)
+
+	def for_key(self, key):
+		"""Copy of the profile for an agent described by another key"""
+		return CapabilityProfile(key, self.model, self.firmware, self.missing, self.tables, self.probed)
+
+	def to_dict(self):
+		return dict(key=self.key, model=self.model, firmware=self.firmware, missing=sorted(self.missing), tables=self.tables, probed=self.probed)
+
+	@classmethod
+	def from_dict(cls, saved):
+		"""Restore a profile saved with to_dict, None if saved is missing or invalid"""
+		try:
+			return cls(saved['key'], saved.get('model'), saved.get('firmware'), saved.get('missing'), saved.get('tables'), float(saved['probed']))
+		except (KeyError, TypeError, ValueError):
+			return None
+
+
+def model_key(model, firmware):
+	"""Registry key of the devices of a model running a firmware revision"""
+	return '%s|%s' % (str(model).strip(), str(firmware).strip())
+
+
+def registry_dir(state_dir):
+	"""Directory of the capability registry within the state directory of the checks"""
+	return os.path.join(state_dir, 'models')
+
+
+class CapabilityRegistry(object):
+	"""Capability profiles shared by all devices of the same model and firmware, one JSON file per model in a directory"""
+
+	def __init__(self, directory):
+		self.directory = directory
+
+	def __path(self, key):
+		digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:12]  # pylint: disable=E1101
+		return os.path.join(self.directory, '%s-%s.json' % (re.sub(r'[^A-Za-z0-9_.-]', '_', key), digest))
+
+	def get(self, model, firmware):
+		"""The profile of a model and firmware, None if no device of it has been probed"""
+		try:
+			with open(self.__path(model_key(model, firmware))) as profile_file:
+				return CapabilityProfile.from_dict(json.load(profile_file))
+		except (IOError, OSError, ValueError):
+			return None
+
+	def put(self, profile):
+		"""Store the profile of a probed device as the one of its model and firmware"""
+		makedirs(self.directory)
+		write_json_atomic(self.__path(profile.key), profile.to_dict())
+
+	def export_profiles(self):
+		"""All profiles of the registry as dict of key to saved profile"""
+		profiles = {}
+		try:
+			filenames = os.listdir(self.directory)
+		except OSError:
+			return profiles
+		for filename in sorted(filenames):
+			if not filename.endswith('.json'):
+				continue
+			try:
+				with open(os.path.join(self.directory, filename)) as profile_file:
+					profile = CapabilityProfile.from_dict(json.load(profile_file))
+			except (IOError, OSError, ValueError):
+				continue
+			if profile is not None:
+				profiles[profile.key] = profile.to_dict()
+		return profiles
+
+	def import_profiles(self, profiles):
+		"""Add exported profiles, keeping the ones probed more recently already in the registry, returns the number added"""
+		imported = 0
+		for saved in profiles.values():
+			profile = CapabilityProfile.from_dict(saved)
+			if profile is None or profile.model is None:
+				continue
+			current = self.get(profile.model, profile.firmware)
+			if current is not None and current.probed >= profile.probed:
+				continue
+			self.put(profile.for_key(model_key(profile.model, profile.firmware)))
+			imported += 1
+		return imported
+
+
+def main():
+	argp = argparse.ArgumentParser(description='Export or import the capability profiles shared by devices of the same model')
+	argp.add_argument('command', choices=['export', 'import'])
+	argp.add_argument('-f', '--file', help='File to export to or import from, - for stdout or stdin', default='-')
+	argp.add_argument('--state-dir', help='State directory of the checks, as given with their --state-dir', dest='state_dir', required=True)
+	args = argp.parse_args()
+
+	registry = CapabilityRegistry(registry_dir(args.state_dir))
+	if args.command == 'export':
+		profiles = registry.export_profiles()
+		if args.file == '-':
+			json.dump(profiles, sys.stdout, indent=1, sort_keys=True)
+			sys.stdout.write('\n')
+		else:
+			with open(args.file, 'w') as export_file:
+				json.dump(profiles, export_file, indent=1, sort_keys=True)
+		sys.stderr.write('Exported %d capability profiles\n' % len(profiles))
+	else:
+		if args.file == '-':
+			profiles = json.load(sys.stdin)
+		else:
+			with open(args.file) as import_file:
+				profiles = json.load(import_file)
+		sys.stderr.write('Imported %d of %d capability profiles\n' % (registry.import_profiles(profiles), len(profiles)))
+
+
+if __name__ == "__main__":
+	main()
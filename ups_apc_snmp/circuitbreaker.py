@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+
+# Doublings of the backoff after which it stays at its maximum anyway
+_MAX_DOUBLINGS = 30
+
+
+class CircuitBreaker(object):
+	"""Consecutive failed polls of a host, and until when it is not polled again
+
+	After a failed poll the host is considered down for a backoff that doubles
+	with every further failure, up to a maximum. Checks during that time report
+	the last error without sending anything, the first check after it sends a
+	single packet to find out whether the host answers again."""
+
+	def __init__(self, failures=0, retry_at=0, error=None):
+		self.failures = failures
+		self.retry_at = retry_at
+		self.error = error
+
+	def __repr__(self):
+		return "CircuitBreaker(failures=%r, retry_at=%r, error=%r)" % (self.failures, self.retry_at, self.error)
+
+	def is_open(self, now=None):
+		"""Whether the host failed recently enough to not be polled at all"""
+		now = time.time() if now is None else now
+		return self.failures > 0 and now < self.retry_at
+
+	def record_failure(self, error, backoff, max_backoff, now=None):
+		"""Keep the host from being polled for a backoff that doubles with each consecutive failure"""
+		now = time.time() if now is None else now
+		self.failures += 1
+		self.retry_at = now + min(backoff * 2 ** min(self.failures - 1, _MAX_DOUBLINGS), max_backoff)
+		self.error = error
+
+	def record_success(self):
+		self.failures = 0
+		self.retry_at = 0
+		self.error = None
+
+	def to_dict(self):
+		return dict(failures=self.failures, retry_at=self.retry_at, error=self.error)
+
+	@classmethod
+	def from_dict(cls, data):
+		"""Restore a breaker saved with to_dict, a closed one if data is missing or invalid"""
+		try:
+			return cls(int(data['failures']), float(data['retry_at']), data.get('error'))
+		except (KeyError, TypeError, ValueError, AttributeError):
+			return cls()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Thin Nagios client of the check_ups_apc daemon
+
+Sends the command line to the daemon over a Unix domain socket and prints
+the plugin output and exit code it returns. Only standard library modules
+are imported, so the client starts within a few milliseconds."""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET = '/run/check_ups_apc/check_ups_apc.sock'
+
+# Check timeout of check_ups_apc if none is given
+DEFAULT_TIMEOUT = 30
+
+UNKNOWN = 3
+
+
+class ArgumentParser(argparse.ArgumentParser):
+	"""Argument parser reporting invalid command lines as UNKNOWN plugin output"""
+
+	def error(self, message):
+		print("UPSAPC UNKNOWN - %s" % message)
+		sys.exit(UNKNOWN)
+
+
+def build_argument_parser():
+	argp = ArgumentParser(description='Run check_ups_apc through the check daemon, all options not listed here are passed on to the check', usage='%(prog)s [--socket SOCKET] [check_ups_apc options]')
+	argp.add_argument('-S', '--socket', help='Unix domain socket of the check daemon, defaults to $CHECK_UPS_APC_SOCKET or %s' % DEFAULT_SOCKET, default=os.environ.get('CHECK_UPS_APC_SOCKET', DEFAULT_SOCKET))
+	argp.add_argument('-t', '--timeout', help='Check timeout, the client waits a bit longer for the daemon to report it', type=int)
+	return argp
+
+
+def main(argv=None):
+	args, argv = build_argument_parser().parse_known_args(sys.argv[1:] if argv is None else argv)
+	path = args.socket
+	timeout = DEFAULT_TIMEOUT
+	if args.timeout is not None:
+		timeout = args.timeout
+		argv += ['--timeout', str(timeout)]
+
+	# wait a bit longer than the check timeout, so the daemon can report it
+	client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	client.settimeout(timeout + 5)
+	try:
+		client.connect(path)
+		client.sendall(json.dumps({'argv': argv}).encode('utf-8'))
+		client.shutdown(socket.SHUT_WR)
+		chunks = []
+		while True:
+			chunk = client.recv(65536)
+			if not chunk:
+				break
+			chunks.append(chunk)
+		response = json.loads(b''.join(chunks).decode('utf-8'))
+	except (socket.error, ValueError) as e:
+		print("UPSAPC UNKNOWN - Check daemon on %s is not available: %s" % (path, e))
+		sys.exit(UNKNOWN)
+	finally:
+		client.close()
+
+	print(response['output'])
+	sys.exit(response['exitcode'])
+
+
+if __name__ == "__main__":
+	main()
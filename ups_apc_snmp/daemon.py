@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Long running check daemon answering requests of check_ups_apc_client
+
+MIBs, config files, threshold contexts and SNMP engines are loaded once
+and reused for all checks, so Nagios only pays for starting the thin client."""
+
+import argparse
+import json
+import logging
+import os
+import threading
+
+try:
+	import queue
+	import socketserver
+except ImportError:  # Python 2
+	import Queue as queue
+	import SocketServer as socketserver
+
+import configparser
+import nagiosplugin
+import nagiosplugin.state
+from pysnmp.entity import engine
+
+import ups_apc_snmp.nagios_plugin
+import ups_apc_snmp.snmpclient
+from ups_apc_snmp.client import DEFAULT_SOCKET
+
+_log = logging.getLogger('nagiosplugin')
+
+
+class CheckRequestHandler(socketserver.StreamRequestHandler):
+	def handle(self):
+		request = json.loads(self.rfile.read().decode('utf-8'))
+		exitcode, output = self.server.check(request['argv'])
+		self.wfile.write(json.dumps(dict(exitcode=exitcode, output=output)).encode('utf-8'))
+
+
+class CheckDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+	"""Unix socket server running one check per connection in its own thread"""
+	daemon_threads = True
+
+	def __init__(self, path):
+		self.lock = threading.Lock()
+		self.configs = {}
+		self.contexts = {}
+		self.engines = queue.Queue()
+		socketserver.UnixStreamServer.__init__(self, path, CheckRequestHandler)
+
+	def get_config(self, path):
+		"""Return the parsed config file, reading it again only after it has been modified"""
+		try:
+			mtime = os.path.getmtime(path)
+		except OSError:
+			mtime = None
+		if path not in self.configs or self.configs[path][0] != mtime:
+			self.configs[path] = (mtime, ups_apc_snmp.nagios_plugin.read_config(path, []))
+		return self.configs[path]
+
+	def get_contexts(self, args):
+		"""Return the contexts for a check, building them once per host, config and thresholds"""
+		with self.lock:
+			mtime, config_parser = self.get_config(args.config)
+			key = (args.host, args.config, mtime, args.uptime, args.battery_ignore_replacement)
+			if key not in self.contexts:
+				_log.info("Building contexts for host %s", args.host)
+				ups_apc_snmp.nagios_plugin.add_device_defaults(config_parser, args.host)
+				self.contexts[key] = ups_apc_snmp.nagios_plugin.build_contexts(args, config_parser)
+			return config_parser, self.contexts[key]
+
+	def acquire_engine(self):
+		try:
+			return self.engines.get_nowait()
+		except queue.Empty:
+			return engine.SnmpEngine()
+
+	def release_engine(self, snmp_engine):
+		self.engines.put(snmp_engine)
+
+	def check(self, argv):
+		"""Run the check for a command line, returning exit code and plugin output"""
+		argp = ups_apc_snmp.nagios_plugin.build_argument_parser()
+		try:
+			args = argp.parse_args(argv)
+		except SystemExit:
+			return nagiosplugin.state.Unknown.code, "UPSAPC UNKNOWN - Invalid arguments %s" % " ".join(argv)
+		if not args.host or args.hosts or args.hosts_file or args.config_hosts:
+			return nagiosplugin.state.Unknown.code, "UPSAPC UNKNOWN - The check daemon only checks a single host given with -H"
+
+		try:
+			config_parser, contexts = self.get_contexts(args)
+		except (configparser.Error, ValueError) as e:
+			return nagiosplugin.state.Unknown.code, "UPSAPC UNKNOWN - Invalid config file %s: %s" % (args.config, e)
+
+		snmp_engine = self.acquire_engine()
+		try:
+			return ups_apc_snmp.nagios_plugin.run_check(ups_apc_snmp.nagios_plugin.build_check(args, config_parser, contexts, snmp_engine))
+		finally:
+			self.release_engine(snmp_engine)
+			_log.debug("OID translation caches: %r", ups_apc_snmp.snmpclient.translation_cache_stats())
+
+
+def main():
+	argp = argparse.ArgumentParser(description='Check daemon for check_ups_apc_client')
+	argp.add_argument('-v', '--verbose', action='count', default=0)
+	argp.add_argument('-S', '--socket', help='Unix domain socket to listen on', default=DEFAULT_SOCKET)
+	argp.add_argument('--cache-dir', help='Directory to cache parsed MIBs in', dest='cache_dir', default=ups_apc_snmp.nagios_plugin.DEFAULT_CACHE_DIR)
+	argp.add_argument('--full-mib', help='Load the complete PowerNet-MIB instead of the one trimmed to UPS objects, for all checks', dest='full_mib', action='store_true')
+	args = argp.parse_args()
+
+	logging.basicConfig(level=max(logging.WARNING - 10 * args.verbose, logging.DEBUG))
+
+	# load the MIBs once before serving any check
+	ups_apc_snmp.nagios_plugin.add_mib_paths(args.full_mib, args.cache_dir)
+	ups_apc_snmp.snmpclient.nodeids(ups_apc_snmp.nagios_plugin.metric_oids(ups_apc_snmp.nagios_plugin.SCALAR_METRICS + ups_apc_snmp.nagios_plugin.STATE_METRICS))
+
+	if os.path.exists(args.socket):
+		os.unlink(args.socket)
+	server = CheckDaemon(args.socket)
+	os.chmod(args.socket, 0o660)
+	_log.info("Check daemon listening on %s", args.socket)
+	try:
+		server.serve_forever()
+	finally:
+		server.server_close()
+		os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+	main()
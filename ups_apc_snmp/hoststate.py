@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import errno
+import json
+import logging
+import os
+import re
+import tempfile
+
+_log = logging.getLogger('nagiosplugin')
+
+
+def makedirs(directory):
+	"""Create a private directory unless it exists already"""
+	try:
+		os.makedirs(directory, 0o700)
+	except OSError as e:
+		if e.errno != errno.EEXIST:
+			raise
+
+
+def write_json_atomic(path, data):
+	"""Write data as JSON to a temporary file and rename it to path, so readers never see partial files"""
+	fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+	try:
+		with os.fdopen(fd, 'w') as json_file:
+			json.dump(data, json_file)
+		os.rename(tmp_path, path)
+	except BaseException:
+		# also on interrupts, no temporary file is left behind
+		os.unlink(tmp_path)
+		raise
+
+
+class HostState(object):
+	"""State learned about a host, persisted between check runs as a JSON file in a state directory"""
+
+	def __init__(self, directory, host):
+		self.directory = directory
+		self.path = os.path.join(directory, re.sub(r'[^A-Za-z0-9_.-]', '_', host) + '.json')
+
+	def load(self):
+		try:
+			with open(self.path) as state_file:
+				return json.load(state_file)
+		except (IOError, OSError, ValueError):
+			return {}
+
+	def save(self, state):
+		try:
+			makedirs(self.directory)
+			write_json_atomic(self.path, state)
+		except (IOError, OSError) as e:
+			_log.warning("Could not save host state to %s: %s", self.path, e)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Precompiled symbol index of the MIBs used by the plugin
+
+Resolving names through pysnmp requires executing the autogenerated
+PowerNet-MIB.py, which instantiates thousands of MIB objects. The index
+generated by this module holds only name to OID mappings and named values,
+so that nodeid, nodename and get_namedvalues can work without it.
+
+The index is a package of shards, one per product branch of the MIB like
+ups, rPDU or airConditioners, plus one for traps and one for everything
+else. Shards are imported on first reference, so a process resolving only
+ups objects never loads the symbols of other products.
+
+Regenerate the index with:
+
+	python -m ups_apc_snmp.mibindex build
+
+Compare startup time and memory of the full and slim MIB and the index with:
+
+	python -m ups_apc_snmp.mibindex benchmark
+"""
+
+import argparse
+import glob
+import hashlib
+import importlib
+import logging
+import marshal
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+from ups_apc_snmp.hoststate import makedirs
+
+_log = logging.getLogger('nagiosplugin')
+
+INDEX_PACKAGE = 'mibsymbols'
+INDEX_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), INDEX_PACKAGE)
+INDEX_PATH = os.path.join(INDEX_DIR, '__init__.py')
+
+# Every product below hardware(1.3.6.1.4.1.318.1.1) gets its own shard named after its node, traps another one
+PRODUCTS_OID = (1, 3, 6, 1, 4, 1, 318, 1, 1)
+TRAPS_OID = (1, 3, 6, 1, 4, 1, 318, 0)
+TRAPS_SHARD = 'traps'
+COMMON_SHARD = 'common'
+
+# MIBs indexed from module files, whose hash is recorded in the index
+FILE_MIBS = ('PowerNet-MIB', )
+
+# Objects of SNMPv2-MIB used by the client, which is compiled into pysnmp and not shipped as file
+SNMPV2_MIB_SYMBOLS = {
+	'system': (1, 3, 6, 1, 2, 1, 1),
+	'sysDescr': (1, 3, 6, 1, 2, 1, 1, 1),
+	'sysObjectID': (1, 3, 6, 1, 2, 1, 1, 2),
+	'sysUpTime': (1, 3, 6, 1, 2, 1, 1, 3),
+	'sysContact': (1, 3, 6, 1, 2, 1, 1, 4),
+	'sysName': (1, 3, 6, 1, 2, 1, 1, 5),
+	'sysLocation': (1, 3, 6, 1, 2, 1, 1, 6),
+	'sysServices': (1, 3, 6, 1, 2, 1, 1, 7),
+}
+
+_OBJECT_RE = re.compile(r'^(\w+) = (?:MibIdentifier|MibScalar|MibTable|MibTableRow|MibTableColumn|NotificationType)\(\(([\d, ]+)\)(?:, (\w+)\(\))?')
+_CLASS_RE = re.compile(r'^class (\w+)\(\w+\):')
+_NAMEDVALUES_RE = re.compile(r'NamedValues\(((?:\("[^"]*", -?\d+\), )+)\)')
+_PAIR_RE = re.compile(r'\("([^"]*)", (-?\d+)\)')
+_WORD_RE = re.compile(r'[a-z]*')
+
+try:
+	from ups_apc_snmp import mibsymbols as _symbols
+except ImportError:  # index not generated yet, callers fall back to the pysnmp MIB tree
+	_symbols = None
+
+_shards = {}
+_locations = {}
+# Symbols, named values and locations of MIBs that differ from the ones the index was built from
+_overlays = {}
+
+
+def parse_mib(path):
+	"""Parse an autogenerated pysnmp MIB module into a dict of symbol OIDs and a dict of named values"""
+	symbols = {}
+	namedvalues = {}
+	type_namedvalues = {}
+	current_class = None
+
+	with open(path) as mib_file:
+		for line in mib_file:
+			match = _CLASS_RE.match(line)
+			if match:
+				current_class = match.group(1)
+				continue
+			if current_class and line.strip().startswith('namedValues = '):
+				type_namedvalues[current_class] = _parse_namedvalues(line)
+				continue
+
+			match = _OBJECT_RE.match(line)
+			if not match:
+				continue
+			current_class = None
+			name, oid, syntax = match.groups()
+			symbols[name] = tuple(int(x) for x in oid.replace(' ', '').strip(',').split(','))
+			values = _parse_namedvalues(line)
+			if values is None and syntax in type_namedvalues:
+				values = type_namedvalues[syntax]
+			if values is not None:
+				namedvalues[name] = values
+
+	return symbols, namedvalues
+
+
+def _parse_namedvalues(line):
+	match = _NAMEDVALUES_RE.search(line)
+	if not match:
+		return None
+	return tuple((label, int(value)) for label, value in _PAIR_RE.findall(match.group(1)))
+
+
+def _leading_word(objectname):
+	"""The leading lowercase word of a symbol, by which names are routed to shards"""
+	return _WORD_RE.match(objectname).group(0)
+
+
+def build_index(mib_dir, index_dir=INDEX_DIR):
+	"""Generate the index package from the MIB modules in mib_dir"""
+	powernet_path = os.path.join(mib_dir, 'PowerNet-MIB.py')
+	powernet_symbols, powernet_namedvalues = parse_mib(powernet_path)
+	mibs = {'PowerNet-MIB': (powernet_symbols, powernet_namedvalues), 'SNMPv2-MIB': (SNMPV2_MIB_SYMBOLS, {})}
+
+	prefixes = {TRAPS_OID: TRAPS_SHARD}
+	for objectname, oid in powernet_symbols.items():
+		if len(oid) == len(PRODUCTS_OID) + 1 and oid[:-1] == PRODUCTS_OID:
+			prefixes[oid] = objectname
+
+	shards = {}
+	routes = {}
+	for mibname, (symbols, namedvalues) in mibs.items():
+		for objectname, oid in symbols.items():
+			shard = prefixes.get(oid[:len(PRODUCTS_OID) + 1]) or prefixes.get(oid[:len(TRAPS_OID)]) or COMMON_SHARD
+			shard_symbols, shard_namedvalues = shards.setdefault(shard, ({}, {}))
+			shard_symbols.setdefault(mibname, {})[objectname] = oid
+			if objectname in namedvalues:
+				shard_namedvalues.setdefault(mibname, {})[objectname] = namedvalues[objectname]
+			route = routes.setdefault((mibname, _leading_word(objectname)), {})
+			route[shard] = route.get(shard, 0) + 1
+
+	if not os.path.isdir(index_dir):
+		os.makedirs(index_dir)
+	for filename in os.listdir(index_dir):
+		if filename.endswith('.py'):
+			os.unlink(os.path.join(index_dir, filename))
+
+	for shard, (symbols, namedvalues) in shards.items():
+		with open(os.path.join(index_dir, shard + '.py'), 'w') as index_file:
+			_write_header(index_file)
+			_write_dict(index_file, 'SYMBOLS', symbols)
+			index_file.write('\n')
+			_write_dict(index_file, 'NAMED_VALUES', namedvalues)
+
+	with open(os.path.join(index_dir, '__init__.py'), 'w') as index_file:
+		_write_header(index_file)
+		index_file.write('# Hashes of the MIB modules the index was built from\n')
+		index_file.write('SOURCE_HASHES = {%r: %r}\n\n' % ('PowerNet-MIB', file_hash(powernet_path)))
+		index_file.write('# Shards holding the symbols below an oid prefix, anything else is in %r\n' % COMMON_SHARD)
+		index_file.write('PREFIXES = {\n')
+		for prefix in sorted(prefixes):
+			index_file.write('\t%r: %r,\n' % (prefix, prefixes[prefix]))
+		index_file.write('}\n\n')
+		index_file.write('# Shards holding the symbols of a MIB starting with a lowercase word, the one holding most of them first\n')
+		index_file.write('ROUTES = {\n')
+		for route in sorted(routes):
+			index_file.write('\t%r: %r,\n' % (route, tuple(sorted(routes[route], key=lambda shard, route=route: (-routes[route][shard], shard)))))
+		index_file.write('}\n')
+
+
+def _write_header(index_file):
+	index_file.write('# -*- coding: utf-8 -*-\n')
+	index_file.write('# Autogenerated by ups_apc_snmp.mibindex - do not edit\n\n')
+
+
+def _write_dict(index_file, variable, mibs):
+	"""Write a dict of MIB names to dicts of symbols, one symbol per line"""
+	index_file.write('%s = {\n' % variable)
+	for mibname in sorted(mibs):
+		index_file.write('\t%r: {\n' % mibname)
+		for objectname in sorted(mibs[mibname]):
+			index_file.write('\t\t%r: %r,\n' % (objectname, mibs[mibname][objectname]))
+		index_file.write('\t},\n')
+	index_file.write('}\n')
+
+
+def _shard(name):
+	"""Import a shard of the index on first reference"""
+	shard = _shards.get(name)
+	if shard is None:
+		shard = importlib.import_module('ups_apc_snmp.%s.%s' % (INDEX_PACKAGE, name))
+		_shards[name] = shard
+	return shard
+
+
+def loaded_shards():
+	"""Names of the shards imported so far"""
+	return sorted(_shards)
+
+
+def file_hash(path):
+	"""Hex SHA-256 of a file"""
+	with open(path, 'rb') as hashed_file:
+		return hashlib.sha256(hashed_file.read()).hexdigest()  # pylint: disable=E1101
+
+
+def load_mib(path, cache_dir=None):
+	"""Resolve the symbols of a MIB module through it instead of the index, if it differs from the one the index was built from
+
+	The parsed symbol table is kept in cache_dir keyed by the hash of the
+	module, so a changed MIB is parsed once and loaded with a single read
+	by later processes."""
+	mibname = os.path.splitext(os.path.basename(path))[0]
+	digest = file_hash(path)
+	if _symbols is not None and _symbols.SOURCE_HASHES.get(mibname) == digest:
+		_overlays.pop(mibname, None)
+		return
+
+	cache_path = None
+	if cache_dir:
+		cache_path = os.path.join(cache_dir, 'mib-%s-%s-py%d%d.marshal' % (mibname, digest, sys.version_info[0], sys.version_info[1]))
+		try:
+			with open(cache_path, 'rb') as cache_file:
+				_overlays[mibname] = marshal.loads(cache_file.read())
+			return
+		except (IOError, OSError, EOFError, ValueError, TypeError):
+			pass
+
+	_log.debug("MIB %s differs from the precompiled index, parsing it", path)
+	symbols, namedvalues = parse_mib(path)
+	locations = dict((oid, (mibname, objectname)) for objectname, oid in symbols.items())
+	_overlays[mibname] = (symbols, namedvalues, locations)
+	if cache_path is not None:
+		try:
+			_write_cache(cache_path, _overlays[mibname])
+		except (IOError, OSError) as e:
+			_log.debug("Could not cache parsed MIB %s in %s: %s", path, cache_dir, e)
+
+
+def _write_cache(cache_path, table):
+	"""Atomically write a marshalled symbol table, replacing the ones of other versions of the MIB"""
+	cache_dir = os.path.dirname(cache_path)
+	makedirs(cache_dir)
+	fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.tmp-')
+	try:
+		with os.fdopen(fd, 'wb') as cache_file:
+			cache_file.write(marshal.dumps(table))
+		os.rename(tmp_path, cache_path)
+	except (IOError, OSError, EOFError, ValueError, TypeError):
+		os.unlink(tmp_path)
+		raise
+	for stale_path in glob.glob(os.path.join(cache_dir, '-'.join(os.path.basename(cache_path).split('-')[:-2]) + '-*.marshal')):
+		if stale_path != cache_path:
+			os.unlink(stale_path)
+
+
+def _symbol_shard(mibname, objectname):
+	"""The shard defining a MIB symbol, None if not indexed"""
+	if _symbols is None:
+		return None
+	for name in _symbols.ROUTES.get((mibname, _leading_word(objectname)), ()):
+		shard = _shard(name)
+		if objectname in shard.SYMBOLS.get(mibname, {}):
+			return shard
+	return None
+
+
+def lookup_oid(mibname, objectname):
+	"""Translate a MIB symbol to its OID tuple, None if not indexed"""
+	if mibname in _overlays:
+		return _overlays[mibname][0].get(objectname)
+	shard = _symbol_shard(mibname, objectname)
+	if shard is None:
+		return None
+	return shard.SYMBOLS[mibname][objectname]
+
+
+def _shard_locations(name):
+	locations = _locations.get(name)
+	if locations is None:
+		locations = dict((symbol_oid, (mibname, objectname)) for mibname, symbols in _shard(name).SYMBOLS.items() for objectname, symbol_oid in symbols.items())
+		_locations[name] = locations
+	return locations
+
+
+def _longest_prefix(locations, oid, shortest=1):
+	"""Length and location of the longest prefix of oid in locations, with at least shortest elements"""
+	for length in range(len(oid), shortest - 1, -1):
+		location = locations.get(oid[:length])
+		if location is not None:
+			return length, location
+	return 0, None
+
+
+def lookup_location(oid):
+	"""Translate an OID tuple to (mibname, objectname, suffix) using the longest indexed prefix, None if not indexed"""
+	length, location = 0, None
+	if _symbols is not None:
+		shard = _symbols.PREFIXES.get(oid[:len(PRODUCTS_OID) + 1]) or _symbols.PREFIXES.get(oid[:len(TRAPS_OID)])
+		# prefixes shorter than the product or trap node itself are in the common shard
+		for name in (shard, COMMON_SHARD):
+			if name is not None:
+				length, location = _longest_prefix(_shard_locations(name), oid)
+				if location is not None and location[0] not in _overlays:
+					break
+				length, location = 0, None
+
+	for _, _, locations in _overlays.values():
+		overlay_length, overlay_location = _longest_prefix(locations, oid, length + 1)
+		if overlay_location is not None:
+			length, location = overlay_length, overlay_location
+
+	if location is None:
+		return None
+	return location + (oid[length:], )
+
+
+def lookup_namedvalues(mibname, objectname):
+	"""Named values of a MIB symbol as tuple of (name, value) pairs, None if not indexed"""
+	if mibname in _overlays:
+		return _overlays[mibname][1].get(objectname)
+	shard = _symbol_shard(mibname, objectname)
+	if shard is None:
+		return None
+	return shard.NAMED_VALUES.get(mibname, {}).get(objectname)
+
+
+_BENCHMARK_CODE = '''
+import resource, time
+start = time.time()
+import ups_apc_snmp.mibindex, ups_apc_snmp.nagios_plugin, ups_apc_snmp.snmpclient
+if %(disable_index)r:
+	ups_apc_snmp.mibindex._symbols = None
+ups_apc_snmp.nagios_plugin.add_mib_paths(%(full_mib)r)
+for metric in ups_apc_snmp.nagios_plugin.SCALAR_METRICS + ups_apc_snmp.nagios_plugin.STATE_METRICS:
+	oid = ups_apc_snmp.snmpclient.nodeid(metric.oid)
+	ups_apc_snmp.snmpclient.nodename(oid)
+	if metric.named:
+		ups_apc_snmp.snmpclient.get_namedvalues(*metric.oid.split('.')[0].split('::'))
+print('%%.1f %%d' %% ((time.time() - start) * 1000, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+'''
+
+
+def benchmark(runs=5):
+	"""Measure startup time and peak RSS of resolving all plugin metrics through the full or slim MIB and through the index"""
+	for label, disable_index, full_mib in (('full MIB tree', True, True), ('slim MIB tree', True, False), ('symbol index', False, False)):
+		times = []
+		rss = []
+		for _ in range(runs):
+			output = subprocess.check_output([sys.executable, '-c', _BENCHMARK_CODE % dict(disable_index=disable_index, full_mib=full_mib)])
+			elapsed, maxrss = output.decode('ascii').split()
+			times.append(float(elapsed))
+			rss.append(int(maxrss))
+		print('%-16s startup %7.1f ms (best of %d), peak RSS %7d KiB' % (label, min(times), runs, min(rss)))
+
+
+def main():
+	argp = argparse.ArgumentParser(description='Build or benchmark the precompiled MIB symbol index')
+	argp.add_argument('command', choices=['build', 'benchmark'])
+	argp.add_argument('-r', '--runs', help='Number of benchmark runs', type=int, default=5)
+	args = argp.parse_args()
+
+	if args.command == 'build':
+		build_index(os.path.dirname(os.path.realpath(__file__)))
+	else:
+		benchmark(args.runs)
+
+
+if __name__ == "__main__":
+	main()
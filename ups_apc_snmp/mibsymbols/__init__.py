@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+# Hashes of the MIB modules the index was built from
+SOURCE_HASHES = {'PowerNet-MIB': 'c5c01e79b86608617fae2d4380b174acfcd4c128b02dc02ac5a2d458540b6100'}
+
+# Shards holding the symbols below an oid prefix, anything else is in 'common'
+PREFIXES = {
+	(1, 3, 6, 1, 4, 1, 318, 0): 'traps',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 1): 'ups',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 2): 'measureUps',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 3): 'miniSNMPadapter',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 4): 'masterswitch',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 5): 'masterswitchVM',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 6): 'masterswitchMSP',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 7): 'dcDM3',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 8): 'automaticTransferSwitch',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 9): 'dc2',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 10): 'environmentalMonitor',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 11): 'netlock',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 12): 'rPDU',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 13): 'airConditioners',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 14): 'rARU',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 15): 'xPDU',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 16): 'battMan',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 17): 'xATS',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 18): 'generator',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 19): 'consolePortServer',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 20): 'accessControl',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 21): 'apcLocalDisplay',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 22): 'isxModularDistribution',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 23): 'isxModularPdu',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 25): 'universalInputOutput',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 26): 'rPDU2',
+	(1, 3, 6, 1, 4, 1, 318, 1, 1, 27): 'cooling',
+}
+
+# Shards holding the symbols of a MIB starting with a lowercase word, the one holding most of them first
+ROUTES = {
+	('PowerNet-MIB', 'abnormal'): ('traps',),
+	('PowerNet-MIB', 'acc'): ('common',),
+	('PowerNet-MIB', 'accept'): ('common', 'ups'),
+	('PowerNet-MIB', 'access'): ('accessControl', 'traps'),
+	('PowerNet-MIB', 'air'): ('airConditioners', 'common', 'traps'),
+	('PowerNet-MIB', 'ais'): ('common',),
+	('PowerNet-MIB', 'ap'): ('consolePortServer',),
+	('PowerNet-MIB', 'apc'): ('traps', 'apcLocalDisplay', 'ups', 'common'),
+	('PowerNet-MIB', 'apcmgmt'): ('common',),
+	('PowerNet-MIB', 'aru'): ('traps',),
+	('PowerNet-MIB', 'ats'): ('automaticTransferSwitch', 'traps'),
+	('PowerNet-MIB', 'automatic'): ('automaticTransferSwitch', 'common'),
+	('PowerNet-MIB', 'back'): ('common',),
+	('PowerNet-MIB', 'bad'): ('traps',),
+	('PowerNet-MIB', 'base'): ('traps',),
+	('PowerNet-MIB', 'batt'): ('battMan', 'common'),
+	('PowerNet-MIB', 'battery'): ('traps', 'ups'),
+	('PowerNet-MIB', 'bm'): ('traps',),
+	('PowerNet-MIB', 'bms'): ('traps',),
+	('PowerNet-MIB', 'bypass'): ('traps',),
+	('PowerNet-MIB', 'calibration'): ('traps',),
+	('PowerNet-MIB', 'ce'): ('traps',),
+	('PowerNet-MIB', 'charger'): ('traps',),
+	('PowerNet-MIB', 'code'): ('traps',),
+	('PowerNet-MIB', 'communication'): ('traps',),
+	('PowerNet-MIB', 'community'): ('common',),
+	('PowerNet-MIB', 'con'): ('common',),
+	('PowerNet-MIB', 'config'): ('traps',),
+	('PowerNet-MIB', 'console'): ('consolePortServer',),
+	('PowerNet-MIB', 'contact'): ('traps', 'measureUps'),
+	('PowerNet-MIB', 'cooling'): ('cooling',),
+	('PowerNet-MIB', 'cps'): ('consolePortServer',),
+	('PowerNet-MIB', 'current'): ('measureUps',),
+	('PowerNet-MIB', 'database'): ('common',),
+	('PowerNet-MIB', 'dc'): ('traps', 'common', 'dc2', 'dcDM3'),
+	('PowerNet-MIB', 'dcmim'): ('dc2', 'common'),
+	('PowerNet-MIB', 'description'): ('measureUps',),
+	('PowerNet-MIB', 'device'): ('ups', 'traps'),
+	('PowerNet-MIB', 'dip'): ('ups',),
+	('PowerNet-MIB', 'discharge'): ('traps',),
+	('PowerNet-MIB', 'dm'): ('dcDM3', 'common'),
+	('PowerNet-MIB', 'dp'): ('common',),
+	('PowerNet-MIB', 'em'): ('environmentalMonitor',),
+	('PowerNet-MIB', 'ems'): ('environmentalMonitor', 'traps'),
+	('PowerNet-MIB', 'emu'): ('common',),
+	('PowerNet-MIB', 'env'): ('traps', 'environmentalMonitor'),
+	('PowerNet-MIB', 'environmental'): ('common', 'environmentalMonitor'),
+	('PowerNet-MIB', 'eps'): ('common',),
+	('PowerNet-MIB', 'essential'): ('common',),
+	('PowerNet-MIB', 'etl'): ('common',),
+	('PowerNet-MIB', 'experimental'): ('common',),
+	('PowerNet-MIB', 'ext'): ('traps',),
+	('PowerNet-MIB', 'external'): ('traps', 'environmentalMonitor'),
+	('PowerNet-MIB', 'galaxy'): ('common',),
+	('PowerNet-MIB', 'general'): ('traps',),
+	('PowerNet-MIB', 'generator'): ('generator',),
+	('PowerNet-MIB', 'graceful'): ('traps',),
+	('PowerNet-MIB', 'gutor'): ('common',),
+	('PowerNet-MIB', 'hardware'): ('common', 'traps'),
+	('PowerNet-MIB', 'humidity'): ('traps',),
+	('PowerNet-MIB', 'iem'): ('environmentalMonitor', 'traps'),
+	('PowerNet-MIB', 'infra'): ('common',),
+	('PowerNet-MIB', 'integrated'): ('environmentalMonitor',),
+	('PowerNet-MIB', 'intelligence'): ('traps',),
+	('PowerNet-MIB', 'isx'): ('isxModularDistribution', 'traps', 'isxModularPdu', 'common'),
+	('PowerNet-MIB', 'isxc'): ('traps', 'common'),
+	('PowerNet-MIB', 'load'): ('common',),
+	('PowerNet-MIB', 'logic'): ('traps',),
+	('PowerNet-MIB', 'low'): ('traps',),
+	('PowerNet-MIB', 'm'): ('measureUps',),
+	('PowerNet-MIB', 'master'): ('common',),
+	('PowerNet-MIB', 'masterswitch'): ('masterswitch', 'masterswitchMSP', 'masterswitchVM'),
+	('PowerNet-MIB', 'matrix'): ('common',),
+	('PowerNet-MIB', 'mconfig'): ('common',),
+	('PowerNet-MIB', 'mcontrol'): ('common',),
+	('PowerNet-MIB', 'measure'): ('measureUps',),
+	('PowerNet-MIB', 'mem'): ('environmentalMonitor', 'common'),
+	('PowerNet-MIB', 'mfiletransfer'): ('common',),
+	('PowerNet-MIB', 'mini'): ('miniSNMPadapter',),
+	('PowerNet-MIB', 'mod'): ('environmentalMonitor',),
+	('PowerNet-MIB', 'module'): ('common',),
+	('PowerNet-MIB', 'monitoring'): ('measureUps',),
+	('PowerNet-MIB', 'monitors'): ('common',),
+	('PowerNet-MIB', 'msp'): ('traps',),
+	('PowerNet-MIB', 'msvm'): ('traps',),
+	('PowerNet-MIB', 'mtrapargs'): ('common',),
+	('PowerNet-MIB', 'mups'): ('traps',),
+	('PowerNet-MIB', 'net'): ('common',),
+	('PowerNet-MIB', 'netlock'): ('netlock',),
+	('PowerNet-MIB', 'network'): ('common',),
+	('PowerNet-MIB', 'new'): ('common',),
+	('PowerNet-MIB', 'nl'): ('netlock',),
+	('PowerNet-MIB', 'no'): ('traps',),
+	('PowerNet-MIB', 'normal'): ('measureUps',),
+	('PowerNet-MIB', 'onbatterycommunication'): ('traps',),
+	('PowerNet-MIB', 'outlet'): ('traps',),
+	('PowerNet-MIB', 'password'): ('traps',),
+	('PowerNet-MIB', 'pdu'): ('traps',),
+	('PowerNet-MIB', 'power'): ('common', 'traps', 'ups'),
+	('PowerNet-MIB', 'products'): ('common',),
+	('PowerNet-MIB', 'r'): ('rPDU2', 'rPDU', 'rARU', 'traps'),
+	('PowerNet-MIB', 'rack'): ('common',),
+	('PowerNet-MIB', 'receive'): ('common',),
+	('PowerNet-MIB', 'receiver'): ('common',),
+	('PowerNet-MIB', 'redundant'): ('common',),
+	('PowerNet-MIB', 'restart'): ('traps',),
+	('PowerNet-MIB', 'return'): ('traps',),
+	('PowerNet-MIB', 'rintelligence'): ('traps',),
+	('PowerNet-MIB', 'rm'): ('traps',),
+	('PowerNet-MIB', 'rpdu'): ('traps',),
+	('PowerNet-MIB', 'rs'): ('traps',),
+	('PowerNet-MIB', 's'): ('masterswitchMSP', 'masterswitchVM', 'masterswitch'),
+	('PowerNet-MIB', 'serial'): ('miniSNMPadapter',),
+	('PowerNet-MIB', 'server'): ('common',),
+	('PowerNet-MIB', 'set'): ('miniSNMPadapter',),
+	('PowerNet-MIB', 'severity'): ('common',),
+	('PowerNet-MIB', 'side'): ('ups',),
+	('PowerNet-MIB', 'smart'): ('common', 'traps'),
+	('PowerNet-MIB', 'smw'): ('traps',),
+	('PowerNet-MIB', 'software'): ('common', 'traps'),
+	('PowerNet-MIB', 'struxure'): ('common',),
+	('PowerNet-MIB', 'subfeed'): ('ups',),
+	('PowerNet-MIB', 'switched'): ('traps',),
+	('PowerNet-MIB', 'switchgear'): ('ups',),
+	('PowerNet-MIB', 'symmetra'): ('common',),
+	('PowerNet-MIB', 'system'): ('common',),
+	('PowerNet-MIB', 'temperature'): ('traps',),
+	('PowerNet-MIB', 'trap'): ('common',),
+	('PowerNet-MIB', 'uio'): ('universalInputOutput',),
+	('PowerNet-MIB', 'universal'): ('universalInputOutput',),
+	('PowerNet-MIB', 'ups'): ('ups', 'traps'),
+	('PowerNet-MIB', 'user'): ('traps',),
+	('PowerNet-MIB', 'va'): ('ups',),
+	('PowerNet-MIB', 'x'): ('traps', 'xATS', 'xPDU', 'generator'),
+	('SNMPv2-MIB', 'sys'): ('common',),
+	('SNMPv2-MIB', 'system'): ('common',),
+}
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'accessControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20),
+		'accessPX': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1),
+		'accessPXConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 2),
+		'accessPXConfigAutoRelockTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 2, 2),
+		'accessPXConfigBeacon': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 7),
+		'accessPXConfigBeaconAction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 7, 3),
+		'accessPXConfigBeaconLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 7, 2),
+		'accessPXConfigBeaconName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 7, 1),
+		'accessPXConfigCardFormat': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 2, 3),
+		'accessPXConfigCardReaderEnableDisableAction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 2, 1),
+		'accessPXConfigFront': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 3),
+		'accessPXConfigFrontDoorLockControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 3, 1),
+		'accessPXConfigFrontDoorMaxOpenTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 3, 2),
+		'accessPXConfigRear': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 5),
+		'accessPXConfigRearDoorLockControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 5, 1),
+		'accessPXConfigRearDoorMaxOpenTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 5, 2),
+		'accessPXIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 1),
+		'accessPXIdentAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 1, 1),
+		'accessPXIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 1, 4),
+		'accessPXIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 1, 3),
+		'accessPXIdentProductNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 1, 2),
+		'accessPXIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 1, 5),
+		'accessPXStatusBeacon': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 8),
+		'accessPXStatusBeaconCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 8, 3),
+		'accessPXStatusBeaconLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 8, 2),
+		'accessPXStatusBeaconName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 8, 1),
+		'accessPXStatusFront': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 4),
+		'accessPXStatusFrontDoor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 4, 2),
+		'accessPXStatusFrontDoorAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 4, 5),
+		'accessPXStatusFrontDoorHandle': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 4, 3),
+		'accessPXStatusFrontDoorLock': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 4, 1),
+		'accessPXStatusFrontDoorMaxOpenTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 4, 4),
+		'accessPXStatusRear': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 6),
+		'accessPXStatusRearDoor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 6, 2),
+		'accessPXStatusRearDoorAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 6, 5),
+		'accessPXStatusRearDoorHandle': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 6, 3),
+		'accessPXStatusRearDoorLock': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 6, 1),
+		'accessPXStatusRearDoorMaxOpenTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 20, 1, 6, 4),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'accessPXConfigBeaconAction': (('turnOff', 1), ('turnOn', 2), ('notInstalledReadOnly', 3), ('disconnectedReadOnly', 4)),
+		'accessPXConfigCardFormat': (('hidStd26', 1), ('hid37Bit', 2), ('hid37BitWithFacility', 3), ('hidCorp1000', 4)),
+		'accessPXConfigCardReaderEnableDisableAction': (('disabled', 1), ('enable', 2)),
+		'accessPXConfigFrontDoorLockControl': (('unlock', 1), ('lock', 2), ('notInstalledReadOnly', 3), ('disconnectedReadOnly', 4)),
+		'accessPXConfigRearDoorLockControl': (('unlock', 1), ('lock', 2), ('notInstalledReadOnly', 3), ('disconnectedReadOnly', 4)),
+		'accessPXStatusBeaconCurrentState': (('off', 1), ('on', 2), ('notInstalled', 3), ('disconnected', 4)),
+		'accessPXStatusFrontDoor': (('open', 1), ('closed', 2), ('notInstalled', 3), ('disconnected', 4)),
+		'accessPXStatusFrontDoorHandle': (('open', 1), ('closed', 2), ('notInstalled', 3), ('disconnected', 4)),
+		'accessPXStatusFrontDoorLock': (('unlocked', 1), ('locked', 2), ('notInstalled', 3), ('disconnected', 4)),
+		'accessPXStatusRearDoor': (('open', 1), ('closed', 2), ('notInstalled', 3), ('disconnected', 4)),
+		'accessPXStatusRearDoorHandle': (('open', 1), ('closed', 2), ('notInstalled', 3), ('disconnected', 4)),
+		'accessPXStatusRearDoorLock': (('unlocked', 1), ('locked', 2), ('notInstalled', 3), ('disconnected', 4)),
+	},
+}
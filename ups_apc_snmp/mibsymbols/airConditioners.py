@@ -0,0 +1,2730 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'airConditioners': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13),
+		'airFM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1),
+		'airFMAlarmClearActiveGroupAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 1),
+		'airFMAlarmClearActiveSysModAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 2),
+		'airFMAlarmConditionsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1),
+		'airFMAlarmConditionsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1, 1),
+		'airFMAlarmConditionsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4),
+		'airFMAlarmConditionsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 3),
+		'airFMAlarmDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1, 5),
+		'airFMAlarmDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1, 7),
+		'airFMAlarmSeverity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1, 2),
+		'airFMAlarmTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1, 6),
+		'airFMAlarmType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1, 3),
+		'airFMAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6),
+		'airFMEventCode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 6, 4, 1, 4),
+		'airFMGroup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3),
+		'airFMGroupAutoRoleNumPrimary': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 4),
+		'airFMGroupCfg': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5),
+		'airFMGroupCfgDmdFightSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 8),
+		'airFMGroupCfgDmdFightStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 7),
+		'airFMGroupCfgFailoverCommLoss': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 6),
+		'airFMGroupCfgIdleBlower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 3),
+		'airFMGroupCfgName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 1),
+		'airFMGroupCfgNumSystems': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 2),
+		'airFMGroupCfgResetFieldServiceDefaults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 11),
+		'airFMGroupCfgSetpointShareSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 10),
+		'airFMGroupCfgSetpointShareStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 9),
+		'airFMGroupCfgShutdownFire': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 5),
+		'airFMGroupCfgShutdownSmoke': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 5, 4),
+		'airFMGroupFailover': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7),
+		'airFMGroupFailoverMod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2),
+		'airFMGroupFailoverModAirBlockInterlockOpen': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 11),
+		'airFMGroupFailoverModBlwrCntrl1Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 4),
+		'airFMGroupFailoverModBlwrCntrl2Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 5),
+		'airFMGroupFailoverModCondensatePumpFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 13),
+		'airFMGroupFailoverModCoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 2),
+		'airFMGroupFailoverModHighFilterDP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 6),
+		'airFMGroupFailoverModHighSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 7),
+		'airFMGroupFailoverModHumFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 3),
+		'airFMGroupFailoverModHumReplaceCylinder': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 10),
+		'airFMGroupFailoverModLossOrLowAirFlow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 9),
+		'airFMGroupFailoverModLowSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 8),
+		'airFMGroupFailoverModMaintRequired': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 1),
+		'airFMGroupFailoverModWaterDetected': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 2, 12),
+		'airFMGroupFailoverSys': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1),
+		'airFMGroupFailoverSysAnyMajorAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 2),
+		'airFMGroupFailoverSysAnyMinorAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 1),
+		'airFMGroupFailoverSysCommLost': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 9),
+		'airFMGroupFailoverSysFireAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 7),
+		'airFMGroupFailoverSysHighEnvHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 5),
+		'airFMGroupFailoverSysHighEnvTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 3),
+		'airFMGroupFailoverSysLowEnvHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 6),
+		'airFMGroupFailoverSysLowEnvTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 4),
+		'airFMGroupFailoverSysNoSensorsAvailable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 14),
+		'airFMGroupFailoverSysPrimarySensorFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 12),
+		'airFMGroupFailoverSysReturnSensorFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 11),
+		'airFMGroupFailoverSysSecondarySensorFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 13),
+		'airFMGroupFailoverSysSmokeAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 8),
+		'airFMGroupFailoverSysSupplySensorFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 7, 1, 10),
+		'airFMGroupLoadShare': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6),
+		'airFMGroupLoadShareCoolRequests': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 1),
+		'airFMGroupLoadShareCoolThreshC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 2),
+		'airFMGroupLoadShareCoolThreshF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 3),
+		'airFMGroupLoadShareDehumRequests': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 9),
+		'airFMGroupLoadShareDehumThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 10),
+		'airFMGroupLoadShareHumRequests': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 7),
+		'airFMGroupLoadShareHumThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 8),
+		'airFMGroupLoadShareReheatRequests': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 4),
+		'airFMGroupLoadShareReheatThreshC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 5),
+		'airFMGroupLoadShareReheatThreshF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 6, 6),
+		'airFMGroupSysComm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1, 6),
+		'airFMGroupSysIPAddress': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1, 7),
+		'airFMGroupSysIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1, 1),
+		'airFMGroupSysManualRoleSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1, 4),
+		'airFMGroupSysPresentRole': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1, 3),
+		'airFMGroupSysRole': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 3),
+		'airFMGroupSysRoleAssignment': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 3),
+		'airFMGroupSysRoleStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1, 2),
+		'airFMGroupSysRoles': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4),
+		'airFMGroupSysRolesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1),
+		'airFMGroupSysRolesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2),
+		'airFMGroupSysRolesTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 1),
+		'airFMGroupSysRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 4, 2, 1, 5),
+		'airFMGroupSysRuntime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 2),
+		'airFMGroupSysStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 3, 1),
+		'airFMIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1),
+		'airFMIdentContact': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 5),
+		'airFMIdentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3, 1),
+		'airFMIdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 4),
+		'airFMIdentModuleDateOfMfg': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3, 1, 3),
+		'airFMIdentModuleFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3, 1, 5),
+		'airFMIdentModuleHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3, 1, 6),
+		'airFMIdentModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3, 1, 1),
+		'airFMIdentModuleModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3, 1, 2),
+		'airFMIdentModuleSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3, 1, 4),
+		'airFMIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 1),
+		'airFMIdentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 3),
+		'airFMIdentTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 1, 2),
+		'airFMModBlower1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6),
+		'airFMModBlower2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7),
+		'airFMModBlwr1AccTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 12),
+		'airFMModBlwr1ActFreq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 4),
+		'airFMModBlwr1ActTorq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 8),
+		'airFMModBlwr1CapLife': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 14),
+		'airFMModBlwr1ChokeTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 22),
+		'airFMModBlwr1ChokeTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 23),
+		'airFMModBlwr1CmdFreq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 3),
+		'airFMModBlwr1CtrlCoolFanLife': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 15),
+		'airFMModBlwr1CtrlType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 2),
+		'airFMModBlwr1Current': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 9),
+		'airFMModBlwr1DCLinkVlt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 11),
+		'airFMModBlwr1DecTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 13),
+		'airFMModBlwr1ElOvMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 16),
+		'airFMModBlwr1ElOvSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 17),
+		'airFMModBlwr1ElOvTimeConst': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 18),
+		'airFMModBlwr1Entry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1),
+		'airFMModBlwr1FanPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 19),
+		'airFMModBlwr1HeatsinkTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 20),
+		'airFMModBlwr1HeatsinkTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 21),
+		'airFMModBlwr1InverterTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 24),
+		'airFMModBlwr1InverterTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 25),
+		'airFMModBlwr1ModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 1),
+		'airFMModBlwr1Poles': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 5),
+		'airFMModBlwr1RatedCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 7),
+		'airFMModBlwr1RatedHorsePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 6),
+		'airFMModBlwr1Table': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2),
+		'airFMModBlwr1TableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 1),
+		'airFMModBlwr1Vlt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 6, 2, 1, 10),
+		'airFMModBlwr2AccTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 12),
+		'airFMModBlwr2ActFreq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 4),
+		'airFMModBlwr2ActTorq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 8),
+		'airFMModBlwr2CapLife': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 14),
+		'airFMModBlwr2ChokeTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 22),
+		'airFMModBlwr2ChokeTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 23),
+		'airFMModBlwr2CmdFreq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 3),
+		'airFMModBlwr2CtrlCoolFanLife': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 15),
+		'airFMModBlwr2CtrlType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 2),
+		'airFMModBlwr2Current': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 9),
+		'airFMModBlwr2DCLinkVlt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 11),
+		'airFMModBlwr2DecTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 13),
+		'airFMModBlwr2ElOvMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 16),
+		'airFMModBlwr2ElOvSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 17),
+		'airFMModBlwr2ElOvTimeConst': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 18),
+		'airFMModBlwr2Entry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1),
+		'airFMModBlwr2FanPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 19),
+		'airFMModBlwr2HeatsinkTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 20),
+		'airFMModBlwr2HeatsinkTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 21),
+		'airFMModBlwr2InverterTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 24),
+		'airFMModBlwr2InverterTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 25),
+		'airFMModBlwr2ModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 1),
+		'airFMModBlwr2Poles': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 5),
+		'airFMModBlwr2RatedCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 7),
+		'airFMModBlwr2RatedHorsePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 6),
+		'airFMModBlwr2Table': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2),
+		'airFMModBlwr2TableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 1),
+		'airFMModBlwr2Vlt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 7, 2, 1, 10),
+		'airFMModBlwrFreqSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 7),
+		'airFMModCapacityCtrl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 3),
+		'airFMModCoilDiffPresInWC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 11),
+		'airFMModCoilDiffPresPa': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 10),
+		'airFMModCoilFluidVlvPos': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 9),
+		'airFMModComp1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 2),
+		'airFMModComp2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 3),
+		'airFMModCondFluidVlvPos': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 8),
+		'airFMModCondPump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 10),
+		'airFMModCoolEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1),
+		'airFMModCoolModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 1),
+		'airFMModCoolTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2),
+		'airFMModCoolTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 1),
+		'airFMModCooling': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4),
+		'airFMModDischPresKPa': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 6),
+		'airFMModDischPresPSI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 7),
+		'airFMModElectricHeaterType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 5),
+		'airFMModElectrodeCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1, 3),
+		'airFMModFilterDiffPresInWC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 9),
+		'airFMModFilterDiffPresPa': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 8),
+		'airFMModFireDetector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 11),
+		'airFMModFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2, 1, 5),
+		'airFMModHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2, 1, 6),
+		'airFMModHeaterType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 4),
+		'airFMModHotWaterVlvPos': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1, 6),
+		'airFMModHumActualOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1, 4),
+		'airFMModHumEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1),
+		'airFMModHumModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1, 1),
+		'airFMModHumTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2),
+		'airFMModHumTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 1),
+		'airFMModHumidifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1, 2),
+		'airFMModHumidifierType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 6),
+		'airFMModHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5),
+		'airFMModIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1),
+		'airFMModIdentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2, 1),
+		'airFMModIdentModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2, 1, 1),
+		'airFMModIdentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2),
+		'airFMModIdentTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 1),
+		'airFMModManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2, 1, 4),
+		'airFMModModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2, 1, 2),
+		'airFMModNomCoilDiffPresInWC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 9),
+		'airFMModNomCoilDiffPresPa': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 8),
+		'airFMModOutputCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 2),
+		'airFMModPropEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1),
+		'airFMModPropModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 1),
+		'airFMModPropTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2),
+		'airFMModPropTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 1),
+		'airFMModProperties': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3),
+		'airFMModRHBlwr1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 6),
+		'airFMModRHBlwr1Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 14),
+		'airFMModRHBlwr2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 7),
+		'airFMModRHBlwr2Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 15),
+		'airFMModRHBlwrCtrl1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 8),
+		'airFMModRHBlwrCtrl2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 9),
+		'airFMModRHComp1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 2),
+		'airFMModRHComp1Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 10),
+		'airFMModRHComp2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 3),
+		'airFMModRHComp2Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 11),
+		'airFMModRHEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1),
+		'airFMModRHHeater': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 4),
+		'airFMModRHHeaterReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 12),
+		'airFMModRHHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 5),
+		'airFMModRHHumReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 13),
+		'airFMModRHModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2, 1, 1),
+		'airFMModRHTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 2),
+		'airFMModRHTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8, 1),
+		'airFMModReturnHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 7),
+		'airFMModReturnTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 5),
+		'airFMModReturnTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 6),
+		'airFMModRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 8),
+		'airFMModSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 1, 2, 1, 3),
+		'airFMModServIntBlwr1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 5),
+		'airFMModServIntBlwr1Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 6),
+		'airFMModServIntBlwr2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 6),
+		'airFMModServIntBlwr2Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 7),
+		'airFMModServIntBlwrCtrl1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 7),
+		'airFMModServIntBlwrCtrl1Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 8),
+		'airFMModServIntBlwrCtrl2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 8),
+		'airFMModServIntBlwrCtrl2Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 9),
+		'airFMModServIntComp1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 1),
+		'airFMModServIntComp1Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 2),
+		'airFMModServIntComp2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 2),
+		'airFMModServIntComp2Reset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 3),
+		'airFMModServIntHeater': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 3),
+		'airFMModServIntHeaterReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 4),
+		'airFMModServIntHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9, 4),
+		'airFMModServIntHumReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 5),
+		'airFMModServIntResetEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1),
+		'airFMModServIntResetModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2, 1, 1),
+		'airFMModServIntResetTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 2),
+		'airFMModServIntResetTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10, 1),
+		'airFMModServIntResets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 10),
+		'airFMModServIntervals': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 9),
+		'airFMModSmokeDetector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 12),
+		'airFMModStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2),
+		'airFMModStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1),
+		'airFMModStatusModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 1),
+		'airFMModStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2),
+		'airFMModStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 1),
+		'airFMModStmElectHumMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1, 7),
+		'airFMModSuctPresKPa': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 4),
+		'airFMModSuctPresPSI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 4, 2, 1, 5),
+		'airFMModSupplyHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 4),
+		'airFMModSupplyTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 2),
+		'airFMModSupplyTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 2, 2, 1, 3),
+		'airFMModWaterConductivity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 5, 2, 1, 5),
+		'airFMModWaterDetector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5, 3, 2, 1, 13),
+		'airFMModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 5),
+		'airFMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2),
+		'airFMStatusModuleEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1),
+		'airFMStatusModuleIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 1),
+		'airFMStatusModuleOutputCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 2),
+		'airFMStatusModuleReturnHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 8),
+		'airFMStatusModuleReturnTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 6),
+		'airFMStatusModuleReturnTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 7),
+		'airFMStatusModuleSupplyHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 5),
+		'airFMStatusModuleSupplyTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 3),
+		'airFMStatusModuleSupplyTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20, 1, 4),
+		'airFMStatusModuleTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 20),
+		'airFMStatusModuleTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 19),
+		'airFMStatusSystemActionHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 7),
+		'airFMStatusSystemActionTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 5),
+		'airFMStatusSystemActionTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 6),
+		'airFMStatusSystemAverageRetHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 4),
+		'airFMStatusSystemAverageRetTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 2),
+		'airFMStatusSystemAverageRetTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 3),
+		'airFMStatusSystemCoolingEnabled': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 15),
+		'airFMStatusSystemDehumidifyEnabled': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 18),
+		'airFMStatusSystemHumidifyEnabled': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 17),
+		'airFMStatusSystemOn': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 1),
+		'airFMStatusSystemReheatingEnabled': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 16),
+		'airFMStatusSystemRemoteAvgHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 12),
+		'airFMStatusSystemRemoteAvgTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 10),
+		'airFMStatusSystemRemoteAvgTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 11),
+		'airFMStatusSystemRemoteHighTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 8),
+		'airFMStatusSystemRemoteHighTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 9),
+		'airFMStatusSystemRemoteLowTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 13),
+		'airFMStatusSystemRemoteLowTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 2, 14),
+		'airFMSysActualElectricReheat': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 8),
+		'airFMSysActualHumCtrl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6, 6),
+		'airFMSysActualHumCtrlMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 22),
+		'airFMSysActualSteamElectrodeHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 12),
+		'airFMSysActualSteamHotGasReheat': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 10),
+		'airFMSysActualSteamHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 14),
+		'airFMSysActualTempCtrlMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 20),
+		'airFMSysAirFltr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 9),
+		'airFMSysAlarmMap': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12),
+		'airFMSysAlarmMapExpMod1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3),
+		'airFMSysAlarmMapExpMod1AirBlckIntOpen': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 14),
+		'airFMSysAlarmMapExpMod1AnyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 2),
+		'airFMSysAlarmMapExpMod1BlwrCntl1Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 10),
+		'airFMSysAlarmMapExpMod1BlwrCntl2Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 11),
+		'airFMSysAlarmMapExpMod1CondPumpFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 9),
+		'airFMSysAlarmMapExpMod1CoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 4),
+		'airFMSysAlarmMapExpMod1Entry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1),
+		'airFMSysAlarmMapExpMod1HighFltrDP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 12),
+		'airFMSysAlarmMapExpMod1HighSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 5),
+		'airFMSysAlarmMapExpMod1HumFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 7),
+		'airFMSysAlarmMapExpMod1HumReplCyl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 8),
+		'airFMSysAlarmMapExpMod1LowAirFlow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 13),
+		'airFMSysAlarmMapExpMod1LowSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 6),
+		'airFMSysAlarmMapExpMod1MaintReq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 3),
+		'airFMSysAlarmMapExpMod1OutputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 1),
+		'airFMSysAlarmMapExpMod1Table': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2),
+		'airFMSysAlarmMapExpMod1TableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 1),
+		'airFMSysAlarmMapExpMod1WaterDetected': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 3, 2, 1, 15),
+		'airFMSysAlarmMapExpMod2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4),
+		'airFMSysAlarmMapExpMod2AirBlckIntOpen': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 14),
+		'airFMSysAlarmMapExpMod2AnyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 2),
+		'airFMSysAlarmMapExpMod2BlwrCntl1Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 10),
+		'airFMSysAlarmMapExpMod2BlwrCntl2Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 11),
+		'airFMSysAlarmMapExpMod2CondPumpFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 9),
+		'airFMSysAlarmMapExpMod2CoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 4),
+		'airFMSysAlarmMapExpMod2Entry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1),
+		'airFMSysAlarmMapExpMod2HighFltrDP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 12),
+		'airFMSysAlarmMapExpMod2HighSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 5),
+		'airFMSysAlarmMapExpMod2HumFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 7),
+		'airFMSysAlarmMapExpMod2HumReplCyl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 8),
+		'airFMSysAlarmMapExpMod2LowAirFlow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 13),
+		'airFMSysAlarmMapExpMod2LowSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 6),
+		'airFMSysAlarmMapExpMod2MaintReq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 3),
+		'airFMSysAlarmMapExpMod2OutputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 1),
+		'airFMSysAlarmMapExpMod2Table': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2),
+		'airFMSysAlarmMapExpMod2TableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 1),
+		'airFMSysAlarmMapExpMod2WaterDetected': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 4, 2, 1, 15),
+		'airFMSysAlarmMapInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5),
+		'airFMSysAlarmMapInput1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 2),
+		'airFMSysAlarmMapInput10': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 11),
+		'airFMSysAlarmMapInput11': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 12),
+		'airFMSysAlarmMapInput12': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 13),
+		'airFMSysAlarmMapInput13': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 14),
+		'airFMSysAlarmMapInput14': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 15),
+		'airFMSysAlarmMapInput15': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 16),
+		'airFMSysAlarmMapInput16': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 17),
+		'airFMSysAlarmMapInput2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 3),
+		'airFMSysAlarmMapInput3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 4),
+		'airFMSysAlarmMapInput4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 5),
+		'airFMSysAlarmMapInput5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 6),
+		'airFMSysAlarmMapInput6': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 7),
+		'airFMSysAlarmMapInput7': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 8),
+		'airFMSysAlarmMapInput8': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 9),
+		'airFMSysAlarmMapInput9': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 10),
+		'airFMSysAlarmMapInputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1),
+		'airFMSysAlarmMapInputOutputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2, 1, 1),
+		'airFMSysAlarmMapInputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 2),
+		'airFMSysAlarmMapInputTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 5, 1),
+		'airFMSysAlarmMapMainMod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2),
+		'airFMSysAlarmMapMainModAirBlckIntOpen': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 14),
+		'airFMSysAlarmMapMainModAnyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 2),
+		'airFMSysAlarmMapMainModBlwrCntl1Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 10),
+		'airFMSysAlarmMapMainModBlwrCntl2Fail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 11),
+		'airFMSysAlarmMapMainModCondPumpFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 9),
+		'airFMSysAlarmMapMainModCoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 4),
+		'airFMSysAlarmMapMainModEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1),
+		'airFMSysAlarmMapMainModHighFltrDP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 12),
+		'airFMSysAlarmMapMainModHighSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 5),
+		'airFMSysAlarmMapMainModHumFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 7),
+		'airFMSysAlarmMapMainModHumReplCyl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 8),
+		'airFMSysAlarmMapMainModLowAirFlow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 13),
+		'airFMSysAlarmMapMainModLowSupplyTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 6),
+		'airFMSysAlarmMapMainModMaintReq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 3),
+		'airFMSysAlarmMapMainModOutputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 1),
+		'airFMSysAlarmMapMainModTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2),
+		'airFMSysAlarmMapMainModTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 1),
+		'airFMSysAlarmMapMainModWaterDetected': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 2, 2, 1, 15),
+		'airFMSysAlarmMapOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6),
+		'airFMSysAlarmMapOutput1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 2),
+		'airFMSysAlarmMapOutput10': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 11),
+		'airFMSysAlarmMapOutput11': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 12),
+		'airFMSysAlarmMapOutput12': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 13),
+		'airFMSysAlarmMapOutput13': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 14),
+		'airFMSysAlarmMapOutput14': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 15),
+		'airFMSysAlarmMapOutput15': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 16),
+		'airFMSysAlarmMapOutput16': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 17),
+		'airFMSysAlarmMapOutput2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 3),
+		'airFMSysAlarmMapOutput3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 4),
+		'airFMSysAlarmMapOutput4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 5),
+		'airFMSysAlarmMapOutput5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 6),
+		'airFMSysAlarmMapOutput6': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 7),
+		'airFMSysAlarmMapOutput7': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 8),
+		'airFMSysAlarmMapOutput8': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 9),
+		'airFMSysAlarmMapOutput9': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 10),
+		'airFMSysAlarmMapOutputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1),
+		'airFMSysAlarmMapOutputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2, 1, 1),
+		'airFMSysAlarmMapOutputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 2),
+		'airFMSysAlarmMapOutputTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 6, 1),
+		'airFMSysAlarmMapSys': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1),
+		'airFMSysAlarmMapSysAnyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 2),
+		'airFMSysAlarmMapSysEconIsol': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 11),
+		'airFMSysAlarmMapSysEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1),
+		'airFMSysAlarmMapSysFireDet': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 9),
+		'airFMSysAlarmMapSysHighEnvHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 7),
+		'airFMSysAlarmMapSysHighEnvTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 5),
+		'airFMSysAlarmMapSysLowEnvHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 8),
+		'airFMSysAlarmMapSysLowEnvTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 6),
+		'airFMSysAlarmMapSysOutputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 1),
+		'airFMSysAlarmMapSysPrimSensFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 15),
+		'airFMSysAlarmMapSysRemSensRemoved': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 14),
+		'airFMSysAlarmMapSysReturnSensFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 13),
+		'airFMSysAlarmMapSysSecSensActive': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 17),
+		'airFMSysAlarmMapSysSecSensFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 16),
+		'airFMSysAlarmMapSysSmokeDet': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 10),
+		'airFMSysAlarmMapSysSupplySensFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 12),
+		'airFMSysAlarmMapSysTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2),
+		'airFMSysAlarmMapSysTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 1),
+		'airFMSysAlarmMapSystemOffline': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 4),
+		'airFMSysAlarmMapSystemOn': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 12, 1, 2, 1, 3),
+		'airFMSysAvgRemoteHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 14),
+		'airFMSysAvgRemoteTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 12),
+		'airFMSysAvgRemoteTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 13),
+		'airFMSysAvgReturnHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 11),
+		'airFMSysAvgReturnTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 9),
+		'airFMSysAvgReturnTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 10),
+		'airFMSysCndsrFluidVlvAct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 13),
+		'airFMSysCndsrFluidVlvCloseDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 6),
+		'airFMSysCndsrFluidVlvType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 14),
+		'airFMSysCoilCfg': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 5),
+		'airFMSysCoilFluidActivDeadbandC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 18),
+		'airFMSysCoilFluidActivDeadbandF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 19),
+		'airFMSysCoilFluidActivThreshC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 16),
+		'airFMSysCoilFluidActivThreshF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 17),
+		'airFMSysCoilFluidActualCoolDehum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 6),
+		'airFMSysCoilFluidCoolDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 4),
+		'airFMSysCoilFluidDehumDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 5),
+		'airFMSysCoilFluidTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 5),
+		'airFMSysCoilFluidTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 6),
+		'airFMSysCoilFluidVlvAct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 11),
+		'airFMSysCoilFluidVlvType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 12),
+		'airFMSysCommLossShutdownDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 6),
+		'airFMSysCompMinOffTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 2),
+		'airFMSysCompMinOnTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 1),
+		'airFMSysCompRotPeriod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 3),
+		'airFMSysConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4),
+		'airFMSysCoolDeadbandC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 12),
+		'airFMSysCoolDeadbandF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 13),
+		'airFMSysCoolEconIsolFunction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 14),
+		'airFMSysCoolEssFunction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 9),
+		'airFMSysCoolPIDDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 23),
+		'airFMSysCoolPIDGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 21),
+		'airFMSysCoolPIDMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 20),
+		'airFMSysCoolPIDResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 22),
+		'airFMSysCoolSetpointC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 10),
+		'airFMSysCoolSetpointF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 11),
+		'airFMSysCoolState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 8),
+		'airFMSysCooling': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5),
+		'airFMSysCtrlHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 25),
+		'airFMSysCtrlTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 23),
+		'airFMSysCtrlTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 24),
+		'airFMSysDXActualCoolDehum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 3),
+		'airFMSysDXCoolingDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 1),
+		'airFMSysDXDehumDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 2),
+		'airFMSysDehumCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 5),
+		'airFMSysDehumDeadband': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 4),
+		'airFMSysDehumEssFunction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 2),
+		'airFMSysDehumPIDDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 9),
+		'airFMSysDehumPIDGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 7),
+		'airFMSysDehumPIDMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 6),
+		'airFMSysDehumPIDResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 8),
+		'airFMSysDehumSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 3),
+		'airFMSysDehumState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7, 1),
+		'airFMSysDehumidify': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 7),
+		'airFMSysDemands': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2),
+		'airFMSysDischAirPtrn': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 8),
+		'airFMSysEconIsolVlvCloseDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 5),
+		'airFMSysEconIsolVlvOpenDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 4),
+		'airFMSysElectricReheatDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 7),
+		'airFMSysFastStartup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 3),
+		'airFMSysFlowSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 10),
+		'airFMSysHeatRejection': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 7),
+		'airFMSysHighCoilFluidTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 5),
+		'airFMSysHighCoilFluidTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 6),
+		'airFMSysHighCtrlHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 13),
+		'airFMSysHighCtrlTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 9),
+		'airFMSysHighCtrlTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 10),
+		'airFMSysHighSplyTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 1),
+		'airFMSysHighSplyTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 2),
+		'airFMSysHotWaterTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 7),
+		'airFMSysHotWaterTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 8),
+		'airFMSysHotWaterVlvAct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 15),
+		'airFMSysHumAlarmDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 16),
+		'airFMSysHumCtrlMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 21),
+		'airFMSysHumCtrlSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6, 5),
+		'airFMSysHumDeadband': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6, 4),
+		'airFMSysHumEssFunction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6, 2),
+		'airFMSysHumSensBand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6, 7),
+		'airFMSysHumSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6, 3),
+		'airFMSysHumState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6, 1),
+		'airFMSysHumidify': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 6),
+		'airFMSysInputAlarmAction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2, 1, 6),
+		'airFMSysInputDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2, 1, 5),
+		'airFMSysInputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2, 1),
+		'airFMSysInputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2, 1, 1),
+		'airFMSysInputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2, 1, 2),
+		'airFMSysInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2, 1, 4),
+		'airFMSysInputStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2, 1, 3),
+		'airFMSysInputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 2),
+		'airFMSysInputTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10, 1),
+		'airFMSysInputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 10),
+		'airFMSysInterstageDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 7),
+		'airFMSysLowCoilFluidTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 7),
+		'airFMSysLowCoilFluidTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 8),
+		'airFMSysLowCtrlHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 14),
+		'airFMSysLowCtrlTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 11),
+		'airFMSysLowCtrlTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 12),
+		'airFMSysLowSplyTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 3),
+		'airFMSysLowSplyTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 4),
+		'airFMSysMainsVlt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 3),
+		'airFMSysMaxRemoteTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 15),
+		'airFMSysMaxRemoteTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 16),
+		'airFMSysMinRemoteTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 17),
+		'airFMSysMinRemoteTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 18),
+		'airFMSysModeDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 5),
+		'airFMSysNumModules': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 1),
+		'airFMSysNumPCIOMs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 2),
+		'airFMSysNumRemoteSensors': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 16),
+		'airFMSysNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 1),
+		'airFMSysOutputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 11, 2, 1),
+		'airFMSysOutputIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 11, 2, 1, 1),
+		'airFMSysOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 11, 2, 1, 3),
+		'airFMSysOutputStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 11, 2, 1, 2),
+		'airFMSysOutputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 11, 2),
+		'airFMSysOutputTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 11, 1),
+		'airFMSysOutputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 11),
+		'airFMSysPresentRole': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 3),
+		'airFMSysPresentStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 2),
+		'airFMSysPrimaryControlSensor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 1),
+		'airFMSysRefrigType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 6),
+		'airFMSysReheat': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8),
+		'airFMSysReheatDeadbandC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 5),
+		'airFMSysReheatDeadbandF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 6),
+		'airFMSysReheatEssFunction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 2),
+		'airFMSysReheatPIDDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 10),
+		'airFMSysReheatPIDGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 8),
+		'airFMSysReheatPIDMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 7),
+		'airFMSysReheatPIDResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 9),
+		'airFMSysReheatSetpointC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 3),
+		'airFMSysReheatSetpointF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 4),
+		'airFMSysReheatState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 8, 1),
+		'airFMSysRemoteSensorData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 2),
+		'airFMSysResetFldSrvcDflts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 9),
+		'airFMSysResetRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 10),
+		'airFMSysResetSysFailure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 7),
+		'airFMSysResetUserDflts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 8),
+		'airFMSysRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 4),
+		'airFMSysSetup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3),
+		'airFMSysStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 4, 4),
+		'airFMSysStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1),
+		'airFMSysSteamElectrodeHumDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 11),
+		'airFMSysSteamHotGasReheatDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 9),
+		'airFMSysSteamHumDmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 2, 13),
+		'airFMSysSuctPresCompensation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 5, 15),
+		'airFMSysTempAlarmDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9, 15),
+		'airFMSysTempCtrlMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 1, 19),
+		'airFMSysThresholds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 9),
+		'airFMSysUPSVlt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4, 3, 4),
+		'airFMSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 1, 4),
+		'airIR': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3),
+		'airIRAlarmConditionsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 1, 2, 1),
+		'airIRAlarmConditionsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 1, 2, 1, 1),
+		'airIRAlarmConditionsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 1, 2),
+		'airIRAlarmConditionsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 1, 1),
+		'airIRAlarmDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 1, 2, 1, 3),
+		'airIRAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 1),
+		'airIREventCode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 1, 2, 1, 2),
+		'airIRG2Alarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 3),
+		'airIRG2AlarmsDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 3, 2, 1, 3),
+		'airIRG2AlarmsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 3, 2, 1),
+		'airIRG2AlarmsEventCode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 3, 2, 1, 2),
+		'airIRG2AlarmsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 3, 2, 1, 1),
+		'airIRG2AlarmsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 3, 2),
+		'airIRG2AlarmsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 3, 1),
+		'airIRG2Group': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2),
+		'airIRG2GroupConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3),
+		'airIRG2GroupConfigActiveFlowControllerLampTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 13),
+		'airIRG2GroupConfigAltitudeMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 15),
+		'airIRG2GroupConfigAltitudeUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 14),
+		'airIRG2GroupConfigCapacityControlType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 3),
+		'airIRG2GroupConfigConfigurationType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 2),
+		'airIRG2GroupConfigCoolDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 7),
+		'airIRG2GroupConfigCoolGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 5),
+		'airIRG2GroupConfigCoolPIDReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 8),
+		'airIRG2GroupConfigCoolResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 6),
+		'airIRG2GroupConfigFanSpeedControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 4),
+		'airIRG2GroupConfigLoadAssistEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 11),
+		'airIRG2GroupConfigNumberOfActiveFlowControllers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 12),
+		'airIRG2GroupConfigNumberofBackupUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 9),
+		'airIRG2GroupConfigNumberofCoolingUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 1),
+		'airIRG2GroupConfigRuntimeBalancingEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 3, 10),
+		'airIRG2GroupSetpoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2),
+		'airIRG2GroupSetpointsActiveFlowControlBias': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 8),
+		'airIRG2GroupSetptsCoolDeadbandMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 4),
+		'airIRG2GroupSetptsCoolDeadbandUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 3),
+		'airIRG2GroupSetptsCoolSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 2),
+		'airIRG2GroupSetptsCoolSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 1),
+		'airIRG2GroupSetptsFanSpeedPreference': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 5),
+		'airIRG2GroupSetptsSupplyAirSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 7),
+		'airIRG2GroupSetptsSupplyAirSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 2, 6),
+		'airIRG2GroupStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1),
+		'airIRG2GroupStatusActiveFlowControlStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 13),
+		'airIRG2GroupStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 4),
+		'airIRG2GroupStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 3),
+		'airIRG2GroupStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 2),
+		'airIRG2GroupStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 1),
+		'airIRG2GroupStatusMaxRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 6),
+		'airIRG2GroupStatusMaxRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 5),
+		'airIRG2GroupStatusMaxReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 10),
+		'airIRG2GroupStatusMaxReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 9),
+		'airIRG2GroupStatusMinRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 8),
+		'airIRG2GroupStatusMinRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 7),
+		'airIRG2GroupStatusMinReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 12),
+		'airIRG2GroupStatusMinReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 2, 1, 11),
+		'airIRG2Ident': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1),
+		'airIRG2IdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 5),
+		'airIRG2IdentGroupSysOID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 9),
+		'airIRG2IdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 6),
+		'airIRG2IdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 2),
+		'airIRG2IdentManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 7),
+		'airIRG2IdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 3),
+		'airIRG2IdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 1),
+		'airIRG2IdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 4),
+		'airIRG2IdentUnitSysOID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 1, 8),
+		'airIRG2RA': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 7),
+		'airIRG2RC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 4),
+		'airIRG2RD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5),
+		'airIRG2RDT2Config': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6),
+		'airIRG2RDT2ConfigIdleOnLeakDetect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 3),
+		'airIRG2RDT2ConfigInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 4),
+		'airIRG2RDT2ConfigOHEInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 7),
+		'airIRG2RDT2ConfigOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 5),
+		'airIRG2RDT2ConfigOutputSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 6),
+		'airIRG2RDT2ConfigStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 2),
+		'airIRG2RDT2ConfigUnitIdleOnCoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 9),
+		'airIRG2RDT2ConfigUnitRoleOverride': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 8),
+		'airIRG2RDT2ConfigUnitType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 6, 1),
+		'airIRG2RDT2RunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2),
+		'airIRG2RDT2RunHoursAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 1),
+		'airIRG2RDT2RunHoursCompressor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 3),
+		'airIRG2RDT2RunHoursCondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 2),
+		'airIRG2RDT2RunHoursEvapFanEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 7, 1),
+		'airIRG2RDT2RunHoursEvapFanHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 7, 1, 2),
+		'airIRG2RDT2RunHoursEvapFanIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 7, 1, 1),
+		'airIRG2RDT2RunHoursEvapFanTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 7),
+		'airIRG2RDT2RunHoursEvapFanTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 6),
+		'airIRG2RDT2RunHoursFanPSEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 5, 1),
+		'airIRG2RDT2RunHoursFanPSHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 5, 1, 2),
+		'airIRG2RDT2RunHoursFanPSIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 5, 1, 1),
+		'airIRG2RDT2RunHoursFanPSPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 5, 1, 3),
+		'airIRG2RDT2RunHoursFanPSTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 5),
+		'airIRG2RDT2RunHoursFanPSTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 4),
+		'airIRG2RDT2RunHoursUnit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 2, 8),
+		'airIRG2RDT2ServiceIntervals': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 3),
+		'airIRG2RDT2ServiceIntervalsAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 3, 1),
+		'airIRG2RDT2ServiceIntervalsAirFilterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 3, 2),
+		'airIRG2RDT2Setpoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 5),
+		'airIRG2RDT2Status': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1),
+		'airIRG2RDT2StatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 5),
+		'airIRG2RDT2StatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 4),
+		'airIRG2RDT2StatusCompressor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 27),
+		'airIRG2RDT2StatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 3),
+		'airIRG2RDT2StatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 2),
+		'airIRG2RDT2StatusDischargePressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 21),
+		'airIRG2RDT2StatusDischargePressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 20),
+		'airIRG2RDT2StatusEvaporatorFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 22),
+		'airIRG2RDT2StatusFilterDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 17),
+		'airIRG2RDT2StatusFilterDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 16),
+		'airIRG2RDT2StatusFluidValvePos': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 28),
+		'airIRG2RDT2StatusHotGasBypassValvePos': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 29),
+		'airIRG2RDT2StatusInputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 23),
+		'airIRG2RDT2StatusLeakSensor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 30),
+		'airIRG2RDT2StatusOHEInputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 25),
+		'airIRG2RDT2StatusOHEOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 26),
+		'airIRG2RDT2StatusOperateMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 1),
+		'airIRG2RDT2StatusOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 24),
+		'airIRG2RDT2StatusRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 7),
+		'airIRG2RDT2StatusRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 6),
+		'airIRG2RDT2StatusReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 11),
+		'airIRG2RDT2StatusReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 10),
+		'airIRG2RDT2StatusSuctionPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 19),
+		'airIRG2RDT2StatusSuctionPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 18),
+		'airIRG2RDT2StatusSuctionTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 13),
+		'airIRG2RDT2StatusSuctionTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 12),
+		'airIRG2RDT2StatusSuperheatTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 15),
+		'airIRG2RDT2StatusSuperheatTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 14),
+		'airIRG2RDT2StatusSupplyAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 9),
+		'airIRG2RDT2StatusSupplyAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 1, 8),
+		'airIRG2RDT2Thresholds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 4),
+		'airIRG2RDT2ThresholdsRackInletHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 4, 2),
+		'airIRG2RDT2ThresholdsRackInletHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 4, 1),
+		'airIRG2RDT2ThresholdsReturnAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 4, 6),
+		'airIRG2RDT2ThresholdsReturnAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 4, 5),
+		'airIRG2RDT2ThresholdsSupplyAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 4, 4),
+		'airIRG2RDT2ThresholdsSupplyAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2, 4, 3),
+		'airIRG2RDType1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 1),
+		'airIRG2RDType2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 5, 2),
+		'airIRG2SC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4, 6),
+		'airIRG3Alarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 3),
+		'airIRG3AlarmsDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 3, 2, 1, 3),
+		'airIRG3AlarmsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 3, 2, 1),
+		'airIRG3AlarmsEventCode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 3, 2, 1, 2),
+		'airIRG3AlarmsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 3, 2, 1, 1),
+		'airIRG3AlarmsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 3, 2),
+		'airIRG3AlarmsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 3, 1),
+		'airIRG3CM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5),
+		'airIRG3CMConfigCMID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7, 1, 2),
+		'airIRG3CMConfigDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7, 1, 1),
+		'airIRG3CMConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7, 1),
+		'airIRG3CMConfigPowerSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7, 1, 6),
+		'airIRG3CMConfigRemoteOnStandby': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7, 1, 5),
+		'airIRG3CMConfigStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7, 1, 4),
+		'airIRG3CMConfigStopOnCoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7, 1, 3),
+		'airIRG3CMConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 7),
+		'airIRG3CMRunHoursAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 8),
+		'airIRG3CMRunHoursCMID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 2),
+		'airIRG3CMRunHoursDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 1),
+		'airIRG3CMRunHoursEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1),
+		'airIRG3CMRunHoursFan1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 3),
+		'airIRG3CMRunHoursFan2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 4),
+		'airIRG3CMRunHoursFan3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 5),
+		'airIRG3CMRunHoursFan4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 6),
+		'airIRG3CMRunHoursFan5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3, 1, 7),
+		'airIRG3CMRunHoursTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 3),
+		'airIRG3CMServiceIntervalsAirFilterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 4, 1, 4),
+		'airIRG3CMServiceIntervalsAirFilterInterval': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 4, 1, 3),
+		'airIRG3CMServiceIntervalsCMID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 4, 1, 2),
+		'airIRG3CMServiceIntervalsDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 4, 1, 1),
+		'airIRG3CMServiceIntervalsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 4, 1),
+		'airIRG3CMServiceIntervalsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 4),
+		'airIRG3CMSetpointsDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 6, 1, 1),
+		'airIRG3CMSetpointsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 6, 1),
+		'airIRG3CMSetpointsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 6),
+		'airIRG3CMStatusAverageFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 22),
+		'airIRG3CMStatusCMID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 2),
+		'airIRG3CMStatusDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 1),
+		'airIRG3CMStatusEPRValvePosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 20),
+		'airIRG3CMStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1),
+		'airIRG3CMStatusEvaporatorTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 14),
+		'airIRG3CMStatusEvaporatorTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 13),
+		'airIRG3CMStatusExpansionValvePosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 19),
+		'airIRG3CMStatusLiquidInletPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 16),
+		'airIRG3CMStatusLiquidInletPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 15),
+		'airIRG3CMStatusLiquidTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 10),
+		'airIRG3CMStatusLiquidTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 9),
+		'airIRG3CMStatusLocalDisplayOnOffEnabled': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 21),
+		'airIRG3CMStatusOperatingMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 3),
+		'airIRG3CMStatusRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 6),
+		'airIRG3CMStatusRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 5),
+		'airIRG3CMStatusReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 8),
+		'airIRG3CMStatusReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 7),
+		'airIRG3CMStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2),
+		'airIRG3CMStatusUnitType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 4),
+		'airIRG3CMStatusVaporOutletPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 18),
+		'airIRG3CMStatusVaporOutletPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 17),
+		'airIRG3CMStatusVaporTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 12),
+		'airIRG3CMStatusVaporTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 2, 1, 11),
+		'airIRG3CMTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 1),
+		'airIRG3CMThresholdsCMID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 2),
+		'airIRG3CMThresholdsDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 1),
+		'airIRG3CMThresholdsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1),
+		'airIRG3CMThresholdsRackInletTempHighMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 4),
+		'airIRG3CMThresholdsRackInletTempHighUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 3),
+		'airIRG3CMThresholdsReturnAirTempHighMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 8),
+		'airIRG3CMThresholdsReturnAirTempHighUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 7),
+		'airIRG3CMThresholdsSupplyAirTempHighMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 6),
+		'airIRG3CMThresholdsSupplyAirTempHighUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5, 1, 5),
+		'airIRG3CMThresholdsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 5, 5),
+		'airIRG3Group': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2),
+		'airIRG3GroupConfigCapacityControlType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 4),
+		'airIRG3GroupConfigConfigurationType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 3),
+		'airIRG3GroupConfigCoolDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 8),
+		'airIRG3GroupConfigCoolGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 6),
+		'airIRG3GroupConfigCoolPIDReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 9),
+		'airIRG3GroupConfigCoolResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 7),
+		'airIRG3GroupConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1),
+		'airIRG3GroupConfigFanSpeedControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 5),
+		'airIRG3GroupConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 1),
+		'airIRG3GroupConfigLoadAssistEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 12),
+		'airIRG3GroupConfigNumberofBackupUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 10),
+		'airIRG3GroupConfigNumberofCoolingUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 2),
+		'airIRG3GroupConfigRuntimeBalancingEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4, 1, 11),
+		'airIRG3GroupConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 4),
+		'airIRG3GroupSetpointsAirFlowControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 9),
+		'airIRG3GroupSetpointsCoolDeadbandMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 5),
+		'airIRG3GroupSetpointsCoolDeadbandUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 4),
+		'airIRG3GroupSetpointsCoolSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 3),
+		'airIRG3GroupSetpointsCoolSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 2),
+		'airIRG3GroupSetpointsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1),
+		'airIRG3GroupSetpointsFanSpeedPreference': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 6),
+		'airIRG3GroupSetpointsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 1),
+		'airIRG3GroupSetpointsLightingOnTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 10),
+		'airIRG3GroupSetpointsSupplyAirSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 8),
+		'airIRG3GroupSetpointsSupplyAirSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3, 1, 7),
+		'airIRG3GroupSetpointsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 3),
+		'airIRG3GroupStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 5),
+		'airIRG3GroupStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 4),
+		'airIRG3GroupStatusAvgAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 20),
+		'airIRG3GroupStatusAvgAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 19),
+		'airIRG3GroupStatusAvgFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 18),
+		'airIRG3GroupStatusAvgReturnTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 17),
+		'airIRG3GroupStatusAvgReturnTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 16),
+		'airIRG3GroupStatusAvgSupplyTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 15),
+		'airIRG3GroupStatusAvgSupplyTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 14),
+		'airIRG3GroupStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 3),
+		'airIRG3GroupStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 2),
+		'airIRG3GroupStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1),
+		'airIRG3GroupStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 1),
+		'airIRG3GroupStatusMaxRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 7),
+		'airIRG3GroupStatusMaxRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 6),
+		'airIRG3GroupStatusMaxReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 11),
+		'airIRG3GroupStatusMaxReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 10),
+		'airIRG3GroupStatusMinRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 9),
+		'airIRG3GroupStatusMinRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 8),
+		'airIRG3GroupStatusMinReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 13),
+		'airIRG3GroupStatusMinReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 12),
+		'airIRG3GroupStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2),
+		'airIRG3GroupStatusTotalAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 22),
+		'airIRG3GroupStatusTotalAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 2, 1, 21),
+		'airIRG3GroupTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 2, 1),
+		'airIRG3Ident': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1),
+		'airIRG3IdentCMSysOID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 10),
+		'airIRG3IdentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1),
+		'airIRG3IdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 6),
+		'airIRG3IdentGroupSysOID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 11),
+		'airIRG3IdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 7),
+		'airIRG3IdentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 1),
+		'airIRG3IdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 3),
+		'airIRG3IdentManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 8),
+		'airIRG3IdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 4),
+		'airIRG3IdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 2),
+		'airIRG3IdentRDUSysOID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 9),
+		'airIRG3IdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2, 1, 5),
+		'airIRG3IdentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 2),
+		'airIRG3IdentTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 1, 1),
+		'airIRG3RDU': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4),
+		'airIRG3RDUConfigByPassValveEnabled': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 10),
+		'airIRG3RDUConfigCalibrateRefrigerantLeakDetector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 12),
+		'airIRG3RDUConfigDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 1),
+		'airIRG3RDUConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1),
+		'airIRG3RDUConfigInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 8),
+		'airIRG3RDUConfigOnReadyStandby': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 13),
+		'airIRG3RDUConfigOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 9),
+		'airIRG3RDUConfigOutputSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 7),
+		'airIRG3RDUConfigPowerSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 6),
+		'airIRG3RDUConfigPumpChangeOverInterval': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 5),
+		'airIRG3RDUConfigRDUID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 2),
+		'airIRG3RDUConfigRefrigerantLeakDetectorEnabled': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 11),
+		'airIRG3RDUConfigStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 4),
+		'airIRG3RDUConfigStopOnLeakDetect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7, 1, 3),
+		'airIRG3RDUConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 7),
+		'airIRG3RDUID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 2),
+		'airIRG3RDURunHoursDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3, 1, 1),
+		'airIRG3RDURunHoursEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3, 1),
+		'airIRG3RDURunHoursPowerSupply1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3, 1, 5),
+		'airIRG3RDURunHoursPowerSupply2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3, 1, 6),
+		'airIRG3RDURunHoursPump1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3, 1, 3),
+		'airIRG3RDURunHoursPump2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3, 1, 4),
+		'airIRG3RDURunHoursRDUID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3, 1, 2),
+		'airIRG3RDURunHoursTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 3),
+		'airIRG3RDUServiceIntervalsAirFilterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 4, 1, 4),
+		'airIRG3RDUServiceIntervalsAirFilterInterval': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 4, 1, 3),
+		'airIRG3RDUServiceIntervalsDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 4, 1, 1),
+		'airIRG3RDUServiceIntervalsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 4, 1),
+		'airIRG3RDUServiceIntervalsRDUID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 4, 1, 2),
+		'airIRG3RDUServiceIntervalsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 4),
+		'airIRG3RDUSetpointsDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 6, 1, 1),
+		'airIRG3RDUSetpointsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 6, 1),
+		'airIRG3RDUSetpointsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 6),
+		'airIRG3RDUStatusByPassValvePosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 42),
+		'airIRG3RDUStatusCWValvePosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 35),
+		'airIRG3RDUStatusCondenserInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 26),
+		'airIRG3RDUStatusCondenserInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 25),
+		'airIRG3RDUStatusCondenserOutletPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 28),
+		'airIRG3RDUStatusCondenserOutletPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 27),
+		'airIRG3RDUStatusCondenserOutletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 24),
+		'airIRG3RDUStatusCondenserOutletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 23),
+		'airIRG3RDUStatusCondenserSaturationTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 16),
+		'airIRG3RDUStatusCondenserSaturationTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 15),
+		'airIRG3RDUStatusDCPowerSupply1Current': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 37),
+		'airIRG3RDUStatusDCPowerSupply2Current': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 38),
+		'airIRG3RDUStatusDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 1),
+		'airIRG3RDUStatusDewPointTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 18),
+		'airIRG3RDUStatusDewPointTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 17),
+		'airIRG3RDUStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1),
+		'airIRG3RDUStatusInletWaterTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 12),
+		'airIRG3RDUStatusInletWaterTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 11),
+		'airIRG3RDUStatusInputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 40),
+		'airIRG3RDUStatusLeadPump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 5),
+		'airIRG3RDUStatusOnReadyStandby': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 3),
+		'airIRG3RDUStatusOperatingMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 4),
+		'airIRG3RDUStatusOutletWaterTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 14),
+		'airIRG3RDUStatusOutletWaterTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 13),
+		'airIRG3RDUStatusOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 41),
+		'airIRG3RDUStatusPowerSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 9),
+		'airIRG3RDUStatusPump1HeadPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 30),
+		'airIRG3RDUStatusPump1HeadPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 29),
+		'airIRG3RDUStatusPump1Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 33),
+		'airIRG3RDUStatusPump2HeadPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 32),
+		'airIRG3RDUStatusPump2HeadPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 31),
+		'airIRG3RDUStatusPump2Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 34),
+		'airIRG3RDUStatusPumpChangeOverInterval': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 7),
+		'airIRG3RDUStatusPumpOutletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 20),
+		'airIRG3RDUStatusPumpOutletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 19),
+		'airIRG3RDUStatusReceiverLiquidLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 36),
+		'airIRG3RDUStatusRefrigerantLeakDetector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 43),
+		'airIRG3RDUStatusStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 6),
+		'airIRG3RDUStatusStopOnLeakDetect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 8),
+		'airIRG3RDUStatusSubcoolerOutletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 22),
+		'airIRG3RDUStatusSubcoolerOutletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 21),
+		'airIRG3RDUStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2),
+		'airIRG3RDUStatusTotalDCPowerSupplyCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 39),
+		'airIRG3RDUStatusTotalRDUOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 2, 1, 10),
+		'airIRG3RDUTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 1),
+		'airIRG3RDUThresholdsDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 5, 1, 1),
+		'airIRG3RDUThresholdsEnteringFluidTempHighMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 5, 1, 4),
+		'airIRG3RDUThresholdsEnteringFluidTempHighUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 5, 1, 3),
+		'airIRG3RDUThresholdsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 5, 1),
+		'airIRG3RDUThresholdsRDUID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 5, 1, 2),
+		'airIRG3RDUThresholdsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6, 4, 5),
+		'airIRGen2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 4),
+		'airIRGen3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 6),
+		'airIRRC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2),
+		'airIRRCGroup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1),
+		'airIRRCGroupConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3),
+		'airIRRCGroupConfigActiveFlowControllerLampTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 9),
+		'airIRRCGroupConfigAltitudeMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 11),
+		'airIRRCGroupConfigAltitudeUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 10),
+		'airIRRCGroupConfigConfigurationType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 2),
+		'airIRRCGroupConfigCoolDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 6),
+		'airIRRCGroupConfigCoolGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 4),
+		'airIRRCGroupConfigCoolResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 5),
+		'airIRRCGroupConfigMaxFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 7),
+		'airIRRCGroupConfigNumberOfActiveFlowControllers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 8),
+		'airIRRCGroupConfigNumberofCoolingUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 1),
+		'airIRRCGroupConfigPctGlycol': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 3, 3),
+		'airIRRCGroupSetpoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2),
+		'airIRRCGroupSetpointsActiveFlowControlBias': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2, 7),
+		'airIRRCGroupSetpointsCoolMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2, 2),
+		'airIRRCGroupSetpointsCoolUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2, 1),
+		'airIRRCGroupSetpointsFanSpeedControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2, 6),
+		'airIRRCGroupSetpointsFanSpeedPreference': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2, 5),
+		'airIRRCGroupSetpointsSupplyAirMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2, 4),
+		'airIRRCGroupSetpointsSupplyAirUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 2, 3),
+		'airIRRCGroupStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1),
+		'airIRRCGroupStatusActiveFlowControlStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 9),
+		'airIRRCGroupStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 4),
+		'airIRRCGroupStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 3),
+		'airIRRCGroupStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 2),
+		'airIRRCGroupStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 1),
+		'airIRRCGroupStatusMaxRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 6),
+		'airIRRCGroupStatusMaxRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 5),
+		'airIRRCGroupStatusMinRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 8),
+		'airIRRCGroupStatusMinRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 1, 1, 7),
+		'airIRRCUnit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2),
+		'airIRRCUnitConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6),
+		'airIRRCUnitConfigCoolCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 1),
+		'airIRRCUnitConfigIdleOnCoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 8),
+		'airIRRCUnitConfigIdleOnLeakDetect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 3),
+		'airIRRCUnitConfigInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 5),
+		'airIRRCUnitConfigOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 6),
+		'airIRRCUnitConfigOutputSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 7),
+		'airIRRCUnitConfigPowerSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 4),
+		'airIRRCUnitConfigStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 6, 2),
+		'airIRRCUnitIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1),
+		'airIRRCUnitIdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 6),
+		'airIRRCUnitIdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 7),
+		'airIRRCUnitIdentID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 1),
+		'airIRRCUnitIdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 3),
+		'airIRRCUnitIdentManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 8),
+		'airIRRCUnitIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 4),
+		'airIRRCUnitIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 2),
+		'airIRRCUnitIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 1, 5),
+		'airIRRCUnitRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3),
+		'airIRRCUnitRunHoursAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 1),
+		'airIRRCUnitRunHoursCondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 12),
+		'airIRRCUnitRunHoursFan1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 2),
+		'airIRRCUnitRunHoursFan2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 3),
+		'airIRRCUnitRunHoursFan3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 4),
+		'airIRRCUnitRunHoursFan4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 5),
+		'airIRRCUnitRunHoursFan5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 6),
+		'airIRRCUnitRunHoursFan6': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 7),
+		'airIRRCUnitRunHoursFan7': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 8),
+		'airIRRCUnitRunHoursFan8': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 9),
+		'airIRRCUnitRunHoursFanPowerSupplyFeedALeft': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 13),
+		'airIRRCUnitRunHoursFanPowerSupplyFeedARight': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 14),
+		'airIRRCUnitRunHoursFanPowerSupplyFeedBLeft': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 15),
+		'airIRRCUnitRunHoursFanPowerSupplyFeedBRight': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 16),
+		'airIRRCUnitRunHoursFanPowerSupplyLeft': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 10),
+		'airIRRCUnitRunHoursFanPowerSupplyRight': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 3, 11),
+		'airIRRCUnitServiceIntervals': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 4),
+		'airIRRCUnitServiceIntervalsAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 4, 1),
+		'airIRRCUnitServiceIntervalsAirFilterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 4, 2),
+		'airIRRCUnitStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2),
+		'airIRRCUnitStatusActivePowerSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 19),
+		'airIRRCUnitStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 5),
+		'airIRRCUnitStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 4),
+		'airIRRCUnitStatusContainmtDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 13),
+		'airIRRCUnitStatusContainmtDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 12),
+		'airIRRCUnitStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 3),
+		'airIRRCUnitStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 2),
+		'airIRRCUnitStatusEnteringFluidTemperatureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 24),
+		'airIRRCUnitStatusEnteringFluidTemperatureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 23),
+		'airIRRCUnitStatusFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 16),
+		'airIRRCUnitStatusFilterDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 15),
+		'airIRRCUnitStatusFilterDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 14),
+		'airIRRCUnitStatusFluidFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 22),
+		'airIRRCUnitStatusFluidFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 21),
+		'airIRRCUnitStatusFluidValvePosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 20),
+		'airIRRCUnitStatusInputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 17),
+		'airIRRCUnitStatusLeavingFluidTemperatureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 26),
+		'airIRRCUnitStatusLeavingFluidTemperatureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 25),
+		'airIRRCUnitStatusOperateMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 1),
+		'airIRRCUnitStatusOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 18),
+		'airIRRCUnitStatusRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 7),
+		'airIRRCUnitStatusRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 6),
+		'airIRRCUnitStatusReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 11),
+		'airIRRCUnitStatusReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 10),
+		'airIRRCUnitStatusSupplyAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 9),
+		'airIRRCUnitStatusSupplyAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 2, 8),
+		'airIRRCUnitThresholds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5),
+		'airIRRCUnitThresholdsEnteringFluidHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 8),
+		'airIRRCUnitThresholdsEnteringFluidHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 7),
+		'airIRRCUnitThresholdsRackInletHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 2),
+		'airIRRCUnitThresholdsRackInletHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 1),
+		'airIRRCUnitThresholdsReturnAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 6),
+		'airIRRCUnitThresholdsReturnAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 5),
+		'airIRRCUnitThresholdsSupplyAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 4),
+		'airIRRCUnitThresholdsSupplyAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 2, 2, 5, 3),
+		'airIRRP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3),
+		'airIRRP100': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1),
+		'airIRRP100Group': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1),
+		'airIRRP100GroupConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3),
+		'airIRRP100GroupConfigActiveFlowControllerLampTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 16),
+		'airIRRP100GroupConfigAltitudeMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 18),
+		'airIRRP100GroupConfigAltitudeUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 17),
+		'airIRRP100GroupConfigConfigurationType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 2),
+		'airIRRP100GroupConfigCoolDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 5),
+		'airIRRP100GroupConfigCoolGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 3),
+		'airIRRP100GroupConfigCoolResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 4),
+		'airIRRP100GroupConfigFullRPBackups': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 13),
+		'airIRRP100GroupConfigHumidifySensitivityBand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 6),
+		'airIRRP100GroupConfigLoadAssistEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 12),
+		'airIRRP100GroupConfigMaxFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 14),
+		'airIRRP100GroupConfigNumberOfActiveFlowControllers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 15),
+		'airIRRP100GroupConfigNumberofBackupUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 10),
+		'airIRRP100GroupConfigNumberofCoolingUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 1),
+		'airIRRP100GroupConfigReheatDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 9),
+		'airIRRP100GroupConfigReheatGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 7),
+		'airIRRP100GroupConfigReheatResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 8),
+		'airIRRP100GroupConfigRuntimeBalancingEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 3, 11),
+		'airIRRP100GroupSetpoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2),
+		'airIRRP100GroupSetpointsActiveFlowControlBias': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 12),
+		'airIRRP100GroupSetpointsCoolMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 2),
+		'airIRRP100GroupSetpointsCoolUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 1),
+		'airIRRP100GroupSetpointsDehumidify': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 6),
+		'airIRRP100GroupSetpointsDehumidifyDeadband': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 7),
+		'airIRRP100GroupSetpointsFanSpeedControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 11),
+		'airIRRP100GroupSetpointsFanSpeedPreference': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 10),
+		'airIRRP100GroupSetpointsHumidify': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 5),
+		'airIRRP100GroupSetpointsReheatMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 9),
+		'airIRRP100GroupSetpointsReheatUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 8),
+		'airIRRP100GroupSetpointsSupplyAirMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 4),
+		'airIRRP100GroupSetpointsSupplyAirUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 2, 3),
+		'airIRRP100GroupStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1),
+		'airIRRP100GroupStatusActiveFlowControlStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 15),
+		'airIRRP100GroupStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 2),
+		'airIRRP100GroupStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 1),
+		'airIRRP100GroupStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 7),
+		'airIRRP100GroupStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 8),
+		'airIRRP100GroupStatusDehumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 11),
+		'airIRRP100GroupStatusDehumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 12),
+		'airIRRP100GroupStatusDewPointTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 17),
+		'airIRRP100GroupStatusDewPointTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 16),
+		'airIRRP100GroupStatusHumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 9),
+		'airIRRP100GroupStatusHumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 10),
+		'airIRRP100GroupStatusMaxRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 4),
+		'airIRRP100GroupStatusMaxRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 3),
+		'airIRRP100GroupStatusMinRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 6),
+		'airIRRP100GroupStatusMinRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 5),
+		'airIRRP100GroupStatusReheatDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 13),
+		'airIRRP100GroupStatusReheatOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 1, 1, 14),
+		'airIRRP100Unit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2),
+		'airIRRP100UnitConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6),
+		'airIRRP100UnitConfigCoolCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 2),
+		'airIRRP100UnitConfigDehumidifyEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 9),
+		'airIRRP100UnitConfigHeatAssistEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 11),
+		'airIRRP100UnitConfigHumidifierControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 8),
+		'airIRRP100UnitConfigHumidifyEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 7),
+		'airIRRP100UnitConfigIdleOnCoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 15),
+		'airIRRP100UnitConfigIdleOnLeakDetect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 3),
+		'airIRRP100UnitConfigInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 4),
+		'airIRRP100UnitConfigOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 5),
+		'airIRRP100UnitConfigOutputSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 6),
+		'airIRRP100UnitConfigPowerSourceConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 12),
+		'airIRRP100UnitConfigReheatEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 10),
+		'airIRRP100UnitConfigSecondaryPowerFeedCapability': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 14),
+		'airIRRP100UnitConfigStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 1),
+		'airIRRP100UnitConfigUnitRoleOverride': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 6, 13),
+		'airIRRP100UnitIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1),
+		'airIRRP100UnitIdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 6),
+		'airIRRP100UnitIdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 7),
+		'airIRRP100UnitIdentID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 1),
+		'airIRRP100UnitIdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 3),
+		'airIRRP100UnitIdentManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 8),
+		'airIRRP100UnitIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 4),
+		'airIRRP100UnitIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 2),
+		'airIRRP100UnitIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 1, 5),
+		'airIRRP100UnitRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3),
+		'airIRRP100UnitRunHoursAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 1),
+		'airIRRP100UnitRunHoursCompressor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 8),
+		'airIRRP100UnitRunHoursCondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 2),
+		'airIRRP100UnitRunHoursFan1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 4),
+		'airIRRP100UnitRunHoursFan2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 6),
+		'airIRRP100UnitRunHoursHeater1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 5),
+		'airIRRP100UnitRunHoursHeater2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 7),
+		'airIRRP100UnitRunHoursHumidifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 3),
+		'airIRRP100UnitRunHoursSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 3, 9),
+		'airIRRP100UnitServiceIntervalAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 1),
+		'airIRRP100UnitServiceIntervalAirFilterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 2),
+		'airIRRP100UnitServiceIntervalCompressor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 7),
+		'airIRRP100UnitServiceIntervalCompressorAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 8),
+		'airIRRP100UnitServiceIntervalCondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 9),
+		'airIRRP100UnitServiceIntervalCondensatePumpAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 10),
+		'airIRRP100UnitServiceIntervalFans': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 11),
+		'airIRRP100UnitServiceIntervalFansAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 12),
+		'airIRRP100UnitServiceIntervalHeater': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 5),
+		'airIRRP100UnitServiceIntervalHeaterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 6),
+		'airIRRP100UnitServiceIntervalHumidifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 3),
+		'airIRRP100UnitServiceIntervalHumidifierAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4, 4),
+		'airIRRP100UnitServiceIntervals': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 4),
+		'airIRRP100UnitStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2),
+		'airIRRP100UnitStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 11),
+		'airIRRP100UnitStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 10),
+		'airIRRP100UnitStatusCompressorDriveAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 45),
+		'airIRRP100UnitStatusCompressorDriveControlCardTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 43),
+		'airIRRP100UnitStatusCompressorDriveControlCardTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 42),
+		'airIRRP100UnitStatusCompressorDriveCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 38),
+		'airIRRP100UnitStatusCompressorDriveDCLinkVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 39),
+		'airIRRP100UnitStatusCompressorDriveHeatSinkTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 41),
+		'airIRRP100UnitStatusCompressorDriveHeatSinkTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 40),
+		'airIRRP100UnitStatusCompressorDrivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 36),
+		'airIRRP100UnitStatusCompressorDriveSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 35),
+		'airIRRP100UnitStatusCompressorDriveVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 37),
+		'airIRRP100UnitStatusCompressorDriveWarningStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 44),
+		'airIRRP100UnitStatusContainmtDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 32),
+		'airIRRP100UnitStatusContainmtDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 31),
+		'airIRRP100UnitStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 13),
+		'airIRRP100UnitStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 14),
+		'airIRRP100UnitStatusDehumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 17),
+		'airIRRP100UnitStatusDehumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 18),
+		'airIRRP100UnitStatusDischargePressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 49),
+		'airIRRP100UnitStatusDischargePressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 48),
+		'airIRRP100UnitStatusFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 12),
+		'airIRRP100UnitStatusFilterDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 30),
+		'airIRRP100UnitStatusFilterDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 29),
+		'airIRRP100UnitStatusHumidifierCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 33),
+		'airIRRP100UnitStatusHumidifierWaterConductivity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 34),
+		'airIRRP100UnitStatusHumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 15),
+		'airIRRP100UnitStatusHumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 16),
+		'airIRRP100UnitStatusInputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 21),
+		'airIRRP100UnitStatusLeakSensor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 50),
+		'airIRRP100UnitStatusOperateMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 1),
+		'airIRRP100UnitStatusOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 22),
+		'airIRRP100UnitStatusRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 3),
+		'airIRRP100UnitStatusRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 2),
+		'airIRRP100UnitStatusRackInletTemperature1Metric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 24),
+		'airIRRP100UnitStatusRackInletTemperature1US': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 23),
+		'airIRRP100UnitStatusRackInletTemperature2Metric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 26),
+		'airIRRP100UnitStatusRackInletTemperature2US': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 25),
+		'airIRRP100UnitStatusRackInletTemperature3Metric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 28),
+		'airIRRP100UnitStatusRackInletTemperature3US': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 27),
+		'airIRRP100UnitStatusReheatDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 19),
+		'airIRRP100UnitStatusReheatOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 20),
+		'airIRRP100UnitStatusReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 7),
+		'airIRRP100UnitStatusReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 6),
+		'airIRRP100UnitStatusReturnHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 9),
+		'airIRRP100UnitStatusSuctionPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 47),
+		'airIRRP100UnitStatusSuctionPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 46),
+		'airIRRP100UnitStatusSupplyAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 5),
+		'airIRRP100UnitStatusSupplyAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 4),
+		'airIRRP100UnitStatusSupplyHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 2, 8),
+		'airIRRP100UnitThresholds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5),
+		'airIRRP100UnitThresholdsRackInletHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 2),
+		'airIRRP100UnitThresholdsRackInletHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 1),
+		'airIRRP100UnitThresholdsReturnAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 6),
+		'airIRRP100UnitThresholdsReturnAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 5),
+		'airIRRP100UnitThresholdsSupplyAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 4),
+		'airIRRP100UnitThresholdsSupplyAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 3),
+		'airIRRP100UnitThresholdsSupplyHumidityHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 7),
+		'airIRRP100UnitThresholdsSupplyHumidityLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 1, 2, 5, 8),
+		'airIRRP500': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2),
+		'airIRRP500Group': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1),
+		'airIRRP500GroupConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3),
+		'airIRRP500GroupConfigActiveFlowControllerLampTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 17),
+		'airIRRP500GroupConfigAltitudeMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 19),
+		'airIRRP500GroupConfigAltitudeUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 18),
+		'airIRRP500GroupConfigConfigurationType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 2),
+		'airIRRP500GroupConfigCoolDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 6),
+		'airIRRP500GroupConfigCoolGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 4),
+		'airIRRP500GroupConfigCoolResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 5),
+		'airIRRP500GroupConfigFullRPBackups': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 15),
+		'airIRRP500GroupConfigHumidifySensitivityBand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 7),
+		'airIRRP500GroupConfigLoadAssistEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 14),
+		'airIRRP500GroupConfigMaxFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 11),
+		'airIRRP500GroupConfigNumberOfActiveFlowControllers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 16),
+		'airIRRP500GroupConfigNumberofBackupUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 12),
+		'airIRRP500GroupConfigNumberofCoolingUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 1),
+		'airIRRP500GroupConfigPercentGlycol': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 3),
+		'airIRRP500GroupConfigReheatDerivativeD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 10),
+		'airIRRP500GroupConfigReheatGainP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 8),
+		'airIRRP500GroupConfigReheatResetRateI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 9),
+		'airIRRP500GroupConfigRuntimeBalancingEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 3, 13),
+		'airIRRP500GroupSetpoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2),
+		'airIRRP500GroupSetpointsActiveFlowControlBias': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 12),
+		'airIRRP500GroupSetpointsCoolMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 2),
+		'airIRRP500GroupSetpointsCoolUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 1),
+		'airIRRP500GroupSetpointsDehumidify': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 6),
+		'airIRRP500GroupSetpointsDehumidifyDeadband': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 7),
+		'airIRRP500GroupSetpointsFanSpeedControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 11),
+		'airIRRP500GroupSetpointsFanSpeedPreference': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 10),
+		'airIRRP500GroupSetpointsHumidify': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 5),
+		'airIRRP500GroupSetpointsReheatMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 9),
+		'airIRRP500GroupSetpointsReheatUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 8),
+		'airIRRP500GroupSetpointsSupplyAirMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 4),
+		'airIRRP500GroupSetpointsSupplyAirUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 2, 3),
+		'airIRRP500GroupStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1),
+		'airIRRP500GroupStatusActiveFlowControlStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 15),
+		'airIRRP500GroupStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 2),
+		'airIRRP500GroupStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 1),
+		'airIRRP500GroupStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 7),
+		'airIRRP500GroupStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 8),
+		'airIRRP500GroupStatusDehumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 11),
+		'airIRRP500GroupStatusDehumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 12),
+		'airIRRP500GroupStatusDewPointTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 17),
+		'airIRRP500GroupStatusDewPointTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 16),
+		'airIRRP500GroupStatusHumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 9),
+		'airIRRP500GroupStatusHumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 10),
+		'airIRRP500GroupStatusMaxRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 4),
+		'airIRRP500GroupStatusMaxRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 3),
+		'airIRRP500GroupStatusMinRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 6),
+		'airIRRP500GroupStatusMinRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 5),
+		'airIRRP500GroupStatusReheatDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 13),
+		'airIRRP500GroupStatusReheatOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 1, 1, 14),
+		'airIRRP500Unit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2),
+		'airIRRP500UnitConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6),
+		'airIRRP500UnitConfigCoolCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 2),
+		'airIRRP500UnitConfigDehumidifyEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 9),
+		'airIRRP500UnitConfigHeatAssistEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 11),
+		'airIRRP500UnitConfigHumidifierControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 8),
+		'airIRRP500UnitConfigHumidifyEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 7),
+		'airIRRP500UnitConfigIdleOnCoolFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 15),
+		'airIRRP500UnitConfigIdleOnLeakDetect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 3),
+		'airIRRP500UnitConfigInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 4),
+		'airIRRP500UnitConfigOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 5),
+		'airIRRP500UnitConfigOutputSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 6),
+		'airIRRP500UnitConfigPowerSourceConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 12),
+		'airIRRP500UnitConfigReheatEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 10),
+		'airIRRP500UnitConfigSecondaryPowerFeedCapability': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 14),
+		'airIRRP500UnitConfigStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 1),
+		'airIRRP500UnitConfigUnitRoleOverride': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 6, 13),
+		'airIRRP500UnitIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1),
+		'airIRRP500UnitIdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 6),
+		'airIRRP500UnitIdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 7),
+		'airIRRP500UnitIdentID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 1),
+		'airIRRP500UnitIdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 3),
+		'airIRRP500UnitIdentManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 8),
+		'airIRRP500UnitIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 4),
+		'airIRRP500UnitIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 2),
+		'airIRRP500UnitIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 1, 5),
+		'airIRRP500UnitRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3),
+		'airIRRP500UnitRunHoursAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 1),
+		'airIRRP500UnitRunHoursCondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 2),
+		'airIRRP500UnitRunHoursFan1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 4),
+		'airIRRP500UnitRunHoursFan2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 6),
+		'airIRRP500UnitRunHoursFan3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 8),
+		'airIRRP500UnitRunHoursHeater1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 5),
+		'airIRRP500UnitRunHoursHeater2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 7),
+		'airIRRP500UnitRunHoursHeater3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 9),
+		'airIRRP500UnitRunHoursHumidifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 3),
+		'airIRRP500UnitRunHoursSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 3, 10),
+		'airIRRP500UnitServiceIntervalAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 1),
+		'airIRRP500UnitServiceIntervalAirFilterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 2),
+		'airIRRP500UnitServiceIntervalCondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 7),
+		'airIRRP500UnitServiceIntervalCondensatePumpAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 8),
+		'airIRRP500UnitServiceIntervalFans': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 9),
+		'airIRRP500UnitServiceIntervalFansAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 10),
+		'airIRRP500UnitServiceIntervalHeater': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 5),
+		'airIRRP500UnitServiceIntervalHeaterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 6),
+		'airIRRP500UnitServiceIntervalHumidifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 3),
+		'airIRRP500UnitServiceIntervalHumidifierAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4, 4),
+		'airIRRP500UnitServiceIntervals': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 4),
+		'airIRRP500UnitStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2),
+		'airIRRP500UnitStatusActivePowerSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 35),
+		'airIRRP500UnitStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 11),
+		'airIRRP500UnitStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 10),
+		'airIRRP500UnitStatusContainmtDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 30),
+		'airIRRP500UnitStatusContainmtDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 29),
+		'airIRRP500UnitStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 13),
+		'airIRRP500UnitStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 14),
+		'airIRRP500UnitStatusDehumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 17),
+		'airIRRP500UnitStatusDehumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 18),
+		'airIRRP500UnitStatusEnteringFluidTemperatureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 40),
+		'airIRRP500UnitStatusEnteringFluidTemperatureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 39),
+		'airIRRP500UnitStatusFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 12),
+		'airIRRP500UnitStatusFilterDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 32),
+		'airIRRP500UnitStatusFilterDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 31),
+		'airIRRP500UnitStatusFluidFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 38),
+		'airIRRP500UnitStatusFluidFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 37),
+		'airIRRP500UnitStatusFluidValvePosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 36),
+		'airIRRP500UnitStatusHumidifierCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 33),
+		'airIRRP500UnitStatusHumidifierWaterConductivity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 34),
+		'airIRRP500UnitStatusHumidifyDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 15),
+		'airIRRP500UnitStatusHumidifyOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 16),
+		'airIRRP500UnitStatusInputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 21),
+		'airIRRP500UnitStatusLeakSensor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 43),
+		'airIRRP500UnitStatusLeavingFluidTemperatureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 42),
+		'airIRRP500UnitStatusLeavingFluidTemperatureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 41),
+		'airIRRP500UnitStatusMaximumRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 3),
+		'airIRRP500UnitStatusMaximumRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 2),
+		'airIRRP500UnitStatusOperateMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 1),
+		'airIRRP500UnitStatusOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 22),
+		'airIRRP500UnitStatusRackInletTemperature1Metric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 24),
+		'airIRRP500UnitStatusRackInletTemperature1US': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 23),
+		'airIRRP500UnitStatusRackInletTemperature2Metric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 26),
+		'airIRRP500UnitStatusRackInletTemperature2US': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 25),
+		'airIRRP500UnitStatusRackInletTemperature3Metric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 28),
+		'airIRRP500UnitStatusRackInletTemperature3US': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 27),
+		'airIRRP500UnitStatusReheatDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 19),
+		'airIRRP500UnitStatusReheatOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 20),
+		'airIRRP500UnitStatusReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 7),
+		'airIRRP500UnitStatusReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 6),
+		'airIRRP500UnitStatusReturnHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 9),
+		'airIRRP500UnitStatusSupplyAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 5),
+		'airIRRP500UnitStatusSupplyAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 4),
+		'airIRRP500UnitStatusSupplyHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 2, 8),
+		'airIRRP500UnitThresholds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5),
+		'airIRRP500UnitThresholdsEnteringFluidHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 10),
+		'airIRRP500UnitThresholdsEnteringFluidHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 9),
+		'airIRRP500UnitThresholdsRackInletHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 2),
+		'airIRRP500UnitThresholdsRackInletHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 1),
+		'airIRRP500UnitThresholdsReturnAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 6),
+		'airIRRP500UnitThresholdsReturnAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 5),
+		'airIRRP500UnitThresholdsSupplyAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 4),
+		'airIRRP500UnitThresholdsSupplyAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 3),
+		'airIRRP500UnitThresholdsSupplyHumidityHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 7),
+		'airIRRP500UnitThresholdsSupplyHumidityLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 3, 2, 2, 5, 8),
+		'airIRSC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4),
+		'airIRSCGroup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2),
+		'airIRSCGroupConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3),
+		'airIRSCGroupConfigActiveFlowControllerLampTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 8),
+		'airIRSCGroupConfigAltitudeMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 5),
+		'airIRSCGroupConfigAltitudeUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 4),
+		'airIRSCGroupConfigCapacityControlType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 3),
+		'airIRSCGroupConfigConfigurationType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 2),
+		'airIRSCGroupConfigFanSpeedControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 6),
+		'airIRSCGroupConfigNumberOfActiveFlowControllers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 7),
+		'airIRSCGroupConfigNumberofCoolingUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 3, 1),
+		'airIRSCGroupSetpoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2),
+		'airIRSCGroupSetpointsActiveFlowControlBias': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 8),
+		'airIRSCGroupSetptsCoolDeadbandMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 4),
+		'airIRSCGroupSetptsCoolDeadbandUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 3),
+		'airIRSCGroupSetptsCoolSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 2),
+		'airIRSCGroupSetptsCoolSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 1),
+		'airIRSCGroupSetptsFanSpeedPreference': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 5),
+		'airIRSCGroupSetptsSupplyAirSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 7),
+		'airIRSCGroupSetptsSupplyAirSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 2, 6),
+		'airIRSCGroupStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1),
+		'airIRSCGroupStatusActiveFlowControlStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 13),
+		'airIRSCGroupStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 4),
+		'airIRSCGroupStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 3),
+		'airIRSCGroupStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 2),
+		'airIRSCGroupStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 1),
+		'airIRSCGroupStatusMaxRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 6),
+		'airIRSCGroupStatusMaxRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 5),
+		'airIRSCGroupStatusMaxReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 10),
+		'airIRSCGroupStatusMaxReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 9),
+		'airIRSCGroupStatusMinRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 8),
+		'airIRSCGroupStatusMinRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 7),
+		'airIRSCGroupStatusMinReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 12),
+		'airIRSCGroupStatusMinReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 2, 1, 11),
+		'airIRSCUnit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1),
+		'airIRSCUnitConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7),
+		'airIRSCUnitConfigAltitudeMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 9),
+		'airIRSCUnitConfigAltitudeUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 8),
+		'airIRSCUnitConfigCapacityControlType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 2),
+		'airIRSCUnitConfigConfigurationType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 1),
+		'airIRSCUnitConfigIdleOnLeakDetect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 4),
+		'airIRSCUnitConfigInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 5),
+		'airIRSCUnitConfigOpControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 10),
+		'airIRSCUnitConfigOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 6),
+		'airIRSCUnitConfigOutputSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 7),
+		'airIRSCUnitConfigStartupDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 7, 3),
+		'airIRSCUnitIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1),
+		'airIRSCUnitIdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1, 5),
+		'airIRSCUnitIdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1, 6),
+		'airIRSCUnitIdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1, 2),
+		'airIRSCUnitIdentManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1, 7),
+		'airIRSCUnitIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1, 3),
+		'airIRSCUnitIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1, 1),
+		'airIRSCUnitIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 1, 4),
+		'airIRSCUnitRunHours': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3),
+		'airIRSCUnitRunHoursAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 1),
+		'airIRSCUnitRunHoursCompressor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 11),
+		'airIRSCUnitRunHoursCondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 10),
+		'airIRSCUnitRunHoursCondenserFan1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 5),
+		'airIRSCUnitRunHoursCondenserFan2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 6),
+		'airIRSCUnitRunHoursCondenserFan3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 7),
+		'airIRSCUnitRunHoursEvaporatorFan1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 2),
+		'airIRSCUnitRunHoursEvaporatorFan2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 3),
+		'airIRSCUnitRunHoursEvaporatorFan3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 4),
+		'airIRSCUnitRunHoursFanPowerSupplyLeft': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 8),
+		'airIRSCUnitRunHoursFanPowerSupplyRight': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 3, 9),
+		'airIRSCUnitServiceIntervals': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 4),
+		'airIRSCUnitServiceIntervalsAirFilter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 4, 1),
+		'airIRSCUnitServiceIntervalsAirFilterAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 4, 2),
+		'airIRSCUnitSetpoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6),
+		'airIRSCUnitSetptsCoolDeadbandMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6, 4),
+		'airIRSCUnitSetptsCoolDeadbandUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6, 3),
+		'airIRSCUnitSetptsCoolSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6, 2),
+		'airIRSCUnitSetptsCoolSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6, 1),
+		'airIRSCUnitSetptsFanSpeedPreference': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6, 5),
+		'airIRSCUnitSetptsSupplyAirSetpointMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6, 7),
+		'airIRSCUnitSetptsSupplyAirSetpointUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 6, 6),
+		'airIRSCUnitStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2),
+		'airIRSCUnitStatusAirFlowMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 5),
+		'airIRSCUnitStatusAirFlowUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 4),
+		'airIRSCUnitStatusCompressor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 32),
+		'airIRSCUnitStatusCondInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 31),
+		'airIRSCUnitStatusCondInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 30),
+		'airIRSCUnitStatusCondOutletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 29),
+		'airIRSCUnitStatusCondOutletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 28),
+		'airIRSCUnitStatusCondenserFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 25),
+		'airIRSCUnitStatusContainmtDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 17),
+		'airIRSCUnitStatusContainmtDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 16),
+		'airIRSCUnitStatusCoolDemand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 3),
+		'airIRSCUnitStatusCoolOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 2),
+		'airIRSCUnitStatusDischargePressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 23),
+		'airIRSCUnitStatusDischargePressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 22),
+		'airIRSCUnitStatusEvaporatorFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 24),
+		'airIRSCUnitStatusFilterDPMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 19),
+		'airIRSCUnitStatusFilterDPUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 18),
+		'airIRSCUnitStatusInputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 26),
+		'airIRSCUnitStatusLeakSensor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 33),
+		'airIRSCUnitStatusOperateMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 1),
+		'airIRSCUnitStatusOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 27),
+		'airIRSCUnitStatusRackInletTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 7),
+		'airIRSCUnitStatusRackInletTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 6),
+		'airIRSCUnitStatusReturnAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 11),
+		'airIRSCUnitStatusReturnAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 10),
+		'airIRSCUnitStatusSuctionPressureMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 21),
+		'airIRSCUnitStatusSuctionPressureUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 20),
+		'airIRSCUnitStatusSuctionTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 13),
+		'airIRSCUnitStatusSuctionTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 12),
+		'airIRSCUnitStatusSuperheatTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 15),
+		'airIRSCUnitStatusSuperheatTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 14),
+		'airIRSCUnitStatusSupplyAirTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 9),
+		'airIRSCUnitStatusSupplyAirTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 2, 8),
+		'airIRSCUnitThresholds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 5),
+		'airIRSCUnitThresholdsRackInletHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 5, 2),
+		'airIRSCUnitThresholdsRackInletHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 5, 1),
+		'airIRSCUnitThresholdsReturnAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 5, 6),
+		'airIRSCUnitThresholdsReturnAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 5, 5),
+		'airIRSCUnitThresholdsSupplyAirHighTempMetric': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 5, 4),
+		'airIRSCUnitThresholdsSupplyAirHighTempUS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 3, 4, 1, 5, 3),
+		'airIRmAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 2),
+		'airIRmAlarmsDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 2, 2, 1, 3),
+		'airIRmAlarmsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 2, 2, 1),
+		'airIRmAlarmsEventCode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 2, 2, 1, 2),
+		'airIRmAlarmsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 2, 2, 1, 1),
+		'airIRmAlarmsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 2, 2),
+		'airIRmAlarmsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 2, 1),
+		'airIRmIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1),
+		'airIRmIdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 5),
+		'airIRmIdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 6),
+		'airIRmIdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 2),
+		'airIRmIdentManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 7),
+		'airIRmIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 3),
+		'airIRmIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 1),
+		'airIRmIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 4),
+		'airIRmIdentSysOID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 1, 8),
+		'airIRmPerimeter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3),
+		'airIRmPmAlarmBits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43),
+		'airIRmPmAuxAlarm1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 38),
+		'airIRmPmAuxAlarm2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 39),
+		'airIRmPmAuxAlarm3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 40),
+		'airIRmPmAuxAlarm4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 41),
+		'airIRmPmAuxAlarm5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 42),
+		'airIRmPmAuxiliaryAlarm1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 92),
+		'airIRmPmAuxiliaryAlarm10': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 101),
+		'airIRmPmAuxiliaryAlarm2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 93),
+		'airIRmPmAuxiliaryAlarm3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 94),
+		'airIRmPmAuxiliaryAlarm4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 95),
+		'airIRmPmAuxiliaryAlarm5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 96),
+		'airIRmPmAuxiliaryAlarm6': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 97),
+		'airIRmPmAuxiliaryAlarm7': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 98),
+		'airIRmPmAuxiliaryAlarm8': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 99),
+		'airIRmPmAuxiliaryAlarm9': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 100),
+		'airIRmPmBusAddress': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 2, 5),
+		'airIRmPmCmp1HysteresisSummer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 18),
+		'airIRmPmCmp1HysteresisSummerF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 18, 2),
+		'airIRmPmCmp1HysteresisSummerK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 18, 1),
+		'airIRmPmCmp1HysteresisWinter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 20),
+		'airIRmPmCmp1HysteresisWinterF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 20, 2),
+		'airIRmPmCmp1HysteresisWinterK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 20, 1),
+		'airIRmPmCmp1ManOperationActive': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 2),
+		'airIRmPmCmp1ManOperationState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 3),
+		'airIRmPmCmp1Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 4),
+		'airIRmPmCmp1Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 29),
+		'airIRmPmCmp1StartTempSummer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 17),
+		'airIRmPmCmp1StartTempSummerF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 17, 2),
+		'airIRmPmCmp1StartTempSummerK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 17, 1),
+		'airIRmPmCmp1StartTempWinter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 19),
+		'airIRmPmCmp1StartTempWinterF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 19, 2),
+		'airIRmPmCmp1StartTempWinterK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7, 19, 1),
+		'airIRmPmCmp2HysteresisSummer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 18),
+		'airIRmPmCmp2HysteresisSummerF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 18, 2),
+		'airIRmPmCmp2HysteresisSummerK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 18, 1),
+		'airIRmPmCmp2HysteresisWinter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 20),
+		'airIRmPmCmp2HysteresisWinterF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 20, 2),
+		'airIRmPmCmp2HysteresisWinterK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 20, 1),
+		'airIRmPmCmp2ManOperationActive': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 2),
+		'airIRmPmCmp2ManOperationState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 3),
+		'airIRmPmCmp2Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 4),
+		'airIRmPmCmp2Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 29),
+		'airIRmPmCmp2StartTempSummer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 17),
+		'airIRmPmCmp2StartTempSummerF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 17, 2),
+		'airIRmPmCmp2StartTempSummerK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 17, 1),
+		'airIRmPmCmp2StartTempWinter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 19),
+		'airIRmPmCmp2StartTempWinterF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 19, 2),
+		'airIRmPmCmp2StartTempWinterK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8, 19, 1),
+		'airIRmPmCommon1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 2),
+		'airIRmPmCommon2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3),
+		'airIRmPmCommon3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4),
+		'airIRmPmCommon4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5),
+		'airIRmPmCommon5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6),
+		'airIRmPmCommonAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 11),
+		'airIRmPmCompressor1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 7),
+		'airIRmPmCompressor1Alarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 61),
+		'airIRmPmCompressor1Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 4),
+		'airIRmPmCompressor1LowPressure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 63),
+		'airIRmPmCompressor2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 8),
+		'airIRmPmCompressor2Alarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 62),
+		'airIRmPmCompressor2Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 5),
+		'airIRmPmCompressor2LowPressure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 64),
+		'airIRmPmControllerType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 2, 7),
+		'airIRmPmCoolingPriority': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 39),
+		'airIRmPmDayNightMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 25),
+		'airIRmPmDehumidificHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 12),
+		'airIRmPmDehumidificManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 2),
+		'airIRmPmDehumidificManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 5),
+		'airIRmPmDehumidificMaxWaterTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 19),
+		'airIRmPmDehumidificMaxWaterTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 19, 1),
+		'airIRmPmDehumidificMaxWaterTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 19, 2),
+		'airIRmPmDehumidificMinWaterTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 18),
+		'airIRmPmDehumidificMinWaterTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 18, 1),
+		'airIRmPmDehumidificMinWaterTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 18, 2),
+		'airIRmPmDehumidificRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 3),
+		'airIRmPmDehumidificRuntime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 21),
+		'airIRmPmDehumidificStartHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31, 10),
+		'airIRmPmDehumidification': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 31),
+		'airIRmPmDrycooler1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17),
+		'airIRmPmDrycooler1Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 69),
+		'airIRmPmDrycooler1Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 11),
+		'airIRmPmDrycooler1HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 11, 2),
+		'airIRmPmDrycooler1HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 11, 1),
+		'airIRmPmDrycooler1ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 2),
+		'airIRmPmDrycooler1ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 5),
+		'airIRmPmDrycooler1Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 3),
+		'airIRmPmDrycooler1Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 16),
+		'airIRmPmDrycooler1SummerStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 10),
+		'airIRmPmDrycooler1SummerStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 10, 1),
+		'airIRmPmDrycooler1SummerStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 10, 2),
+		'airIRmPmDrycooler1WinterStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 9),
+		'airIRmPmDrycooler1WinterStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 9, 1),
+		'airIRmPmDrycooler1WinterStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 17, 9, 2),
+		'airIRmPmDrycooler2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18),
+		'airIRmPmDrycooler2Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 70),
+		'airIRmPmDrycooler2Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 11),
+		'airIRmPmDrycooler2HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 11, 2),
+		'airIRmPmDrycooler2HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 11, 1),
+		'airIRmPmDrycooler2ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 2),
+		'airIRmPmDrycooler2ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 5),
+		'airIRmPmDrycooler2Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 3),
+		'airIRmPmDrycooler2Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 16),
+		'airIRmPmDrycooler2SummerStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 10),
+		'airIRmPmDrycooler2SummerStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 10, 1),
+		'airIRmPmDrycooler2SummerStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 10, 2),
+		'airIRmPmDrycooler2WinterStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 9),
+		'airIRmPmDrycooler2WinterStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 9, 1),
+		'airIRmPmDrycooler2WinterStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 18, 9, 2),
+		'airIRmPmDrycooler3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19),
+		'airIRmPmDrycooler3Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 71),
+		'airIRmPmDrycooler3Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 11),
+		'airIRmPmDrycooler3HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 11, 2),
+		'airIRmPmDrycooler3HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 11, 1),
+		'airIRmPmDrycooler3ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 2),
+		'airIRmPmDrycooler3ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 5),
+		'airIRmPmDrycooler3Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 3),
+		'airIRmPmDrycooler3Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 16),
+		'airIRmPmDrycooler3SummerStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 10),
+		'airIRmPmDrycooler3SummerStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 10, 1),
+		'airIRmPmDrycooler3SummerStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 10, 2),
+		'airIRmPmDrycooler3WinterStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 9),
+		'airIRmPmDrycooler3WinterStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 9, 1),
+		'airIRmPmDrycooler3WinterStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 19, 9, 2),
+		'airIRmPmDrycooler4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20),
+		'airIRmPmDrycooler4Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 72),
+		'airIRmPmDrycooler4Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 11),
+		'airIRmPmDrycooler4HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 11, 2),
+		'airIRmPmDrycooler4HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 11, 1),
+		'airIRmPmDrycooler4ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 2),
+		'airIRmPmDrycooler4ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 5),
+		'airIRmPmDrycooler4Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 3),
+		'airIRmPmDrycooler4Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 16),
+		'airIRmPmDrycooler4SummerStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 10),
+		'airIRmPmDrycooler4SummerStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 10, 1),
+		'airIRmPmDrycooler4SummerStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 10, 2),
+		'airIRmPmDrycooler4WinterStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 9),
+		'airIRmPmDrycooler4WinterStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 9, 1),
+		'airIRmPmDrycooler4WinterStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 20, 9, 2),
+		'airIRmPmEEV1PressureSensorError': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 103),
+		'airIRmPmEEV1StepperMotorError': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 105),
+		'airIRmPmEEV1TemperatureSensorError': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 104),
+		'airIRmPmEEV2PressureSensorError': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 106),
+		'airIRmPmEEV2StepperMotorError': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 108),
+		'airIRmPmEEV2TemperatureSensorError': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 107),
+		'airIRmPmEheating1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11),
+		'airIRmPmEheating1Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 11),
+		'airIRmPmEheating1HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 11, 2),
+		'airIRmPmEheating1HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 11, 1),
+		'airIRmPmEheating1ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 2),
+		'airIRmPmEheating1ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 5),
+		'airIRmPmEheating1Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 4),
+		'airIRmPmEheating1Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 17),
+		'airIRmPmEheating1StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 10),
+		'airIRmPmEheating1StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 10, 2),
+		'airIRmPmEheating1StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 10, 1),
+		'airIRmPmEheating1Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 11, 9),
+		'airIRmPmEheating2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12),
+		'airIRmPmEheating2Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 11),
+		'airIRmPmEheating2HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 11, 2),
+		'airIRmPmEheating2HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 11, 1),
+		'airIRmPmEheating2ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 2),
+		'airIRmPmEheating2ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 5),
+		'airIRmPmEheating2Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 4),
+		'airIRmPmEheating2Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 17),
+		'airIRmPmEheating2StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 10),
+		'airIRmPmEheating2StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 10, 2),
+		'airIRmPmEheating2StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 10, 1),
+		'airIRmPmEheating2Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 12, 9),
+		'airIRmPmEheating3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13),
+		'airIRmPmEheating3Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 11),
+		'airIRmPmEheating3HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 11, 2),
+		'airIRmPmEheating3HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 11, 1),
+		'airIRmPmEheating3ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 2),
+		'airIRmPmEheating3ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 5),
+		'airIRmPmEheating3Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 4),
+		'airIRmPmEheating3Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 17),
+		'airIRmPmEheating3StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 10),
+		'airIRmPmEheating3StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 10, 2),
+		'airIRmPmEheating3StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 10, 1),
+		'airIRmPmEheating3Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 13, 9),
+		'airIRmPmEheating4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14),
+		'airIRmPmEheating4Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 11),
+		'airIRmPmEheating4HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 11, 2),
+		'airIRmPmEheating4HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 11, 1),
+		'airIRmPmEheating4ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 2),
+		'airIRmPmEheating4ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 5),
+		'airIRmPmEheating4Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 4),
+		'airIRmPmEheating4Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 17),
+		'airIRmPmEheating4StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 10),
+		'airIRmPmEheating4StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 10, 2),
+		'airIRmPmEheating4StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 10, 1),
+		'airIRmPmEheating4Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 14, 9),
+		'airIRmPmErrorOnBus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 2, 9),
+		'airIRmPmFan1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32),
+		'airIRmPmFan1Alarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 86),
+		'airIRmPmFan1Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 1),
+		'airIRmPmFan1ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32, 2),
+		'airIRmPmFan1ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32, 6),
+		'airIRmPmFan1ManOpSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32, 34),
+		'airIRmPmFan1Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32, 3),
+		'airIRmPmFan1Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32, 32),
+		'airIRmPmFan1Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32, 33),
+		'airIRmPmFan1Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 32, 9),
+		'airIRmPmFan2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33),
+		'airIRmPmFan2Alarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 87),
+		'airIRmPmFan2Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 2),
+		'airIRmPmFan2ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33, 2),
+		'airIRmPmFan2ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33, 6),
+		'airIRmPmFan2ManOpSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33, 34),
+		'airIRmPmFan2Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33, 3),
+		'airIRmPmFan2Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33, 32),
+		'airIRmPmFan2Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33, 33),
+		'airIRmPmFan2Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 33, 9),
+		'airIRmPmFan3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34),
+		'airIRmPmFan3Alarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 88),
+		'airIRmPmFan3Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 3),
+		'airIRmPmFan3ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34, 2),
+		'airIRmPmFan3ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34, 6),
+		'airIRmPmFan3ManOpSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34, 34),
+		'airIRmPmFan3Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34, 3),
+		'airIRmPmFan3Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34, 32),
+		'airIRmPmFan3Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34, 33),
+		'airIRmPmFan3Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 34, 9),
+		'airIRmPmFilter1Clogged': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 89),
+		'airIRmPmFilter2Clogged': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 90),
+		'airIRmPmFilter3Clogged': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 91),
+		'airIRmPmFireSmokeDetector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 8),
+		'airIRmPmGECWvalve': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15),
+		'airIRmPmGECWvalveGEOffTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 12),
+		'airIRmPmGECWvalveGEOffTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 12, 1),
+		'airIRmPmGECWvalveGEOffTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 12, 2),
+		'airIRmPmGECWvalveLinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 10),
+		'airIRmPmGECWvalveLinearRangeF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 10, 2),
+		'airIRmPmGECWvalveLinearRangeK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 10, 1),
+		'airIRmPmGECWvalveManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 2),
+		'airIRmPmGECWvalveManOpOpeningGrade': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 16),
+		'airIRmPmGECWvalveOpeningGrade': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 15),
+		'airIRmPmGECWvalveStartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 9),
+		'airIRmPmGECWvalveStartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 9, 2),
+		'airIRmPmGECWvalveStartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 15, 9, 1),
+		'airIRmPmGeneralError': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 2, 8),
+		'airIRmPmGlobalZoneData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 45),
+		'airIRmPmGlobalZoneDataEmergencyOpMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 45, 1),
+		'airIRmPmGvalve': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 16),
+		'airIRmPmGvalveManOpOpeningGrade': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 16, 14),
+		'airIRmPmGvalveManOperationEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 16, 2),
+		'airIRmPmGvalveOpeningGrade': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 16, 13),
+		'airIRmPmGvalvePreOpeningGrade': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 16, 12),
+		'airIRmPmGvalvePreOpeningTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 16, 11),
+		'airIRmPmHotGasHeatingAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 102),
+		'airIRmPmHotgasHeatRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 25, 3),
+		'airIRmPmHotgasHeating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 25),
+		'airIRmPmHumidifier1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27),
+		'airIRmPmHumidifier1Alarm20us': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 83),
+		'airIRmPmHumidifier1Alarm5us': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 80),
+		'airIRmPmHumidifier1CurrentValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 28),
+		'airIRmPmHumidifier1Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 77),
+		'airIRmPmHumidifier1Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 20),
+		'airIRmPmHumidifier1LinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 21),
+		'airIRmPmHumidifier1ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 2),
+		'airIRmPmHumidifier1ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 5),
+		'airIRmPmHumidifier1ManOpValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 29),
+		'airIRmPmHumidifier1Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 3),
+		'airIRmPmHumidifier1Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 27),
+		'airIRmPmHumidifier1StartHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 18),
+		'airIRmPmHumidifier1Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 27, 17),
+		'airIRmPmHumidifier2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28),
+		'airIRmPmHumidifier2Alarm20us': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 84),
+		'airIRmPmHumidifier2Alarm5us': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 81),
+		'airIRmPmHumidifier2CurrentValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 28),
+		'airIRmPmHumidifier2Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 78),
+		'airIRmPmHumidifier2Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 20),
+		'airIRmPmHumidifier2LinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 21),
+		'airIRmPmHumidifier2ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 2),
+		'airIRmPmHumidifier2ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 5),
+		'airIRmPmHumidifier2ManOpValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 29),
+		'airIRmPmHumidifier2Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 3),
+		'airIRmPmHumidifier2Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 27),
+		'airIRmPmHumidifier2StartHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 18),
+		'airIRmPmHumidifier2Type': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 28, 17),
+		'airIRmPmHumidifier3Alarm20us': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 85),
+		'airIRmPmHumidifier3Alarm5us': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 82),
+		'airIRmPmHumidifier3Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 79),
+		'airIRmPmLastMaintenanceDay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 3),
+		'airIRmPmLastMaintenanceMonth': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 2),
+		'airIRmPmLastMaintenanceYear': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 1),
+		'airIRmPmLocalStop': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 3),
+		'airIRmPmLocalUPS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 8),
+		'airIRmPmLouver1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 35),
+		'airIRmPmLouver1ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 35, 2),
+		'airIRmPmLouver1ManOpPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 35, 4),
+		'airIRmPmLouver1Position': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 35, 3),
+		'airIRmPmLouver2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 36),
+		'airIRmPmLouver2ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 36, 2),
+		'airIRmPmLouver2ManOpPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 36, 4),
+		'airIRmPmLouver2Position': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 36, 3),
+		'airIRmPmLouver3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 37),
+		'airIRmPmLouver3ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 37, 2),
+		'airIRmPmLouver3ManOpPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 37, 4),
+		'airIRmPmLouver3Position': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 37, 3),
+		'airIRmPmLowPressureWinterDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 18),
+		'airIRmPmMaintenance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 15),
+		'airIRmPmMaxLimitReturnAirHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 14),
+		'airIRmPmMaxLimitReturnAirTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 8),
+		'airIRmPmMaxLimitReturnAirTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 8, 1),
+		'airIRmPmMaxLimitReturnAirTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 8, 2),
+		'airIRmPmMaxLimitSupplyAirHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 16),
+		'airIRmPmMaxLimitSupplyAirTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 10),
+		'airIRmPmMaxLimitSupplyAirTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 10, 1),
+		'airIRmPmMaxLimitSupplyAirTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 10, 2),
+		'airIRmPmMaxLimitWaterTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 12),
+		'airIRmPmMaxLimitWaterTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 12, 1),
+		'airIRmPmMaxLimitWaterTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 12, 2),
+		'airIRmPmMinLimitReturnAirHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 15),
+		'airIRmPmMinLimitReturnAirTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 9),
+		'airIRmPmMinLimitReturnAirTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 9, 1),
+		'airIRmPmMinLimitReturnAirTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 9, 2),
+		'airIRmPmMinLimitSupplyAirHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 17),
+		'airIRmPmMinLimitSupplyAirTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 11),
+		'airIRmPmMinLimitSupplyAirTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 11, 1),
+		'airIRmPmMinLimitSupplyAirTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 11, 2),
+		'airIRmPmMinLimitWaterTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 13),
+		'airIRmPmMinLimitWaterTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 13, 1),
+		'airIRmPmMinLimitWaterTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 13, 2),
+		'airIRmPmMyZone': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44),
+		'airIRmPmMyZoneCWEnergySaveMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 9),
+		'airIRmPmMyZoneEmergencyTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 8),
+		'airIRmPmMyZoneEmergencyTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 8, 1),
+		'airIRmPmMyZoneEmergencyTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 8, 2),
+		'airIRmPmMyZoneNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 1),
+		'airIRmPmMyZoneNumberOfErrorUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 7),
+		'airIRmPmMyZoneRoomHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 3),
+		'airIRmPmMyZoneRoomTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 2),
+		'airIRmPmMyZoneRoomTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 2, 1),
+		'airIRmPmMyZoneRoomTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 2, 2),
+		'airIRmPmMyZoneSequencingTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 6),
+		'airIRmPmMyZoneSupplyHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 5),
+		'airIRmPmMyZoneSupplyTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 4),
+		'airIRmPmMyZoneSupplyTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 4, 1),
+		'airIRmPmMyZoneSupplyTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 44, 4, 2),
+		'airIRmPmNumberOfCompressors': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 4),
+		'airIRmPmNumberOfDehumidifiers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 17),
+		'airIRmPmNumberOfDryCoolers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 6),
+		'airIRmPmNumberOfElectricHeaters': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 8),
+		'airIRmPmNumberOfExternalAlarmInputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 13),
+		'airIRmPmNumberOfFans': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 10),
+		'airIRmPmNumberOfGECWValves': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 14),
+		'airIRmPmNumberOfHotGasReheat': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 15),
+		'airIRmPmNumberOfHumidifiers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 9),
+		'airIRmPmNumberOfLouvers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 11),
+		'airIRmPmNumberOfPWWReheat': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 16),
+		'airIRmPmNumberOfPumps': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 7),
+		'airIRmPmNumberOfSensors': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 12),
+		'airIRmPmNumberOfSuctionValves': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 5, 5),
+		'airIRmPmOutsideAirHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 38),
+		'airIRmPmOutsideAirTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 37),
+		'airIRmPmOutsideAirTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 37, 1),
+		'airIRmPmOutsideAirTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 37, 2),
+		'airIRmPmPCStop': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 1),
+		'airIRmPmPWWHeating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26),
+		'airIRmPmPWWHeatingCurrentValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 16),
+		'airIRmPmPWWHeatingHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 12),
+		'airIRmPmPWWHeatingHysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 12, 2),
+		'airIRmPmPWWHeatingHysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 12, 1),
+		'airIRmPmPWWHeatingLinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 13),
+		'airIRmPmPWWHeatingLinearRangeF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 13, 2),
+		'airIRmPmPWWHeatingLinearRangeK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 13, 1),
+		'airIRmPmPWWHeatingManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 2),
+		'airIRmPmPWWHeatingManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 4),
+		'airIRmPmPWWHeatingManOpValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 17),
+		'airIRmPmPWWHeatingRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 3),
+		'airIRmPmPWWHeatingStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 10),
+		'airIRmPmPWWHeatingStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 10, 2),
+		'airIRmPmPWWHeatingStartTempK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 10, 1),
+		'airIRmPmPWWHeatingType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 26, 9),
+		'airIRmPmPhaseFailure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 7),
+		'airIRmPmPump1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21),
+		'airIRmPmPump1ControlCycle': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 28),
+		'airIRmPmPump1ControlFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 30),
+		'airIRmPmPump1Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 73),
+		'airIRmPmPump1Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 11),
+		'airIRmPmPump1HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 11, 2),
+		'airIRmPmPump1HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 11, 1),
+		'airIRmPmPump1LinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 12),
+		'airIRmPmPump1LinearRangeF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 12, 2),
+		'airIRmPmPump1LinearRangeK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 12, 1),
+		'airIRmPmPump1ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 2),
+		'airIRmPmPump1ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 6),
+		'airIRmPmPump1MaxAdjust': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 29),
+		'airIRmPmPump1PressureSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 13),
+		'airIRmPmPump1Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 3),
+		'airIRmPmPump1Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 21),
+		'airIRmPmPump1Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 22),
+		'airIRmPmPump1StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 10),
+		'airIRmPmPump1StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 10, 2),
+		'airIRmPmPump1StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 21, 10, 1),
+		'airIRmPmPump2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22),
+		'airIRmPmPump2ControlCycle': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 28),
+		'airIRmPmPump2ControlFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 30),
+		'airIRmPmPump2Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 74),
+		'airIRmPmPump2Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 11),
+		'airIRmPmPump2HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 11, 2),
+		'airIRmPmPump2HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 11, 1),
+		'airIRmPmPump2LinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 12),
+		'airIRmPmPump2LinearRangeF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 12, 2),
+		'airIRmPmPump2LinearRangeK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 12, 1),
+		'airIRmPmPump2ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 2),
+		'airIRmPmPump2ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 6),
+		'airIRmPmPump2MaxAdjust': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 29),
+		'airIRmPmPump2PressureSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 13),
+		'airIRmPmPump2Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 3),
+		'airIRmPmPump2Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 21),
+		'airIRmPmPump2Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 22),
+		'airIRmPmPump2StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 10),
+		'airIRmPmPump2StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 10, 2),
+		'airIRmPmPump2StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 22, 10, 1),
+		'airIRmPmPump3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23),
+		'airIRmPmPump3ControlCycle': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 28),
+		'airIRmPmPump3ControlFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 30),
+		'airIRmPmPump3Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 75),
+		'airIRmPmPump3Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 11),
+		'airIRmPmPump3HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 11, 2),
+		'airIRmPmPump3HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 11, 1),
+		'airIRmPmPump3LinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 12),
+		'airIRmPmPump3LinearRangeF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 12, 2),
+		'airIRmPmPump3LinearRangeK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 12, 1),
+		'airIRmPmPump3ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 2),
+		'airIRmPmPump3ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 6),
+		'airIRmPmPump3MaxAdjust': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 29),
+		'airIRmPmPump3PressureSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 13),
+		'airIRmPmPump3Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 3),
+		'airIRmPmPump3Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 21),
+		'airIRmPmPump3Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 22),
+		'airIRmPmPump3StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 10),
+		'airIRmPmPump3StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 10, 2),
+		'airIRmPmPump3StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 23, 10, 1),
+		'airIRmPmPump4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24),
+		'airIRmPmPump4ControlCycle': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 28),
+		'airIRmPmPump4ControlFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 30),
+		'airIRmPmPump4Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 76),
+		'airIRmPmPump4Hysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 11),
+		'airIRmPmPump4HysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 11, 2),
+		'airIRmPmPump4HysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 11, 1),
+		'airIRmPmPump4LinearRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 12),
+		'airIRmPmPump4LinearRangeF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 12, 2),
+		'airIRmPmPump4LinearRangeK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 12, 1),
+		'airIRmPmPump4ManOpEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 2),
+		'airIRmPmPump4ManOpRunning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 6),
+		'airIRmPmPump4MaxAdjust': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 29),
+		'airIRmPmPump4PressureSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 13),
+		'airIRmPmPump4Running': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 3),
+		'airIRmPmPump4Runtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 21),
+		'airIRmPmPump4Speed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 22),
+		'airIRmPmPump4StartTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 10),
+		'airIRmPmPump4StartTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 10, 2),
+		'airIRmPmPump4StartTemperatureK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 24, 10, 1),
+		'airIRmPmReheat1Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 65),
+		'airIRmPmReheat2Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 66),
+		'airIRmPmReheat3Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 67),
+		'airIRmPmReheat4Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 68),
+		'airIRmPmRemoteStop': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 2),
+		'airIRmPmRemoteUPS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 7),
+		'airIRmPmResetAllAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 12),
+		'airIRmPmReturnAirHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 35),
+		'airIRmPmReturnAirHumidityTooHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 10),
+		'airIRmPmReturnAirHumidityTooLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 15),
+		'airIRmPmReturnAirTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 33),
+		'airIRmPmReturnAirTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 33, 1),
+		'airIRmPmReturnAirTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 33, 2),
+		'airIRmPmReturnAirTemperatureTooHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 9),
+		'airIRmPmReturnAirTemperatureTooLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 14),
+		'airIRmPmRuntimeCooling': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 7),
+		'airIRmPmRuntimeDehumidification': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 10),
+		'airIRmPmRuntimeFreeCooling': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 44),
+		'airIRmPmRuntimeHeating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 8),
+		'airIRmPmRuntimeHumidification': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 9),
+		'airIRmPmRuntimeMixedModeFreeCooling': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 45),
+		'airIRmPmRuntimeUnit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 5),
+		'airIRmPmSensor10Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 49),
+		'airIRmPmSensor10Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 28),
+		'airIRmPmSensor11Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 50),
+		'airIRmPmSensor11Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 29),
+		'airIRmPmSensor12Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 51),
+		'airIRmPmSensor12Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 30),
+		'airIRmPmSensor13Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 52),
+		'airIRmPmSensor13Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 31),
+		'airIRmPmSensor14Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 53),
+		'airIRmPmSensor14Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 32),
+		'airIRmPmSensor15Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 54),
+		'airIRmPmSensor15Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 33),
+		'airIRmPmSensor16Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 55),
+		'airIRmPmSensor16Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 34),
+		'airIRmPmSensor17Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 56),
+		'airIRmPmSensor17Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 35),
+		'airIRmPmSensor18Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 57),
+		'airIRmPmSensor18Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 36),
+		'airIRmPmSensor19Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 58),
+		'airIRmPmSensor19Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 37),
+		'airIRmPmSensor1Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 40),
+		'airIRmPmSensor1Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 19),
+		'airIRmPmSensor20Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 59),
+		'airIRmPmSensor20Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 38),
+		'airIRmPmSensor21Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 60),
+		'airIRmPmSensor21Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 39),
+		'airIRmPmSensor2Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 41),
+		'airIRmPmSensor2Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 20),
+		'airIRmPmSensor3Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 42),
+		'airIRmPmSensor3Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 21),
+		'airIRmPmSensor4Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 43),
+		'airIRmPmSensor4Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 22),
+		'airIRmPmSensor5Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 44),
+		'airIRmPmSensor5Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 23),
+		'airIRmPmSensor6Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 45),
+		'airIRmPmSensor6Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 24),
+		'airIRmPmSensor7Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 46),
+		'airIRmPmSensor7Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 25),
+		'airIRmPmSensor8Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 47),
+		'airIRmPmSensor8Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 26),
+		'airIRmPmSensor9Defect': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 48),
+		'airIRmPmSensor9Failure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 27),
+		'airIRmPmSeqStop': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 5),
+		'airIRmPmSetpointHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 17),
+		'airIRmPmSetpointTemperatureDay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 14),
+		'airIRmPmSetpointTemperatureDayC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 14, 1),
+		'airIRmPmSetpointTemperatureDayF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 14, 2),
+		'airIRmPmSetpointTemperatureNight': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 15),
+		'airIRmPmSetpointTemperatureNightC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 15, 1),
+		'airIRmPmSetpointTemperatureNightF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 15, 2),
+		'airIRmPmStoptimeUnit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 6),
+		'airIRmPmSuctionValve1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 9),
+		'airIRmPmSuctionValve2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 10),
+		'airIRmPmSupplyAirHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 36),
+		'airIRmPmSupplyAirHumidityTooHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 12),
+		'airIRmPmSupplyAirHumidityTooLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 17),
+		'airIRmPmSupplyAirTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 34),
+		'airIRmPmSupplyAirTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 34, 1),
+		'airIRmPmSupplyAirTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 34, 2),
+		'airIRmPmSupplyAirTemperatureTooHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 11),
+		'airIRmPmSupplyAirTemperatureTooLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 16),
+		'airIRmPmSwVersion': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 2, 3),
+		'airIRmPmTimerStop': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 4),
+		'airIRmPmUnitCondensationPressure1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 4),
+		'airIRmPmUnitCondensationPressure2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 19),
+		'airIRmPmUnitCondensationTemperature1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 3),
+		'airIRmPmUnitCondensationTemperature1C': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 3, 1),
+		'airIRmPmUnitCondensationTemperature1F': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 3, 2),
+		'airIRmPmUnitCondensationTemperature2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 41),
+		'airIRmPmUnitCondensationTemperature2C': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 41, 1),
+		'airIRmPmUnitCondensationTemperature2F': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 41, 2),
+		'airIRmPmUnitControlType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 24),
+		'airIRmPmUnitEvaporationPressure1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 2),
+		'airIRmPmUnitEvaporationPressure2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 42),
+		'airIRmPmUnitEvaporationTemperature1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 1),
+		'airIRmPmUnitEvaporationTemperature1C': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 1, 1),
+		'airIRmPmUnitEvaporationTemperature1F': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 1, 2),
+		'airIRmPmUnitEvaporationTemperature2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 43),
+		'airIRmPmUnitEvaporationTemperature2C': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 43, 1),
+		'airIRmPmUnitEvaporationTemperature2F': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 43, 2),
+		'airIRmPmUnitHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 12),
+		'airIRmPmUnitMaintenanceInterval': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 4),
+		'airIRmPmUnitOnOff': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 14),
+		'airIRmPmUnitOverloadSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 6, 20),
+		'airIRmPmUnitTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 11),
+		'airIRmPmUnitTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 11, 1),
+		'airIRmPmUnitTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 11, 2),
+		'airIRmPmUnitTemperatureScale': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 23),
+		'airIRmPmUnitType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 2, 1),
+		'airIRmPmUnitWinterMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 3, 24),
+		'airIRmPmWaterDetector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 6),
+		'airIRmPmWaterTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 32),
+		'airIRmPmWaterTemperature2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 43),
+		'airIRmPmWaterTemperature2C': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 43, 1),
+		'airIRmPmWaterTemperature2F': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 43, 2),
+		'airIRmPmWaterTemperatureC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 32, 1),
+		'airIRmPmWaterTemperatureF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 32, 2),
+		'airIRmPmWaterTemperatureTooHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 13),
+		'airIRmPmWaterTemperatureTooLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 43, 18),
+		'airIRmPmWinterModeHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 30),
+		'airIRmPmWinterModeHysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 30, 2),
+		'airIRmPmWinterModeHysteresisK': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 30, 1),
+		'airIRmPmWinterModeStartTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 29),
+		'airIRmPmWinterModeStartTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 29, 1),
+		'airIRmPmWinterModeStartTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5, 3, 4, 29, 2),
+		'airInRoom': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 5),
+		'airPA': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2),
+		'airPABlowerSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 5),
+		'airPACompressor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 6),
+		'airPACondensatePump': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 8),
+		'airPACondenserFan': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 7),
+		'airPADateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 1, 3),
+		'airPAFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 1, 5),
+		'airPAHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 1, 6),
+		'airPAIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 1),
+		'airPAIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 1, 1),
+		'airPAModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 1, 2),
+		'airPAOperatingMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 2),
+		'airPARemoteHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 15),
+		'airPARemoteTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 14),
+		'airPARemoteTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 13),
+		'airPAReturnTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 12),
+		'airPAReturnTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 11),
+		'airPASerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 1, 4),
+		'airPASetpointTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 4),
+		'airPASetpointTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 3),
+		'airPAStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2),
+		'airPASupplyTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 10),
+		'airPASupplyTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 9),
+		'airPASystemPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 13, 2, 2, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'airFMAlarmClearActiveGroupAlarms': (('noOperation', 1), ('clearAlarms', 2)),
+		'airFMAlarmClearActiveSysModAlarms': (('noOperation', 1), ('clearAlarms', 2)),
+		'airFMAlarmSeverity': (('informational', 1), ('warningMinor', 2), ('criticalMajor', 3)),
+		'airFMAlarmType': (('group', 1), ('system', 2), ('mainMod', 3), ('expMod1', 4), ('expMod2', 5)),
+		'airFMGroupAutoRoleNumPrimary': (('one', 1), ('two', 2), ('three', 3), ('four', 4)),
+		'airFMGroupCfgDmdFightSetting': (('disable', 1), ('enable', 2)),
+		'airFMGroupCfgDmdFightStatus': (('off', 1), ('on', 2)),
+		'airFMGroupCfgFailoverCommLoss': (('disable', 1), ('enable', 2)),
+		'airFMGroupCfgIdleBlower': (('off', 1), ('minimumSpeed', 2), ('normalSpeed', 3)),
+		'airFMGroupCfgNumSystems': (('one', 1), ('two', 2), ('three', 3), ('four', 4)),
+		'airFMGroupCfgResetFieldServiceDefaults': (('noOperation', 1), ('reset', 2)),
+		'airFMGroupCfgSetpointShareSetting': (('disable', 1), ('enable', 2)),
+		'airFMGroupCfgSetpointShareStatus': (('off', 1), ('on', 2)),
+		'airFMGroupCfgShutdownFire': (('disable', 1), ('enable', 2)),
+		'airFMGroupCfgShutdownSmoke': (('disable', 1), ('enable', 2)),
+		'airFMGroupFailoverModAirBlockInterlockOpen': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModBlwrCntrl1Fail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModBlwrCntrl2Fail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModCondensatePumpFail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModCoolFail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModHighFilterDP': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModHighSupplyTemp': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModHumFail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModHumReplaceCylinder': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModLossOrLowAirFlow': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModLowSupplyTemp': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModMaintRequired': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverModWaterDetected': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysAnyMajorAlarm': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysAnyMinorAlarm': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysCommLost': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysFireAlarm': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysHighEnvHum': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysHighEnvTemp': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysLowEnvHum': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysLowEnvTemp': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysNoSensorsAvailable': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysPrimarySensorFail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysReturnSensorFail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysSecondarySensorFail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysSmokeAlarm': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupFailoverSysSupplySensorFail': (('notApplicable', 1), ('disable', 2), ('enable', 3)),
+		'airFMGroupLoadShareCoolRequests': (('disable', 1), ('enable', 2)),
+		'airFMGroupLoadShareDehumRequests': (('disable', 1), ('enable', 2)),
+		'airFMGroupLoadShareHumRequests': (('disable', 1), ('enable', 2)),
+		'airFMGroupLoadShareReheatRequests': (('disable', 1), ('enable', 2)),
+		'airFMGroupSysComm': (('commLost', 1), ('commEstablished', 2)),
+		'airFMGroupSysManualRoleSetting': (('primary', 1), ('backup', 2)),
+		'airFMGroupSysPresentRole': (('primary', 1), ('backup', 2)),
+		'airFMGroupSysRole': (('rolePrimary', 1), ('roleBackup', 2)),
+		'airFMGroupSysRoleAssignment': (('staticManual', 1), ('dynamicAutomatic', 2)),
+		'airFMGroupSysRoleStatus': (('reserved1', 1), ('reserved2', 2), ('onLine', 3), ('idle', 4), ('loadShare', 5), ('failed', 6), ('offLine', 7)),
+		'airFMGroupSysStatus': (('statusOnLine', 1), ('statusIdle', 2), ('statusLoadShare', 3), ('statusOffLine', 4), ('statusFailed', 5), ('statusDisabled', 6), ('statusUndefined', 7)),
+		'airFMModBlwr1CtrlType': (('notApplicable', 1), ('fujiVFD', 2), ('ecController', 3), ('danfossVFD', 4)),
+		'airFMModBlwr1ElOvMode': (('notApplicable', 1), ('inactive', 2), ('active', 3)),
+		'airFMModBlwr2CtrlType': (('notApplicable', 1), ('fujiVFD', 2), ('ecController', 3), ('danfossVFD', 4)),
+		'airFMModBlwr2ElOvMode': (('notApplicable', 1), ('inactive', 2), ('active', 3)),
+		'airFMModCapacityCtrl': (('notApplicable', 1), ('tandem', 2), ('hotGasBypass', 3)),
+		'airFMModComp1': (('notApplicable', 1), ('on', 2), ('off', 3)),
+		'airFMModComp2': (('notApplicable', 1), ('on', 2), ('off', 3)),
+		'airFMModCondPump': (('notApplicable', 1), ('notPresent', 2), ('present', 3)),
+		'airFMModElectricHeaterType': (('notApplicable', 1), ('kw10', 2), ('kw15', 3)),
+		'airFMModFireDetector': (('notApplicable', 1), ('notPresent', 2), ('present', 3)),
+		'airFMModHeaterType': (('notApplicable', 1), ('none', 2), ('electricSCR', 3), ('steam', 4), ('hotWaterOnOff', 5), ('hotGasReheat', 6), ('hotGasAndElectric', 7), ('hotWaterProp', 8)),
+		'airFMModHumidifier': (('notApplicable', 1), ('none', 2), ('steamElectrode', 3), ('liveSteam', 4)),
+		'airFMModHumidifierType': (('notApplicable', 1), ('none', 2), ('steamElectrode', 3), ('liveSteam', 4)),
+		'airFMModOutputCapacity': (('notApplicable', 1), ('kw45', 2), ('kw35', 3), ('kw40', 4), ('kw50', 5), ('kw80', 6)),
+		'airFMModRHBlwr1Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModRHBlwr2Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModRHComp1Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModRHComp2Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModRHHeaterReset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModRHHumReset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntBlwr1Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntBlwr2Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntBlwrCtrl1Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntBlwrCtrl2Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntComp1Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntComp2Reset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntHeaterReset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModServIntHumReset': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMModSmokeDetector': (('notApplicable', 1), ('notPresent', 2), ('present', 3)),
+		'airFMModStmElectHumMode': (('notApplicable', 1), ('off', 2), ('auto', 3), ('drain', 4)),
+		'airFMModWaterDetector': (('notApplicable', 1), ('notPresent', 2), ('present', 3)),
+		'airFMStatusSystemCoolingEnabled': (('enabledYes', 1), ('enabledNo', 2)),
+		'airFMStatusSystemDehumidifyEnabled': (('enabledYes', 1), ('enabledNo', 2)),
+		'airFMStatusSystemHumidifyEnabled': (('enabledYes', 1), ('enabledNo', 2)),
+		'airFMStatusSystemOn': (('statusOn', 1), ('statusOff', 2)),
+		'airFMStatusSystemReheatingEnabled': (('enabledYes', 1), ('enabledNo', 2)),
+		'airFMSysActualHumCtrl': (('notApplicable', 1), ('relativeHum', 2), ('dewPoint', 3)),
+		'airFMSysActualHumCtrlMethod': (('notApplicable', 1), ('avgReturnRH', 2), ('avgReturnDewPt', 3), ('avgRemoteRH', 4), ('avgRemoteDewPt', 5)),
+		'airFMSysActualSteamHotGasReheat': (('notApplicable', 1), ('off', 2), ('on', 3)),
+		'airFMSysActualSteamHum': (('notApplicable', 1), ('off', 2), ('on', 3)),
+		'airFMSysActualTempCtrlMethod': (('notApplicable', 1), ('avgReturn', 2), ('avgRemote', 3), ('maxRemote', 4)),
+		'airFMSysAirFltr': (('notApplicable', 1), ('standard', 2), ('highEfficiency', 3)),
+		'airFMSysAlarmMapExpMod1AirBlckIntOpen': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1AnyAlarm': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1BlwrCntl1Fail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1BlwrCntl2Fail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1CondPumpFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1CoolFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1HighFltrDP': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1HighSupplyTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1HumFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1HumReplCyl': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1LowAirFlow': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1LowSupplyTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1MaintReq': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod1WaterDetected': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2AirBlckIntOpen': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2AnyAlarm': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2BlwrCntl1Fail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2BlwrCntl2Fail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2CondPumpFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2CoolFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2HighFltrDP': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2HighSupplyTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2HumFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2HumReplCyl': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2LowAirFlow': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2LowSupplyTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2MaintReq': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapExpMod2WaterDetected': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput1': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput10': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput11': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput12': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput13': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput14': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput15': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput16': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput2': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput3': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput4': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput5': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput6': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput7': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput8': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapInput9': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModAirBlckIntOpen': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModAnyAlarm': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModBlwrCntl1Fail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModBlwrCntl2Fail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModCondPumpFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModCoolFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModHighFltrDP': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModHighSupplyTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModHumFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModHumReplCyl': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModLowAirFlow': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModLowSupplyTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModMaintReq': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapMainModWaterDetected': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput1': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput10': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput11': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput12': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput13': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput14': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput15': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput16': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput2': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput3': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput4': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput5': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput6': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput7': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput8': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapOutput9': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysAnyAlarm': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysEconIsol': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysFireDet': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysHighEnvHum': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysHighEnvTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysLowEnvHum': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysLowEnvTemp': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysPrimSensFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysRemSensRemoved': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysReturnSensFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysSecSensActive': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysSecSensFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysSmokeDet': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSysSupplySensFail': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSystemOffline': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysAlarmMapSystemOn': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysCndsrFluidVlvAct': (('notApplicable', 1), ('none', 2), ('floatingControl', 3)),
+		'airFMSysCndsrFluidVlvType': (('notApplicable', 1), ('twoWay', 2), ('threeWay', 3)),
+		'airFMSysCoilCfg': (('notApplicable', 1), ('dx', 2), ('econ', 3), ('multicool', 4), ('chilledWater', 5)),
+		'airFMSysCoilFluidVlvAct': (('notApplicable', 1), ('none', 2), ('springAnalog', 3), ('floatingControl', 4)),
+		'airFMSysCoilFluidVlvType': (('notApplicable', 1), ('twoWay', 2), ('threeWay', 3)),
+		'airFMSysCoolEconIsolFunction': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysCoolEssFunction': (('notApplicable', 1), ('yes', 2), ('no', 3)),
+		'airFMSysCoolPIDMethod': (('notApplicable', 1), ('p', 2), ('pi', 3), ('pid', 4)),
+		'airFMSysCoolState': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysDehumCapacity': (('notApplicable', 1), ('half', 2), ('full', 3)),
+		'airFMSysDehumEssFunction': (('notApplicable', 1), ('yes', 2), ('no', 3)),
+		'airFMSysDehumPIDMethod': (('notApplicable', 1), ('p', 2), ('pi', 3), ('pid', 4)),
+		'airFMSysDehumState': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysDischAirPtrn': (('notApplicable', 1), ('upFlow', 2), ('downFlow', 3), ('horizFlow', 4)),
+		'airFMSysFastStartup': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysFlowSwitch': (('notApplicable', 1), ('none', 2), ('dxEcon', 3), ('multiCoolChillWater', 4)),
+		'airFMSysHeatRejection': (('notApplicable', 1), ('airCooled', 2), ('waterCooled', 3), ('glycolCooled', 4)),
+		'airFMSysHotWaterVlvAct': (('notApplicable', 1), ('none', 2), ('springAnalog', 3), ('floatingControl', 4)),
+		'airFMSysHumCtrlMethod': (('notApplicable', 1), ('avgReturnRH', 2), ('avgReturnDewPt', 3), ('avgRemoteRH', 4), ('avgRemoteDewPt', 5)),
+		'airFMSysHumCtrlSetting': (('notApplicable', 1), ('relativeHum', 2), ('dewPoint', 3)),
+		'airFMSysHumEssFunction': (('notApplicable', 1), ('yes', 2), ('no', 3)),
+		'airFMSysHumState': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysInputAlarmAction': (('statusOnly', 1), ('minor', 2), ('major', 3), ('remoteRunStop', 4), ('nonessStop', 5), ('immShutdown', 6)),
+		'airFMSysInputNormalState': (('open', 1), ('closed', 2)),
+		'airFMSysInputStatus': (('open', 1), ('closed', 2)),
+		'airFMSysNumModules': (('notApplicable', 1), ('one', 2), ('two', 3), ('three', 4)),
+		'airFMSysNumPCIOMs': (('notApplicable', 1), ('one', 2), ('two', 3), ('three', 4), ('four', 5)),
+		'airFMSysNumber': (('notApplicable', 1), ('one', 2), ('two', 3), ('three', 4), ('four', 5)),
+		'airFMSysOutputNormalState': (('open', 1), ('closed', 2)),
+		'airFMSysOutputStatus': (('open', 1), ('closed', 2)),
+		'airFMSysPresentRole': (('notApplicable', 1), ('primary', 2), ('backup', 3)),
+		'airFMSysPresentStatus': (('notApplicable', 1), ('reserved1', 2), ('reserved2', 3), ('onLine', 4), ('idle', 5), ('loadShare', 6), ('failed', 7), ('offLine', 8)),
+		'airFMSysPrimaryControlSensor': (('notApplicable', 1), ('return', 2), ('remote', 3)),
+		'airFMSysRefrigType': (('notApplicable', 1), ('r22', 2), ('r407C', 3)),
+		'airFMSysReheatEssFunction': (('notApplicable', 1), ('yes', 2), ('no', 3)),
+		'airFMSysReheatPIDMethod': (('notApplicable', 1), ('p', 2), ('pi', 3), ('pid', 4)),
+		'airFMSysReheatState': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysRemoteSensorData': (('notApplicable', 1), ('average', 2), ('maximum', 3)),
+		'airFMSysResetFldSrvcDflts': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMSysResetRunHours': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMSysResetSysFailure': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMSysResetUserDflts': (('notApplicable', 1), ('noOperation', 2), ('reset', 3)),
+		'airFMSysSteamHotGasReheatDmd': (('notApplicable', 1), ('off', 2), ('on', 3)),
+		'airFMSysSteamHumDmd': (('notApplicable', 1), ('off', 2), ('on', 3)),
+		'airFMSysSuctPresCompensation': (('notApplicable', 1), ('disabled', 2), ('enabled', 3)),
+		'airFMSysTempCtrlMethod': (('notApplicable', 1), ('avgReturn', 2), ('avgRemote', 3), ('maxRemote', 4)),
+		'airIRG2GroupConfigActiveFlowControllerLampTest': (('off', 1), ('on', 2)),
+		'airIRG2GroupConfigCapacityControlType': (('discrete', 1), ('proportional', 2)),
+		'airIRG2GroupConfigConfigurationType': (('racs', 1), ('spot', 2), ('in-row', 3), ('hacs', 4), ('cacs', 5)),
+		'airIRG2GroupConfigCoolPIDReset': (('readBack', 1), ('reset', 2)),
+		'airIRG2GroupConfigFanSpeedControl': (('automatic', 1), ('manual', 2)),
+		'airIRG2GroupConfigLoadAssistEnable': (('disable', 1), ('enable', 2)),
+		'airIRG2GroupConfigRuntimeBalancingEnable': (('disable', 1), ('enable', 2)),
+		'airIRG2GroupSetpointsActiveFlowControlBias': (('positive', 1), ('slightlyPositive', 2), ('zero', 3), ('slightlyNegative', 4), ('negative', 5)),
+		'airIRG2GroupSetptsFanSpeedPreference': (('low', 1), ('med-low', 2), ('med', 3), ('med-high', 4), ('high', 5)),
+		'airIRG2GroupStatusActiveFlowControlStatus': (('under', 1), ('okay', 2), ('over', 3), ('notApplicable', 4)),
+		'airIRG2RDT2ConfigIdleOnLeakDetect': (('yes', 1), ('no', 2)),
+		'airIRG2RDT2ConfigInputNormalState': (('open', 1), ('closed', 2)),
+		'airIRG2RDT2ConfigOHEInputNormalState': (('open', 1), ('closed', 2)),
+		'airIRG2RDT2ConfigOutputNormalState': (('open', 1), ('closed', 2)),
+		'airIRG2RDT2ConfigOutputSource': (('anyAlarm', 1), ('criticalAlarm', 2)),
+		'airIRG2RDT2ConfigUnitIdleOnCoolFail': (('no', 1), ('yes', 2)),
+		'airIRG2RDT2ConfigUnitRoleOverride': (('automatic', 1), ('forcedOn', 2)),
+		'airIRG2RDT2ConfigUnitType': (('fluidCooled', 1), ('airCooled', 2)),
+		'airIRG2RDT2RunHoursFanPSPosition': (('upper', 1), ('lower', 2), ('left', 3), ('right', 4)),
+		'airIRG2RDT2ServiceIntervalsAirFilterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRG2RDT2StatusCompressor': (('off', 1), ('on', 2)),
+		'airIRG2RDT2StatusInputState': (('open', 1), ('closed', 2)),
+		'airIRG2RDT2StatusLeakSensor': (('no-leak', 1), ('leak', 2)),
+		'airIRG2RDT2StatusOHEInputState': (('open', 1), ('closed', 2)),
+		'airIRG2RDT2StatusOHEOutputState': (('open', 1), ('closed', 2)),
+		'airIRG2RDT2StatusOperateMode': (('standby', 1), ('on', 2), ('idle', 3), ('reserved', 4), ('service', 5)),
+		'airIRG2RDT2StatusOutputState': (('open', 1), ('closed', 2)),
+		'airIRG3CMConfigPowerSource': (('singleFeed', 1), ('dualFeed', 2)),
+		'airIRG3CMConfigRemoteOnStandby': (('standBy', 1), ('on', 2)),
+		'airIRG3CMConfigStopOnCoolFail': (('no', 1), ('yes', 2)),
+		'airIRG3CMServiceIntervalsAirFilterAlarm': (('disable', 1), ('enable', 2)),
+		'airIRG3CMStatusLocalDisplayOnOffEnabled': (('no', 1), ('yes', 2)),
+		'airIRG3CMStatusOperatingMode': (('standBy', 1), ('on', 2), ('idle', 3)),
+		'airIRG3CMStatusUnitType': (('unconfigured', 1), ('oa', 2), ('ra', 3)),
+		'airIRG3GroupConfigCapacityControlType': (('discrete', 1), ('proportional', 2)),
+		'airIRG3GroupConfigConfigurationType': (('racs', 1), ('spot', 2), ('in-row', 3), ('hacs', 4)),
+		'airIRG3GroupConfigCoolPIDReset': (('readBack', 1), ('reset', 2)),
+		'airIRG3GroupConfigFanSpeedControl': (('automatic', 1), ('manual', 2)),
+		'airIRG3GroupConfigLoadAssistEnable': (('disable', 1), ('enable', 2)),
+		'airIRG3GroupConfigRuntimeBalancingEnable': (('disable', 1), ('enable', 2)),
+		'airIRG3GroupSetpointsAirFlowControl': (('automatic', 1), ('manual', 2)),
+		'airIRG3GroupSetpointsFanSpeedPreference': (('low', 1), ('med-low', 2), ('med', 3), ('med-high', 4), ('high', 5)),
+		'airIRG3RDUConfigByPassValveEnabled': (('no', 1), ('yes', 2)),
+		'airIRG3RDUConfigCalibrateRefrigerantLeakDetector': (('no', 1), ('yes', 2)),
+		'airIRG3RDUConfigInputNormalState': (('open', 1), ('closed', 2)),
+		'airIRG3RDUConfigOnReadyStandby': (('standby', 1), ('ready', 2), ('on', 3)),
+		'airIRG3RDUConfigOutputNormalState': (('open', 1), ('closed', 2)),
+		'airIRG3RDUConfigOutputSource': (('anyalarm', 1), ('onlycriticalalarms', 2)),
+		'airIRG3RDUConfigPowerSource': (('singleFeed', 1), ('dualFeed', 2)),
+		'airIRG3RDUConfigRefrigerantLeakDetectorEnabled': (('no', 1), ('yes', 2)),
+		'airIRG3RDUConfigStopOnLeakDetect': (('no', 1), ('yes', 2)),
+		'airIRG3RDUServiceIntervalsAirFilterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRG3RDUStatusInputState': (('open', 1), ('closed', 2)),
+		'airIRG3RDUStatusLeadPump': (('pump1', 1), ('pump2', 2)),
+		'airIRG3RDUStatusOnReadyStandby': (('standby', 1), ('ready', 2), ('on', 3)),
+		'airIRG3RDUStatusOperatingMode': (('standby', 1), ('ready', 2), ('on', 3), ('stop', 4), ('maintenancemode', 5)),
+		'airIRG3RDUStatusOutputState': (('open', 1), ('closed', 2)),
+		'airIRG3RDUStatusPowerSource': (('singleFeed', 1), ('dualFeed', 2)),
+		'airIRG3RDUStatusRefrigerantLeakDetector': (('suspended', 1), ('calibrating', 2), ('operating', 3), ('disabled', 4)),
+		'airIRG3RDUStatusStopOnLeakDetect': (('no', 1), ('yes', 2)),
+		'airIRRCGroupConfigActiveFlowControllerLampTest': (('off', 1), ('on', 2)),
+		'airIRRCGroupConfigConfigurationType': (('racs', 1), ('hacs', 2), ('in-row', 3), ('cacs', 4)),
+		'airIRRCGroupSetpointsActiveFlowControlBias': (('positive', 1), ('slightlyPositive', 2), ('zero', 3), ('slightlyNegative', 4), ('negative', 5)),
+		'airIRRCGroupSetpointsFanSpeedControl': (('automatic', 1), ('manual', 2)),
+		'airIRRCGroupSetpointsFanSpeedPreference': (('low', 1), ('med-low', 2), ('med', 3), ('med-high', 4), ('high', 5)),
+		'airIRRCGroupStatusActiveFlowControlStatus': (('under', 1), ('okay', 2), ('over', 3), ('notApplicable', 4)),
+		'airIRRCUnitConfigCoolCapacity': (('automatic', 1), ('maximum', 2)),
+		'airIRRCUnitConfigIdleOnCoolFail': (('yes', 1), ('no', 2)),
+		'airIRRCUnitConfigIdleOnLeakDetect': (('yes', 1), ('no', 2)),
+		'airIRRCUnitConfigInputNormalState': (('open', 1), ('closed', 2)),
+		'airIRRCUnitConfigOutputNormalState': (('open', 1), ('closed', 2)),
+		'airIRRCUnitConfigOutputSource': (('anyAlarm', 1), ('criticalAlarm', 2)),
+		'airIRRCUnitConfigPowerSource': (('sourceA', 1), ('sourceB', 2), ('sourceAandB', 3)),
+		'airIRRCUnitServiceIntervalsAirFilterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRCUnitStatusActivePowerSource': (('sourceA', 1), ('sourceB', 2)),
+		'airIRRCUnitStatusInputState': (('open', 1), ('closed', 2)),
+		'airIRRCUnitStatusOperateMode': (('standby', 1), ('on', 2), ('idle', 3)),
+		'airIRRCUnitStatusOutputState': (('open', 1), ('closed', 2)),
+		'airIRRP100GroupConfigActiveFlowControllerLampTest': (('off', 1), ('on', 2)),
+		'airIRRP100GroupConfigConfigurationType': (('racs', 1), ('hacs', 2), ('in-row', 3), ('cacs', 4)),
+		'airIRRP100GroupConfigLoadAssistEnable': (('disable', 1), ('enable', 2)),
+		'airIRRP100GroupConfigRuntimeBalancingEnable': (('disable', 1), ('enable', 2)),
+		'airIRRP100GroupSetpointsActiveFlowControlBias': (('positive', 1), ('slightlyPositive', 2), ('zero', 3), ('slightlyNegative', 4), ('negative', 5)),
+		'airIRRP100GroupSetpointsFanSpeedControl': (('automatic', 1), ('manual', 2)),
+		'airIRRP100GroupSetpointsFanSpeedPreference': (('low', 1), ('med-low', 2), ('med', 3), ('med-high', 4), ('high', 5)),
+		'airIRRP100GroupStatusActiveFlowControlStatus': (('under', 1), ('okay', 2), ('over', 3), ('notApplicable', 4)),
+		'airIRRP100UnitConfigCoolCapacity': (('automatic', 1), ('maximum', 2)),
+		'airIRRP100UnitConfigDehumidifyEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitConfigHeatAssistEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitConfigHumidifierControl': (('auto', 1), ('drainOff', 2)),
+		'airIRRP100UnitConfigHumidifyEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitConfigIdleOnCoolFail': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitConfigIdleOnLeakDetect': (('yes', 1), ('no', 2)),
+		'airIRRP100UnitConfigInputNormalState': (('open', 1), ('closed', 2)),
+		'airIRRP100UnitConfigOutputNormalState': (('open', 1), ('closed', 2)),
+		'airIRRP100UnitConfigOutputSource': (('anyAlarm', 1), ('criticalAlarm', 2)),
+		'airIRRP100UnitConfigPowerSourceConfig': (('single', 1), ('dual', 2)),
+		'airIRRP100UnitConfigReheatEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitConfigSecondaryPowerFeedCapability': (('full', 1), ('reduced', 2)),
+		'airIRRP100UnitConfigUnitRoleOverride': (('automatic', 1), ('forcedOn', 2)),
+		'airIRRP100UnitServiceIntervalAirFilterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitServiceIntervalCompressorAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitServiceIntervalCondensatePumpAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitServiceIntervalFansAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitServiceIntervalHeaterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitServiceIntervalHumidifierAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP100UnitStatusInputState': (('open', 1), ('closed', 2)),
+		'airIRRP100UnitStatusLeakSensor': (('no-leak', 1), ('leak', 2)),
+		'airIRRP100UnitStatusOperateMode': (('standby', 1), ('on', 2), ('idle', 3), ('prestart', 4), ('service', 5), ('backup', 6), ('assist', 7)),
+		'airIRRP100UnitStatusOutputState': (('open', 1), ('closed', 2)),
+		'airIRRP500GroupConfigActiveFlowControllerLampTest': (('off', 1), ('on', 2)),
+		'airIRRP500GroupConfigConfigurationType': (('racs', 1), ('hacs', 2), ('in-row', 3), ('cacs', 4)),
+		'airIRRP500GroupConfigLoadAssistEnable': (('disable', 1), ('enable', 2)),
+		'airIRRP500GroupConfigRuntimeBalancingEnable': (('disable', 1), ('enable', 2)),
+		'airIRRP500GroupSetpointsActiveFlowControlBias': (('positive', 1), ('slightlyPositive', 2), ('zero', 3), ('slightlyNegative', 4), ('negative', 5)),
+		'airIRRP500GroupSetpointsFanSpeedControl': (('automatic', 1), ('manual', 2)),
+		'airIRRP500GroupSetpointsFanSpeedPreference': (('low', 1), ('med-low', 2), ('med', 3), ('med-high', 4), ('high', 5)),
+		'airIRRP500GroupStatusActiveFlowControlStatus': (('under', 1), ('okay', 2), ('over', 3), ('notApplicable', 4)),
+		'airIRRP500UnitConfigCoolCapacity': (('automatic', 1), ('maximum', 2)),
+		'airIRRP500UnitConfigDehumidifyEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitConfigHeatAssistEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitConfigHumidifierControl': (('auto', 1), ('drainOff', 2)),
+		'airIRRP500UnitConfigHumidifyEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitConfigIdleOnCoolFail': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitConfigIdleOnLeakDetect': (('yes', 1), ('no', 2)),
+		'airIRRP500UnitConfigInputNormalState': (('open', 1), ('closed', 2)),
+		'airIRRP500UnitConfigOutputNormalState': (('open', 1), ('closed', 2)),
+		'airIRRP500UnitConfigOutputSource': (('anyAlarm', 1), ('criticalAlarm', 2)),
+		'airIRRP500UnitConfigPowerSourceConfig': (('single', 1), ('dual', 2)),
+		'airIRRP500UnitConfigReheatEnable': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitConfigSecondaryPowerFeedCapability': (('full', 1), ('reduced', 2)),
+		'airIRRP500UnitConfigUnitRoleOverride': (('automatic', 1), ('forcedOn', 2)),
+		'airIRRP500UnitServiceIntervalAirFilterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitServiceIntervalCondensatePumpAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitServiceIntervalFansAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitServiceIntervalHeaterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitServiceIntervalHumidifierAlarm': (('enable', 1), ('disable', 2)),
+		'airIRRP500UnitStatusActivePowerSource': (('sourceA', 1), ('sourceB', 2)),
+		'airIRRP500UnitStatusInputState': (('open', 1), ('closed', 2)),
+		'airIRRP500UnitStatusLeakSensor': (('no-leak', 1), ('leak', 2)),
+		'airIRRP500UnitStatusOperateMode': (('standby', 1), ('on', 2), ('idle', 3), ('prestart', 4), ('backup', 5), ('assist', 6)),
+		'airIRRP500UnitStatusOutputState': (('open', 1), ('closed', 2)),
+		'airIRSCGroupConfigActiveFlowControllerLampTest': (('off', 1), ('on', 2)),
+		'airIRSCGroupConfigCapacityControlType': (('discrete', 1), ('proportional', 2)),
+		'airIRSCGroupConfigConfigurationType': (('racs', 1), ('spot', 2), ('in-row', 3)),
+		'airIRSCGroupConfigFanSpeedControl': (('automatic', 1), ('manual', 2)),
+		'airIRSCGroupSetpointsActiveFlowControlBias': (('positive', 1), ('slightlyPositive', 2), ('zero', 3), ('slightlyNegative', 4), ('negative', 5)),
+		'airIRSCGroupSetptsFanSpeedPreference': (('low', 1), ('med-low', 2), ('med', 3), ('med-high', 4), ('high', 5)),
+		'airIRSCGroupStatusActiveFlowControlStatus': (('under', 1), ('okay', 2), ('over', 3), ('notApplicable', 4)),
+		'airIRSCUnitConfigCapacityControlType': (('discrete', 1), ('proportional', 2)),
+		'airIRSCUnitConfigConfigurationType': (('racs', 1), ('spot', 2), ('in-row', 3)),
+		'airIRSCUnitConfigIdleOnLeakDetect': (('yes', 1), ('no', 2)),
+		'airIRSCUnitConfigInputNormalState': (('open', 1), ('closed', 2)),
+		'airIRSCUnitConfigOpControl': (('standby', 1), ('on', 2)),
+		'airIRSCUnitConfigOutputNormalState': (('open', 1), ('closed', 2)),
+		'airIRSCUnitConfigOutputSource': (('anyAlarm', 1), ('criticalAlarm', 2)),
+		'airIRSCUnitServiceIntervalsAirFilterAlarm': (('enable', 1), ('disable', 2)),
+		'airIRSCUnitSetptsFanSpeedPreference': (('low', 1), ('med-low', 2), ('med', 3), ('med-high', 4), ('high', 5)),
+		'airIRSCUnitStatusCompressor': (('off', 1), ('on', 2)),
+		'airIRSCUnitStatusInputState': (('open', 1), ('closed', 2)),
+		'airIRSCUnitStatusLeakSensor': (('no-leak', 1), ('leak', 2)),
+		'airIRSCUnitStatusOperateMode': (('standby', 1), ('on', 2), ('idle', 3)),
+		'airIRSCUnitStatusOutputState': (('open', 1), ('closed', 2)),
+		'airIRmPmAuxiliaryAlarm1': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm10': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm2': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm3': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm4': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm5': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm6': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm7': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm8': (('ok', 1), ('alarm', 2)),
+		'airIRmPmAuxiliaryAlarm9': (('ok', 1), ('alarm', 2)),
+		'airIRmPmCmp1ManOperationActive': (('automatic', 1), ('manual', 2)),
+		'airIRmPmCmp1ManOperationState': (('off', 1), ('on', 2)),
+		'airIRmPmCmp1Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmCmp2ManOperationActive': (('automatic', 1), ('manual', 2)),
+		'airIRmPmCmp2ManOperationState': (('off', 1), ('on', 2)),
+		'airIRmPmCmp2Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmCommonAlarm': (('ok', 1), ('alarm', 2)),
+		'airIRmPmCompressor1Alarm': (('ok', 1), ('alarm', 2)),
+		'airIRmPmCompressor1Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmCompressor1LowPressure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmCompressor2Alarm': (('ok', 1), ('alarm', 2)),
+		'airIRmPmCompressor2Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmCompressor2LowPressure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmControllerType': (('unknown', 1), ('c7000PT', 10), ('c5MSC', 11), ('c7000PT2', 12), ('c4000', 2), ('c1001', 3), ('c1002', 4), ('c5000', 5), ('c6000', 6), ('c1010', 7), ('c7000IOC', 8), ('c7000AT', 9)),
+		'airIRmPmCoolingPriority': (('ge', 1), ('cw', 2), ('dx', 3)),
+		'airIRmPmDayNightMode': (('day', 1), ('night', 2)),
+		'airIRmPmDehumidificManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmDehumidificManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmDehumidificRunning': (('off', 1), ('on', 2)),
+		'airIRmPmDrycooler1Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmDrycooler1ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler1ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler1Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler2Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmDrycooler2ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler2ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler2Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler3Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmDrycooler3ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler3ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler3Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler4Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmDrycooler4ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler4ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmDrycooler4Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmEEV1PressureSensorError': (('ok', 1), ('alarm', 2)),
+		'airIRmPmEEV1StepperMotorError': (('ok', 1), ('alarm', 2)),
+		'airIRmPmEEV1TemperatureSensorError': (('ok', 1), ('alarm', 2)),
+		'airIRmPmEEV2PressureSensorError': (('ok', 1), ('alarm', 2)),
+		'airIRmPmEEV2StepperMotorError': (('ok', 1), ('alarm', 2)),
+		'airIRmPmEEV2TemperatureSensorError': (('ok', 1), ('alarm', 2)),
+		'airIRmPmEheating1ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating1ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating1Running': (('off', 1), ('on', 2)),
+		'airIRmPmEheating1Type': (('direct', 1), ('pwm', 2)),
+		'airIRmPmEheating2ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating2ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating2Running': (('off', 1), ('on', 2)),
+		'airIRmPmEheating2Type': (('direct', 1), ('pwm', 2)),
+		'airIRmPmEheating3ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating3ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating3Running': (('off', 1), ('on', 2)),
+		'airIRmPmEheating3Type': (('direct', 1), ('pwm', 2)),
+		'airIRmPmEheating4ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating4ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmEheating4Running': (('off', 1), ('on', 2)),
+		'airIRmPmEheating4Type': (('direct', 1), ('pwm', 2)),
+		'airIRmPmErrorOnBus': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFan1Alarm': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFan1Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFan1ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan1ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan1Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan1Type': (('direct', 1), ('proportional', 2)),
+		'airIRmPmFan2Alarm': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFan2Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFan2ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan2ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan2Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan2Type': (('direct', 1), ('proportional', 2)),
+		'airIRmPmFan3Alarm': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFan3Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFan3ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan3ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan3Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmFan3Type': (('direct', 1), ('proportional', 2)),
+		'airIRmPmFilter1Clogged': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFilter2Clogged': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFilter3Clogged': (('ok', 1), ('alarm', 2)),
+		'airIRmPmFireSmokeDetector': (('ok', 1), ('alarm', 2)),
+		'airIRmPmGeneralError': (('ok', 1), ('alarm', 2)),
+		'airIRmPmGlobalZoneDataEmergencyOpMode': (('inactive', 1), ('active', 2)),
+		'airIRmPmGvalveManOperationEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmHotGasHeatingAlarm': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHotgasHeatRunning': (('off', 1), ('on', 2)),
+		'airIRmPmHumidifier1Alarm20us': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier1Alarm5us': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier1Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier1ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmHumidifier1ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmHumidifier1Running': (('off', 1), ('on', 2)),
+		'airIRmPmHumidifier1Type': (('direct', 1), ('proportional', 2)),
+		'airIRmPmHumidifier2Alarm20us': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier2Alarm5us': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier2Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier2ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmHumidifier2ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmHumidifier2Running': (('off', 1), ('on', 2)),
+		'airIRmPmHumidifier2Type': (('direct', 1), ('proportional', 2)),
+		'airIRmPmHumidifier3Alarm20us': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier3Alarm5us': (('ok', 1), ('alarm', 2)),
+		'airIRmPmHumidifier3Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmLocalStop': (('maybeOn', 1), ('unitOff', 2)),
+		'airIRmPmLocalUPS': (('inactive', 1), ('active', 2)),
+		'airIRmPmLouver1ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmLouver1ManOpPosition': (('closed', 1), ('open', 2)),
+		'airIRmPmLouver1Position': (('closed', 1), ('open', 2)),
+		'airIRmPmLouver2ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmLouver2ManOpPosition': (('closed', 1), ('open', 2)),
+		'airIRmPmLouver2Position': (('closed', 1), ('open', 2)),
+		'airIRmPmLouver3ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmLouver3ManOpPosition': (('closed', 1), ('open', 2)),
+		'airIRmPmLouver3Position': (('closed', 1), ('open', 2)),
+		'airIRmPmMaintenance': (('notNecessary', 1), ('necessary', 2)),
+		'airIRmPmMyZoneCWEnergySaveMode': (('inactive', 1), ('active', 2)),
+		'airIRmPmPCStop': (('maybeOn', 1), ('unitOff', 2)),
+		'airIRmPmPWWHeatingManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmPWWHeatingManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmPWWHeatingRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmPWWHeatingType': (('direct', 1), ('undefined', 2)),
+		'airIRmPmPhaseFailure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmPump1Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmPump1ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump1ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump1Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump2Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmPump2ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump2ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump2Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump3Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmPump3ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump3ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump3Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump4Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmPump4ManOpEnable': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump4ManOpRunning': (('inactive', 1), ('active', 2)),
+		'airIRmPmPump4Running': (('inactive', 1), ('active', 2)),
+		'airIRmPmReheat1Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmReheat2Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmReheat3Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmReheat4Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmRemoteStop': (('maybeOn', 1), ('unitOff', 2)),
+		'airIRmPmRemoteUPS': (('off', 1), ('on', 2)),
+		'airIRmPmResetAllAlarms': (('doNothing', 1), ('reset', 2)),
+		'airIRmPmReturnAirHumidityTooHigh': (('ok', 1), ('alarm', 2)),
+		'airIRmPmReturnAirHumidityTooLow': (('ok', 1), ('alarm', 2)),
+		'airIRmPmReturnAirTemperatureTooHigh': (('ok', 1), ('alarm', 2)),
+		'airIRmPmReturnAirTemperatureTooLow': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor10Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor10Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor11Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor11Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor12Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor12Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor13Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor13Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor14Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor14Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor15Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor15Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor16Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor16Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor17Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor17Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor18Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor18Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor19Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor19Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor1Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor1Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor20Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor20Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor21Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor21Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor2Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor2Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor3Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor3Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor4Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor4Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor5Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor5Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor6Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor6Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor7Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor7Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor8Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor8Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor9Defect': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSensor9Failure': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSeqStop': (('maybeOn', 1), ('unitOff', 2)),
+		'airIRmPmSupplyAirHumidityTooHigh': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSupplyAirHumidityTooLow': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSupplyAirTemperatureTooHigh': (('ok', 1), ('alarm', 2)),
+		'airIRmPmSupplyAirTemperatureTooLow': (('ok', 1), ('alarm', 2)),
+		'airIRmPmTimerStop': (('maybeOn', 1), ('unitOff', 2)),
+		'airIRmPmUnitControlType': (('room', 1), ('supply', 2), ('room-SupplyLimit', 3), ('supply-RoomLimit', 4)),
+		'airIRmPmUnitOnOff': (('off', 1), ('on', 2)),
+		'airIRmPmUnitTemperatureScale': (('celsius', 1), ('fahrenheit', 2)),
+		'airIRmPmUnitType': (('mc', 1), ('cw2', 10), ('dx', 2), ('unknown', 256), ('cw', 3), ('ch', 4), ('ecoCool', 5), ('msc', 6), ('ge1', 7), ('ge2', 8), ('dualFluid', 9)),
+		'airIRmPmUnitWinterMode': (('summer', 1), ('winter', 2)),
+		'airIRmPmWaterDetector': (('ok', 1), ('alarm', 2)),
+		'airIRmPmWaterTemperatureTooHigh': (('ok', 1), ('alarm', 2)),
+		'airIRmPmWaterTemperatureTooLow': (('ok', 1), ('alarm', 2)),
+		'airPABlowerSpeed': (('speedLOW', 1), ('speedHIGH', 2)),
+		'airPACompressor': (('statusON', 1), ('statusOFF', 2)),
+		'airPACondensatePump': (('statusON', 1), ('statusOFF', 2)),
+		'airPACondenserFan': (('statusON', 1), ('statusOFF', 2)),
+		'airPAOperatingMode': (('modeOFF', 1), ('modeVENTING', 2), ('modeCOOLING', 3)),
+		'airPASystemPower': (('powerON', 1), ('powerOFF', 2)),
+	},
+}
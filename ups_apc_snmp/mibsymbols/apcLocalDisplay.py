@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'apcLocalDisplay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21),
+		'apcLocalDisplayConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 2),
+		'apcLocalDisplayConfigAlarmBeeper': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 2, 1),
+		'apcLocalDisplayConfigBeeperVolume': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 2, 2),
+		'apcLocalDisplayConfigCheckLogIndicator': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 2, 3),
+		'apcLocalDisplayConfigContrast': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 2, 5),
+		'apcLocalDisplayConfigKeyClick': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 2, 4),
+		'apcLocalDisplayIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 1),
+		'apcLocalDisplayIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 1, 5),
+		'apcLocalDisplayIdentDisplayType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 1, 1),
+		'apcLocalDisplayIdentFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 1, 3),
+		'apcLocalDisplayIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 1, 2),
+		'apcLocalDisplayIdentOptions': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 1, 4),
+		'apcLocalDisplayIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 21, 1, 6),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'apcLocalDisplayConfigAlarmBeeper': (('beeperDisabled', 1), ('beeperEnabled', 2)),
+		'apcLocalDisplayConfigBeeperVolume': (('beeperDisabled', 1), ('beeperLow', 2), ('beeperMedium', 3), ('beeperHigh', 4)),
+		'apcLocalDisplayConfigCheckLogIndicator': (('checklogNotPresent', 1), ('checklogDisabled', 2), ('checklogInformational', 3), ('checklogWarning', 4), ('checklogCritical', 5)),
+		'apcLocalDisplayConfigContrast': (('contrast1', 1), ('contrast2', 2), ('contrast3', 3), ('contrast4', 4), ('contrast5', 5), ('contrast6', 6), ('contrast7', 7), ('contrast8', 8)),
+		'apcLocalDisplayConfigKeyClick': (('keyclickDisabled', 1), ('keyclickEnabled', 2)),
+		'apcLocalDisplayIdentDisplayType': (('noDisplayFound', 1), ('powerviewRM', 2), ('powerviewWW', 3)),
+	},
+}
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'atsCalibration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2),
+		'atsCalibrationInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1),
+		'atsCalibrationInputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1, 3, 1),
+		'atsCalibrationInputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1, 3),
+		'atsCalibrationInputPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1, 3, 1, 2),
+		'atsCalibrationInputTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1, 3, 1, 1),
+		'atsCalibrationNumInputPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1, 2),
+		'atsCalibrationNumInputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1, 1),
+		'atsCalibrationNumOutputPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3, 2),
+		'atsCalibrationNumOutputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3, 1),
+		'atsCalibrationOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3),
+		'atsCalibrationOutputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3, 3, 1),
+		'atsCalibrationOutputPhasesTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3, 3, 1, 2),
+		'atsCalibrationOutputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3, 3),
+		'atsCalibrationOutputTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3, 3, 1, 1),
+		'atsCalibrationPowerSupply': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 2),
+		'atsCalibrationPowerSupplyVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 2, 2, 1, 2),
+		'atsCalibrationPowerSupplyVoltageEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 2, 2, 1),
+		'atsCalibrationPowerSupplyVoltageTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 2, 2),
+		'atsCalibrationPowerSupplyVoltageTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 2, 2, 1, 1),
+		'atsCalibrationPowerSupplyVoltages': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 2, 1),
+		'atsConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4),
+		'atsConfigBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 14, 1, 2),
+		'atsConfigBankEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 14, 1),
+		'atsConfigBankLowLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 14, 1, 3),
+		'atsConfigBankNearOverLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 14, 1, 4),
+		'atsConfigBankOverLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 14, 1, 5),
+		'atsConfigBankTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 14),
+		'atsConfigBankTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 14, 1, 1),
+		'atsConfigBankTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 13),
+		'atsConfigCurrentLimit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 6),
+		'atsConfigFrequencyDeviation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 12),
+		'atsConfigFrontPanelLockout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 3),
+		'atsConfigLineVRMS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 8),
+		'atsConfigLineVRMSMediumLimit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 10),
+		'atsConfigLineVRMSNarrowLimit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 9),
+		'atsConfigLineVRMSWideLimit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 11),
+		'atsConfigPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 16, 1, 2),
+		'atsConfigPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 16, 1),
+		'atsConfigPhaseLowLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 16, 1, 3),
+		'atsConfigPhaseNearOverLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 16, 1, 4),
+		'atsConfigPhaseOverLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 16, 1, 5),
+		'atsConfigPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 16),
+		'atsConfigPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 16, 1, 1),
+		'atsConfigPhaseTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 15),
+		'atsConfigPreferredSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 2),
+		'atsConfigProductName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 1),
+		'atsConfigResetValues': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 7),
+		'atsConfigTransferVoltageRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 5),
+		'atsConfigVoltageSensitivity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 4, 4),
+		'atsControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 3),
+		'atsControlClearAllAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 3, 2),
+		'atsControlResetATS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 3, 1),
+		'atsIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1),
+		'atsIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 4),
+		'atsIdentDeviceRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 9),
+		'atsIdentFirmwareDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 3),
+		'atsIdentFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 2),
+		'atsIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 1),
+		'atsIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 5),
+		'atsIdentNominalLineFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 8),
+		'atsIdentNominalLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 7),
+		'atsIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 1, 6),
+		'atsInputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 6),
+		'atsInputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2, 1),
+		'atsInputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2, 1, 4),
+		'atsInputMaxCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 7),
+		'atsInputMaxPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 10),
+		'atsInputMaxVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 4),
+		'atsInputMinCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 8),
+		'atsInputMinPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 11),
+		'atsInputMinVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 5),
+		'atsInputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2, 1, 6),
+		'atsInputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1),
+		'atsInputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 2),
+		'atsInputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3),
+		'atsInputPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 1),
+		'atsInputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 9),
+		'atsInputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2),
+		'atsInputTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2, 1, 1),
+		'atsInputType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2, 1, 5),
+		'atsInputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 3, 1, 3),
+		'atsInputVoltageOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2, 1, 3),
+		'atsLineVoltageCalibrationFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 1, 3, 1, 3),
+		'atsNumInputPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 2, 1, 2),
+		'atsNumInputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3, 1),
+		'atsNumOutputPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 2, 1, 2),
+		'atsNumOutputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 1),
+		'atsOutputBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 3),
+		'atsOutputBankCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 4),
+		'atsOutputBankEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1),
+		'atsOutputBankLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 9),
+		'atsOutputBankMaxCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 7),
+		'atsOutputBankMaxLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 10),
+		'atsOutputBankMaxPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 13),
+		'atsOutputBankMaxPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 19),
+		'atsOutputBankMaxPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 16),
+		'atsOutputBankMinCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 8),
+		'atsOutputBankMinLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 11),
+		'atsOutputBankMinPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 14),
+		'atsOutputBankMinPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 20),
+		'atsOutputBankMinPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 17),
+		'atsOutputBankOutputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 6),
+		'atsOutputBankPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 12),
+		'atsOutputBankPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 18),
+		'atsOutputBankPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 15),
+		'atsOutputBankState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 5),
+		'atsOutputBankTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5),
+		'atsOutputBankTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 1),
+		'atsOutputBankTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 4),
+		'atsOutputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 4),
+		'atsOutputCurrentCalibrationFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 3, 3, 1, 3),
+		'atsOutputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 2, 1),
+		'atsOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 2, 1, 4),
+		'atsOutputLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 7),
+		'atsOutputMaxCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 5),
+		'atsOutputMaxLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 8),
+		'atsOutputMaxPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 11),
+		'atsOutputMaxPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 17),
+		'atsOutputMaxPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 14),
+		'atsOutputMinCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 6),
+		'atsOutputMinLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 9),
+		'atsOutputMinPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 12),
+		'atsOutputMinPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 18),
+		'atsOutputMinPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 15),
+		'atsOutputPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 10),
+		'atsOutputPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 16),
+		'atsOutputPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 5, 1, 2),
+		'atsOutputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1),
+		'atsOutputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 2),
+		'atsOutputPhaseState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 19),
+		'atsOutputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3),
+		'atsOutputPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 1),
+		'atsOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 13),
+		'atsOutputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 2),
+		'atsOutputTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 2, 1, 1),
+		'atsOutputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 3, 1, 3),
+		'atsOutputVoltageOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4, 2, 1, 3),
+		'atsPowerSupplyVoltageCalibrationFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 2, 2, 2, 1, 3),
+		'atsStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5),
+		'atsStatus24VPowerSupply': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 6),
+		'atsStatus24VSourceBPowerSupply': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 7),
+		'atsStatus5VPowerSupply': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 5),
+		'atsStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 1),
+		'atsStatusDeviceStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1),
+		'atsStatusFrontPanel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 11),
+		'atsStatusHardwareStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 16),
+		'atsStatusInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 3),
+		'atsStatusMinus12VPowerSupply': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 9),
+		'atsStatusOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 4),
+		'atsStatusOverCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 4),
+		'atsStatusPhaseSyncStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 14),
+		'atsStatusPlus12VPowerSupply': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 8),
+		'atsStatusRedundancyState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 3),
+		'atsStatusResetMaxMinValues': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 2, 1),
+		'atsStatusResetValues': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 2),
+		'atsStatusSelectedSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 2),
+		'atsStatusSourceAStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 12),
+		'atsStatusSourceBStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 13),
+		'atsStatusSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 10),
+		'atsStatusVoltageOutStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8, 5, 1, 15),
+		'automaticTransferSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 8),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'atsCalibrationOutputPhasesTableIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3), ('neutral', 4)),
+		'atsCalibrationPowerSupplyVoltage': (('powerSupply24V', 1), ('powerSupply12V', 2), ('powerSupply', 3), ('powerSupply24VSourceB', 4), ('powerSupplyMinus12V', 5)),
+		'atsConfigBank': (('total', 1), ('bank1', 2), ('bank2', 3)),
+		'atsConfigFrequencyDeviation': (('one', 1), ('two', 2), ('three', 3)),
+		'atsConfigFrontPanelLockout': (('disableFrontPanel', 1), ('enableFrontPanel', 2)),
+		'atsConfigPhase': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'atsConfigPreferredSource': (('sourceA', 1), ('sourceB', 2), ('none', 3)),
+		'atsConfigResetValues': (('none', 1), ('reset', 2)),
+		'atsConfigTransferVoltageRange': (('wide', 1), ('medium', 2), ('narrow', 3)),
+		'atsConfigVoltageSensitivity': (('high', 1), ('low', 2)),
+		'atsControlClearAllAlarms': (('none', 1), ('clear', 2)),
+		'atsControlResetATS': (('none', 1), ('reset', 2)),
+		'atsInputType': (('unknown', 1), ('main', 2), ('bypass', 3)),
+		'atsInputVoltageOrientation': (('unknown', 1), ('singlePhase', 2), ('splitPhase', 3), ('threePhasePhaseToNeutral', 4), ('threePhasePhaseToPhase', 5)),
+		'atsOutputBank': (('total', 1), ('bank1', 2), ('bank2', 3)),
+		'atsOutputBankState': (('normal', 1), ('lowload', 2), ('nearoverload', 3), ('overload', 4)),
+		'atsOutputPhase': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'atsOutputPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3), ('neutral', 4)),
+		'atsOutputPhaseState': (('normal', 1), ('lowload', 2), ('nearoverload', 3), ('overload', 4)),
+		'atsOutputVoltageOrientation': (('unknown', 1), ('singlePhase', 2), ('splitPhase', 3), ('threePhasePhaseToNeutral', 4), ('threePhasePhaseToPhase', 5)),
+		'atsStatus24VPowerSupply': (('atsPowerSupplyFailure', 1), ('atsPowerSupplyOK', 2)),
+		'atsStatus24VSourceBPowerSupply': (('atsPowerSupplyFailure', 1), ('atsPowerSupplyOK', 2)),
+		'atsStatus5VPowerSupply': (('atsPowerSupplyFailure', 1), ('atsPowerSupplyOK', 2)),
+		'atsStatusCommStatus': (('atsNeverDiscovered', 1), ('atsCommEstablished', 2), ('atsCommLost', 3)),
+		'atsStatusFrontPanel': (('locked', 1), ('unlocked', 2)),
+		'atsStatusHardwareStatus': (('fail', 1), ('ok', 2)),
+		'atsStatusMinus12VPowerSupply': (('atsPowerSupplyFailure', 1), ('atsPowerSupplyOK', 2)),
+		'atsStatusOverCurrentState': (('atsOverCurrent', 1), ('atsCurrentOK', 2)),
+		'atsStatusPhaseSyncStatus': (('inSync', 1), ('outOfSync', 2)),
+		'atsStatusPlus12VPowerSupply': (('atsPowerSupplyFailure', 1), ('atsPowerSupplyOK', 2)),
+		'atsStatusRedundancyState': (('atsRedundancyLost', 1), ('atsFullyRedundant', 2)),
+		'atsStatusResetMaxMinValues': (('none', 1), ('reset', 2)),
+		'atsStatusSelectedSource': (('sourceA', 1), ('sourceB', 2)),
+		'atsStatusSourceAStatus': (('fail', 1), ('ok', 2)),
+		'atsStatusSourceBStatus': (('fail', 1), ('ok', 2)),
+		'atsStatusSwitchStatus': (('fail', 1), ('ok', 2)),
+		'atsStatusVoltageOutStatus': (('fail', 1), ('ok', 2)),
+	},
+}
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'battMan': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16),
+		'battManACCurrentZeroCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4, 2, 1, 3),
+		'battManAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 7),
+		'battManAlarmBatteries': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 7, 2),
+		'battManAlarmCharger': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 7, 3),
+		'battManAlarmEnvironment': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 7, 4),
+		'battManAlarmManagementController': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 7, 1),
+		'battManBatteryCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5),
+		'battManBatteryStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10),
+		'battManBatteryVoltageSpanCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3, 2, 1, 4),
+		'battManBatteryVoltageZeroCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3, 2, 1, 3),
+		'battManConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6),
+		'battManConfigApplication': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 1),
+		'battManConfigAutoAnnunciatorReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 19),
+		'battManConfigBatteriesperString': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 5),
+		'battManConfigBatteryAHCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 3),
+		'battManConfigBatteryChemistry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 2),
+		'battManConfigCellsperBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 6),
+		'battManConfigDischargeVoltageAlarmLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 18),
+		'battManConfigMaxAmbientTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 12),
+		'battManConfigMaxAmbientTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 11),
+		'battManConfigMaxCellVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 8),
+		'battManConfigMaxCurrentAcceptanceDeviation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 16),
+		'battManConfigMaxPilotTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 10),
+		'battManConfigMaxPilotTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 9),
+		'battManConfigMaxRippleCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 15),
+		'battManConfigMinAmbientTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 14),
+		'battManConfigMinAmbientTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 13),
+		'battManConfigMinCellVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 7),
+		'battManConfigMonitorWireLength': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 17),
+		'battManConfigNumberOfBoosts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 22),
+		'battManConfigNumberofStrings': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 4),
+		'battManConfigOhmicTestWaitTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 21),
+		'battManConfigSuspendCellVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 6, 20),
+		'battManControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 12),
+		'battManDCCurrentZeroCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4, 2, 1, 2),
+		'battManIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 1),
+		'battManIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 1, 4),
+		'battManIdentFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 1, 3),
+		'battManIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 1, 2),
+		'battManIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 1, 5),
+		'battManIdentProductName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 1, 1),
+		'battManIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 1, 6),
+		'battManInputContactAlarmDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2, 1, 6),
+		'battManInputContactAlarmState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2, 1, 3),
+		'battManInputContactEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2, 1),
+		'battManInputContactIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2, 1, 1),
+		'battManInputContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2, 1, 2),
+		'battManInputContactNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2, 1, 5),
+		'battManInputContactState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2, 1, 4),
+		'battManInputContactStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11),
+		'battManInputContactTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 2),
+		'battManInputContactTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 11, 1),
+		'battManOhmicValueCorrectionFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 2, 1),
+		'battManProbeRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4, 2, 1, 4),
+		'battManRemoteAnnunciatorReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 12, 1),
+		'battManResetChargeCurrentDeviationBenchmark': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 12, 2),
+		'battManResetDischargeCounters': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 12, 4),
+		'battManResetLowestDischargeVoltages': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 12, 3),
+		'battManString1BatteryCalibEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 2, 1),
+		'battManString1BatteryCalibIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 2, 1, 1),
+		'battManString1BatteryCalibTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 2),
+		'battManString1BatteryCalibTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 1),
+		'battManString1BatteryCellShorted': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 4),
+		'battManString1BatteryChemHighVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 12),
+		'battManString1BatteryChemLowVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 13),
+		'battManString1BatteryDryout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 9),
+		'battManString1BatteryEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1),
+		'battManString1BatteryHighOhmicValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 7),
+		'battManString1BatteryIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 1),
+		'battManString1BatteryInterTierOhmicValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 2, 1, 2),
+		'battManString1BatteryLowCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 6),
+		'battManString1BatteryLowestVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 3),
+		'battManString1BatteryOpenCell': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 14),
+		'battManString1BatteryOpenFuseOrConnection': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 5),
+		'battManString1BatteryTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2),
+		'battManString1BatteryTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 1),
+		'battManString1BatteryThermalRunaway': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 8),
+		'battManString1BatteryUserHighVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 10),
+		'battManString1BatteryUserLowVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 11),
+		'battManString1BatteryVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 2, 1, 2),
+		'battManString1OhmicValueData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 3, 1, 2),
+		'battManString1OhmicValueEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 3, 1),
+		'battManString1OhmicValueIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 3, 1, 1),
+		'battManString1OhmicValueLastDischargeInfo': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 1),
+		'battManString1OhmicValueTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 3),
+		'battManString1OhmicValueTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 2),
+		'battManString1ResponseTestChangeData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 5, 1, 2),
+		'battManString1ResponseTestChangeEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 5, 1),
+		'battManString1ResponseTestChangeIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 5, 1, 1),
+		'battManString1ResponseTestChangeTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 5),
+		'battManString1ResponseTestChangeTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 4),
+		'battManString1ResponseTestCurrentBenchmarkData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 16, 1, 2),
+		'battManString1ResponseTestCurrentBenchmarkEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 16, 1),
+		'battManString1ResponseTestCurrentBenchmarkIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 16, 1, 1),
+		'battManString1ResponseTestCurrentBenchmarkTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 16),
+		'battManString1ResponseTestCurrentBenchmarkTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 15),
+		'battManString1ResponseTestCurrentData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 12, 1, 2),
+		'battManString1ResponseTestCurrentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 12, 1),
+		'battManString1ResponseTestCurrentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 12, 1, 1),
+		'battManString1ResponseTestCurrentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 12),
+		'battManString1ResponseTestCurrentTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 11),
+		'battManString2BatteryCalibEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 4, 1),
+		'battManString2BatteryCalibIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 4, 1, 1),
+		'battManString2BatteryCalibTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 4),
+		'battManString2BatteryCalibTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 3),
+		'battManString2BatteryCellShorted': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 4),
+		'battManString2BatteryChemHighVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 12),
+		'battManString2BatteryChemLowVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 13),
+		'battManString2BatteryDryout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 9),
+		'battManString2BatteryEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1),
+		'battManString2BatteryHighOhmicValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 7),
+		'battManString2BatteryIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 1),
+		'battManString2BatteryInterTierOhmicValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 5, 4, 1, 2),
+		'battManString2BatteryLowCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 6),
+		'battManString2BatteryLowestVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 3),
+		'battManString2BatteryOpenCell': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 14),
+		'battManString2BatteryOpenFuseOrConnection': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 5),
+		'battManString2BatteryTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4),
+		'battManString2BatteryTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 3),
+		'battManString2BatteryThermalRunaway': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 8),
+		'battManString2BatteryUserHighVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 10),
+		'battManString2BatteryUserLowVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 11),
+		'battManString2BatteryVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 10, 4, 1, 2),
+		'battManString2OhmicValueData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 8, 1, 2),
+		'battManString2OhmicValueEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 8, 1),
+		'battManString2OhmicValueIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 8, 1, 1),
+		'battManString2OhmicValueLastDischargeInfo': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 6),
+		'battManString2OhmicValueTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 8),
+		'battManString2OhmicValueTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 7),
+		'battManString2ResponseTestChangeData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 10, 1, 2),
+		'battManString2ResponseTestChangeEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 10, 1),
+		'battManString2ResponseTestChangeIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 10, 1, 1),
+		'battManString2ResponseTestChangeTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 10),
+		'battManString2ResponseTestChangeTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 9),
+		'battManString2ResponseTestCurrentBenchmarkData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 18, 1, 2),
+		'battManString2ResponseTestCurrentBenchmarkEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 18, 1),
+		'battManString2ResponseTestCurrentBenchmarkIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 18, 1, 1),
+		'battManString2ResponseTestCurrentBenchmarkTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 18),
+		'battManString2ResponseTestCurrentBenchmarkTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 17),
+		'battManString2ResponseTestCurrentData': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 14, 1, 2),
+		'battManString2ResponseTestCurrentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 14, 1),
+		'battManString2ResponseTestCurrentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 14, 1, 1),
+		'battManString2ResponseTestCurrentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 14),
+		'battManString2ResponseTestCurrentTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13, 13),
+		'battManStringCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4),
+		'battManStringCalibEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4, 2, 1),
+		'battManStringCalibIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4, 2, 1, 1),
+		'battManStringCalibTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4, 2),
+		'battManStringCalibTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 4, 1),
+		'battManStringChargerHighVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 4),
+		'battManStringChargerLowVoltageAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 5),
+		'battManStringCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 2),
+		'battManStringCurrentProbeDisconnected': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 6),
+		'battManStringDischarge10to60Seconds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 12),
+		'battManStringDischarge5to10Seconds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 11),
+		'battManStringDischargeLess5Seconds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 10),
+		'battManStringDischargeMore60Seconds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 13),
+		'battManStringEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1),
+		'battManStringHighRippleCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 8),
+		'battManStringIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 1),
+		'battManStringOnBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 7),
+		'battManStringRippleCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 3),
+		'battManStringStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9),
+		'battManStringTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2),
+		'battManStringTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 1),
+		'battManStringVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 9, 2, 1, 9),
+		'battManSystemAmbientHighTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 5),
+		'battManSystemAmbientLowTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 6),
+		'battManSystemAmbientProbeDisconnected': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 9),
+		'battManSystemAmbientTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 1),
+		'battManSystemAmbientTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 2),
+		'battManSystemCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 2),
+		'battManSystemConfigurationInvalid': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 10),
+		'battManSystemPilotBatteryHighTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 7),
+		'battManSystemPilotProbeDisconnected': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 8),
+		'battManSystemPilotTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 3),
+		'battManSystemPilotTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 4),
+		'battManSystemStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8),
+		'battManSystemSuspendVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 8, 11),
+		'battManTestResults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 13),
+		'battManUnitCalib': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3),
+		'battManUnitCalibEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3, 2, 1),
+		'battManUnitCalibIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3, 2, 1, 1),
+		'battManUnitCalibTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3, 2),
+		'battManUnitCalibTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3, 1),
+		'battManUnitCommLoss': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2, 1, 5),
+		'battManUnitFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2, 1, 4),
+		'battManUnitHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2, 1, 3),
+		'battManUnitRelayStuck': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2, 1, 6),
+		'battManUnitSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 3, 2, 1, 2),
+		'battManUnitStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14),
+		'battManUnitStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2, 1),
+		'battManUnitStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2, 1, 1),
+		'battManUnitStatusSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2, 1, 2),
+		'battManUnitStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 2),
+		'battManUnitStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 16, 14, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'battManAlarmBatteries': (('normal', 1), ('alarm', 2)),
+		'battManAlarmCharger': (('normal', 1), ('alarm', 2)),
+		'battManAlarmEnvironment': (('normal', 1), ('alarm', 2)),
+		'battManAlarmManagementController': (('normal', 1), ('alarm', 2)),
+		'battManConfigApplication': (('silcon', 1), ('other', 2)),
+		'battManConfigAutoAnnunciatorReset': (('disabled', 1), ('enabled', 2)),
+		'battManConfigBatteryChemistry': (('leadAcid', 1), ('nickel-Cadmium', 2)),
+		'battManConfigCellsperBattery': (('oneCell', 1), ('twoCells', 2), ('fourCells', 4), ('sixCells', 6)),
+		'battManConfigMonitorWireLength': (('fiftyFeetOrLess', 1), ('moreThanFiftyFeet', 2)),
+		'battManInputContactAlarmState': (('normal', 1), ('alarm', 2)),
+		'battManInputContactNormalState': (('open', 1), ('closed', 2)),
+		'battManInputContactState': (('open', 1), ('closed', 2)),
+		'battManProbeRange': (('amps1000', 1), ('amps500', 2), ('amps100', 3), ('amps200', 4), ('amps2000', 5)),
+		'battManRemoteAnnunciatorReset': (('noOperation', 1), ('reset', 2)),
+		'battManResetChargeCurrentDeviationBenchmark': (('noOperation', 1), ('reset', 2)),
+		'battManResetDischargeCounters': (('noOperation', 1), ('reset', 2)),
+		'battManResetLowestDischargeVoltages': (('noOperation', 1), ('reset', 2)),
+		'battManString1BatteryCellShorted': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryChemHighVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryChemLowVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryDryout': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryHighOhmicValue': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryLowCapacity': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryOpenCell': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryOpenFuseOrConnection': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryThermalRunaway': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryUserHighVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManString1BatteryUserLowVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryCellShorted': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryChemHighVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryChemLowVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryDryout': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryHighOhmicValue': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryLowCapacity': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryOpenCell': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryOpenFuseOrConnection': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryThermalRunaway': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryUserHighVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManString2BatteryUserLowVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManStringChargerHighVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManStringChargerLowVoltageAlarm': (('normal', 1), ('alarm', 2)),
+		'battManStringCurrentProbeDisconnected': (('normal', 1), ('alarm', 2)),
+		'battManStringHighRippleCurrent': (('normal', 1), ('alarm', 2)),
+		'battManStringOnBattery': (('normal', 1), ('alarm', 2)),
+		'battManSystemAmbientHighTempAlarm': (('normal', 1), ('alarm', 2)),
+		'battManSystemAmbientLowTempAlarm': (('normal', 1), ('alarm', 2)),
+		'battManSystemAmbientProbeDisconnected': (('normal', 1), ('alarm', 2)),
+		'battManSystemConfigurationInvalid': (('normal', 1), ('alarm', 2)),
+		'battManSystemPilotBatteryHighTempAlarm': (('normal', 1), ('alarm', 2)),
+		'battManSystemPilotProbeDisconnected': (('normal', 1), ('alarm', 2)),
+		'battManSystemSuspendVoltage': (('normal', 1), ('alarm', 2)),
+		'battManUnitCommLoss': (('normal', 1), ('alarm', 2)),
+		'battManUnitRelayStuck': (('normal', 1), ('alarm', 2)),
+	},
+}
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'accControl': (1, 3, 6, 1, 4, 1, 318, 1, 3, 22),
+		'accPX': (1, 3, 6, 1, 4, 1, 318, 1, 3, 22, 1),
+		'acceptThisReceiver': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2, 1, 5),
+		'airACRC300Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 10),
+		'airACRC600Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 15),
+		'airACRD600Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 16),
+		'airEcoBreeze': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 13),
+		'airFMSeries': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 1),
+		'airIRRC100Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 5),
+		'airIRRD100Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 8),
+		'airIRRDU': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 12),
+		'airIRRP100Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 6),
+		'airIRRP500Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 7),
+		'airIRSC100Series': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 4),
+		'airInRoomPerimeter': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 9),
+		'airLELSeries': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 14),
+		'airLESeries': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 11),
+		'airPASeries': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 3),
+		'ais5000UPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16),
+		'ais5000UPS100kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16, 7),
+		'ais5000UPS10kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16, 1),
+		'ais5000UPS20kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16, 2),
+		'ais5000UPS30kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16, 3),
+		'ais5000UPS40kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16, 4),
+		'ais5000UPS60kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16, 5),
+		'ais5000UPS80kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 16, 6),
+		'apc': (1, 3, 6, 1, 4, 1, 318),
+		'apcmgmt': (1, 3, 6, 1, 4, 1, 318, 2),
+		'automaticXferSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 3, 11),
+		'backUPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 1),
+		'battManager': (1, 3, 6, 1, 4, 1, 318, 1, 3, 18),
+		'communityString': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2, 1, 3),
+		'conPortServ': (1, 3, 6, 1, 4, 1, 318, 1, 3, 20),
+		'conPortServAP930x': (1, 3, 6, 1, 4, 1, 318, 1, 3, 20, 1),
+		'databaseStatus': (1, 3, 6, 1, 4, 1, 318, 1, 2, 2, 1, 2),
+		'dcPower': (1, 3, 6, 1, 4, 1, 318, 1, 3, 10),
+		'dcmim2': (1, 3, 6, 1, 4, 1, 318, 1, 3, 10, 2),
+		'dm3': (1, 3, 6, 1, 4, 1, 318, 1, 3, 10, 1),
+		'dp100E': (1, 3, 6, 1, 4, 1, 318, 1, 3, 6),
+		'dp300E': (1, 3, 6, 1, 4, 1, 318, 1, 3, 7),
+		'emu2': (1, 3, 6, 1, 4, 1, 318, 1, 3, 8, 3),
+		'environmental': (1, 3, 6, 1, 4, 1, 318, 1, 3, 8, 1),
+		'environmentalMgtSystem': (1, 3, 6, 1, 4, 1, 318, 1, 3, 8, 2),
+		'eps': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30),
+		'eps6000FreqConverter': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 4),
+		'eps6000SSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 2),
+		'eps6000UPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 1),
+		'eps6000UPSWithSSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 3),
+		'eps7000FreqConverter': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 8),
+		'eps7000SSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 6),
+		'eps7000UPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 5),
+		'eps7000UPSWithSSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 7),
+		'eps8000FreqConverter': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 12),
+		'eps8000SSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 10),
+		'eps8000UPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 9),
+		'eps8000UPSWithSSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 30, 11),
+		'essentialServicesStatus': (1, 3, 6, 1, 4, 1, 318, 1, 2, 2, 1, 4),
+		'etlStatus': (1, 3, 6, 1, 4, 1, 318, 1, 2, 2, 1, 5),
+		'experimental': (1, 3, 6, 1, 4, 1, 318, 1, 4),
+		'galaxy': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28),
+		'galaxy300UPS10kVA31': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 14),
+		'galaxy300UPS10kVA33': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 9),
+		'galaxy300UPS15kVA31': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 15),
+		'galaxy300UPS15kVA33': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 10),
+		'galaxy300UPS20kVA31': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 16),
+		'galaxy300UPS20kVA33': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 11),
+		'galaxy300UPS30kVA31': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 17),
+		'galaxy300UPS30kVA33': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 12),
+		'galaxy300UPS40kVA33': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 13),
+		'galaxy5000UPS100KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 24),
+		'galaxy5000UPS120KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 25),
+		'galaxy5000UPS130KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 26),
+		'galaxy5000UPS20KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 18),
+		'galaxy5000UPS30KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 19),
+		'galaxy5000UPS40KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 20),
+		'galaxy5000UPS50KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 21),
+		'galaxy5000UPS60KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 22),
+		'galaxy5000UPS80KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 23),
+		'galaxy5500UPS100KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 33),
+		'galaxy5500UPS120KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 34),
+		'galaxy5500UPS130KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 35),
+		'galaxy5500UPS20KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 27),
+		'galaxy5500UPS30KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 28),
+		'galaxy5500UPS40KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 29),
+		'galaxy5500UPS50KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 30),
+		'galaxy5500UPS60KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 31),
+		'galaxy5500UPS80KVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 32),
+		'galaxy7000SSC1200kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 7),
+		'galaxy7000SSC2000kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 8),
+		'galaxy7000SSC800kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 6),
+		'galaxy7000UPS200kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 1),
+		'galaxy7000UPS250kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 2),
+		'galaxy7000UPS300kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 3),
+		'galaxy7000UPS400kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 4),
+		'galaxy7000UPS500kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 5),
+		'galaxy9000FreqConverter': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 51),
+		'galaxy9000SSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 49),
+		'galaxy9000UPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 48),
+		'galaxy9000UPSWithSSC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 50),
+		'galaxyVMUPS100kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 40),
+		'galaxyVMUPS110kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 41),
+		'galaxyVMUPS120kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 42),
+		'galaxyVMUPS130kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 43),
+		'galaxyVMUPS160kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 44),
+		'galaxyVMUPS180kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 45),
+		'galaxyVMUPS200kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 46),
+		'galaxyVMUPS225kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 47),
+		'galaxyVMUPS50kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 36),
+		'galaxyVMUPS60kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 37),
+		'galaxyVMUPS80kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 38),
+		'galaxyVMUPS90kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 28, 39),
+		'gutor': (1, 3, 6, 1, 4, 1, 318, 1, 3, 21),
+		'gutorPDW': (1, 3, 6, 1, 4, 1, 318, 1, 3, 21, 2),
+		'gutorPEW': (1, 3, 6, 1, 4, 1, 318, 1, 3, 21, 1),
+		'gutorSDC': (1, 3, 6, 1, 4, 1, 318, 1, 3, 21, 5),
+		'gutorWDW': (1, 3, 6, 1, 4, 1, 318, 1, 3, 21, 4),
+		'gutorWEW': (1, 3, 6, 1, 4, 1, 318, 1, 3, 21, 3),
+		'hardware': (1, 3, 6, 1, 4, 1, 318, 1, 1),
+		'infraStruXureATS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 19),
+		'infraStruXurePDU': (1, 3, 6, 1, 4, 1, 318, 1, 3, 15),
+		'isx24ModuleHalfRackPdu': (1, 3, 6, 1, 4, 1, 318, 1, 3, 24, 1),
+		'isx6ModuleRackPdu': (1, 3, 6, 1, 4, 1, 318, 1, 3, 24, 2),
+		'isxModDistribution': (1, 3, 6, 1, 4, 1, 318, 1, 3, 24),
+		'isxServers': (1, 3, 6, 1, 4, 1, 318, 1, 3, 25),
+		'isxcBasic': (1, 3, 6, 1, 4, 1, 318, 1, 3, 25, 1),
+		'isxcEnterprise': (1, 3, 6, 1, 4, 1, 318, 1, 3, 25, 3),
+		'isxcStandard': (1, 3, 6, 1, 4, 1, 318, 1, 3, 25, 2),
+		'isxcVirtual': (1, 3, 6, 1, 4, 1, 318, 1, 3, 25, 4),
+		'loadBalancerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 2, 2, 1, 3),
+		'masterSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4),
+		'masterSwitchMSP': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4, 4),
+		'masterSwitchV1': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4, 1),
+		'masterSwitchV2': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4, 2),
+		'masterSwitchVM': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4, 3),
+		'masterSwitchrPDU': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4, 5),
+		'masterSwitchrPDU2': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4, 6),
+		'masterSwitchsPDU': (1, 3, 6, 1, 4, 1, 318, 1, 3, 4, 7),
+		'matrixUPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 3),
+		'matrixUPS3000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 3, 1),
+		'matrixUPS5000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 3, 2),
+		'mconfig': (1, 3, 6, 1, 4, 1, 318, 2, 1),
+		'mconfigBOOTPEnabled': (1, 3, 6, 1, 4, 1, 318, 2, 1, 3),
+		'mconfigClock': (1, 3, 6, 1, 4, 1, 318, 2, 1, 6),
+		'mconfigClockDate': (1, 3, 6, 1, 4, 1, 318, 2, 1, 6, 1),
+		'mconfigClockTime': (1, 3, 6, 1, 4, 1, 318, 2, 1, 6, 2),
+		'mconfigNumTrapReceivers': (1, 3, 6, 1, 4, 1, 318, 2, 1, 1),
+		'mconfigTFTPServerIP': (1, 3, 6, 1, 4, 1, 318, 2, 1, 4),
+		'mconfigTrapReceiverEntry': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2, 1),
+		'mconfigTrapReceiverTable': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2),
+		'mcontrol': (1, 3, 6, 1, 4, 1, 318, 2, 2),
+		'mcontrolRestartAgent': (1, 3, 6, 1, 4, 1, 318, 2, 2, 1),
+		'mem': (1, 3, 6, 1, 4, 1, 318, 1, 3, 8, 4),
+		'mfiletransfer': (1, 3, 6, 1, 4, 1, 318, 2, 4),
+		'mfiletransferConfig': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2),
+		'mfiletransferConfigFTP': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 3),
+		'mfiletransferConfigFTPServerAddress': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 3, 1),
+		'mfiletransferConfigFTPServerPassword': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 3, 3),
+		'mfiletransferConfigFTPServerUser': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 3, 2),
+		'mfiletransferConfigSettings': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 1),
+		'mfiletransferConfigSettingsFilename': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 1, 1),
+		'mfiletransferConfigTFTP': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 2),
+		'mfiletransferConfigTFTPServerAddress': (1, 3, 6, 1, 4, 1, 318, 2, 4, 2, 2, 1),
+		'mfiletransferControl': (1, 3, 6, 1, 4, 1, 318, 2, 4, 3),
+		'mfiletransferControlInitiateFileTransfer': (1, 3, 6, 1, 4, 1, 318, 2, 4, 3, 1),
+		'mfiletransferStatus': (1, 3, 6, 1, 4, 1, 318, 2, 4, 1),
+		'mfiletransferStatusLastTransferResult': (1, 3, 6, 1, 4, 1, 318, 2, 4, 1, 1),
+		'moduleDate': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2, 2, 1, 4),
+		'moduleName': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2, 2, 1, 2),
+		'moduleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2, 2, 1, 1),
+		'moduleVersion': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2, 2, 1, 3),
+		'monitors': (1, 3, 6, 1, 4, 1, 318, 1, 3, 8),
+		'mtrapargs': (1, 3, 6, 1, 4, 1, 318, 2, 3),
+		'mtrapargsGauge': (1, 3, 6, 1, 4, 1, 318, 2, 3, 4),
+		'mtrapargsGauge02': (1, 3, 6, 1, 4, 1, 318, 2, 3, 12),
+		'mtrapargsGauge03': (1, 3, 6, 1, 4, 1, 318, 2, 3, 13),
+		'mtrapargsInteger': (1, 3, 6, 1, 4, 1, 318, 2, 3, 1),
+		'mtrapargsInteger02': (1, 3, 6, 1, 4, 1, 318, 2, 3, 6),
+		'mtrapargsInteger03': (1, 3, 6, 1, 4, 1, 318, 2, 3, 7),
+		'mtrapargsInteger04': (1, 3, 6, 1, 4, 1, 318, 2, 3, 18),
+		'mtrapargsInteger05': (1, 3, 6, 1, 4, 1, 318, 2, 3, 19),
+		'mtrapargsIpAddress': (1, 3, 6, 1, 4, 1, 318, 2, 3, 2),
+		'mtrapargsIpAddress02': (1, 3, 6, 1, 4, 1, 318, 2, 3, 8),
+		'mtrapargsIpAddress03': (1, 3, 6, 1, 4, 1, 318, 2, 3, 9),
+		'mtrapargsOctetString': (1, 3, 6, 1, 4, 1, 318, 2, 3, 23),
+		'mtrapargsOctetString02': (1, 3, 6, 1, 4, 1, 318, 2, 3, 24),
+		'mtrapargsOctetString03': (1, 3, 6, 1, 4, 1, 318, 2, 3, 25),
+		'mtrapargsOctetString04': (1, 3, 6, 1, 4, 1, 318, 2, 3, 26),
+		'mtrapargsOctetString05': (1, 3, 6, 1, 4, 1, 318, 2, 3, 27),
+		'mtrapargsOctetString06': (1, 3, 6, 1, 4, 1, 318, 2, 3, 28),
+		'mtrapargsOctetString07': (1, 3, 6, 1, 4, 1, 318, 2, 3, 29),
+		'mtrapargsOctetString08': (1, 3, 6, 1, 4, 1, 318, 2, 3, 30),
+		'mtrapargsString': (1, 3, 6, 1, 4, 1, 318, 2, 3, 3),
+		'mtrapargsString02': (1, 3, 6, 1, 4, 1, 318, 2, 3, 10),
+		'mtrapargsString03': (1, 3, 6, 1, 4, 1, 318, 2, 3, 11),
+		'mtrapargsString04': (1, 3, 6, 1, 4, 1, 318, 2, 3, 16),
+		'mtrapargsString05': (1, 3, 6, 1, 4, 1, 318, 2, 3, 17),
+		'mtrapargsString06': (1, 3, 6, 1, 4, 1, 318, 2, 3, 20),
+		'mtrapargsString07': (1, 3, 6, 1, 4, 1, 318, 2, 3, 21),
+		'mtrapargsString08': (1, 3, 6, 1, 4, 1, 318, 2, 3, 22),
+		'mtrapargsTimeTicks': (1, 3, 6, 1, 4, 1, 318, 2, 3, 5),
+		'mtrapargsTimeTicks02': (1, 3, 6, 1, 4, 1, 318, 2, 3, 14),
+		'mtrapargsTimeTicks03': (1, 3, 6, 1, 4, 1, 318, 2, 3, 15),
+		'netLock': (1, 3, 6, 1, 4, 1, 318, 1, 3, 12),
+		'networkAir': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14),
+		'newCodeAuthentViaTFTP': (1, 3, 6, 1, 4, 1, 318, 2, 1, 5),
+		'powerNetSoftwareConfig': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2),
+		'powerNetSoftwareEntry': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2, 2, 1),
+		'powerNetSoftwareOid': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 1, 2),
+		'powerNetSoftwareSystem': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 1),
+		'powerNetSoftwareSystemDescription': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 1, 1),
+		'powerNetSoftwareSystemUpTime': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 1, 3),
+		'powerNetSoftwareTable': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2, 2),
+		'powerNetSoftwareTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1, 2, 1),
+		'powerNetSubAgent': (1, 3, 6, 1, 4, 1, 318, 1, 2, 1),
+		'products': (1, 3, 6, 1, 4, 1, 318, 1),
+		'rackAirRemovalUnit': (1, 3, 6, 1, 4, 1, 318, 1, 3, 14, 2),
+		'receiveTrapType': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2, 1, 6),
+		'receiverAddr': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2, 1, 2),
+		'redundantSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 3, 9),
+		'serverStatus': (1, 3, 6, 1, 4, 1, 318, 1, 2, 2, 1, 1),
+		'severity': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2, 1, 4),
+		'smartUPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2),
+		'smartUPS1000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 9),
+		'smartUPS10000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 15),
+		'smartUPS1250': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 5),
+		'smartUPS1400': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 10),
+		'smartUPS1500': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 16),
+		'smartUPS2': (1, 3, 6, 1, 4, 1, 318, 1, 3, 27),
+		'smartUPS2000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 6),
+		'smartUPS2200': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 11),
+		'smartUPS250': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 1),
+		'smartUPS3000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 12),
+		'smartUPS3000DSP': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 17),
+		'smartUPS3Phase': (1, 3, 6, 1, 4, 1, 318, 1, 3, 17),
+		'smartUPS3Phase10kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 17, 1),
+		'smartUPS3Phase15kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 17, 2),
+		'smartUPS3Phase20kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 17, 3),
+		'smartUPS3Phase30kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 17, 4),
+		'smartUPS3Phase40kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 17, 5),
+		'smartUPS400': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 2),
+		'smartUPS450': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 7),
+		'smartUPS5000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 13),
+		'smartUPS5000DSP': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 18),
+		'smartUPS600': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 3),
+		'smartUPS700': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 8),
+		'smartUPS7500': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 14),
+		'smartUPS8000': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 19),
+		'smartUPS900': (1, 3, 6, 1, 4, 1, 318, 1, 3, 2, 4),
+		'software': (1, 3, 6, 1, 4, 1, 318, 1, 2),
+		'struxureWareOperations': (1, 3, 6, 1, 4, 1, 318, 1, 2, 2),
+		'struxureWareOperationsStatus': (1, 3, 6, 1, 4, 1, 318, 1, 2, 2, 1),
+		'symmetra3PhaseUPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 13),
+		'symmetra3PhaseUPS20kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 13, 4),
+		'symmetra3PhaseUPS40kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 13, 1),
+		'symmetra3PhaseUPS60kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 13, 2),
+		'symmetra3PhaseUPS80kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 13, 3),
+		'symmetraPX': (1, 3, 6, 1, 4, 1, 318, 1, 3, 23),
+		'symmetraPx100kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 23, 5),
+		'symmetraPx160kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 23, 2),
+		'symmetraPx250kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 23, 3),
+		'symmetraPx48kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 23, 1),
+		'symmetraPx500kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 23, 4),
+		'symmetraPxDisplay': (1, 3, 6, 1, 4, 1, 318, 1, 3, 23, 6),
+		'symmetraUPS': (1, 3, 6, 1, 4, 1, 318, 1, 3, 5),
+		'symmetraUPS12kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 5, 3),
+		'symmetraUPS16kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 5, 4),
+		'symmetraUPS4kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 5, 1),
+		'symmetraUPS8kVA': (1, 3, 6, 1, 4, 1, 318, 1, 3, 5, 2),
+		'system': (1, 3, 6, 1, 4, 1, 318, 1, 3),
+		'trapIndex': (1, 3, 6, 1, 4, 1, 318, 2, 1, 2, 1, 1),
+	},
+	'SNMPv2-MIB': {
+		'sysContact': (1, 3, 6, 1, 2, 1, 1, 4),
+		'sysDescr': (1, 3, 6, 1, 2, 1, 1, 1),
+		'sysLocation': (1, 3, 6, 1, 2, 1, 1, 6),
+		'sysName': (1, 3, 6, 1, 2, 1, 1, 5),
+		'sysObjectID': (1, 3, 6, 1, 2, 1, 1, 2),
+		'sysServices': (1, 3, 6, 1, 2, 1, 1, 7),
+		'sysUpTime': (1, 3, 6, 1, 2, 1, 1, 3),
+		'system': (1, 3, 6, 1, 2, 1, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'acceptThisReceiver': (('yes', 1), ('no', 2)),
+		'databaseStatus': (('unknown', 1), ('running-alone', 10), ('stopped', 2), ('running', 3), ('detached', 4), ('catching-up', 5), ('attaching', 6), ('running-master', 7), ('running-primary-slave', 8), ('running-slave', 9)),
+		'essentialServicesStatus': (('unknown', 1), ('stopped', 2), ('running', 3), ('time-sync-problems', 4), ('backup-problems', 5)),
+		'etlStatus': (('unknown', 1), ('running', 2), ('failed', 3), ('paused', 4), ('stopped', 5)),
+		'loadBalancerStatus': (('unknown', 1), ('stopped', 2), ('running', 3), ('running-missing', 4)),
+		'mconfigBOOTPEnabled': (('yes', 1), ('no', 2)),
+		'mcontrolRestartAgent': (('restartCurrentAgent', 1), ('continueCurrentAgent', 2), ('loadAndExecuteNewAgent', 3), ('restartWithoutAgent', 4), ('resetNetworkAndRestart', 5), ('resetNetworkLeaveModeAndRestart', 6)),
+		'mfiletransferControlInitiateFileTransfer': (('doNotInitiateFileTransfer', 1), ('initiateFileTransferDownloadViaTFTP', 2), ('initiateFileTransferDownloadViaFTP', 3)),
+		'mfiletransferStatusLastTransferResult': (('lastFileTransferResultSuccessful', 1), ('lastFileTransferResultNotAvailable', 2), ('lastFileTransferResultFailureUnknown', 3), ('lastFileTransferResultFailureServerInaccessible', 4), ('lastFileTransferResultFailureServerAccessDenied', 5), ('lastFileTransferResultFailureFileNotFound', 6), ('lastFileTransferResultFailureFileTypeUnknown', 7), ('lastFileTransferResultFailureFileCorrupted', 8)),
+		'newCodeAuthentViaTFTP': (('unknown', 1), ('validNewAgentCodeImage', 2), ('sameAgentCodeImage', 3), ('invalidAgentCodeImage', 4)),
+		'receiveTrapType': (('powernet', 1), ('ietf', 2), ('both', 3)),
+		'serverStatus': (('unknown', 1), ('stopped', 2), ('running', 3), ('running-missing', 4), ('initializing', 5), ('starting', 6), ('disaster-recovery', 7), ('postoffice-inconsistent', 8), ('missing-jgroups', 9)),
+		'severity': (('information', 1), ('warning', 2), ('severe', 3)),
+	},
+}
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'apCPSCPUfreq': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 7),
+		'apCPSDevId': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 8),
+		'apCPSFlashSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 5),
+		'apCPSNPcmcia': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 1),
+		'apCPSPcmcia': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4),
+		'apCPSPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 3),
+		'apCPSPw1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 3, 2),
+		'apCPSPw2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 3, 3),
+		'apCPSPwNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 3, 1),
+		'apCPSRAMSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 6),
+		'apCPSSave': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 4, 1),
+		'apCPSSerialHUP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 4, 2),
+		'apCPSpname': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 1),
+		'apCPSversion': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 2),
+		'consolePortServer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19),
+		'cpsAP930x': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1),
+		'cpsAP930xAdm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 4),
+		'cpsAP930xConf': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2),
+		'cpsAP930xInfo': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3),
+		'cpsAP930xSys': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1),
+		'cpsCardConfCardv': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 6),
+		'cpsCardConfEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1),
+		'cpsCardConfFunc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 5),
+		'cpsCardConfIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 1),
+		'cpsCardConfInter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 4),
+		'cpsCardConfPort1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 7),
+		'cpsCardConfPort2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 8),
+		'cpsCardConfPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 2),
+		'cpsCardConfTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3),
+		'cpsCardConfType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 3, 1, 3),
+		'cpsCardIdentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 2, 1),
+		'cpsCardIdentFunc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 2, 1, 4),
+		'cpsCardIdentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 2, 1, 1),
+		'cpsCardIdentMan': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 2, 1, 3),
+		'cpsCardIdentPCI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 2, 1, 5),
+		'cpsCardIdentProd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 2, 1, 2),
+		'cpsCardIdentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 2),
+		'cpsCardStatusCard': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 4, 1, 2),
+		'cpsCardStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 4, 1),
+		'cpsCardStatusFunc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 4, 1, 3),
+		'cpsCardStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 4, 1, 1),
+		'cpsCardStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 1, 4, 4),
+		'cpsConsoleBanner': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 2),
+		'cpsDNSdomain': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 5, 3, 3),
+		'cpsDNSpriserv': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 5, 3, 1),
+		'cpsDNSsecserv': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 5, 3, 2),
+		'cpsDNSserv': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 5, 3),
+		'cpsEthDhcpc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 4, 1),
+		'cpsEthIPaddr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 4, 2),
+		'cpsEthIPaddr2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 4, 5),
+		'cpsEthIPmask': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 4, 3),
+		'cpsEthIPmask2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 4, 6),
+		'cpsEthItf': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 4),
+		'cpsEthMTU': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 4, 4),
+		'cpsHostName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 1),
+		'cpsInfoSerialPortEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1),
+		'cpsInfoSerialPortErrBreaks': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 9),
+		'cpsInfoSerialPortErrFrame': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 7),
+		'cpsInfoSerialPortErrOverrun': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 10),
+		'cpsInfoSerialPortErrParity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 8),
+		'cpsInfoSerialPortName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 3),
+		'cpsInfoSerialPortNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 1),
+		'cpsInfoSerialPortRXBytes': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 6),
+		'cpsInfoSerialPortSigCD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 12),
+		'cpsInfoSerialPortSigCTS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 15),
+		'cpsInfoSerialPortSigDSR': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 13),
+		'cpsInfoSerialPortSigDTR': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 11),
+		'cpsInfoSerialPortSigRI': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 16),
+		'cpsInfoSerialPortSigRTS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 14),
+		'cpsInfoSerialPortSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 4),
+		'cpsInfoSerialPortTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1),
+		'cpsInfoSerialPortTty': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 2),
+		'cpsInfoSerialPortTxBytes': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 3, 1, 1, 5),
+		'cpsMotd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 3),
+		'cpsMultipleIP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 5, 2),
+		'cpsNameService': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 5),
+		'cpsResolverOrder': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 5, 1),
+		'cpsSerialDBFacility': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 10),
+		'cpsSerialFacility': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 9),
+		'cpsSerialGlobal': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1),
+		'cpsSerialGroupEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 11, 1),
+		'cpsSerialGroupIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 11, 1, 1),
+		'cpsSerialGroupName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 11, 1, 2),
+		'cpsSerialGroupTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 11),
+		'cpsSerialGroupUsers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 11, 1, 3),
+		'cpsSerialInclude': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 1),
+		'cpsSerialLocalLogins': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 8),
+		'cpsSerialLockDir': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 3),
+		'cpsSerialNFS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 2),
+		'cpsSerialPortAccSrv1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 16),
+		'cpsSerialPortAccSrv2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 20),
+		'cpsSerialPortAuthAcc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 23),
+		'cpsSerialPortAuthRadP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 22),
+		'cpsSerialPortAuthRetr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 18),
+		'cpsSerialPortAuthSecret': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 21),
+		'cpsSerialPortAuthSrv1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 15),
+		'cpsSerialPortAuthSrv2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 19),
+		'cpsSerialPortAuthTmo': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 17),
+		'cpsSerialPortAuthtype': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 14),
+		'cpsSerialPortAutoInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 56),
+		'cpsSerialPortAutoOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 57),
+		'cpsSerialPortAutomUsr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 31),
+		'cpsSerialPortBanner': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 28),
+		'cpsSerialPortBreakInterval': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 58),
+		'cpsSerialPortConf': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6),
+		'cpsSerialPortDBalarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 47),
+		'cpsSerialPortDBmenu': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 46),
+		'cpsSerialPortDBmode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 44),
+		'cpsSerialPortDBsize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 42),
+		'cpsSerialPortDBsyslog': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 45),
+		'cpsSerialPortDBtime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 43),
+		'cpsSerialPortDCDCtrl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 10),
+		'cpsSerialPortDTRdelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 9),
+		'cpsSerialPortDataSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 5),
+		'cpsSerialPortEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1),
+		'cpsSerialPortFlowCtrl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 8),
+		'cpsSerialPortLFSuppress': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 55),
+		'cpsSerialPortLogUtmp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 11),
+		'cpsSerialPortLogWtmp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 12),
+		'cpsSerialPortLogform': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 13),
+		'cpsSerialPortModemChat': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 37),
+		'cpsSerialPortName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 3),
+		'cpsSerialPortNetMask': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 32),
+		'cpsSerialPortNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 1),
+		'cpsSerialPortParity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 7),
+		'cpsSerialPortPppFoption': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 36),
+		'cpsSerialPortPppMru': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 34),
+		'cpsSerialPortPppMtu': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 33),
+		'cpsSerialPortPppOptions': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 35),
+		'cpsSerialPortPrompt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 29),
+		'cpsSerialPortProtocol': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 24),
+		'cpsSerialPortRemHost': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 27),
+		'cpsSerialPortRemoteIP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 25),
+		'cpsSerialPortSSHbreak': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 48),
+		'cpsSerialPortSniffAdm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 50),
+		'cpsSerialPortSniffEsc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 51),
+		'cpsSerialPortSniffMsess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 52),
+		'cpsSerialPortSniffSess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 49),
+		'cpsSerialPortSockIdle': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 41),
+		'cpsSerialPortSockPoll': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 40),
+		'cpsSerialPortSockTx': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 39),
+		'cpsSerialPortSocketPort': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 26),
+		'cpsSerialPortSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 4),
+		'cpsSerialPortStopBits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 6),
+		'cpsSerialPortSttyCmd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 38),
+		'cpsSerialPortSysBufSess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 54),
+		'cpsSerialPortTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1),
+		'cpsSerialPortTelnetMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 53),
+		'cpsSerialPortTermType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 30),
+		'cpsSerialPortTty': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2, 1, 1, 2),
+		'cpsSerialPppd': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 5),
+		'cpsSerialRlogin': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 4),
+		'cpsSerialSpec': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 2),
+		'cpsSerialSsh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 7),
+		'cpsSerialTelnet': (1, 3, 6, 1, 4, 1, 318, 1, 1, 19, 1, 2, 6, 1, 6),
+	},
+}
+
+NAMED_VALUES = {
+}
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'cooling': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27),
+		'coolingUnit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1),
+		'coolingUnitAbout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 3),
+		'coolingUnitAboutDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 3, 2, 1, 2),
+		'coolingUnitAboutEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 3, 2, 1),
+		'coolingUnitAboutTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 3, 2),
+		'coolingUnitAboutTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 3, 2, 1, 1),
+		'coolingUnitAboutTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 3, 1),
+		'coolingUnitAboutValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 3, 2, 1, 3),
+		'coolingUnitConfiguration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5),
+		'coolingUnitConfigurationAnalog': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1),
+		'coolingUnitConfigurationAnalogAccess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 6),
+		'coolingUnitConfigurationAnalogDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 2),
+		'coolingUnitConfigurationAnalogEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1),
+		'coolingUnitConfigurationAnalogMaximum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 8),
+		'coolingUnitConfigurationAnalogMinimum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 7),
+		'coolingUnitConfigurationAnalogScale': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 5),
+		'coolingUnitConfigurationAnalogTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2),
+		'coolingUnitConfigurationAnalogTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 1),
+		'coolingUnitConfigurationAnalogTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 1),
+		'coolingUnitConfigurationAnalogUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 4),
+		'coolingUnitConfigurationAnalogValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 1, 2, 1, 3),
+		'coolingUnitConfigurationDiscrete': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2),
+		'coolingUnitConfigurationDiscreteAccess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2, 1, 6),
+		'coolingUnitConfigurationDiscreteDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2, 1, 2),
+		'coolingUnitConfigurationDiscreteEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2, 1),
+		'coolingUnitConfigurationDiscreteIntegerReferenceKey': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2, 1, 5),
+		'coolingUnitConfigurationDiscreteTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2),
+		'coolingUnitConfigurationDiscreteTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2, 1, 1),
+		'coolingUnitConfigurationDiscreteTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 1),
+		'coolingUnitConfigurationDiscreteValueAsInteger': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2, 1, 4),
+		'coolingUnitConfigurationDiscreteValueAsString': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 2, 2, 1, 3),
+		'coolingUnitConfigurationString': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3),
+		'coolingUnitConfigurationStringAccess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 2, 1, 5),
+		'coolingUnitConfigurationStringDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 2, 1, 2),
+		'coolingUnitConfigurationStringEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 2, 1),
+		'coolingUnitConfigurationStringMaxLength': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 2, 1, 4),
+		'coolingUnitConfigurationStringTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 2),
+		'coolingUnitConfigurationStringTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 2, 1, 1),
+		'coolingUnitConfigurationStringTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 1),
+		'coolingUnitConfigurationStringValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 5, 3, 2, 1, 3),
+		'coolingUnitEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 2, 1),
+		'coolingUnitExtended': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6),
+		'coolingUnitExtendedAnalog': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1),
+		'coolingUnitExtendedAnalogDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 2, 1, 2),
+		'coolingUnitExtendedAnalogEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 2, 1),
+		'coolingUnitExtendedAnalogScale': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 2, 1, 5),
+		'coolingUnitExtendedAnalogTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 2),
+		'coolingUnitExtendedAnalogTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 2, 1, 1),
+		'coolingUnitExtendedAnalogTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 1),
+		'coolingUnitExtendedAnalogUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 2, 1, 4),
+		'coolingUnitExtendedAnalogValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 1, 2, 1, 3),
+		'coolingUnitExtendedDiscrete': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2),
+		'coolingUnitExtendedDiscreteDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 2, 1, 2),
+		'coolingUnitExtendedDiscreteEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 2, 1),
+		'coolingUnitExtendedDiscreteIntegerReferenceKey': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 2, 1, 5),
+		'coolingUnitExtendedDiscreteTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 2),
+		'coolingUnitExtendedDiscreteTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 2, 1, 1),
+		'coolingUnitExtendedDiscreteTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 1),
+		'coolingUnitExtendedDiscreteValueAsInteger': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 2, 1, 4),
+		'coolingUnitExtendedDiscreteValueAsString': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 2, 2, 1, 3),
+		'coolingUnitExtendedString': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 3),
+		'coolingUnitExtendedStringDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 3, 2, 1, 2),
+		'coolingUnitExtendedStringEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 3, 2, 1),
+		'coolingUnitExtendedStringTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 3, 2),
+		'coolingUnitExtendedStringTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 3, 2, 1, 1),
+		'coolingUnitExtendedStringTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 3, 1),
+		'coolingUnitExtendedStringValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 6, 3, 2, 1, 3),
+		'coolingUnitStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4),
+		'coolingUnitStatusAnalog': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1),
+		'coolingUnitStatusAnalogDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 2, 1, 2),
+		'coolingUnitStatusAnalogEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 2, 1),
+		'coolingUnitStatusAnalogScale': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 2, 1, 5),
+		'coolingUnitStatusAnalogTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 2),
+		'coolingUnitStatusAnalogTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 2, 1, 1),
+		'coolingUnitStatusAnalogTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 1),
+		'coolingUnitStatusAnalogUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 2, 1, 4),
+		'coolingUnitStatusAnalogValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 1, 2, 1, 3),
+		'coolingUnitStatusDiscrete': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2),
+		'coolingUnitStatusDiscreteDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 2, 1, 2),
+		'coolingUnitStatusDiscreteEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 2, 1),
+		'coolingUnitStatusDiscreteIntegerReferenceKey': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 2, 1, 5),
+		'coolingUnitStatusDiscreteTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 2),
+		'coolingUnitStatusDiscreteTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 2, 1, 1),
+		'coolingUnitStatusDiscreteTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 1),
+		'coolingUnitStatusDiscreteValueAsInteger': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 2, 1, 4),
+		'coolingUnitStatusDiscreteValueAsString': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 4, 2, 2, 1, 3),
+		'coolingUnitTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 2),
+		'coolingUnitTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 2, 1, 1),
+		'coolingUnitTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 27, 1, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'coolingUnitConfigurationAnalogAccess': (('readOnly', 1), ('readWrite', 2)),
+		'coolingUnitConfigurationDiscreteAccess': (('readOnly', 1), ('readWrite', 2)),
+		'coolingUnitConfigurationStringAccess': (('readOnly', 1), ('readWrite', 2)),
+	},
+}
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'dc2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9),
+		'dcmim2Config': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3),
+		'dcmim2ConfigBattCapacityTestCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 9),
+		'dcmim2ConfigBattCapacityTestEndThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 8),
+		'dcmim2ConfigBattCapacityTestPercent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 7),
+		'dcmim2ConfigBattFloatVolt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 1),
+		'dcmim2ConfigBattFunctTestDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 5),
+		'dcmim2ConfigBattFunctTestThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 6),
+		'dcmim2ConfigBattMaxRecharge': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 2),
+		'dcmim2ConfigBattMfgCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 3),
+		'dcmim2ConfigBattType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2, 4),
+		'dcmim2ConfigBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 2),
+		'dcmim2ConfigLVD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3),
+		'dcmim2ConfigLVDEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3, 2, 1),
+		'dcmim2ConfigLVDIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3, 2, 1, 1),
+		'dcmim2ConfigLVDReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3, 2, 1, 3),
+		'dcmim2ConfigLVDState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3, 2, 1, 4),
+		'dcmim2ConfigLVDTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3, 2),
+		'dcmim2ConfigLVDTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3, 1),
+		'dcmim2ConfigLVDTrip': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 3, 2, 1, 2),
+		'dcmim2ConfigSysHighTempReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 1, 2),
+		'dcmim2ConfigSysHighTempTrip': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 1, 1),
+		'dcmim2ConfigSysLowTempReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 1, 4),
+		'dcmim2ConfigSysLowTempTrip': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 1, 3),
+		'dcmim2ConfigSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 3, 1),
+		'dcmim2Control': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 2),
+		'dcmim2ControlRunCapacityBatteryTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 2, 1, 2),
+		'dcmim2ControlRunFunctBatteryTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 2, 1, 1),
+		'dcmim2ControlSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 2, 1),
+		'dcmim2Ident': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 1),
+		'dcmim2IdentSysFWVersion': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 1, 1, 1),
+		'dcmim2IdentSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 1, 1),
+		'dcmim2Status': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4),
+		'dcmim2StatusAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 5),
+		'dcmim2StatusAlarmsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 5, 2, 1),
+		'dcmim2StatusAlarmsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 5, 2, 1, 1),
+		'dcmim2StatusAlarmsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 5, 2),
+		'dcmim2StatusAlarmsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 5, 1),
+		'dcmim2StatusAlarmsText': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 5, 2, 1, 2),
+		'dcmim2StatusBattCapacityTestResult': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3, 7),
+		'dcmim2StatusBattCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3, 2),
+		'dcmim2StatusBattFloatVolt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3, 1),
+		'dcmim2StatusBattFunctTestResult': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3, 6),
+		'dcmim2StatusBattMfgCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3, 4),
+		'dcmim2StatusBattTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3, 3),
+		'dcmim2StatusBattTestCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3, 5),
+		'dcmim2StatusBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 3),
+		'dcmim2StatusLVD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 4),
+		'dcmim2StatusLVDEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 4, 2, 1),
+		'dcmim2StatusLVDIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 4, 2, 1, 1),
+		'dcmim2StatusLVDState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 4, 2, 1, 2),
+		'dcmim2StatusLVDTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 4, 2),
+		'dcmim2StatusLVDTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 4, 1),
+		'dcmim2StatusRectCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2, 1, 6),
+		'dcmim2StatusRectDevType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2, 1, 2),
+		'dcmim2StatusRectEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2, 1),
+		'dcmim2StatusRectFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2, 1, 5),
+		'dcmim2StatusRectID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2, 1, 3),
+		'dcmim2StatusRectIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2, 1, 1),
+		'dcmim2StatusRectPhyAddr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2, 1, 4),
+		'dcmim2StatusRectTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 2),
+		'dcmim2StatusRectTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2, 1),
+		'dcmim2StatusRectifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 2),
+		'dcmim2StatusSysAmbientTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 1, 4),
+		'dcmim2StatusSysBusVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 1, 3),
+		'dcmim2StatusSysLoadCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 1, 2),
+		'dcmim2StatusSysRectCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 1, 1),
+		'dcmim2StatusSysTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 1, 6),
+		'dcmim2StatusSysUpTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 1, 5),
+		'dcmim2StatusSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 9, 4, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'dcmim2ConfigLVDState': (('statusClosed', 1), ('statusOpened', 2)),
+		'dcmim2ControlRunCapacityBatteryTest': (('battTestOff', 1), ('battTestOn', 2)),
+		'dcmim2ControlRunFunctBatteryTest': (('battTestOff', 1), ('battTestOn', 2)),
+		'dcmim2StatusBattCapacityTestResult': (('capacityTestNotPerformed', 1), ('capacityTestInProcess', 2), ('capacityTestInterrupted', 3), ('capacityTestPass', 4), ('capacityTestFail', 5)),
+		'dcmim2StatusBattFunctTestResult': (('functTestNotPerformed', 1), ('functTestInProcess', 2), ('functTestInterrupted', 3), ('functTestPass', 4), ('functTestFail', 5)),
+		'dcmim2StatusLVDState': (('statusClosed', 1), ('statusOpened', 2)),
+		'dcmim2StatusRectFail': (('statusTrue', 1), ('statusFalse', 2)),
+		'dcmim2StatusSysTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+	},
+}
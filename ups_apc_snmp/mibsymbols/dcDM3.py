@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'dcDM3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7),
+		'dm3Config': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2),
+		'dm3ConfigBattAmpHour': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 13),
+		'dm3ConfigBattDischargeAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 4),
+		'dm3ConfigBattDischargeThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 3),
+		'dm3ConfigBattFloatVolt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 1),
+		'dm3ConfigBattHighTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 10),
+		'dm3ConfigBattHighTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 9),
+		'dm3ConfigBattHighVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 6),
+		'dm3ConfigBattHighVoltThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 5),
+		'dm3ConfigBattHwCurrentAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 18),
+		'dm3ConfigBattHwTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 19),
+		'dm3ConfigBattLowTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 12),
+		'dm3ConfigBattLowTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 11),
+		'dm3ConfigBattLowVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 8),
+		'dm3ConfigBattLowVoltThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 7),
+		'dm3ConfigBattMaxRecharge': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 2),
+		'dm3ConfigBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3),
+		'dm3ConfigBreakers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 1),
+		'dm3ConfigBreakersAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 1, 2, 1, 3),
+		'dm3ConfigBreakersEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 1, 2, 1),
+		'dm3ConfigBreakersIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 1, 2, 1, 1),
+		'dm3ConfigBreakersName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 1, 2, 1, 2),
+		'dm3ConfigBreakersTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 1, 2),
+		'dm3ConfigBreakersTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 1, 1),
+		'dm3ConfigCompMethod': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 14),
+		'dm3ConfigCompTempCoeff': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 15),
+		'dm3ConfigConv1ofNAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 4),
+		'dm3ConfigConv2ofNAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 5),
+		'dm3ConfigConvAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2),
+		'dm3ConfigConvConfigAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 3),
+		'dm3ConfigConvCurrLimitAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 8),
+		'dm3ConfigConvDiagAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 6),
+		'dm3ConfigConvFailAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 11),
+		'dm3ConfigConvFailComm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1, 7),
+		'dm3ConfigConvFailMax': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1, 5),
+		'dm3ConfigConvFailMin': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1, 6),
+		'dm3ConfigConvFailSafe': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1, 3),
+		'dm3ConfigConvFanFailAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 10),
+		'dm3ConfigConvHighVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 1),
+		'dm3ConfigConvHighVoltThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1, 1),
+		'dm3ConfigConvHwVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 12),
+		'dm3ConfigConvImbalanceAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 7),
+		'dm3ConfigConvLowVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 2),
+		'dm3ConfigConvLowVoltThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1, 2),
+		'dm3ConfigConvSetPoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1, 4),
+		'dm3ConfigConvStandbyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 2, 9),
+		'dm3ConfigConvThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2, 1),
+		'dm3ConfigConverter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 2),
+		'dm3ConfigDistribution': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6),
+		'dm3ConfigFuses': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 2),
+		'dm3ConfigFusesAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 2, 2, 1, 3),
+		'dm3ConfigFusesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 2, 2, 1),
+		'dm3ConfigFusesIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 2, 2, 1, 1),
+		'dm3ConfigFusesName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 2, 2, 1, 2),
+		'dm3ConfigFusesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 2, 2),
+		'dm3ConfigFusesTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 6, 2, 1),
+		'dm3ConfigHighKneeTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 16),
+		'dm3ConfigInRlyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2, 2, 1, 4),
+		'dm3ConfigInRlyDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2, 2, 1, 3),
+		'dm3ConfigInRlyEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2, 2, 1),
+		'dm3ConfigInRlyIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2, 2, 1, 1),
+		'dm3ConfigInRlyName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2, 2, 1, 2),
+		'dm3ConfigInRlyTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2, 2),
+		'dm3ConfigInRlyTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2, 1),
+		'dm3ConfigInputRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 2),
+		'dm3ConfigLVD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2),
+		'dm3ConfigLVDEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1, 3),
+		'dm3ConfigLVDEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1),
+		'dm3ConfigLVDHWAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1, 7),
+		'dm3ConfigLVDIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1, 1),
+		'dm3ConfigLVDName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1, 2),
+		'dm3ConfigLVDOpenAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1, 6),
+		'dm3ConfigLVDResetThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1, 5),
+		'dm3ConfigLVDTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2),
+		'dm3ConfigLVDTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 1),
+		'dm3ConfigLVDTripThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 2, 2, 1, 4),
+		'dm3ConfigLowKneeTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 3, 17),
+		'dm3ConfigOutRlyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1, 2, 1, 4),
+		'dm3ConfigOutRlyDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1, 2, 1, 3),
+		'dm3ConfigOutRlyEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1, 2, 1),
+		'dm3ConfigOutRlyIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1, 2, 1, 1),
+		'dm3ConfigOutRlyName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1, 2, 1, 2),
+		'dm3ConfigOutRlyTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1, 2),
+		'dm3ConfigOutRlyTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1, 1),
+		'dm3ConfigOutputRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5, 1),
+		'dm3ConfigPowerModules': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4),
+		'dm3ConfigRect1ofNAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 4),
+		'dm3ConfigRect2ofNAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 5),
+		'dm3ConfigRectAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2),
+		'dm3ConfigRectConfigAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 3),
+		'dm3ConfigRectCurrLimitAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 8),
+		'dm3ConfigRectDiagAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 6),
+		'dm3ConfigRectFailAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 11),
+		'dm3ConfigRectFailComm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 1, 4),
+		'dm3ConfigRectFailSafe': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 1, 3),
+		'dm3ConfigRectFanFailAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 10),
+		'dm3ConfigRectHighVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 1),
+		'dm3ConfigRectHighVoltThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 1, 1),
+		'dm3ConfigRectHwVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 12),
+		'dm3ConfigRectImbalanceAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 7),
+		'dm3ConfigRectLowVoltAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 2),
+		'dm3ConfigRectLowVoltThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 1, 2),
+		'dm3ConfigRectStandbyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 2, 9),
+		'dm3ConfigRectThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1, 1),
+		'dm3ConfigRectifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 4, 1),
+		'dm3ConfigRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 5),
+		'dm3ConfigSysDescriptionEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 2, 1),
+		'dm3ConfigSysDescriptionIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 2, 1, 1),
+		'dm3ConfigSysDescriptionTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 2),
+		'dm3ConfigSysDescriptionTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 1),
+		'dm3ConfigSysDescriptionText': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 2, 1, 2),
+		'dm3ConfigSysHardwareTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 7),
+		'dm3ConfigSysHighTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 4),
+		'dm3ConfigSysHighTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 3),
+		'dm3ConfigSysLowTempAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 6),
+		'dm3ConfigSysLowTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 5),
+		'dm3ConfigSysRemoteAccess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1, 8),
+		'dm3ConfigSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 2, 1),
+		'dm3Ident': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1),
+		'dm3IdentSysCntrlRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 4),
+		'dm3IdentSysDescriptionEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 2, 1),
+		'dm3IdentSysDescriptionIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 2, 1, 1),
+		'dm3IdentSysDescriptionTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 2),
+		'dm3IdentSysDescriptionTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 1),
+		'dm3IdentSysDescriptionText': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 2, 1, 2),
+		'dm3IdentSysFWVersion': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 5),
+		'dm3IdentSysModel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1, 3),
+		'dm3IdentSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 1, 1),
+		'dm3Status': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3),
+		'dm3StatusAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 2),
+		'dm3StatusAlarmsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 2, 2, 1),
+		'dm3StatusAlarmsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 2, 2, 1, 1),
+		'dm3StatusAlarmsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 2, 2),
+		'dm3StatusAlarmsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 2, 1),
+		'dm3StatusAlarmsText': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 2, 2, 1, 2),
+		'dm3StatusBattCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 3, 1),
+		'dm3StatusBattCurrentSanity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 3, 3),
+		'dm3StatusBattTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 3, 2),
+		'dm3StatusBattTempSanity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 3, 4),
+		'dm3StatusBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 3),
+		'dm3StatusBreakers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 1),
+		'dm3StatusBreakersEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 1, 2, 1),
+		'dm3StatusBreakersIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 1, 2, 1, 1),
+		'dm3StatusBreakersName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 1, 2, 1, 2),
+		'dm3StatusBreakersStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 1, 2, 1, 3),
+		'dm3StatusBreakersTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 1, 2),
+		'dm3StatusBreakersTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 1, 1),
+		'dm3StatusConvCfg': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 11),
+		'dm3StatusConvCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 4),
+		'dm3StatusConvCurrentLimit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 5),
+		'dm3StatusConvDesc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 3),
+		'dm3StatusConvDevType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 9),
+		'dm3StatusConvDiagPass': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 15),
+		'dm3StatusConvEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1),
+		'dm3StatusConvFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 8),
+		'dm3StatusConvFanFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 7),
+		'dm3StatusConvFwVer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 13),
+		'dm3StatusConvID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 2),
+		'dm3StatusConvIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 1),
+		'dm3StatusConvPcbRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 12),
+		'dm3StatusConvPhyAddr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 10),
+		'dm3StatusConvPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 14),
+		'dm3StatusConvStandby': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 6),
+		'dm3StatusConvState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2, 1, 16),
+		'dm3StatusConvTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 2),
+		'dm3StatusConvTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 1),
+		'dm3StatusConverter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2),
+		'dm3StatusDistribution': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8),
+		'dm3StatusFuses': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 2),
+		'dm3StatusFusesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 2, 2, 1),
+		'dm3StatusFusesIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 2, 2, 1, 1),
+		'dm3StatusFusesName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 2, 2, 1, 2),
+		'dm3StatusFusesStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 2, 2, 1, 3),
+		'dm3StatusFusesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 2, 2),
+		'dm3StatusFusesTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 8, 2, 1),
+		'dm3StatusInRlyEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 2, 2, 1),
+		'dm3StatusInRlyIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 2, 2, 1, 1),
+		'dm3StatusInRlyName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 2, 2, 1, 2),
+		'dm3StatusInRlyStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 2, 2, 1, 3),
+		'dm3StatusInRlyTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 2, 2),
+		'dm3StatusInRlyTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 2, 1),
+		'dm3StatusInputRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 2),
+		'dm3StatusLVD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5),
+		'dm3StatusLVDEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5, 2, 1),
+		'dm3StatusLVDHwFault': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5, 2, 1, 4),
+		'dm3StatusLVDIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5, 2, 1, 1),
+		'dm3StatusLVDName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5, 2, 1, 2),
+		'dm3StatusLVDState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5, 2, 1, 3),
+		'dm3StatusLVDTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5, 2),
+		'dm3StatusLVDTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 5, 1),
+		'dm3StatusOEM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 4),
+		'dm3StatusOEMconvGain': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 4, 4),
+		'dm3StatusOEMconvOffset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 4, 3),
+		'dm3StatusOEMrectGain': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 4, 2),
+		'dm3StatusOEMrectOffset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 4, 1),
+		'dm3StatusOEMshuntGain': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 4, 6),
+		'dm3StatusOEMshuntOffset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 4, 5),
+		'dm3StatusOutRlyEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 1, 2, 1),
+		'dm3StatusOutRlyIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 1, 2, 1, 1),
+		'dm3StatusOutRlyName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 1, 2, 1, 2),
+		'dm3StatusOutRlyStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 1, 2, 1, 3),
+		'dm3StatusOutRlyTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 1, 2),
+		'dm3StatusOutRlyTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 1, 1),
+		'dm3StatusOutputRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7, 1),
+		'dm3StatusPowerModules': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6),
+		'dm3StatusRectCfg': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 11),
+		'dm3StatusRectCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 4),
+		'dm3StatusRectCurrentLimit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 5),
+		'dm3StatusRectDesc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 3),
+		'dm3StatusRectDevType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 9),
+		'dm3StatusRectDiagPass': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 15),
+		'dm3StatusRectEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1),
+		'dm3StatusRectFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 8),
+		'dm3StatusRectFanFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 7),
+		'dm3StatusRectFwVer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 13),
+		'dm3StatusRectID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 2),
+		'dm3StatusRectIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 1),
+		'dm3StatusRectPcbRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 12),
+		'dm3StatusRectPhyAddr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 10),
+		'dm3StatusRectPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 14),
+		'dm3StatusRectStandby': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 6),
+		'dm3StatusRectState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2, 1, 16),
+		'dm3StatusRectTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 2),
+		'dm3StatusRectTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 1),
+		'dm3StatusRectifier': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1),
+		'dm3StatusRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 7),
+		'dm3StatusSysAlarmState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1, 6),
+		'dm3StatusSysConvAvailable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 4),
+		'dm3StatusSysConvCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 7),
+		'dm3StatusSysConvType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 5),
+		'dm3StatusSysConvVoltSanity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 3),
+		'dm3StatusSysConvVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 2, 6),
+		'dm3StatusSysRectAvailable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 4),
+		'dm3StatusSysRectCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 7),
+		'dm3StatusSysRectType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 5),
+		'dm3StatusSysRectVoltSanity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 3),
+		'dm3StatusSysRectVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 6, 1, 6),
+		'dm3StatusSysRemoteAccess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1, 3),
+		'dm3StatusSysSecurityLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1, 4),
+		'dm3StatusSysTempSanity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1, 5),
+		'dm3StatusSysTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1, 7),
+		'dm3StatusSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1),
+		'dm3StatusSystemStart': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1, 2),
+		'dm3StatusSystemTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 7, 3, 1, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'dm3ConfigBattDischargeAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigBattHighTempAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigBattHighVoltAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigBattHwCurrentAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigBattHwTempAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigBattLowTempAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigBattLowVoltAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigBreakersAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigCompMethod': (('tempcompOn', 1), ('tempcompOff', 2)),
+		'dm3ConfigConv1ofNAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConv2ofNAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvConfigAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvCurrLimitAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvDiagAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvFailAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvFanFailAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvHighVoltAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvHwVoltAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvImbalanceAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvLowVoltAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigConvStandbyAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigFusesAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigInRlyAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigLVDEnable': (('enabledYes', 1), ('enabledNo', 2)),
+		'dm3ConfigLVDHWAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigLVDOpenAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigOutRlyAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRect1ofNAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRect2ofNAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectConfigAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectCurrLimitAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectDiagAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectFailAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectFanFailAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectHighVoltAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectHwVoltAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectImbalanceAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectLowVoltAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigRectStandbyAlarm': (('alarmIgnore', 1), ('alarmNofN', 10), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigSysHardwareTempAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigSysHighTempAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigSysLowTempAlarm': (('alarmIgnore', 1), ('alarmRelay1', 2), ('alarmRelay2', 3), ('alarmRelay3', 4), ('alarmRelay4', 5), ('alarmRelay5', 6), ('alarmRelay6', 7), ('alarmMinor', 8), ('alarmMajor', 9)),
+		'dm3ConfigSysRemoteAccess': (('accessEnabled', 1), ('accessDisabled', 2)),
+		'dm3StatusBattCurrentSanity': (('saneYES', 1), ('saneNO', 2)),
+		'dm3StatusBattTempSanity': (('saneYES', 1), ('saneNO', 2)),
+		'dm3StatusBreakersStatus': (('statusClosed', 1), ('statusOpen', 2)),
+		'dm3StatusConvCfg': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusConvCurrentLimit': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusConvDiagPass': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusConvFail': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusConvFanFail': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusConvPresent': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusConvStandby': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusFusesStatus': (('statusClosed', 1), ('statusOpen', 2)),
+		'dm3StatusInRlyStatus': (('statusOn', 1), ('statusOff', 2)),
+		'dm3StatusLVDHwFault': (('statusFault', 1), ('statusNofault', 2)),
+		'dm3StatusLVDState': (('statusClosed', 1), ('statusOpened', 2)),
+		'dm3StatusOutRlyStatus': (('statusOn', 1), ('statusOff', 2)),
+		'dm3StatusRectCfg': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusRectCurrentLimit': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusRectDiagPass': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusRectFail': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusRectFanFail': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusRectPresent': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusRectStandby': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusSysAlarmState': (('alarmMinor', 1), ('alarmMajor', 2), ('alarmBoth', 3), ('alarmNone', 4)),
+		'dm3StatusSysConvAvailable': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusSysConvVoltSanity': (('saneYES', 1), ('saneNO', 2)),
+		'dm3StatusSysRectAvailable': (('statusTrue', 1), ('statusFalse', 2)),
+		'dm3StatusSysRectVoltSanity': (('saneYES', 1), ('saneNO', 2)),
+		'dm3StatusSysRemoteAccess': (('accessEnabled', 1), ('accessDisabled', 2)),
+		'dm3StatusSysTempSanity': (('saneYES', 1), ('saneNO', 2)),
+		'dm3StatusSysTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+	},
+}
@@ -0,0 +1,545 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'emConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2),
+		'emConfigContactEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4, 1, 3),
+		'emConfigContactLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4, 1, 6),
+		'emConfigContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4, 1, 2),
+		'emConfigContactNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4, 1, 5),
+		'emConfigContactNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4, 1, 1),
+		'emConfigContactSeverity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4, 1, 4),
+		'emConfigContactsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4, 1),
+		'emConfigContactsNumContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 3),
+		'emConfigContactsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 4),
+		'emConfigProbeHighHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 10),
+		'emConfigProbeHighHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 6),
+		'emConfigProbeHighTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 8),
+		'emConfigProbeHighTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 3),
+		'emConfigProbeHumidHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 21),
+		'emConfigProbeLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 22),
+		'emConfigProbeLowHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 11),
+		'emConfigProbeLowHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 7),
+		'emConfigProbeLowTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 9),
+		'emConfigProbeLowTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 4),
+		'emConfigProbeMaxHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 18),
+		'emConfigProbeMaxHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 14),
+		'emConfigProbeMaxTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 16),
+		'emConfigProbeMaxTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 12),
+		'emConfigProbeMinHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 19),
+		'emConfigProbeMinHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 15),
+		'emConfigProbeMinTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 17),
+		'emConfigProbeMinTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 13),
+		'emConfigProbeName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 2),
+		'emConfigProbeNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 1),
+		'emConfigProbeTempHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 20),
+		'emConfigProbeTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1, 5),
+		'emConfigProbesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2, 1),
+		'emConfigProbesNumProbes': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 1),
+		'emConfigProbesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 2, 2),
+		'emIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 1),
+		'emIdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 1, 1),
+		'emStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3),
+		'emStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 1),
+		'emStatusContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 5, 1, 2),
+		'emStatusContactNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 5, 1, 1),
+		'emStatusContactStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 5, 1, 3),
+		'emStatusContactsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 5, 1),
+		'emStatusContactsNumContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 4),
+		'emStatusContactsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 5),
+		'emStatusProbeCurrentHumid': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 6),
+		'emStatusProbeCurrentTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 4),
+		'emStatusProbeHighHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 9),
+		'emStatusProbeHighTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 7),
+		'emStatusProbeLowHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 10),
+		'emStatusProbeLowTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 8),
+		'emStatusProbeMaxHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 13),
+		'emStatusProbeMaxTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 11),
+		'emStatusProbeMinHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 14),
+		'emStatusProbeMinTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 12),
+		'emStatusProbeName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 2),
+		'emStatusProbeNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 1),
+		'emStatusProbeStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 3),
+		'emStatusProbeTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1, 5),
+		'emStatusProbesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3, 1),
+		'emStatusProbesNumProbes': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 2),
+		'emStatusProbesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1, 3, 3),
+		'emsAlarmDeviceControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 5),
+		'emsAlarmDeviceControlDeviceCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 5, 1, 1, 3),
+		'emsAlarmDeviceControlDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 5, 1, 1, 1),
+		'emsAlarmDeviceControlDeviceName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 5, 1, 1, 2),
+		'emsAlarmDeviceControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 5, 1, 1),
+		'emsAlarmDeviceControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 5, 1),
+		'emsAlarmDeviceStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 17),
+		'emsAlarmDeviceStatusDeviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 17, 1, 1, 1),
+		'emsAlarmDeviceStatusDeviceName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 17, 1, 1, 2),
+		'emsAlarmDeviceStatusDeviceState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 17, 1, 1, 3),
+		'emsAlarmDeviceStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 17, 1, 1),
+		'emsAlarmDeviceStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 17, 1),
+		'emsConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 6),
+		'emsConfigCheckLogLight': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 6, 2),
+		'emsConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 6, 1),
+		'emsIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 1),
+		'emsIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 1, 5),
+		'emsIdentEMSName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 1, 1),
+		'emsIdentFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 1, 3),
+		'emsIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 1, 4),
+		'emsIdentProductNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 1, 2),
+		'emsIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 1, 6),
+		'emsInputContactConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 8),
+		'emsInputContactConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 8, 1, 1),
+		'emsInputContactConfigInputContactIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 8, 1, 1, 1),
+		'emsInputContactConfigInputContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 8, 1, 1, 2),
+		'emsInputContactConfigInputContactNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 8, 1, 1, 3),
+		'emsInputContactConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 8, 1),
+		'emsInputContactStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 14),
+		'emsInputContactStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 14, 1, 1),
+		'emsInputContactStatusInputContactIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 14, 1, 1, 1),
+		'emsInputContactStatusInputContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 14, 1, 1, 2),
+		'emsInputContactStatusInputContactNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 14, 1, 1, 4),
+		'emsInputContactStatusInputContactState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 14, 1, 1, 3),
+		'emsInputContactStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 14, 1),
+		'emsOutletConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 10),
+		'emsOutletConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 10, 1, 1),
+		'emsOutletConfigOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 10, 1, 1, 1),
+		'emsOutletConfigOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 10, 1, 1, 2),
+		'emsOutletConfigOutletNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 10, 1, 1, 3),
+		'emsOutletConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 10, 1),
+		'emsOutletControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 3),
+		'emsOutletControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 3, 1, 1),
+		'emsOutletControlOutletCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 3, 1, 1, 3),
+		'emsOutletControlOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 3, 1, 1, 1),
+		'emsOutletControlOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 3, 1, 1, 2),
+		'emsOutletControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 3, 1),
+		'emsOutletStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 16),
+		'emsOutletStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 16, 1, 1),
+		'emsOutletStatusOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 16, 1, 1, 1),
+		'emsOutletStatusOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 16, 1, 1, 2),
+		'emsOutletStatusOutletNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 16, 1, 1, 4),
+		'emsOutletStatusOutletState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 16, 1, 1, 3),
+		'emsOutletStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 16, 1),
+		'emsOutputRelayConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 9),
+		'emsOutputRelayConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 9, 1, 1),
+		'emsOutputRelayConfigOutputRelayIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 9, 1, 1, 1),
+		'emsOutputRelayConfigOutputRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 9, 1, 1, 2),
+		'emsOutputRelayConfigOutputRelayNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 9, 1, 1, 3),
+		'emsOutputRelayConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 9, 1),
+		'emsOutputRelayControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 2),
+		'emsOutputRelayControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 2, 1, 1),
+		'emsOutputRelayControlOutputRelayCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 2, 1, 1, 3),
+		'emsOutputRelayControlOutputRelayIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 2, 1, 1, 1),
+		'emsOutputRelayControlOutputRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 2, 1, 1, 2),
+		'emsOutputRelayControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 2, 1),
+		'emsOutputRelayStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 15),
+		'emsOutputRelayStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 15, 1, 1),
+		'emsOutputRelayStatusOutputRelayIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 15, 1, 1, 1),
+		'emsOutputRelayStatusOutputRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 15, 1, 1, 2),
+		'emsOutputRelayStatusOutputRelayNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 15, 1, 1, 4),
+		'emsOutputRelayStatusOutputRelayState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 15, 1, 1, 3),
+		'emsOutputRelayStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 15, 1),
+		'emsProbeConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7),
+		'emsProbeConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1),
+		'emsProbeConfigProbeDeltaHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 12),
+		'emsProbeConfigProbeDeltaTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 9),
+		'emsProbeConfigProbeHighHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 5),
+		'emsProbeConfigProbeHighTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 3),
+		'emsProbeConfigProbeIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 1),
+		'emsProbeConfigProbeLTDecTempTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 20),
+		'emsProbeConfigProbeLTDecTempVariance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 19),
+		'emsProbeConfigProbeLTIncTempTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 18),
+		'emsProbeConfigProbeLTIncTempVariance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 17),
+		'emsProbeConfigProbeLowHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 6),
+		'emsProbeConfigProbeLowTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 4),
+		'emsProbeConfigProbeMaxHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 10),
+		'emsProbeConfigProbeMaxTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 7),
+		'emsProbeConfigProbeMinHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 11),
+		'emsProbeConfigProbeMinTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 8),
+		'emsProbeConfigProbeName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 2),
+		'emsProbeConfigProbeSTDecTempTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 16),
+		'emsProbeConfigProbeSTDecTempVariance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 15),
+		'emsProbeConfigProbeSTIncTempTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 14),
+		'emsProbeConfigProbeSTIncTempVariance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1, 1, 13),
+		'emsProbeConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 7, 1),
+		'emsProbeStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13),
+		'emsProbeStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1),
+		'emsProbeStatusProbeAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 11),
+		'emsProbeStatusProbeCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 10),
+		'emsProbeStatusProbeHighHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 7),
+		'emsProbeStatusProbeHighTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 4),
+		'emsProbeStatusProbeHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 6),
+		'emsProbeStatusProbeIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 1),
+		'emsProbeStatusProbeLowHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 8),
+		'emsProbeStatusProbeLowTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 5),
+		'emsProbeStatusProbeMaxHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 14),
+		'emsProbeStatusProbeMaxTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 12),
+		'emsProbeStatusProbeMinHumidityThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 15),
+		'emsProbeStatusProbeMinTempThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 13),
+		'emsProbeStatusProbeName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 2),
+		'emsProbeStatusProbeSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 9),
+		'emsProbeStatusProbeTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1, 1, 3),
+		'emsProbeStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 13, 1),
+		'emsSensorConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11),
+		'emsSensorConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11, 1, 1),
+		'emsSensorConfigSensorAlarmDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11, 1, 1, 5),
+		'emsSensorConfigSensorIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11, 1, 1, 1),
+		'emsSensorConfigSensorNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11, 1, 1, 4),
+		'emsSensorConfigSensorSystemName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11, 1, 1, 2),
+		'emsSensorConfigSensorUserName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11, 1, 1, 3),
+		'emsSensorConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 11, 1),
+		'emsSensorControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 4),
+		'emsSensorControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 4, 1, 1),
+		'emsSensorControlSensorCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 4, 1, 1, 4),
+		'emsSensorControlSensorIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 4, 1, 1, 1),
+		'emsSensorControlSensorSystemName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 4, 1, 1, 2),
+		'emsSensorControlSensorUserName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 4, 1, 1, 3),
+		'emsSensorControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 4, 1),
+		'emsSensorStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18),
+		'emsSensorStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1, 1),
+		'emsSensorStatusSensorAlarmDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1, 1, 6),
+		'emsSensorStatusSensorIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1, 1, 1),
+		'emsSensorStatusSensorName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1, 1, 3),
+		'emsSensorStatusSensorNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1, 1, 5),
+		'emsSensorStatusSensorState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1, 1, 4),
+		'emsSensorStatusSensorSystemName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1, 1, 2),
+		'emsSensorStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 18, 1),
+		'emsStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12),
+		'emsStatusAlarmDeviceCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 10),
+		'emsStatusAlinkAruDeviceCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 8),
+		'emsStatusAlinkProbeDeviceCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 9),
+		'emsStatusCheckLogLight': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 12),
+		'emsStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 2),
+		'emsStatusEMSName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 1),
+		'emsStatusHardwareStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 13),
+		'emsStatusInputContactCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 4),
+		'emsStatusOutletCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 6),
+		'emsStatusOutputRelayCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 5),
+		'emsStatusProbeCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 3),
+		'emsStatusSensorCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 7),
+		'emsStatusSysTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3, 12, 11),
+		'envMgtSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 3),
+		'environmentalMonitor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10),
+		'external': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 1),
+		'iemConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2),
+		'iemConfigConfigRelaysNumRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 5),
+		'iemConfigContactEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 3),
+		'iemConfigContactLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 6),
+		'iemConfigContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 2),
+		'iemConfigContactNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 5),
+		'iemConfigContactNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 1),
+		'iemConfigContactSeverity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 4),
+		'iemConfigContactsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1),
+		'iemConfigContactsNumContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 3),
+		'iemConfigContactsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4),
+		'iemConfigProbeHighHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 10),
+		'iemConfigProbeHighHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 6),
+		'iemConfigProbeHighTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 8),
+		'iemConfigProbeHighTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 3),
+		'iemConfigProbeHumidHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 21),
+		'iemConfigProbeLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 22),
+		'iemConfigProbeLowHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 11),
+		'iemConfigProbeLowHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 7),
+		'iemConfigProbeLowTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 9),
+		'iemConfigProbeLowTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 4),
+		'iemConfigProbeMaxHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 18),
+		'iemConfigProbeMaxHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 14),
+		'iemConfigProbeMaxTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 16),
+		'iemConfigProbeMaxTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 12),
+		'iemConfigProbeMinHumidEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 19),
+		'iemConfigProbeMinHumidThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 15),
+		'iemConfigProbeMinTempEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 17),
+		'iemConfigProbeMinTempThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 13),
+		'iemConfigProbeName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 2),
+		'iemConfigProbeNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 1),
+		'iemConfigProbeTempHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 20),
+		'iemConfigProbeTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 5),
+		'iemConfigProbesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1),
+		'iemConfigProbesNumProbes': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 1),
+		'iemConfigProbesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2),
+		'iemConfigRelayFaultCondition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 4),
+		'iemConfigRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 2),
+		'iemConfigRelayNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 3),
+		'iemConfigRelayNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 1),
+		'iemConfigRelaysEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1),
+		'iemConfigRelaysTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6),
+		'iemIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 1),
+		'iemIdentHardwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 1, 1),
+		'iemStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3),
+		'iemStatusContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1, 2),
+		'iemStatusContactNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1, 1),
+		'iemStatusContactStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1, 3),
+		'iemStatusContactsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1),
+		'iemStatusContactsNumContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 3),
+		'iemStatusContactsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4),
+		'iemStatusProbeCurrentHumid': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 6),
+		'iemStatusProbeCurrentTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 4),
+		'iemStatusProbeHighHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 9),
+		'iemStatusProbeHighTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 7),
+		'iemStatusProbeLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 15),
+		'iemStatusProbeLowHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 10),
+		'iemStatusProbeLowTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 8),
+		'iemStatusProbeMaxHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 13),
+		'iemStatusProbeMaxTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 11),
+		'iemStatusProbeMinHumidViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 14),
+		'iemStatusProbeMinTempViolation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 12),
+		'iemStatusProbeName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 2),
+		'iemStatusProbeNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 1),
+		'iemStatusProbeStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 3),
+		'iemStatusProbeTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 5),
+		'iemStatusProbesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1),
+		'iemStatusProbesNumProbes': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 1),
+		'iemStatusProbesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2),
+		'iemStatusRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1, 2),
+		'iemStatusRelayNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1, 1),
+		'iemStatusRelayStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1, 3),
+		'iemStatusRelaysEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1),
+		'iemStatusRelaysNumRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 6),
+		'iemStatusRelaysTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7),
+		'integrated': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2),
+		'memBeaconAction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 5),
+		'memBeaconConfigBeaconNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 2),
+		'memBeaconConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1),
+		'memBeaconConfigLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 4),
+		'memBeaconConfigModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 1),
+		'memBeaconConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 3),
+		'memBeaconConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4),
+		'memBeaconConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 3),
+		'memBeaconStatusBeaconLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 4),
+		'memBeaconStatusBeaconName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 3),
+		'memBeaconStatusBeaconNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 2),
+		'memBeaconStatusCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 5),
+		'memBeaconStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1),
+		'memBeaconStatusModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 1),
+		'memBeaconStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2),
+		'memBeaconStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 1),
+		'memBeacons': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6),
+		'memInputAbnormalSeverity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 8),
+		'memInputAlarmGeneration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 6),
+		'memInputAnalogCalibrationPoint1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 10),
+		'memInputAnalogCalibrationPoint1Value': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 15),
+		'memInputAnalogCalibrationPoint2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 11),
+		'memInputAnalogCalibrationPoint2Value': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 16),
+		'memInputAnalogCalibrationPoint3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 12),
+		'memInputAnalogCalibrationPoint3Value': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 17),
+		'memInputAnalogCalibrationPoint4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 13),
+		'memInputAnalogCalibrationPoint4Value': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 18),
+		'memInputAnalogCalibrationPoint5': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 14),
+		'memInputAnalogCalibrationPoint5Value': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 19),
+		'memInputAnalogHighThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 22),
+		'memInputAnalogLowThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 23),
+		'memInputAnalogMaxThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 21),
+		'memInputAnalogMeasurementUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 20),
+		'memInputAnalogMinThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 24),
+		'memInputAnalogThreshHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 25),
+		'memInputLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 4),
+		'memInputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 3),
+		'memInputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 7),
+		'memInputNumberCalibrationPoints': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 9),
+		'memInputType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 5),
+		'memInputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3),
+		'memInputsCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 8),
+		'memInputsConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1),
+		'memInputsConfigInputNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 2),
+		'memInputsConfigModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 1),
+		'memInputsConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4),
+		'memInputsConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 3),
+		'memInputsStatusAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 7),
+		'memInputsStatusCurrentAnalogValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 6),
+		'memInputsStatusCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 5),
+		'memInputsStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1),
+		'memInputsStatusInputLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 4),
+		'memInputsStatusInputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 3),
+		'memInputsStatusInputNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 2),
+		'memInputsStatusModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 1),
+		'memInputsStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2),
+		'memInputsStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 1),
+		'memModules': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1),
+		'memModulesConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1),
+		'memModulesConfigModuleLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1, 3),
+		'memModulesConfigModuleName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1, 2),
+		'memModulesConfigModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1, 1),
+		'memModulesConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4),
+		'memModulesConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 3),
+		'memModulesStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1),
+		'memModulesStatusFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 6),
+		'memModulesStatusHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 7),
+		'memModulesStatusModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 4),
+		'memModulesStatusModuleLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 3),
+		'memModulesStatusModuleName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 2),
+		'memModulesStatusModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 1),
+		'memModulesStatusSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 5),
+		'memModulesStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2),
+		'memModulesStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 1),
+		'memOutletAction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 6),
+		'memOutletConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1),
+		'memOutletConfigModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 1),
+		'memOutletConfigOutletNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 2),
+		'memOutletConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4),
+		'memOutletConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 3),
+		'memOutletLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 4),
+		'memOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 3),
+		'memOutletNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 5),
+		'memOutletStatusCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 5),
+		'memOutletStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1),
+		'memOutletStatusModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 1),
+		'memOutletStatusOutletLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 4),
+		'memOutletStatusOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 3),
+		'memOutletStatusOutletNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 2),
+		'memOutletStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2),
+		'memOutletStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 1),
+		'memOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5),
+		'memOutputAction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 6),
+		'memOutputConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1),
+		'memOutputConfigModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 1),
+		'memOutputConfigOutputNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 2),
+		'memOutputConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4),
+		'memOutputConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 3),
+		'memOutputLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 4),
+		'memOutputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 3),
+		'memOutputNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 5),
+		'memOutputStatusCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 5),
+		'memOutputStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1),
+		'memOutputStatusModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 1),
+		'memOutputStatusOutputLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 4),
+		'memOutputStatusOutputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 3),
+		'memOutputStatusOutputNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 2),
+		'memOutputStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2),
+		'memOutputStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 1),
+		'memOutputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4),
+		'memSensors': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2),
+		'memSensorsAlarmGeneration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 5),
+		'memSensorsAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 8),
+		'memSensorsCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 7),
+		'memSensorsConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1),
+		'memSensorsConfigModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 1),
+		'memSensorsConfigSensorNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 2),
+		'memSensorsConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5),
+		'memSensorsConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 4),
+		'memSensorsHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 6),
+		'memSensorsHumidityHighThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 20),
+		'memSensorsHumidityLowThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 21),
+		'memSensorsHumidityMaxThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 19),
+		'memSensorsHumidityMinThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 22),
+		'memSensorsHumidityThreshHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 23),
+		'memSensorsLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 4),
+		'memSensorsName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 3),
+		'memSensorsStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1),
+		'memSensorsStatusModuleNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 1),
+		'memSensorsStatusSensorLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 4),
+		'memSensorsStatusSensorName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 3),
+		'memSensorsStatusSensorNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 2),
+		'memSensorsStatusSysTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 1),
+		'memSensorsStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3),
+		'memSensorsStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 2),
+		'memSensorsTempHighThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 7),
+		'memSensorsTempLongDecRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 16),
+		'memSensorsTempLongDecRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 15),
+		'memSensorsTempLongIncRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 18),
+		'memSensorsTempLongIncRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 17),
+		'memSensorsTempLowThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 8),
+		'memSensorsTempMaxThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 6),
+		'memSensorsTempMinThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 9),
+		'memSensorsTempShortDecRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 12),
+		'memSensorsTempShortDecRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 11),
+		'memSensorsTempShortIncRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 14),
+		'memSensorsTempShortIncRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 13),
+		'memSensorsTempThreshHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 10),
+		'memSensorsTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 5),
+		'modEnvMgr': (1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'emConfigContactEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigContactNormalState': (('open', 1), ('closed', 2)),
+		'emConfigContactSeverity': (('critical', 1), ('warning', 2), ('informational', 3)),
+		'emConfigProbeHighHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeHighTempEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeLowHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeLowTempEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeMaxHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeMaxTempEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeMinHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeMinTempEnable': (('disabled', 1), ('enabled', 2)),
+		'emConfigProbeTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+		'emStatusCommStatus': (('noComm', 1), ('comm', 2), ('commLost', 3)),
+		'emStatusContactStatus': (('noFault', 1), ('fault', 2), ('disabled', 3)),
+		'emStatusProbeHighHumidViolation': (('noViolation', 1), ('highHumidViolation', 2), ('disabled', 3)),
+		'emStatusProbeHighTempViolation': (('noViolation', 1), ('highTempViolation', 2), ('disabled', 3)),
+		'emStatusProbeLowHumidViolation': (('noViolation', 1), ('lowHumidViolation', 2), ('disabled', 3)),
+		'emStatusProbeLowTempViolation': (('noViolation', 1), ('lowTempViolation', 2), ('disabled', 3)),
+		'emStatusProbeMaxHumidViolation': (('noViolation', 1), ('maxHumidViolation', 2), ('disabled', 3)),
+		'emStatusProbeMaxTempViolation': (('noViolation', 1), ('maxTempViolation', 2), ('disabled', 3)),
+		'emStatusProbeMinHumidViolation': (('noViolation', 1), ('minHumidViolation', 2), ('disabled', 3)),
+		'emStatusProbeMinTempViolation': (('noViolation', 1), ('minTempViolation', 2), ('disabled', 3)),
+		'emStatusProbeStatus': (('disconnected', 1), ('connected', 2)),
+		'emStatusProbeTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+		'emsAlarmDeviceControlDeviceCommand': (('alarmDeviceOnEMS', 1), ('alarmDeviceOffEMS', 2), ('alarmDeviceNotInstalledEMS', 3)),
+		'emsAlarmDeviceStatusDeviceState': (('alarmDeviceOnEMS', 1), ('alarmDeviceOffEMS', 2), ('alarmDeviceNotInstalledEMS', 3)),
+		'emsConfigCheckLogLight': (('lightDisabled', 1), ('lightOnInformational', 2), ('lightOnWarning', 3), ('lightOnSevere', 4)),
+		'emsInputContactConfigInputContactNormalState': (('normallyClosedEMS', 1), ('normallyOpenEMS', 2)),
+		'emsInputContactStatusInputContactNormalState': (('normallyClosedEMS', 1), ('normallyOpenEMS', 2)),
+		'emsInputContactStatusInputContactState': (('contactClosedEMS', 1), ('contactOpenEMS', 2)),
+		'emsOutletConfigOutletNormalState': (('normallyOnEMS', 1), ('normallyOffEMS', 2)),
+		'emsOutletControlOutletCommand': (('immediateOnEMS', 1), ('immediateOffEMS', 2)),
+		'emsOutletStatusOutletNormalState': (('normallyOnEMS', 1), ('normallyOffEMS', 2)),
+		'emsOutletStatusOutletState': (('outletOnEMS', 1), ('outletOffEMS', 2)),
+		'emsOutputRelayConfigOutputRelayNormalState': (('normallyClosedEMS', 1), ('normallyOpenEMS', 2)),
+		'emsOutputRelayControlOutputRelayCommand': (('immediateCloseEMS', 1), ('immediateOpenEMS', 2)),
+		'emsOutputRelayStatusOutputRelayNormalState': (('normallyClosedEMS', 1), ('normallyOpenEMS', 2)),
+		'emsOutputRelayStatusOutputRelayState': (('relayClosedEMS', 1), ('relayOpenEMS', 2)),
+		'emsProbeStatusProbeCommStatus': (('commsNeverDiscovered', 1), ('commsEstablished', 2), ('commsLost', 3)),
+		'emsSensorConfigSensorNormalState': (('normallyClosedEMS', 1), ('normallyOpenEMS', 2)),
+		'emsSensorControlSensorCommand': (('noCommandEMS', 1), ('resetCommandEMS', 2)),
+		'emsSensorStatusSensorNormalState': (('normallyClosedEMS', 1), ('normallyOpenEMS', 2)),
+		'emsSensorStatusSensorState': (('sensorFaultedEMS', 1), ('sensorOKEMS', 2), ('sensorNotInstalledEMS', 3)),
+		'emsStatusCheckLogLight': (('lightOff', 1), ('lightOn', 2)),
+		'emsStatusCommStatus': (('noComm', 1), ('comm', 2), ('commLost', 3)),
+		'emsStatusSysTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+		'iemConfigContactEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigContactNormalState': (('open', 1), ('closed', 2)),
+		'iemConfigContactSeverity': (('critical', 1), ('warning', 2), ('informational', 3)),
+		'iemConfigProbeHighHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeHighTempEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeLowHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeLowTempEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeMaxHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeMaxTempEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeMinHumidEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeMinTempEnable': (('disabled', 1), ('enabled', 2)),
+		'iemConfigProbeTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+		'iemConfigRelayNormalState': (('open', 1), ('closed', 2)),
+		'iemStatusContactStatus': (('noFault', 1), ('fault', 2), ('disabled', 3)),
+		'iemStatusProbeHighHumidViolation': (('noViolation', 1), ('highHumidViolation', 2), ('disabled', 3)),
+		'iemStatusProbeHighTempViolation': (('noViolation', 1), ('highTempViolation', 2), ('disabled', 3)),
+		'iemStatusProbeLowHumidViolation': (('noViolation', 1), ('lowHumidViolation', 2), ('disabled', 3)),
+		'iemStatusProbeLowTempViolation': (('noViolation', 1), ('lowTempViolation', 2), ('disabled', 3)),
+		'iemStatusProbeMaxHumidViolation': (('noViolation', 1), ('maxHumidViolation', 2), ('disabled', 3)),
+		'iemStatusProbeMaxTempViolation': (('noViolation', 1), ('maxTempViolation', 2), ('disabled', 3)),
+		'iemStatusProbeMinHumidViolation': (('noViolation', 1), ('minHumidViolation', 2), ('disabled', 3)),
+		'iemStatusProbeMinTempViolation': (('noViolation', 1), ('minTempViolation', 2), ('disabled', 3)),
+		'iemStatusProbeStatus': (('disconnected', 1), ('connected', 2)),
+		'iemStatusProbeTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+		'iemStatusRelayStatus': (('faultState', 1), ('normalState', 2)),
+		'memBeaconAction': (('turnOff', 1), ('turnOn', 2)),
+		'memBeaconStatusCurrentState': (('off', 1), ('on', 2)),
+		'memInputAbnormalSeverity': (('inputSeverityinformational', 1), ('inputSeveritywarning', 2), ('inputSeveritysevere', 3), ('inputSeverityNotApplicable', 4)),
+		'memInputAlarmGeneration': (('disabled', 1), ('enabled', 2)),
+		'memInputNormalState': (('inputClosedHighMEM', 1), ('inputOpenLowMEM', 2), ('inputDisabled', 3), ('inputStateNotApplicable', 4)),
+		'memInputType': (('noConnection', 1), ('dryContact', 2), ('digital', 3), ('analogmAmps', 4), ('analogVolts', 5)),
+		'memInputsCommStatus': (('notInstalled', 1), ('commsOK', 2), ('commsLost', 3)),
+		'memInputsStatusAlarmStatus': (('memNormal', 1), ('memWarning', 2), ('memCritical', 3)),
+		'memInputsStatusCurrentState': (('inputClosedHighMEM', 1), ('inputOpenLowMEM', 2), ('inputDisabled', 3), ('inputStateNotApplicable', 4)),
+		'memOutletAction': (('turnOff', 1), ('turnOn', 2)),
+		'memOutletNormalState': (('off', 1), ('on', 2)),
+		'memOutletStatusCurrentState': (('off', 1), ('on', 2)),
+		'memOutputAction': (('memActionClose', 1), ('memActionOpen', 2)),
+		'memOutputNormalState': (('memOutputClosed', 1), ('memOutputOpen', 2)),
+		'memOutputStatusCurrentState': (('memOutputClosed', 1), ('memOutputOpen', 2)),
+		'memSensorsAlarmGeneration': (('disabled', 1), ('enabled', 2)),
+		'memSensorsAlarmStatus': (('memNormal', 1), ('memWarning', 2), ('memCritical', 3)),
+		'memSensorsCommStatus': (('notInstalled', 1), ('commsOK', 2), ('commsLost', 3)),
+		'memSensorsStatusSysTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+	},
+}
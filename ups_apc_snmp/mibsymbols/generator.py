@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'generator': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18),
+		'xATSGenerator': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1),
+		'xATSGeneratorAdvStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 3),
+		'xATSGeneratorAdvStatusBatteryVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 3, 1),
+		'xATSGeneratorAdvStatusCoolantLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 3, 6),
+		'xATSGeneratorAdvStatusCoolantTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 3, 3),
+		'xATSGeneratorAdvStatusEngineRPM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 3, 4),
+		'xATSGeneratorAdvStatusOilLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 3, 5),
+		'xATSGeneratorAdvStatusOilPressure': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 3, 2),
+		'xATSGeneratorFuelSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7),
+		'xATSGeneratorFuelSystemEstimatedRunTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 5),
+		'xATSGeneratorFuelSystemFuelLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 3),
+		'xATSGeneratorFuelSystemLowFuelLevelThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 8),
+		'xATSGeneratorFuelSystemLowRunTimeThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 6),
+		'xATSGeneratorFuelSystemRuntimePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 4),
+		'xATSGeneratorFuelSystemTankSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 2),
+		'xATSGeneratorFuelSystemType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 1),
+		'xATSGeneratorFuelSystemVeryLowFuelLevelThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 9),
+		'xATSGeneratorFuelSystemVeryLowRunTimeThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 7, 7),
+		'xATSGeneratorIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 1),
+		'xATSGeneratorIdentAlternatorFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 1, 6),
+		'xATSGeneratorIdentDateofManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 1, 3),
+		'xATSGeneratorIdentMaxPowerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 1, 5),
+		'xATSGeneratorIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 1, 1),
+		'xATSGeneratorIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 1, 2),
+		'xATSGeneratorIdentVoltageConfiguration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 1, 4),
+		'xATSGeneratorOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4),
+		'xATSGeneratorOutputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1, 6),
+		'xATSGeneratorOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 1),
+		'xATSGeneratorOutputPhaseCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1, 4),
+		'xATSGeneratorOutputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1),
+		'xATSGeneratorOutputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1, 1),
+		'xATSGeneratorOutputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6),
+		'xATSGeneratorOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1, 5),
+		'xATSGeneratorOutputPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1, 7),
+		'xATSGeneratorOutputTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 5),
+		'xATSGeneratorOutputTotalApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 3),
+		'xATSGeneratorOutputTotalPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 2),
+		'xATSGeneratorOutputTotalPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 4),
+		'xATSGeneratorOutputVoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1, 2),
+		'xATSGeneratorOutputVoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 4, 6, 1, 3),
+		'xATSGeneratorService': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6),
+		'xATSGeneratorServiceCalendarIntervalThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 12),
+		'xATSGeneratorServiceEngineStartsLifetime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 2),
+		'xATSGeneratorServiceEngineStartsSinceMaintenance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 5),
+		'xATSGeneratorServiceNextServiceDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 9),
+		'xATSGeneratorServiceRecordResetDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 8),
+		'xATSGeneratorServiceResetRecord': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 7),
+		'xATSGeneratorServiceRunHoursThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 11),
+		'xATSGeneratorServiceRunHoursUntilServiceDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 10),
+		'xATSGeneratorServiceTotalRunHoursLifetime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 1),
+		'xATSGeneratorServiceTotalRunHoursSinceMaintenance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 4),
+		'xATSGeneratorServiceTotalkWhLifetime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 3),
+		'xATSGeneratorServiceTotalkWhMaintenance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 6, 6),
+		'xATSGeneratorSettings': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5),
+		'xATSGeneratorSettingsCrankCycleEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 5),
+		'xATSGeneratorSettingsCrankRestTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 7),
+		'xATSGeneratorSettingsCrankTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 6),
+		'xATSGeneratorSettingsFrequencyAdjust': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 2),
+		'xATSGeneratorSettingsMetricUnit': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 9),
+		'xATSGeneratorSettingsNumberCrank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 8),
+		'xATSGeneratorSettingsStartDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 3),
+		'xATSGeneratorSettingsStopDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 4),
+		'xATSGeneratorSettingsVoltageAdjust': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 5, 1),
+		'xATSGeneratorStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 2),
+		'xATSGeneratorStatusGeneratorName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 2, 1),
+		'xATSGeneratorStatusModeSwitchPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 2, 3),
+		'xATSGeneratorStatusOperational': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 2, 2),
+		'xATSGeneratorStatusRemoteStart': (1, 3, 6, 1, 4, 1, 318, 1, 1, 18, 1, 2, 4),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'xATSGeneratorAdvStatusCoolantLevel': (('ok', 1), ('low', 2), ('unknown', 3)),
+		'xATSGeneratorAdvStatusOilLevel': (('ok', 1), ('low', 2), ('unknown', 3)),
+		'xATSGeneratorFuelSystemLowRunTimeThreshold': (('disabled', 1), ('twoDays', 10), ('threeDays', 11), ('fourDays', 12), ('fiveDays', 13), ('sixDays', 14), ('sevenDays', 15), ('oneHour', 2), ('twoHours', 3), ('threeHours', 4), ('fourHours', 5), ('fiveHours', 6), ('sixHours', 7), ('twelveHours', 8), ('oneDay', 9)),
+		'xATSGeneratorFuelSystemType': (('diesel', 1), ('propane', 2), ('naturalGas', 3), ('unknown', 4)),
+		'xATSGeneratorFuelSystemVeryLowRunTimeThreshold': (('disabled', 1), ('twoDays', 10), ('threeDays', 11), ('fourDays', 12), ('fiveDays', 13), ('sixDays', 14), ('sevenDays', 15), ('oneHour', 2), ('twoHours', 3), ('threeHours', 4), ('fourHours', 5), ('fiveHours', 6), ('sixHours', 7), ('twelveHours', 8), ('oneDay', 9)),
+		'xATSGeneratorOutputPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'xATSGeneratorServiceCalendarIntervalThreshold': (('disabled', 1), ('interval1month', 2), ('interval2month', 3), ('interval3month', 4), ('interval6month', 5), ('intervalyearly', 6)),
+		'xATSGeneratorServiceResetRecord': (('yes', 1), ('no', 2)),
+		'xATSGeneratorServiceRunHoursThreshold': (('disabled', 1), ('runThreshold100Hours', 2), ('runThreshold150Hours', 3), ('runThreshold200Hours', 4), ('runThreshold250Hours', 5), ('runThreshold300Hours', 6), ('runThreshold400Hours', 7), ('runThreshold500Hours', 8)),
+		'xATSGeneratorSettingsCrankCycleEnable': (('disabled', 1), ('enabled', 2), ('unknown', 3)),
+		'xATSGeneratorSettingsMetricUnit': (('disabled', 1), ('enabled', 2)),
+		'xATSGeneratorStatusModeSwitchPosition': (('off', 1), ('manual', 2), ('automatic', 3), ('unknown', 4)),
+		'xATSGeneratorStatusOperational': (('nocomm', 1), ('shutdown', 10), ('unknown', 11), ('off', 2), ('ready', 3), ('starting', 4), ('idle', 5), ('running', 6), ('normalStop', 7), ('emergencyStop', 8), ('notInAuto', 9)),
+		'xATSGeneratorStatusRemoteStart': (('stop', 1), ('run', 2), ('unknown', 3)),
+	},
+}
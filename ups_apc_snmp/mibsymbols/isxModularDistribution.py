@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'isxModularDistInfo': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1),
+		'isxModularDistInfoEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2, 1),
+		'isxModularDistInfoMeterDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2, 1, 4),
+		'isxModularDistInfoMeterFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2, 1, 5),
+		'isxModularDistInfoMeterHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2, 1, 6),
+		'isxModularDistInfoMeterModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2, 1, 2),
+		'isxModularDistInfoMeterSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2, 1, 3),
+		'isxModularDistInfoSegmentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2, 1, 1),
+		'isxModularDistInfoTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 2),
+		'isxModularDistInfoTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 1, 1),
+		'isxModularDistModuleBreakerAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 3),
+		'isxModularDistModuleBreakerCableNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 6),
+		'isxModularDistModuleBreakerCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 9),
+		'isxModularDistModuleBreakerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1),
+		'isxModularDistModuleBreakerModIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 1),
+		'isxModularDistModuleBreakerPercent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 10),
+		'isxModularDistModuleBreakerPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 2),
+		'isxModularDistModuleBreakerPhysicalGroup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 5),
+		'isxModularDistModuleBreakerPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 7),
+		'isxModularDistModuleBreakerPositionAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 8),
+		'isxModularDistModuleBreakerPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 11),
+		'isxModularDistModuleBreakerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4, 1, 4),
+		'isxModularDistModuleBreakerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 4),
+		'isxModularDistModuleBreakerTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 3),
+		'isxModularDistModuleInfoAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2, 1, 2),
+		'isxModularDistModuleInfoDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2, 1, 5),
+		'isxModularDistModuleInfoEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2, 1),
+		'isxModularDistModuleInfoModIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2, 1, 1),
+		'isxModularDistModuleInfoModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2, 1, 3),
+		'isxModularDistModuleInfoNumCables': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2, 1, 6),
+		'isxModularDistModuleInfoSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2, 1, 4),
+		'isxModularDistModuleInfoTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 2),
+		'isxModularDistModuleInfoTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 1),
+		'isxModularDistModuleOutputAlarmGeneration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 7),
+		'isxModularDistModuleOutputAlarmHighEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 15),
+		'isxModularDistModuleOutputAlarmLowEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 14),
+		'isxModularDistModuleOutputAlarmMaxEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 16),
+		'isxModularDistModuleOutputAlarmMinEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 13),
+		'isxModularDistModuleOutputAvailableVoltages': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 19),
+		'isxModularDistModuleOutputBreakerMap': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 8),
+		'isxModularDistModuleOutputCableLength': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 17),
+		'isxModularDistModuleOutputConnectorType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 18),
+		'isxModularDistModuleOutputCordIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 3),
+		'isxModularDistModuleOutputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1),
+		'isxModularDistModuleOutputKwhReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 22),
+		'isxModularDistModuleOutputKwhResetDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 23),
+		'isxModularDistModuleOutputKwhUsage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 21),
+		'isxModularDistModuleOutputLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 5),
+		'isxModularDistModuleOutputModIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 1),
+		'isxModularDistModuleOutputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 4),
+		'isxModularDistModuleOutputNumCables': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 2),
+		'isxModularDistModuleOutputStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 6),
+		'isxModularDistModuleOutputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6),
+		'isxModularDistModuleOutputThresholdHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 11),
+		'isxModularDistModuleOutputThresholdLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 10),
+		'isxModularDistModuleOutputThresholdMax': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 12),
+		'isxModularDistModuleOutputThresholdMin': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 9),
+		'isxModularDistModuleOutputTotalPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 6, 1, 20),
+		'isxModularDistModuleOutputsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2, 5),
+		'isxModularDistModules': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 2),
+		'isxModularDistSubFeedInfoAlarmGeneration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 7),
+		'isxModularDistSubFeedInfoAlarmHighEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 14),
+		'isxModularDistSubFeedInfoAlarmLowEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 13),
+		'isxModularDistSubFeedInfoAlarmMaxEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 15),
+		'isxModularDistSubFeedInfoAlarmMinEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 12),
+		'isxModularDistSubFeedInfoAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 6),
+		'isxModularDistSubFeedInfoBreakerAlarmEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 16),
+		'isxModularDistSubFeedInfoBreakerPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 5),
+		'isxModularDistSubFeedInfoBreakerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 4),
+		'isxModularDistSubFeedInfoEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1),
+		'isxModularDistSubFeedInfoKwhReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 19),
+		'isxModularDistSubFeedInfoKwhResetDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 20),
+		'isxModularDistSubFeedInfoKwhUsage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 18),
+		'isxModularDistSubFeedInfoLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 3),
+		'isxModularDistSubFeedInfoName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 2),
+		'isxModularDistSubFeedInfoSubIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 1),
+		'isxModularDistSubFeedInfoTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2),
+		'isxModularDistSubFeedInfoTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 1),
+		'isxModularDistSubFeedInfoThresholdHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 10),
+		'isxModularDistSubFeedInfoThresholdLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 9),
+		'isxModularDistSubFeedInfoThresholdMax': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 11),
+		'isxModularDistSubFeedInfoThresholdMin': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 8),
+		'isxModularDistSubFeedInfoTotalPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 2, 1, 17),
+		'isxModularDistSubFeedLoadingAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4, 1, 3),
+		'isxModularDistSubFeedLoadingCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4, 1, 4),
+		'isxModularDistSubFeedLoadingEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4, 1),
+		'isxModularDistSubFeedLoadingPercent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4, 1, 5),
+		'isxModularDistSubFeedLoadingPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4, 1, 2),
+		'isxModularDistSubFeedLoadingPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4, 1, 6),
+		'isxModularDistSubFeedLoadingSubIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4, 1, 1),
+		'isxModularDistSubFeedLoadingTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 4),
+		'isxModularDistSubFeedLoadingTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3, 3),
+		'isxModularDistSubFeeds': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 3),
+		'isxModularDistSysCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2),
+		'isxModularDistSysCurrentAlarmHighEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 9),
+		'isxModularDistSysCurrentAlarmLowEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 8),
+		'isxModularDistSysCurrentAlarmMaxEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 10),
+		'isxModularDistSysCurrentAlarmMinEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 7),
+		'isxModularDistSysCurrentAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 11, 1, 2),
+		'isxModularDistSysCurrentAmps': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 11, 1, 3),
+		'isxModularDistSysCurrentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 11, 1),
+		'isxModularDistSysCurrentMonitoring': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 2),
+		'isxModularDistSysCurrentPercent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 11, 1, 4),
+		'isxModularDistSysCurrentPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 11, 1, 1),
+		'isxModularDistSysCurrentRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 1),
+		'isxModularDistSysCurrentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 11),
+		'isxModularDistSysCurrentThresholdHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 5),
+		'isxModularDistSysCurrentThresholdLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 4),
+		'isxModularDistSysCurrentThresholdMax': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 6),
+		'isxModularDistSysCurrentThresholdMin': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 2, 3),
+		'isxModularDistSysOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 4),
+		'isxModularDistSysOutputNominalFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 3),
+		'isxModularDistSysOutputVoltageAlarmHighEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 12),
+		'isxModularDistSysOutputVoltageAlarmLowEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 11),
+		'isxModularDistSysOutputVoltageAlarmMaxEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 13),
+		'isxModularDistSysOutputVoltageAlarmMinEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 10),
+		'isxModularDistSysOutputVoltageFrequencyTolerance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 14),
+		'isxModularDistSysOutputVoltageMonitoring': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 5),
+		'isxModularDistSysOutputVoltageNominalLineToLine': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 2),
+		'isxModularDistSysOutputVoltageNominalLineToNeutral': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 1),
+		'isxModularDistSysOutputVoltageThresholdHigh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 8),
+		'isxModularDistSysOutputVoltageThresholdLow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 7),
+		'isxModularDistSysOutputVoltageThresholdMax': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 9),
+		'isxModularDistSysOutputVoltageThresholdMin': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 6),
+		'isxModularDistSysPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3),
+		'isxModularDistSysPowerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 5, 1),
+		'isxModularDistSysPowerKw': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 5, 1, 2),
+		'isxModularDistSysPowerKwhPhaseUsage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 5, 1, 3),
+		'isxModularDistSysPowerKwhReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 3),
+		'isxModularDistSysPowerKwhResetDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 4),
+		'isxModularDistSysPowerKwhUsage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 2),
+		'isxModularDistSysPowerPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 5, 1, 1),
+		'isxModularDistSysPowerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 5),
+		'isxModularDistSysPowerTotal': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 3, 1),
+		'isxModularDistSysVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1),
+		'isxModularDistSysVoltageAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 15, 1, 2),
+		'isxModularDistSysVoltageEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 15, 1),
+		'isxModularDistSysVoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 15, 1, 4),
+		'isxModularDistSysVoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 15, 1, 3),
+		'isxModularDistSysVoltagePhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 15, 1, 1),
+		'isxModularDistSysVoltageTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4, 1, 15),
+		'isxModularDistTotals': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22, 4),
+		'isxModularDistribution': (1, 3, 6, 1, 4, 1, 318, 1, 1, 22),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'isxModularDistModuleBreakerPhaseIndex': (('phaseL1', 1), ('phaseL2', 2), ('phaseL3', 3)),
+		'isxModularDistModuleBreakerPosition': (('open', 1), ('closed', 2)),
+		'isxModularDistModuleBreakerPositionAlarms': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistModuleInfoAlarmStatus': (('normal', 1), ('warning', 2), ('critical', 3), ('notPresent', 4), ('unknown', 5)),
+		'isxModularDistModuleOutputAlarmGeneration': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistModuleOutputAlarmHighEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistModuleOutputAlarmLowEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistModuleOutputAlarmMaxEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistModuleOutputAlarmMinEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistModuleOutputKwhReset': (('no', 1), ('yes', 2)),
+		'isxModularDistModuleOutputStatus': (('normal', 1), ('warning', 2), ('critical', 3), ('notPresent', 4), ('unknown', 6)),
+		'isxModularDistSubFeedInfoAlarmGeneration': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSubFeedInfoAlarmHighEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSubFeedInfoAlarmLowEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSubFeedInfoAlarmMaxEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSubFeedInfoAlarmMinEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSubFeedInfoAlarmStatus': (('normal', 1), ('warning', 2), ('critical', 3)),
+		'isxModularDistSubFeedInfoBreakerAlarmEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSubFeedInfoBreakerPosition': (('open', 1), ('closed', 2)),
+		'isxModularDistSubFeedInfoKwhReset': (('no', 1), ('yes', 2)),
+		'isxModularDistSubFeedLoadingPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'isxModularDistSysCurrentAlarmHighEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysCurrentAlarmLowEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysCurrentAlarmMaxEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysCurrentAlarmMinEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysCurrentMonitoring': (('notPresent', 1), ('present', 2)),
+		'isxModularDistSysCurrentPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'isxModularDistSysOutputVoltageAlarmHighEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysOutputVoltageAlarmLowEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysOutputVoltageAlarmMaxEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysOutputVoltageAlarmMinEnable': (('disabled', 1), ('enabled', 2)),
+		'isxModularDistSysOutputVoltageFrequencyTolerance': (('freqToleranceOff', 1), ('freqToleranceNine', 10), ('freqToleranceNotAvailable', 11), ('freqTolerancePointTwo', 2), ('freqTolerancePointFive', 3), ('freqToleranceOne', 4), ('freqToleranceOnePointFive', 5), ('freqToleranceTwo', 6), ('freqToleranceThree', 7), ('freqToleranceFour', 8), ('freqToleranceFive', 9)),
+		'isxModularDistSysOutputVoltageMonitoring': (('notPresent', 1), ('present', 2)),
+		'isxModularDistSysPowerKwhReset': (('no', 1), ('yes', 2)),
+		'isxModularDistSysPowerPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'isxModularDistSysVoltagePhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+	},
+}
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'isxModularPdu': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23),
+		'isxModularPduAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 3, 1),
+		'isxModularPduDevice': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 2),
+		'isxModularPduDeviceFansPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 2, 3),
+		'isxModularPduDeviceNominalMainInputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 2, 4),
+		'isxModularPduDeviceServiceType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 2, 2),
+		'isxModularPduDeviceTransformerPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 2, 1),
+		'isxModularPduFanStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 3, 3),
+		'isxModularPduIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1),
+		'isxModularPduIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1, 3),
+		'isxModularPduIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1, 1),
+		'isxModularPduIdentMonitorCardFirmwareAppOSRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1, 7),
+		'isxModularPduIdentMonitorCardFirmwareAppRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1, 6),
+		'isxModularPduIdentMonitorCardHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1, 5),
+		'isxModularPduIdentMonitorCardSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1, 4),
+		'isxModularPduIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 1, 2),
+		'isxModularPduStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 3),
+		'isxModularPduTransformerTempStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 23, 3, 2),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'isxModularPduAlarmStatus': (('normal', 1), ('warning', 2), ('critical', 3)),
+		'isxModularPduDeviceFansPresent': (('notPresent', 1), ('present', 2)),
+		'isxModularPduDeviceServiceType': (('threeWire', 1), ('fourWire', 2)),
+		'isxModularPduDeviceTransformerPresent': (('notPresent', 1), ('isoXfmrPresent', 2), ('autoXfmrPresent', 3)),
+		'isxModularPduFanStatus': (('normal', 1), ('failed', 2), ('noCoolingFansPresent', 3), ('unknown', 4)),
+		'isxModularPduTransformerTempStatus': (('normal', 1), ('overtemp', 2), ('noTransformerPresent', 3), ('unknown', 4)),
+	},
+}
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'masterswitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4),
+		'sPDUIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 1),
+		'sPDUIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 1, 3),
+		'sPDUIdentFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 1, 2),
+		'sPDUIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 1, 1),
+		'sPDUIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 1, 4),
+		'sPDUIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 1, 5),
+		'sPDUMasterConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 3),
+		'sPDUMasterConfigPDUName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 3, 3),
+		'sPDUMasterConfigPowerOn': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 3, 1),
+		'sPDUMasterConfigReboot': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 3, 2),
+		'sPDUMasterControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 2),
+		'sPDUMasterControlSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 2, 1),
+		'sPDUMasterPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 2, 3),
+		'sPDUMasterState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 2, 2),
+		'sPDUOutletConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5),
+		'sPDUOutletConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 2, 1),
+		'sPDUOutletConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 2, 1, 1),
+		'sPDUOutletConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 2),
+		'sPDUOutletConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 1),
+		'sPDUOutletControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4),
+		'sPDUOutletControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4, 2, 1),
+		'sPDUOutletControlIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4, 2, 1, 1),
+		'sPDUOutletControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4, 2),
+		'sPDUOutletControlTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4, 1),
+		'sPDUOutletCtl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4, 2, 1, 3),
+		'sPDUOutletCtlName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4, 2, 1, 4),
+		'sPDUOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 2, 1, 3),
+		'sPDUOutletPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 4, 2, 1, 2),
+		'sPDUOutletPowerOffTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 2, 1, 4),
+		'sPDUOutletPowerOnTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 2, 1, 2),
+		'sPDUOutletRebootDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 4, 5, 2, 1, 5),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'sPDUMasterControlSwitch': (('turnAllOnNow', 1), ('turnAllOnSequence', 2), ('turnAllOffNow', 3), ('rebootAllNow', 4), ('rebootAllSequence', 5), ('noCommand', 6), ('turnAllOffSequence', 7)),
+		'sPDUOutletCtl': (('outletOn', 1), ('outletOff', 2), ('outletReboot', 3), ('outletUnknown', 4), ('outletOnWithDelay', 5), ('outletOffWithDelay', 6), ('outletRebootWithDelay', 7)),
+		'sPDUOutletPending': (('commandPending', 1), ('noCommandPending', 2), ('commandPendingUnknown', 3)),
+	},
+}
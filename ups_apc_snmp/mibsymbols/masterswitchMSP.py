@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'masterswitchMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6),
+		'sPDUIdentDateOfManufactureMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1, 5),
+		'sPDUIdentFirmwareRevMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1, 4),
+		'sPDUIdentHardwareRevMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1, 3),
+		'sPDUIdentMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1),
+		'sPDUIdentMSPEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1),
+		'sPDUIdentMSPIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1, 1),
+		'sPDUIdentMSPTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2),
+		'sPDUIdentMSPTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 1),
+		'sPDUIdentModelNumberMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1, 6),
+		'sPDUIdentNameMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1, 2),
+		'sPDUIdentSerialNumberMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 1, 2, 1, 7),
+		'sPDUMasterConfigMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3),
+		'sPDUMasterConfigMSPEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3, 2, 1),
+		'sPDUMasterConfigMSPIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3, 2, 1, 1),
+		'sPDUMasterConfigMSPManualButton': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3, 2, 1, 4),
+		'sPDUMasterConfigMSPName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3, 2, 1, 2),
+		'sPDUMasterConfigMSPPowerOnTimeDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3, 2, 1, 3),
+		'sPDUMasterConfigMSPTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3, 2),
+		'sPDUMasterConfigMSPTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 3, 1),
+		'sPDUMasterControlMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 2),
+		'sPDUMasterControlMSPCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 2, 2, 1, 3),
+		'sPDUMasterControlMSPEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 2, 2, 1),
+		'sPDUMasterControlMSPIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 2, 2, 1, 1),
+		'sPDUMasterControlMSPName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 2, 2, 1, 2),
+		'sPDUMasterControlMSPTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 2, 2),
+		'sPDUMasterControlMSPTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 2, 1),
+		'sPDUMasterStatusMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 4),
+		'sPDUMasterStatusMSPEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 4, 2, 1),
+		'sPDUMasterStatusMSPIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 4, 2, 1, 1),
+		'sPDUMasterStatusMSPName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 4, 2, 1, 2),
+		'sPDUMasterStatusMSPOutletCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 4, 2, 1, 3),
+		'sPDUMasterStatusMSPTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 4, 2),
+		'sPDUMasterStatusMSPTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 4, 1),
+		'sPDUOutletConfigMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6),
+		'sPDUOutletConfigMSPall': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1),
+		'sPDUOutletConfigMSPallEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1, 1, 1),
+		'sPDUOutletConfigMSPallIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1, 1, 1, 1),
+		'sPDUOutletConfigMSPallName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1, 1, 1, 2),
+		'sPDUOutletConfigMSPallOutletCtrlMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1, 1, 1, 5),
+		'sPDUOutletConfigMSPallOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1, 1, 1, 3),
+		'sPDUOutletConfigMSPallOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1, 1, 1, 4),
+		'sPDUOutletConfigMSPallTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 1, 1),
+		'sPDUOutletConfigMSPannun': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3),
+		'sPDUOutletConfigMSPannunAlarmActionDly': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1, 7),
+		'sPDUOutletConfigMSPannunEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1),
+		'sPDUOutletConfigMSPannunIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1, 1),
+		'sPDUOutletConfigMSPannunInitialState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1, 6),
+		'sPDUOutletConfigMSPannunName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1, 2),
+		'sPDUOutletConfigMSPannunOutletCtrlMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1, 5),
+		'sPDUOutletConfigMSPannunOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1, 3),
+		'sPDUOutletConfigMSPannunOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1, 1, 4),
+		'sPDUOutletConfigMSPannunTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 3, 1),
+		'sPDUOutletConfigMSPgs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2),
+		'sPDUOutletConfigMSPgsBattCapThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 12),
+		'sPDUOutletConfigMSPgsDeviceConfirm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 6),
+		'sPDUOutletConfigMSPgsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1),
+		'sPDUOutletConfigMSPgsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 1),
+		'sPDUOutletConfigMSPgsLowBattMult': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 8),
+		'sPDUOutletConfigMSPgsLowBattWarning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 7),
+		'sPDUOutletConfigMSPgsName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 2),
+		'sPDUOutletConfigMSPgsOutletCtrlMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 5),
+		'sPDUOutletConfigMSPgsOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 3),
+		'sPDUOutletConfigMSPgsOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 4),
+		'sPDUOutletConfigMSPgsPowerOffDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 11),
+		'sPDUOutletConfigMSPgsPowerOnDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 10),
+		'sPDUOutletConfigMSPgsRebootDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 13),
+		'sPDUOutletConfigMSPgsRestartDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1, 1, 9),
+		'sPDUOutletConfigMSPgsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 2, 1),
+		'sPDUOutletConfigMSPmups': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4),
+		'sPDUOutletConfigMSPmupsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1),
+		'sPDUOutletConfigMSPmupsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 1),
+		'sPDUOutletConfigMSPmupsName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 2),
+		'sPDUOutletConfigMSPmupsOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 3),
+		'sPDUOutletConfigMSPmupsOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 4),
+		'sPDUOutletConfigMSPmupsP1HiHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 10),
+		'sPDUOutletConfigMSPmupsP1HiTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 12),
+		'sPDUOutletConfigMSPmupsP1LowHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 9),
+		'sPDUOutletConfigMSPmupsP1LowTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 11),
+		'sPDUOutletConfigMSPmupsP2HiHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 14),
+		'sPDUOutletConfigMSPmupsP2HiTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 16),
+		'sPDUOutletConfigMSPmupsP2LowHum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 13),
+		'sPDUOutletConfigMSPmupsP2LowTemp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 15),
+		'sPDUOutletConfigMSPmupsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1),
+		'sPDUOutletConfigMSPmupsZone1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 5),
+		'sPDUOutletConfigMSPmupsZone2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 6),
+		'sPDUOutletConfigMSPmupsZone3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 7),
+		'sPDUOutletConfigMSPmupsZone4': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 6, 4, 1, 1, 8),
+		'sPDUOutletControlMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5),
+		'sPDUOutletControlMSPEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5, 1, 1),
+		'sPDUOutletControlMSPIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5, 1, 1, 1),
+		'sPDUOutletControlMSPName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5, 1, 1, 2),
+		'sPDUOutletControlMSPOutletCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5, 1, 1, 5),
+		'sPDUOutletControlMSPOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5, 1, 1, 3),
+		'sPDUOutletControlMSPOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5, 1, 1, 4),
+		'sPDUOutletControlMSPTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 5, 1),
+		'sPDUOutletStatusMSP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7),
+		'sPDUOutletStatusMSPCommandPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1, 6),
+		'sPDUOutletStatusMSPEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1),
+		'sPDUOutletStatusMSPIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1, 1),
+		'sPDUOutletStatusMSPName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1, 2),
+		'sPDUOutletStatusMSPOutletCtrlMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1, 7),
+		'sPDUOutletStatusMSPOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1, 3),
+		'sPDUOutletStatusMSPOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1, 4),
+		'sPDUOutletStatusMSPOutletState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1, 1, 5),
+		'sPDUOutletStatusMSPTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 6, 7, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'sPDUMasterConfigMSPManualButton': (('manualButtonDisabled', 1), ('manualButtonEnabled', 2)),
+		'sPDUMasterControlMSPCommand': (('noCommandAllMSP', 1), ('restoreFactoryDefaultsMSP', 10), ('immediateAllOnMSP', 2), ('sequencedAllOnMSP', 3), ('immediateAllOffMSP', 4), ('gracefulAllRebootMSP', 5), ('immediateAllRebootMSP', 6), ('gracefulAllShutdownMSP', 7), ('overrideAllBatCapThreshMSP', 8), ('cancelAllPendingCommandsMSP', 9)),
+		'sPDUOutletConfigMSPallOutletCtrlMode': (('modeGracefulShutdown', 1), ('modeAnnunciator', 2)),
+		'sPDUOutletConfigMSPannunInitialState': (('initialStateOff', 1), ('initialStateOn', 2)),
+		'sPDUOutletConfigMSPannunOutletCtrlMode': (('modeGracefulShutdown', 1), ('modeAnnunciator', 2)),
+		'sPDUOutletConfigMSPgsDeviceConfirm': (('deviceConfirmNo', 1), ('deviceConfirmYes', 2)),
+		'sPDUOutletConfigMSPgsOutletCtrlMode': (('modeGracefulShutdown', 1), ('modeAnnunciator', 2)),
+		'sPDUOutletConfigMSPmupsP1HiHum': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsP1HiTemp': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsP1LowHum': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsP1LowTemp': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsP2HiHum': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsP2HiTemp': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsP2LowHum': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsP2LowTemp': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsZone1': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsZone2': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsZone3': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletConfigMSPmupsZone4': (('disableAlarm', 1), ('enableAlarm', 2)),
+		'sPDUOutletControlMSPOutletCommand': (('immediateOnMSP', 1), ('delayedOnMSP', 2), ('immediateOffMSP', 3), ('gracefulRebootMSP', 4), ('immediateRebootMSP', 5), ('gracefulshutdownMSP', 6), ('overrideBatCapThreshMSP', 7), ('cancelPendingCommandMSP', 8)),
+		'sPDUOutletStatusMSPCommandPending': (('outletStatusMSPCommandPending', 1), ('outletStatusMSPNoCommandPending', 2)),
+		'sPDUOutletStatusMSPOutletCtrlMode': (('modeGracefulShutdown', 1), ('modeAnnunciator', 2)),
+		'sPDUOutletStatusMSPOutletState': (('outletStatusMSPOn', 1), ('outletStatusMSPOff', 2)),
+	},
+}
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'masterswitchVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5),
+		'sPDUIdentDateOfManufactureVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1, 5),
+		'sPDUIdentFirmwareRevVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1, 4),
+		'sPDUIdentHardwareRevVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1, 3),
+		'sPDUIdentModelNumberVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1, 6),
+		'sPDUIdentNameVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1, 2),
+		'sPDUIdentSerialNumberVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1, 7),
+		'sPDUIdentVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1),
+		'sPDUIdentVMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1),
+		'sPDUIdentVMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2, 1, 1),
+		'sPDUIdentVMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 2),
+		'sPDUIdentVMTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 1, 1),
+		'sPDUMasterConfigVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3),
+		'sPDUMasterConfigVMAudioAlarmActivated': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1, 4),
+		'sPDUMasterConfigVMColdstartDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1, 3),
+		'sPDUMasterConfigVMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1),
+		'sPDUMasterConfigVMHighLoadWarningThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1, 5),
+		'sPDUMasterConfigVMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1, 1),
+		'sPDUMasterConfigVMLowLoadWarningThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1, 6),
+		'sPDUMasterConfigVMName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1, 2),
+		'sPDUMasterConfigVMOverloadRestriction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2, 1, 7),
+		'sPDUMasterConfigVMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 2),
+		'sPDUMasterConfigVMTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 3, 1),
+		'sPDUMasterControlVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 2),
+		'sPDUMasterControlVMCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 2, 2, 1, 3),
+		'sPDUMasterControlVMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 2, 2, 1),
+		'sPDUMasterControlVMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 2, 2, 1, 1),
+		'sPDUMasterControlVMName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 2, 2, 1, 2),
+		'sPDUMasterControlVMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 2, 2),
+		'sPDUMasterControlVMTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 2, 1),
+		'sPDUMasterStatusVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4),
+		'sPDUMasterStatusVMCommandPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 3),
+		'sPDUMasterStatusVMCurrentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 6),
+		'sPDUMasterStatusVMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1),
+		'sPDUMasterStatusVMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 1),
+		'sPDUMasterStatusVMLowLoadCondition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 5),
+		'sPDUMasterStatusVMMaxLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 7),
+		'sPDUMasterStatusVMName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 2),
+		'sPDUMasterStatusVMOutletCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 8),
+		'sPDUMasterStatusVMOverloadCondition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 4),
+		'sPDUMasterStatusVMRebootDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2, 1, 9),
+		'sPDUMasterStatusVMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 2),
+		'sPDUMasterStatusVMTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 4, 1),
+		'sPDUOutletConfigVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6),
+		'sPDUOutletConfigVMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1),
+		'sPDUOutletConfigVMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1, 1),
+		'sPDUOutletConfigVMName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1, 2),
+		'sPDUOutletConfigVMOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1, 3),
+		'sPDUOutletConfigVMOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1, 4),
+		'sPDUOutletConfigVMPowerOffTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1, 6),
+		'sPDUOutletConfigVMPowerOnTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1, 5),
+		'sPDUOutletConfigVMRebootDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1, 1, 7),
+		'sPDUOutletConfigVMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 6, 1),
+		'sPDUOutletControlVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5),
+		'sPDUOutletControlVMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5, 1, 1),
+		'sPDUOutletControlVMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5, 1, 1, 1),
+		'sPDUOutletControlVMName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5, 1, 1, 2),
+		'sPDUOutletControlVMOutletCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5, 1, 1, 5),
+		'sPDUOutletControlVMOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5, 1, 1, 3),
+		'sPDUOutletControlVMOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5, 1, 1, 4),
+		'sPDUOutletControlVMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 5, 1),
+		'sPDUOutletStatusVM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7),
+		'sPDUOutletStatusVMCommandPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1, 1, 6),
+		'sPDUOutletStatusVMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1, 1),
+		'sPDUOutletStatusVMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1, 1, 1),
+		'sPDUOutletStatusVMName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1, 1, 2),
+		'sPDUOutletStatusVMOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1, 1, 3),
+		'sPDUOutletStatusVMOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1, 1, 4),
+		'sPDUOutletStatusVMOutletState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1, 1, 5),
+		'sPDUOutletStatusVMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 5, 7, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'sPDUMasterConfigVMAudioAlarmActivated': (('audioAlarmActiveNever', 1), ('audioAlarmActiveOnOverload', 2), ('audioAlarmActiveOnOverloadImminent', 3)),
+		'sPDUMasterConfigVMOverloadRestriction': (('alwaysAllowTurnON', 1), ('restrictOnWarning', 2), ('restrictOnOverload', 3)),
+		'sPDUMasterControlVMCommand': (('noCommandAllVM', 1), ('cancelAllPendingCommandsVM', 10), ('audioAlarmMute', 11), ('immediateAllOnVM', 2), ('immediateAllOffVM', 3), ('immediateAllRebootVM', 4), ('delayedAllOnVM', 5), ('delayedAllOffVM', 6), ('sequencedAllRebootVM', 7), ('delayedAllRebootVM', 8), ('delayedSequenceAllRebootVM', 9)),
+		'sPDUMasterStatusVMCommandPending': (('commandPendingMasterTrueVM', 1), ('commandPendingMasterFalseVM', 2)),
+		'sPDUMasterStatusVMLowLoadCondition': (('lowLoadConditionTrueVM', 1), ('lowLoadConditionFalseVM', 2)),
+		'sPDUMasterStatusVMOverloadCondition': (('overloadConditionTrueVM', 1), ('overloadConditionFalseVM', 2)),
+		'sPDUOutletControlVMOutletCommand': (('immediateOnVM', 1), ('immediateOffVM', 2), ('immediateRebootVM', 3), ('delayedOnVM', 4), ('delayedOffVM', 5), ('delayedRebootVM', 6), ('cancelPendingCommandVM', 7)),
+		'sPDUOutletStatusVMCommandPending': (('outletStatusVMCommandPending', 1), ('outletStatusVMNoCommandPending', 2)),
+		'sPDUOutletStatusVMOutletState': (('outletStatusVMOn', 1), ('outletStatusVMOff', 2)),
+	},
+}
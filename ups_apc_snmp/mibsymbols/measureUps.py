@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'contactNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 2, 1, 1),
+		'currentStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 2, 1, 5),
+		'description': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 2, 1, 3),
+		'mUpsContact': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2),
+		'mUpsContactEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 2, 1),
+		'mUpsContactNumContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 1),
+		'mUpsContactTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 2),
+		'mUpsEnviron': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 1),
+		'mUpsEnvironAmbientTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 1, 1),
+		'mUpsEnvironAmbientTemperature2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 1, 3),
+		'mUpsEnvironRelativeHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 1, 2),
+		'mUpsEnvironRelativeHumidity2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 1, 4),
+		'measureUps': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2),
+		'monitoringStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 2, 1, 4),
+		'normalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 2, 2, 2, 1, 2),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'currentStatus': (('unknown', 1), ('noFault', 2), ('fault', 3)),
+		'monitoringStatus': (('unknown', 1), ('enabled', 2), ('disabled', 3)),
+		'normalState': (('unknown', 1), ('open', 2), ('closed', 3)),
+	},
+}
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'miniSNMPadapter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3),
+		'serialPort': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3, 1),
+		'serialPort1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3, 1, 1),
+		'serialPort2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3, 1, 2),
+		'serialPort2Config': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3, 1, 2, 1),
+		'serialPort2Control': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3, 1, 2, 2),
+		'serialPort2Mode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3, 1, 2, 1, 1),
+		'setPulseOnTXD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 3, 1, 2, 2, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'serialPort2Mode': (('localConsole', 1), ('passthrough', 2)),
+		'setPulseOnTXD': (('noSetPulseOnTXD', 1), ('setPulseOnTXD', 2), ('setTXDLow', 3), ('setTXDHigh', 4)),
+	},
+}
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'netlock': (1, 3, 6, 1, 4, 1, 318, 1, 1, 11),
+		'nlIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 11, 1),
+		'nlStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 11, 2),
+	},
+}
+
+NAMED_VALUES = {
+}
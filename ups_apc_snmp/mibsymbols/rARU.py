@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'rARU': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14),
+		'rARUConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2),
+		'rARUConfigAruIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1, 1, 1),
+		'rARUConfigAruMasterControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1, 1, 6),
+		'rARUConfigAruName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1, 1, 2),
+		'rARUConfigAruRemoteSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1, 1, 3),
+		'rARUConfigAruTempOvrdEnableDisable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1, 1, 4),
+		'rARUConfigAruTempOvrdSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1, 1, 5),
+		'rARUConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1, 1),
+		'rARUConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 2, 1),
+		'rARUFanStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4),
+		'rARUFanStatusAruIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 1),
+		'rARUFanStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1),
+		'rARUFanStatusFanFlowRate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 8),
+		'rARUFanStatusFanInServiceDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 9),
+		'rARUFanStatusFanIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 5),
+		'rARUFanStatusFanOperatingStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 6),
+		'rARUFanStatusFanRpmSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 7),
+		'rARUFanStatusFanRunhourCounter': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 10),
+		'rARUFanStatusFanRunhourReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 11),
+		'rARUFanStatusNominalFanSpeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 2),
+		'rARUFanStatusReplacementThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 4),
+		'rARUFanStatusSelectedFanLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1, 1, 3),
+		'rARUFanStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 4, 1),
+		'rARUIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 1),
+		'rARUIdentAruIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 1, 1, 1, 1),
+		'rARUIdentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 1, 1, 1),
+		'rARUIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 1, 1, 1, 2),
+		'rARUIdentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 1, 1),
+		'rARUPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 5),
+		'rARUPowerStatusAruIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 5, 1, 1, 1),
+		'rARUPowerStatusAuxiliaryAcPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 5, 1, 1, 3),
+		'rARUPowerStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 5, 1, 1),
+		'rARUPowerStatusPrimaryAcPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 5, 1, 1, 2),
+		'rARUPowerStatusRedundantAcConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 5, 1, 1, 4),
+		'rARUPowerStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 5, 1),
+		'rARUSensors': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6),
+		'rARUSensorsConfigAruIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 1),
+		'rARUSensorsConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1),
+		'rARUSensorsConfigSensorNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 2),
+		'rARUSensorsConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4),
+		'rARUSensorsConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 3),
+		'rARUSensorsLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 4),
+		'rARUSensorsName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 3),
+		'rARUSensorsStatusAruIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 2, 1, 1),
+		'rARUSensorsStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 2, 1),
+		'rARUSensorsStatusSensorNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 2, 1, 2),
+		'rARUSensorsStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 2),
+		'rARUSensorsStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 1),
+		'rARUSensorsTempHighThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 6),
+		'rARUSensorsTempLongDecRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 15),
+		'rARUSensorsTempLongDecRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 14),
+		'rARUSensorsTempLongIncRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 17),
+		'rARUSensorsTempLongIncRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 16),
+		'rARUSensorsTempLowThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 7),
+		'rARUSensorsTempMaxThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 5),
+		'rARUSensorsTempMinThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 8),
+		'rARUSensorsTempShortDecRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 11),
+		'rARUSensorsTempShortDecRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 10),
+		'rARUSensorsTempShortIncRateThreshTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 13),
+		'rARUSensorsTempShortIncRateThreshValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 12),
+		'rARUSensorsTempThreshHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 4, 1, 9),
+		'rARUSensorsTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 6, 2, 1, 3),
+		'rARUStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3),
+		'rARUStatusAruAlarmState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 10),
+		'rARUStatusAruCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 11),
+		'rARUStatusAruDeviceCount': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 1),
+		'rARUStatusAruIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 1),
+		'rARUStatusAruManualSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 4),
+		'rARUStatusAruMasterControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 13),
+		'rARUStatusAruName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 2),
+		'rARUStatusAruRemoteSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 3),
+		'rARUStatusAruTemp1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 5),
+		'rARUStatusAruTemp2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 6),
+		'rARUStatusAruTemp3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 7),
+		'rARUStatusAruTempOvrdEnableDisable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 8),
+		'rARUStatusAruTempOvrdSetpoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 9),
+		'rARUStatusAruTempOvrdStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 12),
+		'rARUStatusAruTotalAirflow': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1, 14),
+		'rARUStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3, 1),
+		'rARUStatusSysTempUnits': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 2),
+		'rARUStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 14, 3, 3),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'rARUConfigAruMasterControl': (('aruOn', 1), ('aruOff', 2)),
+		'rARUConfigAruRemoteSetpoint': (('aruOff', 1), ('aru400cfm', 10), ('aru600cfm', 11), ('aru700cfm', 12), ('aru900cfm', 13), ('aru1000cfm', 14), ('aru1400cfm', 15), ('aru1600cfm', 16), ('aru1800cfm', 17), ('aru2000cfm', 18), ('aru85F-29C', 2), ('aru90F-32C', 3), ('aru95F-35C', 4), ('aru100F-38C', 5), ('aru7kW-1200cfm', 6), ('aru5kW-800cfm', 7), ('aru3kW-500cfm', 8), ('aru2kW-300cfm', 9)),
+		'rARUConfigAruTempOvrdEnableDisable': (('disabled', 1), ('enabled', 2)),
+		'rARUFanStatusFanOperatingStatus': (('unknown', 1), ('off', 2), ('onOk', 3), ('onDegraded', 4), ('offFailed', 5)),
+		'rARUFanStatusFanRunhourReset': (('yes', 1), ('no', 2)),
+		'rARUFanStatusReplacementThreshold': (('disabled', 1), ('khr20', 2), ('khr25', 3), ('khr30', 4), ('khr35', 5), ('khr40', 6), ('khr50', 7)),
+		'rARUPowerStatusAuxiliaryAcPresent': (('yes', 1), ('no', 2)),
+		'rARUPowerStatusPrimaryAcPresent': (('yes', 1), ('no', 2)),
+		'rARUPowerStatusRedundantAcConfig': (('singleCord', 1), ('dualCord', 2)),
+		'rARUStatusAruCommStatus': (('commsNeverDiscovered', 1), ('commsEstablished', 2), ('commsLost', 3)),
+		'rARUStatusAruManualSetpoint': (('aruOff', 1), ('aruRem', 10), ('aru85F-29C', 2), ('aru90F-32C', 3), ('aru95F-35C', 4), ('aru100F-38C', 5), ('aru7kW', 6), ('aru5kW', 7), ('aru3kW', 8), ('aru2kW', 9)),
+		'rARUStatusAruMasterControl': (('aruOn', 1), ('aruOff', 2)),
+		'rARUStatusAruRemoteSetpoint': (('aruOff', 1), ('aru400cfm', 10), ('aru600cfm', 11), ('aru700cfm', 12), ('aru900cfm', 13), ('aru1000cfm', 14), ('aru1400cfm', 15), ('aru1600cfm', 16), ('aru1800cfm', 17), ('aru2000cfm', 18), ('aru85F-29C', 2), ('aru90F-32C', 3), ('aru95F-35C', 4), ('aru100F-38C', 5), ('aru7kW-1200cfm', 6), ('aru5kW-800cfm', 7), ('aru3kW-500cfm', 8), ('aru2kW-300cfm', 9)),
+		'rARUStatusAruTempOvrdEnableDisable': (('disabled', 1), ('enabled', 2)),
+		'rARUStatusAruTempOvrdStatus': (('inactive', 1), ('active', 2)),
+		'rARUStatusSysTempUnits': (('celsius', 1), ('fahrenheit', 2)),
+	},
+}
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'rPDU': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12),
+		'rPDUIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1),
+		'rPDUIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 4),
+		'rPDUIdentDeviceBreakerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 11),
+		'rPDUIdentDeviceDisplayOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 14),
+		'rPDUIdentDeviceLinetoLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 15),
+		'rPDUIdentDeviceLinetoNeutralVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 19),
+		'rPDUIdentDeviceNumBreakers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 10),
+		'rPDUIdentDeviceNumOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 8),
+		'rPDUIdentDeviceNumPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 9),
+		'rPDUIdentDeviceOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 12),
+		'rPDUIdentDeviceOutletLayout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 13),
+		'rPDUIdentDevicePowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 17),
+		'rPDUIdentDevicePowerVA': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 18),
+		'rPDUIdentDevicePowerWatts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 16),
+		'rPDUIdentDeviceRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 7),
+		'rPDUIdentFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 3),
+		'rPDUIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 2),
+		'rPDUIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 5),
+		'rPDUIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 1),
+		'rPDUIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 1, 6),
+		'rPDULoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2),
+		'rPDULoadBankConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4),
+		'rPDULoadBankConfigAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4, 1, 1, 5),
+		'rPDULoadBankConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4, 1, 1),
+		'rPDULoadBankConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4, 1, 1, 1),
+		'rPDULoadBankConfigLowLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4, 1, 1, 2),
+		'rPDULoadBankConfigNearOverloadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4, 1, 1, 3),
+		'rPDULoadBankConfigOverloadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4, 1, 1, 4),
+		'rPDULoadBankConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 4, 1),
+		'rPDULoadDevBankEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 6, 1),
+		'rPDULoadDevBankIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 6, 1, 1),
+		'rPDULoadDevBankMaxLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 6, 1, 3),
+		'rPDULoadDevBankNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 6, 1, 2),
+		'rPDULoadDevBankTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 6),
+		'rPDULoadDevBankTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 5),
+		'rPDULoadDevMaxBankLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 3),
+		'rPDULoadDevMaxOutletEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 8, 1),
+		'rPDULoadDevMaxOutletLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 8, 1, 3),
+		'rPDULoadDevMaxOutletTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 8),
+		'rPDULoadDevMaxOutletTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 7),
+		'rPDULoadDevMaxPhaseLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 1),
+		'rPDULoadDevNumBanks': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 4),
+		'rPDULoadDevNumPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 2),
+		'rPDULoadDevOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 8, 1, 1),
+		'rPDULoadDevOutletNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1, 8, 1, 2),
+		'rPDULoadDevice': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 1),
+		'rPDULoadPhaseConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2),
+		'rPDULoadPhaseConfigAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2, 1, 1, 5),
+		'rPDULoadPhaseConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2, 1, 1),
+		'rPDULoadPhaseConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2, 1, 1, 1),
+		'rPDULoadPhaseConfigLowLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2, 1, 1, 2),
+		'rPDULoadPhaseConfigNearOverloadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2, 1, 1, 3),
+		'rPDULoadPhaseConfigOverloadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2, 1, 1, 4),
+		'rPDULoadPhaseConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 2, 1),
+		'rPDULoadStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3),
+		'rPDULoadStatusBankNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3, 1, 1, 5),
+		'rPDULoadStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3, 1, 1),
+		'rPDULoadStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3, 1, 1, 1),
+		'rPDULoadStatusLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3, 1, 1, 2),
+		'rPDULoadStatusLoadState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3, 1, 1, 3),
+		'rPDULoadStatusPhaseNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3, 1, 1, 4),
+		'rPDULoadStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 2, 3, 1),
+		'rPDUOutlet': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3),
+		'rPDUOutletBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 6),
+		'rPDUOutletBankEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 6, 1, 1),
+		'rPDUOutletBankIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 6, 1, 1, 1),
+		'rPDUOutletBankOverloadRestriction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 6, 1, 1, 2),
+		'rPDUOutletBankTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 6, 1),
+		'rPDUOutletConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4),
+		'rPDUOutletConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1),
+		'rPDUOutletConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1, 1),
+		'rPDUOutletConfigMonitoredEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3, 1),
+		'rPDUOutletConfigMonitoredIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3, 1, 1),
+		'rPDUOutletConfigMonitoredLowLoadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3, 1, 4),
+		'rPDUOutletConfigMonitoredName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3, 1, 2),
+		'rPDUOutletConfigMonitoredNearOverloadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3, 1, 5),
+		'rPDUOutletConfigMonitoredNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3, 1, 3),
+		'rPDUOutletConfigMonitoredOverloadThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3, 1, 6),
+		'rPDUOutletConfigMonitoredTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 3),
+		'rPDUOutletConfigMonitoredTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 2),
+		'rPDUOutletConfigOutletBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1, 7),
+		'rPDUOutletConfigOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1, 2),
+		'rPDUOutletConfigOutletPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1, 3),
+		'rPDUOutletConfigPowerOffTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1, 5),
+		'rPDUOutletConfigPowerOnTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1, 4),
+		'rPDUOutletConfigRebootDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1, 1, 6),
+		'rPDUOutletConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 4, 1),
+		'rPDUOutletControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3),
+		'rPDUOutletControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3, 1, 1),
+		'rPDUOutletControlIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3, 1, 1, 1),
+		'rPDUOutletControlOutletBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3, 1, 1, 5),
+		'rPDUOutletControlOutletCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3, 1, 1, 4),
+		'rPDUOutletControlOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3, 1, 1, 2),
+		'rPDUOutletControlOutletPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3, 1, 1, 3),
+		'rPDUOutletControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 3, 1),
+		'rPDUOutletDevColdstartDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 1, 2),
+		'rPDUOutletDevCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 1, 1),
+		'rPDUOutletDevMonitoredOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 1, 5),
+		'rPDUOutletDevNumCntrlOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 1, 3),
+		'rPDUOutletDevNumTotalOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 1, 4),
+		'rPDUOutletDevice': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 1),
+		'rPDUOutletPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 2),
+		'rPDUOutletPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 2, 1, 1),
+		'rPDUOutletPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 2, 1, 1, 1),
+		'rPDUOutletPhaseOverloadRestriction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 2, 1, 1, 2),
+		'rPDUOutletPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 2, 1),
+		'rPDUOutletStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5),
+		'rPDUOutletStatusCommandPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1, 5),
+		'rPDUOutletStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1),
+		'rPDUOutletStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1, 1),
+		'rPDUOutletStatusLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1, 7),
+		'rPDUOutletStatusOutletBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1, 6),
+		'rPDUOutletStatusOutletName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1, 2),
+		'rPDUOutletStatusOutletPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1, 3),
+		'rPDUOutletStatusOutletState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1, 1, 4),
+		'rPDUOutletStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 3, 5, 1),
+		'rPDUPowerSupply': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 4),
+		'rPDUPowerSupply1Status': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 4, 1, 1),
+		'rPDUPowerSupply2Status': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 4, 1, 2),
+		'rPDUPowerSupplyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 4, 1, 3),
+		'rPDUPowerSupplyDevice': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 4, 1),
+		'rPDUStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5),
+		'rPDUStatusBankEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 2, 1),
+		'rPDUStatusBankIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 2, 1, 1),
+		'rPDUStatusBankNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 2, 1, 2),
+		'rPDUStatusBankState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 2, 1, 3),
+		'rPDUStatusBankTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 2),
+		'rPDUStatusBankTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 1),
+		'rPDUStatusOutletEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 6, 1),
+		'rPDUStatusOutletIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 6, 1, 1),
+		'rPDUStatusOutletNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 6, 1, 2),
+		'rPDUStatusOutletState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 6, 1, 3),
+		'rPDUStatusOutletTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 6),
+		'rPDUStatusOutletTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 5),
+		'rPDUStatusPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 4, 1),
+		'rPDUStatusPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 4, 1, 1),
+		'rPDUStatusPhaseNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 4, 1, 2),
+		'rPDUStatusPhaseState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 4, 1, 3),
+		'rPDUStatusPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 4),
+		'rPDUStatusPhaseTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 12, 5, 3),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'rPDUIdentDeviceDisplayOrientation': (('displayNormal', 1), ('displayReverse', 2)),
+		'rPDUIdentDeviceOrientation': (('orientHorizontal', 1), ('orientVertical', 2)),
+		'rPDUIdentDeviceOutletLayout': (('seqPhaseToNeutral', 1), ('seqPhaseToPhase', 2), ('seqPhToNeu21PhToPh', 3), ('seqPhToPhGrouped', 4), ('seqPhToNGrouped', 5), ('seqPToN1516PToPGrouped', 6), ('seqPhToPh2xGrouped', 7), ('seqPhToN2xGrouped', 8), ('seqNotApplicable', 9)),
+		'rPDULoadBankConfigAlarm': (('noLoadAlarm', 1), ('underCurrentAlarm', 2), ('nearOverCurrentAlarm', 3), ('overCurrentAlarm', 4)),
+		'rPDULoadPhaseConfigAlarm': (('noLoadAlarm', 1), ('underCurrentAlarm', 2), ('nearOverCurrentAlarm', 3), ('overCurrentAlarm', 4)),
+		'rPDULoadPhaseConfigIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'rPDULoadStatusLoadState': (('phaseLoadNormal', 1), ('phaseLoadLow', 2), ('phaseLoadNearOverload', 3), ('phaseLoadOverload', 4)),
+		'rPDUOutletBankOverloadRestriction': (('alwaysAllowTurnON', 1), ('restrictOnNearOverload', 2), ('restrictOnOverload', 3)),
+		'rPDUOutletConfigOutletPhase': (('phase1', 1), ('phase2', 2), ('phase3', 3), ('phase1-2', 4), ('phase2-3', 5), ('phase3-1', 6)),
+		'rPDUOutletControlOutletCommand': (('immediateOn', 1), ('immediateOff', 2), ('immediateReboot', 3), ('delayedOn', 4), ('delayedOff', 5), ('delayedReboot', 6), ('cancelPendingCommand', 7)),
+		'rPDUOutletControlOutletPhase': (('phase1', 1), ('phase2', 2), ('phase3', 3), ('phase1-2', 4), ('phase2-3', 5), ('phase3-1', 6)),
+		'rPDUOutletDevCommand': (('noCommandAll', 1), ('immediateAllOn', 2), ('immediateAllOff', 3), ('immediateAllReboot', 4), ('delayedAllOn', 5), ('delayedAllOff', 6), ('delayedAllReboot', 7), ('cancelAllPendingCommands', 8)),
+		'rPDUOutletPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'rPDUOutletPhaseOverloadRestriction': (('alwaysAllowTurnON', 1), ('restrictOnNearOverload', 2), ('restrictOnOverload', 3)),
+		'rPDUOutletStatusCommandPending': (('outletStatusCommandPending', 1), ('outletStatusNoCommandPending', 2)),
+		'rPDUOutletStatusOutletPhase': (('phase1', 1), ('phase2', 2), ('phase3', 3), ('phase1-2', 4), ('phase2-3', 5), ('phase3-1', 6)),
+		'rPDUOutletStatusOutletState': (('outletStatusOn', 1), ('outletStatusOff', 2)),
+		'rPDUPowerSupply1Status': (('powerSupplyOneOk', 1), ('powerSupplyOneFailed', 2)),
+		'rPDUPowerSupply2Status': (('powerSupplyTwoOk', 1), ('powerSupplyTwoFailed', 2), ('powerSupplyTwoNotPresent', 3)),
+		'rPDUPowerSupplyAlarm': (('allAvailablePowerSuppliesOK', 1), ('powerSupplyOneFailed', 2), ('powerSupplyTwoFailed', 3), ('powerSupplyOneandTwoFailed', 4)),
+		'rPDUStatusBankState': (('bankLoadNormal', 1), ('bankLoadLow', 2), ('bankLoadNearOverload', 3), ('bankLoadOverload', 4)),
+		'rPDUStatusOutletState': (('outletLoadNormal', 1), ('outletLoadLow', 2), ('outletLoadNearOverload', 3), ('outletLoadOverload', 4)),
+		'rPDUStatusPhaseState': (('phaseLoadNormal', 1), ('phaseLoadLow', 2), ('phaseLoadNearOverload', 3), ('phaseLoadOverload', 4)),
+	},
+}
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'rPDU2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26),
+		'rPDU2Bank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8),
+		'rPDU2BankConfigBankPeakCurrentReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 8),
+		'rPDU2BankConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1),
+		'rPDU2BankConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 1),
+		'rPDU2BankConfigLowLoadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 5),
+		'rPDU2BankConfigModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 2),
+		'rPDU2BankConfigNearOverloadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 6),
+		'rPDU2BankConfigNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 3),
+		'rPDU2BankConfigOverloadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 7),
+		'rPDU2BankConfigOverloadRestriction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1, 1, 4),
+		'rPDU2BankConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 1),
+		'rPDU2BankPropertiesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 2, 1),
+		'rPDU2BankPropertiesIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 2, 1, 1),
+		'rPDU2BankPropertiesModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 2, 1, 2),
+		'rPDU2BankPropertiesNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 2, 1, 3),
+		'rPDU2BankPropertiesPhaseLayout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 2, 1, 4),
+		'rPDU2BankPropertiesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 2),
+		'rPDU2BankStatusCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 5),
+		'rPDU2BankStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1),
+		'rPDU2BankStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 1),
+		'rPDU2BankStatusLoadState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 4),
+		'rPDU2BankStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 2),
+		'rPDU2BankStatusNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 3),
+		'rPDU2BankStatusPeakCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 6),
+		'rPDU2BankStatusPeakCurrentStartTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 8),
+		'rPDU2BankStatusPeakCurrentTimestamp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3, 1, 7),
+		'rPDU2BankStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 8, 3),
+		'rPDU2BankTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 7),
+		'rPDU2Device': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4),
+		'rPDU2DeviceConfigColdstartDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 6),
+		'rPDU2DeviceConfigContact': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 14),
+		'rPDU2DeviceConfigDeviceEnergyReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 11),
+		'rPDU2DeviceConfigDevicePeakPowerReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 10),
+		'rPDU2DeviceConfigDisplayOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 5),
+		'rPDU2DeviceConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1),
+		'rPDU2DeviceConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 1),
+		'rPDU2DeviceConfigLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 4),
+		'rPDU2DeviceConfigLowLoadPowerThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 7),
+		'rPDU2DeviceConfigModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 2),
+		'rPDU2DeviceConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 3),
+		'rPDU2DeviceConfigNearOverloadPowerThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 8),
+		'rPDU2DeviceConfigOutletsEnergyReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 12),
+		'rPDU2DeviceConfigOutletsPeakLoadReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 13),
+		'rPDU2DeviceConfigOverloadPowerThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1, 1, 9),
+		'rPDU2DeviceConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 1),
+		'rPDU2DeviceControlCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 4, 1, 4),
+		'rPDU2DeviceControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 4, 1),
+		'rPDU2DeviceControlIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 4, 1, 1),
+		'rPDU2DeviceControlModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 4, 1, 2),
+		'rPDU2DeviceControlName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 4, 1, 3),
+		'rPDU2DeviceControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 4),
+		'rPDU2DevicePropertiesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1),
+		'rPDU2DevicePropertiesIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 1),
+		'rPDU2DevicePropertiesMaxCurrentRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 9),
+		'rPDU2DevicePropertiesMaxPhaseCurrentRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 12),
+		'rPDU2DevicePropertiesModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 2),
+		'rPDU2DevicePropertiesName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 3),
+		'rPDU2DevicePropertiesNumMeteredBanks': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 8),
+		'rPDU2DevicePropertiesNumMeteredOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 6),
+		'rPDU2DevicePropertiesNumOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 4),
+		'rPDU2DevicePropertiesNumPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 7),
+		'rPDU2DevicePropertiesNumSwitchedOutlets': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 5),
+		'rPDU2DevicePropertiesOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 10),
+		'rPDU2DevicePropertiesOutletLayout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2, 1, 11),
+		'rPDU2DevicePropertiesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 2),
+		'rPDU2DeviceStatusApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 16),
+		'rPDU2DeviceStatusCommandPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 11),
+		'rPDU2DeviceStatusEnergy': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 9),
+		'rPDU2DeviceStatusEnergyStartTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 10),
+		'rPDU2DeviceStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1),
+		'rPDU2DeviceStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 1),
+		'rPDU2DeviceStatusLoadState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 4),
+		'rPDU2DeviceStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 2),
+		'rPDU2DeviceStatusNPSType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 18),
+		'rPDU2DeviceStatusName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 3),
+		'rPDU2DeviceStatusOutletsEnergyStartTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 15),
+		'rPDU2DeviceStatusPeakPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 6),
+		'rPDU2DeviceStatusPeakPowerStartTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 8),
+		'rPDU2DeviceStatusPeakPowerTimestamp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 7),
+		'rPDU2DeviceStatusPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 5),
+		'rPDU2DeviceStatusPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 17),
+		'rPDU2DeviceStatusPowerSupply1Status': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 13),
+		'rPDU2DeviceStatusPowerSupply2Status': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 14),
+		'rPDU2DeviceStatusPowerSupplyAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3, 1, 12),
+		'rPDU2DeviceStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 4, 3),
+		'rPDU2DeviceTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 3),
+		'rPDU2Group': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 11),
+		'rPDU2GroupEnergyReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 11, 4),
+		'rPDU2GroupNumberOfDevices': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 11, 1),
+		'rPDU2GroupTotalEnergy': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 11, 3),
+		'rPDU2GroupTotalPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 11, 2),
+		'rPDU2IdentContact': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 10),
+		'rPDU2IdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 7),
+		'rPDU2IdentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1),
+		'rPDU2IdentFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 6),
+		'rPDU2IdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 5),
+		'rPDU2IdentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 1),
+		'rPDU2IdentLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 4),
+		'rPDU2IdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 8),
+		'rPDU2IdentModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 2),
+		'rPDU2IdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 3),
+		'rPDU2IdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2, 1, 9),
+		'rPDU2IdentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 2),
+		'rPDU2IdentTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 1),
+		'rPDU2Outlet': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9),
+		'rPDU2OutletMetered': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4),
+		'rPDU2OutletMeteredConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1),
+		'rPDU2OutletMeteredConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1, 1),
+		'rPDU2OutletMeteredConfigLowLoadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1, 5),
+		'rPDU2OutletMeteredConfigModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1, 2),
+		'rPDU2OutletMeteredConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1, 3),
+		'rPDU2OutletMeteredConfigNearOverloadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1, 6),
+		'rPDU2OutletMeteredConfigNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1, 4),
+		'rPDU2OutletMeteredConfigOverloadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1, 1, 7),
+		'rPDU2OutletMeteredConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 1),
+		'rPDU2OutletMeteredPropertiesBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1, 7),
+		'rPDU2OutletMeteredPropertiesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1),
+		'rPDU2OutletMeteredPropertiesIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1, 1),
+		'rPDU2OutletMeteredPropertiesLayout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1, 5),
+		'rPDU2OutletMeteredPropertiesModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1, 2),
+		'rPDU2OutletMeteredPropertiesName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1, 3),
+		'rPDU2OutletMeteredPropertiesNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1, 4),
+		'rPDU2OutletMeteredPropertiesPowerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2, 1, 6),
+		'rPDU2OutletMeteredPropertiesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 2),
+		'rPDU2OutletMeteredStatusCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 6),
+		'rPDU2OutletMeteredStatusEnergy': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 11),
+		'rPDU2OutletMeteredStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1),
+		'rPDU2OutletMeteredStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 1),
+		'rPDU2OutletMeteredStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 2),
+		'rPDU2OutletMeteredStatusName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 3),
+		'rPDU2OutletMeteredStatusNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 4),
+		'rPDU2OutletMeteredStatusPeakPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 8),
+		'rPDU2OutletMeteredStatusPeakPowerStartTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 10),
+		'rPDU2OutletMeteredStatusPeakPowerTimestamp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 9),
+		'rPDU2OutletMeteredStatusPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 7),
+		'rPDU2OutletMeteredStatusState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3, 1, 5),
+		'rPDU2OutletMeteredStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 4, 3),
+		'rPDU2OutletMeteredTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 3),
+		'rPDU2OutletSwitched': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2),
+		'rPDU2OutletSwitchedConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1),
+		'rPDU2OutletSwitchedConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1, 1),
+		'rPDU2OutletSwitchedConfigModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1, 2),
+		'rPDU2OutletSwitchedConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1, 3),
+		'rPDU2OutletSwitchedConfigNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1, 4),
+		'rPDU2OutletSwitchedConfigPowerOffTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1, 6),
+		'rPDU2OutletSwitchedConfigPowerOnTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1, 5),
+		'rPDU2OutletSwitchedConfigRebootDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1, 1, 7),
+		'rPDU2OutletSwitchedConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 1),
+		'rPDU2OutletSwitchedControlCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 4, 1, 5),
+		'rPDU2OutletSwitchedControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 4, 1),
+		'rPDU2OutletSwitchedControlIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 4, 1, 1),
+		'rPDU2OutletSwitchedControlModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 4, 1, 2),
+		'rPDU2OutletSwitchedControlName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 4, 1, 3),
+		'rPDU2OutletSwitchedControlNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 4, 1, 4),
+		'rPDU2OutletSwitchedControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 4),
+		'rPDU2OutletSwitchedPropertiesBank': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2, 1, 6),
+		'rPDU2OutletSwitchedPropertiesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2, 1),
+		'rPDU2OutletSwitchedPropertiesIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2, 1, 1),
+		'rPDU2OutletSwitchedPropertiesModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2, 1, 2),
+		'rPDU2OutletSwitchedPropertiesName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2, 1, 3),
+		'rPDU2OutletSwitchedPropertiesNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2, 1, 4),
+		'rPDU2OutletSwitchedPropertiesPhaseLayout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2, 1, 5),
+		'rPDU2OutletSwitchedPropertiesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 2),
+		'rPDU2OutletSwitchedStatusCommandPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3, 1, 6),
+		'rPDU2OutletSwitchedStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3, 1),
+		'rPDU2OutletSwitchedStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3, 1, 1),
+		'rPDU2OutletSwitchedStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3, 1, 2),
+		'rPDU2OutletSwitchedStatusName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3, 1, 3),
+		'rPDU2OutletSwitchedStatusNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3, 1, 4),
+		'rPDU2OutletSwitchedStatusState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3, 1, 5),
+		'rPDU2OutletSwitchedStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 2, 3),
+		'rPDU2OutletSwitchedTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 9, 1),
+		'rPDU2Phase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6),
+		'rPDU2PhaseConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1),
+		'rPDU2PhaseConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 1),
+		'rPDU2PhaseConfigLowLoadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 5),
+		'rPDU2PhaseConfigModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 2),
+		'rPDU2PhaseConfigNearOverloadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 6),
+		'rPDU2PhaseConfigNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 3),
+		'rPDU2PhaseConfigOverloadCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 7),
+		'rPDU2PhaseConfigOverloadRestriction': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 4),
+		'rPDU2PhaseConfigPhasePeakCurrentReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1, 1, 8),
+		'rPDU2PhaseConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 1),
+		'rPDU2PhasePropertiesEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 2, 1),
+		'rPDU2PhasePropertiesIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 2, 1, 1),
+		'rPDU2PhasePropertiesModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 2, 1, 2),
+		'rPDU2PhasePropertiesNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 2, 1, 3),
+		'rPDU2PhasePropertiesTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 2),
+		'rPDU2PhaseStatusApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 8),
+		'rPDU2PhaseStatusCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 5),
+		'rPDU2PhaseStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1),
+		'rPDU2PhaseStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 1),
+		'rPDU2PhaseStatusLoadState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 4),
+		'rPDU2PhaseStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 2),
+		'rPDU2PhaseStatusNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 3),
+		'rPDU2PhaseStatusPeakCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 10),
+		'rPDU2PhaseStatusPeakCurrentStartTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 12),
+		'rPDU2PhaseStatusPeakCurrentTimestamp': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 11),
+		'rPDU2PhaseStatusPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 7),
+		'rPDU2PhaseStatusPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 9),
+		'rPDU2PhaseStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3),
+		'rPDU2PhaseStatusVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 6, 3, 1, 6),
+		'rPDU2PhaseTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 5),
+		'rPDU2PhaseToPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13),
+		'rPDU2PhaseToPhaseStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13, 1, 1),
+		'rPDU2PhaseToPhaseStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13, 1, 1, 1),
+		'rPDU2PhaseToPhaseStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13, 1, 1, 2),
+		'rPDU2PhaseToPhaseStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13, 1),
+		'rPDU2PhaseToPhaseStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 12),
+		'rPDU2PhaseToPhaseStatusVoltage1to2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13, 1, 1, 3),
+		'rPDU2PhaseToPhaseStatusVoltage2to3': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13, 1, 1, 4),
+		'rPDU2PhaseToPhaseStatusVoltage3to1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 13, 1, 1, 5),
+		'rPDU2Sensor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10),
+		'rPDU2SensorDiscrete': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4),
+		'rPDU2SensorDiscreteConfigAbnormalSeverity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1, 1, 6),
+		'rPDU2SensorDiscreteConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1, 1),
+		'rPDU2SensorDiscreteConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1, 1, 1),
+		'rPDU2SensorDiscreteConfigModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1, 1, 2),
+		'rPDU2SensorDiscreteConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1, 1, 3),
+		'rPDU2SensorDiscreteConfigNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1, 1, 5),
+		'rPDU2SensorDiscreteConfigNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1, 1, 4),
+		'rPDU2SensorDiscreteConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 1),
+		'rPDU2SensorDiscreteStatusAlarmState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 8),
+		'rPDU2SensorDiscreteStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 6),
+		'rPDU2SensorDiscreteStatusCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 7),
+		'rPDU2SensorDiscreteStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1),
+		'rPDU2SensorDiscreteStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 1),
+		'rPDU2SensorDiscreteStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 2),
+		'rPDU2SensorDiscreteStatusName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 3),
+		'rPDU2SensorDiscreteStatusNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 4),
+		'rPDU2SensorDiscreteStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2),
+		'rPDU2SensorDiscreteStatusType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 4, 2, 1, 5),
+		'rPDU2SensorDiscreteTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 3),
+		'rPDU2SensorTempHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2),
+		'rPDU2SensorTempHumidityConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1),
+		'rPDU2SensorTempHumidityConfigHumidityAlarmEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 6),
+		'rPDU2SensorTempHumidityConfigHumidityHysteresis': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 15),
+		'rPDU2SensorTempHumidityConfigHumidityLowThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 13),
+		'rPDU2SensorTempHumidityConfigHumidityMinThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 14),
+		'rPDU2SensorTempHumidityConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 1),
+		'rPDU2SensorTempHumidityConfigModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 2),
+		'rPDU2SensorTempHumidityConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 3),
+		'rPDU2SensorTempHumidityConfigNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 4),
+		'rPDU2SensorTempHumidityConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1),
+		'rPDU2SensorTempHumidityConfigTempHighThreshC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 11),
+		'rPDU2SensorTempHumidityConfigTempHighThreshF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 8),
+		'rPDU2SensorTempHumidityConfigTempHysteresisC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 12),
+		'rPDU2SensorTempHumidityConfigTempHysteresisF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 9),
+		'rPDU2SensorTempHumidityConfigTempMaxThreshC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 10),
+		'rPDU2SensorTempHumidityConfigTempMaxThreshF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 7),
+		'rPDU2SensorTempHumidityConfigTemperatureAlarmEnable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 1, 1, 5),
+		'rPDU2SensorTempHumidityStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 6),
+		'rPDU2SensorTempHumidityStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1),
+		'rPDU2SensorTempHumidityStatusHumidityStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 11),
+		'rPDU2SensorTempHumidityStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 1),
+		'rPDU2SensorTempHumidityStatusModule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 2),
+		'rPDU2SensorTempHumidityStatusName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 3),
+		'rPDU2SensorTempHumidityStatusNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 4),
+		'rPDU2SensorTempHumidityStatusRelativeHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 10),
+		'rPDU2SensorTempHumidityStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2),
+		'rPDU2SensorTempHumidityStatusTempC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 8),
+		'rPDU2SensorTempHumidityStatusTempF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 7),
+		'rPDU2SensorTempHumidityStatusTempStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 9),
+		'rPDU2SensorTempHumidityStatusType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 2, 2, 1, 5),
+		'rPDU2SensorTempHumidityTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 26, 10, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'rPDU2BankConfigBankPeakCurrentReset': (('noOperation', 1), ('reset', 2)),
+		'rPDU2BankConfigOverloadRestriction': (('alwaysAllowTurnON', 1), ('restrictOnNearOverload', 2), ('restrictOnOverload', 3), ('notSupported', 4)),
+		'rPDU2BankPropertiesPhaseLayout': (('seqPhase1ToNeutral', 1), ('seqPhase2ToNeutral', 2), ('seqPhase3ToNeutral', 3), ('seqPhase1ToPhase2', 4), ('seqPhase2ToPhase3', 5), ('seqPhase3ToPhase1', 6)),
+		'rPDU2BankStatusLoadState': (('lowLoad', 1), ('normal', 2), ('nearOverload', 3), ('overload', 4)),
+		'rPDU2DeviceConfigDeviceEnergyReset': (('noOperation', 1), ('reset', 2), ('notSupported', 3)),
+		'rPDU2DeviceConfigDevicePeakPowerReset': (('noOperation', 1), ('reset', 2)),
+		'rPDU2DeviceConfigDisplayOrientation': (('displayNormal', 1), ('displayReverse', 2)),
+		'rPDU2DeviceConfigOutletsEnergyReset': (('noOperation', 1), ('reset', 2), ('notSupported', 3)),
+		'rPDU2DeviceConfigOutletsPeakLoadReset': (('noOperation', 1), ('reset', 2), ('notSupported', 3)),
+		'rPDU2DeviceControlCommand': (('immediateAllOn', 1), ('delayedAllOn', 2), ('immediateAllOff', 3), ('immediateAllReboot', 4), ('delayedAllReboot', 5), ('noCommandAll', 6), ('delayedAllOff', 7), ('cancelAllPendingCommands', 8)),
+		'rPDU2DevicePropertiesOrientation': (('horizontal', 1), ('vertical', 2), ('verticalISXv2', 3)),
+		'rPDU2DevicePropertiesOutletLayout': (('seqPhaseToNeutral', 1), ('seqPhToNPhToPhPhToN', 10), ('seqPhaseToPhase', 2), ('seqPhToNeu21PhToPh', 3), ('seqPhToPhGrouped', 4), ('seqPhToNGrouped', 5), ('seqPToN1516PToPGrouped', 6), ('seqPhToPh2xGrouped', 7), ('seqPhToN2xGrouped', 8), ('seqNotApplicable', 9)),
+		'rPDU2DeviceStatusCommandPending': (('commandPending', 1), ('noCommandPending', 2), ('commandPendingUnknown', 3)),
+		'rPDU2DeviceStatusLoadState': (('lowLoad', 1), ('normal', 2), ('nearOverload', 3), ('overload', 4)),
+		'rPDU2DeviceStatusNPSType': (('notNPS', 1), ('host', 2), ('guest', 3)),
+		'rPDU2DeviceStatusPowerSupply1Status': (('normal', 1), ('alarm', 2), ('notInstalled', 3)),
+		'rPDU2DeviceStatusPowerSupply2Status': (('normal', 1), ('alarm', 2), ('notInstalled', 3)),
+		'rPDU2DeviceStatusPowerSupplyAlarm': (('normal', 1), ('alarm', 2)),
+		'rPDU2GroupEnergyReset': (('noOperation', 1), ('reset', 2), ('notSupported', 3)),
+		'rPDU2OutletMeteredPropertiesLayout': (('seqPhase1ToNeutral', 1), ('seqPhase2ToNeutral', 2), ('seqPhase3ToNeutral', 3), ('seqPhase1ToPhase2', 4), ('seqPhase2ToPhase3', 5), ('seqPhase3ToPhase1', 6)),
+		'rPDU2OutletMeteredStatusState': (('lowLoad', 1), ('normal', 2), ('nearOverload', 3), ('overload', 4)),
+		'rPDU2OutletSwitchedControlCommand': (('immediateOn', 1), ('immediateOff', 2), ('immediateReboot', 3), ('outletUnknown', 4), ('delayedOn', 5), ('delayedOff', 6), ('delayedReboot', 7), ('cancelPendingCommand', 8)),
+		'rPDU2OutletSwitchedPropertiesPhaseLayout': (('seqPhase1ToNeutral', 1), ('seqPhase2ToNeutral', 2), ('seqPhase3ToNeutral', 3), ('seqPhase1ToPhase2', 4), ('seqPhase2ToPhase3', 5), ('seqPhase3ToPhase1', 6)),
+		'rPDU2OutletSwitchedStatusCommandPending': (('commandPending', 1), ('noCommandPending', 2), ('commandPendingUnknown', 3)),
+		'rPDU2OutletSwitchedStatusState': (('off', 1), ('on', 2)),
+		'rPDU2PhaseConfigOverloadRestriction': (('alwaysAllowTurnON', 1), ('restrictOnNearOverload', 2), ('restrictOnOverload', 3), ('notSupported', 4)),
+		'rPDU2PhaseConfigPhasePeakCurrentReset': (('noOperation', 1), ('reset', 2)),
+		'rPDU2PhaseStatusLoadState': (('lowLoad', 1), ('normal', 2), ('nearOverload', 3), ('overload', 4)),
+		'rPDU2SensorDiscreteConfigAbnormalSeverity': (('informational', 1), ('warning', 2), ('critical', 3)),
+		'rPDU2SensorDiscreteConfigNormalState': (('normallyOpen', 1), ('normallyClosed', 2)),
+		'rPDU2SensorDiscreteStatusAlarmState': (('normal', 1), ('alarm', 2)),
+		'rPDU2SensorDiscreteStatusCommStatus': (('notInstalled', 1), ('commsOK', 2), ('commsLost', 3)),
+		'rPDU2SensorDiscreteStatusCurrentState': (('open', 1), ('closed', 2), ('unknown', 3)),
+		'rPDU2SensorDiscreteStatusType': (('notConnected', 1), ('doorContactSensor', 2), ('smokeSensor', 3), ('motionDetector', 4), ('vibrationSensor', 5), ('dryContactSensor', 6), ('spotLeakSensor', 7)),
+		'rPDU2SensorTempHumidityConfigHumidityAlarmEnable': (('disabled', 1), ('enabled', 2)),
+		'rPDU2SensorTempHumidityConfigTemperatureAlarmEnable': (('disabled', 1), ('enabled', 2)),
+		'rPDU2SensorTempHumidityStatusCommStatus': (('notInstalled', 1), ('commsOK', 2), ('commsLost', 3)),
+		'rPDU2SensorTempHumidityStatusHumidityStatus': (('notPresent', 1), ('belowMin', 2), ('belowLow', 3), ('normal', 4), ('aboveHigh', 5), ('aboveMax', 6)),
+		'rPDU2SensorTempHumidityStatusTempStatus': (('notPresent', 1), ('belowMin', 2), ('belowLow', 3), ('normal', 4), ('aboveHigh', 5), ('aboveMax', 6)),
+		'rPDU2SensorTempHumidityStatusType': (('temperatureOnly', 1), ('temperatureHumidity', 2), ('commsLost', 3), ('notInstalled', 4)),
+	},
+}
@@ -0,0 +1,748 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'abnormalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 77),
+		'abnormalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 78),
+		'accessViolationConsole': (1, 3, 6, 1, 4, 1, 318, 0, 46),
+		'accessViolationHTTP': (1, 3, 6, 1, 4, 1, 318, 0, 47),
+		'airCriticalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 306),
+		'airCriticalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 307),
+		'airInformationalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 310),
+		'airInformationalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 311),
+		'airWarningCondition': (1, 3, 6, 1, 4, 1, 318, 0, 308),
+		'airWarningConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 309),
+		'apcAdConverterFault': (1, 3, 6, 1, 4, 1, 318, 0, 614),
+		'apcAdConverterFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 615),
+		'apcAnalogInputHighThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 561),
+		'apcAnalogInputHighThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 562),
+		'apcAnalogInputLowThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 563),
+		'apcAnalogInputLowThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 564),
+		'apcAnalogInputMaxThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 559),
+		'apcAnalogInputMaxThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 560),
+		'apcAnalogInputMinThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 565),
+		'apcAnalogInputMinThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 566),
+		'apcBeaconConnected': (1, 3, 6, 1, 4, 1, 318, 0, 543),
+		'apcBeaconDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 544),
+		'apcBeaconOff': (1, 3, 6, 1, 4, 1, 318, 0, 546),
+		'apcBeaconOn': (1, 3, 6, 1, 4, 1, 318, 0, 545),
+		'apcCriticalDiscreteInputContactStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 553),
+		'apcCriticalDiscreteInputContactStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 554),
+		'apcDcBusOverVoltage': (1, 3, 6, 1, 4, 1, 318, 0, 610),
+		'apcDcBusOverVoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 611),
+		'apcDeviceClearLostComms': (1, 3, 6, 1, 4, 1, 318, 0, 567),
+		'apcDeviceClearUserConfigs': (1, 3, 6, 1, 4, 1, 318, 0, 592),
+		'apcDeviceConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 516),
+		'apcDeviceConnected': (1, 3, 6, 1, 4, 1, 318, 0, 568),
+		'apcDeviceDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 569),
+		'apcDoorClosed': (1, 3, 6, 1, 4, 1, 318, 0, 578),
+		'apcDoorClosedImproperly': (1, 3, 6, 1, 4, 1, 318, 0, 692),
+		'apcDoorClosedImproperlyCleared': (1, 3, 6, 1, 4, 1, 318, 0, 693),
+		'apcDoorEstablishedComms': (1, 3, 6, 1, 4, 1, 318, 0, 589),
+		'apcDoorLocked': (1, 3, 6, 1, 4, 1, 318, 0, 574),
+		'apcDoorLostComms': (1, 3, 6, 1, 4, 1, 318, 0, 588),
+		'apcDoorOpened': (1, 3, 6, 1, 4, 1, 318, 0, 577),
+		'apcDoorSenseConnected': (1, 3, 6, 1, 4, 1, 318, 0, 587),
+		'apcDoorSenseDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 586),
+		'apcDoorUnlocked': (1, 3, 6, 1, 4, 1, 318, 0, 573),
+		'apcEnvHighHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 537),
+		'apcEnvHighHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 538),
+		'apcEnvHighTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 521),
+		'apcEnvHighTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 522),
+		'apcEnvLTDecTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 533),
+		'apcEnvLTDecTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 534),
+		'apcEnvLTIncTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 531),
+		'apcEnvLTIncTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 532),
+		'apcEnvLowHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 539),
+		'apcEnvLowHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 540),
+		'apcEnvLowTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 523),
+		'apcEnvLowTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 524),
+		'apcEnvMaxHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 535),
+		'apcEnvMaxHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 536),
+		'apcEnvMaxTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 519),
+		'apcEnvMaxTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 520),
+		'apcEnvMinHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 541),
+		'apcEnvMinHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 542),
+		'apcEnvMinTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 525),
+		'apcEnvMinTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 526),
+		'apcEnvSTDecTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 529),
+		'apcEnvSTDecTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 530),
+		'apcEnvSTIncTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 527),
+		'apcEnvSTIncTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 528),
+		'apcEnvSensorConnected': (1, 3, 6, 1, 4, 1, 318, 0, 517),
+		'apcEnvSensorDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 518),
+		'apcForcedEntry': (1, 3, 6, 1, 4, 1, 318, 0, 582),
+		'apcForcedEntryCleared': (1, 3, 6, 1, 4, 1, 318, 0, 583),
+		'apcHandleClosed': (1, 3, 6, 1, 4, 1, 318, 0, 576),
+		'apcHandleOpened': (1, 3, 6, 1, 4, 1, 318, 0, 575),
+		'apcHardwareStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 551),
+		'apcHardwareStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 552),
+		'apcInformationalDiscreteInputContactStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 557),
+		'apcInformationalDiscreteInputContactStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 558),
+		'apcInternalCommunicationFault': (1, 3, 6, 1, 4, 1, 318, 0, 730),
+		'apcInternalCommunicationFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 731),
+		'apcKeyOverrideLocked': (1, 3, 6, 1, 4, 1, 318, 0, 581),
+		'apcKeyOverrideUnlocked': (1, 3, 6, 1, 4, 1, 318, 0, 580),
+		'apcLogicPowerSupplyFault': (1, 3, 6, 1, 4, 1, 318, 0, 616),
+		'apcLogicPowerSupplyFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 617),
+		'apcOutletStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 547),
+		'apcOutletStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 548),
+		'apcOutputRelayFault': (1, 3, 6, 1, 4, 1, 318, 0, 606),
+		'apcOutputRelayFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 607),
+		'apcOutputRelayStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 549),
+		'apcOutputRelayStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 550),
+		'apcOutputShortCircuit': (1, 3, 6, 1, 4, 1, 318, 0, 604),
+		'apcOutputShortCircuitCleared': (1, 3, 6, 1, 4, 1, 318, 0, 605),
+		'apcRegisteredUserAccessChange': (1, 3, 6, 1, 4, 1, 318, 0, 590),
+		'apcRegisteredUserAccessDenied': (1, 3, 6, 1, 4, 1, 318, 0, 571),
+		'apcRegisteredUserConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 572),
+		'apcRelockTimeout': (1, 3, 6, 1, 4, 1, 318, 0, 584),
+		'apcRelockTimeoutCleared': (1, 3, 6, 1, 4, 1, 318, 0, 585),
+		'apcTestTrap': (1, 3, 6, 1, 4, 1, 318, 0, 636),
+		'apcTransformerDCImbalanceFault': (1, 3, 6, 1, 4, 1, 318, 0, 618),
+		'apcTransformerDCImbalanceFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 619),
+		'apcUnregisteredUserAccessDenied': (1, 3, 6, 1, 4, 1, 318, 0, 570),
+		'apcUnregisteredUserStatusChange': (1, 3, 6, 1, 4, 1, 318, 0, 591),
+		'apcUserScheduleViolation': (1, 3, 6, 1, 4, 1, 318, 0, 694),
+		'apcUserScheduleViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 695),
+		'apcWarningDiscreteInputContactStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 555),
+		'apcWarningDiscreteInputContactStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 556),
+		'aruAlinkCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 284),
+		'aruAlinkCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 285),
+		'aruDeviceConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 228),
+		'aruExhaustTemperatureAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 292),
+		'aruExhaustTemperatureAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 293),
+		'aruFanFail': (1, 3, 6, 1, 4, 1, 318, 0, 286),
+		'aruFanFailCleared': (1, 3, 6, 1, 4, 1, 318, 0, 287),
+		'aruFanPoorPerformanceAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 512),
+		'aruFanPoorPerformanceAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 513),
+		'aruFanRuntimeAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 510),
+		'aruFanRuntimeAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 511),
+		'aruHighTemperatureAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 290),
+		'aruHighTemperatureAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 291),
+		'aruRedundantPowerLostAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 514),
+		'aruRedundantPowerLostAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 515),
+		'aruSmokeAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 288),
+		'aruSmokeAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 289),
+		'atsCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 130),
+		'atsCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 131),
+		'atsConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 129),
+		'atsControllerRestart': (1, 3, 6, 1, 4, 1, 318, 0, 702),
+		'atsHardwareStatusFail': (1, 3, 6, 1, 4, 1, 318, 0, 700),
+		'atsHardwareStatusOk': (1, 3, 6, 1, 4, 1, 318, 0, 701),
+		'atsLostRedundancy': (1, 3, 6, 1, 4, 1, 318, 0, 127),
+		'atsLowLoad': (1, 3, 6, 1, 4, 1, 318, 0, 638),
+		'atsLowLoadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 639),
+		'atsNearOverload': (1, 3, 6, 1, 4, 1, 318, 0, 640),
+		'atsNearOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 641),
+		'atsOverCurrent': (1, 3, 6, 1, 4, 1, 318, 0, 132),
+		'atsOverCurrentCleared': (1, 3, 6, 1, 4, 1, 318, 0, 133),
+		'atsOverload': (1, 3, 6, 1, 4, 1, 318, 0, 642),
+		'atsOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 643),
+		'atsPowerSupplyFailure': (1, 3, 6, 1, 4, 1, 318, 0, 134),
+		'atsPowerSupplyFailureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 135),
+		'atsRMSOverFrequency': (1, 3, 6, 1, 4, 1, 318, 0, 648),
+		'atsRMSOverFrequencyCleared': (1, 3, 6, 1, 4, 1, 318, 0, 649),
+		'atsRMSOverVoltage': (1, 3, 6, 1, 4, 1, 318, 0, 644),
+		'atsRMSOverVoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 645),
+		'atsRMSUnderFrequency': (1, 3, 6, 1, 4, 1, 318, 0, 650),
+		'atsRMSUnderFrequencyCleared': (1, 3, 6, 1, 4, 1, 318, 0, 651),
+		'atsRMSUnderVoltage': (1, 3, 6, 1, 4, 1, 318, 0, 646),
+		'atsRMSUnderVoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 647),
+		'atsRedundancyRestored': (1, 3, 6, 1, 4, 1, 318, 0, 128),
+		'atsSourceStatusFail': (1, 3, 6, 1, 4, 1, 318, 0, 698),
+		'atsSourceStatusOk': (1, 3, 6, 1, 4, 1, 318, 0, 699),
+		'atsSourceSwitched': (1, 3, 6, 1, 4, 1, 318, 0, 126),
+		'badVoltage': (1, 3, 6, 1, 4, 1, 318, 0, 49),
+		'badVoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 50),
+		'baseFanFailure': (1, 3, 6, 1, 4, 1, 318, 0, 25),
+		'baseFanFailureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 637),
+		'batteryDecrease': (1, 3, 6, 1, 4, 1, 318, 0, 68),
+		'batteryIncrease': (1, 3, 6, 1, 4, 1, 318, 0, 67),
+		'batteryOverTemperature': (1, 3, 6, 1, 4, 1, 318, 0, 53),
+		'batteryOverTemperatureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 54),
+		'batteryPackCommEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 27),
+		'batteryPackCommLost': (1, 3, 6, 1, 4, 1, 318, 0, 26),
+		'bmBatManBatteryAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 183),
+		'bmBatManBatteryAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 184),
+		'bmBatManChargerAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 181),
+		'bmBatManChargerAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 182),
+		'bmBatManCommEstab': (1, 3, 6, 1, 4, 1, 318, 0, 177),
+		'bmBatManCommLost': (1, 3, 6, 1, 4, 1, 318, 0, 178),
+		'bmBatManEnvironmentAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 185),
+		'bmBatManEnvironmentAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 186),
+		'bmBatManKneeAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 179),
+		'bmBatManKneeAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 180),
+		'bmBatManMaintenanceAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 187),
+		'bmBatManMaintenanceAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 188),
+		'bmsCriticalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 375),
+		'bmsCriticalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 376),
+		'bmsInformationalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 379),
+		'bmsInformationalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 380),
+		'bmsWarningCondition': (1, 3, 6, 1, 4, 1, 318, 0, 377),
+		'bmsWarningConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 378),
+		'bypassPowerSupplyFailure': (1, 3, 6, 1, 4, 1, 318, 0, 24),
+		'calibrationEnd': (1, 3, 6, 1, 4, 1, 318, 0, 37),
+		'calibrationStart': (1, 3, 6, 1, 4, 1, 318, 0, 28),
+		'ceInformationalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 351),
+		'ceInformationalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 352),
+		'ceSevereCondition': (1, 3, 6, 1, 4, 1, 318, 0, 347),
+		'ceSevereConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 348),
+		'ceWarningCondition': (1, 3, 6, 1, 4, 1, 318, 0, 349),
+		'ceWarningConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 350),
+		'chargerFailure': (1, 3, 6, 1, 4, 1, 318, 0, 51),
+		'chargerFailureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 52),
+		'codeAuthenticationDone': (1, 3, 6, 1, 4, 1, 318, 0, 32),
+		'communicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 8),
+		'communicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 1),
+		'configChangeOutlet': (1, 3, 6, 1, 4, 1, 318, 0, 45),
+		'configChangeSNMP': (1, 3, 6, 1, 4, 1, 318, 0, 44),
+		'contactFault': (1, 3, 6, 1, 4, 1, 318, 0, 18),
+		'contactFaultResolved': (1, 3, 6, 1, 4, 1, 318, 0, 19),
+		'dcBBCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 161),
+		'dcBBCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 162),
+		'dcBatteryBreakerAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 148),
+		'dcBatteryBreakerAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 149),
+		'dcBatteryTestFail': (1, 3, 6, 1, 4, 1, 318, 0, 156),
+		'dcCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 110),
+		'dcCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 111),
+		'dcCurrentLimitAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 142),
+		'dcCurrentLimitAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 143),
+		'dcFanFailAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 138),
+		'dcFanFailAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 139),
+		'dcFuseCBAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 154),
+		'dcFuseCBAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 155),
+		'dcHumidityAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 159),
+		'dcHumidityAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 160),
+		'dcInputRelayOff': (1, 3, 6, 1, 4, 1, 318, 0, 120),
+		'dcInputRelayOn': (1, 3, 6, 1, 4, 1, 318, 0, 119),
+		'dcLVDImminentAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 152),
+		'dcLVDImminentAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 153),
+		'dcMainsFailAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 136),
+		'dcMainsFailAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 137),
+		'dcMajorAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 113),
+		'dcMajorAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 114),
+		'dcMinorAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 115),
+		'dcMinorAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 116),
+		'dcMultRectFailAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 146),
+		'dcMultRectFailAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 147),
+		'dcOutputRelayOff': (1, 3, 6, 1, 4, 1, 318, 0, 118),
+		'dcOutputRelayOn': (1, 3, 6, 1, 4, 1, 318, 0, 117),
+		'dcPINChanged': (1, 3, 6, 1, 4, 1, 318, 0, 112),
+		'dcRectifierFailAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 144),
+		'dcRectifierFailAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 145),
+		'dcRectifierOVPAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 150),
+		'dcRectifierOVPAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 151),
+		'dcRectifierOvertempAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 140),
+		'dcRectifierOvertempAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 141),
+		'dcTemperatureAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 157),
+		'dcTemperatureAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 158),
+		'deviceStatusChange': (1, 3, 6, 1, 4, 1, 318, 0, 79),
+		'dischargeCleared': (1, 3, 6, 1, 4, 1, 318, 0, 38),
+		'emsAlinkPowerOverload': (1, 3, 6, 1, 4, 1, 318, 0, 296),
+		'emsAlinkPowerOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 297),
+		'emsBeaconConnected': (1, 3, 6, 1, 4, 1, 318, 0, 238),
+		'emsBeaconDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 239),
+		'emsBeaconOff': (1, 3, 6, 1, 4, 1, 318, 0, 241),
+		'emsBeaconOn': (1, 3, 6, 1, 4, 1, 318, 0, 240),
+		'emsCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 230),
+		'emsCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 231),
+		'emsDeviceConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 252),
+		'emsHardwareStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 345),
+		'emsHardwareStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 346),
+		'emsInputContactStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 248),
+		'emsInputContactStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 249),
+		'emsMajorAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 242),
+		'emsMajorAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 243),
+		'emsMinorAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 244),
+		'emsMinorAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 245),
+		'emsOutletStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 246),
+		'emsOutletStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 247),
+		'emsOutputRelayStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 250),
+		'emsOutputRelayStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 251),
+		'emsProbeConnected': (1, 3, 6, 1, 4, 1, 318, 0, 232),
+		'emsProbeDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 233),
+		'emsSensorConnected': (1, 3, 6, 1, 4, 1, 318, 0, 234),
+		'emsSensorDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 235),
+		'emsSensorFault': (1, 3, 6, 1, 4, 1, 318, 0, 236),
+		'emsSensorFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 237),
+		'envAlinkCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 294),
+		'envAlinkCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 295),
+		'envHighHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 257),
+		'envHighHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 258),
+		'envHighTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 253),
+		'envHighTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 254),
+		'envLTDecTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 373),
+		'envLTDecTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 374),
+		'envLTIncTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 371),
+		'envLTIncTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 372),
+		'envLowHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 259),
+		'envLowHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 260),
+		'envLowTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 255),
+		'envLowTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 256),
+		'envMaxHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 363),
+		'envMaxHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 364),
+		'envMaxTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 359),
+		'envMaxTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 360),
+		'envMinHumidityThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 365),
+		'envMinHumidityThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 366),
+		'envMinTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 361),
+		'envMinTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 362),
+		'envSTDecTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 369),
+		'envSTDecTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 370),
+		'envSTIncTempRateViolation': (1, 3, 6, 1, 4, 1, 318, 0, 367),
+		'envSTIncTempRateViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 368),
+		'extBatteryFrameDecrease': (1, 3, 6, 1, 4, 1, 318, 0, 76),
+		'extBatteryFrameIncease': (1, 3, 6, 1, 4, 1, 318, 0, 75),
+		'externalSwitchGearClosed': (1, 3, 6, 1, 4, 1, 318, 0, 123),
+		'externalSwitchGearOpened': (1, 3, 6, 1, 4, 1, 318, 0, 124),
+		'generalDeviceEvent': (1, 3, 6, 1, 4, 1, 318, 0, 125),
+		'gracefulShutdown': (1, 3, 6, 1, 4, 1, 318, 0, 39),
+		'hardwareFailureBypass': (1, 3, 6, 1, 4, 1, 318, 0, 20),
+		'humidityThresholdViolation1': (1, 3, 6, 1, 4, 1, 318, 0, 57),
+		'humidityThresholdViolation2': (1, 3, 6, 1, 4, 1, 318, 0, 61),
+		'humidityThresholdViolationCleared1': (1, 3, 6, 1, 4, 1, 318, 0, 58),
+		'humidityThresholdViolationCleared2': (1, 3, 6, 1, 4, 1, 318, 0, 62),
+		'iemContactFault': (1, 3, 6, 1, 4, 1, 318, 0, 173),
+		'iemContactFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 174),
+		'iemHighHumidThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 167),
+		'iemHighHumidThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 168),
+		'iemHighTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 163),
+		'iemHighTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 164),
+		'iemLowHumidThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 169),
+		'iemLowHumidThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 170),
+		'iemLowTempThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 165),
+		'iemLowTempThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 166),
+		'iemProbeConnected': (1, 3, 6, 1, 4, 1, 318, 0, 172),
+		'iemProbeDisconnected': (1, 3, 6, 1, 4, 1, 318, 0, 171),
+		'iemRelayFault': (1, 3, 6, 1, 4, 1, 318, 0, 175),
+		'iemRelayFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 176),
+		'intelligenceModuleInserted': (1, 3, 6, 1, 4, 1, 318, 0, 71),
+		'intelligenceModuleRemoved': (1, 3, 6, 1, 4, 1, 318, 0, 72),
+		'isxModularBreakerOpenAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 656),
+		'isxModularBreakerOpenAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 657),
+		'isxModularCoolingFanAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 756),
+		'isxModularCoolingFanAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 757),
+		'isxModularDistributionCommEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 653),
+		'isxModularDistributionCommLost': (1, 3, 6, 1, 4, 1, 318, 0, 652),
+		'isxModularDistributionModuleInserted': (1, 3, 6, 1, 4, 1, 318, 0, 654),
+		'isxModularDistributionModuleRemoved': (1, 3, 6, 1, 4, 1, 318, 0, 655),
+		'isxModularHighCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 662),
+		'isxModularHighCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 663),
+		'isxModularLowCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 660),
+		'isxModularLowCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 661),
+		'isxModularMaxCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 664),
+		'isxModularMaxCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 665),
+		'isxModularMinCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 658),
+		'isxModularMinCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 659),
+		'isxModularOutputFrequencyThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 696),
+		'isxModularOutputFrequencyViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 697),
+		'isxModularOutputVoltageHighThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 688),
+		'isxModularOutputVoltageHighThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 689),
+		'isxModularOutputVoltageLowThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 686),
+		'isxModularOutputVoltageLowThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 687),
+		'isxModularOutputVoltageMaxThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 690),
+		'isxModularOutputVoltageMaxThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 691),
+		'isxModularOutputVoltageMinThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 684),
+		'isxModularOutputVoltageMinThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 685),
+		'isxModularSubfeedBreakerOpenAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 666),
+		'isxModularSubfeedBreakerOpenAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 667),
+		'isxModularSubfeedHighCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 672),
+		'isxModularSubfeedHighCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 673),
+		'isxModularSubfeedLowCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 670),
+		'isxModularSubfeedLowCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 671),
+		'isxModularSubfeedMaxCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 674),
+		'isxModularSubfeedMaxCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 675),
+		'isxModularSubfeedMinCurrentThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 668),
+		'isxModularSubfeedMinCurrentThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 669),
+		'isxModularTotalOutputCurrentHighThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 680),
+		'isxModularTotalOutputCurrentHighThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 681),
+		'isxModularTotalOutputCurrentLowThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 678),
+		'isxModularTotalOutputCurrentLowThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 679),
+		'isxModularTotalOutputCurrentMaxThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 682),
+		'isxModularTotalOutputCurrentMaxThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 683),
+		'isxModularTotalOutputCurrentMinThresholdViolation': (1, 3, 6, 1, 4, 1, 318, 0, 676),
+		'isxModularTotalOutputCurrentMinThresholdViolationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 677),
+		'isxModularTransformerOverheating': (1, 3, 6, 1, 4, 1, 318, 0, 728),
+		'isxModularTransformerOverheatingCleared': (1, 3, 6, 1, 4, 1, 318, 0, 729),
+		'isxcCriticalAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 746),
+		'isxcCriticalAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 747),
+		'isxcErrorAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 744),
+		'isxcErrorAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 745),
+		'isxcFailureAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 748),
+		'isxcFailureAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 749),
+		'isxcInformationalAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 740),
+		'isxcInformationalAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 741),
+		'isxcWarningAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 742),
+		'isxcWarningAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 743),
+		'logicPowerSuppliesDecreased': (1, 3, 6, 1, 4, 1, 318, 0, 122),
+		'logicPowerSuppliesIncreased': (1, 3, 6, 1, 4, 1, 318, 0, 121),
+		'lowBattery': (1, 3, 6, 1, 4, 1, 318, 0, 7),
+		'mspCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 98),
+		'mspCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 99),
+		'mspDeviceConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 102),
+		'mspOutletConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 103),
+		'mspOutletOff': (1, 3, 6, 1, 4, 1, 318, 0, 101),
+		'mspOutletOn': (1, 3, 6, 1, 4, 1, 318, 0, 100),
+		'msvmCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 85),
+		'msvmCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 86),
+		'msvmDeviceConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 91),
+		'msvmLowLoad': (1, 3, 6, 1, 4, 1, 318, 0, 93),
+		'msvmLowLoadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 94),
+		'msvmNearOverload': (1, 3, 6, 1, 4, 1, 318, 0, 95),
+		'msvmNearOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 96),
+		'msvmOutletConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 92),
+		'msvmOutletOff': (1, 3, 6, 1, 4, 1, 318, 0, 90),
+		'msvmOutletOn': (1, 3, 6, 1, 4, 1, 318, 0, 89),
+		'msvmOverload': (1, 3, 6, 1, 4, 1, 318, 0, 87),
+		'msvmOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 88),
+		'msvmPowerSupplyStatusChange': (1, 3, 6, 1, 4, 1, 318, 0, 97),
+		'mupsCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 65),
+		'mupsCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 66),
+		'noBatteries': (1, 3, 6, 1, 4, 1, 318, 0, 80),
+		'noBatteriesCleared': (1, 3, 6, 1, 4, 1, 318, 0, 81),
+		'onbatterycommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 733),
+		'outletOff': (1, 3, 6, 1, 4, 1, 318, 0, 42),
+		'outletOn': (1, 3, 6, 1, 4, 1, 318, 0, 41),
+		'outletReboot': (1, 3, 6, 1, 4, 1, 318, 0, 43),
+		'passwordChange': (1, 3, 6, 1, 4, 1, 318, 0, 48),
+		'pduAtypicalBypassMode': (1, 3, 6, 1, 4, 1, 318, 0, 212),
+		'pduCircuitPanelFrequencyOutOfRange': (1, 3, 6, 1, 4, 1, 318, 0, 205),
+		'pduCircuitPanelFrequencyOutofRangeCleared': (1, 3, 6, 1, 4, 1, 318, 0, 206),
+		'pduCircuitPanelInputOvercurrent': (1, 3, 6, 1, 4, 1, 318, 0, 203),
+		'pduCircuitPanelInputOvercurrentCleared': (1, 3, 6, 1, 4, 1, 318, 0, 204),
+		'pduCircuitPanelInputOvervoltage': (1, 3, 6, 1, 4, 1, 318, 0, 199),
+		'pduCircuitPanelInputOvervoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 200),
+		'pduCircuitPanelInputUndercurrent': (1, 3, 6, 1, 4, 1, 318, 0, 201),
+		'pduCircuitPanelInputUndercurrentCleared': (1, 3, 6, 1, 4, 1, 318, 0, 202),
+		'pduCircuitPanelInputUndervoltage': (1, 3, 6, 1, 4, 1, 318, 0, 197),
+		'pduCircuitPanelInputUndervoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 198),
+		'pduCircuitPanelNeutralOvercurrent': (1, 3, 6, 1, 4, 1, 318, 0, 207),
+		'pduCircuitPanelNeutralOvercurrentCleared': (1, 3, 6, 1, 4, 1, 318, 0, 208),
+		'pduCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 189),
+		'pduCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 190),
+		'pduContactFault': (1, 3, 6, 1, 4, 1, 318, 0, 220),
+		'pduContactFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 221),
+		'pduForcedBypassMode': (1, 3, 6, 1, 4, 1, 318, 0, 215),
+		'pduGroundOvercurrent': (1, 3, 6, 1, 4, 1, 318, 0, 195),
+		'pduGroundOvercurrentCleared': (1, 3, 6, 1, 4, 1, 318, 0, 196),
+		'pduInputTransformerOverTemperature': (1, 3, 6, 1, 4, 1, 318, 0, 216),
+		'pduInputTransformerOverTemperatureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 217),
+		'pduMaintenanceBypassMode': (1, 3, 6, 1, 4, 1, 318, 0, 211),
+		'pduNoPanelFeedMode': (1, 3, 6, 1, 4, 1, 318, 0, 213),
+		'pduOnBatteryMode': (1, 3, 6, 1, 4, 1, 318, 0, 210),
+		'pduSystemOff': (1, 3, 6, 1, 4, 1, 318, 0, 209),
+		'pduUPSInputVoltageLost': (1, 3, 6, 1, 4, 1, 318, 0, 218),
+		'pduUPSInputVoltageRestored': (1, 3, 6, 1, 4, 1, 318, 0, 219),
+		'pduUpsOperationMode': (1, 3, 6, 1, 4, 1, 318, 0, 214),
+		'pduUtilityLineOvervoltage': (1, 3, 6, 1, 4, 1, 318, 0, 193),
+		'pduUtilityLineOvervoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 194),
+		'pduUtilityLineUndervoltage': (1, 3, 6, 1, 4, 1, 318, 0, 191),
+		'pduUtilityLineUndervoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 192),
+		'powerModuleDecrease': (1, 3, 6, 1, 4, 1, 318, 0, 70),
+		'powerModuleIncrease': (1, 3, 6, 1, 4, 1, 318, 0, 69),
+		'powerRestored': (1, 3, 6, 1, 4, 1, 318, 0, 9),
+		'rPDUBankPhaseLowLoad': (1, 3, 6, 1, 4, 1, 318, 0, 222),
+		'rPDUBankPhaseLowLoadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 223),
+		'rPDUBankPhaseNearOverload': (1, 3, 6, 1, 4, 1, 318, 0, 224),
+		'rPDUBankPhaseNearOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 225),
+		'rPDUBankPhaseOverload': (1, 3, 6, 1, 4, 1, 318, 0, 226),
+		'rPDUBankPhaseOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 227),
+		'rPDUCancelPendingCommand': (1, 3, 6, 1, 4, 1, 318, 0, 283),
+		'rPDUCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 266),
+		'rPDUCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 267),
+		'rPDUDeviceConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 270),
+		'rPDULowLoad': (1, 3, 6, 1, 4, 1, 318, 0, 272),
+		'rPDULowLoadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 273),
+		'rPDUNearOverload': (1, 3, 6, 1, 4, 1, 318, 0, 274),
+		'rPDUNearOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 275),
+		'rPDUOutletConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 271),
+		'rPDUOutletLowLoad': (1, 3, 6, 1, 4, 1, 318, 0, 630),
+		'rPDUOutletLowLoadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 631),
+		'rPDUOutletNearOverload': (1, 3, 6, 1, 4, 1, 318, 0, 632),
+		'rPDUOutletNearOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 633),
+		'rPDUOutletOff': (1, 3, 6, 1, 4, 1, 318, 0, 269),
+		'rPDUOutletOn': (1, 3, 6, 1, 4, 1, 318, 0, 268),
+		'rPDUOutletOverload': (1, 3, 6, 1, 4, 1, 318, 0, 634),
+		'rPDUOutletOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 635),
+		'rPDUOverload': (1, 3, 6, 1, 4, 1, 318, 0, 276),
+		'rPDUOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 277),
+		'rPDUPhaseConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 282),
+		'rPDUPowerSupply1Fail': (1, 3, 6, 1, 4, 1, 318, 0, 278),
+		'rPDUPowerSupply1Ok': (1, 3, 6, 1, 4, 1, 318, 0, 279),
+		'rPDUPowerSupply2Fail': (1, 3, 6, 1, 4, 1, 318, 0, 280),
+		'rPDUPowerSupply2Ok': (1, 3, 6, 1, 4, 1, 318, 0, 281),
+		'restartAgent': (1, 3, 6, 1, 4, 1, 318, 0, 29),
+		'returnFromBypass': (1, 3, 6, 1, 4, 1, 318, 0, 23),
+		'returnFromLowBattery': (1, 3, 6, 1, 4, 1, 318, 0, 11),
+		'rintelligenceModuleInserted': (1, 3, 6, 1, 4, 1, 318, 0, 73),
+		'rintelligenceModuleRemoved': (1, 3, 6, 1, 4, 1, 318, 0, 74),
+		'rmPDUCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 229),
+		'rpduCriticalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 750),
+		'rpduCriticalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 751),
+		'rpduInformationalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 754),
+		'rpduInformationalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 755),
+		'rpduWarningCondition': (1, 3, 6, 1, 4, 1, 318, 0, 752),
+		'rpduWarningConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 753),
+		'rsCommunicationEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 108),
+		'rsCommunicationLost': (1, 3, 6, 1, 4, 1, 318, 0, 109),
+		'rsConfigChange': (1, 3, 6, 1, 4, 1, 318, 0, 107),
+		'rsLostRedundancy': (1, 3, 6, 1, 4, 1, 318, 0, 105),
+		'rsRedundancyRestored': (1, 3, 6, 1, 4, 1, 318, 0, 106),
+		'rsSourceSwitched': (1, 3, 6, 1, 4, 1, 318, 0, 104),
+		'smartAvrReducing': (1, 3, 6, 1, 4, 1, 318, 0, 31),
+		'smartAvrReducingOff': (1, 3, 6, 1, 4, 1, 318, 0, 35),
+		'smartBoostOff': (1, 3, 6, 1, 4, 1, 318, 0, 34),
+		'smartBoostOn': (1, 3, 6, 1, 4, 1, 318, 0, 6),
+		'smartRelayFault': (1, 3, 6, 1, 4, 1, 318, 0, 55),
+		'smartRelayFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 56),
+		'smwCriticalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 300),
+		'smwCriticalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 301),
+		'smwInformationalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 304),
+		'smwInformationalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 305),
+		'smwWarningCondition': (1, 3, 6, 1, 4, 1, 318, 0, 302),
+		'smwWarningConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 303),
+		'softwareBypass': (1, 3, 6, 1, 4, 1, 318, 0, 21),
+		'switchedBypass': (1, 3, 6, 1, 4, 1, 318, 0, 22),
+		'temperatureThresholdViolation1': (1, 3, 6, 1, 4, 1, 318, 0, 59),
+		'temperatureThresholdViolation2': (1, 3, 6, 1, 4, 1, 318, 0, 63),
+		'temperatureThresholdViolationCleared1': (1, 3, 6, 1, 4, 1, 318, 0, 60),
+		'temperatureThresholdViolationCleared2': (1, 3, 6, 1, 4, 1, 318, 0, 64),
+		'upsBackfeedRelayFault': (1, 3, 6, 1, 4, 1, 318, 0, 620),
+		'upsBackfeedRelayFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 621),
+		'upsBatteryNeedsReplacement': (1, 3, 6, 1, 4, 1, 318, 0, 17),
+		'upsBatteryOverVoltage': (1, 3, 6, 1, 4, 1, 318, 0, 506),
+		'upsBatteryOverVoltageCleared': (1, 3, 6, 1, 4, 1, 318, 0, 507),
+		'upsBatteryReplaced': (1, 3, 6, 1, 4, 1, 318, 0, 36),
+		'upsBatterySoftBusStartFault': (1, 3, 6, 1, 4, 1, 318, 0, 602),
+		'upsBatterySoftBusStartFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 603),
+		'upsBatteryTempSensorFault': (1, 3, 6, 1, 4, 1, 318, 0, 600),
+		'upsBatteryTempSensorFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 601),
+		'upsBypassRelayFault': (1, 3, 6, 1, 4, 1, 318, 0, 622),
+		'upsBypassRelayFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 623),
+		'upsCalibrationStackChanged': (1, 3, 6, 1, 4, 1, 318, 0, 358),
+		'upsCriticalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 734),
+		'upsCriticalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 735),
+		'upsDiagnosticsFailed': (1, 3, 6, 1, 4, 1, 318, 0, 3),
+		'upsDiagnosticsPassed': (1, 3, 6, 1, 4, 1, 318, 0, 10),
+		'upsDipSwitchChanged': (1, 3, 6, 1, 4, 1, 318, 0, 16),
+		'upsDischarged': (1, 3, 6, 1, 4, 1, 318, 0, 4),
+		'upsEPOActive': (1, 3, 6, 1, 4, 1, 318, 0, 771),
+		'upsEPOActiveCleared': (1, 3, 6, 1, 4, 1, 318, 0, 772),
+		'upsEepromFault': (1, 3, 6, 1, 4, 1, 318, 0, 508),
+		'upsEepromFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 509),
+		'upsFirmwareMismatch': (1, 3, 6, 1, 4, 1, 318, 0, 773),
+		'upsFirmwareMismatchCleared': (1, 3, 6, 1, 4, 1, 318, 0, 774),
+		'upsFirmwareUpdateFailed': (1, 3, 6, 1, 4, 1, 318, 0, 761),
+		'upsFirmwareUpdateFinished': (1, 3, 6, 1, 4, 1, 318, 0, 759),
+		'upsFirmwareUpdateStarted': (1, 3, 6, 1, 4, 1, 318, 0, 758),
+		'upsFirmwareUpdateSucceeded': (1, 3, 6, 1, 4, 1, 318, 0, 760),
+		'upsHasNoValidFirmware': (1, 3, 6, 1, 4, 1, 318, 0, 762),
+		'upsHasNoValidFirmwareCleared': (1, 3, 6, 1, 4, 1, 318, 0, 763),
+		'upsInformationalCondition': (1, 3, 6, 1, 4, 1, 318, 0, 738),
+		'upsInformationalConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 739),
+		'upsInternalOverTemperature': (1, 3, 6, 1, 4, 1, 318, 0, 353),
+		'upsInternalOverTemperatureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 354),
+		'upsInverterFault': (1, 3, 6, 1, 4, 1, 318, 0, 612),
+		'upsInverterFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 613),
+		'upsInverterOverTemperature': (1, 3, 6, 1, 4, 1, 318, 0, 504),
+		'upsInverterOverTemperatureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 505),
+		'upsLocalDisplayButtonFault': (1, 3, 6, 1, 4, 1, 318, 0, 767),
+		'upsLocalDisplayButtonFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 768),
+		'upsMpuReset': (1, 3, 6, 1, 4, 1, 318, 0, 355),
+		'upsNeedsFactorySetupFault': (1, 3, 6, 1, 4, 1, 318, 0, 769),
+		'upsNeedsFactorySetupFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 770),
+		'upsOnBattery': (1, 3, 6, 1, 4, 1, 318, 0, 5),
+		'upsOnBatteryDueToFault': (1, 3, 6, 1, 4, 1, 318, 0, 777),
+		'upsOnBatteryDueToFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 778),
+		'upsOscillatorFailed': (1, 3, 6, 1, 4, 1, 318, 0, 775),
+		'upsOscillatorFailedCleared': (1, 3, 6, 1, 4, 1, 318, 0, 776),
+		'upsOutletGroupCommand': (1, 3, 6, 1, 4, 1, 318, 0, 732),
+		'upsOutletGroupTurnedOff': (1, 3, 6, 1, 4, 1, 318, 0, 299),
+		'upsOutletGroupTurnedOn': (1, 3, 6, 1, 4, 1, 318, 0, 298),
+		'upsOutputSwitchClosed': (1, 3, 6, 1, 4, 1, 318, 0, 356),
+		'upsOutputSwitchOpened': (1, 3, 6, 1, 4, 1, 318, 0, 357),
+		'upsOverload': (1, 3, 6, 1, 4, 1, 318, 0, 2),
+		'upsOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 33),
+		'upsPfcFault': (1, 3, 6, 1, 4, 1, 318, 0, 608),
+		'upsPfcFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 609),
+		'upsPfcInputRelayFailure': (1, 3, 6, 1, 4, 1, 318, 0, 502),
+		'upsPfcInputRelayFailureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 503),
+		'upsRebootStarted': (1, 3, 6, 1, 4, 1, 318, 0, 15),
+		'upsSleeping': (1, 3, 6, 1, 4, 1, 318, 0, 13),
+		'upsTurnedOff': (1, 3, 6, 1, 4, 1, 318, 0, 12),
+		'upsTurnedOn': (1, 3, 6, 1, 4, 1, 318, 0, 30),
+		'upsWarningCondition': (1, 3, 6, 1, 4, 1, 318, 0, 736),
+		'upsWarningConditionCleared': (1, 3, 6, 1, 4, 1, 318, 0, 737),
+		'upsWokeUp': (1, 3, 6, 1, 4, 1, 318, 0, 14),
+		'userAdded': (1, 3, 6, 1, 4, 1, 318, 0, 82),
+		'userDeleted': (1, 3, 6, 1, 4, 1, 318, 0, 83),
+		'userModified': (1, 3, 6, 1, 4, 1, 318, 0, 84),
+		'xAPCControllerFirmwareUpdateTransferComplete': (1, 3, 6, 1, 4, 1, 318, 0, 500),
+		'xAPCControllerFirmwareUpdateTransferFailed': (1, 3, 6, 1, 4, 1, 318, 0, 501),
+		'xAPCControllerFirmwareUpdateTransferStart': (1, 3, 6, 1, 4, 1, 318, 0, 499),
+		'xATSDCBackupAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 421),
+		'xATSDCBackupAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 422),
+		'xATSDataCommMismatchError': (1, 3, 6, 1, 4, 1, 318, 0, 393),
+		'xATSDataCommMismatchErrorCleared': (1, 3, 6, 1, 4, 1, 318, 0, 394),
+		'xATSDoorOpenAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 419),
+		'xATSDoorOpenAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 420),
+		'xATSEngineStartAsserted': (1, 3, 6, 1, 4, 1, 318, 0, 401),
+		'xATSEngineStopAsserted': (1, 3, 6, 1, 4, 1, 318, 0, 402),
+		'xATSEpoArmed': (1, 3, 6, 1, 4, 1, 318, 0, 410),
+		'xATSEpoReset': (1, 3, 6, 1, 4, 1, 318, 0, 408),
+		'xATSEpoTestMode': (1, 3, 6, 1, 4, 1, 318, 0, 409),
+		'xATSEpoTripped': (1, 3, 6, 1, 4, 1, 318, 0, 407),
+		'xATSGenCommEstablished': (1, 3, 6, 1, 4, 1, 318, 0, 396),
+		'xATSGenCommLost': (1, 3, 6, 1, 4, 1, 318, 0, 395),
+		'xATSGeneratorBatteryCharger': (1, 3, 6, 1, 4, 1, 318, 0, 475),
+		'xATSGeneratorBatteryChargerCleared': (1, 3, 6, 1, 4, 1, 318, 0, 476),
+		'xATSGeneratorControlSwitchNotAuto': (1, 3, 6, 1, 4, 1, 318, 0, 445),
+		'xATSGeneratorControlSwitchNotAutoCleared': (1, 3, 6, 1, 4, 1, 318, 0, 446),
+		'xATSGeneratorEStop': (1, 3, 6, 1, 4, 1, 318, 0, 439),
+		'xATSGeneratorEStopCleared': (1, 3, 6, 1, 4, 1, 318, 0, 440),
+		'xATSGeneratorEngineCold': (1, 3, 6, 1, 4, 1, 318, 0, 459),
+		'xATSGeneratorEngineColdCleared': (1, 3, 6, 1, 4, 1, 318, 0, 460),
+		'xATSGeneratorFuelTankRuptureAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 493),
+		'xATSGeneratorFuelTankRuptureAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 494),
+		'xATSGeneratorGenericEvent': (1, 3, 6, 1, 4, 1, 318, 0, 477),
+		'xATSGeneratorGenericEventCleared': (1, 3, 6, 1, 4, 1, 318, 0, 478),
+		'xATSGeneratorGroundFaultAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 495),
+		'xATSGeneratorGroundFaultAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 496),
+		'xATSGeneratorHighACVEvent': (1, 3, 6, 1, 4, 1, 318, 0, 455),
+		'xATSGeneratorHighACVEventCleared': (1, 3, 6, 1, 4, 1, 318, 0, 456),
+		'xATSGeneratorHighBatteryVolt': (1, 3, 6, 1, 4, 1, 318, 0, 441),
+		'xATSGeneratorHighBatteryVoltCleared': (1, 3, 6, 1, 4, 1, 318, 0, 442),
+		'xATSGeneratorHighCoolantTempAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 427),
+		'xATSGeneratorHighCoolantTempAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 428),
+		'xATSGeneratorLowACVEvent': (1, 3, 6, 1, 4, 1, 318, 0, 453),
+		'xATSGeneratorLowACVEventCleared': (1, 3, 6, 1, 4, 1, 318, 0, 454),
+		'xATSGeneratorLowBatteryVolt': (1, 3, 6, 1, 4, 1, 318, 0, 443),
+		'xATSGeneratorLowBatteryVoltCleared': (1, 3, 6, 1, 4, 1, 318, 0, 444),
+		'xATSGeneratorLowBatteryVoltDuringCrankAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 435),
+		'xATSGeneratorLowBatteryVoltDuringCrankAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 436),
+		'xATSGeneratorLowCoolantLevelAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 423),
+		'xATSGeneratorLowCoolantLevelAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 424),
+		'xATSGeneratorLowCoolantTempAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 431),
+		'xATSGeneratorLowCoolantTempAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 432),
+		'xATSGeneratorLowFuelLevelAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 463),
+		'xATSGeneratorLowFuelLevelAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 464),
+		'xATSGeneratorLowOilLevelAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 433),
+		'xATSGeneratorLowOilLevelAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 434),
+		'xATSGeneratorLowOilPressure': (1, 3, 6, 1, 4, 1, 318, 0, 447),
+		'xATSGeneratorLowOilPressureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 448),
+		'xATSGeneratorLowRunTimeAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 467),
+		'xATSGeneratorLowRunTimeAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 468),
+		'xATSGeneratorOutputBreakerOpen': (1, 3, 6, 1, 4, 1, 318, 0, 461),
+		'xATSGeneratorOutputBreakerOpenCleared': (1, 3, 6, 1, 4, 1, 318, 0, 462),
+		'xATSGeneratorOverload': (1, 3, 6, 1, 4, 1, 318, 0, 451),
+		'xATSGeneratorOverloadCleared': (1, 3, 6, 1, 4, 1, 318, 0, 452),
+		'xATSGeneratorOverspeed': (1, 3, 6, 1, 4, 1, 318, 0, 457),
+		'xATSGeneratorOverspeedCleared': (1, 3, 6, 1, 4, 1, 318, 0, 458),
+		'xATSGeneratorServiceDueAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 471),
+		'xATSGeneratorServiceDueAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 472),
+		'xATSGeneratorShutdown': (1, 3, 6, 1, 4, 1, 318, 0, 473),
+		'xATSGeneratorShutdownCleared': (1, 3, 6, 1, 4, 1, 318, 0, 474),
+		'xATSGeneratorVeryHighCoolantTempAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 429),
+		'xATSGeneratorVeryHighCoolantTempAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 430),
+		'xATSGeneratorVeryLowBatteryVoltDuringCrankAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 437),
+		'xATSGeneratorVeryLowBatteryVoltDuringCrankAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 438),
+		'xATSGeneratorVeryLowCoolantLevelAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 425),
+		'xATSGeneratorVeryLowCoolantLevelAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 426),
+		'xATSGeneratorVeryLowFuelLevelAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 465),
+		'xATSGeneratorVeryLowFuelLevelAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 466),
+		'xATSGeneratorVeryLowOilPressure': (1, 3, 6, 1, 4, 1, 318, 0, 449),
+		'xATSGeneratorVeryLowOilPressureCleared': (1, 3, 6, 1, 4, 1, 318, 0, 450),
+		'xATSGeneratorVeryLowRunTimeAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 469),
+		'xATSGeneratorVeryLowRunTimeAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 470),
+		'xATSInputContactStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 415),
+		'xATSInputContactStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 416),
+		'xATSInternalATSFault': (1, 3, 6, 1, 4, 1, 318, 0, 399),
+		'xATSInternalATSFaultCleared': (1, 3, 6, 1, 4, 1, 318, 0, 400),
+		'xATSInternalCommError': (1, 3, 6, 1, 4, 1, 318, 0, 391),
+		'xATSInternalCommErrorCleared': (1, 3, 6, 1, 4, 1, 318, 0, 392),
+		'xATSNeutralPosition': (1, 3, 6, 1, 4, 1, 318, 0, 397),
+		'xATSNotInAutomaticMode': (1, 3, 6, 1, 4, 1, 318, 0, 405),
+		'xATSNotInAutomaticModeCleared': (1, 3, 6, 1, 4, 1, 318, 0, 406),
+		'xATSOutputCurrentHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 387),
+		'xATSOutputCurrentHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 388),
+		'xATSOutputCurrentLowAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 385),
+		'xATSOutputCurrentLowAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 386),
+		'xATSOutputFrequencyAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 389),
+		'xATSOutputFrequencyAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 390),
+		'xATSOutputLoadPoweredByGeneratorAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 497),
+		'xATSOutputLoadPoweredByGeneratorAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 498),
+		'xATSOutputVoltageHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 383),
+		'xATSOutputVoltageHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 384),
+		'xATSOutputVoltageLowAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 381),
+		'xATSOutputVoltageLowAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 382),
+		'xATSRemoteStartContactMismatch': (1, 3, 6, 1, 4, 1, 318, 0, 417),
+		'xATSRemoteStartContactMismatchCleared': (1, 3, 6, 1, 4, 1, 318, 0, 418),
+		'xATSS1BadPhaseBalance': (1, 3, 6, 1, 4, 1, 318, 0, 726),
+		'xATSS1BadPhaseBalanceCleared': (1, 3, 6, 1, 4, 1, 318, 0, 727),
+		'xATSS1BadPhaseRotation': (1, 3, 6, 1, 4, 1, 318, 0, 724),
+		'xATSS1BadPhaseRotationCleared': (1, 3, 6, 1, 4, 1, 318, 0, 725),
+		'xATSStartFailure': (1, 3, 6, 1, 4, 1, 318, 0, 403),
+		'xATSStopFailure': (1, 3, 6, 1, 4, 1, 318, 0, 404),
+		'xATSSwitchTransferEvent': (1, 3, 6, 1, 4, 1, 318, 0, 398),
+		'xATSTestCanceled': (1, 3, 6, 1, 4, 1, 318, 0, 412),
+		'xATSTestFailed': (1, 3, 6, 1, 4, 1, 318, 0, 413),
+		'xATSTestInitiated': (1, 3, 6, 1, 4, 1, 318, 0, 411),
+		'xATSTestPassed': (1, 3, 6, 1, 4, 1, 318, 0, 414),
+		'xPDUBranchCurrentHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 342),
+		'xPDUBranchCurrentHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 343),
+		'xPDUBranchCurrentLowAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 340),
+		'xPDUBranchCurrentLowAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 341),
+		'xPDUBranchCurrentMaxAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 628),
+		'xPDUBranchCurrentMaxAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 629),
+		'xPDUBranchCurrentMinAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 626),
+		'xPDUBranchCurrentMinAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 627),
+		'xPDUBreakerChangeEvent': (1, 3, 6, 1, 4, 1, 318, 0, 488),
+		'xPDUBreakerPositionAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 486),
+		'xPDUBreakerPositionAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 487),
+		'xPDUBypassVoltageHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 318),
+		'xPDUBypassVoltageHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 319),
+		'xPDUBypassVoltageLowAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 316),
+		'xPDUBypassVoltageLowAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 317),
+		'xPDUCoolingFanAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 336),
+		'xPDUCoolingFanAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 337),
+		'xPDUDataCommMismatchError': (1, 3, 6, 1, 4, 1, 318, 0, 489),
+		'xPDUDataCommMismatchErrorCleared': (1, 3, 6, 1, 4, 1, 318, 0, 490),
+		'xPDUEpoArmed': (1, 3, 6, 1, 4, 1, 318, 0, 483),
+		'xPDUEpoTestMode': (1, 3, 6, 1, 4, 1, 318, 0, 482),
+		'xPDUFuseBlownAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 484),
+		'xPDUFuseBlownAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 485),
+		'xPDUInputContactStateAbnormal': (1, 3, 6, 1, 4, 1, 318, 0, 332),
+		'xPDUInputContactStateNormal': (1, 3, 6, 1, 4, 1, 318, 0, 333),
+		'xPDUInputVoltageHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 314),
+		'xPDUInputVoltageHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 315),
+		'xPDUInputVoltageLowAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 312),
+		'xPDUInputVoltageLowAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 313),
+		'xPDUInternalCommError': (1, 3, 6, 1, 4, 1, 318, 0, 344),
+		'xPDUInternalCommErrorCleared': (1, 3, 6, 1, 4, 1, 318, 0, 479),
+		'xPDUOutputCurrentHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 326),
+		'xPDUOutputCurrentHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 327),
+		'xPDUOutputCurrentLowAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 324),
+		'xPDUOutputCurrentLowAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 325),
+		'xPDUOutputFrequencyAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 328),
+		'xPDUOutputFrequencyAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 329),
+		'xPDUOutputNeutralCurrentHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 334),
+		'xPDUOutputNeutralCurrentHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 335),
+		'xPDUOutputVoltageHighAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 322),
+		'xPDUOutputVoltageHighAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 323),
+		'xPDUOutputVoltageLowAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 320),
+		'xPDUOutputVoltageLowAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 321),
+		'xPDUSystemGroundCurrentAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 330),
+		'xPDUSystemGroundCurrentAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 331),
+		'xPDUSystemInMaintenanceBypassMode': (1, 3, 6, 1, 4, 1, 318, 0, 491),
+		'xPDUSystemInUPSOperationalMode': (1, 3, 6, 1, 4, 1, 318, 0, 492),
+		'xPDUSystemStateAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 480),
+		'xPDUSystemStateAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 481),
+		'xPDUTransformerTempAlarm': (1, 3, 6, 1, 4, 1, 318, 0, 338),
+		'xPDUTransformerTempAlarmCleared': (1, 3, 6, 1, 4, 1, 318, 0, 339),
+	},
+}
+
+NAMED_VALUES = {
+}
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'uioInputContact': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2),
+		'uioInputContactStatusAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 6),
+		'uioInputContactStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 7),
+		'uioInputContactStatusContactID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 2),
+		'uioInputContactStatusContactLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 4),
+		'uioInputContactStatusContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 3),
+		'uioInputContactStatusCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 5),
+		'uioInputContactStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1),
+		'uioInputContactStatusPortID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 1),
+		'uioInputContactStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2),
+		'uioInputContactStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 1),
+		'uioOutputRelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3),
+		'uioOutputRelayStatusAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 6),
+		'uioOutputRelayStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 7),
+		'uioOutputRelayStatusCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 5),
+		'uioOutputRelayStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1),
+		'uioOutputRelayStatusPortID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 1),
+		'uioOutputRelayStatusRelayID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 2),
+		'uioOutputRelayStatusRelayLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 4),
+		'uioOutputRelayStatusRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 3),
+		'uioOutputRelayStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2),
+		'uioOutputRelayStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 1),
+		'uioSensor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1),
+		'uioSensorStatusAlarmStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 9),
+		'uioSensorStatusCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 10),
+		'uioSensorStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1),
+		'uioSensorStatusHumidity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 7),
+		'uioSensorStatusPortID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 1),
+		'uioSensorStatusSensorID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 2),
+		'uioSensorStatusSensorLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 4),
+		'uioSensorStatusSensorName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 3),
+		'uioSensorStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2),
+		'uioSensorStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 1),
+		'uioSensorStatusTemperatureDegC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 6),
+		'uioSensorStatusTemperatureDegF': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 5),
+		'uioSensorStatusViolationStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 8),
+		'universalInputOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 25),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'uioInputContactStatusAlarmStatus': (('uioNormal', 1), ('uioWarning', 2), ('uioCritical', 3), ('inputStatusNotApplicable', 4)),
+		'uioInputContactStatusCommStatus': (('notInstalled', 1), ('commsOK', 2), ('commsLost', 3)),
+		'uioInputContactStatusCurrentState': (('uioInputClosed', 1), ('uioInputOpen', 2), ('uioInputDisabled', 3), ('inputStateNotApplicable', 4)),
+		'uioOutputRelayStatusAlarmStatus': (('uioNormal', 1), ('uioWarning', 2), ('uioCritical', 3), ('inputStatusNotApplicable', 4)),
+		'uioOutputRelayStatusCommStatus': (('notInstalled', 1), ('commsOK', 2), ('commsLost', 3)),
+		'uioOutputRelayStatusCurrentState': (('uioOutputClosed', 1), ('uioOutputOpen', 2), ('outputStateNotApplicable', 3)),
+		'uioSensorStatusAlarmStatus': (('uioNormal', 1), ('uioWarning', 2), ('uioCritical', 3), ('sensorStatusNotApplicable', 4)),
+		'uioSensorStatusCommStatus': (('notInstalled', 1), ('commsOK', 2), ('commsLost', 3)),
+	},
+}
@@ -0,0 +1,799 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'acceptThisDevice': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2, 1, 4),
+		'apcUpsConfigFieldIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 16, 1, 1),
+		'apcUpsConfigFieldOID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 16, 1, 2),
+		'apcUpsConfigFieldValueRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 16, 1, 3),
+		'batteryFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 5, 1, 1),
+		'batteryFramePositionID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 5, 1, 2),
+		'deviceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2, 1, 1),
+		'deviceName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2, 1, 2),
+		'dipSwitchIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 13, 1, 1),
+		'dipSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 13, 1, 2),
+		'powerFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 9, 1, 1),
+		'powerFramePositionID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 9, 1, 2),
+		'sideCarFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 7, 1, 1),
+		'sideCarFramePositionID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 7, 1, 2),
+		'subfeedBreakerIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1, 1),
+		'subfeedBreakerName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1, 7),
+		'subfeedBreakerPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1, 2),
+		'subfeedBreakerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1, 3),
+		'subfeedBreakerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1, 6),
+		'subfeedBreakerUpperAcceptPowerCritical': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1, 5),
+		'subfeedBreakerUpperAcceptPowerWarning': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1, 4),
+		'switchgearBreakerIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7, 1, 1),
+		'switchgearBreakerName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7, 1, 3),
+		'switchgearBreakerPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7, 1, 2),
+		'switchgearBreakerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7, 1, 5),
+		'switchgearBreakerType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7, 1, 4),
+		'ups': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1),
+		'upsAdvBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2),
+		'upsAdvBatteryActualVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 8),
+		'upsAdvBatteryActualVoltageEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1),
+		'upsAdvBatteryActualVoltagePolarity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1, 2),
+		'upsAdvBatteryActualVoltageTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12),
+		'upsAdvBatteryActualVoltageTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1, 1),
+		'upsAdvBatteryCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 1),
+		'upsAdvBatteryChargerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 17),
+		'upsAdvBatteryCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 9),
+		'upsAdvBatteryCurrentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1),
+		'upsAdvBatteryCurrentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 2),
+		'upsAdvBatteryCurrentPolarity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 3),
+		'upsAdvBatteryCurrentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14),
+		'upsAdvBatteryCurrentTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 1),
+		'upsAdvBatteryEstimatedChargeTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 15),
+		'upsAdvBatteryExternalSKU': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 20),
+		'upsAdvBatteryFrameActualVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1, 3),
+		'upsAdvBatteryFrameCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 4),
+		'upsAdvBatteryFullCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 11),
+		'upsAdvBatteryInternalSKU': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 19),
+		'upsAdvBatteryNominalVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 7),
+		'upsAdvBatteryNumOfBadBattPacks': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 6),
+		'upsAdvBatteryNumOfBattPacks': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 5),
+		'upsAdvBatteryPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 16),
+		'upsAdvBatteryRecommendedReplaceDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 21),
+		'upsAdvBatteryReplaceIndicator': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 4),
+		'upsAdvBatteryRunTimeRemaining': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 3),
+		'upsAdvBatteryTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 2),
+		'upsAdvConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2),
+		'upsAdvConfigACWiringSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 36),
+		'upsAdvConfigAlarm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 4),
+		'upsAdvConfigAlarmLoadOver': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 22),
+		'upsAdvConfigAlarmRedundancy': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 21),
+		'upsAdvConfigAlarmRuntimeUnder': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 23),
+		'upsAdvConfigAlarmTimer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 5),
+		'upsAdvConfigAllowedSetEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 16, 1),
+		'upsAdvConfigAllowedSetTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 16),
+		'upsAdvConfigBasicSignalLowBatteryDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 30),
+		'upsAdvConfigBattCabAmpHour': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 17),
+		'upsAdvConfigBattExhaustThresh': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 14),
+		'upsAdvConfigBatteryHealthAlarmSleepTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 51),
+		'upsAdvConfigBatteryHealthAlarmWarningTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 50),
+		'upsAdvConfigBatterySelection': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 49),
+		'upsAdvConfigBypassPhaseLockRequired': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 31),
+		'upsAdvConfigBypassToleranceSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 34),
+		'upsAdvConfigChargerLevel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 33),
+		'upsAdvConfigChargerRate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 48),
+		'upsAdvConfigDipSwitchEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 13, 1),
+		'upsAdvConfigDipSwitchTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 13),
+		'upsAdvConfigGreenMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 45),
+		'upsAdvConfigHighTransferVolt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 2),
+		'upsAdvConfigInformationalAlarmDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 44),
+		'upsAdvConfigLCDLocalLanguage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 46),
+		'upsAdvConfigLCDLockOut': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 47),
+		'upsAdvConfigLowBatteryRunTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 8),
+		'upsAdvConfigLowTransferVolt': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 3),
+		'upsAdvConfigLowerBypassVoltTolerance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 40),
+		'upsAdvConfigLowerOutputVoltTolerance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 38),
+		'upsAdvConfigMainsSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 35),
+		'upsAdvConfigMaxShutdownTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 27),
+		'upsAdvConfigMinReturnCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 6),
+		'upsAdvConfigMinReturnRuntime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 29),
+		'upsAdvConfigNumExternalBatteries': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 25),
+		'upsAdvConfigOutofSyncBypassTransferDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 41),
+		'upsAdvConfigOutputFreqRange': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 19),
+		'upsAdvConfigOutputFreqSlewRate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 32),
+		'upsAdvConfigPassword': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 15),
+		'upsAdvConfigPositionSelector': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 18),
+		'upsAdvConfigRatedOutputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 1),
+		'upsAdvConfigReturnDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 9),
+		'upsAdvConfigSensitivity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 7),
+		'upsAdvConfigSetEEPROMDefaults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 12),
+		'upsAdvConfigShutoffDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 10),
+		'upsAdvConfigSimpleSignalShutdowns': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 26),
+		'upsAdvConfigUPSFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 20),
+		'upsAdvConfigUpperBypassVoltTolerance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 39),
+		'upsAdvConfigUpperOutputVoltTolerance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 37),
+		'upsAdvConfigUpsSleepTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 11),
+		'upsAdvConfigVoutReporting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 24),
+		'upsAdvConfigWarningAlarmDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 43),
+		'upsAdvControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2),
+		'upsAdvControlBypassSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 7),
+		'upsAdvControlFirmwareUpdate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 9),
+		'upsAdvControlFlashAndBeep': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 5),
+		'upsAdvControlRebootShutdownUps': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 2),
+		'upsAdvControlRebootUpsWithOrWithoutAC': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 8),
+		'upsAdvControlSimulatePowerFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 4),
+		'upsAdvControlTurnOnUPS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 6),
+		'upsAdvControlUpsOff': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 1),
+		'upsAdvControlUpsSleep': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 3),
+		'upsAdvIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2),
+		'upsAdvIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 2),
+		'upsAdvIdentFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 1),
+		'upsAdvIdentFirmwareRevision2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 4),
+		'upsAdvIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 3),
+		'upsAdvIdentSkuNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 5),
+		'upsAdvInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2),
+		'upsAdvInputActivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 7),
+		'upsAdvInputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 2),
+		'upsAdvInputBypassNominalFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 8),
+		'upsAdvInputBypassNominalVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 9),
+		'upsAdvInputBypassPeakCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 6),
+		'upsAdvInputBypassTotalActivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 14),
+		'upsAdvInputBypassTotalApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 13),
+		'upsAdvInputBypassVoltageTHD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 4),
+		'upsAdvInputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 4),
+		'upsAdvInputLineFailCause': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 5),
+		'upsAdvInputLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 1),
+		'upsAdvInputMaxLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 2),
+		'upsAdvInputMinLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 3),
+		'upsAdvInputNominalFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 6),
+		'upsAdvInputNominalVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 7),
+		'upsAdvInputPeakCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 5),
+		'upsAdvInputStatisticsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1),
+		'upsAdvInputStatisticsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 1),
+		'upsAdvInputStatisticsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10),
+		'upsAdvInputTotalActivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 12),
+		'upsAdvInputTotalApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 11),
+		'upsAdvInputVoltageTHD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 3),
+		'upsAdvOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2),
+		'upsAdvOutputActivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 8),
+		'upsAdvOutputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 9),
+		'upsAdvOutputCrestFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 4),
+		'upsAdvOutputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 4),
+		'upsAdvOutputCurrentTHD': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 3),
+		'upsAdvOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 2),
+		'upsAdvOutputKVACapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 6),
+		'upsAdvOutputLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 3),
+		'upsAdvOutputNeutralCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 11),
+		'upsAdvOutputNominalFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 7),
+		'upsAdvOutputPeakCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 2),
+		'upsAdvOutputRedundancy': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 5),
+		'upsAdvOutputStatisticsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1),
+		'upsAdvOutputStatisticsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 1),
+		'upsAdvOutputStatisticsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10),
+		'upsAdvOutputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 1),
+		'upsAdvState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2),
+		'upsAdvStateAbnormalConditions': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 1),
+		'upsAdvStateDP300ESpecificFaults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 3),
+		'upsAdvStateEcomode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 13),
+		'upsAdvStateNumberoftimesNormal': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 12),
+		'upsAdvStateNumberoftimesbypass': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 11),
+		'upsAdvStateNumberoftimesonbattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 10),
+		'upsAdvStateSmartUPSSpecificFaults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 5),
+		'upsAdvStateSymmetra3PhaseSpecificFaults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 2),
+		'upsAdvStateSymmetraSpecificFaults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 4),
+		'upsAdvStateSystemMessages': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 6),
+		'upsAdvStateTotaltimeonNormal': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 9),
+		'upsAdvStateTotaltimeonbattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 7),
+		'upsAdvStateTotaltimeonbypass': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 8),
+		'upsAdvTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2),
+		'upsAdvTestCalibrationDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 7),
+		'upsAdvTestCalibrationResults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 6),
+		'upsAdvTestDiagnosticDay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 9),
+		'upsAdvTestDiagnosticSchedule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 1),
+		'upsAdvTestDiagnosticTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 8),
+		'upsAdvTestDiagnostics': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 2),
+		'upsAdvTestDiagnosticsResults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 3),
+		'upsAdvTestLastDiagnosticsDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 4),
+		'upsAdvTestRuntimeCalibration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 5),
+		'upsAdvTotalDCCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 10),
+		'upsAdvTotalDCCurrentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1),
+		'upsAdvTotalDCCurrentPolarity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1, 2),
+		'upsAdvTotalDCCurrentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13),
+		'upsAdvTotalDCCurrentTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1, 1),
+		'upsAdvTotalFrameDCCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1, 3),
+		'upsAsiUpsControlServerRequestShutdown': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 28),
+		'upsBasicBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1),
+		'upsBasicBatteryLastReplaceDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1, 3),
+		'upsBasicBatteryStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1, 1),
+		'upsBasicBatteryTimeOnBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1, 2),
+		'upsBasicConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1),
+		'upsBasicConfigDeviceEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2, 1),
+		'upsBasicConfigDeviceTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2),
+		'upsBasicConfigNumDevices': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 1),
+		'upsBasicControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 1),
+		'upsBasicControlConserveBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 1, 1),
+		'upsBasicIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 1),
+		'upsBasicIdentModel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 1, 1),
+		'upsBasicIdentName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 1, 2),
+		'upsBasicInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 1),
+		'upsBasicInputPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 1, 1),
+		'upsBasicOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1),
+		'upsBasicOutputACwiringConfiguration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 7),
+		'upsBasicOutputPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 2),
+		'upsBasicOutputStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 1),
+		'upsBasicState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 1),
+		'upsBasicStateOutputState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 1, 1),
+		'upsBasicSystemInternalTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 4),
+		'upsBasicSystemInverterStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 5),
+		'upsBasicSystemPFCStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 6),
+		'upsBasicSystemStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 3),
+		'upsBasicTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 1),
+		'upsBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2),
+		'upsBatteryFrameLayoutEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 5, 1),
+		'upsBatteryFrameLayoutTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 5),
+		'upsBatteryFrameLayoutTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 4),
+		'upsBottomFeedFrameLayoutPositionID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 2),
+		'upsComm': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 8),
+		'upsCommStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 8, 1),
+		'upsConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5),
+		'upsControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6),
+		'upsDCOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17),
+		'upsDCOutputStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1),
+		'upsDCOutputStatusAbnormalConditions': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 6),
+		'upsDCOutputStatusCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 5),
+		'upsDCOutputStatusCurrentRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 3),
+		'upsDCOutputStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1),
+		'upsDCOutputStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2),
+		'upsDCOutputStatusTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 1),
+		'upsDCOutputStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 1),
+		'upsDCOutputStatusVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 4),
+		'upsDCOutputStatusVoltageNominal': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 2),
+		'upsDiagBatteryEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1),
+		'upsDiagBatteryFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 5),
+		'upsDiagBatteryFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 1),
+		'upsDiagBatteryFramePresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 8),
+		'upsDiagBatteryFrameTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 9),
+		'upsDiagBatteryIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 2),
+		'upsDiagBatteryManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 6),
+		'upsDiagBatterySerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 4),
+		'upsDiagBatteryStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 3),
+		'upsDiagBatteryTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2),
+		'upsDiagBatteryTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 1),
+		'upsDiagBatteryType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 7),
+		'upsDiagComBusExternalMIMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 4),
+		'upsDiagComBusExternalRIMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 5),
+		'upsDiagComBusInternalMIMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 1),
+		'upsDiagComBusInternalRIMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 2),
+		'upsDiagComBusMIMtoRIMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 3),
+		'upsDiagFlyWheel': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 4),
+		'upsDiagFlyWheelStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 4, 1),
+		'upsDiagIMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1),
+		'upsDiagIMFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 4),
+		'upsDiagIMHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 6),
+		'upsDiagIMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 1),
+		'upsDiagIMManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 8),
+		'upsDiagIMSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 7),
+		'upsDiagIMSlaveFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 5),
+		'upsDiagIMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 3),
+		'upsDiagIMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2),
+		'upsDiagIMTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 1),
+		'upsDiagIMType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 2),
+		'upsDiagMCCBBox': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 2),
+		'upsDiagMCCBBoxStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 2, 1),
+		'upsDiagPMEnclDoorFltrEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1),
+		'upsDiagPMEnclDoorFltrEstmtdLifetimeRmng': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 4),
+		'upsDiagPMEnclDoorFltrEstmtdLifetimeRmngPct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 5),
+		'upsDiagPMEnclDoorFltrLifetime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 2),
+		'upsDiagPMEnclDoorFltrStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 3),
+		'upsDiagPMEnclDoorFltrTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5),
+		'upsDiagPMEnclDoorFltrTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 4),
+		'upsDiagPMEnclIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 1),
+		'upsDiagPMEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1),
+		'upsDiagPMEstmtdLifetimeRmng': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 3),
+		'upsDiagPMEstmtdLifetimeRmngPct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 4),
+		'upsDiagPMFanEstmtdLifetimeRmng': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 6),
+		'upsDiagPMFanEstmtdLifetimeRmngPct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 7),
+		'upsDiagPMFanLifetimeStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 5),
+		'upsDiagPMFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 3),
+		'upsDiagPMHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 4),
+		'upsDiagPMIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 1),
+		'upsDiagPMLifetimeInfoEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1),
+		'upsDiagPMLifetimeInfoIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 1),
+		'upsDiagPMLifetimeInfoTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3),
+		'upsDiagPMLifetimeStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 2),
+		'upsDiagPMManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 6),
+		'upsDiagPMSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 5),
+		'upsDiagPMStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 2),
+		'upsDiagPMTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2),
+		'upsDiagPMTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 1),
+		'upsDiagSubFeedBreakerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1),
+		'upsDiagSubFeedBreakerIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 1),
+		'upsDiagSubFeedBreakerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9),
+		'upsDiagSubFeedBreakerTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 8),
+		'upsDiagSubFeedPhaseCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 3),
+		'upsDiagSubFeedPhaseCurrentAlternate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 4),
+		'upsDiagSubFeedPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1),
+		'upsDiagSubFeedPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 2),
+		'upsDiagSubFeedPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11),
+		'upsDiagSubSysBattMonitorEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1),
+		'upsDiagSubSysBattMonitorFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 4),
+		'upsDiagSubSysBattMonitorFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 1),
+		'upsDiagSubSysBattMonitorHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 5),
+		'upsDiagSubSysBattMonitorIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 2),
+		'upsDiagSubSysBattMonitorManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 7),
+		'upsDiagSubSysBattMonitorSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 6),
+		'upsDiagSubSysBattMonitorStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 3),
+		'upsDiagSubSysBattMonitorTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6),
+		'upsDiagSubSysBattMonitorTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 5),
+		'upsDiagSubSysChargerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1),
+		'upsDiagSubSysChargerFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1, 1),
+		'upsDiagSubSysChargerIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1, 2),
+		'upsDiagSubSysChargerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1, 3),
+		'upsDiagSubSysChargerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20),
+		'upsDiagSubSysChargerTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 19),
+		'upsDiagSubSysDCCircuitBreakerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1),
+		'upsDiagSubSysDCCircuitBreakerFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1, 1),
+		'upsDiagSubSysDCCircuitBreakerIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1, 2),
+		'upsDiagSubSysDCCircuitBreakerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1, 3),
+		'upsDiagSubSysDCCircuitBreakerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12),
+		'upsDiagSubSysDCCircuitBreakerTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 11),
+		'upsDiagSubSysDisplayInterfaceCardEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1),
+		'upsDiagSubSysDisplayInterfaceCardFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1, 1),
+		'upsDiagSubSysDisplayInterfaceCardIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1, 2),
+		'upsDiagSubSysDisplayInterfaceCardStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1, 3),
+		'upsDiagSubSysDisplayInterfaceCardTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10),
+		'upsDiagSubSysDisplayInterfaceCardTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 9),
+		'upsDiagSubSysExternalPowerFrameBoardEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1),
+		'upsDiagSubSysExternalPowerFrameBoardFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1, 1),
+		'upsDiagSubSysExternalPowerFrameBoardIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1, 2),
+		'upsDiagSubSysExternalPowerFrameBoardStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1, 3),
+		'upsDiagSubSysExternalPowerFrameBoardTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18),
+		'upsDiagSubSysExternalPowerFrameBoardTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 17),
+		'upsDiagSubSysExternalSwitchGearEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1),
+		'upsDiagSubSysExternalSwitchGearFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 4),
+		'upsDiagSubSysExternalSwitchGearFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 1),
+		'upsDiagSubSysExternalSwitchGearHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 5),
+		'upsDiagSubSysExternalSwitchGearIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 2),
+		'upsDiagSubSysExternalSwitchGearManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 7),
+		'upsDiagSubSysExternalSwitchGearSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 6),
+		'upsDiagSubSysExternalSwitchGearStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 3),
+		'upsDiagSubSysExternalSwitchGearTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8),
+		'upsDiagSubSysExternalSwitchGearTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 7),
+		'upsDiagSubSysFrameEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1),
+		'upsDiagSubSysFrameFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 3),
+		'upsDiagSubSysFrameHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 4),
+		'upsDiagSubSysFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 1),
+		'upsDiagSubSysFrameManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 6),
+		'upsDiagSubSysFrameSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 5),
+		'upsDiagSubSysFrameTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2),
+		'upsDiagSubSysFrameTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 1),
+		'upsDiagSubSysFrameType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 2),
+		'upsDiagSubSysIntBypSwitchEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1),
+		'upsDiagSubSysIntBypSwitchFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 4),
+		'upsDiagSubSysIntBypSwitchFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 1),
+		'upsDiagSubSysIntBypSwitchHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 5),
+		'upsDiagSubSysIntBypSwitchIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 2),
+		'upsDiagSubSysIntBypSwitchManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 7),
+		'upsDiagSubSysIntBypSwitchSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 6),
+		'upsDiagSubSysIntBypSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 3),
+		'upsDiagSubSysIntBypSwitchTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4),
+		'upsDiagSubSysIntBypSwitchTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 3),
+		'upsDiagSubSysInverterEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1),
+		'upsDiagSubSysInverterFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 4),
+		'upsDiagSubSysInverterFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 1),
+		'upsDiagSubSysInverterHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 5),
+		'upsDiagSubSysInverterIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 2),
+		'upsDiagSubSysInverterManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 7),
+		'upsDiagSubSysInverterSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 6),
+		'upsDiagSubSysInverterStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 3),
+		'upsDiagSubSysInverterTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22),
+		'upsDiagSubSysInverterTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 21),
+		'upsDiagSubSysNetworkComCardDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 4),
+		'upsDiagSubSysNetworkComCardEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1),
+		'upsDiagSubSysNetworkComCardFirmwareAppOSRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 7),
+		'upsDiagSubSysNetworkComCardFirmwareAppRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 6),
+		'upsDiagSubSysNetworkComCardHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 5),
+		'upsDiagSubSysNetworkComCardIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 1),
+		'upsDiagSubSysNetworkComCardModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 2),
+		'upsDiagSubSysNetworkComCardSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 3),
+		'upsDiagSubSysNetworkComCardTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26),
+		'upsDiagSubSysNetworkComCardTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 25),
+		'upsDiagSubSysPowerFactorCorrectionEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1),
+		'upsDiagSubSysPowerFactorCorrectionFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 4),
+		'upsDiagSubSysPowerFactorCorrectionFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 1),
+		'upsDiagSubSysPowerFactorCorrectionHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 5),
+		'upsDiagSubSysPowerFactorCorrectionIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 2),
+		'upsDiagSubSysPowerFactorCorrectionManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 7),
+		'upsDiagSubSysPowerFactorCorrectionSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 6),
+		'upsDiagSubSysPowerFactorCorrectionStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 3),
+		'upsDiagSubSysPowerFactorCorrectionTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24),
+		'upsDiagSubSysPowerFactorCorrectionTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 23),
+		'upsDiagSubSysSystemPowerSupplyEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1),
+		'upsDiagSubSysSystemPowerSupplyFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 4),
+		'upsDiagSubSysSystemPowerSupplyFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 1),
+		'upsDiagSubSysSystemPowerSupplyHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 5),
+		'upsDiagSubSysSystemPowerSupplyIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 2),
+		'upsDiagSubSysSystemPowerSupplyManufactureDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 7),
+		'upsDiagSubSysSystemPowerSupplySerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 6),
+		'upsDiagSubSysSystemPowerSupplyStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 3),
+		'upsDiagSubSysSystemPowerSupplyTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14),
+		'upsDiagSubSysSystemPowerSupplyTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 13),
+		'upsDiagSubSysXRCommunicationCardEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1),
+		'upsDiagSubSysXRCommunicationCardFirmwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 4),
+		'upsDiagSubSysXRCommunicationCardFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 1),
+		'upsDiagSubSysXRCommunicationCardIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 2),
+		'upsDiagSubSysXRCommunicationCardSerialNum': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 5),
+		'upsDiagSubSysXRCommunicationCardStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 3),
+		'upsDiagSubSysXRCommunicationCardTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16),
+		'upsDiagSubSysXRCommunicationCardTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 15),
+		'upsDiagSwitchGear': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1),
+		'upsDiagSwitchGearBreakerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7, 1),
+		'upsDiagSwitchGearBreakerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7),
+		'upsDiagSwitchGearBreakerTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 6),
+		'upsDiagSwitchGearBypassInputSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 5),
+		'upsDiagSwitchGearBypassSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 4),
+		'upsDiagSwitchGearInputSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 2),
+		'upsDiagSwitchGearInstallationLoadPct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 10),
+		'upsDiagSwitchGearOutputSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 3),
+		'upsDiagSwitchGearStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 1),
+		'upsDiagSwitchgearSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 12),
+		'upsDiagTransformer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 3),
+		'upsDiagTransformerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 3, 1),
+		'upsDiagnosticBatteries': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3),
+		'upsDiagnosticComBus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6),
+		'upsDiagnosticExternalDevices': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5),
+		'upsDiagnosticIM': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1),
+		'upsDiagnosticPowerModules': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2),
+		'upsDiagnosticSubsystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4),
+		'upsDiagnostics': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13),
+		'upsHighPrecBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3),
+		'upsHighPrecBatteryActualVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 4),
+		'upsHighPrecBatteryActualVoltageEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1),
+		'upsHighPrecBatteryActualVoltagePolarity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1, 2),
+		'upsHighPrecBatteryActualVoltageTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7),
+		'upsHighPrecBatteryActualVoltageTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1, 1),
+		'upsHighPrecBatteryCapacity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 1),
+		'upsHighPrecBatteryCartridgeIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 2),
+		'upsHighPrecBatteryCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 5),
+		'upsHighPrecBatteryCurrentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1),
+		'upsHighPrecBatteryCurrentIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 2),
+		'upsHighPrecBatteryCurrentPolarity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 3),
+		'upsHighPrecBatteryCurrentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9),
+		'upsHighPrecBatteryCurrentTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 1),
+		'upsHighPrecBatteryFrameCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 4),
+		'upsHighPrecBatteryNominalVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 3),
+		'upsHighPrecBatteryPackCartridgeHealth': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 7),
+		'upsHighPrecBatteryPackCartridgeInstallDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 9),
+		'upsHighPrecBatteryPackCartridgeReplaceDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 8),
+		'upsHighPrecBatteryPackCartridgeStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 10),
+		'upsHighPrecBatteryPackEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1),
+		'upsHighPrecBatteryPackFirmwareRevision': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 3),
+		'upsHighPrecBatteryPackIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 1),
+		'upsHighPrecBatteryPackSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 4),
+		'upsHighPrecBatteryPackStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 6),
+		'upsHighPrecBatteryPackTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2),
+		'upsHighPrecBatteryPackTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 1),
+		'upsHighPrecBatteryPackTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 5),
+		'upsHighPrecBatteryPacks': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10),
+		'upsHighPrecBatteryTemperature': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 2),
+		'upsHighPrecBatteryVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1, 3),
+		'upsHighPrecInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3),
+		'upsHighPrecInputBypassFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 7),
+		'upsHighPrecInputBypassVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 6),
+		'upsHighPrecInputEnergyUsage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 5),
+		'upsHighPrecInputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 4),
+		'upsHighPrecInputLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 1),
+		'upsHighPrecInputMaxLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 2),
+		'upsHighPrecInputMinLineVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 3),
+		'upsHighPrecOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3),
+		'upsHighPrecOutputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 4),
+		'upsHighPrecOutputEfficiency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 5),
+		'upsHighPrecOutputEnergyUsage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 6),
+		'upsHighPrecOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 2),
+		'upsHighPrecOutputLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 3),
+		'upsHighPrecOutputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 1),
+		'upsHighPrecTotalDCCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 6),
+		'upsHighPrecTotalDCCurrentEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1),
+		'upsHighPrecTotalDCCurrentPolarity': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1, 2),
+		'upsHighPrecTotalDCCurrentTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8),
+		'upsHighPrecTotalDCCurrentTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1, 1),
+		'upsHighPrecTotalDCFrameCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1, 3),
+		'upsIOFrameLayoutPositionID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 1),
+		'upsIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1),
+		'upsInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3),
+		'upsIntegratedATS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16),
+		'upsIntegratedATSLineFailDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 4),
+		'upsIntegratedATSLineStabilityDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 5),
+		'upsIntegratedATSPreferredSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 2),
+		'upsIntegratedATSSelectedSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 1),
+		'upsIntegratedATSSourceEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1),
+		'upsIntegratedATSSourceIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 1),
+		'upsIntegratedATSSourceName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 2),
+		'upsIntegratedATSSourceStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 3),
+		'upsIntegratedATSSourceTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5),
+		'upsIntegratedATSSourceTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 4),
+		'upsIntegratedATSUpsReturnStaggering': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 3),
+		'upsOutletGroupConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2),
+		'upsOutletGroupConfigEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1),
+		'upsOutletGroupConfigIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 1),
+		'upsOutletGroupConfigLoadShedControlAutoRestart': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 9),
+		'upsOutletGroupConfigLoadShedControlInOverload': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 12),
+		'upsOutletGroupConfigLoadShedControlRuntimeRemaining': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 11),
+		'upsOutletGroupConfigLoadShedControlSkipOffDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 8),
+		'upsOutletGroupConfigLoadShedControlTimeOnBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 10),
+		'upsOutletGroupConfigLoadShedRuntimeRemaining': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 14),
+		'upsOutletGroupConfigLoadShedTimeOnBattery': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 13),
+		'upsOutletGroupConfigMinReturnRuntime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 6),
+		'upsOutletGroupConfigName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 2),
+		'upsOutletGroupConfigOutletType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 7),
+		'upsOutletGroupConfigPowerOffDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 4),
+		'upsOutletGroupConfigPowerOnDelay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 3),
+		'upsOutletGroupConfigRebootDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 5),
+		'upsOutletGroupConfigTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2),
+		'upsOutletGroupConfigTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 1),
+		'upsOutletGroupControl': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3),
+		'upsOutletGroupControlCommand': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 3),
+		'upsOutletGroupControlEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1),
+		'upsOutletGroupControlIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 1),
+		'upsOutletGroupControlName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 2),
+		'upsOutletGroupControlOutletType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 4),
+		'upsOutletGroupControlTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2),
+		'upsOutletGroupControlTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 1),
+		'upsOutletGroupStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1),
+		'upsOutletGroupStatusCommandPending': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 4),
+		'upsOutletGroupStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1),
+		'upsOutletGroupStatusGroupState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 3),
+		'upsOutletGroupStatusIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 1),
+		'upsOutletGroupStatusName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 2),
+		'upsOutletGroupStatusOutletType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 5),
+		'upsOutletGroupStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2),
+		'upsOutletGroupStatusTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 1),
+		'upsOutletGroups': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12),
+		'upsOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4),
+		'upsParallelDiagSubSysBreakerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1),
+		'upsParallelDiagSubSysBreakerFrameIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 1),
+		'upsParallelDiagSubSysBreakerIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 2),
+		'upsParallelDiagSubSysBreakerName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 4),
+		'upsParallelDiagSubSysBreakerStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 3),
+		'upsParallelDiagSubSysBreakerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10),
+		'upsParallelInputActivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 4),
+		'upsParallelInputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 5),
+		'upsParallelInputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 3),
+		'upsParallelInputMaxCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 8),
+		'upsParallelInputMaxVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 7),
+		'upsParallelInputMaximumCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 4),
+		'upsParallelInputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1),
+		'upsParallelInputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 2),
+		'upsParallelInputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7),
+		'upsParallelInputPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 1),
+		'upsParallelInputTotalActivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 9),
+		'upsParallelInputTotalApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 10),
+		'upsParallelInputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 6),
+		'upsParallelOutputActivePower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12, 1, 2),
+		'upsParallelOutputActivePowerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12, 1),
+		'upsParallelOutputActivePowerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12),
+		'upsParallelOutputActivePowerTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12, 1, 1),
+		'upsParallelOutputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9, 1, 2),
+		'upsParallelOutputApparentPowerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9, 1),
+		'upsParallelOutputApparentPowerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9),
+		'upsParallelOutputApparentPowerTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9, 1, 1),
+		'upsParallelOutputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 3),
+		'upsParallelOutputLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 4),
+		'upsParallelOutputPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 5),
+		'upsParallelOutputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1),
+		'upsParallelOutputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 2),
+		'upsParallelOutputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8),
+		'upsParallelOutputPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 1),
+		'upsParallelOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 6),
+		'upsParallelOutputTotalPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 11),
+		'upsParallelSysLocalAddress': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 1),
+		'upsParallelSysName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 15),
+		'upsParallelSysRedundancy': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 3),
+		'upsParallelSysRedundancyStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 14),
+		'upsParallelSysRemoteAddress': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 2),
+		'upsParallelSysSwitchGearInstallationLoadPct': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 13),
+		'upsParallelSystem': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14),
+		'upsParallelTotalOutputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 6),
+		'upsParallelTotalOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 5),
+		'upsPhase': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9),
+		'upsPhaseInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2),
+		'upsPhaseInputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 12),
+		'upsPhaseInputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 6),
+		'upsPhaseInputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1),
+		'upsPhaseInputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 4),
+		'upsPhaseInputMaxCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 7),
+		'upsPhaseInputMaxPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 10),
+		'upsPhaseInputMaxVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 4),
+		'upsPhaseInputMinCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 8),
+		'upsPhaseInputMinPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 11),
+		'upsPhaseInputMinVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 5),
+		'upsPhaseInputName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 6),
+		'upsPhaseInputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1),
+		'upsPhaseInputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 2),
+		'upsPhaseInputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3),
+		'upsPhaseInputPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 1),
+		'upsPhaseInputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 9),
+		'upsPhaseInputPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 13),
+		'upsPhaseInputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2),
+		'upsPhaseInputTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 1),
+		'upsPhaseInputType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 5),
+		'upsPhaseInputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 3),
+		'upsPhaseInputVoltageOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 3),
+		'upsPhaseNumInputPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 2),
+		'upsPhaseNumInputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 1),
+		'upsPhaseNumOutputPhases': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 2),
+		'upsPhaseNumOutputs': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 1),
+		'upsPhaseOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3),
+		'upsPhaseOutputCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 4),
+		'upsPhaseOutputEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1),
+		'upsPhaseOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 4),
+		'upsPhaseOutputLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 7),
+		'upsPhaseOutputMaxCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 5),
+		'upsPhaseOutputMaxLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 8),
+		'upsPhaseOutputMaxPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 11),
+		'upsPhaseOutputMaxPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 17),
+		'upsPhaseOutputMaxPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 14),
+		'upsPhaseOutputMinCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 6),
+		'upsPhaseOutputMinLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 9),
+		'upsPhaseOutputMinPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 12),
+		'upsPhaseOutputMinPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 18),
+		'upsPhaseOutputMinPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 15),
+		'upsPhaseOutputPercentLoad': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 10),
+		'upsPhaseOutputPercentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 16),
+		'upsPhaseOutputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1),
+		'upsPhaseOutputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 2),
+		'upsPhaseOutputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3),
+		'upsPhaseOutputPhaseTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 1),
+		'upsPhaseOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 13),
+		'upsPhaseOutputPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 19),
+		'upsPhaseOutputTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2),
+		'upsPhaseOutputTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 1),
+		'upsPhaseOutputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 3),
+		'upsPhaseOutputVoltageOrientation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 3),
+		'upsPhaseResetMaxMinValues': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 1, 1),
+		'upsPhaseResetValues': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 1),
+		'upsPhysicalLayout': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15),
+		'upsPowerFrameLayoutEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 9, 1),
+		'upsPowerFrameLayoutTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 9),
+		'upsPowerFrameLayoutTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 8),
+		'upsSCGACInputStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 3),
+		'upsSCGACOutputStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 4),
+		'upsSCGActiveMembershipStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 2),
+		'upsSCGMemberIP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 2),
+		'upsSCGMembershipGroupNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 1),
+		'upsSCGMultiCastIP': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 5),
+		'upsSCGNumOfGroupMembers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 1),
+		'upsSCGPowerSynchronizationDelayTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 3),
+		'upsSCGReturnBatteryCapacityOffset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 4),
+		'upsSCGStatusEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1),
+		'upsSCGStatusTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2),
+		'upsSCGStatusTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 1),
+		'upsSideCarFrameLayoutEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 7, 1),
+		'upsSideCarFrameLayoutTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 7),
+		'upsSideCarFrameLayoutTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 6),
+		'upsState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11),
+		'upsSwitchGearLayoutPositionID': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 3),
+		'upsSyncCtrlGroup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10),
+		'upsSyncCtrlGroupConfig': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1),
+		'upsSyncCtrlGroupStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2),
+		'upsTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7),
+		'vaRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2, 1, 3),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'acceptThisDevice': (('yes', 1), ('no', 2)),
+		'dipSwitchStatus': (('on', 1), ('off', 2)),
+		'subfeedBreakerPresent': (('notPresent', 1), ('present', 2)),
+		'subfeedBreakerStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'switchgearBreakerPresent': (('notPresent', 1), ('present', 2)),
+		'switchgearBreakerStatus': (('unknown', 1), ('opened', 2), ('closed', 3)),
+		'switchgearBreakerType': (('unknown', 1), ('unitInputBreaker', 2), ('staticSwitchInputBreaker', 3), ('maintenanceBypassBreaker', 4), ('unitOutputBreaker', 5), ('systemIsolationBreaker', 6)),
+		'upsAdvBatteryActualVoltagePolarity': (('positive', 0), ('negative', 1)),
+		'upsAdvBatteryChargerStatus': (('unknown', 1), ('ok', 2), ('inFaultCondition', 3)),
+		'upsAdvBatteryCurrentPolarity': (('positive', 0), ('negative', 1)),
+		'upsAdvBatteryReplaceIndicator': (('noBatteryNeedsReplacing', 1), ('batteryNeedsReplacing', 2)),
+		'upsAdvConfigACWiringSetting': (('threeWire', 1), ('fourWire', 2)),
+		'upsAdvConfigAlarm': (('timed', 1), ('atLowBattery', 2), ('never', 3), ('mute', 4)),
+		'upsAdvConfigBatterySelection': (('vrla', 1), ('ventedcell', 2)),
+		'upsAdvConfigBypassPhaseLockRequired': (('unknown', 1), ('disabled', 2), ('enabled', 3)),
+		'upsAdvConfigBypassToleranceSetting': (('unknown', 1), ('wide', 2), ('medium', 3), ('narrow', 4), ('custom', 5)),
+		'upsAdvConfigChargerLevel': (('unknown', 1), ('low', 2), ('high', 3)),
+		'upsAdvConfigGreenMode': (('disable', 1), ('enable', 2)),
+		'upsAdvConfigLCDLocalLanguage': (('english', 1), ('french', 2), ('italian', 3), ('german', 4), ('spanish', 5), ('portuguese', 6), ('japanese', 7)),
+		'upsAdvConfigLCDLockOut': (('disable', 1), ('enable', 2)),
+		'upsAdvConfigMainsSetting': (('singleInput', 1), ('dualInput', 2)),
+		'upsAdvConfigOutputFreqRange': (('unknown', 1), ('freqRange50Var1dot0', 10), ('freqRange50Pct0dot5', 11), ('freqRange50Pct1', 12), ('freqRange50Pct2', 13), ('freqRange50Pct4', 14), ('freqRange50Pct6', 15), ('freqRange50Pct8', 16), ('freqRange60Pct0dot5', 17), ('freqRange60Pct1', 18), ('freqRange60Pct2', 19), ('freqRangeAUTO', 2), ('freqRange60Pct4', 20), ('freqRange60Pct6', 21), ('freqRange60Pct8', 22), ('freqRange60Var1', 3), ('freqRange60Var3', 4), ('freqRange50Var1', 5), ('freqRange50Var3', 6), ('freqRange60Var10', 7), ('freqRange50Var10', 8), ('freqRange60Var1dot0', 9)),
+		'upsAdvConfigOutputFreqSlewRate': (('unknown', 1), ('slewRateQuarterHzPerSec', 2), ('slewRateHalfHzPerSec', 3), ('slewRate1HzPerSec', 4), ('slewRate2HzPerSec', 5), ('slewRate4HzPerSec', 6), ('slewRate6HzPerSec', 7)),
+		'upsAdvConfigPositionSelector': (('unknown', 1), ('rack', 2), ('tower', 3)),
+		'upsAdvConfigSensitivity': (('auto', 1), ('low', 2), ('medium', 3), ('high', 4)),
+		'upsAdvConfigSetEEPROMDefaults': (('noSetEEPROMDefaults', 1), ('setEEPROMDefaults', 2)),
+		'upsAdvConfigSimpleSignalShutdowns': (('unknown', 1), ('disabled', 2), ('enabled', 3)),
+		'upsAdvConfigUPSFail': (('unknown', 1), ('gotoBypass', 2), ('dropLoad', 3)),
+		'upsAdvConfigVoutReporting': (('unknown', 1), ('voutAUTO', 2), ('vout208', 3), ('vout240', 4)),
+		'upsAdvControlBypassSwitch': (('noBypassSwitch', 1), ('switchToBypass', 2), ('switchOutOfBypass', 3)),
+		'upsAdvControlFirmwareUpdate': (('noFirmwareUpdate', 1), ('firmwareUpdate', 2), ('updateInProcess', 3), ('updateSuccessful', 4), ('updateFailed', 5)),
+		'upsAdvControlFlashAndBeep': (('noFlashAndBeep', 1), ('flashAndBeep', 2), ('flashAndBeepSyncGroup', 3), ('flashAndBeepCont', 4), ('flashAndBeepCancel', 5)),
+		'upsAdvControlRebootShutdownUps': (('noRebootShutdownUps', 1), ('rebootShutdownUps', 2), ('rebootShutdownUpsGracefully', 3), ('rebootShutdownSyncGroupUps', 4), ('rebootShutdownSyncGroupUpsGracefully', 5)),
+		'upsAdvControlRebootUpsWithOrWithoutAC': (('noRebootUpsWithOrWithoutAC', 1), ('rebootUpsImmediatelyWithOrWithoutAC', 2), ('rebootUpsDelayedWithOrWithoutAC', 3)),
+		'upsAdvControlSimulatePowerFail': (('noSimulatePowerFailure', 1), ('simulatePowerFailure', 2)),
+		'upsAdvControlTurnOnUPS': (('noTurnOnUPS', 1), ('turnOnUPS', 2), ('turnOnUPSSyncGroup', 3)),
+		'upsAdvControlUpsOff': (('noTurnUpsOff', 1), ('turnUpsOff', 2), ('turnUpsOffGracefully', 3), ('turnUpsSyncGroupOff', 4), ('turnUpsSyncGroupOffAfterDelay', 5), ('turnUpsSyncGroupOffGracefully', 6)),
+		'upsAdvControlUpsSleep': (('noPutUpsToSleep', 1), ('putUpsToSleep', 2), ('putUpsToSleepGracefully', 3), ('putUpsSyncGroupToSleep', 4), ('putUpsSyncGroupToSleepGracefully', 5)),
+		'upsAdvInputLineFailCause': (('noTransfer', 1), ('rateOfVoltageChange', 10), ('highLineVoltage', 2), ('brownout', 3), ('blackout', 4), ('smallMomentarySag', 5), ('deepMomentarySag', 6), ('smallMomentarySpike', 7), ('largeMomentarySpike', 8), ('selfTest', 9)),
+		'upsAdvStateEcomode': (('upsOnEcoMode', 1), ('upsNotOnEcoMode', 2)),
+		'upsAdvTestCalibrationResults': (('ok', 1), ('invalidCalibration', 2), ('calibrationInProgress', 3)),
+		'upsAdvTestDiagnosticDay': (('monday', 1), ('tuesday', 2), ('wednesday', 3), ('thursday', 4), ('friday', 5), ('saturday', 6), ('sunday', 7)),
+		'upsAdvTestDiagnosticSchedule': (('unknown', 1), ('eightWeeks', 10), ('twentysixWeeks', 11), ('fiftytwoWeeks', 12), ('biweekly', 2), ('weekly', 3), ('atTurnOn', 4), ('never', 5), ('fourWeeks', 6), ('twelveWeeks', 7), ('biweeklySinceLastTest', 8), ('weeklySinceLastTest', 9)),
+		'upsAdvTestDiagnostics': (('noTestDiagnostics', 1), ('testDiagnostics', 2)),
+		'upsAdvTestDiagnosticsResults': (('ok', 1), ('failed', 2), ('invalidTest', 3), ('testInProgress', 4)),
+		'upsAdvTestRuntimeCalibration': (('noPerformCalibration', 1), ('performCalibration', 2), ('cancelCurrentCalibration', 3)),
+		'upsAdvTotalDCCurrentPolarity': (('positive', 0), ('negative', 1)),
+		'upsAsiUpsControlServerRequestShutdown': (('serverShutdownOff', 1), ('serverShutdownReboot', 2)),
+		'upsBasicBatteryStatus': (('unknown', 1), ('batteryNormal', 2), ('batteryLow', 3), ('batteryInFaultCondition', 4)),
+		'upsBasicControlConserveBattery': (('noTurnOffUps', 1), ('turnOffUpsToConserveBattery', 2)),
+		'upsBasicOutputACwiringConfiguration': (('unknown', 1), ('noNeutralWiredonSystem', 2), ('neutralUsedforSupplyingLoad', 3)),
+		'upsBasicOutputStatus': (('unknown', 1), ('hardwareFailureBypass', 10), ('sleepingUntilPowerReturn', 11), ('onSmartTrim', 12), ('ecoMode', 13), ('hotStandby', 14), ('onBatteryTest', 15), ('emergencyStaticBypass', 16), ('staticBypassStandby', 17), ('powerSavingMode', 18), ('spotMode', 19), ('onLine', 2), ('eConversion', 20), ('chargerSpotmode', 21), ('inverterSpotmode', 22), ('onBattery', 3), ('onSmartBoost', 4), ('timedSleeping', 5), ('softwareBypass', 6), ('off', 7), ('rebooting', 8), ('switchedBypass', 9)),
+		'upsBasicSystemInverterStatus': (('unknown', 1), ('ok', 2), ('inFaultCondition', 3)),
+		'upsBasicSystemPFCStatus': (('unknown', 1), ('ok', 2), ('inFaultCondition', 3)),
+		'upsBasicSystemStatus': (('unknown', 1), ('hardwareFailureBypass', 10), ('sleepingUntilPowerReturn', 11), ('onSmartTrim', 12), ('ecoMode', 13), ('inverter', 14), ('eConversion', 15), ('staticBypassStandby', 16), ('onLine', 2), ('onBattery', 3), ('onSmartBoost', 4), ('timedSleeping', 5), ('softwareBypass', 6), ('off', 7), ('rebooting', 8), ('switchedBypass', 9)),
+		'upsCommStatus': (('ok', 1), ('noComm', 2)),
+		'upsDiagBatteryFramePresent': (('notPresent', 0), ('present', 1)),
+		'upsDiagBatteryStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('failed', 4), ('highTemperature', 5), ('replaceImmediately', 6), ('lowCapacity', 7)),
+		'upsDiagComBusExternalMIMStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('lostComm', 4), ('rxFailure', 5), ('txFailure', 6)),
+		'upsDiagComBusExternalRIMStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('lostComm', 4), ('rxFailure', 5), ('txFailure', 6)),
+		'upsDiagComBusInternalMIMStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('lostComm', 4), ('rxFailure', 5), ('txFailure', 6)),
+		'upsDiagComBusInternalRIMStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('lostComm', 4), ('rxFailure', 5), ('txFailure', 6)),
+		'upsDiagComBusMIMtoRIMStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('lostComm', 4), ('rxFailure', 5), ('txFailure', 6)),
+		'upsDiagFlyWheelStatus': (('unknown', 1), ('present', 2), ('notPresent', 3)),
+		'upsDiagIMStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagIMType': (('imUnknown', 1), ('imMIM', 2), ('imRIM', 3)),
+		'upsDiagMCCBBoxStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'upsDiagPMEnclDoorFltrLifetime': (('heavyFiltration15days', 1), ('normalFiltration30days', 2), ('lightFiltration60days', 3), ('notPresent', 4)),
+		'upsDiagPMEnclDoorFltrStatus': (('ok', 1), ('nearEnd', 2), ('exceeded', 3), ('unknown', 4)),
+		'upsDiagPMFanLifetimeStatus': (('ok', 1), ('nearEnd', 2), ('exceeded', 3), ('unknown', 4)),
+		'upsDiagPMLifetimeStatus': (('ok', 1), ('nearEnd', 2), ('exceeded', 3), ('unknown', 4)),
+		'upsDiagPMStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysBattMonitorStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysChargerStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysDCCircuitBreakerStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'upsDiagSubSysDisplayInterfaceCardStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysExternalPowerFrameBoardStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysExternalSwitchGearStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysFrameType': (('unknown', 1), ('notInstalled', 2), ('frameTypeMain', 3), ('frameTypeXR', 4), ('frameTypeLXR', 5)),
+		'upsDiagSubSysIntBypSwitchStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysInverterStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysPowerFactorCorrectionStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysSystemPowerSupplyStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSubSysXRCommunicationCardStatus': (('unknown', 1), ('notInstalled', 2), ('offOk', 3), ('onOk', 4), ('offFail', 5), ('onFail', 6), ('lostComm', 7)),
+		'upsDiagSwitchGearBypassInputSwitchStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'upsDiagSwitchGearBypassSwitchStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'upsDiagSwitchGearInputSwitchStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'upsDiagSwitchGearOutputSwitchStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'upsDiagSwitchGearStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('fail', 4), ('lostComm', 5), ('overtemp', 6)),
+		'upsDiagTransformerStatus': (('unknown', 1), ('notInstalled', 2), ('ok', 3), ('fail', 4), ('lostComm', 5), ('overtemp', 6), ('opened', 7), ('closed', 8)),
+		'upsHighPrecBatteryActualVoltagePolarity': (('positive', 0), ('negative', 1)),
+		'upsHighPrecBatteryCurrentPolarity': (('positive', 0), ('negative', 1)),
+		'upsHighPrecTotalDCCurrentPolarity': (('positive', 0), ('negative', 1)),
+		'upsIntegratedATSPreferredSource': (('upsIntegratedATSNoSourcePreference', 1), ('upsIntegratedATSPreferSourceA', 2), ('upsIntegratedATSPreferSourceB', 3)),
+		'upsIntegratedATSSelectedSource': (('noSourceSelected', 1), ('unknown', 2), ('sourceA', 3), ('sourceB', 4)),
+		'upsIntegratedATSSourceStatus': (('upsIntegratedATSSourceGood', 1), ('upsIntegratedATSSourceBad', 2), ('upsIntegratedATSSourceUnknown', 3)),
+		'upsOutletGroupConfigLoadShedControlAutoRestart': (('upsOutletGroupConfigAutoRestart', 1), ('upsOutletGroupConfigManualRestart', 2)),
+		'upsOutletGroupConfigLoadShedControlInOverload': (('upsOutletGroupConfigDisableInOverloadLoadShed', 1), ('upsOutletGroupConfigEnableInOverloadLoadShed', 2)),
+		'upsOutletGroupConfigLoadShedControlRuntimeRemaining': (('upsOutletGroupConfigDisableRuntimeRemainingLoadShed', 1), ('upsOutletGroupConfigEnableRuntimeRemainingLoadShed', 2)),
+		'upsOutletGroupConfigLoadShedControlSkipOffDelay': (('upsOutletGroupConfigSkipOffDelay', 1), ('upsOutletGroupConfigUseOffDelay', 2)),
+		'upsOutletGroupConfigLoadShedControlTimeOnBattery': (('upsOutletGroupConfigDisableTimeOnBatteryLoadShed', 1), ('upsOutletGroupConfigEnableTimeOnBatteryLoadShed', 2)),
+		'upsOutletGroupConfigOutletType': (('upsSwitchedOutletGroup', 1), ('upsMainOutletGroup', 2)),
+		'upsOutletGroupControlCommand': (('upsOutletGroupImmediateOn', 1), ('upsOutletGroupDelayedRebootShutdown', 10), ('upsOutletGroupImmediateOff', 2), ('upsOutletGroupImmediateRebootWithOrWithoutAC', 3), ('upsOutletGroupDelayedOn', 4), ('upsOutletGroupDelayedOff', 5), ('upsOutletGroupDelayedRebootWithOrWithoutAC', 6), ('upsOutletGroupCancelPendingCommand', 7), ('upsOutletGroupControlUnknown', 8), ('upsOutletGroupImmediateRebootShutdown', 9)),
+		'upsOutletGroupControlOutletType': (('upsSwitchedOutletGroup', 1), ('upsMainOutletGroup', 2)),
+		'upsOutletGroupStatusCommandPending': (('upsOutletGroupCommandPending', 1), ('upsOutletGroupNoCommandPending', 2)),
+		'upsOutletGroupStatusGroupState': (('upsOutletGroupStatusOn', 1), ('upsOutletGroupStatusOff', 2), ('upsOutletGroupStatusUnknown', 3)),
+		'upsOutletGroupStatusOutletType': (('upsSwitchedOutletGroup', 1), ('upsMainOutletGroup', 2)),
+		'upsParallelDiagSubSysBreakerStatus': (('unknown', 1), ('notInstalled', 2), ('opened', 3), ('closed', 4)),
+		'upsParallelSysRedundancy': (('nplus0', 1), ('nplus1', 2), ('nplus2', 3), ('nplus3', 4), ('nplus4', 5), ('nplus5', 6)),
+		'upsParallelSysRedundancyStatus': (('nplus0', 1), ('nplus1', 2), ('nplus2', 3), ('nplus3', 4), ('nplus4', 5), ('nplus5', 6)),
+		'upsPhaseInputType': (('unknown', 1), ('main', 2), ('bypass', 3)),
+		'upsPhaseInputVoltageOrientation': (('unknown', 1), ('singlePhase', 2), ('splitPhase', 3), ('threePhasePhaseToNeutral', 4), ('threePhasePhaseToPhase', 5)),
+		'upsPhaseOutputVoltageOrientation': (('unknown', 1), ('singlePhase', 2), ('splitPhase', 3), ('threePhasePhaseToNeutral', 4), ('threePhasePhaseToPhase', 5)),
+		'upsPhaseResetMaxMinValues': (('none', 1), ('reset', 2)),
+		'upsSCGACInputStatus': (('acInGood', 1), ('acInBad', 2)),
+		'upsSCGACOutputStatus': (('acOutOn', 1), ('acOutOff', 2)),
+		'upsSCGActiveMembershipStatus': (('enabledSCG', 1), ('disabledSCG', 2)),
+	},
+}
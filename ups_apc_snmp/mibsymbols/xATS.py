@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'xATS': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17),
+		'xATSACMonitoringPoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4),
+		'xATSDevice': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 2),
+		'xATSDeviceDCBackUpPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 2, 5),
+		'xATSDeviceNominalFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 2, 3),
+		'xATSDeviceNominalVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 2, 2),
+		'xATSDeviceServiceType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 2, 1),
+		'xATSDeviceTransferSwitchRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 2, 4),
+		'xATSIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1),
+		'xATSIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 6),
+		'xATSIdentFirmwareAppOSRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 4),
+		'xATSIdentFirmwareAppRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 3),
+		'xATSIdentFirmwareControllerRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 5),
+		'xATSIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 2),
+		'xATSIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 7),
+		'xATSIdentProductName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 1),
+		'xATSIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 1, 8),
+		'xATSInputContactCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 3, 1, 4),
+		'xATSInputContactEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 3, 1),
+		'xATSInputContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 3, 1, 2),
+		'xATSInputContactNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 3, 1, 3),
+		'xATSInputContactNumContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 1),
+		'xATSInputContactNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 3, 1, 1),
+		'xATSInputContactTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 3),
+		'xATSInputContactTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6, 2),
+		'xATSInputContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 6),
+		'xATSMisc': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 8),
+		'xATSOutputRelayCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 3, 1, 4),
+		'xATSOutputRelayEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 3, 1),
+		'xATSOutputRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 3, 1, 2),
+		'xATSOutputRelayNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 3, 1, 3),
+		'xATSOutputRelayNumRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 1),
+		'xATSOutputRelayNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 3, 1, 1),
+		'xATSOutputRelayTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 3),
+		'xATSOutputRelayTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7, 2),
+		'xATSOutputRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 7),
+		'xATSSource1': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1),
+		'xATSSource1Frequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 3),
+		'xATSSource1Index': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 7, 1, 1),
+		'xATSSource1Name': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 1),
+		'xATSSource1PhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 7, 1),
+		'xATSSource1PhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 7),
+		'xATSSource1Position': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 2),
+		'xATSSource1Quality': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 4),
+		'xATSSource1Rotation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 5),
+		'xATSSource1TableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 6),
+		'xATSSource1VoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 7, 1, 2),
+		'xATSSource1VoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 1, 7, 1, 3),
+		'xATSSource2': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2),
+		'xATSSource2Frequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 3),
+		'xATSSource2Index': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 7, 1, 1),
+		'xATSSource2Name': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 1),
+		'xATSSource2PhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 7, 1),
+		'xATSSource2PhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 7),
+		'xATSSource2Position': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 2),
+		'xATSSource2Quality': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 4),
+		'xATSSource2Rotation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 5),
+		'xATSSource2TableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 6),
+		'xATSSource2VoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 7, 1, 2),
+		'xATSSource2VoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 2, 7, 1, 3),
+		'xATSSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3),
+		'xATSSwitchBlockMap': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4),
+		'xATSSwitchBlockMapEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4, 2, 1),
+		'xATSSwitchBlockMapIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4, 2, 1, 1),
+		'xATSSwitchBlockMapName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4, 2, 1, 2),
+		'xATSSwitchBlockMapSetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4, 2, 1, 4),
+		'xATSSwitchBlockMapStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4, 2, 1, 3),
+		'xATSSwitchBlockMapTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4, 2),
+		'xATSSwitchBlockMapTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 4, 1),
+		'xATSSwitchSettings': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2),
+		'xATSSwitchSettingsAllowClosedTransfer': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 6),
+		'xATSSwitchSettingsClearLatchedAlarms': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 9),
+		'xATSSwitchSettingsHighVoltageTransferPoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 2),
+		'xATSSwitchSettingsLowVoltageTransferPoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 1),
+		'xATSSwitchSettingsMaxFrequencyDeviation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 3),
+		'xATSSwitchSettingsMaxSyncTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 7),
+		'xATSSwitchSettingsMinPhaseBalance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 4),
+		'xATSSwitchSettingsNeutralTransferTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 8),
+		'xATSSwitchSettingsNominalRotation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 5),
+		'xATSSwitchSettingsSetToFactoryDefaults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 2, 10),
+		'xATSSwitchStatistics': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5),
+		'xATSSwitchStatisticsEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5, 2, 1),
+		'xATSSwitchStatisticsIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5, 2, 1, 1),
+		'xATSSwitchStatisticsName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5, 2, 1, 2),
+		'xATSSwitchStatisticsReset': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5, 2, 1, 4),
+		'xATSSwitchStatisticsTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5, 2),
+		'xATSSwitchStatisticsTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5, 1),
+		'xATSSwitchStatisticsValue': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 5, 2, 1, 3),
+		'xATSSwitchStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 1),
+		'xATSSwitchStatusAutomaticOperationSwitch': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 1, 3),
+		'xATSSwitchStatusEngineStartSignal': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 1, 4),
+		'xATSSwitchStatusOperationalMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 1, 2),
+		'xATSSwitchStatusSelectedSource': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 1, 1),
+		'xATSSwitchTimers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3),
+		'xATSSwitchTimersAbort': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2, 1, 3),
+		'xATSSwitchTimersDelaySetting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2, 1, 6),
+		'xATSSwitchTimersEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2, 1),
+		'xATSSwitchTimersIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2, 1, 1),
+		'xATSSwitchTimersName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2, 1, 2),
+		'xATSSwitchTimersRemainingTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2, 1, 5),
+		'xATSSwitchTimersStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2, 1, 4),
+		'xATSSwitchTimersTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 2),
+		'xATSSwitchTimersTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 3, 3, 1),
+		'xATSSystemOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3),
+		'xATSSystemOutputAlarmDelayThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 10),
+		'xATSSystemOutputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1, 6),
+		'xATSSystemOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 1),
+		'xATSSystemOutputFrequencyTolerance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 5),
+		'xATSSystemOutputOverCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 8),
+		'xATSSystemOutputOverVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 6),
+		'xATSSystemOutputPhaseCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1, 4),
+		'xATSSystemOutputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1),
+		'xATSSystemOutputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1, 1),
+		'xATSSystemOutputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12),
+		'xATSSystemOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1, 5),
+		'xATSSystemOutputPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1, 7),
+		'xATSSystemOutputTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 11),
+		'xATSSystemOutputTotalApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 3),
+		'xATSSystemOutputTotalPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 2),
+		'xATSSystemOutputTotalPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 4),
+		'xATSSystemOutputUnderCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 9),
+		'xATSSystemOutputUnderVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 7),
+		'xATSSystemOutputVoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1, 2),
+		'xATSSystemOutputVoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 4, 3, 12, 1, 3),
+		'xATSTesting': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5),
+		'xATSTestingResults': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2),
+		'xATSTestingResultsLastCrankDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2, 4),
+		'xATSTestingResultsLastDateOfTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2, 1),
+		'xATSTestingResultsLastLoadedDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2, 6),
+		'xATSTestingResultsLastResult': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2, 2),
+		'xATSTestingResultsLastUnloadedDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2, 7),
+		'xATSTestingResultsLastWarmupDuration': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2, 5),
+		'xATSTestingResultsTestLastTestTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 2, 3),
+		'xATSTestingSchedule': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 3),
+		'xATSTestingScheduleFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 3, 1),
+		'xATSTestingScheduleNextTestDate': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 3, 6),
+		'xATSTestingScheduleTestDay': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 3, 2),
+		'xATSTestingScheduleTestTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 3, 3),
+		'xATSTestingScheduleTestWithLoadInterval': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 3, 4),
+		'xATSTestingScheduleTestWithLoadSelectMonth': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 3, 5),
+		'xATSTestingSimulatePowerFail': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 4),
+		'xATSTestingSimulatePowerFailTest': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 4, 1),
+		'xATSTestingSimulatePowerFailTimeRemaining': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 4, 2),
+		'xATSTestingStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 1),
+		'xATSTestingStatusProfileLoadedTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 1, 4),
+		'xATSTestingStatusProfileUnloadedTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 1, 5),
+		'xATSTestingStatusProfileWarmupTime': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 1, 3),
+		'xATSTestingStatusSelectTestProcess': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 1, 1),
+		'xATSTestingStatusTestStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 17, 5, 1, 2),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'xATSDeviceDCBackUpPresent': (('yes', 1), ('no', 2)),
+		'xATSDeviceServiceType': (('threeWire', 1), ('fourWire', 2)),
+		'xATSInputContactCurrentState': (('open', 1), ('closed', 2)),
+		'xATSInputContactNormalState': (('open', 1), ('closed', 2)),
+		'xATSOutputRelayCurrentState': (('open', 1), ('closed', 2)),
+		'xATSOutputRelayNormalState': (('open', 1), ('closed', 2)),
+		'xATSSource1Index': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'xATSSource1Position': (('open', 1), ('closed', 2), ('tripped', 3), ('unknown', 4)),
+		'xATSSource1Quality': (('sourceGood', 1), ('lowVoltage', 2), ('highVoltage', 3), ('phaseImbalance', 4), ('freqOutOfRange', 5), ('badRotation', 6), ('unknown', 7)),
+		'xATSSource1Rotation': (('abc', 1), ('cba', 2), ('unknown', 3)),
+		'xATSSource2Index': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'xATSSource2Position': (('open', 1), ('closed', 2), ('tripped', 3), ('unknown', 4)),
+		'xATSSource2Quality': (('sourceGood', 1), ('lowVoltage', 2), ('highVoltage', 3), ('phaseImbalance', 4), ('freqOutOfRange', 5), ('badRotation', 6), ('unknown', 7)),
+		'xATSSource2Rotation': (('abc', 1), ('cba', 2), ('unknown', 3)),
+		'xATSSwitchSettingsAllowClosedTransfer': (('yes', 1), ('no', 2), ('unknown', 3)),
+		'xATSSwitchSettingsClearLatchedAlarms': (('yes', 1), ('no', 2)),
+		'xATSSwitchSettingsNominalRotation': (('abc', 1), ('cba', 2), ('any', 3), ('unknown', 4)),
+		'xATSSwitchSettingsSetToFactoryDefaults': (('yes', 1), ('no', 2)),
+		'xATSSwitchStatisticsReset': (('yes', 1), ('no', 2)),
+		'xATSSwitchStatusAutomaticOperationSwitch': (('disabled', 1), ('enabled', 2), ('unknown', 3)),
+		'xATSSwitchStatusEngineStartSignal': (('run', 1), ('stop', 2), ('unknown', 3)),
+		'xATSSwitchStatusOperationalMode': (('automatic', 1), ('notInAutoAbnormal', 2), ('notInAuto', 3), ('unknown', 4)),
+		'xATSSwitchStatusSelectedSource': (('none', 1), ('source1', 2), ('source2', 3), ('fault', 4), ('unknown', 5)),
+		'xATSSwitchTimersAbort': (('yes', 1), ('no', 2)),
+		'xATSSwitchTimersStatus': (('inactive', 1), ('active', 2)),
+		'xATSSystemOutputFrequencyTolerance': (('freqToleranceOff', 1), ('freqToleranceNine', 10), ('freqTolerancePointTwo', 2), ('freqTolerancePointFive', 3), ('freqToleranceOne', 4), ('freqToleranceOnePointFive', 5), ('freqToleranceTwo', 6), ('freqToleranceThree', 7), ('freqToleranceFour', 8), ('freqToleranceFive', 9)),
+		'xATSSystemOutputPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'xATSTestingResultsLastResult': (('noResultsAvailable', 1), ('genFailedDuringWarmup', 10), ('failureOnXferToS1', 11), ('genFailedLoaded', 12), ('failureOnRexferToS2', 13), ('failedOnCooldown', 14), ('genFailedToStop', 15), ('failedAtsInternalFault', 16), ('failedAtsNotInAuto', 17), ('canceledManualTest', 18), ('canceledScheduledTest', 19), ('startTestPassed', 2), ('loadTestPassed', 3), ('startSignalFailure', 4), ('failedGenNotInAuto', 5), ('failedGenEmerStop', 6), ('failedGenShutdown', 7), ('failedGenDidNotStart', 8), ('failedS2NeverGood', 9)),
+		'xATSTestingScheduleFrequency': (('never', 1), ('daily', 2), ('weekly', 3), ('monthly', 4)),
+		'xATSTestingScheduleTestWithLoadInterval': (('applyLoadEveryTest', 1), ('neverApplyLoad', 2), ('applyLoadMonthly', 3), ('applyLoadMonthlyDetailed', 4)),
+		'xATSTestingSimulatePowerFailTest': (('cancelSimulation', 1), ('fiveSecondsSimulation', 2), ('tenSecondsSimulation', 3), ('thirtySecondsSimulation', 4), ('oneMinuteSimulation', 5), ('threeMinutesSimulation', 6), ('fiveMinutesSimulation', 7), ('tenMinutesSimulation', 8)),
+		'xATSTestingStatusSelectTestProcess': (('engineStartTest', 1), ('systemLoadTest', 2), ('generatorHoldTest', 3), ('cancelTest', 4)),
+		'xATSTestingStatusTestStatus': (('noTestInProcess', 1), ('holdingOnGenerator', 10), ('testPending', 2), ('startingEngine', 3), ('engineWarmingUp', 4), ('awaitingTransferToS2', 5), ('testingWithLoad', 6), ('awaitingRetransferToS1', 7), ('testingWithoutLoad', 8), ('stoppingEngine', 9)),
+	},
+}
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# Autogenerated by ups_apc_snmp.mibindex - do not edit
+
+SYMBOLS = {
+	'PowerNet-MIB': {
+		'xPDU': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15),
+		'xPDUACMonitoringPoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3),
+		'xPDUBranchBreakerCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 5),
+		'xPDUBranchBreakerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1),
+		'xPDUBranchBreakerLocation': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 11),
+		'xPDUBranchBreakerMaxCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 8),
+		'xPDUBranchBreakerMinCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 9),
+		'xPDUBranchBreakerName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 10),
+		'xPDUBranchBreakerOverCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 6),
+		'xPDUBranchBreakerRDPFeed': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 3),
+		'xPDUBranchBreakerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 2),
+		'xPDUBranchBreakerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3),
+		'xPDUBranchBreakerTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 1),
+		'xPDUBranchBreakerTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 2),
+		'xPDUBranchBreakerTieIndicator': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 4),
+		'xPDUBranchBreakerUnderCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 3, 1, 7),
+		'xPDUBranchBreakers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2),
+		'xPDUBypassInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2),
+		'xPDUBypassInputOverVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 1),
+		'xPDUBypassInputUnderVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 2),
+		'xPDUBypassInputVoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 4, 1, 2),
+		'xPDUBypassInputVoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 4, 1, 3),
+		'xPDUBypassInputVoltagePhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 4, 1),
+		'xPDUBypassInputVoltagePhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 4, 1, 1),
+		'xPDUBypassInputVoltagePhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 4),
+		'xPDUBypassInputVoltagePhaseTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 2, 3),
+		'xPDUCircuitBreakers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4),
+		'xPDUCoolingFanStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 7, 3),
+		'xPDUDevice': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2),
+		'xPDUDeviceBypassInputPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 11),
+		'xPDUDeviceCrossTieOutputPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 12),
+		'xPDUDeviceEarthGroundMonitorPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 13),
+		'xPDUDeviceFansPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 10),
+		'xPDUDeviceFusesPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 9),
+		'xPDUDeviceInfraStruXureType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 14),
+		'xPDUDeviceLoadTestPortPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 8),
+		'xPDUDeviceLoadTieBreakerPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 7),
+		'xPDUDeviceMainInputBreakerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 4),
+		'xPDUDeviceNominalMainInputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 1),
+		'xPDUDeviceNominalOutputVoltage': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 3),
+		'xPDUDevicePanelBreakerRating': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 5),
+		'xPDUDeviceServiceType': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 2),
+		'xPDUDeviceTransformerPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 2, 6),
+		'xPDUEPOMode': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 7, 1),
+		'xPDUGroundCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 5, 1),
+		'xPDUGroundCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 5, 2),
+		'xPDUGroundMonitorPoint': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 5),
+		'xPDUIdent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1),
+		'xPDUIdentDateOfManufacture': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 6),
+		'xPDUIdentFirmwareAppOSRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 4),
+		'xPDUIdentFirmwareAppRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 3),
+		'xPDUIdentFirmwareControllerRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 5),
+		'xPDUIdentHardwareRev': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 2),
+		'xPDUIdentModelNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 7),
+		'xPDUIdentProductName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 1),
+		'xPDUIdentSerialNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 1, 8),
+		'xPDUInputContactCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 3, 1, 4),
+		'xPDUInputContactEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 3, 1),
+		'xPDUInputContactName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 3, 1, 2),
+		'xPDUInputContactNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 3, 1, 3),
+		'xPDUInputContactNumContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 1),
+		'xPDUInputContactNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 3, 1, 1),
+		'xPDUInputContactTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 3),
+		'xPDUInputContactTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5, 2),
+		'xPDUInputContacts': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 5),
+		'xPDUMainInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1),
+		'xPDUMainInputOverVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 1),
+		'xPDUMainInputUnderVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 2),
+		'xPDUMainInputVoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 4, 1, 2),
+		'xPDUMainInputVoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 4, 1, 3),
+		'xPDUMainInputVoltagePhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 4, 1),
+		'xPDUMainInputVoltagePhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 4, 1, 1),
+		'xPDUMainInputVoltagePhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 4),
+		'xPDUMainInputVoltageTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 1, 3),
+		'xPDUMiscGroup': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 7),
+		'xPDUNumOfBranchBreakers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 2, 1),
+		'xPDUOutputRelayCurrentState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 3, 1, 4),
+		'xPDUOutputRelayEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 3, 1),
+		'xPDUOutputRelayName': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 3, 1, 2),
+		'xPDUOutputRelayNormalState': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 3, 1, 3),
+		'xPDUOutputRelayNumber': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 3, 1, 1),
+		'xPDUOutputRelayTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 3),
+		'xPDUOutputRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6),
+		'xPDUOutputRelaysNumRelays': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 1),
+		'xPDUOutputRelaysTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 6, 2),
+		'xPDUSystemBreakerDescription': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 1, 2, 1, 2),
+		'xPDUSystemBreakerEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 1, 2, 1),
+		'xPDUSystemBreakerPosition': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 1, 2, 1, 3),
+		'xPDUSystemBreakerTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 1, 2),
+		'xPDUSystemBreakerTableIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 1, 2, 1, 1),
+		'xPDUSystemBreakerTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 1, 1),
+		'xPDUSystemBreakers': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 4, 1),
+		'xPDUSystemOutput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4),
+		'xPDUSystemOutputApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1, 6),
+		'xPDUSystemOutputFrequency': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 1),
+		'xPDUSystemOutputFrequencyTolerance': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 6),
+		'xPDUSystemOutputMaxKWPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 7),
+		'xPDUSystemOutputNeutralCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 2),
+		'xPDUSystemOutputOverCurrentNeutralThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 11),
+		'xPDUSystemOutputOverCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 10),
+		'xPDUSystemOutputOverVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 8),
+		'xPDUSystemOutputPhaseCurrent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1, 4),
+		'xPDUSystemOutputPhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1),
+		'xPDUSystemOutputPhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1, 1),
+		'xPDUSystemOutputPhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14),
+		'xPDUSystemOutputPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1, 5),
+		'xPDUSystemOutputPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1, 7),
+		'xPDUSystemOutputTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 13),
+		'xPDUSystemOutputTotalApparentPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 4),
+		'xPDUSystemOutputTotalPower': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 3),
+		'xPDUSystemOutputTotalPowerFactor': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 5),
+		'xPDUSystemOutputUnderCurrentThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 12),
+		'xPDUSystemOutputUnderVoltThreshold': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 9),
+		'xPDUSystemOutputVoltageLtoL': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1, 2),
+		'xPDUSystemOutputVoltageLtoN': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 4, 14, 1, 3),
+		'xPDUTransformTempStatus': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 7, 2),
+		'xPDUUPSInput': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 3),
+		'xPDUUPSInputVoltageLtoNPresent': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 3, 2, 1, 2),
+		'xPDUUPSInputVoltagePhaseEntry': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 3, 2, 1),
+		'xPDUUPSInputVoltagePhaseIndex': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 3, 2, 1, 1),
+		'xPDUUPSInputVoltagePhaseTable': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 3, 2),
+		'xPDUUPSInputVoltagePhaseTableSize': (1, 3, 6, 1, 4, 1, 318, 1, 1, 15, 3, 3, 1),
+	},
+}
+
+NAMED_VALUES = {
+	'PowerNet-MIB': {
+		'xPDUBranchBreakerRDPFeed': (('remoteDistribution', 1), ('noRemoteDistribution', 2)),
+		'xPDUBranchBreakerTieIndicator': (('breakerUnTied', 1), ('breakerTied', 2)),
+		'xPDUBypassInputVoltagePhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'xPDUCoolingFanStatus': (('normal', 1), ('failed', 2), ('noCoolingFansPresent', 3), ('unknown', 4)),
+		'xPDUDeviceBypassInputPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUDeviceCrossTieOutputPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUDeviceEarthGroundMonitorPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUDeviceFansPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUDeviceFusesPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUDeviceInfraStruXureType': (('typeB', 1), ('typeC', 2)),
+		'xPDUDeviceLoadTestPortPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUDeviceLoadTieBreakerPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUDeviceServiceType': (('threeWire', 1), ('fourWire', 2)),
+		'xPDUDeviceTransformerPresent': (('notPresent', 1), ('present', 2)),
+		'xPDUEPOMode': (('armed', 1), ('disarmed', 2), ('unknown', 3)),
+		'xPDUInputContactCurrentState': (('open', 1), ('closed', 2), ('unknown', 3)),
+		'xPDUInputContactNormalState': (('open', 1), ('closed', 2)),
+		'xPDUMainInputVoltagePhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'xPDUOutputRelayCurrentState': (('open', 1), ('closed', 2), ('unknown', 3)),
+		'xPDUOutputRelayNormalState': (('open', 1), ('closed', 2)),
+		'xPDUSystemBreakerPosition': (('open', 1), ('closed', 2), ('unknown', 3)),
+		'xPDUSystemOutputFrequencyTolerance': (('freqToleranceOff', 1), ('freqToleranceNine', 10), ('freqTolerancePointTwo', 2), ('freqTolerancePointFive', 3), ('freqToleranceOne', 4), ('freqToleranceOnePointFive', 5), ('freqToleranceTwo', 6), ('freqToleranceThree', 7), ('freqToleranceFour', 8), ('freqToleranceFive', 9)),
+		'xPDUSystemOutputPhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+		'xPDUTransformTempStatus': (('normal', 1), ('overtemp', 2), ('noTransformerPresent', 3), ('unknown', 4)),
+		'xPDUUPSInputVoltageLtoNPresent': (('notPresent', 1), ('present', 2), ('unknown', 3)),
+		'xPDUUPSInputVoltagePhaseIndex': (('phase1', 1), ('phase2', 2), ('phase3', 3)),
+	},
+}
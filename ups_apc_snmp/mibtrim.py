@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Generator of a slim PowerNet-MIB with only the objects of UPS devices
+
+The autogenerated PowerNet-MIB.py defines the whole APC enterprise tree.
+Whenever a symbol has to be resolved through pysnmp instead of the
+precompiled index, pysnmp executes all of it. The trimmed module keeps the
+ups, uio, iem and mem objects, their parent nodes and the textual
+conventions they use, so loading it is a fraction of the work.
+
+Regenerate it with:
+
+	python -m ups_apc_snmp.mibtrim
+"""
+
+import argparse
+import os
+import re
+
+MIB_DIR = os.path.dirname(os.path.realpath(__file__))
+SLIM_MIB_DIR = os.path.join(MIB_DIR, 'slimmib')
+MIB_FILE = 'PowerNet-MIB.py'
+
+# Leading lowercase words of the symbols kept in the slim MIB
+SLIM_PREFIXES = ('ups', 'uio', 'iem', 'mem')
+
+# Symbols exported per exportSymbols call, as in the pysnmp generated modules
+_EXPORTS_PER_LINE = 100
+
+_SECTION_RE = re.compile(r'^# (\w+)$')
+_CLASS_RE = re.compile(r'^class (\w+)\(')
+_OBJECT_RE = re.compile(r'^(\w+) = (?:MibIdentifier|MibScalar|MibTable|MibTableRow|MibTableColumn)\(\(([\d, ]+)\)')
+_LOADTEXTS_RE = re.compile(r'^if mibBuilder\.loadTexts: (\w+)\.')
+_WORD_RE = re.compile(r'[a-z]*')
+_IDENTIFIER_RE = re.compile(r'\b([A-Z]\w*)\(')
+
+
+def _split_sections(path):
+	"""Split a pysnmp MIB module into its header lines and the lines of each of its first sections"""
+	header = []
+	sections = {}
+	current = header
+	with open(path) as mib_file:
+		for line in mib_file:
+			match = _SECTION_RE.match(line.rstrip('\n'))
+			if match:
+				if match.group(1) in sections:  # the second set of sections are the exports
+					break
+				current = sections.setdefault(match.group(1), [])
+				continue
+			current.append(line)
+	return header, sections
+
+
+def _parse_types(lines):
+	"""Group the Types section into a dict of class name to its lines"""
+	types = {}
+	name = None
+	for line in lines:
+		match = _CLASS_RE.match(line)
+		if match:
+			name = match.group(1)
+			types[name] = []
+		if name is not None and line.strip():
+			types[name].append(line)
+	return types
+
+
+def _parse_objects(lines):
+	"""Group the Objects section into a list of (name, oid, lines) tuples"""
+	objects = []
+	for line in lines:
+		match = _OBJECT_RE.match(line)
+		if match:
+			oid = tuple(int(x) for x in match.group(2).replace(' ', '').strip(',').split(','))
+			objects.append((match.group(1), oid, [line]))
+			continue
+		match = _LOADTEXTS_RE.match(line)
+		if match and objects and objects[-1][0] == match.group(1):
+			objects[-1][2].append(line)
+	return objects
+
+
+def trim_mib(source, target, prefixes=SLIM_PREFIXES):
+	"""Write a copy of the MIB module source to target, keeping only the objects starting with prefixes"""
+	header, sections = _split_sections(source)
+	types = _parse_types(sections.get('Types', []))
+	objects = _parse_objects(sections.get('Objects', []))
+
+	kept = [(name, oid) for name, oid, _ in objects if _WORD_RE.match(name).group(0) in prefixes]
+	ancestors = set(oid[:length] for _, oid in kept for length in range(1, len(oid)))
+	kept_names = set(name for name, _ in kept)
+	kept_objects = [(name, lines) for name, oid, lines in objects if name in kept_names or oid in ancestors]
+
+	kept_types = set()
+	for _, lines in kept_objects:
+		kept_types.update(identifier for identifier in _IDENTIFIER_RE.findall(lines[0]) if identifier in types)
+
+	if not os.path.isdir(os.path.dirname(target)):
+		os.makedirs(os.path.dirname(target))
+	with open(target, 'w') as mib_file:
+		mib_file.write(''.join(header).rstrip('\n') + '\n')
+		mib_file.write('# Trimmed by ups_apc_snmp.mibtrim to the symbols starting with %s - do not edit\n\n' % ', '.join(prefixes))
+		mib_file.write('# Imports\n')
+		mib_file.write(''.join(sections.get('Imports', [])).rstrip('\n') + '\n\n')
+		mib_file.write('# Types\n\n')
+		for name in sorted(kept_types):
+			mib_file.write(''.join(types[name]) + '    \n')
+		mib_file.write('\n# Objects\n\n')
+		for _, lines in kept_objects:
+			mib_file.write(''.join(lines))
+		mib_file.write('\n# Exports\n\n')
+		mib_file.write('# Types\n')
+		_write_exports(mib_file, sorted(kept_types))
+		mib_file.write('\n# Objects\n')
+		_write_exports(mib_file, [name for name, _ in kept_objects])
+	return len(kept_objects), len(objects)
+
+
+def _write_exports(mib_file, names):
+	for start in range(0, len(names), _EXPORTS_PER_LINE):
+		chunk = names[start:start + _EXPORTS_PER_LINE]
+		mib_file.write('mibBuilder.exportSymbols("PowerNet-MIB", %s)\n' % ', '.join('%s=%s' % (name, name) for name in chunk))
+
+
+def main():
+	argp = argparse.ArgumentParser(description='Generate the slim PowerNet-MIB holding only the objects of UPS devices')
+	argp.add_argument('-p', '--prefix', help='Leading lowercase word of the symbols to keep, repeat for several', action='append', default=None)
+	args = argp.parse_args()
+
+	kept, total = trim_mib(os.path.join(MIB_DIR, MIB_FILE), os.path.join(SLIM_MIB_DIR, MIB_FILE), tuple(args.prefix or SLIM_PREFIXES))
+	print('Kept %d of %d objects in %s' % (kept, total, os.path.join(SLIM_MIB_DIR, MIB_FILE)))
+
+
+if __name__ == "__main__":
+	main()
@@ -2,8 +2,13 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import collections
+import concurrent.futures
+import functools
 import logging
 import os
+import sys
+import time
 
 import configparser
 import nagiosplugin
@@ -11,15 +16,83 @@ import nagiosplugin.result
 import nagiosplugin.state
 
 import ups_apc_snmp
+import ups_apc_snmp.capabilities
+import ups_apc_snmp.circuitbreaker
+import ups_apc_snmp.hoststate
+import ups_apc_snmp.pollcache
 import ups_apc_snmp.snmpclient
+import ups_apc_snmp.stateflags
 
 MIB_PATH = os.path.realpath(os.path.dirname(ups_apc_snmp.__file__))
+# PowerNet-MIB trimmed to UPS objects by ups_apc_snmp.mibtrim, searched before the full one unless disabled
+SLIM_MIB_PATH = os.path.join(MIB_PATH, 'slimmib')
+
+DEFAULT_CACHE_DIR = '/var/cache/check_ups_apc'
+
+# Seconds of the check timeout left for evaluating a poll after its deadline
+DEADLINE_MARGIN = 1
 
 _log = logging.getLogger('nagiosplugin')
 
+# Specification of a scalar metric: where it is read from, how its value is converted and logged and how it is evaluated
+# log_fmt is formatted with the host and the converted value
+# context is called with the metric name, and the warning and critical ranges if thresholds are given as a pair of
+# templates filled in from the device config; the fallback is an object of lower precision read in the same request,
+# used when the agent does not have oid
+ScalarMetric = collections.namedtuple('ScalarMetric', ['name', 'oid', 'named', 'convert', 'optional', 'log_fmt', 'context', 'thresholds', 'uom', 'fallback_oid', 'fallback_convert'])
+ScalarMetric.__new__.__defaults__ = (None, None, None, None)
+
+# Columns of the battery pack table used by the check, other columns are never fetched
+BATTERY_PACK_COLUMNS = (
+	'PowerNet-MIB::upsHighPrecBatteryPackIndex',
+	'PowerNet-MIB::upsHighPrecBatteryCartridgeIndex',
+	'PowerNet-MIB::upsHighPrecBatteryPackSerialNumber',
+	'PowerNet-MIB::upsHighPrecBatteryPackTemperature',
+	'PowerNet-MIB::upsHighPrecBatteryPackStatus',
+	'PowerNet-MIB::upsHighPrecBatteryPackCartridgeHealth',
+	'PowerNet-MIB::upsHighPrecBatteryPackCartridgeReplaceDate',
+	'PowerNet-MIB::upsHighPrecBatteryPackCartridgeInstallDate',
+	'PowerNet-MIB::upsHighPrecBatteryPackCartridgeStatus',
+)
+
+
+def metric_oids(metrics):
+	"""All objects read for metrics, including their fallbacks"""
+	oids = []
+	for metric in metrics:
+		oids.append(metric.oid)
+		if metric.fallback_oid is not None:
+			oids.append(metric.fallback_oid)
+	return oids
+
+
+def scalar_oids(metrics, profile):
+	"""Objects to request for metrics from an agent with the capability profile
+
+	A metric with a fallback is read from both objects unless the profile tells which one the agent has."""
+	oids = []
+	for metric in metrics:
+		if profile.supports(metric.oid):
+			oids.append(metric.oid)
+		if metric.fallback_oid is not None and profile.supports(metric.fallback_oid):
+			oids.append(metric.fallback_oid)
+	return oids
+
+
+def add_mib_paths(full_mib=False, cache_dir=None):
+	"""Let pysnmp find the slim PowerNet-MIB, or the full one if requested, and the MIBs it imports
+
+	The full PowerNet-MIB is checked against the precompiled index if a cache_dir is given."""
+	if not full_mib:
+		ups_apc_snmp.snmpclient.add_mib_path(SLIM_MIB_PATH)
+	ups_apc_snmp.snmpclient.add_mib_path(MIB_PATH, cache_dir)
+
 
 class UPSAPCSummary(nagiosplugin.Summary):
 	def ok(self, results):  # pylint: disable=R0201
+		if 'reachable' not in results:
+			# the poll failed before the device answered, the failure is the first significant result
+			return "No data available"
 		if 'error_status' in results['reachable'].metric.value:
 			summary = 'Device is not reachable through SNMP with error %s' % results['reachable'].metric.value['error_status']
 		else:
@@ -50,7 +123,7 @@ class PerformanceContext(nagiosplugin.Context):  # pylint: disable=too-few-publi
 		super(PerformanceContext, self).__init__(name, fmt_metric, result_cls)
 
 	def performance(self, metric, resource):  # pylint: disable=W0613,R0201
-		return nagiosplugin.performance.Performance(metric.name, metric.value)
+		return nagiosplugin.performance.Performance(metric.name, metric.value, metric.uom or '')
 
 	def evaluate(self, metric, resource):  # pylint: disable=W0613
 		return self.result_cls(nagiosplugin.state.Ok, None, metric)
@@ -135,6 +208,11 @@ class ElementContext(nagiosplugin.Context):  # pylint: disable=too-few-public-me
 			return self.result_cls(nagiosplugin.state.Unknown, self.unknown_text, metric)
 
 
+class PartialContext(nagiosplugin.Context):  # pylint: disable=too-few-public-methods
+	def evaluate(self, metric, resource):  # pylint: disable=W0613
+		return self.result_cls(nagiosplugin.state.Unknown, "Poll incomplete - %s" % metric.value, metric)
+
+
 class SNMPContext(nagiosplugin.Context):  # pylint: disable=too-few-public-methods
 	def evaluate(self, metric, resource):  # pylint: disable=W0613
 		if metric.value["status"]:
@@ -143,282 +221,530 @@ class SNMPContext(nagiosplugin.Context):  # pylint: disable=too-few-public-metho
 			return self.result_cls(nagiosplugin.state.Critical, "Unreachable - %s" % metric.value["error_indication"], metric)
 
 
-class UPSAPC(nagiosplugin.Resource):  # pylint: disable=too-few-public-methods
-	def __init__(self, args):
-		self.args = args
-		ups_apc_snmp.snmpclient.add_mib_path(MIB_PATH)
-		self.snmpclient = None
-
-	def probe(self):  # pylint: disable=too-many-locals
-		_log.debug("Probing APC UPS device %s through SNMP", self.args.host)
-		self.snmpclient = ups_apc_snmp.snmpclient.SnmpClient(self.args.host, ups_apc_snmp.snmpclient.snmp_auth_data_v2c(community=self.args.community), timeout=self.args.snmp_timeout, retries=self.args.retries)
-
-		if not self.snmpclient.alive:
-			_log.warn("Device is not reachable through SNMP with error %s", self.snmpclient.error_status)
-			yield nagiosplugin.Metric('reachable', dict(status=self.snmpclient.alive, error_indication=self.snmpclient.error_indication, error_status=self.snmpclient.error_status, error_varbinds=self.snmpclient.error_varbinds))
-			return
-
-		_log.debug("Queried APC UPS device %s through SNMP - device is reachable", self.args.host)
-		yield nagiosplugin.Metric('reachable', dict(status=True))
-		_log.debug("Found Sysname %s and sysdescr %s", self.snmpclient.sysname, self.snmpclient.sysdescr)
-
-		if not str(self.snmpclient.sysdescr).startswith("APC"):
-			raise nagiosplugin.CheckError("Device is not a APC UPS device - System description is %s", self.snmpclient.sysdescr)
+def _tenth(value):
+	return float(value) / 10.0
+
+
+OUTPUT_STATUS_OK_VALUES = [
+	'onLine',
+	'hotStandby',
+]
+OUTPUT_STATUS_WARN_VALUES = [
+	'onBattery',
+	'onSmartBoost',  # under-voltage boost
+	'softwareBypass',
+	'switchedBypass',
+	'rebooting',
+	'onSmartTrim',  # over-voltage trim
+	'ecoMode',  # bypass
+	'staticBypassStandby',
+]
+OUTPUT_STATUS_CRIT_VALUES = [
+	'timedSleeping',  # output off (planned)
+	'sleepingUntilPowerReturn',
+	'hardwareFailureBypass',
+	'emergencyStaticBypass',
+	'off',
+	'powerSavingMode',  # auto-off
+]
+
+# Scalar metrics of a device, all fetched using a single batched SNMP get
+# HighPrec objects in tenths are read together with their Adv fallback in whole units until the device is known to have them
+SCALAR_METRICS = (
+	ScalarMetric('sysuptime', 'SNMPv2-MIB::sysUpTime.0', False, lambda value: int(value / 100 / 60), False, "Device %s uptime is %d minutes", nagiosplugin.ScalarContext, thresholds=('@0:%(uptime)i', None)),
+
+	# device
+	ScalarMetric('unit_type', 'PowerNet-MIB::upsBasicIdentModel.0', False, str, False, "Device %s unit type is %s", nagiosplugin.Context),
+	ScalarMetric('diagnostics_date', 'PowerNet-MIB::upsAdvTestLastDiagnosticsDate.0', False, str, False, "Device %s last diagnostics date was %s", PerformanceContext),
+	ScalarMetric('diagnostics_result', 'PowerNet-MIB::upsAdvTestDiagnosticsResults.0', True, None, False, "Device %s last diagnostics result was %s", functools.partial(ElementContext, ok_values=['ok', 'testInProgress'], crit_values=['failed', 'invalidTest'])),
+	ScalarMetric('uio_temp1', 'PowerNet-MIB::uioSensorStatusTemperatureDegC.1.1', False, int, True, "Device %s external temperature sensor 1 is at %dC", PerformanceContext),
+	ScalarMetric('uio_temp2', 'PowerNet-MIB::uioSensorStatusTemperatureDegC.1.2', False, int, True, "Device %s external temperature sensor 2 is at %dC", PerformanceContext),
 
-		_log.debug("Starting SNMP polling of host %s", self.args.host)
-
-		sysuptime = self.snmpclient.get("SNMPv2-MIB::sysUpTime.0")
-
-		yield nagiosplugin.Metric("sysuptime", int(sysuptime.get_value() / 100 / 60))
+	# battery
+	ScalarMetric('battery_capacity', 'PowerNet-MIB::upsHighPrecBatteryCapacity.0', False, _tenth, False, "Device %s battery capacity is %.1f%%", nagiosplugin.ScalarContext, thresholds=('%(battery_capacity_min_warn)i:100', '%(battery_capacity_min_crit)i:100'), uom='%', fallback_oid='PowerNet-MIB::upsAdvBatteryCapacity.0', fallback_convert=float),
+	ScalarMetric('battery_voltage', 'PowerNet-MIB::upsHighPrecBatteryActualVoltage.0', False, _tenth, False, "Device %s battery voltage is %.1fV", PerformanceContext, fallback_oid='PowerNet-MIB::upsAdvBatteryActualVoltage.0', fallback_convert=float),
+	ScalarMetric('battery_temperature', 'PowerNet-MIB::upsHighPrecBatteryTemperature.0', False, _tenth, False, "Device %s battery temperature is %.1fC", nagiosplugin.ScalarContext, thresholds=('%(battery_temperature_min_warn)i:%(battery_temperature_max_warn)i', '%(battery_temperature_min_crit)i:%(battery_temperature_max_crit)i'), fallback_oid='PowerNet-MIB::upsAdvBatteryTemperature.0', fallback_convert=float),
+	ScalarMetric('battery_run_time_remaining', 'PowerNet-MIB::upsAdvBatteryRunTimeRemaining.0', False, lambda value: float(value) / 100, False, "Device %s battery run time remaining: %ds", PerformanceContext, uom='s'),
 
-		# device
-		unit_type = self.snmpclient.get("PowerNet-MIB::upsBasicIdentModel.0").get_value()
-		_log.debug("Device %s unit type is %s", self.args.host, unit_type)
-		yield nagiosplugin.Metric('unit_type', unit_type)
+	# input
+	ScalarMetric('input_voltage', 'PowerNet-MIB::upsHighPrecInputLineVoltage.0', False, _tenth, False, "Device %s input voltage is %.1fV", nagiosplugin.ScalarContext, thresholds=('%(input_voltage_min_warn)i:%(input_voltage_max_warn)i', '%(input_voltage_min_crit)i:%(input_voltage_max_crit)i'), fallback_oid='PowerNet-MIB::upsAdvInputLineVoltage.0', fallback_convert=float),
+	ScalarMetric('input_min_voltage', 'PowerNet-MIB::upsHighPrecInputMinLineVoltage.0', False, _tenth, False, "Device %s minimum input voltage is %.1fV", PerformanceContext, fallback_oid='PowerNet-MIB::upsAdvInputMinLineVoltage.0', fallback_convert=float),
+	ScalarMetric('input_max_voltage', 'PowerNet-MIB::upsHighPrecInputMaxLineVoltage.0', False, _tenth, False, "Device %s maximum input voltage is %.1fV", PerformanceContext, fallback_oid='PowerNet-MIB::upsAdvInputMaxLineVoltage.0', fallback_convert=float),
+	ScalarMetric('input_frequency', 'PowerNet-MIB::upsHighPrecInputFrequency.0', False, _tenth, False, "Device %s input frequency is %.1fHz", nagiosplugin.ScalarContext, thresholds=('%(input_frequency_min_warn)i:%(input_frequency_max_warn)i', '%(input_frequency_min_crit)i:%(input_frequency_max_crit)i'), fallback_oid='PowerNet-MIB::upsAdvInputFrequency.0', fallback_convert=float),
+	ScalarMetric('input_fail_cause', 'PowerNet-MIB::upsAdvInputLineFailCause.0', True, None, False, "Device %s input last fail cause is %s", nagiosplugin.Context),
 
-		diagnostics_date = self.snmpclient.get("PowerNet-MIB::upsAdvTestLastDiagnosticsDate.0").get_value()
-		_log.debug("Device %s last diagnostics date was %s", self.args.host, diagnostics_date)
-		yield nagiosplugin.Metric('diagnostics_date', diagnostics_date)
+	# output
+	ScalarMetric('output_voltage', 'PowerNet-MIB::upsHighPrecOutputVoltage.0', False, _tenth, False, "Device %s output voltage is %.1fV", nagiosplugin.ScalarContext, thresholds=('%(output_voltage_min_warn)i:%(output_voltage_max_warn)i', '%(output_voltage_min_crit)i:%(output_voltage_max_crit)i'), fallback_oid='PowerNet-MIB::upsAdvOutputVoltage.0', fallback_convert=float),
+	ScalarMetric('output_current', 'PowerNet-MIB::upsHighPrecOutputCurrent.0', False, _tenth, False, "Device %s output current is %.1fA", PerformanceContext, fallback_oid='PowerNet-MIB::upsAdvOutputCurrent.0', fallback_convert=float),
+	ScalarMetric('output_load', 'PowerNet-MIB::upsHighPrecOutputLoad.0', False, _tenth, False, "Device %s output load is %.1f%%", nagiosplugin.ScalarContext, thresholds=('0:%(output_load_max_warn)i', '0:%(output_load_max_crit)i'), uom='%', fallback_oid='PowerNet-MIB::upsAdvOutputLoad.0', fallback_convert=float),
+	ScalarMetric('output_frequency', 'PowerNet-MIB::upsHighPrecOutputFrequency.0', False, _tenth, False, "Device %s output frequency is %.1fHz", nagiosplugin.ScalarContext, thresholds=('%(output_frequency_min_warn)i:%(output_frequency_max_warn)i', '%(output_frequency_min_crit)i:%(output_frequency_max_crit)i'), fallback_oid='PowerNet-MIB::upsAdvOutputFrequency.0', fallback_convert=float),
+	ScalarMetric('output_efficiency', 'PowerNet-MIB::upsHighPrecOutputEfficiency.0', False, _tenth, True, "Device %s output efficiency is %.1f%%", PerformanceContext, uom='%'),
+)
+
+# Firmware revision of the UPS, which together with the model selects the shared capability profile
+FIRMWARE_OID = 'PowerNet-MIB::upsAdvIdentFirmwareRevision.0'
+
+# Metrics derived from upsBasicStateOutputState, read from their own objects in the same request until the agent is known to have valid state flags
+STATE_METRICS = (
+	ScalarMetric('output_status', 'PowerNet-MIB::upsBasicOutputStatus.0', True, None, False, "Device %s output status is %s", functools.partial(ElementContext, ok_values=OUTPUT_STATUS_OK_VALUES, warn_values=OUTPUT_STATUS_WARN_VALUES, crit_values=OUTPUT_STATUS_CRIT_VALUES)),
+	ScalarMetric('battery_status', 'PowerNet-MIB::upsBasicBatteryStatus.0', True, None, False, "Device %s battery status is %s", functools.partial(ElementContext, ok_values=['batteryNormal'], warn_values=['batteryLow'], crit_values=['batteryInFaultCondition'])),
+	ScalarMetric('battery_replace_indicator', 'PowerNet-MIB::upsAdvBatteryReplaceIndicator.0', False, lambda value: value != 2, False, "Device %s battery does not need replacement: %s", functools.partial(BoolContext, ok_text="Battery OK", crit_text="Battery needs replacement")),
+)
+
+# Units of measure of the metrics in their performance data, by metric name
+METRIC_UOMS = dict((metric.name, metric.uom) for metric in SCALAR_METRICS + STATE_METRICS if metric.uom)
+
+
+def metric_contexts(metrics, threshold_values):
+	"""Contexts of the metrics, their threshold ranges filled in from threshold_values"""
+	contexts = []
+	for metric in metrics:
+		if metric.thresholds is None:
+			contexts.append(metric.context(metric.name))
+			continue
+		warning, critical = [threshold % threshold_values if threshold is not None else None for threshold in metric.thresholds]
+		contexts.append(metric.context(metric.name, warning=warning, critical=critical))
+	return contexts
 
-		diagnostics_result = self.snmpclient.get("PowerNet-MIB::upsAdvTestDiagnosticsResults.0").get_named_value()
-		_log.debug("Device %s last diagnostics result was %s", self.args.host, diagnostics_result)
-		yield nagiosplugin.Metric('diagnostics_result', diagnostics_result)
 
-		uio_temp1 = self.snmpclient.get("PowerNet-MIB::uioSensorStatusTemperatureDegC.1.1").get_value()
-		try:
-			uio_temp1 = int(uio_temp1)
-			_log.debug("Device %s external temperature sensor 1 is at %dC", self.args.host, uio_temp1)
-			yield nagiosplugin.Metric('uio_temp1', uio_temp1)
-		except:  # pylint: disable=W0702
-			yield nagiosplugin.Metric('uio_temp1', 'U')
+class UPSAPC(nagiosplugin.Resource):  # pylint: disable=too-few-public-methods
+	def __init__(self, args, snmp_engine=None, deadline=None):
+		self.args = args
+		self.snmp_engine = snmp_engine
+		add_mib_paths(args.full_mib, args.cache_dir)
+		self.snmpclient = None
+		self.state = {}
+		self.pdu_budget = None
+		self.rtt_estimator = None
+		self.deadline = deadline if deadline is not None else ups_apc_snmp.snmpclient.Deadline(max(1, args.timeout - DEADLINE_MARGIN))
 
-		uio_temp2 = self.snmpclient.get("PowerNet-MIB::uioSensorStatusTemperatureDegC.1.2").get_value()
+	def probe(self):
+		self.snmpclient = None
+		if self.args.cache_ttl > 0:
+			values = ups_apc_snmp.pollcache.PollCache(self.args.cache_dir, self.args.cache_ttl).get_or_poll(self.args.host, self.args.community, self.poll, cacheable=lambda values: 'partial' not in dict(values))
+		else:
+			values = self.poll()
+
+		for name, value in values:
+			if name == 'snmp_requests' and self.snmpclient is None:
+				_log.debug("Using cached poll result of device %s", self.args.host)
+				value = 0
+			yield nagiosplugin.Metric(name, value, METRIC_UOMS.get(name))
+
+	def poll(self):
+		"""Poll the device, returning a list of metric names and plain values
+
+		If the deadline of the check is reached, the metrics polled so far are returned along with a partial metric."""
+		host_state = ups_apc_snmp.hoststate.HostState(self.args.state_dir, self.args.host) if self.args.state_dir else None
+		self.state = host_state.load() if host_state else {}
+		self.pdu_budget = ups_apc_snmp.snmpclient.get_pdu_budget(self.args.host, saved=self.state.get('pdu_budget'))
+		ups_apc_snmp.snmpclient.load_address(self.args.host, saved=self.state.get('address'))
+		self.rtt_estimator = None if self.args.fixed_timeout else ups_apc_snmp.snmpclient.get_rtt_estimator(self.args.host, saved=self.state.get('rtt'))
+		breaker = ups_apc_snmp.circuitbreaker.CircuitBreaker.from_dict(self.state.get('breaker')) if host_state and self.args.breaker_backoff > 0 else None
+		values = []
 		try:
-			uio_temp2 = int(uio_temp2)
-			_log.debug("Device %s external temperature sensor 2 is at %dC", self.args.host, uio_temp2)
-			yield nagiosplugin.Metric('uio_temp2', uio_temp2)
-		except:  # pylint: disable=W0702
-			yield nagiosplugin.Metric('uio_temp2', 'U')
-
-		# battery
-		battery_status = self.snmpclient.get("PowerNet-MIB::upsBasicBatteryStatus.0").get_named_value()
-		_log.debug("Device %s battery status is %s", self.args.host, battery_status)
-		yield nagiosplugin.Metric('battery_status', battery_status)
-
-		battery_capacity = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecBatteryCapacity.0").get_value()) / 10.0
-		_log.debug("Device %s battery capacity is %.1f%%", self.args.host, battery_capacity)
-		yield nagiosplugin.Metric('battery_capacity', battery_capacity)
-
-		battery_voltage = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecBatteryActualVoltage.0").get_value()) / 10.0
-		_log.debug("Device %s battery voltage is %.1fV", self.args.host, battery_voltage)
-		yield nagiosplugin.Metric('battery_voltage', battery_voltage)
-
-		battery_temperature = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecBatteryTemperature.0").get_value()) / 10.0
-		_log.debug("Device %s battery temperature is %.1fC", self.args.host, battery_temperature)
-		yield nagiosplugin.Metric('battery_temperature', battery_temperature)
-
-		battery_replace_indicator = self.snmpclient.get("PowerNet-MIB::upsAdvBatteryReplaceIndicator.0").get_value() == 2
-		_log.debug("Device %s battery replace indicator is %s", self.args.host, 'on' if battery_replace_indicator else 'off')
-		yield nagiosplugin.Metric('battery_replace_indicator', not battery_replace_indicator)
-
-		battery_run_time_remaining = self.snmpclient.get("PowerNet-MIB::upsAdvBatteryRunTimeRemaining.0").get_value() / 100
-		_log.debug("Device %s battery run time remaining: %ds", self.args.host, battery_run_time_remaining)
-		yield nagiosplugin.Metric('battery_run_time_remaining', battery_run_time_remaining)
-
-		batterypacks = []
-		batterypacktable_varbinds = self.snmpclient.gettable("PowerNet-MIB::upsHighPrecBatteryPackTable")
-		batterypacktable = batterypacktable_varbinds.get_json_name()
-		batterypack_serial_prefix = 'PowerNet-MIB::upsHighPrecBatteryPackSerialNumber.'
-		batterypackids = list(x[len(batterypack_serial_prefix):] for x in batterypacktable.keys() if x.startswith(batterypack_serial_prefix))
-		for batterypackid in batterypackids:
-			batterypack = {}
-			batterypack['index'] = int(batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackIndex.%s" % batterypackid])
-			batterypack['serial'] = batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackSerialNumber.%s" % batterypackid].strip()
-
-			if batterypack['serial']:
-				batterypack['status'] = batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackStatus.%s" % batterypackid]
-				batterypack['temperature'] = float(batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackTemperature.%s" % batterypackid]) / 10.0
-
-				batterypack['cartridge_index'] = int(batterypacktable["PowerNet-MIB::upsHighPrecBatteryCartridgeIndex.%s" % batterypackid])
-				batterypack['cartridge_status'] = batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackCartridgeStatus.%s" % batterypackid]
-				batterypack['cartridge_health'] = batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackCartridgeHealth.%s" % batterypackid]
-				batterypack['cartridge_installdate'] = batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackCartridgeInstallDate.%s" % batterypackid]
-				batterypack['cartridge_replacedate'] = batterypacktable["PowerNet-MIB::upsHighPrecBatteryPackCartridgeReplaceDate.%s" % batterypackid]
-
-				batterypacks.append(batterypack)
-				_log.debug("Battery pack: %r", batterypack)
-
-		yield nagiosplugin.Metric('battery_packs', batterypacks)
-
-		# input
-		input_voltage = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecInputLineVoltage.0").get_value()) / 10.0
-		_log.debug("Device %s input voltage is %.1fV", self.args.host, input_voltage)
-		yield nagiosplugin.Metric('input_voltage', input_voltage)
-
-		input_min_voltage = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecInputMinLineVoltage.0").get_value()) / 10.0
-		_log.debug("Device %s minimum input voltage is %.1fV", self.args.host, input_min_voltage)
-		yield nagiosplugin.Metric('input_min_voltage', input_min_voltage)
-
-		input_max_voltage = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecInputMaxLineVoltage.0").get_value()) / 10.0
-		_log.debug("Device %s maximum input voltage is %.1fV", self.args.host, input_max_voltage)
-		yield nagiosplugin.Metric('input_max_voltage', input_max_voltage)
-
-		input_frequency = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecInputFrequency.0").get_value()) / 10.0
-		_log.debug("Device %s input frequency is %.1fHz", self.args.host, input_frequency)
-		yield nagiosplugin.Metric('input_frequency', input_frequency)
-
-		input_fail_cause = self.snmpclient.get("PowerNet-MIB::upsAdvInputLineFailCause.0").get_named_value()
-		_log.debug("Device %s input last fail cause is %s", self.args.host, input_fail_cause)
-		yield nagiosplugin.Metric('input_fail_cause', input_fail_cause)
-
-		# output
-		output_status = self.snmpclient.get("PowerNet-MIB::upsBasicOutputStatus.0").get_named_value()
-		_log.debug("Device %s output status is %s", self.args.host, output_status)
-		yield nagiosplugin.Metric('output_status', output_status)
-
-		output_voltage = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecOutputVoltage.0").get_value()) / 10.0
-		_log.debug("Device %s output voltage is %.1fV", self.args.host, output_voltage)
-		yield nagiosplugin.Metric('output_voltage', output_voltage)
-
-		output_current = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecOutputCurrent.0").get_value()) / 10.0
-		_log.debug("Device %s output current is %.1fA", self.args.host, output_current)
-		yield nagiosplugin.Metric('output_current', output_current)
-
-		output_load = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecOutputLoad.0").get_value()) / 10.0
-		_log.debug("Device %s output load is %.1f%%", self.args.host, output_load)
-		yield nagiosplugin.Metric('output_load', output_load)
-
-		output_frequency = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecOutputFrequency.0").get_value()) / 10.0
-		_log.debug("Device %s output frequency is %.1fHz", self.args.host, output_frequency)
-		yield nagiosplugin.Metric('output_frequency', output_frequency)
-
-		output_efficiency = float(self.snmpclient.get("PowerNet-MIB::upsHighPrecOutputEfficiency.0").get_value()) / 10.0
-		_log.debug("Device %s output efficiency is %.1f%%", self.args.host, output_efficiency)
-		yield nagiosplugin.Metric('output_efficiency', output_efficiency)
-
-
-@nagiosplugin.guarded
-def main():
-	argp = argparse.ArgumentParser()
-	argp.add_argument('-v', '--verbose', action='count', default=0)
-	argp.add_argument('-c', '--config', help='config file', default='/etc/check_ups_apc.conf')
-	argp.add_argument('-C', '--community', help='SNMP Community', default='public')
-	argp.add_argument('-H', '--host', help='Hostname or network address to check', required=True)
-	argp.add_argument('-t', '--timeout', help='Check timeout', type=int, default=30)
-	argp.add_argument('-s', '--snmp-timeout', help='SNMP timeout', dest='snmp_timeout', type=int, default=2)
-	argp.add_argument('-r', '--retries', help='SNMP retries', type=int, default=3)
-	argp.add_argument('-u', '--uptime', help='Uptime limit in minutes to create warning', type=int, default=120)
-	argp.add_argument('-b', '--battery-ignore-replacement', help='Ignore battery replacement warnings', action='store_true')
-	args = argp.parse_args()
+			try:
+				if breaker is not None and breaker.is_open():
+					_log.info("Device %s failed the last %d polls, not polling it before %s", self.args.host, breaker.failures, time.ctime(breaker.retry_at))
+					return [('reachable', breaker.error)]
+				# the first request after the backoff is a single packet, to find out whether the device answers again
+				for metric in self._poll_metrics(probe=breaker is not None and breaker.failures > 0):
+					values.append((metric.name, metric.value))
+			except ups_apc_snmp.snmpclient.DeadlineExceeded as e:
+				_log.warning("Device %s was not polled completely: %s", self.args.host, e)
+				values.append(('partial', str(e)))
+			reachable = dict(values).get('reachable')
+			if breaker is not None and reachable is not None:
+				if reachable['status']:
+					if breaker.failures:
+						_log.info("Device %s is reachable again after %d failed polls", self.args.host, breaker.failures)
+					breaker.record_success()
+				else:
+					breaker.record_failure(reachable, self.args.breaker_backoff, self.args.breaker_max_backoff)
+					_log.info("Device %s is not reachable, not polling it before %s", self.args.host, time.ctime(breaker.retry_at))
+			return values
+		finally:
+			_log.debug("Device %s PDU budget is %r and response time is %r", self.args.host, self.pdu_budget, self.rtt_estimator)
+			if host_state:
+				self.state['pdu_budget'] = self.pdu_budget.to_dict()
+				if self.rtt_estimator is not None:
+					self.state['rtt'] = self.rtt_estimator.to_dict()
+				address = ups_apc_snmp.snmpclient.address_entry(self.args.host)
+				if address is not None:
+					self.state['address'] = address
+				if breaker is not None:
+					self.state['breaker'] = breaker.to_dict()
+				host_state.save(self.state)
+
+	@staticmethod
+	def _unreachable(client):
+		"""Value of the reachable metric of a device the client got no answer from"""
+		return dict(status=False, error_indication=str(client.error_indication), error_status=str(client.error_status), error_varbinds=str(client.error_varbinds))
+
+	def _capability_profile(self):
+		"""The saved capability profile of the device, None if there is none or it is due to be probed again
+
+		Its key is only checked against the sysDescr returned by the first request, which the profile already shapes."""
+		if self.args.capability_ttl <= 0:
+			return None
+		profile = ups_apc_snmp.capabilities.CapabilityProfile.from_dict(self.state.get('capabilities'))
+		if profile is None or not profile.is_fresh(profile.key, self.args.capability_ttl):
+			return None
+		return profile
+
+	@staticmethod
+	def _scalar_oids(profile):
+		"""Objects of the first request to an agent with the capability profile
+
+		The state objects are left out only if the probed profile tells the agent has state flags."""
+		oids = scalar_oids(SCALAR_METRICS, profile)
+		if profile.supports(ups_apc_snmp.stateflags.STATE_FLAGS_OID):
+			oids.append(ups_apc_snmp.stateflags.STATE_FLAGS_OID)
+		if profile.key is None or not profile.supports(ups_apc_snmp.stateflags.STATE_FLAGS_OID):
+			oids.extend(metric.oid for metric in STATE_METRICS)
+		return oids + [FIRMWARE_OID]
+
+	def _capability_registry(self):
+		"""The registry of capability profiles shared by devices of the same model, None without a state directory"""
+		if self.args.capability_ttl <= 0 or not self.args.state_dir:
+			return None
+		return ups_apc_snmp.capabilities.CapabilityRegistry(ups_apc_snmp.capabilities.registry_dir(self.args.state_dir))
+
+	def _scalar_metrics(self, scalars, metrics):
+		"""Convert the values of scalar metrics fetched from the device"""
+		for metric in metrics:
+			oid, convert = metric.oid, metric.convert
+			if not scalars.has_value(oid) and metric.fallback_oid is not None and scalars.has_value(metric.fallback_oid):
+				_log.debug("Device %s has no %s, using %s", self.args.host, oid, metric.fallback_oid)
+				oid, convert = metric.fallback_oid, metric.fallback_convert
+			if not scalars.has_value(oid):
+				if metric.optional:
+					yield nagiosplugin.Metric(metric.name, 'U')
+					continue
+				raise nagiosplugin.CheckError("Device %s did not return a value for %s" % (self.args.host, metric.oid))
+
+			if metric.named:
+				value = scalars.get_named_value(oid)
+			else:
+				value = scalars.get_value(oid)
+			if convert is not None:
+				value = convert(value)
+			_log.debug(metric.log_fmt, self.args.host, value)
+			yield nagiosplugin.Metric(metric.name, value)
+
+	def _poll_metrics(self, probe=False):  # pylint: disable=too-many-locals
+		"""Metrics of the device, with probe the first request is sent once with the full timeout and no retransmission"""
+		_log.debug("Probing APC UPS device %s through SNMP", self.args.host)
+		# the handshake of the client is sent along with the scalars of the device
+		with ups_apc_snmp.snmpclient.SnmpClient(self.args.host, ups_apc_snmp.snmpclient.snmp_auth_data_v2c(community=self.args.community), timeout=self.args.snmp_timeout, retries=0 if probe else self.args.retries, snmp_engine=self.snmp_engine, pdu_budget=self.pdu_budget, lazy=True, rtt_estimator=None if probe else self.rtt_estimator, deadline=self.deadline) as self.snmpclient:
+			saved = self._capability_profile()
+			oids = self._scalar_oids(saved if saved is not None else ups_apc_snmp.capabilities.CapabilityProfile(None))
+			try:
+				scalars = self.snmpclient.getmany(oids)
+			except ups_apc_snmp.snmpclient.SnmpError:
+				if self.snmpclient.alive:
+					raise
+				_log.warn("Device %s at %s is not reachable through SNMP with error %s", self.args.host, self.snmpclient.address, self.snmpclient.error_status)
+				yield nagiosplugin.Metric('reachable', self._unreachable(self.snmpclient))
+				return
+			if probe:
+				self.snmpclient.retries = self.args.retries
+				self.snmpclient.rtt_estimator = self.rtt_estimator
+
+			_log.debug("Queried APC UPS device %s at %s through SNMP - device is reachable", self.args.host, self.snmpclient.address)
+			yield nagiosplugin.Metric('reachable', dict(status=True))
+			_log.debug("Found Sysname %s and sysdescr %s", self.snmpclient.sysname, self.snmpclient.sysdescr)
+
+			if not str(self.snmpclient.sysdescr).startswith("APC"):
+				raise nagiosplugin.CheckError("Device is not a APC UPS device - System description is %s", self.snmpclient.sysdescr)
+
+			profile = saved
+			if profile is not None and profile.key != str(self.snmpclient.sysdescr):
+				_log.info("Device %s reports a different sysDescr than when its capabilities were probed, probing them again", self.args.host)
+				profile = None
+				skipped = [oid for oid in self._scalar_oids(ups_apc_snmp.capabilities.CapabilityProfile(None)) if oid not in oids]
+				if skipped:
+					scalars = ups_apc_snmp.snmpclient.SnmpVarBinds(list(scalars.get_varbinds()) + list(self.snmpclient.getmany(skipped).get_varbinds()))
+					oids = oids + skipped
+			probing = profile is None
+			if probing:
+				profile = ups_apc_snmp.capabilities.CapabilityProfile(str(self.snmpclient.sysdescr))
+			else:
+				_log.debug("Device %s has capability profile %r", self.args.host, profile)
+
+			use_flags = profile.supports(ups_apc_snmp.stateflags.STATE_FLAGS_OID)
+			model = None
+			for metric in self._scalar_metrics(scalars, SCALAR_METRICS):
+				if metric.name == 'unit_type':
+					model = metric.value
+				yield metric
+			firmware = str(scalars.get_value(FIRMWARE_OID)) if scalars.has_value(FIRMWARE_OID) else ''
+
+			registry = self._capability_registry()
+			adopted = False
+			if probing and registry is not None and model is not None:
+				shared = registry.get(model, firmware)
+				if shared is not None and shared.is_fresh(shared.key, self.args.capability_ttl):
+					_log.debug("Device %s adopts the capability profile of model %s firmware %s", self.args.host, model, firmware)
+					profile = shared.for_key(str(self.snmpclient.sysdescr))
+					probing = False
+					adopted = True
+			if probing:
+				for metric in SCALAR_METRICS:
+					if metric.fallback_oid is not None:
+						# only the object used is requested from now on, the precise one if the agent has it
+						profile.add_missing(metric.fallback_oid if scalars.has_value(metric.oid) else metric.oid)
+					elif metric.optional and not scalars.has_value(metric.oid):
+						profile.add_missing(metric.oid)
+
+			states = None
+			if use_flags:
+				flags = None
+				if scalars.has_value(ups_apc_snmp.stateflags.STATE_FLAGS_OID):
+					flags = ups_apc_snmp.stateflags.decode_state_flags(scalars.get_value(ups_apc_snmp.stateflags.STATE_FLAGS_OID))
+				_log.debug("Device %s state flags are %r", self.args.host, flags)
+				if flags is not None:
+					states = ups_apc_snmp.stateflags.derive_states(flags)
+				elif probing:
+					profile.add_missing(ups_apc_snmp.stateflags.STATE_FLAGS_OID)
+			if states is not None:
+				for metric in STATE_METRICS:
+					_log.debug(metric.log_fmt, self.args.host, states[metric.name])
+					yield nagiosplugin.Metric(metric.name, states[metric.name])
+			else:
+				unrequested = [metric.oid for metric in STATE_METRICS if metric.oid not in oids]
+				if unrequested:
+					_log.debug("Device %s has no conclusive state flags, fetching its state OIDs", self.args.host)
+					scalars = ups_apc_snmp.snmpclient.SnmpVarBinds(list(scalars.get_varbinds()) + list(self.snmpclient.getmany(unrequested).get_varbinds()))
+				for metric in self._scalar_metrics(scalars, STATE_METRICS):
+					yield metric
+
+			batterypacks = []
+			batterypacktable = ()
+			if profile.has_table('battery_packs'):
+				batterypacktable = self.snmpclient.getcolumns(*BATTERY_PACK_COLUMNS)
+				_log.debug("Device %s battery pack table was walked using %d SNMP requests", self.args.host, self.snmpclient.last_walk_pdus)
+				if probing:
+					profile.set_table('battery_packs', len(batterypacktable))
+				batterypacktable = batterypacktable.rows()
+			for _, row in batterypacktable:
+				batterypack = {}
+				batterypack['index'] = int(row["PowerNet-MIB::upsHighPrecBatteryPackIndex"])
+				batterypack['serial'] = row["PowerNet-MIB::upsHighPrecBatteryPackSerialNumber"].strip()
+
+				if batterypack['serial']:
+					batterypack['status'] = row["PowerNet-MIB::upsHighPrecBatteryPackStatus"]
+					batterypack['temperature'] = float(row["PowerNet-MIB::upsHighPrecBatteryPackTemperature"]) / 10.0
+
+					batterypack['cartridge_index'] = int(row["PowerNet-MIB::upsHighPrecBatteryCartridgeIndex"])
+					batterypack['cartridge_status'] = row["PowerNet-MIB::upsHighPrecBatteryPackCartridgeStatus"]
+					batterypack['cartridge_health'] = row["PowerNet-MIB::upsHighPrecBatteryPackCartridgeHealth"]
+					batterypack['cartridge_installdate'] = row["PowerNet-MIB::upsHighPrecBatteryPackCartridgeInstallDate"]
+					batterypack['cartridge_replacedate'] = row["PowerNet-MIB::upsHighPrecBatteryPackCartridgeReplaceDate"]
+
+					batterypacks.append(batterypack)
+					_log.debug("Battery pack: %r", batterypack)
+
+			yield nagiosplugin.Metric('battery_packs', batterypacks)
+
+			if probing:
+				profile.model = model
+				profile.firmware = firmware
+				_log.debug("Device %s probed capability profile %r", self.args.host, profile)
+				if self.args.capability_ttl > 0:
+					self.state['capabilities'] = profile.to_dict()
+				if registry is not None and model is not None:
+					registry.put(profile.for_key(ups_apc_snmp.capabilities.model_key(model, firmware)))
+			elif profile.model != model or profile.firmware != firmware:
+				_log.info("Device %s changed from model %s firmware %s to model %s firmware %s, probing its capabilities on the next poll", self.args.host, profile.model, profile.firmware, model, firmware)
+				self.state.pop('capabilities', None)
+			elif adopted:
+				self.state['capabilities'] = profile.to_dict()
+
+			_log.debug("Device %s was polled using %d SNMP requests", self.args.host, self.snmpclient.requests)
+			yield nagiosplugin.Metric('snmp_requests', self.snmpclient.requests)
+
+
+DEVICE_DEFAULTS = dict(
+	input_voltage_min_warn=215, input_voltage_max_warn=240, input_voltage_min_crit=210, input_voltage_max_crit=245,
+	input_frequency_min_warn=48, input_frequency_max_warn=52, input_frequency_min_crit=47, input_frequency_max_crit=53,
+
+	output_voltage_min_warn=215, output_voltage_max_warn=240, output_voltage_min_crit=210, output_voltage_max_crit=245,
+	output_frequency_min_warn=48, output_frequency_max_warn=52, output_frequency_min_crit=47, output_frequency_max_crit=53,
+
+	battery_capacity_min_warn=70, battery_capacity_min_crit=50,
+	battery_temperature_min_warn=15, battery_temperature_max_warn=30, battery_temperature_min_crit=10, battery_temperature_max_crit=40,
+
+	output_load_max_warn=70, output_load_max_crit=85,
+)
+
+
+def read_config(path, hosts):
+	"""Read the config file and fill in device defaults for all given hosts"""
+	config_parser = configparser.ConfigParser()
+	config_parser.read(path)
+
+	for host in hosts:
+		add_device_defaults(config_parser, host)
+
+	return config_parser
+
+
+def add_device_defaults(config_parser, host):
+	"""Add the section of a host to the config, filling in defaults for missing values"""
+	if host not in config_parser.sections():
+		config_parser.add_section(host)
+
+	for key, value in DEVICE_DEFAULTS.items():
+		if not config_parser.has_option(host, key):
+			config_parser.set(host, key, str(value))
+
+
+def read_hosts_file(path):
+	"""Read a list of hosts, one per line, ignoring empty lines and comments"""
+	hosts = []
+	with open(path) as hosts_file:
+		for line in hosts_file:
+			line = line.split('#', 1)[0].strip()
+			if line:
+				hosts.append(line)
+	return hosts
+
+
+def build_contexts(args, config_parser):
+	"""Set up all contexts for the host in args"""
+	host = args.host
+	contexts = []
+	contexts.append(SNMPContext('reachable'))
+
+	threshold_values = dict((key, config_parser.getint(host, key)) for key in DEVICE_DEFAULTS)
+	threshold_values['uptime'] = args.uptime
+	contexts.extend(metric_contexts(SCALAR_METRICS + STATE_METRICS, threshold_values))
+
+	contexts.append(BatteryPackContext('battery_packs', args.battery_ignore_replacement))
+	contexts.append(PerformanceContext('snmp_requests'))
+	contexts.append(PartialContext('partial'))
 
-	device_defaults = dict(
-		input_voltage_min_warn=215, input_voltage_max_warn=240, input_voltage_min_crit=210, input_voltage_max_crit=245,
-		input_frequency_min_warn=48, input_frequency_max_warn=52, input_frequency_min_crit=47, input_frequency_max_crit=53,
+	contexts.append(UPSAPCSummary())
+	return contexts
 
-		output_voltage_min_warn=215, output_voltage_max_warn=240, output_voltage_min_crit=210, output_voltage_max_crit=245,
-		output_frequency_min_warn=48, output_frequency_max_warn=52, output_frequency_min_crit=47, output_frequency_max_crit=53,
 
-		battery_capacity_min_warn=70, battery_capacity_min_crit=50,
-		battery_temperature_min_warn=15, battery_temperature_max_warn=30, battery_temperature_min_crit=10, battery_temperature_max_crit=40,
+def build_check(args, config_parser, contexts=None, snmp_engine=None, deadline=None):  # pylint: disable=too-many-arguments
+	"""Set up the check for the host in args, reusing already built contexts if given
 
-		output_load_max_warn=70, output_load_max_crit=85,
-	)
-	config_defaults = {'general': {}, args.host: device_defaults}
+	Its SNMP requests end by the deadline if one is given, else before the check --timeout."""
+	check = nagiosplugin.Check(UPSAPC(args, snmp_engine=snmp_engine, deadline=deadline))
+	if contexts is None:
+		contexts = build_contexts(args, config_parser)
+	for context in contexts:
+		check.add(context)
+	return check
 
-	config_parser = configparser.ConfigParser(config_defaults)
-	config_parser.read(args.config)
 
-	if args.host not in config_parser.sections():
-		config_parser.add_section(args.host)
+def run_check(check):
+	"""Run a check without exiting, returning exit code and plugin output"""
+	try:
+		check()
+	except Exception as e:  # pylint: disable=broad-except
+		return nagiosplugin.state.Unknown.code, "UPSAPC UNKNOWN - %s" % e
 
-	for key, value in device_defaults.items():
-		if not config_parser.has_option(args.host, key):
-			config_parser.set(args.host, key, str(value))
+	output = "%s %s - %s" % (check.name.upper(), str(check.state).upper(), check.summary_str)
+	perfdata = [str(perf) for perf in check.perfdata if perf]
+	if perfdata:
+		output += " | " + " ".join(perfdata)
+	return check.exitcode, output
 
-	check = nagiosplugin.Check(UPSAPC(args))
-	check.add(SNMPContext('reachable'))
-	check.add(nagiosplugin.Context('unit_type'))
-	check.add(BoolContext('battery_replace_indicator', ok_text="Battery OK", crit_text="Battery needs replacement"))
-	check.add(PerformanceContext('diagnostics_date'))
-	check.add(ElementContext('diagnostics_result', ok_values=['ok', 'testInProgress'], crit_values=['failed', 'invalidTest']))
-	check.add(PerformanceContext('uio_temp1'))
-	check.add(PerformanceContext('uio_temp2'))
 
-	# input
-	check.add(nagiosplugin.ScalarContext('input_voltage',
-											warning='%i:%i' % (config_parser.getint(args.host, 'input_voltage_min_warn'), config_parser.getint(args.host, 'input_voltage_max_warn')),
-											critical='%i:%i' % (config_parser.getint(args.host, 'input_voltage_min_crit'), config_parser.getint(args.host, 'input_voltage_max_crit'))))
+def check_host(args, config_parser, host, fleet_deadline):
+	"""Run the check for one host of a fleet, returning exit code and plugin output
 
-	check.add(PerformanceContext('input_min_voltage'))
-	check.add(PerformanceContext('input_max_voltage'))
+	The poll ends by the check --timeout or the deadline of the whole fleet, whichever comes first."""
+	host_args = argparse.Namespace(**vars(args))
+	host_args.host = host
+	deadline = ups_apc_snmp.snmpclient.Deadline(max(1, min(args.timeout - DEADLINE_MARGIN, fleet_deadline.remaining())))
+	return run_check(build_check(host_args, config_parser, deadline=deadline))
 
-	check.add(nagiosplugin.ScalarContext('input_frequency',
-											warning='%i:%i' % (config_parser.getint(args.host, 'input_frequency_min_warn'), config_parser.getint(args.host, 'input_frequency_max_warn')),
-											critical='%i:%i' % (config_parser.getint(args.host, 'input_frequency_min_crit'), config_parser.getint(args.host, 'input_frequency_max_crit'))))
 
-	check.add(nagiosplugin.Context('input_fail_cause'))
+def check_fleet(args, hosts):
+	"""Check all hosts concurrently and print passive service check results, returning the worst exit code"""
+	config_parser = read_config(args.config, hosts)
 
-	# output
-	check.add(nagiosplugin.ScalarContext('output_voltage',
-											warning='%i:%i' % (config_parser.getint(args.host, 'output_voltage_min_warn'), config_parser.getint(args.host, 'output_voltage_max_warn')),
-											critical='%i:%i' % (config_parser.getint(args.host, 'output_voltage_min_crit'), config_parser.getint(args.host, 'output_voltage_max_crit'))))
-
-	check.add(nagiosplugin.ScalarContext('output_load',
-											warning='0:%i' % (config_parser.getint(args.host, 'output_load_max_warn')),
-											critical='0:%i' % (config_parser.getint(args.host, 'output_load_max_crit'))))
-
-	check.add(nagiosplugin.ScalarContext('output_frequency',
-											warning='%i:%i' % (config_parser.getint(args.host, 'output_frequency_min_warn'), config_parser.getint(args.host, 'output_frequency_max_warn')),
-											critical='%i:%i' % (config_parser.getint(args.host, 'output_frequency_min_crit'), config_parser.getint(args.host, 'output_frequency_max_crit'))))
-
-	output_status_ok_values = [
-		'onLine',
-		'hotStandby',
-	]
-	output_status_warn_values = [
-		'onBattery',
-		'onSmartBoost',  # under-voltage boost
-		'softwareBypass',
-		'switchedBypass',
-		'rebooting',
-		'onSmartTrim',  # over-voltage trim
-		'ecoMode',  # bypass
-		'staticBypassStandby',
-	]
-	output_status_crit_values = [
-		'timedSleeping',  # output off (planned)
-		'sleepingUntilPowerReturn',
-		'hardwareFailureBypass',
-		'emergencyStaticBypass',
-		'off',
-		'powerSavingMode',  # auto-off
-	]
-	check.add(ElementContext('output_status', ok_values=output_status_ok_values, warn_values=output_status_warn_values, crit_values=output_status_crit_values))
-
-	check.add(PerformanceContext('output_current'))
-	check.add(PerformanceContext('output_efficiency'))
+	# resolve the MIB symbols once before the worker threads share the MIB builder
+	add_mib_paths(args.full_mib, args.cache_dir)
+	ups_apc_snmp.snmpclient.nodeids(metric_oids(SCALAR_METRICS + STATE_METRICS))
 
-	# battery
-	check.add(ElementContext('battery_status', ok_values=['batteryNormal'], warn_values=['batteryLow'], crit_values=['batteryInFaultCondition']))
+	# polls still running at the fleet deadline stop and report what they got, so the workers are done by the fleet timeout
+	fleet_deadline = ups_apc_snmp.snmpclient.Deadline(max(1, args.fleet_timeout - DEADLINE_MARGIN))
+	executor = concurrent.futures.ThreadPoolExecutor(max_workers=args.workers)
+	futures = dict((executor.submit(check_host, args, config_parser, host, fleet_deadline), host) for host in hosts)
+	done, not_done = concurrent.futures.wait(futures, timeout=args.fleet_timeout)
 
-	check.add(nagiosplugin.ScalarContext('battery_capacity',
-											warning='%i:100' % (config_parser.getint(args.host, 'battery_capacity_min_warn')),
-											critical='%i:100' % (config_parser.getint(args.host, 'battery_capacity_min_crit'))))
+	results = []
+	for future in done:
+		exitcode, output = future.result()
+		results.append((futures[future], exitcode, output))
+	for future in not_done:
+		future.cancel()
+		results.append((futures[future], nagiosplugin.state.Unknown.code, "UPSAPC UNKNOWN - Timeout: check execution aborted after %s seconds" % args.fleet_timeout))
+	executor.shutdown(wait=False)
 
-	check.add(PerformanceContext('battery_run_time_remaining'))
+	now = int(time.time())
+	for host, exitcode, output in sorted(results):
+		print("[%d] PROCESS_SERVICE_CHECK_RESULT;%s;%s;%d;%s" % (now, host, args.service, exitcode, output.replace("\n", "\\n")))
 
-	check.add(nagiosplugin.ScalarContext('battery_temperature',
-											warning='%i:%i' % (config_parser.getint(args.host, 'battery_temperature_min_warn'), config_parser.getint(args.host, 'battery_temperature_max_warn')),
-											critical='%i:%i' % (config_parser.getint(args.host, 'battery_temperature_min_crit'), config_parser.getint(args.host, 'battery_temperature_max_crit'))))
+	return max([exitcode for _, exitcode, _ in results] + [0])
 
-	check.add(PerformanceContext('battery_voltage'))
 
-	check.add(BatteryPackContext('battery_packs', args.battery_ignore_replacement))
+def build_argument_parser():
+	argp = argparse.ArgumentParser()
+	argp.add_argument('-v', '--verbose', action='count', default=0)
+	argp.add_argument('-c', '--config', help='config file', default='/etc/check_ups_apc.conf')
+	argp.add_argument('-C', '--community', help='SNMP Community', default='public')
+	argp.add_argument('-H', '--host', help='Hostname or network address to check')
+	argp.add_argument('-t', '--timeout', help='Check timeout', type=int, default=30)
+	argp.add_argument('-s', '--snmp-timeout', help='Upper bound of the SNMP timeout, the timeout used is learned from the response times of the device', dest='snmp_timeout', type=int, default=2)
+	argp.add_argument('-r', '--retries', help='SNMP retries', type=int, default=3)
+	argp.add_argument('-u', '--uptime', help='Uptime limit in minutes to create warning', type=int, default=120)
+	argp.add_argument('-b', '--battery-ignore-replacement', help='Ignore battery replacement warnings', action='store_true')
+	argp.add_argument('--hosts', help='Comma separated list of hosts to check in fleet mode')
+	argp.add_argument('--hosts-file', help='File with one host per line to check in fleet mode', dest='hosts_file')
+	argp.add_argument('--config-hosts', help='Check all hosts with a section in the config file in fleet mode', action='store_true', dest='config_hosts')
+	argp.add_argument('--workers', help='Number of hosts checked concurrently in fleet mode', type=int, default=20)
+	argp.add_argument('--fleet-timeout', help='Timeout of the whole run in fleet mode, hosts not polled completely by then are reported with what was polled', dest='fleet_timeout', type=int, default=300)
+	argp.add_argument('--service', help='Service description used for passive check results in fleet mode', default='check_ups_apc')
+	argp.add_argument('--cache-ttl', help='Share poll results between checks of the same host for this many seconds (0 disables the cache)', dest='cache_ttl', type=int, default=0)
+	argp.add_argument('--cache-dir', help='Directory of the shared poll result cache and of parsed MIBs', dest='cache_dir', default=DEFAULT_CACHE_DIR)
+	argp.add_argument('--capability-ttl', help='Seconds after which the objects a device supports are probed again, only used with --state-dir (0 probes on every poll)', dest='capability_ttl', type=int, default=86400)
+	argp.add_argument('--fixed-timeout', help='Always wait the full --snmp-timeout before retransmitting a request', dest='fixed_timeout', action='store_true')
+	argp.add_argument('--full-mib', help='Load the complete PowerNet-MIB instead of the one trimmed to UPS objects when symbols are not in the precompiled index', dest='full_mib', action='store_true')
+	argp.add_argument('--breaker-backoff', help='Seconds an unreachable device is not polled after a failed poll, doubling with each further failure, only used with --state-dir (0 polls every time)', dest='breaker_backoff', type=int, default=60)
+	argp.add_argument('--breaker-max-backoff', help='Upper bound of the seconds an unreachable device is not polled', dest='breaker_max_backoff', type=int, default=1800)
+	argp.add_argument('--state-dir', help='Directory to keep state learned about devices between checks in, like their PDU limits', dest='state_dir')
+	return argp
 
-	check.add(nagiosplugin.ScalarContext('sysuptime', warning='@%i:%i' % (0, args.uptime)))
 
-	check.add(UPSAPCSummary())
+@nagiosplugin.guarded
+def main():
+	argp = build_argument_parser()
+	args = argp.parse_args()
 
+	if args.hosts or args.hosts_file or args.config_hosts:
+		hosts = [args.host] if args.host else []
+		if args.hosts:
+			hosts.extend(host.strip() for host in args.hosts.split(',') if host.strip())
+		if args.hosts_file:
+			hosts.extend(read_hosts_file(args.hosts_file))
+		if args.config_hosts:
+			config_parser = configparser.ConfigParser()
+			config_parser.read(args.config)
+			hosts.extend(section for section in config_parser.sections() if section != 'general')
+		hosts = sorted(set(hosts))
+		sys.exit(check_fleet(args, hosts))
+
+	if not args.host:
+		argp.error('one of the arguments -H/--host, --hosts, --hosts-file or --config-hosts is required')
+
+	check = build_check(args, read_config(args.config, [args.host]))
 	check.main(args.verbose, timeout=args.timeout)
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import time
+
+from ups_apc_snmp.hoststate import makedirs, write_json_atomic
+
+_log = logging.getLogger('nagiosplugin')
+
+
+class PollCache(object):
+	"""Poll results shared between check processes through files in a cache directory
+
+	Entries are keyed by host and community, written atomically and protected
+	by a lock file, so concurrent checks missing the cache wait for a single
+	poll instead of each polling the device themselves."""
+
+	def __init__(self, directory, ttl):
+		self.directory = directory
+		self.ttl = ttl
+
+	def __path(self, host, community):
+		key = hashlib.sha256(('%s\0%s' % (host, community)).encode('utf-8')).hexdigest()  # pylint: disable=E1101
+		return os.path.join(self.directory, key)
+
+	def read(self, path):
+		"""Return the values of a fresh cache entry, None if missing or expired"""
+		try:
+			with open(path + '.json') as cache_file:
+				entry = json.load(cache_file)
+		except (IOError, OSError, ValueError):
+			return None
+		if not 0 <= time.time() - entry['time'] <= self.ttl:
+			return None
+		return entry['values']
+
+	def write(self, path, values):
+		"""Atomically replace a cache entry"""
+		write_json_atomic(path + '.json', dict(time=time.time(), values=values))
+
+	def get_or_poll(self, host, community, poll, cacheable=None):
+		"""Return the cached values of a host or call poll, letting only one process poll a host at a time
+
+		Polled values are not cached if cacheable is given and returns False for them."""
+		path = self.__path(host, community)
+		values = self.read(path)
+		if values is not None:
+			return values
+
+		makedirs(self.directory)
+
+		with open(path + '.lock', 'a') as lock_file:
+			fcntl.flock(lock_file, fcntl.LOCK_EX)
+			try:
+				# another process may have polled the host while we were waiting for the lock
+				values = self.read(path)
+				if values is None:
+					_log.debug("No fresh poll result of host %s in cache %s", host, self.directory)
+					values = poll()
+					if cacheable is None or cacheable(values):
+						self.write(path, values)
+			finally:
+				fcntl.flock(lock_file, fcntl.LOCK_UN)
+		return values
@@ -0,0 +1,1782 @@
+# PySNMP SMI module. Autogenerated from smidump -f python PowerNet-MIB
+# by libsmi2pysnmp-0.1.3 at Mon May  9 16:08:28 2016,
+# Python version sys.version_info(major=2, minor=7, micro=11, releaselevel='final', serial=0)
+# Trimmed by ups_apc_snmp.mibtrim to the symbols starting with ups, uio, iem, mem - do not edit
+
+# Imports
+
+( Integer, ObjectIdentifier, OctetString, ) = mibBuilder.importSymbols("ASN1", "Integer", "ObjectIdentifier", "OctetString")
+( NamedValues, ) = mibBuilder.importSymbols("ASN1-ENUMERATION", "NamedValues")
+( ConstraintsIntersection, ConstraintsUnion, SingleValueConstraint, ValueRangeConstraint, ValueSizeConstraint, ) = mibBuilder.importSymbols("ASN1-REFINEMENT", "ConstraintsIntersection", "ConstraintsUnion", "SingleValueConstraint", "ValueRangeConstraint", "ValueSizeConstraint")
+( Gauge, IpAddress, TimeTicks, enterprises, ) = mibBuilder.importSymbols("RFC1155-SMI", "Gauge", "IpAddress", "TimeTicks", "enterprises")
+( Bits, Integer32, Integer32, MibIdentifier, MibScalar, MibTable, MibTableRow, MibTableColumn, NotificationType, TimeTicks, Unsigned32, ) = mibBuilder.importSymbols("SNMPv2-SMI", "Bits", "Integer32", "Integer32", "MibIdentifier", "MibScalar", "MibTable", "MibTableRow", "MibTableColumn", "NotificationType", "TimeTicks", "Unsigned32")
+( DisplayString, ) = mibBuilder.importSymbols("SNMPv2-TC", "DisplayString")
+
+# Types
+
+
+# Objects
+
+apc = MibIdentifier((1, 3, 6, 1, 4, 1, 318))
+products = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1))
+hardware = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1))
+ups = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1))
+upsIdent = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1))
+upsBasicIdent = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 1))
+upsBasicIdentModel = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 1, 1), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicIdentModel.setDescription("The UPS model name (e.g. 'APC Smart-UPS 600').")
+upsBasicIdentName = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 1, 2), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsBasicIdentName.setDescription("An 8 byte ID string identifying the UPS.  This object\ncan be set by the administrator.")
+upsAdvIdent = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2))
+upsAdvIdentFirmwareRevision = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 1), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvIdentFirmwareRevision.setDescription("The firmware revision of the UPS system's microprocessor.")
+upsAdvIdentDateOfManufacture = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvIdentDateOfManufacture.setDescription("The date when the UPS was manufactured in mm/dd/yy (or yyyy) format.")
+upsAdvIdentSerialNumber = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvIdentSerialNumber.setDescription("An 8-character string identifying the serial number of \nthe UPS internal microprocessor.  This number is set at\nthe factory.  NOTE: This number does NOT correspond to\nthe serial number on the rear of the UPS.")
+upsAdvIdentFirmwareRevision2 = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvIdentFirmwareRevision2.setDescription("The firmware revision of a UPS system co-microprocessor.")
+upsAdvIdentSkuNumber = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 1, 2, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvIdentSkuNumber.setDescription("The SKU number of a UPS system.")
+upsBattery = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2))
+upsBasicBattery = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1))
+upsBasicBatteryStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,4,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("batteryNormal", 2), ("batteryLow", 3), ("batteryInFaultCondition", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicBatteryStatus.setDescription("The status of the UPS batteries. A batteryLow(3) value \nindicates the UPS will be unable to sustain the current \nload, and its services will be lost if power is not restored.\nThe amount of run time in reserve at the time of low battery \ncan be configured by the upsAdvConfigLowBatteryRunTime.\nA batteryInFaultCondition(4)value indicates that a battery \ninstalled has an internal error condition.")
+upsBasicBatteryTimeOnBattery = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1, 2), TimeTicks()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicBatteryTimeOnBattery.setDescription("The elapsed time since the UPS has switched to battery \npower.")
+upsBasicBatteryLastReplaceDate = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 1, 3), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsBasicBatteryLastReplaceDate.setDescription("The date when the UPS system's batteries were last replaced \nin mm/dd/yy (or yyyy) format.  For Smart-UPS models, this value \nis originally set in the factory.  When the UPS batteries \nare replaced, this value should be reset by the administrator.\nFor Symmetra PX 250/500 this OID is read only and is configurable in the local display only.")
+upsAdvBattery = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2))
+upsAdvBatteryCapacity = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 1), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryCapacity.setDescription("The remaining battery capacity expressed in \npercent of full capacity.")
+upsAdvBatteryTemperature = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 2), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryTemperature.setDescription("The current internal UPS temperature expressed in \nCelsius.")
+upsAdvBatteryRunTimeRemaining = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 3), TimeTicks()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryRunTimeRemaining.setDescription("The UPS battery run time remaining before battery \nexhaustion.")
+upsAdvBatteryReplaceIndicator = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("noBatteryNeedsReplacing", 1), ("batteryNeedsReplacing", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryReplaceIndicator.setDescription("Indicates whether the UPS batteries need replacing.")
+upsAdvBatteryNumOfBattPacks = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryNumOfBattPacks.setDescription("The number of external battery packs connected to the UPS. If\nthe UPS does not use smart cells then the agent reports\nERROR_NO_SUCH_NAME.")
+upsAdvBatteryNumOfBadBattPacks = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryNumOfBadBattPacks.setDescription("The number of external battery packs connected to the UPS that \nare defective. If the UPS does not use smart cells then the\nagent reports ERROR_NO_SUCH_NAME.")
+upsAdvBatteryNominalVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryNominalVoltage.setDescription("The nominal battery voltage in Volts.")
+upsAdvBatteryActualVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryActualVoltage.setDescription("The actual battery bus voltage in Volts.")
+upsAdvBatteryCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryCurrent.setDescription("The battery current in Amps.")
+upsAdvTotalDCCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 10), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTotalDCCurrent.setDescription("The total DC current in Amps.")
+upsAdvBatteryFullCapacity = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryFullCapacity.setDescription("The full chargeable capacity of the battery which is\nexpressed in percentage.")
+upsAdvBatteryActualVoltageTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12))
+if mibBuilder.loadTexts: upsAdvBatteryActualVoltageTable.setDescription("A list of battery table entries. The number of battery\nframes present in UPS.")
+upsAdvBatteryActualVoltageEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1)).setIndexNames((0, "PowerNet-MIB", "upsAdvBatteryActualVoltageTableIndex"))
+if mibBuilder.loadTexts: upsAdvBatteryActualVoltageEntry.setDescription("Information applicable to \neach of the Battery frames.")
+upsAdvBatteryActualVoltageTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryActualVoltageTableIndex.setDescription("The Battery Frame identifier. Battery Frame index.")
+upsAdvBatteryActualVoltagePolarity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(0,1,)).subtype(namedValues=NamedValues(("positive", 0), ("negative", 1), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryActualVoltagePolarity.setDescription("The selected Battery Voltage Polarity.\n0 indicates positive polarity.\n1 indicates negative polarity.")
+upsAdvBatteryFrameActualVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 12, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryFrameActualVoltage.setDescription("The actual battery bus voltage in Volts.")
+upsAdvTotalDCCurrentTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13))
+if mibBuilder.loadTexts: upsAdvTotalDCCurrentTable.setDescription("A list of Battery Frame table entries.  The number of entries\nis given by the value of Number of Battery Frames.")
+upsAdvTotalDCCurrentEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1)).setIndexNames((0, "PowerNet-MIB", "upsAdvTotalDCCurrentTableIndex"))
+if mibBuilder.loadTexts: upsAdvTotalDCCurrentEntry.setDescription("An entry containing information applicable to a\nparticular Battery Frame.")
+upsAdvTotalDCCurrentTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTotalDCCurrentTableIndex.setDescription("The Battery Frame identifier. Total DC Current\nTable Index.")
+upsAdvTotalDCCurrentPolarity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(0,1,)).subtype(namedValues=NamedValues(("positive", 0), ("negative", 1), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTotalDCCurrentPolarity.setDescription("The selected Battery Current Polarity.\n0 indicates positive polarity.\n1 indicates negative polarity.")
+upsAdvTotalFrameDCCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 13, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTotalFrameDCCurrent.setDescription(" The Total DC Current of battery in Amperes.")
+upsAdvBatteryCurrentTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14))
+if mibBuilder.loadTexts: upsAdvBatteryCurrentTable.setDescription("A list of Battery Frame table entries.  The number of entries\nis given by number of Battery frames present.")
+upsAdvBatteryCurrentEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1)).setIndexNames((0, "PowerNet-MIB", "upsAdvBatteryCurrentTableIndex"), (0, "PowerNet-MIB", "upsAdvBatteryCurrentIndex"))
+if mibBuilder.loadTexts: upsAdvBatteryCurrentEntry.setDescription("An entry containing information applicable to a\nparticular battery frame.")
+upsAdvBatteryCurrentTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryCurrentTableIndex.setDescription("The Battery Frame identifier. Battery Current\nTable Index.")
+upsAdvBatteryCurrentIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryCurrentIndex.setDescription("The battery frame identifier.")
+upsAdvBatteryCurrentPolarity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(0,1,)).subtype(namedValues=NamedValues(("positive", 0), ("negative", 1), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryCurrentPolarity.setDescription("The selected Battery current polarity.\n0 indicates positive polarity.\n1 indicates negative polarity")
+upsAdvBatteryFrameCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 14, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryFrameCurrent.setDescription("The Battery current measured in Amperes")
+upsAdvBatteryEstimatedChargeTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 15), TimeTicks()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryEstimatedChargeTime.setDescription("The estimated remaining time required to charge the UPS to a full state of charge.")
+upsAdvBatteryPower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 16), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryPower.setDescription("The measured battery power in kW.")
+upsAdvBatteryChargerStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 17), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("ok", 2), ("inFaultCondition", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryChargerStatus.setDescription("The status of the battery charger. If the UPS is unable\nto find the state of charger, this variable is set to unknown(1).")
+upsAdvBatteryInternalSKU = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 19), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryInternalSKU.setDescription("The SKU of the internal battery.")
+upsAdvBatteryExternalSKU = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 20), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryExternalSKU.setDescription("The SKU of the external battery.")
+upsAdvBatteryRecommendedReplaceDate = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 2, 21), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvBatteryRecommendedReplaceDate.setDescription("The recommended replacement date for the battery based on the UPS internal battery life algorithm.")
+upsHighPrecBattery = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3))
+upsHighPrecBatteryCapacity = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 1), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryCapacity.setDescription("The remaining battery capacity expressed in \ntenths of percent of full capacity.")
+upsHighPrecBatteryTemperature = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 2), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryTemperature.setDescription("The current internal UPS temperature expressed in \ntenths of degrees Celsius.")
+upsHighPrecBatteryNominalVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryNominalVoltage.setDescription("The nominal battery voltage in tenths of Volts.")
+upsHighPrecBatteryActualVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryActualVoltage.setDescription("The actual battery bus voltage in tenths of Volts.")
+upsHighPrecBatteryCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryCurrent.setDescription("The battery current in tenths of Amps.")
+upsHighPrecTotalDCCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecTotalDCCurrent.setDescription("The total DC current in tenths of Amps.")
+upsHighPrecBatteryActualVoltageTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7))
+if mibBuilder.loadTexts: upsHighPrecBatteryActualVoltageTable.setDescription("A list of Battery frame table entries.  The number of entries\nis given by the number of Battery frames.")
+upsHighPrecBatteryActualVoltageEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1)).setIndexNames((0, "PowerNet-MIB", "upsHighPrecBatteryActualVoltageTableIndex"))
+if mibBuilder.loadTexts: upsHighPrecBatteryActualVoltageEntry.setDescription("An entry containing information applicable to a\nparticular battery frame.")
+upsHighPrecBatteryActualVoltageTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryActualVoltageTableIndex.setDescription("The Battery Frame identifier. High Precision\nActual Voltage Table Index.")
+upsHighPrecBatteryActualVoltagePolarity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(0,1,)).subtype(namedValues=NamedValues(("positive", 0), ("negative", 1), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryActualVoltagePolarity.setDescription("The selected Battery Voltage polarity.\n0 indicates positive polarity.\n1 indicates negative polarity.")
+upsHighPrecBatteryVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 7, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryVoltage.setDescription("The actual battery bus voltage expressed\nas tenths of Volts. ")
+upsHighPrecTotalDCCurrentTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8))
+if mibBuilder.loadTexts: upsHighPrecTotalDCCurrentTable.setDescription("A list of Battery Frame table entries.  The number of entries\nis given by the number of battery frames.")
+upsHighPrecTotalDCCurrentEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1)).setIndexNames((0, "PowerNet-MIB", "upsHighPrecTotalDCCurrentTableIndex"))
+if mibBuilder.loadTexts: upsHighPrecTotalDCCurrentEntry.setDescription("An entry containing information applicable to a\nparticular battery frame.")
+upsHighPrecTotalDCCurrentTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecTotalDCCurrentTableIndex.setDescription("The Battery Frame identifier.\nHigh precision Total DC Current index.")
+upsHighPrecTotalDCCurrentPolarity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(0,1,)).subtype(namedValues=NamedValues(("positive", 0), ("negative", 1), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecTotalDCCurrentPolarity.setDescription("The selected Battery Current polarity.\n0 indicates positive polarity.\n1 indicates negative polarity.")
+upsHighPrecTotalDCFrameCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 8, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecTotalDCFrameCurrent.setDescription("The total DC current in tenths of Amperes. ")
+upsHighPrecBatteryCurrentTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9))
+if mibBuilder.loadTexts: upsHighPrecBatteryCurrentTable.setDescription("A list of Battery Frame table entries.  The number of entries\nis given by the number of battery frames.")
+upsHighPrecBatteryCurrentEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1)).setIndexNames((0, "PowerNet-MIB", "upsHighPrecBatteryCurrentTableIndex"), (0, "PowerNet-MIB", "upsHighPrecBatteryCurrentIndex"))
+if mibBuilder.loadTexts: upsHighPrecBatteryCurrentEntry.setDescription("An entry containing information applicable to a\nparticular battery frame.")
+upsHighPrecBatteryCurrentTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryCurrentTableIndex.setDescription("The Battery frame identifier.\nBattery Frame index.")
+upsHighPrecBatteryCurrentIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryCurrentIndex.setDescription("The Battery frame identifier.\nBattery Index for each frame.")
+upsHighPrecBatteryCurrentPolarity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(0,1,)).subtype(namedValues=NamedValues(("positive", 0), ("negative", 1), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryCurrentPolarity.setDescription("The selected Battery Current polarity.\n0 indicates positive polarity.\n1 indicates negative polarity.")
+upsHighPrecBatteryFrameCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 9, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryFrameCurrent.setDescription("The Battery current in tenths of Amperes.")
+upsHighPrecBatteryPacks = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10))
+upsHighPrecBatteryPackTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackTableSize.setDescription("The number of entries in the upsHighPrecBatteryPacks.")
+upsHighPrecBatteryPackTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2))
+if mibBuilder.loadTexts: upsHighPrecBatteryPackTable.setDescription("A list of Battery Pack table entries.  The number of entries\nis given by number of Battery Packs present.")
+upsHighPrecBatteryPackEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsHighPrecBatteryPackIndex"), (0, "PowerNet-MIB", "upsHighPrecBatteryCartridgeIndex"))
+if mibBuilder.loadTexts: upsHighPrecBatteryPackEntry.setDescription("An entry containing information applicable to a\nparticular battery pack.")
+upsHighPrecBatteryPackIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackIndex.setDescription("The battery pack identifier.")
+upsHighPrecBatteryCartridgeIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryCartridgeIndex.setDescription("The battery cartridge identifier.")
+upsHighPrecBatteryPackFirmwareRevision = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackFirmwareRevision.setDescription("The battery pack firmware revision.")
+upsHighPrecBatteryPackSerialNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackSerialNumber.setDescription("The battery pack serial number.")
+upsHighPrecBatteryPackTemperature = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackTemperature.setDescription("The battery pack temperature measured in 10ths of degree Celcius")
+upsHighPrecBatteryPackStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 6), OctetString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackStatus.setDescription("The battery status for the pack only.\nbit 0 Disconnected\nbit 1 Overvoltage\nbit 2 NeedsReplacement\nbit 3 OvertemperatureCritical\nbit 4 Charger\nbit 5 TemperatureSensor\nbit 6 BusSoftStart\nbit 7 OvertemperatureWarning\nbit 8 GeneralError\nbit 9 Communication\nbit 10 DisconnectedFrame\nbit 11 FirmwareMismatch")
+upsHighPrecBatteryPackCartridgeHealth = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 7), OctetString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackCartridgeHealth.setDescription("The battery cartridge health.\nbit 0 Battery lifetime okay\nbit 1 Battery lifetime near end, order replacement cartridge\nbit 2 Battery lifetime exceeded, replace battery\nbit 3 Battery lifetime near end acknowledged, order replacement cartridge\nbit 4 Battery lifetime exceeded acknowledged, replace battery\nbit 5 Battery measured lifetime near end, order replacement cartridge\nbit 6 Battery measured lifetime near end acknowledged, order replacement cartridge")
+upsHighPrecBatteryPackCartridgeReplaceDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 8), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackCartridgeReplaceDate.setDescription("The battery cartridge estimated battery replace date.")
+upsHighPrecBatteryPackCartridgeInstallDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 9), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackCartridgeInstallDate.setDescription("The battery cartridge install date.")
+upsHighPrecBatteryPackCartridgeStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 2, 3, 10, 2, 1, 10), OctetString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecBatteryPackCartridgeStatus.setDescription("The battery cartridge status.\nbit 0 Disconnected\nbit 1 Overvoltage\nbit 2 NeedsReplacement\nbit 3 OvertemperatureCritical\nbit 4 Charger\nbit 5 TemperatureSensor\nbit 6 BusSoftStart\nbit 7 OvertemperatureWarning\nbit 8 GeneralError\nbit 9 Communication\nbit 10 DisconnectedFrame\nbit 11 FirmwareMismatch")
+upsInput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3))
+upsBasicInput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 1))
+upsBasicInputPhase = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicInputPhase.setDescription("The current AC input phase.")
+upsAdvInput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2))
+upsAdvInputLineVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 1), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputLineVoltage.setDescription("The current utility line voltage in VAC.")
+upsAdvInputMaxLineVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 2), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputMaxLineVoltage.setDescription("The maximum utility line voltage in VAC over the\nprevious 1 minute period.")
+upsAdvInputMinLineVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 3), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputMinLineVoltage.setDescription("The minimum utility line voltage in VAC over the\nprevious 1 minute period.")
+upsAdvInputFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 4), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputFrequency.setDescription("The current input frequency to the UPS system in Hz.")
+upsAdvInputLineFailCause = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(9,10,1,5,2,8,3,6,7,4,)).subtype(namedValues=NamedValues(("noTransfer", 1), ("rateOfVoltageChange", 10), ("highLineVoltage", 2), ("brownout", 3), ("blackout", 4), ("smallMomentarySag", 5), ("deepMomentarySag", 6), ("smallMomentarySpike", 7), ("largeMomentarySpike", 8), ("selfTest", 9), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputLineFailCause.setDescription("The reason for the occurrence of the last transfer to UPS\nbattery power.  The variable is set to:\n- noTransfer(1) -- if there is no transfer yet.\n- highLineVoltage(2) -- if the transfer to battery is caused\nby an over voltage greater than the high transfer voltage.\n- brownout(3) -- if the duration of the outage is greater than\nfive seconds and the line voltage is between 40% of the\nrated output voltage and the low transfer voltage.\n- blackout(4) -- if the duration of the outage is greater than five\nseconds and the line voltage is between 40% of the rated \noutput voltage and ground.\n- smallMomentarySag(5) -- if the duration of the outage is less\nthan five seconds and the line voltage is between 40% of the\nrated output voltage and the low transfer voltage.\n- deepMomentarySag(6) -- if the duration of the outage is less \nthan five seconds and the line voltage is between 40% of the \nrated output voltage and ground.  The variable is set to \n- smallMomentarySpike(7) -- if the line failure is caused by a\nrate of change of input voltage less than ten volts per cycle.\n- largeMomentarySpike(8) -- if the line failure is caused by \na rate of change of input voltage greater than ten volts per cycle.\n- selfTest(9) -- if the UPS was commanded to do a self test.\n- rateOfVoltageChange(10) -- if the failure is due to the rate of change of\nthe line voltage.")
+upsAdvInputNominalFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputNominalFrequency.setDescription("The nominal input frequency of the UPS system in Hz.")
+upsAdvInputNominalVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputNominalVoltage.setDescription("The nominal input voltage of the UPS system in VAC.")
+upsAdvInputBypassNominalFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputBypassNominalFrequency.setDescription("The nominal bypass input frequency of the UPS system in Hz.")
+upsAdvInputBypassNominalVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputBypassNominalVoltage.setDescription("The nominal bypass input voltage of the UPS system in VAC.")
+upsAdvInputStatisticsTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10))
+if mibBuilder.loadTexts: upsAdvInputStatisticsTable.setDescription("A list of input table entries.  The number of entries\nis given by the value of upsPhaseNumInputs.")
+upsAdvInputStatisticsEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1)).setIndexNames((0, "PowerNet-MIB", "upsAdvInputStatisticsIndex"))
+if mibBuilder.loadTexts: upsAdvInputStatisticsEntry.setDescription("An entry containing information applicable to a\nparticular input.")
+upsAdvInputStatisticsIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputStatisticsIndex.setDescription("The input identifier.")
+upsAdvInputApparentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputApparentPower.setDescription("The input apparent power(sum of all of the three phases) measured in kVA.")
+upsAdvInputVoltageTHD = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputVoltageTHD.setDescription("The input voltage Total Harmonic Distortion in percent.")
+upsAdvInputBypassVoltageTHD = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputBypassVoltageTHD.setDescription("The bypass input voltage Total Harmonic Distortion in percent.")
+upsAdvInputPeakCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputPeakCurrent.setDescription("The input peak current in Amperes.")
+upsAdvInputBypassPeakCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputBypassPeakCurrent.setDescription("The bypass input peak current in Amperes.")
+upsAdvInputActivePower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 10, 1, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputActivePower.setDescription("The input active power measured in kW.")
+upsAdvInputTotalApparentPower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputTotalApparentPower.setDescription("The input total apparent power(sum of all three phases)\nof the UPS system in kVA.")
+upsAdvInputTotalActivePower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 12), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputTotalActivePower.setDescription("The input total active power(sum of all three phases)\nof the UPS system in kW.")
+upsAdvInputBypassTotalApparentPower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 13), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputBypassTotalApparentPower.setDescription("The input bypass total apparent power(sum of all three phases)\nof the UPS system in kVA.")
+upsAdvInputBypassTotalActivePower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 2, 14), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvInputBypassTotalActivePower.setDescription("The input bypass total active power(sum of all three phases)\nof the UPS system in kW.")
+upsHighPrecInput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3))
+upsHighPrecInputLineVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 1), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecInputLineVoltage.setDescription("The current utility line voltage in tenths of VAC.")
+upsHighPrecInputMaxLineVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 2), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecInputMaxLineVoltage.setDescription("The maximum utility line voltage in tenths of VAC over the\nprevious 1 minute period.")
+upsHighPrecInputMinLineVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 3), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecInputMinLineVoltage.setDescription("The minimum utility line voltage in tenths of VAC over the\nprevious 1 minute period.")
+upsHighPrecInputFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 4), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecInputFrequency.setDescription("The current input frequency to the UPS system in tenths of Hz.")
+upsHighPrecInputEnergyUsage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 5), Unsigned32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecInputEnergyUsage.setDescription("The input energy usage of the UPS in hundredths of kWh.")
+upsHighPrecInputBypassVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 6), Unsigned32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecInputBypassVoltage.setDescription("The current bypass line voltage in tenths of VAC.")
+upsHighPrecInputBypassFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 3, 3, 7), Unsigned32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecInputBypassFrequency.setDescription("The current input bypass frequency to the UPS system in tenths of Hz.")
+upsOutput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4))
+upsBasicOutput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1))
+upsBasicOutputStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(10,11,15,19,22,1,18,8,20,5,16,12,13,6,21,2,4,7,17,9,3,14,)).subtype(namedValues=NamedValues(("unknown", 1), ("hardwareFailureBypass", 10), ("sleepingUntilPowerReturn", 11), ("onSmartTrim", 12), ("ecoMode", 13), ("hotStandby", 14), ("onBatteryTest", 15), ("emergencyStaticBypass", 16), ("staticBypassStandby", 17), ("powerSavingMode", 18), ("spotMode", 19), ("onLine", 2), ("eConversion", 20), ("chargerSpotmode", 21), ("inverterSpotmode", 22), ("onBattery", 3), ("onSmartBoost", 4), ("timedSleeping", 5), ("softwareBypass", 6), ("off", 7), ("rebooting", 8), ("switchedBypass", 9), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicOutputStatus.setDescription("The current state of the UPS. If the UPS is unable to \ndetermine the state of the UPS this variable is set \nto unknown(1).")
+upsBasicOutputPhase = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicOutputPhase.setDescription("The current output phase.")
+upsBasicSystemStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(12,4,7,16,1,11,10,8,13,6,2,9,14,5,15,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("hardwareFailureBypass", 10), ("sleepingUntilPowerReturn", 11), ("onSmartTrim", 12), ("ecoMode", 13), ("inverter", 14), ("eConversion", 15), ("staticBypassStandby", 16), ("onLine", 2), ("onBattery", 3), ("onSmartBoost", 4), ("timedSleeping", 5), ("softwareBypass", 6), ("off", 7), ("rebooting", 8), ("switchedBypass", 9), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicSystemStatus.setDescription("Current state for the whole system (UPS and surrounding breakers).\nIf the UPS is unable to determine the state of the system, this\nvariable is set to unknown(1).")
+upsBasicSystemInternalTemperature = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicSystemInternalTemperature.setDescription("The actual internal temperature of the UPS system in Celsius.")
+upsBasicSystemInverterStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("ok", 2), ("inFaultCondition", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicSystemInverterStatus.setDescription("The current state of the UPS inverter. If the UPS is unable\nto determine the state of the inverter, this variable is set\nto unknown(1).")
+upsBasicSystemPFCStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("ok", 2), ("inFaultCondition", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicSystemPFCStatus.setDescription("The general status of the power factor correction (AC input stage\nof the UPS). If the UPS is unable to determine the state of PFC,\nthis variable is set to unknown(1).")
+upsBasicOutputACwiringConfiguration = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("noNeutralWiredonSystem", 2), ("neutralUsedforSupplyingLoad", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicOutputACwiringConfiguration.setDescription("Indicates if neutral wire on output side of the UPS is \nused (load wired line to neutral). If the UPS is unable to \ndetermine the state of neutral, this variable is set to \nunknown(1).")
+upsAdvOutput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2))
+upsAdvOutputVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 1), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputVoltage.setDescription("The output voltage of the UPS system in VAC.")
+upsAdvOutputFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 2), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputFrequency.setDescription("The current output frequency of the UPS system in Hz.")
+upsAdvOutputLoad = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 3), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputLoad.setDescription("The current UPS load expressed in percent \nof rated capacity.")
+upsAdvOutputCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 4), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputCurrent.setDescription("The current in amperes drawn by the load on the UPS.")
+upsAdvOutputRedundancy = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 5), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputRedundancy.setDescription("The number of power modules which can fail or be\nremoved without causing the UPS to generate a Minimum\nRedundancy Lost event.")
+upsAdvOutputKVACapacity = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputKVACapacity.setDescription("The maximum load that this UPS can support.")
+upsAdvOutputNominalFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputNominalFrequency.setDescription("The nominal output frequency of the UPS system in Hz.")
+upsAdvOutputActivePower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputActivePower.setDescription("The total output active power of the UPS system in W. \nThe total active power is the sum of phase 1, phase 2 and \nphase 3 power.")
+upsAdvOutputApparentPower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputApparentPower.setDescription("The total output apparent power of all phases of the UPS system in VA.")
+upsAdvOutputStatisticsTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10))
+if mibBuilder.loadTexts: upsAdvOutputStatisticsTable.setDescription("A list of input table entries.  The number of entries\nis given by the value of upsPhaseNumOutputs.")
+upsAdvOutputStatisticsEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1)).setIndexNames((0, "PowerNet-MIB", "upsAdvOutputStatisticsIndex"))
+if mibBuilder.loadTexts: upsAdvOutputStatisticsEntry.setDescription("An entry containing information applicable to a\nparticular output.")
+upsAdvOutputStatisticsIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputStatisticsIndex.setDescription("The output identifier.")
+upsAdvOutputPeakCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputPeakCurrent.setDescription("The output peak current in Amperes.")
+upsAdvOutputCurrentTHD = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputCurrentTHD.setDescription("The output current Total Harmonic Distortion in percent.")
+upsAdvOutputCrestFactor = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 10, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputCrestFactor.setDescription("The output current crest factor expressed in tenths.")
+upsAdvOutputNeutralCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 2, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvOutputNeutralCurrent.setDescription("The neutral current in amperes.")
+upsHighPrecOutput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3))
+upsHighPrecOutputVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 1), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecOutputVoltage.setDescription("The output voltage of the UPS system in tenths of VAC.")
+upsHighPrecOutputFrequency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 2), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecOutputFrequency.setDescription("The current output frequency of the UPS system in tenths of Hz.")
+upsHighPrecOutputLoad = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 3), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecOutputLoad.setDescription("The current UPS load expressed in tenths of percent \nof rated capacity.")
+upsHighPrecOutputCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 4), Gauge()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecOutputCurrent.setDescription("The current in tenths of amperes drawn by the load on the UPS.")
+upsHighPrecOutputEfficiency = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecOutputEfficiency.setDescription("The positive values represent efficiency of the UPS in tenths of percent. \n-1 If UPS supports this OID but the result is not available\n-2 Load is too low to report efficiency\n-3 Output off and efficiency is 0\n-4 On battery, efficiency is not measured or calculated in this mode\n-5 In Bypass, efficiency is not measured or calculated in this mode\n-6 Battery charging, battery is charging and adversely affecting efficiency\n-7 Poor AC input, the main input is outside the optimum efficiency range")
+upsHighPrecOutputEnergyUsage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 4, 3, 6), Unsigned32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsHighPrecOutputEnergyUsage.setDescription("The output energy usage of the UPS in hundredths of kWh.")
+upsConfig = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5))
+upsBasicConfig = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1))
+upsBasicConfigNumDevices = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicConfigNumDevices.setDescription("The number of devices that are plugged into the UPS.\nThis value is customer configurable from the device entry table")
+upsBasicConfigDeviceTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2))
+if mibBuilder.loadTexts: upsBasicConfigDeviceTable.setDescription("A list of devices that are plugged into the UPS.\nThe number of entries is given by the value of\nupsBasicConfigNumDevices.")
+upsBasicConfigDeviceEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 1, 2, 1)).setIndexNames((0, "PowerNet-MIB", "deviceIndex"))
+if mibBuilder.loadTexts: upsBasicConfigDeviceEntry.setDescription("The devices plugged in to the UPS.")
+upsAdvConfig = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2))
+upsAdvConfigRatedOutputVoltage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 1), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigRatedOutputVoltage.setDescription("The nominal output voltage from the UPS in VAC. \n\nFor a list of allowed values supported by your UPS model,\nsee the UPS User's Manual.\n\nIf a value other than a supported value is provided in a \nset request, the UPS interprets it as the next lower\nacceptable value.  If the provided value is lower than\nthe lowest acceptable value, the lowest acceptable \nvalue is used.")
+upsAdvConfigHighTransferVolt = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 2), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigHighTransferVolt.setDescription("The maximum line voltage in VAC allowed before the\nUPS system transfers to battery backup.\n\nFor a list of allowed values supported by your UPS model,\nsee the UPS User's Manual.\n\nIf a value other than a supported value is provided in a\nset request, the UPS interprets it as a the next higher\nacceptable value.  If the provided value is higher than\nthe highest acceptable value, the highest acceptable \nvalue is used.")
+upsAdvConfigLowTransferVolt = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 3), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigLowTransferVolt.setDescription("The minimum line voltage in VAC allowed before the\nUPS system transfers to battery backup.\n\nFor a list of allowed values supported by your UPS model,\nsee the UPS User's Manual.\n\nIf a value other than a supported value is provided in a \nset request, the UPS interprets it as the next lower\nacceptable value.  If the provided value is lower than\nthe lowest acceptable value, the lowest acceptable \nvalue is used.")
+upsAdvConfigAlarm = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("timed", 1), ("atLowBattery", 2), ("never", 3), ("mute", 4), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigAlarm.setDescription("A flag indicating how the UPS should handle audible\nline fail alarms:\ntimed(1): UPS alarm will sound after a preset timed duration starting\nfrom the line fail condition (see OID upsAdvConfigAlarmTimer for the\nalarm timer value)\natLowBattery(2): UPS alarm will sound when the UPS has reached a Low\nBattery condition during a line fail\nnever(3): Disables the UPS audible alarm\nmute(4): Mutes the current alarm for some UPSs only when it is in an\nalarm state and will return to the previously configured option when\nthe UPS recovers from the alarm condition")
+upsAdvConfigAlarmTimer = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 5), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigAlarmTimer.setDescription("The time after initial line failure at which the UPS\nbegins emitting audible alarms (beeping).  This timer is\nobserved only if the value of extControlAlarm is timed(2).\nAllowed values are 0 or 30 seconds.\n\nIf a value other than a supported value is provided in a\nset request, the UPS interprets it as a the next lower\nacceptable value.  If the provided value is lower than\nthe lowest acceptable value, the lowest acceptable \nvalue is used.")
+upsAdvConfigMinReturnCapacity = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 6), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigMinReturnCapacity.setDescription("The minimum battery capacity required before the UPS will \nreturn from a low battery shutdown condition.  The capacity is\nmeasured from 0% battery capacity (or Low Battery) as a percent\nof full capacity (100%).   In other words, the UPS will not re-energize\nthe output until the battery has charged so that its' capacity is equal \nto this value.\n\nFor a list of allowed values supported by your UPS model,\nsee the UPS User's Manual.\n\nIf a value other than a supported value is provided in a\nset request, the UPS interprets it as a the next higher\nacceptable value.  If the provided value is higher than\nthe highest acceptable value, the highest acceptable \nvalue is used.")
+upsAdvConfigSensitivity = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(4,1,3,2,)).subtype(namedValues=NamedValues(("auto", 1), ("low", 2), ("medium", 3), ("high", 4), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigSensitivity.setDescription("The sensitivity of the UPS to utility line abnormalities\nor noises.")
+upsAdvConfigLowBatteryRunTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 8), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigLowBatteryRunTime.setDescription("The desired run time of the UPS, in seconds, once the \nlow battery condition is reached. During this time the UPS will\nproduce a constant warning tone which can not be disabled.\n\nFor a list of allowed values supported by your UPS model,\nsee the UPS User's Manual.\n\nIf a value other than a supported value is provided in a set\nrequest, the UPS interprets the value as the next higher\nacceptable value.  If the provided value is higher than the\nhighest acceptable value, the highest acceptable value is used.")
+upsAdvConfigReturnDelay = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 9), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigReturnDelay.setDescription("The delay in seconds after utility line power returns\nbefore the UPS will turn on.  This value is also used \nwhen the UPS comes out of a reboot and before the UPS\nwakes up from 'sleep' mode.\n\nFor a list of allowed values supported by your UPS model,\nsee the UPS User's Manual.\n\nIf a value other than a supported value is provided in a\nset request, the UPS interprets it as a the next higher\nacceptable value.  If the provided value is higher than\nthe highest acceptable value, the highest acceptable \nvalue is used.")
+upsAdvConfigShutoffDelay = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 10), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigShutoffDelay.setDescription("The delay in seconds the UPS remains on after being told \nto turn off.\n\nFor a list of allowed values supported by your UPS model,\nsee the UPS User's Manual.\n\nIf a value other than a supported value is provided in a\nset request, the UPS interprets it as a the next higher\nacceptable value.  If the provided value is higher than\nthe highest acceptable value, the highest acceptable \nvalue is used.")
+upsAdvConfigUpsSleepTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 11), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigUpsSleepTime.setDescription("The time in seconds for the UPS to go to 'sleep' when \ninstructed.  When in sleep mode, the UPS will not provide\noutput power regardless of the input line state.  Once the\nspecified time has elapsed, output power will be restored.\n\nThis is a configuration setting.  The UPS will not go to\nsleep until told to do so by the manager from a management\nstation.\n\nAny input value is allowed, however the UPS only recognizes\n1/10 of an hour increments.  The provided value will be \nrounded to the closest 1/10 of an hour with one exception:\nAny value entered between 1 and 540 seconds will be rounded \nto 360 seconds (or 6 minutes).")
+upsAdvConfigSetEEPROMDefaults = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 12), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("noSetEEPROMDefaults", 1), ("setEEPROMDefaults", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigSetEEPROMDefaults.setDescription("WRITE: Resets the UPS EEPROM variables to default values.\nREAD: returns 1")
+upsAdvConfigDipSwitchTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 13))
+if mibBuilder.loadTexts: upsAdvConfigDipSwitchTable.setDescription("Current settings of UPS dip switches.")
+upsAdvConfigDipSwitchEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 13, 1)).setIndexNames((0, "PowerNet-MIB", "dipSwitchIndex"))
+if mibBuilder.loadTexts: upsAdvConfigDipSwitchEntry.setDescription("The current setting of one dip switch.")
+upsAdvConfigBattExhaustThresh = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 14), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBattExhaustThresh.setDescription("The number of seconds prior to battery exhaustion when the\nUPS will switch off power to its load.")
+upsAdvConfigPassword = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 15), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigPassword.setDescription("The password entered at the UPS front panel to enable local\nconfiguration of the EEProm. If the password is disabled or \nis not supported, then the agent returns a null string.")
+upsAdvConfigAllowedSetTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 16))
+if mibBuilder.loadTexts: upsAdvConfigAllowedSetTable.setDescription("The table listing the allowed values for all discrete \nconfigurable UPS variables.")
+upsAdvConfigAllowedSetEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 16, 1)).setIndexNames((0, "PowerNet-MIB", "apcUpsConfigFieldIndex"))
+if mibBuilder.loadTexts: upsAdvConfigAllowedSetEntry.setDescription("The table entry for a configurable UPS variable.")
+upsAdvConfigBattCabAmpHour = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 17), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBattCabAmpHour.setDescription("Configure the amp-hour setting of the UPS battery cabinet.")
+upsAdvConfigPositionSelector = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 18), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("rack", 2), ("tower", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigPositionSelector.setDescription("Configure UPS position selector.  If the UPS doesn't\nsupport this configuration it will report unknown (1).\nThe positions are either rack (2) for rack mounted or\ntower (3) for tower unit.")
+upsAdvConfigOutputFreqRange = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 19), Integer().subtype(subtypeSpec=SingleValueConstraint(7,1,2,17,9,11,8,10,22,19,18,21,20,5,6,3,16,15,14,13,4,12,)).subtype(namedValues=NamedValues(("unknown", 1), ("freqRange50Var1dot0", 10), ("freqRange50Pct0dot5", 11), ("freqRange50Pct1", 12), ("freqRange50Pct2", 13), ("freqRange50Pct4", 14), ("freqRange50Pct6", 15), ("freqRange50Pct8", 16), ("freqRange60Pct0dot5", 17), ("freqRange60Pct1", 18), ("freqRange60Pct2", 19), ("freqRangeAUTO", 2), ("freqRange60Pct4", 20), ("freqRange60Pct6", 21), ("freqRange60Pct8", 22), ("freqRange60Var1", 3), ("freqRange60Var3", 4), ("freqRange50Var1", 5), ("freqRange50Var3", 6), ("freqRange60Var10", 7), ("freqRange50Var10", 8), ("freqRange60Var1dot0", 9), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigOutputFreqRange.setDescription("Configure the output frequency tolerance range.\nunknown(1) indicates the output frequency is unknown.\nfreqRangeAUTO(2) configure the output frequency range for automatic.\nfreqRange60Var1(3) configure the output frequency range for 60 +/- 0.1 Hz\nfreqRange60Var3(4) configure the output frequency range for 60 +/- 3.0 Hz\nfreqRange50Var1(5) configure the output frequency range for 50 +/- 0.1 Hz\nfreqRange50Var3(6) configure the output frequency range for 50 +/- 3.0 Hz\nfreqRange60Var10(7) configure the output frequency range for 60 +/- 10 Hz\nfreqRange50Var10(8) configure the output frequency range for 50 +/- 10 Hz\nfreqRange60Var1dot0(9) configure the output frequency range for 60 +/- 1.0 Hz\nfreqRange50Var1dot0(10) configure the output frequency range for 50 +/- 1.0 Hz\nfreqRange50Pct0dot5(11) configure the output frequency range for 50 Hz +/- 0.5 %\nfreqRange50Pct1(12) configure the output frequency range for 50 Hz +/- 1.0 %\nfreqRange50Pct2(13) configure the output frequency range for 50 Hz +/- 2.0 %\nfreqRange50Pct4(14) configure the output frequency range for 50 Hz +/- 4.0 %\nfreqRange50Pct6(15) configure the output frequency range for 50 Hz +/- 6.0 %\nfreqRange50Pct8(16) configure the output frequency range for 50 Hz +/- 8.0 %\nfreqRange60Pct0dot5(17) configure the output frequency range for 60 Hz +/- 0.5 %\nfreqRange60Pct1(18) configure the output frequency range for 60 Hz +/- 1.0 %\nfreqRange60Pct2(19) configure the output frequency range for 60 Hz +/- 2.0 %\nfreqRange60Pct4(20) configure the output frequency range for 60 Hz +/- 4.0 %\nfreqRange60Pct6(21) configure the output frequency range for 60 Hz +/- 6.0 %\nfreqRange60Pct8(22) configure the output frequency range for 60 Hz +/- 8.0 %\nFor a list of allowed values and conditions when variable can be set by your UPS model,\nsee the UPS User's Manual.")
+upsAdvConfigUPSFail = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 20), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("gotoBypass", 2), ("dropLoad", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigUPSFail.setDescription("Configure the UPS fail action.  If UPS fails,\nand frequency or voltage is out of range it will either\nGotoBypass (2) or DropLoad (3).  This OID will report\nunknown (1) if it is not supported feature or option.")
+upsAdvConfigAlarmRedundancy = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 21), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigAlarmRedundancy.setDescription("Configure settings of UPS alarm if the redundancy is\nunder the current redundancy.  Use 0 for never.")
+upsAdvConfigAlarmLoadOver = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 22), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigAlarmLoadOver.setDescription("Configure settings of UPS alarm if the load is\nover the current load in kVA.  Use -1 for never.")
+upsAdvConfigAlarmRuntimeUnder = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 23), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigAlarmRuntimeUnder.setDescription("Configure settings of UPS alarm if the runtime is\nunder the current time of minutes.  Use -1 for never.")
+upsAdvConfigVoutReporting = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 24), Integer().subtype(subtypeSpec=SingleValueConstraint(4,1,2,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("voutAUTO", 2), ("vout208", 3), ("vout240", 4), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigVoutReporting.setDescription("Configure the way the UPS scales its output voltage readings.\nunknown(1) indicates the Vout Reporting is unknown.\nvoutAUTO(2) configure the Vout Reporting for automatic scaling.\nvout208(3) configure the Vout Reporting for 208 Volts.\nvout240(4) configure the Vout Reporting for 240 Volts.")
+upsAdvConfigNumExternalBatteries = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 25), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigNumExternalBatteries.setDescription("Configure the number of external batteries connected to the UPS.")
+upsAdvConfigSimpleSignalShutdowns = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 26), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("disabled", 2), ("enabled", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigSimpleSignalShutdowns.setDescription("Configure Simple Signal shutdown commands from the Simple Signal\nport to be issued to the UPS.\nunknown(1) indicates the Simple Signal Shutdown setting is unknown.\ndisabled(2) configure to disable Simple Signal Shutdowns.\nenabled(3) configure to enable Simple Signal Shutdowns.")
+upsAdvConfigMaxShutdownTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 27), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigMaxShutdownTime.setDescription("The maximum amount of time for server shutdown to complete before a \nUPS shutdown occurs.")
+upsAsiUpsControlServerRequestShutdown = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 28), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("serverShutdownOff", 1), ("serverShutdownReboot", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAsiUpsControlServerRequestShutdown.setDescription("Start a server shutdown sequence:\nserverShutdownOff: Shutdown server and turn off UPS\nserverShutdownReboot: Shutdown server and turn reboot UPS.")
+upsAdvConfigMinReturnRuntime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 29), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigMinReturnRuntime.setDescription("The minimum amount of run time in seconds required before the output will be\nturned on, using power calculation captured at start of last shutdown.")
+upsAdvConfigBasicSignalLowBatteryDuration = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 30), TimeTicks()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBasicSignalLowBatteryDuration.setDescription("The duration of runtime in seconds during an on-battery condition at which \nthe UPS will signal the basic low battery shutdown condition.")
+upsAdvConfigBypassPhaseLockRequired = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 31), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("disabled", 2), ("enabled", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBypassPhaseLockRequired.setDescription("Sets the condition for when bypass is an acceptable mode of operation as a\nrequirement.")
+upsAdvConfigOutputFreqSlewRate = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 32), Integer().subtype(subtypeSpec=SingleValueConstraint(2,3,5,1,6,4,7,)).subtype(namedValues=NamedValues(("unknown", 1), ("slewRateQuarterHzPerSec", 2), ("slewRateHalfHzPerSec", 3), ("slewRate1HzPerSec", 4), ("slewRate2HzPerSec", 5), ("slewRate4HzPerSec", 6), ("slewRate6HzPerSec", 7), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigOutputFreqSlewRate.setDescription("The rate at which the UPS will change its output frequency \nin response to utility frequency changes.")
+upsAdvConfigChargerLevel = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 33), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("low", 2), ("high", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigChargerLevel.setDescription("Sets the rate at which the UPS charges its batteries.")
+upsAdvConfigBypassToleranceSetting = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 34), Integer().subtype(subtypeSpec=SingleValueConstraint(2,3,1,5,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("wide", 2), ("medium", 3), ("narrow", 4), ("custom", 5), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBypassToleranceSetting.setDescription("This setting allows selecting from standard bypass tolerance configurations to suit their situation.")
+upsAdvConfigMainsSetting = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 35), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("singleInput", 1), ("dualInput", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvConfigMainsSetting.setDescription("Configure the type of mains supply system.\nsingleInput (1) indicates a single supply system.\ndualInput   (2) indicates a dual supply system. ")
+upsAdvConfigACWiringSetting = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 36), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("threeWire", 1), ("fourWire", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvConfigACWiringSetting.setDescription("Configure the AC wiring of the system.\nthreeWire (1) indicates 3-wire system configuration.\nfourWire  (2) indicates 4-wire system configuration. ")
+upsAdvConfigUpperOutputVoltTolerance = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 37), Integer32().subtype(subtypeSpec=ValueRangeConstraint(0, 100))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigUpperOutputVoltTolerance.setDescription("Upper tolerance of the output RMS voltage before transferring to bypass.\nExpressed as percent of nominal voltage.")
+upsAdvConfigLowerOutputVoltTolerance = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 38), Integer32().subtype(subtypeSpec=ValueRangeConstraint(0, 100))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigLowerOutputVoltTolerance.setDescription("Lower tolerance of the output RMS voltage before transferring to bypass.\nExpressed as percent of nominal voltage.")
+upsAdvConfigUpperBypassVoltTolerance = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 39), Integer32().subtype(subtypeSpec=ValueRangeConstraint(0, 100))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigUpperBypassVoltTolerance.setDescription("Upper tolerance of the bypass voltage that allows transfer to bypass by user.\nExpressed as percent of nominal voltage.")
+upsAdvConfigLowerBypassVoltTolerance = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 40), Integer32().subtype(subtypeSpec=ValueRangeConstraint(0, 100))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigLowerBypassVoltTolerance.setDescription("Lower tolerance of the bypass voltage that allows transfer to bypass by user.\nExpressed as percent of nominal voltage.")
+upsAdvConfigOutofSyncBypassTransferDelay = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 41), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigOutofSyncBypassTransferDelay.setDescription("Configure the time (in milliseconds), indicating the gap in output voltage\nif an asynchronous transfer to bypass needs to occur.")
+upsAdvConfigWarningAlarmDelay = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 43), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigWarningAlarmDelay.setDescription("Configure the time delay for reporting warning alarms\n(in seconds).")
+upsAdvConfigInformationalAlarmDelay = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 44), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigInformationalAlarmDelay.setDescription("Configure the time delay for reporting informational alarms\n(in seconds).")
+upsAdvConfigGreenMode = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 45), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("disable", 1), ("enable", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigGreenMode.setDescription("Enable/Disable UPS green mode feature.")
+upsAdvConfigLCDLocalLanguage = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 46), Integer().subtype(subtypeSpec=SingleValueConstraint(5,6,4,1,7,2,3,)).subtype(namedValues=NamedValues(("english", 1), ("french", 2), ("italian", 3), ("german", 4), ("spanish", 5), ("portuguese", 6), ("japanese", 7), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigLCDLocalLanguage.setDescription("Configure the language setting of the UPS LCD display information.")
+upsAdvConfigLCDLockOut = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 47), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("disable", 1), ("enable", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigLCDLockOut.setDescription("Enable/Disable the control function of the UPS via the LCD Display.")
+upsAdvConfigChargerRate = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 48), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigChargerRate.setDescription("Change the maximum allowed UPS charge rate on select products where 100% represents \nthe manufacturer's recommended rate.  A charge/discharge rate of C/10 for a 10 Ah \nbattery would be 1 where C is defined as the charge or discharge rate equal to the \ncapacity of a battery divided by 1 hour. To increase the charge rate by a factor of \n2 to C/5, this oid would be set to 200%.  This number would not change when external \npacks are added or removed.  Charging at too high a rate can result in boiling and/or \nventing of electrolyte and/or high gas pressure.")
+upsAdvConfigBatterySelection = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 49), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("vrla", 1), ("ventedcell", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBatterySelection.setDescription("Configure the installed battery type on select products where VRLA is Valve Regulated \nLead Acid type battery and Vented Cell is a wet cell type (car) battery.")
+upsAdvConfigBatteryHealthAlarmWarningTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 50), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBatteryHealthAlarmWarningTime.setDescription("Configure the number of days before the battery health is depleted that the battery\nhealth alarm is activated. Setting this to -1, if supported by the UPS, will suppress\nthe battery health alarm.")
+upsAdvConfigBatteryHealthAlarmSleepTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 5, 2, 51), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvConfigBatteryHealthAlarmSleepTime.setDescription("Configure the number of days that the UPS's battery health alarm should sleep before\nbeing activated again after being acknowledged. Setting this to -1, if supported by the\nUPS, displays no other alarms after the first alarm is acknowledged.")
+upsControl = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6))
+upsBasicControl = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 1))
+upsBasicControlConserveBattery = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 1, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("noTurnOffUps", 1), ("turnOffUpsToConserveBattery", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsBasicControlConserveBattery.setDescription("Setting this variable to turnUpsOffToConserveBattery(2) \ncauses a UPS on battery to be put into 'sleep' mode.  The \nUPS will turn back on when utility power is restored.  \nAttempting to turn off a UPS that is not on battery will \nresult in a badValue error.\n\nSetting this value to noTurnOffUps(1) has no\neffect.\n\nThe value noTurnOffUps(1) will always be returned\nwhen the variable is read.")
+upsAdvControl = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2))
+upsAdvControlUpsOff = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(4,1,5,2,6,3,)).subtype(namedValues=NamedValues(("noTurnUpsOff", 1), ("turnUpsOff", 2), ("turnUpsOffGracefully", 3), ("turnUpsSyncGroupOff", 4), ("turnUpsSyncGroupOffAfterDelay", 5), ("turnUpsSyncGroupOffGracefully", 6), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlUpsOff.setDescription("Setting this variable to turnUpsOff(2) causes\nthe UPS to shut off.  When in this state, the UPS \nwill not provide output power regardless of the input\nline state.\n\nSetting this variable to turnUpsOffGracefully(3) causes\nthe UPS to shut off after a delay period. This allows the\nhost to shut down in a graceful manner. When in this state,\nthe UPS will not provide output power regardless of the\ninput line state. \n       \nIf this UPS is an active member of a Synchronized \nControl Group (SCG) the turnUpsSyncGroupOff(4) command \nwill perform a Synchronized Turn Off of all active Group\nmembers regardless of their current AC output status.    \n\nIf this UPS is an active member of a Synchronized \nControl Group (SCG) the turnUpsSyncGroupOffAfterDelay(5)\ncommand will perform a Synchronized Turn Off After Delay \nof all active Group members regardless of their current \nAC output status. This unit's Shutdown Delay will be used \nto execute the Turn Off After Delay command.  \n\nIf this UPS is an active member of an SCG, the \nturnUpsSyncGroupOffGracefully(6) command will perform a \nSynchronized Turn Off Gracefully of all active Group \nmembers regardless of their current AC output status.  \nThis unit's Maximum Shutdown Time and Shutdown Delay will\nbe used to execute the Turn Off Gracefully command.  \n\nSetting this value to noTurnUpsOff(1) has no\neffect.\n\nThe value noTurnUpsOff(1) will always be returned\nwhen the variable is read.")
+upsAdvControlRebootShutdownUps = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(2,3,1,4,5,)).subtype(namedValues=NamedValues(("noRebootShutdownUps", 1), ("rebootShutdownUps", 2), ("rebootShutdownUpsGracefully", 3), ("rebootShutdownSyncGroupUps", 4), ("rebootShutdownSyncGroupUpsGracefully", 5), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlRebootShutdownUps.setDescription("Setting this variable to rebootShutdownUps(2) causes the UPS\nto shut off and turn back on (as long as good AC input power\nis available, otherwise the UPS will remain off until good AC\ninput power is available).\n\nSetting this variable to rebootShutdownUpsGracefully(3) causes\nthe UPS to shut off after a delay period and then turn back\non.  This allows the host to shut down in a graceful manner.\n\nIf this UPS is an active member of a Synchronized Control\nGroup (SCG) the rebootShutdownSyncGroupUps(4) command will\nperform a Synchronized Reboot of all active Group members\nregardless of their current AC output status.  If applicable,\nthis unit's Power Synchronization Delay, Shutdown Delay,\nReturn Delay, Return Battery Capacity, and Return Battery\nCapacity Offset will be used to execute the Reboot command.\n\nIf this UPS is an active member of a SCG the\nrebootShutdownSyncGroupUpsGracefully(5) command will perform\na Synchronized Reboot of all active Group members regardless\nof their current AC output status.  If applicable, this unit's\nPower Synchronization Delay, Maximum Shutdown Time, Shutdown\nDelay, Return Delay, Return Battery Capacity, and Return\nBattery Capacity Offset will be used to execute the Reboot\ncommand.\n\nSetting this value to noRebootShutdownUps(1) has no effect.\n\nThe value noRebootShutdownUps(1) will always be returned when\nthe variable is read.")
+upsAdvControlUpsSleep = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(2,3,4,5,1,)).subtype(namedValues=NamedValues(("noPutUpsToSleep", 1), ("putUpsToSleep", 2), ("putUpsToSleepGracefully", 3), ("putUpsSyncGroupToSleep", 4), ("putUpsSyncGroupToSleepGracefully", 5), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlUpsSleep.setDescription("Setting this variable to putUpsToSleep(2) causes\nthe UPS to go to sleep for the time specified by\nupsAdvConfigUpsSleepTime.\n\nSetting this variable to putUpsToSleepGracefully(3)\ncauses the UPS to go to sleep for the time specified \nby upsAdvConfigUpsSleepTime after a delay period. \nThis allows the host to shut down in a graceful manner.\n\nIf this UPS is an active member of a Synchronized Control \nGroup (SCG), the putUpsSyncGroupToSleep(4) command will perform\na Synchronized Sleep of all active Group members regardless \nof their current AC output status.  This unit's Power \nSynchronization Delay, Shutdown Delay, Sleep Time, \nand Return Delay will be used to execute the sleep command.  \n\nIf this UPS is an active member of a SCG the \nputUpsSyncGroupToSleepGracefully(5) command will perform a \nSynchronized Sleep Gracefully of all active Group members \nregardless of their current AC output status.  This unit's \nPower Synchronization Delay, Maximum Shutdown Time, Shutdown \nDelay, Sleep Time, and Return Delay to execute the sleep \ncommand.  \n\nWhen in sleep mode, the UPS will not provide output\npower regardless of the input line state.  Once the\nspecified time has elapsed, output power will be\nrestored. \n\nSetting this value to noPutUpsToSleep(1) has no\neffect.\n\nThe value noPutUpsToSleep(1) will always be returned\nwhen the variable is read.")
+upsAdvControlSimulatePowerFail = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("noSimulatePowerFailure", 1), ("simulatePowerFailure", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlSimulatePowerFail.setDescription("Setting this variable to simulatePowerFailure(2) causes\nthe UPS switch to battery power.\n\nSetting this value to noSimulatePowerFailure(1) has no\neffect.\n\nThe value noSimulatePowerFailure(1) will always be returned\nwhen the variable is read.")
+upsAdvControlFlashAndBeep = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(4,1,3,5,2,)).subtype(namedValues=NamedValues(("noFlashAndBeep", 1), ("flashAndBeep", 2), ("flashAndBeepSyncGroup", 3), ("flashAndBeepCont", 4), ("flashAndBeepCancel", 5), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlFlashAndBeep.setDescription("Setting this variable to flashAndBeep(2) causes the\nUPS to beep and simultaneously turn on the UPS front\npanel lights (Smart-UPS only).\n\nIf this UPS is an active member of a Synchronized Control \nGroup (SCG), the flashAndBeepSyncGroup(3) command will \nFlash and Beep all active Group members regardless of \ncurrent AC output status.\n\nSetting this value to noFlashAndBeep(1) has no\neffect.\n  \nSetting this value to flashAndBeepCont (4) commandcauses \nthe UPS to beep and light the front panel lights until \nthe flashAndBeepCancel (5) command is received.\n\nThe value noFlashAndBeep(1) will always be returned\nwhen the variable is read.")
+upsAdvControlTurnOnUPS = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("noTurnOnUPS", 1), ("turnOnUPS", 2), ("turnOnUPSSyncGroup", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlTurnOnUPS.setDescription("Setting this variable to turnOnUPS(2) causes the\nUPS to be turned on immediately.\n\nIf this UPS is an active member of a Synchronized Control \nGroup (SCG), the turnOnUPSSyncGroup(3) command will perform \na Synchronized Turn On of all active Group members \nregardless of their current AC output status.\n\nSetting this value to noTurnOnUPS(1) has no\neffect.\n\nThe value noTurnOnUPS(1) will always be returned\nwhen the variable is read.")
+upsAdvControlBypassSwitch = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(2,3,1,)).subtype(namedValues=NamedValues(("noBypassSwitch", 1), ("switchToBypass", 2), ("switchOutOfBypass", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlBypassSwitch.setDescription("This switch puts the UPS in or out of bypass mode.")
+upsAdvControlRebootUpsWithOrWithoutAC = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("noRebootUpsWithOrWithoutAC", 1), ("rebootUpsImmediatelyWithOrWithoutAC", 2), ("rebootUpsDelayedWithOrWithoutAC", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlRebootUpsWithOrWithoutAC.setDescription("Setting this variable to rebootUpsImmediatelyWithOrWithoutAC (2)\ncauses the UPS to turn off immediately, wait for a minimum time\n(typically 8 seconds), and then turn back on regardless of the\nAC input power on the UPS.  Any supported switched outlet\ngroups will be turned off immediately but will turn on based\non their individual settings (to allow on sequencing).\n\nSetting this variable to rebootUpsDelayedWithOrWithoutAC (3)\ncauses the UPS to turn off after a delay period, wait for a\nminimum time (typically 8 seconds), and then turn back on\nregardless of the AC input power on the UPS.  Any supported\nswitched outlet groups will be turned off and on based on their\nindividual settings (to allow off and/or on sequencing).\n\nSetting this value to noRebootUpsWithOrWithoutAC (1) has no\neffect.\n\nThe value noRebootUpsWithOrWithoutAC (1) will always be\nreturned when the variable is read.")
+upsAdvControlFirmwareUpdate = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 6, 2, 9), Integer().subtype(subtypeSpec=SingleValueConstraint(4,2,3,5,1,)).subtype(namedValues=NamedValues(("noFirmwareUpdate", 1), ("firmwareUpdate", 2), ("updateInProcess", 3), ("updateSuccessful", 4), ("updateFailed", 5), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvControlFirmwareUpdate.setDescription("Setting this variable to firmwareUpdate(2) causes the\nUPS to begin a firmware update if possible.\n\nSetting this value to noFirmwareUpdate(1) will clear the\nprevious results, if any, or otherwise has no effect.\n\nReading this variable will return noFirmwareUpdate(1) when\nthe UPS firmware has not been updated (or previous results\nhave been cleared), updateInProcess(3) when the UPS firmware\nis being updated, updateSuccessful(4) when the UPS firmware\nhas been successfully updated, or updateFailed(5) if the UPS\nfirmware update failed.")
+upsTest = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7))
+upsBasicTest = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 1))
+upsAdvTest = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2))
+upsAdvTestDiagnosticSchedule = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(4,10,5,12,7,2,11,3,9,8,6,1,)).subtype(namedValues=NamedValues(("unknown", 1), ("eightWeeks", 10), ("twentysixWeeks", 11), ("fiftytwoWeeks", 12), ("biweekly", 2), ("weekly", 3), ("atTurnOn", 4), ("never", 5), ("fourWeeks", 6), ("twelveWeeks", 7), ("biweeklySinceLastTest", 8), ("weeklySinceLastTest", 9), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvTestDiagnosticSchedule.setDescription("The UPS system's automatic battery test schedule.")
+upsAdvTestDiagnostics = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("noTestDiagnostics", 1), ("testDiagnostics", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvTestDiagnostics.setDescription("Setting this variable to testDiagnostics(2) causes\nthe UPS to perform a diagnostic self test.\n\nSetting this value to noTestDiagnostics(1) has no\neffect.\n\nThe value noTestDiagnostics(1) will always be returned\nwhen the variable is read.")
+upsAdvTestDiagnosticsResults = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(2,4,1,3,)).subtype(namedValues=NamedValues(("ok", 1), ("failed", 2), ("invalidTest", 3), ("testInProgress", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTestDiagnosticsResults.setDescription("The results of the last UPS diagnostics test performed.")
+upsAdvTestLastDiagnosticsDate = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTestLastDiagnosticsDate.setDescription("The date the last UPS diagnostics test was performed in\nmm/dd/yy format.")
+upsAdvTestRuntimeCalibration = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,)).subtype(namedValues=NamedValues(("noPerformCalibration", 1), ("performCalibration", 2), ("cancelCurrentCalibration", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvTestRuntimeCalibration.setDescription("Setting this variable to performCalibration(2) causes\nthe UPS to discharge to calibrate the UPS.\nThe test will only start if the battery capacity is 100%.\nThe test runs until capacity is less than 25%.\n\nSetting this variable to cancelCurrentCalibration(3)\nafter setting performCalibration(2) will cancel the \ncurrent discharge.\n\nSetting this variable to noPerformCalibration(1) \nwill have no effect.\n\nThe value noPerformCalibration(1) will always be returned\nwhen the variable is read.\n\nThe result of the calibration will be saved in \nupsAdvTestCalibrationResult.")
+upsAdvTestCalibrationResults = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("ok", 1), ("invalidCalibration", 2), ("calibrationInProgress", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTestCalibrationResults.setDescription("The results of the last runtime calibration.\n\nValue ok(1) means a successful runtime calibration.\n\nValue invalidCalibration(2) indicates last calibration did\nnot take place since the battery capacity was below\n100%.\n\nValue calibrationInProgress(3) means a calibration \nis occurring now. ")
+upsAdvTestCalibrationDate = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvTestCalibrationDate.setDescription("The date the last UPS runtime calibration was \nperformed in mm/dd/yy format.")
+upsAdvTestDiagnosticTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 8), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvTestDiagnosticTime.setDescription("The time of the day to perform automatic battery test. \nExpressed in 24 hour notation - hh:mm.")
+upsAdvTestDiagnosticDay = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 7, 2, 9), Integer().subtype(subtypeSpec=SingleValueConstraint(7,1,2,5,3,4,6,)).subtype(namedValues=NamedValues(("monday", 1), ("tuesday", 2), ("wednesday", 3), ("thursday", 4), ("friday", 5), ("saturday", 6), ("sunday", 7), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsAdvTestDiagnosticDay.setDescription("The day of the week to perform automatic battery test.")
+upsComm = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 8))
+upsCommStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 8, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("ok", 1), ("noComm", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsCommStatus.setDescription("The status of agent's communication with UPS. ")
+upsPhase = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9))
+upsPhaseResetValues = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 1))
+upsPhaseResetMaxMinValues = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 1, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("none", 1), ("reset", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsPhaseResetMaxMinValues.setDescription("Reset the maximum and minimum UPS values:\nupsPhaseInputMaxVoltage, upsPhaseInputMinVoltage,\nupsPhaseInputMaxCurrent, upsPhaseInputMinCurrent,\nupsPhaseInputMaxPower, upsPhaseInputMinPower,\nupsPhaseOutputMaxCurrent, upsPhaseOutputMinCurrent,\nupsPhaseOutputMaxLoad, upsPhaseOutputMinLoad,\nupsPhaseOutputMaxPercentLoad, upsPhaseOutputMinPercentLoad,\nupsPhaseOutputMaxPower, upsPhaseOutputMinPower,\nupsPhaseOutputMaxPercentPower, upsPhaseOutputMinPercentPower.")
+upsPhaseInput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2))
+upsPhaseNumInputs = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseNumInputs.setDescription("The number of input feeds to this device.\nThis variable indicates the number of rows in the\ninput table.")
+upsPhaseInputTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2))
+if mibBuilder.loadTexts: upsPhaseInputTable.setDescription("A list of input table entries.  The number of entries\nis given by the value of upsPhaseNumInputs.")
+upsPhaseInputEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsPhaseInputTableIndex"))
+if mibBuilder.loadTexts: upsPhaseInputEntry.setDescription("An entry containing information applicable to a\nparticular input.")
+upsPhaseInputTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputTableIndex.setDescription("The input identifier.")
+upsPhaseNumInputPhases = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseNumInputPhases.setDescription("The number of input phases utilized in this\ndevice.  The sum of all the upsPhaseNumInputPhases\nvariable indicates the number of rows in the \ninput phase table.")
+upsPhaseInputVoltageOrientation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(4,3,5,1,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("singlePhase", 2), ("splitPhase", 3), ("threePhasePhaseToNeutral", 4), ("threePhasePhaseToPhase", 5), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputVoltageOrientation.setDescription("The input voltage orientation: \n1: unknown for this UPS\n2: singlePhase - phase 1 voltage is between Phase 1\nand Neutral.\n3: splitPhase - phase 1 voltage is between Phase 1 and \nNeutral; phase 2 voltage is between Phase 2 and Neutral; \nphase 3 voltage is between Phase 1 and Phase 2.\n4: threePhasePhaseToNeutral - phase 1 voltage is between\nPhase 1 and Neutral; phase 2 voltage is between Phase 2 \nand Neutral; phase 3 voltage is between Phase 3 and\nNeutral.\n5: threePhasePhaseToPhase - phase 1 voltage is between \nPhase 1 and Phase 2; phase 2 voltage is between Phase 2\nand Phase 3; phase 3 voltage is between Phase 3 and\nPhase 1.")
+upsPhaseInputFrequency = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputFrequency.setDescription("The input frequency in 0.1 Hertz, or -1 if it's unsupported\nby this UPS.")
+upsPhaseInputType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,)).subtype(namedValues=NamedValues(("unknown", 1), ("main", 2), ("bypass", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputType.setDescription("The input type.")
+upsPhaseInputName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 2, 1, 6), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsPhaseInputName.setDescription("A name given to a particular input.")
+upsPhaseInputPhaseTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3))
+if mibBuilder.loadTexts: upsPhaseInputPhaseTable.setDescription("A list of input table entries.  The number of entries\nis given by the sum of the upsPhaseNumInputPhases.")
+upsPhaseInputPhaseEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1)).setIndexNames((0, "PowerNet-MIB", "upsPhaseInputPhaseTableIndex"), (0, "PowerNet-MIB", "upsPhaseInputPhaseIndex"))
+if mibBuilder.loadTexts: upsPhaseInputPhaseEntry.setDescription("An entry containing information applicable to a\nparticular input phase.")
+upsPhaseInputPhaseTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputPhaseTableIndex.setDescription("The input identifier.")
+upsPhaseInputPhaseIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputPhaseIndex.setDescription("The input phase identifier.")
+upsPhaseInputVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputVoltage.setDescription("The input voltage in VAC, or -1 if it's unsupported\nby this UPS.")
+upsPhaseInputMaxVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputMaxVoltage.setDescription("The maximum input voltage in VAC measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseInputMinVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputMinVoltage.setDescription("The minimum input voltage in VAC measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseInputCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputCurrent.setDescription("The input current in 0.1 amperes, or -1 if it's\nunsupported by this UPS.")
+upsPhaseInputMaxCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputMaxCurrent.setDescription("The maximum input current in 0.1 amperes measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseInputMinCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputMinCurrent.setDescription("The minimum input current in 0.1 amperes measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseInputPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputPower.setDescription("The input power in Watts, or -1 if it's unsupported\nby this UPS.")
+upsPhaseInputMaxPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 10), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputMaxPower.setDescription("The maximum input power in Watts measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseInputMinPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputMinPower.setDescription("The minimum input power in Watts measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseInputApparentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 12), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputApparentPower.setDescription("The input apparent power of the UPS in kVA.")
+upsPhaseInputPowerFactor = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 2, 3, 1, 13), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseInputPowerFactor.setDescription("The input power factor measured in hundredth.")
+upsPhaseOutput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3))
+upsPhaseNumOutputs = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseNumOutputs.setDescription("The number of output feeds to this device.\nThis variable indicates the number of rows in the\noutput table.")
+upsPhaseOutputTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2))
+if mibBuilder.loadTexts: upsPhaseOutputTable.setDescription("A list of output table entries.  The number of entries\nis given by the value of upsOutputNumPhases.")
+upsPhaseOutputEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsPhaseOutputTableIndex"))
+if mibBuilder.loadTexts: upsPhaseOutputEntry.setDescription("An entry containing information applicable to a\nparticular output.")
+upsPhaseOutputTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputTableIndex.setDescription("The output identifier.")
+upsPhaseNumOutputPhases = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseNumOutputPhases.setDescription("The number of output phases utilized in this\ndevice.  The sum of all the upsPhaseNumOutputPhases\nvariable indicates the number of rows in the \noutput phase table.")
+upsPhaseOutputVoltageOrientation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(4,3,5,1,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("singlePhase", 2), ("splitPhase", 3), ("threePhasePhaseToNeutral", 4), ("threePhasePhaseToPhase", 5), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputVoltageOrientation.setDescription("The output voltage orientation: \n1: unknown for this UPS\n2: singlePhase - phase 1 voltage is between Phase 1\nand Neutral.\n3: splitPhase - phase 1 voltage is between Phase 1 and \nNeutral; phase 2 voltage is between Phase 2 and Neutral; \nphase 3 voltage is between Phase 1 and Phase 2.\n4: threePhasePhaseToNeutral - phase 1 voltage is between\nPhase 1 and Neutral; phase 2 voltage is between Phase 2 \nand Neutral; phase 3 voltage is between Phase 3 and\nNeutral.\n5: threePhasePhaseToPhase - phase 1 voltage is between \nPhase 1 and Phase 2; phase 2 voltage is between Phase 2\nand Phase 3; phase 3 voltage is between Phase 3 and\nPhase 1.")
+upsPhaseOutputFrequency = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 2, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputFrequency.setDescription("The output frequency in 0.1 Hertz, or -1 if it's\nunsupported by this UPS.")
+upsPhaseOutputPhaseTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3))
+if mibBuilder.loadTexts: upsPhaseOutputPhaseTable.setDescription("A list of output table entries.  The number of\nentries is given by the sum of the upsPhaseNumOutputPhases.")
+upsPhaseOutputPhaseEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1)).setIndexNames((0, "PowerNet-MIB", "upsPhaseOutputPhaseTableIndex"), (0, "PowerNet-MIB", "upsPhaseOutputPhaseIndex"))
+if mibBuilder.loadTexts: upsPhaseOutputPhaseEntry.setDescription("An entry containing information applicable to a\nparticular output phase.")
+upsPhaseOutputPhaseTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputPhaseTableIndex.setDescription("The output identifier.")
+upsPhaseOutputPhaseIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputPhaseIndex.setDescription("The output phase identifier.")
+upsPhaseOutputVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputVoltage.setDescription("The output voltage in VAC, or -1 if it's unsupported\nby this UPS.")
+upsPhaseOutputCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputCurrent.setDescription("The output current in 0.1 amperes drawn \nby the load on the UPS, or -1 if it's unsupported\nby this UPS.")
+upsPhaseOutputMaxCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMaxCurrent.setDescription("The maximum output current in 0.1 amperes measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseOutputMinCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMinCurrent.setDescription("The minimum output current in 0.1 amperes measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseOutputLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputLoad.setDescription("The output load in VA, or -1 if it's unsupported\nby this UPS.")
+upsPhaseOutputMaxLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMaxLoad.setDescription("The maximum output load in VA measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseOutputMinLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMinLoad.setDescription("The minimum output load in VA measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseOutputPercentLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 10), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputPercentLoad.setDescription("The percentage of the UPS load capacity in VA at \nredundancy @ (n + x) presently being used on this \noutput phase, or -1 if it's unsupported by this UPS.")
+upsPhaseOutputMaxPercentLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMaxPercentLoad.setDescription("The maximum percentage of the UPS load capacity in \nVA measured at redundancy @ (n + x) presently \nbeing used on this output phase since the last reset\n(upsPhaseResetMaxMinValues), or -1 if it's unsupported\nby this UPS. Sampled every 30 seconds.")
+upsPhaseOutputMinPercentLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 12), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMinPercentLoad.setDescription("The minimum percentage of the UPS load capacity in \nVA measured at redundancy @ (n + x) presently \nbeing used on this output phase since the last reset\n(upsPhaseResetMaxMinValues), or -1 if it's unsupported\nby this UPS. Sampled every 30 seconds.")
+upsPhaseOutputPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 13), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputPower.setDescription("The output power in Watts, or -1 if it's\nunsupported by this UPS.")
+upsPhaseOutputMaxPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 14), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMaxPower.setDescription("The maximum output power in Watts measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseOutputMinPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 15), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMinPower.setDescription("The minimum output power in Watts measured\nsince the last reset (upsPhaseResetMaxMinValues), or\n-1 if it's unsupported by this UPS.\nSampled every 30 seconds.")
+upsPhaseOutputPercentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 16), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputPercentPower.setDescription("The percentage of the UPS power capacity in Watts at \nredundancy @ (n + x) presently being used on this \noutput phase, or -1 if it's unsupported by this UPS.")
+upsPhaseOutputMaxPercentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 17), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMaxPercentPower.setDescription("The maximum percentage of the UPS power capacity\nin Watts measured at redundancy @ (n + x) presently\nbeing used on this output phase since the last \nreset (upsPhaseResetMaxMinValues), or -1 if it's\nunsupported by this UPS. Sampled every 30 seconds.")
+upsPhaseOutputMinPercentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 18), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputMinPercentPower.setDescription("The maximum percentage of the UPS power capacity\nin Watts measured at redundancy @ (n + x) presently\nbeing used on this output phase since the last \nreset (upsPhaseResetMaxMinValues), or -1 if it's\nunsupported by this UPS. Sampled every 30 seconds.")
+upsPhaseOutputPowerFactor = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 9, 3, 3, 1, 19), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPhaseOutputPowerFactor.setDescription("The Output power factor of the UPS in hundredth.")
+upsSyncCtrlGroup = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10))
+upsSyncCtrlGroupConfig = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1))
+upsSCGMembershipGroupNumber = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 1), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsSCGMembershipGroupNumber.setDescription("The SCG Membership Group number (MGN) is a 16-bit number allowing \nup to 65534 separate groups that can be identified and distinguished\nper IP subnet. Zero and 65535 are not used. The MGN is used in all \ncommunication between members of the SCG and a Network Management Card\n(NMC) will listen and only respond to commands sent to it using its \nconfigured SCG ID.")
+upsSCGActiveMembershipStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("enabledSCG", 1), ("disabledSCG", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsSCGActiveMembershipStatus.setDescription("Membership in the configured SCG can be enabled and \ndisabled.  If an NMC is configured for an SCG, but \nhas its membership disabled, all synchronized control commands \nreceived will be ignored.")
+upsSCGPowerSynchronizationDelayTime = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 3), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsSCGPowerSynchronizationDelayTime.setDescription("The Power Synchronization Delay Time (PSD) setting is the maximum \nnumber of seconds an SCG Initiator will wait for all SCG members to \nrecover utility power before completing the reboot sequence of a\nreboot or sleep command. If all SCG members are ready to proceed, \nno additional delay is introduced.")
+upsSCGReturnBatteryCapacityOffset = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 4), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsSCGReturnBatteryCapacityOffset.setDescription("A reboot command uses the Initiator's Return battery Capacity (RBC) to control\nwhen the SCG completes this operation. In a Normal Control Operation (NCC) the \nUPS will only complete the reboot if RBC is reached.  Due to normal battery \ncharge rate variations it may be desirable for the Followers to complete the \nreboot if they are within some range of the Initiator's RBC when the Initiator \nis prepared (charged to RBC) to complete the reboot. The Return Battery \nCapacity Offset (RBCO) defines a percent battery capacity subtracted from an \nRBC above which a Follower's battery must be charged for it to complete a \nreboot.  For example, if the Initiator's RBC is 50% and the Initiator's RBCO is\n5% then a Follower's battery capacity is within range if it is greater or equal \nto 45% (50% - 5%) at the time when the Initiator tries to complete the reboot \ncommand.  The default RBCO is 10%. ")
+upsSCGMultiCastIP = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 1, 5), IpAddress()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsSCGMultiCastIP.setDescription("The MultiCast IP address of the SCG Group.")
+upsSyncCtrlGroupStatus = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2))
+upsSCGNumOfGroupMembers = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsSCGNumOfGroupMembers.setDescription("The number of active, communicating members in the Sync Control Group (SCG).\nThis variable indicates the number of rows in the SCG Status Table.")
+upsSCGStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2))
+if mibBuilder.loadTexts: upsSCGStatusTable.setDescription("A list of SCG status table entries.  The number of entries\nis given by the value of upsSCGNumOfGroupMembers.")
+upsSCGStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsSCGStatusTableIndex"))
+if mibBuilder.loadTexts: upsSCGStatusEntry.setDescription("An entry containing information applicable to a\nparticular SCG Member.")
+upsSCGStatusTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsSCGStatusTableIndex.setDescription("The index of a status entry for an active, communicating SCG member.")
+upsSCGMemberIP = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 2), IpAddress()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsSCGMemberIP.setDescription("The IP address of an active, communicating SCG Member.")
+upsSCGACInputStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("acInGood", 1), ("acInBad", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsSCGACInputStatus.setDescription("This OID indicates the AC Input Status of the SCG Member.\nacInGood(1) indicates the AC Input is within tolerance.\nacInBad(2)  indicates the AC Input is not within tolerance.")
+upsSCGACOutputStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 10, 2, 2, 1, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("acOutOn", 1), ("acOutOff", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsSCGACOutputStatus.setDescription("This OID indicates the AC Output Status of the SCG Member.\nacOutOn(1)  indicates the UPS output is providing power to the load.\nacOutOff(2) indicates the UPS output is not providing power to the load. ")
+upsState = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11))
+upsBasicState = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 1))
+upsBasicStateOutputState = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 1, 1), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBasicStateOutputState.setDescription("An ASCII string containing the 64 flags representing\nthe current state(s) of the UPS. If the Network Card\nis unable to determine the state of the UPS, this\nvariable is set to 'UNKNOWN'.\n\nThe flags are numbered 1 to 64, read from left to\nright. The flags are defined as follows:\n\nFlag  1: Abnormal Condition Present\nFlag  2: On Battery\nFlag  3: Low Battery\nFlag  4: On Line    \n                    \nFlag  5: Replace Battery\nFlag  6: Serial Communication Established\nFlag  7: AVR Boost Active\nFlag  8: AVR Trim Active \n                         \nFlag  9: Overload\nFlag 10: Runtime Calibration \nFlag 11: Batteries Discharged\nFlag 12: Manual Bypass\n                             \nFlag 13: Software Bypass\nFlag 14: In Bypass due to Internal Fault\nFlag 15: In Bypass due to Supply Failure\nFlag 16: In Bypass due to Fan Failure   \n                                        \nFlag 17: Sleeping on a Timer            \nFlag 18: Sleeping until Utility Power Returns\nFlag 19: On\nFlag 20: Rebooting\n                  \nFlag 21: Battery Communication Lost \nFlag 22: Graceful Shutdown Initiated\nFlag 23: Smart Boost or Smart Trim Fault\nFlag 24: Bad Output Voltage\n\nFlag 25: Battery Charger Failure\nFlag 26: High Battery Temperature    \nFlag 27: Warning Battery Temperature \nFlag 28: Critical Battery Temperature\n\nFlag 29: Self Test In Progress   \nFlag 30: Low Battery / On Battery\nFlag 31: Graceful Shutdown Issued by Upstream Device\nFlag 32: Graceful Shutdown Issued by Downstream Device\n\nFlag 33: No Batteries Attached\nFlag 34: Synchronized Command is in Progress\nFlag 35: Synchronized Sleeping Command is in Progress  \nFlag 36: Synchronized Rebooting Command is in Progress \n\nFlag 37: Inverter DC Imbalance \nFlag 38: Transfer Relay Failure\nFlag 39: Shutdown or Unable to Transfer\nFlag 40: Low Battery Shutdown\n\nFlag 41: Electronic Unit Fan Failure\nFlag 42: Main Relay Failure\nFlag 43: Bypass Relay Failure\nFlag 44: Temporary Bypass\n\nFlag 45: High Internal Temperature\nFlag 46: Battery Temperature Sensor Fault\nFlag 47: Input Out of Range for Bypass\nFlag 48: DC Bus Overvoltage\n\nFlag 49: PFC Failure\nFlag 50: Critical Hardware Fault\nFlag 51: Green Mode/ECO Mode\nFlag 52: Hot Standby\n       \nFlag 53: Emergency Power Off (EPO) Activated\nFlag 54: Load Alarm Violation\nFlag 55: Bypass Phase Fault\nFlag 56: UPS Internal Communication Failure    \n\nFlag 57: Efficiency Booster Mode\nFlag 58: Off\nFlag 59: Standby\nFlag 60: <Not Used>\n\nFlag 61: <Not Used>\nFlag 62: <Not Used>\nFlag 63: <Not Used>\nFlag 64: <Not Used>")
+upsAdvState = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2))
+upsAdvStateAbnormalConditions = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 1), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateAbnormalConditions.setDescription("An ASCII string containing the 32 flags representing\nthe current active UPS faults. If the Network Card\nis unable to determine the values of the flags, this\nvariable is set to 'UNKNOWN'. If this variable is not\nsupported by the connected UPS, this variable is set to\n'NOT SUPPORTED'.\n\nThe flags are numbered from 1 to 32, and read from left to\nright. The flags are defined as follows:\n\nFlag  1: Power Module Failure\nFlag  2: Main Intelligence Module Failure\nFlag  3: Redundant Intelligence Module Failure\nFlag  4: Battery Failure\n \nFlag  5: Load(kVA) Alarm Threshold Violation\nFlag  6: Redundancy Lost\nFlag  7: Redundancy Below Alarm Threshold\nFlag  8: Bypass not in Range; Either Frequency or Voltage\n\nFlag  9: Bypass Contactor Stuck in Bypass Condition\nFlag 10: Bypass Contactor Stuck in On-Line Condition\nFlag 11: In Bypass due to an Internal Fault\nFlag 12: In Bypass due to an Overload\n\nFlag 13: In Maintenance Bypass\nFlag 14: Input Circuit Braker Tripped Open\nFlag 15: System Level Fan Failure\nFlag 16: Redundant Intelligent Module in Control\n\nFlag 17: IIC Inter-Module Communication Failure\nFlag 18: No Working Power Modules\nFlag 19: Load Shutdown From Bypass; Input Frequency\nFlag 20: Runtime Below Alarm Threshold\n\nFlag 21: Extended Run Frame Fault\nFlag 22: Output Voltage out of Range\nFlag 23: UPS Not Synchronized\nFlag 24: No Batteries Installed\n\nFlag 25: Battery Voltage High\nFlag 26: UPS Specific Fault Detected\nFlag 27: Site Wiring Fault\nFlag 28: Backfeed Protection Relay Opened\n\nFlag 29: <Not Used>\nFlag 30: <Not Used>\nFlag 31: <Not Used>\nFlag 32: <Not Used>")
+upsAdvStateSymmetra3PhaseSpecificFaults = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateSymmetra3PhaseSpecificFaults.setDescription("An ASCII string containing the 64 flags representing\nthe current active UPS specific faults for the Symmetra\n3-Phase UPS models. If the Network Card is unable to\ndetermine the values of the flags, this variable is set\nto 'UNKNOWN'. If the connected UPS does not use this\nvariable, it is set to 'NOT SUPPORTED'.\n\nThe flags are numbered from 1 to 64, and read from left\nto right. The bits are defined as follows:\n\nFlag  1: External Switch Gear Failure\nFlag  2: External Transformer Over Temperature\nFlag  3: External DC Circuit Breaker Tripped\nFlag  4: System Power Supply Failure\n  \nFlag  5: Battery Monitor Card Failure\nFlag  6: Battery Monitor Card Removed\nFlag  7: XR Communication Card Failure\nFlag  8: XR Communication Card Removed\n\nFlag  9: External Switch Gear Monitoring Card Failure\nFlag 10: External Switch Gear Monitoring Card Removed\nFlag 11: Internal DC Circuit Breaker Tripped\nFlag 12: Static Bypass Switch Failure\n\nFlag 13: System EEPROM Removed\nFlag 14: System EEPROM Failure\nFlag 15: UPS in Forced Bypass\nFlag 16: Static Bypass Switch Module Removed\n\nFlag 17: System Start-Up Configuration Fault\nFlag 18: Battery Charger Shutdown Externally\nFlag 19: <Not Used>\nFlag 20: <Not Used>\n\nFlag 21: <Not Used>\nFlag 22: <Not Used>\nFlag 23: <Not Used>\nFlag 24: <Not Used>\n\nFlag 25: <Not Used>\nFlag 26: <Not Used>\nFlag 27: <Not Used>\nFlag 28: <Not Used>\n\nFlag 29: <Not Used>\nFlag 30: <Not Used>\nFlag 31: <Not Used>\nFlag 32: <Not Used>\n\nFlag 33: <Not Used>\nFlag 34: <Not Used>\nFlag 35: <Not Used>\nFlag 36: <Not Used>\n\nFlag 37: <Not Used>\nFlag 38: <Not Used>\nFlag 39: <Not Used>\nFlag 40: <Not Used>\n\nFlag 41: <Not Used>\nFlag 42: <Not Used>\nFlag 43: <Not Used>\nFlag 44: <Not Used>\n\nFlag 45: <Not Used>\nFlag 46: <Not Used>\nFlag 47: <Not Used>\nFlag 48: <Not Used>\n\nFlag 49: <Not Used>\nFlag 50: <Not Used>\nFlag 51: <Not Used>\nFlag 52: <Not Used>\n\nFlag 53: <Not Used>\nFlag 54: <Not Used>\nFlag 55: <Not Used>\nFlag 56: <Not Used>\n\nFlag 57: <Not Used>\nFlag 58: <Not Used>\nFlag 59: <Not Used>\nFlag 60: <Not Used>\n\nFlag 61: <Not Used>\nFlag 62: <Not Used>\nFlag 63: <Not Used>\nFlag 64: <Not Used>")
+upsAdvStateDP300ESpecificFaults = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateDP300ESpecificFaults.setDescription("An ASCII string containing the 64 flags representing\nthe current active UPS specific faults for the Silcon\nDP300E UPS models. If the Network Card is unable to\ndetermine the values of the flags, this variable is set\nto 'UNKNOWN'. If the connected UPS does not use this\nvariable, it is set to 'NOT SUPPORTED'.\n\nThe flags are numbered from 1 to 64, and read from left\nto right. The bits are defined as follows:\n\nFlag  1: Peak Current Limiter Active\nFlag  2: Bypass Power Supply Fault\nFlag  3: Delta Current Limiter Active\nFlag  4: Fan Fault\n  \nFlag  5: High DC warning\nFlag  6: Inverter Voltage Error\nFlag  7: Parallel Synchronization Error\nFlag  8: Second Power Supply Fault\n\nFlag  9: Internal Power Supply Fault\nFlag 10: <Not Used>\nFlag 11: <Not Used>\nFlag 12: <Not Used>\n\nFlag 13: <Not Used>\nFlag 14: Bypass Static Switch High Temperature\nFlag 15: High Battery Temperature\nFlag 16: Battery Weak\n\nFlag 17: <Not Used>\nFlag 18: System Locked in Operation Mode\nFlag 19: RAM1 Memory Write Error\nFlag 20: Memory Write Error\n\nFlag 21: Communication to VQ Bypass Lost\nFlag 22: Communication to VQ Output Lost\nFlag 23: Communication to DMU Lost\nFlag 24: Communication to Controller Lost\n\nFlag 25: Communication to Parallel IF Lost\nFlag 26: External Shutdown Accepted\nFlag 27: DC Capacitor Charge Error\nFlag 28: Communication to VQ Mains Lost\n\nFlag 29: Bypass Synchronization Error\nFlag 30: Charge Error\nFlag 31: SII Aux Input Activiated\nFlag 32: <Not Used>\n\nFlag 33: Blown Inverter Fuse\nFlag 34: Blown Rectifier Fuse\nFlag 35: Auxilliary 1 Fault\nFlag 36: <Not Used>\n\nFlag 37: <Not Used>\nFlag 38: <Not Used>\nFlag 39: <Not Used>\nFlag 40: <Not Used>\n\nFlag 41: <Not Used>\nFlag 42: <Not Used>\nFlag 43: <Not Used>\nFlag 44: <Not Used>\n\nFlag 45: <Not Used>\nFlag 46: High Temperature Charger Magnetic\nFlag 47: <Not Used>\nFlag 48: Battery Monitor Warning\n\nFlag 49: Battery Monitor Alarm\nFlag 50: <Not Used>\nFlag 51: <Not Used>\nFlag 52: <Not Used>\n\nFlag 53: TSM 1/2/3 Temperature Shutdown\nFlag 54: Charger 0/30 Temperature Warning\nFlag 55: Charger 0/30 Temperature Shutdown\nFlag 56: High Output Voltage\n\nFlag 57: SSW Temperature Over 90\nFlag 58: <Not Used>\nFlag 59: Low Current Failure In AC Capacitors\nFlag 60: <Not Used>\n\nFlag 61: Advanced Battery Management Not Installed\nFlag 62: <Not Used>\nFlag 63: <Not Used>\nFlag 64: <Not Used>")
+upsAdvStateSymmetraSpecificFaults = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateSymmetraSpecificFaults.setDescription("An ASCII string containing the 64 flags representing\nthe current active UPS specific faults for the Symmetra\nUPS models. If the Network Card is unable to determine\nthe values of the flags, this variable is set to 'UNKNOWN'.\nIf the connected UPS does not use this variable, it is\nset to 'NOT SUPPORTED'.\n\nThe flags are numbered from 1 to 64, and read from left\nto right. The bits are defined as follows:\n\nFlag  1: System Fault\nFlag  2: Bypass Relay Fault\nFlag  3: Power Module Turn Off Failure\nFlag  4: Frame Identification Fault\n  \nFlag  5: <Not Used>\nFlag  6: <Not Used>\nFlag  7: <Not Used>\nFlag  8: <Not Used>\n\nFlag  9: <Not Used>\nFlag 10: <Not Used>\nFlag 11: <Not Used>\nFlag 12: <Not Used>\n\nFlag 13: <Not Used>\nFlag 14: <Not Used>\nFlag 15: <Not Used>\nFlag 16: <Not Used>\n\nFlag 17: <Not Used>\nFlag 18: <Not Used>\nFlag 19: <Not Used>\nFlag 20: <Not Used>\n\nFlag 21: <Not Used>\nFlag 22: <Not Used>\nFlag 23: <Not Used>\nFlag 24: <Not Used>\n\nFlag 25: <Not Used>\nFlag 26: <Not Used>\nFlag 27: <Not Used>\nFlag 28: <Not Used>\n\nFlag 29: <Not Used>\nFlag 30: <Not Used>\nFlag 31: <Not Used>\nFlag 32: <Not Used>\n\nFlag 33: <Not Used>\nFlag 34: <Not Used>\nFlag 35: <Not Used>\nFlag 36: <Not Used>\n\nFlag 37: <Not Used>\nFlag 38: <Not Used>\nFlag 39: <Not Used>\nFlag 40: <Not Used>\n\nFlag 41: <Not Used>\nFlag 42: <Not Used>\nFlag 43: <Not Used>\nFlag 44: <Not Used>\n\nFlag 45: <Not Used>\nFlag 46: <Not Used>\nFlag 47: <Not Used>\nFlag 48: <Not Used>\n\nFlag 49: <Not Used>\nFlag 50: <Not Used>\nFlag 51: <Not Used>\nFlag 52: <Not Used>\n\nFlag 53: <Not Used>\nFlag 54: <Not Used>\nFlag 55: <Not Used>\nFlag 56: <Not Used>\n\nFlag 57: <Not Used>\nFlag 58: <Not Used>\nFlag 59: <Not Used>\nFlag 60: <Not Used>\n\nFlag 61: <Not Used>\nFlag 62: <Not Used>\nFlag 63: <Not Used>\nFlag 64: <Not Used>")
+upsAdvStateSmartUPSSpecificFaults = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateSmartUPSSpecificFaults.setDescription("An ASCII string containing the 64 flags representing\nthe current active UPS specific faults for the Smart-UPS \nUPS models. If the Network Card is unable to determine\nthe values of the flags, this variable is set to\n'UNKNOWN'. If the connected UPS does not use this\nvariable, it is set to 'NOT SUPPORTED'.\n\nThe flags are numbered from 1 to 64, and read from left\nto right. The bits are defined as follows:\n\nFlag  1: EPO Switch Activated\nFlag  2: Static Bypass Switch Fault\nFlag  3: System Configuration Fault\nFlag  4: Power Supply Unit Fault\n  \nFlag  5: Weak Battery\nFlag  6: High Battery Temperature\nFlag  7: Internal Mechanical Bypass\nFlag  8: Loss Of Parallel Redundancy\n\nFlag  9: Parallel Bus Communication Fault on Cable 1\nFlag 10: Parallel Bus Communication Fault on Cable 2\nFlag 11: Auxiliary Bus Communication Fault\nFlag 12: Parallel Bus Termination Fault on Cable 1\n\nFlag 13: Parallel Bus Termination Fault on Cable 2\nFlag 14: Auxiliary Bus Termination Fault\nFlag 15: No Master Present In The Parallel System\nFlag 16: Overload on a Parallel Unit\n\nFlag 17: Parallel Configuration Fault\nFlag 18: <Not Used>\nFlag 19: <Not Used>\nFlag 20: <Not Used>\n\nFlag 21: <Not Used>\nFlag 22: <Not Used>\nFlag 23: <Not Used>\nFlag 24: <Not Used>\n\nFlag 25: <Not Used>\nFlag 26: <Not Used>\nFlag 27: <Not Used>\nFlag 28: <Not Used>\n\nFlag 29: <Not Used>\nFlag 30: <Not Used>\nFlag 31: <Not Used>\nFlag 32: <Not Used>\n\nFlag 33: <Not Used>\nFlag 34: <Not Used>\nFlag 35: <Not Used>\nFlag 36: <Not Used>\n\nFlag 37: <Not Used>\nFlag 38: <Not Used>\nFlag 39: <Not Used>\nFlag 40: <Not Used>\n\nFlag 41: <Not Used>\nFlag 42: <Not Used>\nFlag 43: <Not Used>\nFlag 44: <Not Used>\n\nFlag 45: <Not Used>\nFlag 46: <Not Used>\nFlag 47: <Not Used>\nFlag 48: <Not Used>\n\nFlag 49: <Not Used>\nFlag 50: <Not Used>\nFlag 51: <Not Used>\nFlag 52: <Not Used>\n\nFlag 53: <Not Used>\nFlag 54: <Not Used>\nFlag 55: <Not Used>\nFlag 56: <Not Used>\n\nFlag 57: <Not Used>\nFlag 58: <Not Used>\nFlag 59: <Not Used>\nFlag 60: <Not Used>\n\nFlag 61: <Not Used>\nFlag 62: <Not Used>\nFlag 63: <Not Used>\nFlag 64: <Not Used>")
+upsAdvStateSystemMessages = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateSystemMessages.setDescription("An ASCII string containing the 3 digit Decimal code\nrepresenting the current active message from the\nSystem Message Register. Each code should remain active\nfor a minimum of 15 seconds. However, in the worst case\nscenario, a code could be cleared after only 5 seconds.\nIt is recommended that this object be polled at least\nonce every 4 seconds in order to get the most accurate\nrepresentation of the current UPS System Message. If the\nNetwork Card is unable to determine the value of the\nSystem Message Register, this variable is set to\n'UNKNOWN'.")
+upsAdvStateTotaltimeonbattery = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateTotaltimeonbattery.setDescription("Total time the UPS has been in battery operation.")
+upsAdvStateTotaltimeonbypass = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 8), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateTotaltimeonbypass.setDescription("Total time the UPS has been in bypass operation.")
+upsAdvStateTotaltimeonNormal = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 9), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateTotaltimeonNormal.setDescription("Total time the UPS has been in normal operation.")
+upsAdvStateNumberoftimesonbattery = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 10), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateNumberoftimesonbattery.setDescription("Number of times the UPS was on battery.\nSince the last reset of statistical data.")
+upsAdvStateNumberoftimesbypass = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateNumberoftimesbypass.setDescription("Number of times the UPS was in bypass.\nSince the last reset of statistical data.")
+upsAdvStateNumberoftimesNormal = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 12), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateNumberoftimesNormal.setDescription("Number of times the UPS was in normal operation.\nSince the last reset of statistical data.")
+upsAdvStateEcomode = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 11, 2, 13), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("upsOnEcoMode", 1), ("upsNotOnEcoMode", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsAdvStateEcomode.setDescription("Eco mode status.\n1: UPS is on Eco-mode\n2: UPS is not on Eco-mode.")
+upsOutletGroups = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12))
+upsOutletGroupStatus = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1))
+upsOutletGroupStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupStatusTableSize.setDescription("The number of outlet groups for the UPS.")
+upsOutletGroupStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2))
+if mibBuilder.loadTexts: upsOutletGroupStatusTable.setDescription("Allows for getting status of the outlet groups. The number of\nentries is contained in the upsOutletGroupStatusTableSize OID.")
+upsOutletGroupStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsOutletGroupStatusIndex"))
+if mibBuilder.loadTexts: upsOutletGroupStatusEntry.setDescription("The outlet group status to get.")
+upsOutletGroupStatusIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupStatusIndex.setDescription("The index to the outlet group entry.")
+upsOutletGroupStatusName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupStatusName.setDescription("The name of the outlet group. This OID is provided\nfor informational purposes only. This value is set\nby the upsOutletGroupConfigName OID.")
+upsOutletGroupStatusGroupState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(2,3,1,)).subtype(namedValues=NamedValues(("upsOutletGroupStatusOn", 1), ("upsOutletGroupStatusOff", 2), ("upsOutletGroupStatusUnknown", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupStatusGroupState.setDescription("Getting this variable will return the outlet group state. If the outlet\ngroup is on, the upsOutletGroupStatusOn (1) value will be returned. If\nthe outlet group is off, the upsOutletGroupStatusOff (2) value will be\nreturned. If the state of the outlet group cannot be determined, the\nupsOutletGroupStatusUnknown (3) value will be returned.")
+upsOutletGroupStatusCommandPending = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("upsOutletGroupCommandPending", 1), ("upsOutletGroupNoCommandPending", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupStatusCommandPending.setDescription("Getting this variable will return the command pending\nstate of the outlet group. If a command is pending on the \noutlet group, the upsOutletGroupCommandPending (1) value\nwill be returned. If there is not a command pending\non the outlet group, the upsOutletGroupNoCommandPending (2)\nwill be returned.")
+upsOutletGroupStatusOutletType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 1, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("upsSwitchedOutletGroup", 1), ("upsMainOutletGroup", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupStatusOutletType.setDescription("Getting this variable will return the type of outlet group.\nIf present in the system, the main outlet group is\n'unswitched' and must be on in order for any of the switched\noutlet groups to be on. Conversely, if the main outlet group\nis off, all the switched outlet groups must also be off.\nTherefore, any commands made to the main outlet group that\nturn it off will also be applied to all switched outlet\ngroups that are on, unless the state of a switched outlet\ngroup prevents it, in which case the command will fail.")
+upsOutletGroupConfig = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2))
+upsOutletGroupConfigTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupConfigTableSize.setDescription("The number of outlet groups for the UPS.")
+upsOutletGroupConfigTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2))
+if mibBuilder.loadTexts: upsOutletGroupConfigTable.setDescription("The list of outlet groups to configure. The number of entries\nis defined by the upsOutletGroupConfigTableSize OID.")
+upsOutletGroupConfigEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsOutletGroupConfigIndex"))
+if mibBuilder.loadTexts: upsOutletGroupConfigEntry.setDescription("The outlet groups to configure.")
+upsOutletGroupConfigIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupConfigIndex.setDescription("The index to the outlet group entry.")
+upsOutletGroupConfigName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 2), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigName.setDescription("The name of the outlet group.")
+upsOutletGroupConfigPowerOnDelay = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 3), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigPowerOnDelay.setDescription("The amount of time (seconds) the outlet group will delay\npowering on when the delayed on, reboot, or shutdown command is\napplied. Allowed values vary by UPS model. The value of -1 is\nused for Never if supported by the UPS and the outlet group.")
+upsOutletGroupConfigPowerOffDelay = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 4), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigPowerOffDelay.setDescription("The amount of time (seconds) the outlet group will delay\npowering off when the delayed off, reboot, or shutdown command is\napplied. Allowed values vary by UPS model. The value of -1 is\nused for Never if supported by the UPS and the outlet group.")
+upsOutletGroupConfigRebootDuration = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 5), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigRebootDuration.setDescription("During a reboot sequence, power is turned off and then \nback on. This OID defines the amount of time to wait \n(seconds) after turning the power off, at the start\nof the sequence, before initiating the power on sequence.\nAllowed values vary by UPS model.")
+upsOutletGroupConfigMinReturnRuntime = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 6), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigMinReturnRuntime.setDescription("In an Outlet Group shutdown sequence, the Outlet Group cycles\npower off then on. This OID defines the minimum amount of UPS\nruntime (seconds) that is required in order to power the\nOutlet Group on. Allowed values vary by UPS model.")
+upsOutletGroupConfigOutletType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("upsSwitchedOutletGroup", 1), ("upsMainOutletGroup", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupConfigOutletType.setDescription("Getting this variable will return the type of outlet group.\nIf present in the system, the main outlet group is\n'unswitched' and must be on in order for any of the switched\noutlet groups to be on. Conversely, if the main outlet group\nis off, all the switched outlet groups must also be off.\nTherefore, any commands made to the main outlet group that\nturn it off will also be applied to all switched outlet\ngroups that are on, unless the state of a switched outlet\ngroup prevents it, in which case the command will fail.")
+upsOutletGroupConfigLoadShedControlSkipOffDelay = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("upsOutletGroupConfigSkipOffDelay", 1), ("upsOutletGroupConfigUseOffDelay", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigLoadShedControlSkipOffDelay.setDescription("Configures whether the outlet group's off delay setting\n(upsOutletGroupConfigPowerOffDelay) will be used in a load\nshedding situation, where applicable.")
+upsOutletGroupConfigLoadShedControlAutoRestart = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 9), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("upsOutletGroupConfigAutoRestart", 1), ("upsOutletGroupConfigManualRestart", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigLoadShedControlAutoRestart.setDescription("Configures whether the outlet group will automatically restart\nafter a load shedding situation, where applicable.")
+upsOutletGroupConfigLoadShedControlTimeOnBattery = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 10), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("upsOutletGroupConfigDisableTimeOnBatteryLoadShed", 1), ("upsOutletGroupConfigEnableTimeOnBatteryLoadShed", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigLoadShedControlTimeOnBattery.setDescription("Configures whether the outlet group will load shed (turn off)\nafter the UPS's time on battery has exceeded the\nupsOutletGroupConfigLoadShedTimeOnBattery OID setting. The\nsettings for upsOutletGroupConfigLoadShedControlSkipOffDelay\nand upsOutletGroupConfigLoadShedControlAutoRestart are valid\nfor this load shed condition.")
+upsOutletGroupConfigLoadShedControlRuntimeRemaining = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 11), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("upsOutletGroupConfigDisableRuntimeRemainingLoadShed", 1), ("upsOutletGroupConfigEnableRuntimeRemainingLoadShed", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigLoadShedControlRuntimeRemaining.setDescription("Configures whether the outlet group will load shed (turn off)\nwhen the UPS is on battery and the remaining runtime is less\nthan the upsOutletGroupConfigLoadShedRuntimeRemaining OID\nsetting. The settings for\nupsOutletGroupConfigLoadShedControlSkipOffDelay and\nupsOutletGroupConfigLoadShedControlAutoRestart are valid for\nthis load shed condition.")
+upsOutletGroupConfigLoadShedControlInOverload = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 12), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("upsOutletGroupConfigDisableInOverloadLoadShed", 1), ("upsOutletGroupConfigEnableInOverloadLoadShed", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigLoadShedControlInOverload.setDescription("Configures whether the outlet group will load shed (turn off)\nwhen the UPS is in an overload condition. The setting for\nupsOutletGroupConfigLoadShedControlSkipOffDelay is valid for\nthis load shed condition. Returns -1 if not supported by this\noutlet group.")
+upsOutletGroupConfigLoadShedTimeOnBattery = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 13), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigLoadShedTimeOnBattery.setDescription("When the UPS has been on battery for more time than this\nvalue, the outlet group will turn off if this condition is\nenabled by the upsOutletGroupConfigLoadShedControlTimeOnBattery\nOID. Allowed values vary by UPS model.")
+upsOutletGroupConfigLoadShedRuntimeRemaining = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 2, 2, 1, 14), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupConfigLoadShedRuntimeRemaining.setDescription("When the runtime remaining is less than this value, the outlet\ngroup will turn off if this condition is enabled by the\nupsOutletGroupConfigLoadShedControlRuntimeRemaining OID.\nAllowed values vary by UPS model.")
+upsOutletGroupControl = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3))
+upsOutletGroupControlTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupControlTableSize.setDescription("The number of outlet groups for the UPS.")
+upsOutletGroupControlTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2))
+if mibBuilder.loadTexts: upsOutletGroupControlTable.setDescription("Allows for control of individual outlet groups. The number of\nentries is contained in the upsOutletGroupControlTableSize OID.")
+upsOutletGroupControlEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsOutletGroupControlIndex"))
+if mibBuilder.loadTexts: upsOutletGroupControlEntry.setDescription("The outlet group to control.")
+upsOutletGroupControlIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupControlIndex.setDescription("The index to the outlet group entry.")
+upsOutletGroupControlName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupControlName.setDescription("The name of the outlet group. This OID is provided\nfor informational purposes only. This value is set\nby the upsOutletGroupConfigName OID.")
+upsOutletGroupControlCommand = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(9,1,7,5,8,2,6,3,10,4,)).subtype(namedValues=NamedValues(("upsOutletGroupImmediateOn", 1), ("upsOutletGroupDelayedRebootShutdown", 10), ("upsOutletGroupImmediateOff", 2), ("upsOutletGroupImmediateRebootWithOrWithoutAC", 3), ("upsOutletGroupDelayedOn", 4), ("upsOutletGroupDelayedOff", 5), ("upsOutletGroupDelayedRebootWithOrWithoutAC", 6), ("upsOutletGroupCancelPendingCommand", 7), ("upsOutletGroupControlUnknown", 8), ("upsOutletGroupImmediateRebootShutdown", 9), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsOutletGroupControlCommand.setDescription("Getting this variable will return the outlet group state. If the outlet\ngroup is on, the upsOutletGroupImmediateOn (1) value will be returned. If\nthe outlet group is off, the upsOutletGroupImmediateOff (2) value will be\nreturned.\n\nIf the state of the outlet group cannot be determined, the\nupsOutletGroupControlUnknown (8) value will be returned.\n\nSetting this variable to upsOutletGroupImmediateOn (1) will turn the\noutlet group on immediately.\n\nSetting this variable to upsOutletGroupImmediateOff (2) will turn the\noutlet group off immediately.\n\nSetting this variable to upsOutletGroupImmediateRebootWithOrWithoutAC (3)\nwill turn the outlet group off immediately, wait the\nupsOutletGroupConfigRebootDuration OID time, wait the\nupsOutletGroupConfigPowerOnDelay OID, and then turn the outlet group on\nregardless of the AC input power on the UPS.\n\nSetting this variable to upsOutletGroupDelayedOn (4) will turn the outlet\ngroup on after the upsOutletGroupConfigPowerOnDelay OID has elapsed.\n\nSetting this variable to upsOutletGroupDelayedOff (5) will turn the outlet\ngroup off after the upsOutletGroupConfigPowerOffDelay OID has elapsed.\n\nSetting this variable to upsOutletGroupDelayedRebootWithOrWithoutAC (6)\nwill turn the outlet group off after the upsOutletGroupConfigPowerOffDelay\nOID has elapsed, wait the upsOutletGroupConfigRebootDuration OID time, wait\nthe upsOutletGroupConfigPowerOnDelay OID, and then turn the outlet group\non regardless of the AC input power on the UPS.\n\nSetting this variable to upsOutletGroupCancelPendingCommand (7) will\ncause any pending command to this outlet group to be canceled.\n\nSetting this variable to upsOutletGroupImmediateRebootShutdown (9) will\nturn the outlet group off immediately, wait for the AC power to return to normal\n(a minimum of the upsOutletGroupConfigRebootDuration OID time), wait the\nupsOutletGroupConfigPowerOnDelay OID time, and then turn the outlet\ngroup on.\n\nSetting this variable to upsOutletGroupDelayedRebootShutdown (10) will\nturn the outlet group off after the upsOutletGroupConfigPowerOffDelay OID\nhas elapsed, wait for the AC power to return to normal (a minimum of the\nupsOutletGroupConfigRebootDuration OID time), wait the\nupsOutletGroupConfigPowerOnDelay OID time, and then turn the outlet\ngroup on.\n\nIn systems with a main outlet group, commands to the main outlet group must\nbe performed with caution. It may be clearer to use the ups control commands\navailable from upsAdvControl... OIDs. If any command is made to the main\noutlet group that will turn it off, one of two things will happen:\n1) If any switched outlet group is in a state that prevents this command\nfrom occurring on the main outlet group, the command will be rejected. Note\nthat a switched outlet group being on without a command in progress is not a\nstate that normally prevents the command.\n2) The command will be accepted and applied to the main outlet group and all\nswitched outlet groups that are on.\n\nThere is one additional special case for systems with a main outlet group.\nIf the main outlet group is off and a switched outlet group is commanded to\nturn on, the on command will be applied to both the main outlet group and\nthat switched outlet group.")
+upsOutletGroupControlOutletType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 12, 3, 2, 1, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("upsSwitchedOutletGroup", 1), ("upsMainOutletGroup", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsOutletGroupControlOutletType.setDescription("Getting this variable will return the type of outlet group.\nIf present in the system, the main outlet group is\n'unswitched' and must be on in order for any of the switched\noutlet groups to be on. Conversely, if the main outlet group\nis off, all the switched outlet groups must also be off.\nTherefore, any commands made to the main outlet group that\nturn it off will also be applied to all switched outlet\ngroups that are on, unless the state of a switched outlet\ngroup prevents it, in which case the command will fail.")
+upsDiagnostics = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13))
+upsDiagnosticIM = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1))
+upsDiagIMTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMTableSize.setDescription("The number of Intelligence Modules in or attached to the UPS.")
+upsDiagIMTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2))
+if mibBuilder.loadTexts: upsDiagIMTable.setDescription("Allows for diagnostics of individual Intelligence Modules. The number of\nentries is contained in the upsDiagIMTableSize OID.")
+upsDiagIMEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagIMIndex"))
+if mibBuilder.loadTexts: upsDiagIMEntry.setDescription("The diagnostics and information of an Intelligence Module.")
+upsDiagIMIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMIndex.setDescription("The index to the Intelligence Module entry.")
+upsDiagIMType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("imUnknown", 1), ("imMIM", 2), ("imRIM", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMType.setDescription("The type of the Intelligence Module.\nimUnknown(1) indicates the IM type is unknown.\nimMIM(2) indicates the IM type is a Main Intelligence Module.\nimRIM(3) indicates the IM type is Redundant Intelligence Module.")
+upsDiagIMStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMStatus.setDescription("The status of the Intelligence Module.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagIMFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMFirmwareRev.setDescription("The firmware revision of the Intelligence Module.")
+upsDiagIMSlaveFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMSlaveFirmwareRev.setDescription("The slave firmware revision of the Intelligence Module.")
+upsDiagIMHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMHardwareRev.setDescription("The hardware revision of the Intelligence Module.")
+upsDiagIMSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMSerialNum.setDescription("The serial number of the Intelligence Module.")
+upsDiagIMManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 1, 2, 1, 8), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagIMManufactureDate.setDescription("The manufacture date of the Intelligence Module.")
+upsDiagnosticPowerModules = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2))
+upsDiagPMTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMTableSize.setDescription("The maximum number of Power Modules supported by the UPS.")
+upsDiagPMTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2))
+if mibBuilder.loadTexts: upsDiagPMTable.setDescription("Allows for diagnostics of Individual Power modules. The number of\nentries is contained in the upsDiagPMTableSize OID.")
+upsDiagPMEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagPMIndex"))
+if mibBuilder.loadTexts: upsDiagPMEntry.setDescription("The diagnostics of an Power Module.")
+upsDiagPMIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMIndex.setDescription("The index to the Power Module entry.")
+upsDiagPMStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMStatus.setDescription("The status of the Power Module.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagPMFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMFirmwareRev.setDescription("The firmware revision of the Power Module.")
+upsDiagPMHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMHardwareRev.setDescription("The hardware revision of the Power Module.")
+upsDiagPMSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMSerialNum.setDescription("The serial number of the Power Module.")
+upsDiagPMManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 2, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMManufactureDate.setDescription("The manufacture date of the Power Module.")
+upsDiagPMLifetimeInfoTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3))
+if mibBuilder.loadTexts: upsDiagPMLifetimeInfoTable.setDescription("Allows for diagnostics of individual power module's lifetime information. \nThe number of entries is contained in the upsDiagPMTableSize OID.")
+upsDiagPMLifetimeInfoEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagPMLifetimeInfoIndex"))
+if mibBuilder.loadTexts: upsDiagPMLifetimeInfoEntry.setDescription("The diagnostics of a Power Module lifetime information.")
+upsDiagPMLifetimeInfoIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMLifetimeInfoIndex.setDescription("The index to the Power Module lifetime information entry.")
+upsDiagPMLifetimeStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(4,2,3,1,)).subtype(namedValues=NamedValues(("ok", 1), ("nearEnd", 2), ("exceeded", 3), ("unknown", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMLifetimeStatus.setDescription("The status of the Power Module lifetime information.\nok(1) indicates the device lifetime status is OK.\nnearEnd(2) indicates the device lifetime status is near end.\nexceeded(3) indicates the device lifetime status is exceeded.\nunknown(4) indicates the device lifetime status is unknown.")
+upsDiagPMEstmtdLifetimeRmng = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEstmtdLifetimeRmng.setDescription("Displays the time remaining for the module before it should be replaced.\nMeasured in months. This value is set when you originally install the module.")
+upsDiagPMEstmtdLifetimeRmngPct = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEstmtdLifetimeRmngPct.setDescription("Displays the percentage of the total lifetime remaining for the module \nbefore it should be replaced.")
+upsDiagPMFanLifetimeStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(4,2,3,1,)).subtype(namedValues=NamedValues(("ok", 1), ("nearEnd", 2), ("exceeded", 3), ("unknown", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMFanLifetimeStatus.setDescription("The status of the Power Module Fan lifetime information.\nok(1) indicates the device lifetime status is OK.\nnearEnd(2) indicates the device lifetime status is near end.\nexceeded(3) indicates the device lifetime status is exceeded.\nunknown(4) indicates the device lifetime status is unknown.")
+upsDiagPMFanEstmtdLifetimeRmng = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMFanEstmtdLifetimeRmng.setDescription("Displays the time remaining, measured in months, before the module's \nfan should be replaced. It is reset by the field service engineer when\na new fan is installed.")
+upsDiagPMFanEstmtdLifetimeRmngPct = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 3, 1, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMFanEstmtdLifetimeRmngPct.setDescription("Displays the percentage of the total lifetime remaining \nbefore the module's fan should be replaced.")
+upsDiagPMEnclDoorFltrTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEnclDoorFltrTableSize.setDescription("The maximum number of power module enclosures attached to the UPS.")
+upsDiagPMEnclDoorFltrTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5))
+if mibBuilder.loadTexts: upsDiagPMEnclDoorFltrTable.setDescription("Allows for the diagnostics of individual power module enclosure door filters.      \nThe number of entries is contained in the upsDiagPMEnclDoorFltrTableSize OID.")
+upsDiagPMEnclDoorFltrEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagPMEnclIndex"))
+if mibBuilder.loadTexts: upsDiagPMEnclDoorFltrEntry.setDescription("Power module door filter diagnostics info.")
+upsDiagPMEnclIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEnclIndex.setDescription("The index to the power module enclosure entry.\nEnclosure 0 indicates the Power enclosure 1. \nEnclosure 1 indicates the Power enclosure 2.")
+upsDiagPMEnclDoorFltrLifetime = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(2,4,3,1,)).subtype(namedValues=NamedValues(("heavyFiltration15days", 1), ("normalFiltration30days", 2), ("lightFiltration60days", 3), ("notPresent", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEnclDoorFltrLifetime.setDescription("Door filter replacement time interval, based on the installation enivironment.\nheavyFiltration15days (1) indicates door filter needs to be replaced within 15 days.\nnormalFiltration30days (2) indicates door filter needs to be replaced within 30 days.\nlightFiltration60days (3) indicates door filter needs to be replaced within 60 days.\nnotPresent(4) indicates that the door filter is not present.")
+upsDiagPMEnclDoorFltrStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(4,2,3,1,)).subtype(namedValues=NamedValues(("ok", 1), ("nearEnd", 2), ("exceeded", 3), ("unknown", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEnclDoorFltrStatus.setDescription("Indicates the current status of the door filter.\nok(1) indicates the device lifetime status is OK.\nnearEnd(2) indicates the device lifetime status is near end.\nexceeded(3) indicates the device lifetime status is exceeded.\nunknown(4) indicates the device lifetime status is unknown.")
+upsDiagPMEnclDoorFltrEstmtdLifetimeRmng = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEnclDoorFltrEstmtdLifetimeRmng.setDescription("Displays the time remaining, measured in days, before the module door filter should be replaced. \nThis value is set when you originally install the module.")
+upsDiagPMEnclDoorFltrEstmtdLifetimeRmngPct = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 2, 5, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagPMEnclDoorFltrEstmtdLifetimeRmngPct.setDescription("Displays the percentage of the total lifetime remaining for the module \ndoor filter before it should be replaced.")
+upsDiagnosticBatteries = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3))
+upsDiagBatteryTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryTableSize.setDescription("The maximum number of batteries supported by the UPS.")
+upsDiagBatteryTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2))
+if mibBuilder.loadTexts: upsDiagBatteryTable.setDescription("Allows for diagnostics of individual batteries. The number of\nentries is contained in the upsDiagBattTableSize OID.")
+upsDiagBatteryEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagBatteryIndex"))
+if mibBuilder.loadTexts: upsDiagBatteryEntry.setDescription("The diagnostics of a battery.")
+upsDiagBatteryFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryFrameIndex.setDescription("The index to the battery frame entry.\nFrame 0 indicates the Main frame. Extended Run (XR) frames\nstart from index 1.")
+upsDiagBatteryIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryIndex.setDescription("The index to the battery entry.")
+upsDiagBatteryStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(4,7,3,6,1,2,5,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("failed", 4), ("highTemperature", 5), ("replaceImmediately", 6), ("lowCapacity", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryStatus.setDescription("The status of the battery.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the battery status is OK.\nfailed(4) indicates the battery status is failed.\nhighTemperature(5) indicates the battery has a high temperature condition.\nreplaceImmediately(6) indicates the battery must be replaced immediately.\nlowCapacity(7) indicates the battery has a low capacity.")
+upsDiagBatterySerialNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatterySerialNumber.setDescription("The serial number of the battery.")
+upsDiagBatteryFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryFirmwareRev.setDescription("The firmware revision of the battery.")
+upsDiagBatteryManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryManufactureDate.setDescription("The manufacture date of the battery.")
+upsDiagBatteryType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryType.setDescription("The battery type or rating for the battery.")
+upsDiagBatteryFramePresent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(0,1,)).subtype(namedValues=NamedValues(("notPresent", 0), ("present", 1), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryFramePresent.setDescription("The battery frame/cabinet status.\n0 indicates frame/cabinet is not present.\n1 indicates frame/cabinet is present.")
+upsDiagBatteryFrameTemperature = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 3, 2, 1, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagBatteryFrameTemperature.setDescription("The battery frame/cabinet temperature in tenths of degrees celsius.\nIf the frame/cabinet is not present, this variable is set to (-1).")
+upsDiagnosticSubsystem = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4))
+upsDiagSubSysFrameTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysFrameTableSize.setDescription("The number of frames attached to the UPS including the Main frame.")
+upsDiagSubSysFrameTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2))
+if mibBuilder.loadTexts: upsDiagSubSysFrameTable.setDescription("Allows for diagnostics of individual XR Frames.")
+upsDiagSubSysFrameEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysFrameIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysFrameEntry.setDescription("The diagnostics of an XR Frame.")
+upsDiagSubSysFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysFrameType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,4,5,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("frameTypeMain", 3), ("frameTypeXR", 4), ("frameTypeLXR", 5), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysFrameType.setDescription("The type of Frame.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nframeTypeMain(3) indicates the frame type is the Main Frame.\nframeTypeXR(4) indicates the frame type is an XR Frame.\nframeTypeLXR(5) indicates the frame type is an LXR Frame.")
+upsDiagSubSysFrameFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysFrameFirmwareRev.setDescription("The firmware revision of the frame.")
+upsDiagSubSysFrameHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysFrameHardwareRev.setDescription("The hardware revision of the frame.")
+upsDiagSubSysFrameSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysFrameSerialNum.setDescription("The serial number of the frame.")
+upsDiagSubSysFrameManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 2, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysFrameManufactureDate.setDescription("The manufacture date of the frame.")
+upsDiagSubSysIntBypSwitchTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchTableSize.setDescription("The number of Internal Bypass switches attached to the UPS.")
+upsDiagSubSysIntBypSwitchTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4))
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchTable.setDescription("Allows for diagnostics of the Internal Bypass Switch.")
+upsDiagSubSysIntBypSwitchEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysIntBypSwitchIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchEntry.setDescription("The diagnostics of the Internal Bypass Switch.")
+upsDiagSubSysIntBypSwitchFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysIntBypSwitchIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchIndex.setDescription("The Internal Bypass Switch index entry.")
+upsDiagSubSysIntBypSwitchStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchStatus.setDescription("The Internal Bypass Switch status.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysIntBypSwitchFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchFirmwareRev.setDescription("The firmware revision of the Internal Bypass Switch.")
+upsDiagSubSysIntBypSwitchHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchHardwareRev.setDescription("The hardware revision of the Internal Bypass Switch.")
+upsDiagSubSysIntBypSwitchSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchSerialNum.setDescription("The serial number of the Internal Bypass Switch.")
+upsDiagSubSysIntBypSwitchManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 4, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysIntBypSwitchManufactureDate.setDescription("The manufacture date of the Internal Bypass Switch.")
+upsDiagSubSysBattMonitorTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorTableSize.setDescription("The number of Battery Monitor Boards attached to the UPS.")
+upsDiagSubSysBattMonitorTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6))
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorTable.setDescription("Allows for diagnostics of the Battery Monitor Board.")
+upsDiagSubSysBattMonitorEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysBattMonitorIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorEntry.setDescription("The diagnostics of the Battery Monitor Board.")
+upsDiagSubSysBattMonitorFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysBattMonitorIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorIndex.setDescription("The index of the Battery Monitor Board.")
+upsDiagSubSysBattMonitorStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorStatus.setDescription("The status of the Battery Monitor Board.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysBattMonitorFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorFirmwareRev.setDescription("The firmware revision of the Battery Monitor Board.")
+upsDiagSubSysBattMonitorHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorHardwareRev.setDescription("The hardware revision of the Battery Monitor Board.")
+upsDiagSubSysBattMonitorSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorSerialNum.setDescription("The serial number of the Battery Monitor Board.")
+upsDiagSubSysBattMonitorManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 6, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysBattMonitorManufactureDate.setDescription("The date of the manufacture for the Battery Monitor Board.")
+upsDiagSubSysExternalSwitchGearTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearTableSize.setDescription("The number of External Switch Gears attached to the UPS.")
+upsDiagSubSysExternalSwitchGearTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8))
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearTable.setDescription("Allows for diagnostics of the individual External Switch Gear.")
+upsDiagSubSysExternalSwitchGearEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysExternalSwitchGearIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearEntry.setDescription("The diagnostics of an individual External Switch Gear.")
+upsDiagSubSysExternalSwitchGearFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysExternalSwitchGearIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearIndex.setDescription("The index of the External Switch Gear.")
+upsDiagSubSysExternalSwitchGearStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearStatus.setDescription("The status of the External Switch Gear.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysExternalSwitchGearFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearFirmwareRev.setDescription("The firmware revision of the External Switch Gear monitor card.")
+upsDiagSubSysExternalSwitchGearHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearHardwareRev.setDescription("The hardware revision of the External Switch Gear monitor card.")
+upsDiagSubSysExternalSwitchGearSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearSerialNum.setDescription("The serial number of the External Switch Gear monitor card.")
+upsDiagSubSysExternalSwitchGearManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 8, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalSwitchGearManufactureDate.setDescription("The date of the manufacture for the External Switch Gear monitor card.")
+upsDiagSubSysDisplayInterfaceCardTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDisplayInterfaceCardTableSize.setDescription("The number of Display Interface Cards attached to the UPS.")
+upsDiagSubSysDisplayInterfaceCardTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10))
+if mibBuilder.loadTexts: upsDiagSubSysDisplayInterfaceCardTable.setDescription("Allows for diagnostics of individual Display Interface Cards.")
+upsDiagSubSysDisplayInterfaceCardEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysDisplayInterfaceCardIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysDisplayInterfaceCardEntry.setDescription("The diagnostics of a Display Interface Card.")
+upsDiagSubSysDisplayInterfaceCardFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDisplayInterfaceCardFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysDisplayInterfaceCardIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDisplayInterfaceCardIndex.setDescription("The index of the Display Interface Card.")
+upsDiagSubSysDisplayInterfaceCardStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 10, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDisplayInterfaceCardStatus.setDescription("The status of the Display Interface Card.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysDCCircuitBreakerTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDCCircuitBreakerTableSize.setDescription("The number of DC Circuit Breakers attached to the UPS.")
+upsDiagSubSysDCCircuitBreakerTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12))
+if mibBuilder.loadTexts: upsDiagSubSysDCCircuitBreakerTable.setDescription("Allows for diagnostics of individual DC Circuit Breakers.")
+upsDiagSubSysDCCircuitBreakerEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysDCCircuitBreakerIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysDCCircuitBreakerEntry.setDescription("The diagnostics of a DC Circuit Breaker.")
+upsDiagSubSysDCCircuitBreakerFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDCCircuitBreakerFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysDCCircuitBreakerIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDCCircuitBreakerIndex.setDescription("The index of the DC Circuit Breaker.")
+upsDiagSubSysDCCircuitBreakerStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 12, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("opened", 3), ("closed", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysDCCircuitBreakerStatus.setDescription("The status of the DC Circuit Breaker.\nunknown(1) indicates the circuit breaker status is unknown.\nnotInstalled(2) indicates the circuit breaker is not installed.\nopened(3) indicates the circuit breaker is opened.\nclosed(4) indicates the circuit breaker is closed.")
+upsDiagSubSysSystemPowerSupplyTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 13), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyTableSize.setDescription("The number of System Power Supplies attached to the UPS.")
+upsDiagSubSysSystemPowerSupplyTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14))
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyTable.setDescription("Allows for diagnostics of individual System Power Supplies.")
+upsDiagSubSysSystemPowerSupplyEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysSystemPowerSupplyIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyEntry.setDescription("The diagnostics of a System Power Supply.")
+upsDiagSubSysSystemPowerSupplyFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysSystemPowerSupplyIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyIndex.setDescription("The index of a System Power Supply.")
+upsDiagSubSysSystemPowerSupplyStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyStatus.setDescription("The status of the System Power Supply.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysSystemPowerSupplyFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyFirmwareRev.setDescription("The firmware revision of the System Power Supply monitor card.")
+upsDiagSubSysSystemPowerSupplyHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyHardwareRev.setDescription("The hardware revision of the System Power Supply monitor card.")
+upsDiagSubSysSystemPowerSupplySerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplySerialNum.setDescription("The serial number of the System Power Supply monitor card.")
+upsDiagSubSysSystemPowerSupplyManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 14, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysSystemPowerSupplyManufactureDate.setDescription("The date of the manufacture for the System Power Supply monitor card.")
+upsDiagSubSysXRCommunicationCardTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 15), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardTableSize.setDescription("The number of XR Communication Cards attached to the UPS.")
+upsDiagSubSysXRCommunicationCardTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16))
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardTable.setDescription("Allows for diagnostics of individual XR Communication Cards.")
+upsDiagSubSysXRCommunicationCardEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysXRCommunicationCardIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardEntry.setDescription("The diagnostics of an XR Communication Card.")
+upsDiagSubSysXRCommunicationCardFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysXRCommunicationCardIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardIndex.setDescription("The index of an XR Communication Card.")
+upsDiagSubSysXRCommunicationCardStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardStatus.setDescription("The status of the XR Communication Card.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysXRCommunicationCardFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardFirmwareRev.setDescription("The firmware revision of the XR Communication card.")
+upsDiagSubSysXRCommunicationCardSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 16, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysXRCommunicationCardSerialNum.setDescription("The serial number of the XR Communication card.")
+upsDiagSubSysExternalPowerFrameBoardTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 17), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalPowerFrameBoardTableSize.setDescription("The number of External Power Frame Boards attached to the UPS.")
+upsDiagSubSysExternalPowerFrameBoardTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18))
+if mibBuilder.loadTexts: upsDiagSubSysExternalPowerFrameBoardTable.setDescription("Allows for diagnostics of individual External Power Frame Boards.")
+upsDiagSubSysExternalPowerFrameBoardEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysExternalPowerFrameBoardIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysExternalPowerFrameBoardEntry.setDescription("The diagnostics of an External Power Frame Board.")
+upsDiagSubSysExternalPowerFrameBoardFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalPowerFrameBoardFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysExternalPowerFrameBoardIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalPowerFrameBoardIndex.setDescription("The index of an External Power Frame Board.")
+upsDiagSubSysExternalPowerFrameBoardStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 18, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysExternalPowerFrameBoardStatus.setDescription("The status of the External Power Frame Board.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysChargerTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 19), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysChargerTableSize.setDescription("The number of Chargers attached to the UPS.")
+upsDiagSubSysChargerTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20))
+if mibBuilder.loadTexts: upsDiagSubSysChargerTable.setDescription("Allows for diagnostics of individual chargers.")
+upsDiagSubSysChargerEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysChargerIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysChargerEntry.setDescription("The diagnostics of a charger.")
+upsDiagSubSysChargerFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysChargerFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysChargerIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysChargerIndex.setDescription("The index of a charger.")
+upsDiagSubSysChargerStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 20, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysChargerStatus.setDescription("The status of the Charger.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysInverterTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 21), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterTableSize.setDescription("The number of Inverters attached to the UPS.")
+upsDiagSubSysInverterTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22))
+if mibBuilder.loadTexts: upsDiagSubSysInverterTable.setDescription("Allows for diagnostics of individual Inverters.")
+upsDiagSubSysInverterEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysInverterIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysInverterEntry.setDescription("The diagnostics of an Inverter.")
+upsDiagSubSysInverterFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysInverterIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterIndex.setDescription("The index of an Inverter.")
+upsDiagSubSysInverterStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterStatus.setDescription("The status of the Inverter.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysInverterFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterFirmwareRev.setDescription("The firmware revision of the Inverter monitor.")
+upsDiagSubSysInverterHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterHardwareRev.setDescription("The hardware revision of the Inverter monitor.")
+upsDiagSubSysInverterSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterSerialNum.setDescription("The serial number of the Inverter monitor.")
+upsDiagSubSysInverterManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 22, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysInverterManufactureDate.setDescription("The date of manufacture for the Inverter monitor.")
+upsDiagSubSysPowerFactorCorrectionTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 23), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionTableSize.setDescription("The number of Power Factor Correction devices attached to the UPS.")
+upsDiagSubSysPowerFactorCorrectionTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24))
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionTable.setDescription("Allows for diagnostics of individual PowerFactorCorrections.")
+upsDiagSubSysPowerFactorCorrectionEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysPowerFactorCorrectionIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionEntry.setDescription("The diagnostics of a Power Factor Correction.")
+upsDiagSubSysPowerFactorCorrectionFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionFrameIndex.setDescription("The frame index entry.")
+upsDiagSubSysPowerFactorCorrectionIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionIndex.setDescription("The index of a Power Factor Correction.")
+upsDiagSubSysPowerFactorCorrectionStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,7,5,1,2,4,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("offOk", 3), ("onOk", 4), ("offFail", 5), ("onFail", 6), ("lostComm", 7), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionStatus.setDescription("The status of the Power Factor Correction.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\noffOk(3) indicates the device status is off and OK.\nonOk(4) indicates the device status is on and OK.\noffFail(5) indicates the device status is off and failed.\nonFail(6) indicates the device status is on and failed.\nlostComm(7) indicates the device has lost communication.")
+upsDiagSubSysPowerFactorCorrectionFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionFirmwareRev.setDescription("The firmware revision of the Power Factor Correction monitor.")
+upsDiagSubSysPowerFactorCorrectionHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionHardwareRev.setDescription("The hardware revision of the Power Factor Correction monitor.")
+upsDiagSubSysPowerFactorCorrectionSerialNum = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionSerialNum.setDescription("The serial number of the Power Factor Correction monitor.")
+upsDiagSubSysPowerFactorCorrectionManufactureDate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 24, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysPowerFactorCorrectionManufactureDate.setDescription("The date of the manufacture for the Power Factor Correction monitor.")
+upsDiagSubSysNetworkComCardTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 25), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardTableSize.setDescription("The number of Network Communication Cards attached to the UPS.")
+upsDiagSubSysNetworkComCardTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26))
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardTable.setDescription("Allows for getting diagnostics information of an individual Network Communication Card.")
+upsDiagSubSysNetworkComCardEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubSysNetworkComCardIndex"))
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardEntry.setDescription("The diagnostics of a Network Communication Card.")
+upsDiagSubSysNetworkComCardIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardIndex.setDescription("The UPS network and display interface communication card index entry.")
+upsDiagSubSysNetworkComCardModelNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardModelNumber.setDescription("A character string identifying the model number of the UPS network and display interface communication card.\nThis value is set at the factory.")
+upsDiagSubSysNetworkComCardSerialNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardSerialNumber.setDescription("A character string identifying the serial number of the UPS network and display interface communication card.\nThis value is set at the factory.")
+upsDiagSubSysNetworkComCardDateOfManufacture = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardDateOfManufacture.setDescription("The date when the UPS network and display interface communication card was manufactured in mm/dd/yyyy format. \nThis value is set at the factory.")
+upsDiagSubSysNetworkComCardHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardHardwareRev.setDescription("The hardware revision of the UPS network and display interface communication card. \nThis value is set at the factory.")
+upsDiagSubSysNetworkComCardFirmwareAppRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardFirmwareAppRev.setDescription("An ID string identifying the application firmware revision of the \nUPS network and display interface communication card.")
+upsDiagSubSysNetworkComCardFirmwareAppOSRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 4, 26, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubSysNetworkComCardFirmwareAppOSRev.setDescription("An ID string identifying the application operating system firmware revision of the \nUPS network and display interface communication card.")
+upsDiagnosticExternalDevices = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5))
+upsDiagSwitchGear = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1))
+upsDiagSwitchGearStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(5,3,6,1,2,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("fail", 4), ("lostComm", 5), ("overtemp", 6), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchGearStatus.setDescription("The status of the Switch Gear.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the device status is OK.\nfail(4) indicates the device status has failed.\nlostComm(5) indicates the device has lost communication.\novertemp(6) indicates the device has an over temperature condition.")
+upsDiagSwitchGearInputSwitchStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("opened", 3), ("closed", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchGearInputSwitchStatus.setDescription("The status of the Switch Gear Input Switch.\nunknown(1) indicates the switch status is unknown.\nnotInstalled(2) indicates the switch is not installed.\nopened(3) indicates the switch is opened.\nclosed(4) indicates the switch is closed.")
+upsDiagSwitchGearOutputSwitchStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("opened", 3), ("closed", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchGearOutputSwitchStatus.setDescription("The status of the Switch Gear Output Switch.\nunknown(1) indicates the switch status is unknown.\nnotInstalled(2) indicates the switch is not installed.\nopened(3) indicates the switch is opened.\nclosed(4) indicates the switch is closed.")
+upsDiagSwitchGearBypassSwitchStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("opened", 3), ("closed", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchGearBypassSwitchStatus.setDescription("The status of the Switch Gear Bypass Switch.\nunknown(1) indicates the switch status is unknown.\nnotInstalled(2) indicates the switch is not installed.\nopened(3) indicates the switch is opened.\nclosed(4) indicates the switch is closed.")
+upsDiagSwitchGearBypassInputSwitchStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("opened", 3), ("closed", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchGearBypassInputSwitchStatus.setDescription("The status of the Switch Gear Bypass Input Switch.\nunknown(1) indicates the switch status is unknown.\nnotInstalled(2) indicates the switch is not installed.\nopened(3) indicates the switch is opened.\nclosed(4) indicates the switch is closed.")
+upsDiagSwitchGearBreakerTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchGearBreakerTableSize.setDescription("The number of switchgear breakers attached to the UPS.")
+upsDiagSwitchGearBreakerTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7))
+if mibBuilder.loadTexts: upsDiagSwitchGearBreakerTable.setDescription("Switchgear breaker table.")
+upsDiagSwitchGearBreakerEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 7, 1)).setIndexNames((0, "PowerNet-MIB", "switchgearBreakerIndex"))
+if mibBuilder.loadTexts: upsDiagSwitchGearBreakerEntry.setDescription("A list of switchgear breakers.")
+upsDiagSubFeedBreakerTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubFeedBreakerTableSize.setDescription("The number of subfeed breakers attached to the UPS.")
+upsDiagSubFeedBreakerTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9))
+if mibBuilder.loadTexts: upsDiagSubFeedBreakerTable.setDescription("Subfeed breaker table.")
+upsDiagSubFeedBreakerEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 9, 1)).setIndexNames((0, "PowerNet-MIB", "subfeedBreakerIndex"))
+if mibBuilder.loadTexts: upsDiagSubFeedBreakerEntry.setDescription("A list of subfeed breakers.")
+upsDiagSwitchGearInstallationLoadPct = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 10), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchGearInstallationLoadPct.setDescription("The actual output load expressed as a percentage of the rating of the UPS.")
+upsDiagSubFeedPhaseTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11))
+if mibBuilder.loadTexts: upsDiagSubFeedPhaseTable.setDescription("A list of subfeed phase table.")
+upsDiagSubFeedPhaseEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1)).setIndexNames((0, "PowerNet-MIB", "upsDiagSubFeedPhaseIndex"))
+if mibBuilder.loadTexts: upsDiagSubFeedPhaseEntry.setDescription("An entry containing information applicable to a\nparticular phase.")
+upsDiagSubFeedBreakerIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubFeedBreakerIndex.setDescription("The subfeed breaker index.")
+upsDiagSubFeedPhaseIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubFeedPhaseIndex.setDescription("The subfeed phase index.")
+upsDiagSubFeedPhaseCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubFeedPhaseCurrent.setDescription("The subfeed phase current in Amps.")
+upsDiagSubFeedPhaseCurrentAlternate = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 11, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSubFeedPhaseCurrentAlternate.setDescription("The subfeed phase current in tenths of Amps.")
+upsDiagSwitchgearSerialNumber = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 1, 12), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagSwitchgearSerialNumber.setDescription("The serial number of the UPS I/O Cabinet.")
+upsDiagMCCBBox = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 2))
+upsDiagMCCBBoxStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 2, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("opened", 3), ("closed", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagMCCBBoxStatus.setDescription("The status of the MCCB Box (Molded Case Circuit Breaker Box) external device.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nopened(3) indicates the circuit is opened.\nclosed(4) indicates the circuit is closed.")
+upsDiagTransformer = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 3))
+upsDiagTransformerStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 3, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(6,5,3,7,8,4,1,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("fail", 4), ("lostComm", 5), ("overtemp", 6), ("opened", 7), ("closed", 8), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagTransformerStatus.setDescription("The status of the External Transformer.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the device status is OK.\nfail(4) indicates the device status has failed.\nlostComm(5) indicates the device has lost communication.\novertemp(6) indicates the device has an over temperature condition.\nopened(7) indicates the circuit is opened.\nclosed(8) indicates the circuit is closed.")
+upsDiagFlyWheel = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 4))
+upsDiagFlyWheelStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 5, 4, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("unknown", 1), ("present", 2), ("notPresent", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagFlyWheelStatus.setDescription("Indicates the status of flywheel connected to UPS. If the UPS\nis unable to determine the state of flywheel, this variable is\nset to unknown(1).")
+upsDiagnosticComBus = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6))
+upsDiagComBusInternalMIMStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(4,3,1,2,5,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("lostComm", 4), ("rxFailure", 5), ("txFailure", 6), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagComBusInternalMIMStatus.setDescription("The status of the internal MIM communication bus.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the device status is OK.\nlostComm(4) indicates the device has lost communication.\nrxFailure(5) indicates the device has a receive failure.\ntxFailure(6) indicates the device has a transmit failure.")
+upsDiagComBusInternalRIMStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(4,3,1,2,5,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("lostComm", 4), ("rxFailure", 5), ("txFailure", 6), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagComBusInternalRIMStatus.setDescription("The status of the internal RIM communication bus.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the device status is OK.\nlostComm(4) indicates the device has lost communication.\nrxFailure(5) indicates the device has a receive failure.\ntxFailure(6) indicates the device has a transmit failure.")
+upsDiagComBusMIMtoRIMStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(4,3,1,2,5,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("lostComm", 4), ("rxFailure", 5), ("txFailure", 6), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagComBusMIMtoRIMStatus.setDescription("The status of the MIM to RIM communication bus.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the device status is OK.\nlostComm(4) indicates the device has lost communication.\nrxFailure(5) indicates the device has a receive failure.\ntxFailure(6) indicates the device has a transmit failure.")
+upsDiagComBusExternalMIMStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(4,3,1,2,5,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("lostComm", 4), ("rxFailure", 5), ("txFailure", 6), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagComBusExternalMIMStatus.setDescription("The status of the external MIM communication bus.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the device status is OK.\nlostComm(4) indicates the device has lost communication.\nrxFailure(5) indicates the device has a receive failure.\ntxFailure(6) indicates the device has a transmit failure.")
+upsDiagComBusExternalRIMStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 13, 6, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(4,3,1,2,5,6,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("ok", 3), ("lostComm", 4), ("rxFailure", 5), ("txFailure", 6), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDiagComBusExternalRIMStatus.setDescription("The status of the external RIM communication bus.\nunknown(1) indicates the device status is unknown.\nnotInstalled(2) indicates the device is not installed.\nok(3) indicates the device status is OK.\nlostComm(4) indicates the device has lost communication.\nrxFailure(5) indicates the device has a receive failure.\ntxFailure(6) indicates the device has a transmit failure.")
+upsParallelSystem = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14))
+upsParallelSysLocalAddress = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 1), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsParallelSysLocalAddress.setDescription("Defines the UPS ID number in the parallel system.")
+upsParallelSysRemoteAddress = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 2), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsParallelSysRemoteAddress.setDescription("Defines the total number of UPSs in parallel.")
+upsParallelSysRedundancy = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,5,6,)).subtype(namedValues=NamedValues(("nplus0", 1), ("nplus1", 2), ("nplus2", 3), ("nplus3", 4), ("nplus4", 5), ("nplus5", 6), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsParallelSysRedundancy.setDescription("The redundancy warning level for paralleled UPS\nnplus0 (1) indicates that there are no redundant units.\nnplus1 (2) indicates that there is one redundant unit.\nnplus2 (3) indicates that there are two redundant units.\nnplus3 (4) indicates that there are three redundant units.\nnplus4 (5) indicates that there are four redundant unit.\nnplus5 (6) indicates that there are five redundant units.")
+upsParallelInputMaximumCurrent = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputMaximumCurrent.setDescription("Maximum input RMS current of the parallel system\nmeasured in Amperes.")
+upsParallelTotalOutputPower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelTotalOutputPower.setDescription("The Total Ouptut power of UPS in KW \nwhen UPS are configured in parallel\nor -1 if it's unsupported by this UPS.")
+upsParallelTotalOutputApparentPower = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelTotalOutputApparentPower.setDescription("The Total Ouptut Apparent power of UPS in kVA \nwhen UPS are configured in parallel \nor -1 if it's unsupported by this UPS.")
+upsParallelInputPhaseTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7))
+if mibBuilder.loadTexts: upsParallelInputPhaseTable.setDescription("A list of input table entries.")
+upsParallelInputPhaseEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1)).setIndexNames((0, "PowerNet-MIB", "upsParallelInputPhaseTableIndex"), (0, "PowerNet-MIB", "upsParallelInputPhaseIndex"))
+if mibBuilder.loadTexts: upsParallelInputPhaseEntry.setDescription("An entry containing information applicable to a\nparticular input phase.")
+upsParallelInputPhaseTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputPhaseTableIndex.setDescription("The parallel unit identifier.")
+upsParallelInputPhaseIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputPhaseIndex.setDescription("The input phase identifier.")
+upsParallelInputCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputCurrent.setDescription("The input current in amperes, or -1 if it's\nunsupported by this UPS.")
+upsParallelInputActivePower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputActivePower.setDescription("The input power in kW, or -1 if it's\nunsupported by this UPS.")
+upsParallelInputApparentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputApparentPower.setDescription("The input apparent power in kVA, or -1 if it's\nunsupported by this UPS.")
+upsParallelInputVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputVoltage.setDescription("The input voltage of UPS in volts, or -1 if it's\nunsupported by this UPS.")
+upsParallelInputMaxVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputMaxVoltage.setDescription("The peak input voltage in VAC measured since the last reset,\nor -1 if it's unsupported by this UPS.")
+upsParallelInputMaxCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputMaxCurrent.setDescription("The peak input current in amperes measured since last reset, \nor -1 if it's unsupported by this UPS.")
+upsParallelInputTotalActivePower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 9), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputTotalActivePower.setDescription("Total active input power of the parallel system in kW.")
+upsParallelInputTotalApparentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 7, 1, 10), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelInputTotalApparentPower.setDescription("Total apparent input power of the parallel system in kVA.")
+upsParallelOutputPhaseTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8))
+if mibBuilder.loadTexts: upsParallelOutputPhaseTable.setDescription("A list of output table entries.  The number of\nentries is given by the sum of the upsPhaseNumOutputPhases.")
+upsParallelOutputPhaseEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1)).setIndexNames((0, "PowerNet-MIB", "upsParallelOutputPhaseTableIndex"), (0, "PowerNet-MIB", "upsParallelOutputPhaseIndex"))
+if mibBuilder.loadTexts: upsParallelOutputPhaseEntry.setDescription("An entry containing information applicable to a\nparticular output phase.")
+upsParallelOutputPhaseTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputPhaseTableIndex.setDescription("The output identifier.")
+upsParallelOutputPhaseIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputPhaseIndex.setDescription("The output phase identifier.")
+upsParallelOutputCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputCurrent.setDescription("The output current in amperes drawn \nby the load on the UPS, or -1 if it's unsupported\nby this UPS.")
+upsParallelOutputLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputLoad.setDescription("The output load in VA, or -1 if it's unsupported\nby this UPS.")
+upsParallelOutputPercentLoad = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputPercentLoad.setDescription("The percentage of the UPS load capacity in VA at \npresent redundancy being used on this output phase, \nor -1 if it's unsupported by this UPS.")
+upsParallelOutputPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 8, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputPower.setDescription("The output power in Watts, or -1 if it's\nunsupported by this UPS.")
+upsParallelOutputApparentPowerTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9))
+if mibBuilder.loadTexts: upsParallelOutputApparentPowerTable.setDescription("A list of output table entries.  The number of entries\nis given by the value of upsOutputNumPhases.")
+upsParallelOutputApparentPowerEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9, 1)).setIndexNames((0, "PowerNet-MIB", "upsParallelOutputApparentPowerTableIndex"))
+if mibBuilder.loadTexts: upsParallelOutputApparentPowerEntry.setDescription("An entry containing information applicable to a\nparticular output.")
+upsParallelOutputApparentPowerTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputApparentPowerTableIndex.setDescription("The UPS parallel output identifier.")
+upsParallelOutputApparentPower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 9, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputApparentPower.setDescription("The apparent power of each of UPS in kVA\nwhen UPS are configured in parallel.")
+upsParallelDiagSubSysBreakerTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10))
+if mibBuilder.loadTexts: upsParallelDiagSubSysBreakerTable.setDescription("Allows for diagnostics of parallel Circuit Breakers.")
+upsParallelDiagSubSysBreakerEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1)).setIndexNames((0, "PowerNet-MIB", "upsParallelDiagSubSysBreakerFrameIndex"), (0, "PowerNet-MIB", "upsParallelDiagSubSysBreakerIndex"))
+if mibBuilder.loadTexts: upsParallelDiagSubSysBreakerEntry.setDescription("The diagnostics of Circuit Breaker.")
+upsParallelDiagSubSysBreakerFrameIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelDiagSubSysBreakerFrameIndex.setDescription("The Parallel UPS index entry.")
+upsParallelDiagSubSysBreakerIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelDiagSubSysBreakerIndex.setDescription("The index of the Circuit Breaker.")
+upsParallelDiagSubSysBreakerStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("unknown", 1), ("notInstalled", 2), ("opened", 3), ("closed", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelDiagSubSysBreakerStatus.setDescription("The status of the Circuit Breaker.\nunknown(1) indicates the circuit breaker status is unknown.\nnotInstalled(2) indicates the circuit breaker is not installed.\nopened(3) indicates the circuit breaker is opened.\nclosed(4) indicates the circuit breaker is closed.")
+upsParallelDiagSubSysBreakerName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 10, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelDiagSubSysBreakerName.setDescription("The name of Circuit Breaker.")
+upsParallelOutputTotalPercentLoad = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 11), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputTotalPercentLoad.setDescription("The percentage of the UPS total load capacity in kVA \nor -1 if it's unsupported by this UPS.")
+upsParallelOutputActivePowerTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12))
+if mibBuilder.loadTexts: upsParallelOutputActivePowerTable.setDescription("A list of output table entries.  The number of entries\nis given by the value of upsParallelSysRemoteAddress.")
+upsParallelOutputActivePowerEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12, 1)).setIndexNames((0, "PowerNet-MIB", "upsParallelOutputActivePowerTableIndex"))
+if mibBuilder.loadTexts: upsParallelOutputActivePowerEntry.setDescription("An entry containing information applicable to a\nparticular output.")
+upsParallelOutputActivePowerTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputActivePowerTableIndex.setDescription("The UPS parallel output identifier.")
+upsParallelOutputActivePower = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 12, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelOutputActivePower.setDescription("The active power of each UPS in kW\nwhen UPSs are configured in parallel.")
+upsParallelSysSwitchGearInstallationLoadPct = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 13), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelSysSwitchGearInstallationLoadPct.setDescription("The actual output load expressed as a percentage of the rating of the\nParallel UPS system.")
+upsParallelSysRedundancyStatus = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 14), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,5,6,)).subtype(namedValues=NamedValues(("nplus0", 1), ("nplus1", 2), ("nplus2", 3), ("nplus3", 4), ("nplus4", 5), ("nplus5", 6), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsParallelSysRedundancyStatus.setDescription("Displays the number of backup or redundant UPSs set up on the parallel system.\nnplus0 (1) no redundant units.\nnplus1 (2) one redundant unit.\nnplus2 (3) two redundant units.\nnplus3 (4) three redundant units.\nnplus4 (5) four redundant units.\nnplus5 (6) five redundant units.")
+upsParallelSysName = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 14, 15), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsParallelSysName.setDescription("An ID string for the group of UPS units in the same parallel system.\nSome products do not allow write operations for this OID.")
+upsPhysicalLayout = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15))
+upsIOFrameLayoutPositionID = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsIOFrameLayoutPositionID.setDescription("Defines the position ID of UPS frame.")
+upsBottomFeedFrameLayoutPositionID = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBottomFeedFrameLayoutPositionID.setDescription("Defines the position ID of bottom feed frame.")
+upsSwitchGearLayoutPositionID = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsSwitchGearLayoutPositionID.setDescription("Defines the position ID of switchgear.")
+upsBatteryFrameLayoutTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsBatteryFrameLayoutTableSize.setDescription("The number of battery frames.")
+upsBatteryFrameLayoutTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 5))
+if mibBuilder.loadTexts: upsBatteryFrameLayoutTable.setDescription("Battery frame layout position ID table.")
+upsBatteryFrameLayoutEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 5, 1)).setIndexNames((0, "PowerNet-MIB", "batteryFrameIndex"))
+if mibBuilder.loadTexts: upsBatteryFrameLayoutEntry.setDescription("A list of layout position IDs of battery frames.")
+upsSideCarFrameLayoutTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsSideCarFrameLayoutTableSize.setDescription("The number of sidecar frames.")
+upsSideCarFrameLayoutTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 7))
+if mibBuilder.loadTexts: upsSideCarFrameLayoutTable.setDescription("Sidecar frame layout position ID table.")
+upsSideCarFrameLayoutEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 7, 1)).setIndexNames((0, "PowerNet-MIB", "sideCarFrameIndex"))
+if mibBuilder.loadTexts: upsSideCarFrameLayoutEntry.setDescription("A list of sidecar frame layout position IDs.")
+upsPowerFrameLayoutTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsPowerFrameLayoutTableSize.setDescription("The number of power frames.")
+upsPowerFrameLayoutTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 9))
+if mibBuilder.loadTexts: upsPowerFrameLayoutTable.setDescription("Power frame layout position ID table.")
+upsPowerFrameLayoutEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 15, 9, 1)).setIndexNames((0, "PowerNet-MIB", "powerFrameIndex"))
+if mibBuilder.loadTexts: upsPowerFrameLayoutEntry.setDescription("A list of power frame layout position IDs.")
+upsIntegratedATS = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16))
+upsIntegratedATSSelectedSource = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(4,1,3,2,)).subtype(namedValues=NamedValues(("noSourceSelected", 1), ("unknown", 2), ("sourceA", 3), ("sourceB", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsIntegratedATSSelectedSource.setDescription("The source which is currently selected by the ATS to supply the UPS.")
+upsIntegratedATSPreferredSource = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 2), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("upsIntegratedATSNoSourcePreference", 1), ("upsIntegratedATSPreferSourceA", 2), ("upsIntegratedATSPreferSourceB", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsIntegratedATSPreferredSource.setDescription("The preferred source of power when both sources are OK.")
+upsIntegratedATSUpsReturnStaggering = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 3), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsIntegratedATSUpsReturnStaggering.setDescription("This is a delay factor applied to the retransfer of this UPS with integrated ATS.\nWhen multiple UPSs are in use from a single source, each UPS can have a unique delay value,\nwhich will reduce inrush by preventing all UPSs from transferring at the same time.")
+upsIntegratedATSSourceTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsIntegratedATSSourceTableSize.setDescription("The number of input sources for this integrated ATS.")
+upsIntegratedATSSourceTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5))
+if mibBuilder.loadTexts: upsIntegratedATSSourceTable.setDescription("Allows for getting status and settings for the ATS input sources.\nThe number of entries is contained in the upsIntegratedATSSourceTableSize OID.")
+upsIntegratedATSSourceEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1)).setIndexNames((0, "PowerNet-MIB", "upsIntegratedATSSourceIndex"))
+if mibBuilder.loadTexts: upsIntegratedATSSourceEntry.setDescription("The input source status to get.")
+upsIntegratedATSSourceIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsIntegratedATSSourceIndex.setDescription("The index to the input source entry.")
+upsIntegratedATSSourceName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsIntegratedATSSourceName.setDescription("The name of the input source. This OID is provided\nfor informational purposes only.")
+upsIntegratedATSSourceStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("upsIntegratedATSSourceGood", 1), ("upsIntegratedATSSourceBad", 2), ("upsIntegratedATSSourceUnknown", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsIntegratedATSSourceStatus.setDescription("Getting this variable will return the input source status.")
+upsIntegratedATSLineFailDelay = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 4), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsIntegratedATSLineFailDelay.setDescription("The delay between a selected input source becoming bad, and the ATS switching away from that source.\nThis delay is used to make sure that the line has truly failed before the ATS will be switched.\nSpecified in seconds.")
+upsIntegratedATSLineStabilityDelay = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 16, 5, 1, 5), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: upsIntegratedATSLineStabilityDelay.setDescription("The delay between an unselected input source becoming good, and the ATS switching to that source.\nThis delay is used to make sure that the line has truly returned before the ATS will be switched.\nSpecified in seconds.")
+upsDCOutput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17))
+upsDCOutputStatus = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1))
+upsDCOutputStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDCOutputStatusTableSize.setDescription("The number of DC outputs on the UPS.")
+upsDCOutputStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2))
+if mibBuilder.loadTexts: upsDCOutputStatusTable.setDescription("Provides status information on UPS DC outputs.\nThe number of entries is contained in the upsDCOutputStatusTableSize OID.")
+upsDCOutputStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1)).setIndexNames((0, "PowerNet-MIB", "upsDCOutputStatusTableIndex"))
+if mibBuilder.loadTexts: upsDCOutputStatusEntry.setDescription("The DC output.")
+upsDCOutputStatusTableIndex = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDCOutputStatusTableIndex.setDescription("The index to the DC output status entry.")
+upsDCOutputStatusVoltageNominal = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDCOutputStatusVoltageNominal.setDescription("The desired voltage for this output in tenths of VDC. \nWhen the output is on and there are no fault conditions, \nthe actual voltage should be near the nominal.")
+upsDCOutputStatusCurrentRating = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDCOutputStatusCurrentRating.setDescription("The amount of current this output is able to supply in\ntenths of amperes.")
+upsDCOutputStatusVoltage = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDCOutputStatusVoltage.setDescription("The voltage measured on this output in tenths of VDC.")
+upsDCOutputStatusCurrent = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDCOutputStatusCurrent.setDescription("The current drawn by the load measured on this output \nin tenths of amperes.")
+upsDCOutputStatusAbnormalConditions = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 1, 17, 1, 2, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: upsDCOutputStatusAbnormalConditions.setDescription("An ASCII string containing flags representing active\noutput faults. If the Network Card is unable to determine\nthe state of the UPS, this variable is set to 'UNKNOWN'.\n\nThe flags are numbered 1 onward, read from left to\nright. The flags are defined as follows starting from 1:\n\nFlag  1: Output Overload\nFlag  2: Output Short Circuit\nFlag  3: Output Over Voltage\nFlag  6: Backfeed Relay Fault\nFlag 10: Bypass Relay Fault\nFlag 19: Output Fault (over or undervoltage)\nFlag 20: Bus Converter Fault\nFlag 21: Sensor Fault")
+environmentalMonitor = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10))
+integrated = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2))
+iemIdent = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 1))
+iemIdentHardwareRevision = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 1, 1), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemIdentHardwareRevision.setDescription("The hardware revision of the Integrated Environmental\nMonitor.")
+iemConfig = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2))
+iemConfigProbesNumProbes = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemConfigProbesNumProbes.setDescription("The number of temperature and humidity probes available.")
+iemConfigProbesTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2))
+if mibBuilder.loadTexts: iemConfigProbesTable.setDescription("A list of probes supported by the Environmental Monitor\nand their configurations.")
+iemConfigProbesEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1)).setIndexNames((0, "PowerNet-MIB", "iemConfigProbeNumber"))
+if mibBuilder.loadTexts: iemConfigProbesEntry.setDescription("The Environmental Monitor probe configurations.")
+iemConfigProbeNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemConfigProbeNumber.setDescription("The index to a Environmental Monitor probe entry.")
+iemConfigProbeName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 2), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeName.setDescription("A descriptive name for the probe set by the user,\npossibly denoting its location or purpose.")
+iemConfigProbeHighTempThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 3), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeHighTempThreshold.setDescription("The high temperature alarm threshold for the probe.\nUnits are displayed in the scale selected in the\n'iemConfigProbeTempUnits' OID (Celsius or Fahrenheit).")
+iemConfigProbeLowTempThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 4), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeLowTempThreshold.setDescription("The low temperature alarm threshold for the probe.\nUnits are displayed in the scale selected in the\n'iemConfigProbeTempUnits' OID (Celsius or Fahrenheit).")
+iemConfigProbeTempUnits = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("celsius", 1), ("fahrenheit", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemConfigProbeTempUnits.setDescription("The temperature scale used to display the temperature\nthresholds of the probe, Celsius(1) or Fahrenheit(2).\nThis setting is based on the system preferences\nconfiguration in the agent.")
+iemConfigProbeHighHumidThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 6), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeHighHumidThreshold.setDescription("The high humidity alarm threshold for the probe in\npercent relative humidity.")
+iemConfigProbeLowHumidThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 7), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeLowHumidThreshold.setDescription("The low humidity alarm threshold for the probe in\npercent relative humidity.")
+iemConfigProbeHighTempEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeHighTempEnable.setDescription("The high temperature alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeLowTempEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 9), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeLowTempEnable.setDescription("The low temperature alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeHighHumidEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 10), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeHighHumidEnable.setDescription("The high humidity alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeLowHumidEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 11), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeLowHumidEnable.setDescription("The low humidity alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeMaxTempThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 12), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMaxTempThreshold.setDescription("The maximun temperature alarm threshold for the probe.\nUnits are displayed in the scale selected in the\n'iemConfigProbeTempUnits' OID (Celsius or Fahrenheit).")
+iemConfigProbeMinTempThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 13), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMinTempThreshold.setDescription("The minimun temperature alarm threshold for the probe.\nUnits are displayed in the scale selected in the\n'iemConfigProbeTempUnits' OID (Celsius or Fahrenheit).")
+iemConfigProbeMaxHumidThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 14), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMaxHumidThreshold.setDescription("The maximum humidity alarm threshold for the probe in\npercent relative humidity.")
+iemConfigProbeMinHumidThreshold = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 15), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMinHumidThreshold.setDescription("The minimum humidity alarm threshold for the probe in\npercent relative humidity.")
+iemConfigProbeMaxTempEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 16), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMaxTempEnable.setDescription("The maximum temperature alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeMinTempEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 17), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMinTempEnable.setDescription("The low temperature alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeMaxHumidEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 18), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMaxHumidEnable.setDescription("The maximum humidity alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeMinHumidEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 19), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeMinHumidEnable.setDescription("The minimum humidity alarm enable/disable for the\nprobe. No alarm will be generated if this value\nis set to disabled(1). The alarm will be \ngenerated if this value is set to enabled(2) and\nthe threshold has been violated.")
+iemConfigProbeTempHysteresis = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 20), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeTempHysteresis.setDescription("The number of degrees beyond the temperature thresholds\nat which an active temperature alarm will be cleared.\nThis configuration setting applies to all temperature\nthresholds.\nUnits are displayed in the scale selected in\nthe 'emConfigProbeTempUnits' OID (Celsius or Fahrenheit).")
+iemConfigProbeHumidHysteresis = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 21), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeHumidHysteresis.setDescription("The number of percent RH points beyond the humidity\nthresholds at which an active humidity alarm will be\ncleared. This configuration setting applies to all\nhumidity thresholds.\nUnits are displayed in the scale selected in\nthe 'emConfigProbeTempUnits' OID (Celsius or Fahrenheit).")
+iemConfigProbeLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 2, 1, 22), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigProbeLocation.setDescription("A string describing the location of the probe.")
+iemConfigContactsNumContacts = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemConfigContactsNumContacts.setDescription("The number of contacts available on the Environmental\nMonitor.")
+iemConfigContactsTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4))
+if mibBuilder.loadTexts: iemConfigContactsTable.setDescription("A list of contacts supported by the Environmental Monitor\nand their configurations.")
+iemConfigContactsEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1)).setIndexNames((0, "PowerNet-MIB", "iemConfigContactNumber"))
+if mibBuilder.loadTexts: iemConfigContactsEntry.setDescription("The Environmental Monitor contact configurations.")
+iemConfigContactNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemConfigContactNumber.setDescription("The index of an Environmental Monitor contact.")
+iemConfigContactName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 2), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigContactName.setDescription("A descriptive name for the Environmental Monitor contact\nset by the user, possibly denoting its location or purpose.")
+iemConfigContactEnable = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigContactEnable.setDescription("An Environmental Monitor contact alarm enable/disable.")
+iemConfigContactSeverity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 4), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("critical", 1), ("warning", 2), ("informational", 3), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigContactSeverity.setDescription("The severtity of the alarm that will be triggered when\nthe input contact is activated. The alarms can be\ncritical(1), warning(2) or informational(3).\nNOTE: informational(3) is deprecated (and no longer valid) for this OID.")
+iemConfigContactNormalState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("open", 1), ("closed", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigContactNormalState.setDescription("The contact state that will be considered normal, i.e.\nwill not trigger an alarm. The states are open(1) or \nclosed(2).")
+iemConfigContactLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 4, 1, 6), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigContactLocation.setDescription("A descriptive label for the contact denoting its\nlocation or purpose.")
+iemConfigConfigRelaysNumRelays = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemConfigConfigRelaysNumRelays.setDescription("The number of output relays supported by the Environmental\nMonitor.")
+iemConfigRelaysTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6))
+if mibBuilder.loadTexts: iemConfigRelaysTable.setDescription("A list of output relays supported by the Environmental Monitor\nand their configurations.")
+iemConfigRelaysEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1)).setIndexNames((0, "PowerNet-MIB", "iemConfigRelayNumber"))
+if mibBuilder.loadTexts: iemConfigRelaysEntry.setDescription("The Environmental Monitor output relay configurations.")
+iemConfigRelayNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemConfigRelayNumber.setDescription("The index of an Environmental Monitor output relay.")
+iemConfigRelayName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 2), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigRelayName.setDescription("A descriptive name of an Environmental Monitor output relay, \nset by the user, describing its location or purpose.")
+iemConfigRelayNormalState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("open", 1), ("closed", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigRelayNormalState.setDescription("The normal state (non-fault state) of an Environmental\nMonitor output relay, either open(1) or closed(2).")
+iemConfigRelayFaultCondition = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 2, 6, 1, 4), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: iemConfigRelayFaultCondition.setDescription("The fault condition used to activate the output relay.")
+iemStatus = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3))
+iemStatusProbesNumProbes = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbesNumProbes.setDescription("The number of available probes on the Environmental\nMonitor.")
+iemStatusProbesTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2))
+if mibBuilder.loadTexts: iemStatusProbesTable.setDescription("A list of probes supported by the Environmental Monitor\nand their status.")
+iemStatusProbesEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1)).setIndexNames((0, "PowerNet-MIB", "iemStatusProbeNumber"))
+if mibBuilder.loadTexts: iemStatusProbesEntry.setDescription("The status of the probe.")
+iemStatusProbeNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeNumber.setDescription("The index of the probe.")
+iemStatusProbeName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeName.setDescription("A descriptive name for the probe set by the user.")
+iemStatusProbeStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("disconnected", 1), ("connected", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeStatus.setDescription("The connected status of the probe, either      \ndisconnected(1) or connected(2).")
+iemStatusProbeCurrentTemp = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeCurrentTemp.setDescription("The current temperature reading from the probe displayed\nin the units shown in the 'iemStatusProbeTempUnits' OID\n(Celsius or Fahrenheit).")
+iemStatusProbeTempUnits = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("celsius", 1), ("fahrenheit", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeTempUnits.setDescription("The temperature scale used to display the temperature\nthresholds of the probe, Celsius(1) or Fahrenheit(2).\nThis setting is based on the system preferences\nconfiguration in the agent.")
+iemStatusProbeCurrentHumid = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeCurrentHumid.setDescription("The current humidity reading from the probe in percent\nrelative humidity.")
+iemStatusProbeHighTempViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("noViolation", 1), ("highTempViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeHighTempViolation.setDescription("The high temperature violation status of the probe\ntemperature reading. This OID will show a highTempViolation(2)\nif the current temperature reading shown in the\n'iemStatusProbeCurrentTemp' OID is greater than or equal to\nthe high temperature threshold value, the \n'iemConfigProbeHighTempThreshold' OID, and the value of the\n'iemConfigProbeHighTempEnable' OID is enabled. Otherwise it will show\nnoViolation(1). If the 'iemConfigProbeHighTempEnable' OID is disabled,\nthis OID will show disabled(3).")
+iemStatusProbeLowTempViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("noViolation", 1), ("lowTempViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeLowTempViolation.setDescription("The high temperature violation status of the probe\ntemperature reading. This OID will show a lowTempViolation(2)\nif the current temperature reading shown in the\n'iemStatusProbeCurrentTemp' OID is less than or equal to\nthe low temperature threshold value, the \n'iemConfigProbeLowTempThreshold' OID, and the value of the\n'iemPConfigrobeLowTempEnable' OID is enabled. Otherwise it will show\nnoViolation(1). If the 'iemConfigProbeLowTempEnable' OID is disabled,\nthis OID will show disabled(3).")
+iemStatusProbeHighHumidViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 9), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,3,)).subtype(namedValues=NamedValues(("noViolation", 1), ("highHumidViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeHighHumidViolation.setDescription("The high humidity violation status of the probe humidity\nreading. This OID will show a highTempViolation(2)\nif the current humidity reading shown in the\n'iemStatusProbeCurrentHumid' OID is greater than or equal to\nthe high humidity threshold value, the \n'iemConfigProbeHighHumidThreshold' OID, and the value of the\n'iemConfigProbeHighHumidEnable' OID is enabled. Otherwise it will\nshow noViolation(1). If the 'iemConfigProbeHighHumidEnable' OID is\ndisabled, this OID will show disabled(3).")
+iemStatusProbeLowHumidViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 10), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("noViolation", 1), ("lowHumidViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeLowHumidViolation.setDescription("The low humidity violation status of the probe humidity\nreading. This OID will show a lowTempViolation(2)\nif the current humidity reading shown in the\n'iemStatusProbeCurrentHumid' OID is less than or equal to\nthe low humidity threshold value, the \n'iemConfigProbeLowHumidThreshold' OID, and the value of the\n'iemConfigProbeLowHumidEnable' OID is enabled. Otherwise it will\nshow noViolation(1). If the 'iemConfigProbeLowHumidEnable' OID is\ndisabled, this OID will show disabled(3).")
+iemStatusProbeMaxTempViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 11), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("noViolation", 1), ("maxTempViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeMaxTempViolation.setDescription("The max temperature violation status of the probe\ntemperature reading. This OID will show a maxTempViolation(2)\nif the current temperature reading shown in the\n'iemStatusProbeCurrentTemp' OID is greater than or equal to\nthe maximun temperature threshold value, the \n'iemConfigProbeMaxTempThreshold' OID, and the value of the\n'iemConfigProbeMaxTempEnable' OID is enabled. Otherwise it will show\nnoViolation(1). If the 'iemConfigProbeMaxTempEnable' OID is disabled,\nthis OID will show disabled(3).")
+iemStatusProbeMinTempViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 12), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("noViolation", 1), ("minTempViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeMinTempViolation.setDescription("The minimum temperature violation status of the probe\ntemperature reading. This OID will show a minTempViolation(2)\nif the current temperature reading shown in the\n'iemStatusProbeCurrentTemp' OID is less than or equal to\nthe minimum temperature threshold value, the \n'iemConfigProbeMinTempThreshold' OID, and the value of the\n'iemConfigProbeMinTempEnable' OID is enabled. Otherwise it will show\nnoViolation(1). If the 'iemConfigProbeMinTempEnable' OID is disabled,\nthis OID will show disabled(3).")
+iemStatusProbeMaxHumidViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 13), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,3,)).subtype(namedValues=NamedValues(("noViolation", 1), ("maxHumidViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeMaxHumidViolation.setDescription("The maximum humidity violation status of the probe humidity\nreading. This OID will show a maxTempViolation(2)\nif the current humidity reading shown in the\n'iemStatusProbeCurrentHumid' OID is greater than or equal to\nthe maximum humidity threshold value, the \n'iemConfigProbeMaxHumidThreshold' OID, and the value of the\n'iemConfigProbeMaxHumidEnable' OID is enabled. Otherwise it will\nshow noViolation(1).  If the 'iemConfigProbeMaxHumidEnable' OID is\ndisabled, this OID will show disabled(3)")
+iemStatusProbeMinHumidViolation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 14), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("noViolation", 1), ("minHumidViolation", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeMinHumidViolation.setDescription("The minimum humidity violation status of the probe humidity\nreading. This OID will show a minTempViolation(2)\nif the current humidity reading shown in the\n'iemStatusProbeCurrentHumid' OID is less than or equal to\nthe minimum humidity threshold value, the \n'iemConfigProbeMinHumidThreshold' OID, and the value of the\n'iemConfigProbeMinHumidEnable' OID is enabled. Otherwise it will\nshow noViolation(1). If the 'iemConfigProbeMinHumidEnable' OID is\ndisabled, this OID will show disabled(3).")
+iemStatusProbeLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 2, 1, 15), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusProbeLocation.setDescription("A descriptive location for the probe set by the user.")
+iemStatusContactsNumContacts = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusContactsNumContacts.setDescription("The number of contacts supported on the\nEnvironmental Monitor.")
+iemStatusContactsTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4))
+if mibBuilder.loadTexts: iemStatusContactsTable.setDescription("A list of contacts supported by the Environmental Monitor\nand their status.")
+iemStatusContactsEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1)).setIndexNames((0, "PowerNet-MIB", "iemStatusContactNumber"))
+if mibBuilder.loadTexts: iemStatusContactsEntry.setDescription("The status of the contact.")
+iemStatusContactNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusContactNumber.setDescription("The index of the Environmental Monitor contact.")
+iemStatusContactName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusContactName.setDescription("A descriptive name for the Environmental Monitor contact\nset by the user, denoting its location or purpose.")
+iemStatusContactStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 4, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(3,2,1,)).subtype(namedValues=NamedValues(("noFault", 1), ("fault", 2), ("disabled", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusContactStatus.setDescription("The status of the Environmental Monitor contact. The status\nwill show noFault(1) if the contact is in the normal state\nand the 'iemConfigContactEnable' OID is enabled. The status will\nshow a fault(2) if the contact is faulted and the \n'iemConfigContactEnable' OID is enabled. If the\n'iemConfigContactEnable' OID is disabled, the status will show\ndisabled(3).")
+iemStatusRelaysNumRelays = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusRelaysNumRelays.setDescription("The number of output relays supported on the\nEnvironmental Monitor.")
+iemStatusRelaysTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7))
+if mibBuilder.loadTexts: iemStatusRelaysTable.setDescription("A list of output relays supported by the\nEnvironmental Monitor and their status.")
+iemStatusRelaysEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1)).setIndexNames((0, "PowerNet-MIB", "iemStatusRelayNumber"))
+if mibBuilder.loadTexts: iemStatusRelaysEntry.setDescription("The status of the relay.")
+iemStatusRelayNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusRelayNumber.setDescription("The index of the output relay.")
+iemStatusRelayName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusRelayName.setDescription("A descriptive name for the output relay set by the\nuser, denoting its location or purpose.")
+iemStatusRelayStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 2, 3, 7, 1, 3), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("faultState", 1), ("normalState", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: iemStatusRelayStatus.setDescription("The status of the output relay, either faultState(1) or\nnormalState(2).")
+modEnvMgr = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4))
+memModules = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1))
+memModulesStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusTableSize.setDescription("The number of entries in the memModulesStatusTable.")
+memModulesStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2))
+if mibBuilder.loadTexts: memModulesStatusTable.setDescription("Allows for getting status information from the modules\nattached to the system.")
+memModulesStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1)).setIndexNames((0, "PowerNet-MIB", "memModulesStatusModuleNumber"))
+if mibBuilder.loadTexts: memModulesStatusEntry.setDescription("The unit to get data from.")
+memModulesStatusModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusModuleNumber.setDescription("The module number.")
+memModulesStatusModuleName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 2), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusModuleName.setDescription("The module name.")
+memModulesStatusModuleLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusModuleLocation.setDescription("The location of the module.")
+memModulesStatusModelNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusModelNumber.setDescription("The model number of the module.")
+memModulesStatusSerialNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 5), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusSerialNumber.setDescription("The serial number of the module.")
+memModulesStatusFirmwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusFirmwareRev.setDescription("The firmware revision of the module.")
+memModulesStatusHardwareRev = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 2, 1, 7), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesStatusHardwareRev.setDescription("The hardware revision.")
+memModulesConfigTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesConfigTableSize.setDescription("The number of entries in the memModulesConfigTable.")
+memModulesConfigTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4))
+if mibBuilder.loadTexts: memModulesConfigTable.setDescription("Allows for getting status information from the modules\nattached to the system.")
+memModulesConfigEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1)).setIndexNames((0, "PowerNet-MIB", "memModulesConfigModuleNumber"))
+if mibBuilder.loadTexts: memModulesConfigEntry.setDescription("The unit to get data from.")
+memModulesConfigModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memModulesConfigModuleNumber.setDescription("The module number.")
+memModulesConfigModuleName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1, 2), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memModulesConfigModuleName.setDescription("The module name.")
+memModulesConfigModuleLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 1, 4, 1, 3), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memModulesConfigModuleLocation.setDescription("The location of the module.")
+memSensors = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2))
+memSensorsStatusSysTempUnits = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 1), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("celsius", 1), ("fahrenheit", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsStatusSysTempUnits.setDescription("The temperature scale used to display the temperature\nin the system, Celsius(1) or Fahrenheit(2).\nThis setting is based on the system preferences\nconfiguration in the agent.")
+memSensorsStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsStatusTableSize.setDescription("The number of entries in the memSensorsStatusTable.")
+memSensorsStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3))
+if mibBuilder.loadTexts: memSensorsStatusTable.setDescription("Allows for getting sensor status information.")
+memSensorsStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1)).setIndexNames((0, "PowerNet-MIB", "memSensorsStatusModuleNumber"), (0, "PowerNet-MIB", "memSensorsStatusSensorNumber"))
+if mibBuilder.loadTexts: memSensorsStatusEntry.setDescription("The unit to get data from.")
+memSensorsStatusModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsStatusModuleNumber.setDescription("The number of the module that the sensor is attached to.")
+memSensorsStatusSensorNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsStatusSensorNumber.setDescription("The number of this sensor on the module.")
+memSensorsStatusSensorName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsStatusSensorName.setDescription("The sensor name.")
+memSensorsStatusSensorLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsStatusSensorLocation.setDescription("The location of the sensor.")
+memSensorsTemperature = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsTemperature.setDescription("The sensor's current temperature reading. \nUnits are displayed in the scale shown in\nthe memSensorsStatusSysTempUnits OID (Celsius or Fahrenheit).")
+memSensorsHumidity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsHumidity.setDescription("The current humidity reading from the sensor.")
+memSensorsCommStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("notInstalled", 1), ("commsOK", 2), ("commsLost", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsCommStatus.setDescription("The communications status of the sensor.")
+memSensorsAlarmStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 3, 1, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("memNormal", 1), ("memWarning", 2), ("memCritical", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsAlarmStatus.setDescription("The alarm status of the sensor.")
+memSensorsConfigTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 4), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsConfigTableSize.setDescription("The number of entries in the memSensorsConfigTable.")
+memSensorsConfigTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5))
+if mibBuilder.loadTexts: memSensorsConfigTable.setDescription("Allows for getting configuration information from \nsensors attached to the system.")
+memSensorsConfigEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1)).setIndexNames((0, "PowerNet-MIB", "memSensorsConfigModuleNumber"), (0, "PowerNet-MIB", "memSensorsConfigSensorNumber"))
+if mibBuilder.loadTexts: memSensorsConfigEntry.setDescription("The unit to get data from.")
+memSensorsConfigModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsConfigModuleNumber.setDescription("The number of the module that the sensor is attached to.")
+memSensorsConfigSensorNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memSensorsConfigSensorNumber.setDescription("The number of this sensor on the module.")
+memSensorsName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 3), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsName.setDescription("A descriptive name for the sensor.")
+memSensorsLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 4), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsLocation.setDescription("The location of the sensor.")
+memSensorsAlarmGeneration = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsAlarmGeneration.setDescription("Enable or disable alarm generation on this sensor.")
+memSensorsTempMaxThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 6), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempMaxThresh.setDescription("The temperature at which the MEM will generate a maximum\ntemperature threshold violation alarm on this sensor.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempHighThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 7), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempHighThresh.setDescription("The temperature at which the MEM will generate a high\ntemperature threshold violation alarm on this sensor.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempLowThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 8), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempLowThresh.setDescription("The temperature at which the MEM will generate a low\ntemperature threshold violation alarm on this sensor.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempMinThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 9), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempMinThresh.setDescription("The temperature at which the MEM will generate a minimum\ntemperature threshold violation alarm on this sensor.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempThreshHysteresis = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 10), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempThreshHysteresis.setDescription("The change in temperature required to cause a\ntemperature alarm to change from an active to an inactive state.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempShortDecRateThreshValue = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 11), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempShortDecRateThreshValue.setDescription("The value of the temperature short-term decreasing rate\ntime that will cause an alarm to be generated.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempShortDecRateThreshTime = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 12), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempShortDecRateThreshTime.setDescription("The time over which the temperature may not decrease\nbeyond the value specified by the temperature short-term\ndecreasing rate threshold value.")
+memSensorsTempShortIncRateThreshValue = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 13), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempShortIncRateThreshValue.setDescription("The value of the temperature short-term increasing rate\ntime that will cause an alarm to be generated.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempShortIncRateThreshTime = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 14), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempShortIncRateThreshTime.setDescription("The time over which the temperature may not increase\nbeyond the value specified by the temperature short-term\nincreasing rate threshold value.")
+memSensorsTempLongDecRateThreshValue = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 15), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempLongDecRateThreshValue.setDescription("The value of the temperature long-term decreasing rate\ntime that will cause an alarm to be generated.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempLongDecRateThreshTime = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 16), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempLongDecRateThreshTime.setDescription("The time over which the temperature may not decrease\nbeyond the value specified by the temperature long-term\ndecreasing rate threshold value.")
+memSensorsTempLongIncRateThreshValue = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 17), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempLongIncRateThreshValue.setDescription("The value of the temperature long-term increasing rate\ntime that will cause an alarm to be generated.\nThe temperature scale is based on the memSensorsStatusSysTempUnits OID.")
+memSensorsTempLongIncRateThreshTime = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 18), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsTempLongIncRateThreshTime.setDescription("The time over which the temperature may not increase\nbeyond the value specified by the temperature long-term\nincreasing rate threshold value.")
+memSensorsHumidityMaxThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 19), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsHumidityMaxThresh.setDescription("The humidity at which the maximum humidity threshold alarm\nwill be generated.")
+memSensorsHumidityHighThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 20), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsHumidityHighThresh.setDescription("The humidity at which the high humidity threshold alarm\nwill be generated.")
+memSensorsHumidityLowThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 21), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsHumidityLowThresh.setDescription("The humidity at which the low humidity threshold alarm\nwill be generated.")
+memSensorsHumidityMinThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 22), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsHumidityMinThresh.setDescription("The humidity at which the minimum humidity threshold alarm\nwill be generated.")
+memSensorsHumidityThreshHysteresis = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 2, 5, 1, 23), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memSensorsHumidityThreshHysteresis.setDescription("The change in humidity required to cause an active humidity\nalarm to change to the inactive state.")
+memInputs = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3))
+memInputsStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusTableSize.setDescription("The number of entries in the memInputsStatusTable.")
+memInputsStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2))
+if mibBuilder.loadTexts: memInputsStatusTable.setDescription("Allows for getting input status information.")
+memInputsStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1)).setIndexNames((0, "PowerNet-MIB", "memInputsStatusModuleNumber"), (0, "PowerNet-MIB", "memInputsStatusInputNumber"))
+if mibBuilder.loadTexts: memInputsStatusEntry.setDescription("The unit to get data from.")
+memInputsStatusModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusModuleNumber.setDescription("The number of the module that the input is attached to.")
+memInputsStatusInputNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusInputNumber.setDescription("The number of this input on the module.")
+memInputsStatusInputName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusInputName.setDescription("The input name.")
+memInputsStatusInputLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusInputLocation.setDescription("The location of the input.")
+memInputsStatusCurrentState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,4,2,)).subtype(namedValues=NamedValues(("inputClosedHighMEM", 1), ("inputOpenLowMEM", 2), ("inputDisabled", 3), ("inputStateNotApplicable", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusCurrentState.setDescription("The current state of the input. This OID will return \ninputStateNotAplicable(4) for analog input types. ")
+memInputsStatusCurrentAnalogValue = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 6), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusCurrentAnalogValue.setDescription("The current analog value of the input in the units defined\nby the user.")
+memInputsStatusAlarmStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(3,1,2,)).subtype(namedValues=NamedValues(("memNormal", 1), ("memWarning", 2), ("memCritical", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsStatusAlarmStatus.setDescription("The alarm status of the input.")
+memInputsCommStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 2, 1, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("notInstalled", 1), ("commsOK", 2), ("commsLost", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsCommStatus.setDescription("The communications status of the input. This OID is only supported by NBRK0200.")
+memInputsConfigTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsConfigTableSize.setDescription("The number of entries in the memInputsConfigTable.")
+memInputsConfigTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4))
+if mibBuilder.loadTexts: memInputsConfigTable.setDescription("Allows for getting input configuration information.")
+memInputsConfigEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1)).setIndexNames((0, "PowerNet-MIB", "memInputsConfigModuleNumber"), (0, "PowerNet-MIB", "memInputsConfigInputNumber"))
+if mibBuilder.loadTexts: memInputsConfigEntry.setDescription("The unit to get data from.")
+memInputsConfigModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsConfigModuleNumber.setDescription("The number of the module that the input is attached to.")
+memInputsConfigInputNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memInputsConfigInputNumber.setDescription("The number of this input on the module.")
+memInputName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 3), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputName.setDescription("The name of the input.")
+memInputLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 4), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputLocation.setDescription("The location of the input.")
+memInputType = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(3,2,1,4,5,)).subtype(namedValues=NamedValues(("noConnection", 1), ("dryContact", 2), ("digital", 3), ("analogmAmps", 4), ("analogVolts", 5), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputType.setDescription("The type of input this contact will take.")
+memInputAlarmGeneration = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("disabled", 1), ("enabled", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAlarmGeneration.setDescription("Enable or disable alarm generation on this input.")
+memInputNormalState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,4,2,)).subtype(namedValues=NamedValues(("inputClosedHighMEM", 1), ("inputOpenLowMEM", 2), ("inputDisabled", 3), ("inputStateNotApplicable", 4), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputNormalState.setDescription("Defines the normal (no alarm) state of the input.")
+memInputAbnormalSeverity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 8), Integer().subtype(subtypeSpec=SingleValueConstraint(4,2,1,3,)).subtype(namedValues=NamedValues(("inputSeverityinformational", 1), ("inputSeveritywarning", 2), ("inputSeveritysevere", 3), ("inputSeverityNotApplicable", 4), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAbnormalSeverity.setDescription("Defines the severity of the event that is associated\nwith the abnormal state of the input.  This OID will return \ninputSeverityNotApplicable(4) for analog input types. ")
+memInputNumberCalibrationPoints = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 9), Integer32()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputNumberCalibrationPoints.setDescription("The number of calibration points that are required for\nthis input.")
+memInputAnalogCalibrationPoint1 = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 10), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint1.setDescription("The electrical value that the input sensor will measure at the\nfirst calibration point.  \nThis OID is relevant only for inputs configured as analog type (ma or V).")
+memInputAnalogCalibrationPoint2 = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 11), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint2.setDescription("The electrical value that the input sensor will measure at the\nsecond calibration point.  \nThis OID is relevant only for inputs configured as analog type (ma or V).")
+memInputAnalogCalibrationPoint3 = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 12), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint3.setDescription("The electrical value that the input sensor will measure at the\nthird calibration point.  \nThis OID is relevant only for inputs configured as analog type (ma or V).")
+memInputAnalogCalibrationPoint4 = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 13), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint4.setDescription("The electrical value that the input sensor will measure at the\nfourth calibration point.  \nThis OID is relevant only for inputs configured as analog type (ma or V).")
+memInputAnalogCalibrationPoint5 = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 14), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint5.setDescription("The electrical value that the input sensor will measure at the\nfifth calibration point.  \nThis OID is relevant only for inputs configured as analog type (ma or V).")
+memInputAnalogCalibrationPoint1Value = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 15), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint1Value.setDescription("The value of the input, in units of measure defined by\nthe user, that corresponds to the current setting at the\nfirst calibration point.")
+memInputAnalogCalibrationPoint2Value = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 16), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint2Value.setDescription("The value of the input, in units of measure defined by\nthe user, that corresponds to the current setting at the\nsecond calibration point.")
+memInputAnalogCalibrationPoint3Value = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 17), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint3Value.setDescription("The value of the input, in units of measure defined by\nthe user, that corresponds to the current setting at the\nthird calibration point.")
+memInputAnalogCalibrationPoint4Value = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 18), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint4Value.setDescription("The value of the input, in units of measure defined by\nthe user, that corresponds to the current setting at the\nfourth calibration point.")
+memInputAnalogCalibrationPoint5Value = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 19), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogCalibrationPoint5Value.setDescription("The value of the input, in units of measure defined by\nthe user, that corresponds to the current setting at the\nfifth calibration point.")
+memInputAnalogMeasurementUnits = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 20), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogMeasurementUnits.setDescription("The units of measure to be used for this input.")
+memInputAnalogMaxThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 21), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogMaxThresh.setDescription("The input value at which a maximum threshold violation\nalarm will be generated on this input.")
+memInputAnalogHighThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 22), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogHighThresh.setDescription("The input value at which a high threshold violation\nalarm will be generated on this input.")
+memInputAnalogLowThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 23), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogLowThresh.setDescription("The input value at which a low threshold violation\nalarm will be generated on this input.")
+memInputAnalogMinThresh = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 24), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogMinThresh.setDescription("The input value at which a minimum threshold violation\nalarm will be generated on this input.")
+memInputAnalogThreshHysteresis = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 3, 4, 1, 25), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memInputAnalogThreshHysteresis.setDescription("The change in value required to cause an alarm on this input\nto change from active to inactive.")
+memOutputs = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4))
+memOutputStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputStatusTableSize.setDescription("The number of entries in the memOutputStatusTable.")
+memOutputStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2))
+if mibBuilder.loadTexts: memOutputStatusTable.setDescription("Allows for getting output status information.")
+memOutputStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1)).setIndexNames((0, "PowerNet-MIB", "memOutputStatusModuleNumber"), (0, "PowerNet-MIB", "memOutputStatusOutputNumber"))
+if mibBuilder.loadTexts: memOutputStatusEntry.setDescription("The unit to get data from.")
+memOutputStatusModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputStatusModuleNumber.setDescription("The number of the module that the output is attached to.")
+memOutputStatusOutputNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputStatusOutputNumber.setDescription("The number of this output on the module.")
+memOutputStatusOutputName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputStatusOutputName.setDescription("The output name.")
+memOutputStatusOutputLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputStatusOutputLocation.setDescription("The location of the output.")
+memOutputStatusCurrentState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("memOutputClosed", 1), ("memOutputOpen", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputStatusCurrentState.setDescription("The state of the output.")
+memOutputConfigTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputConfigTableSize.setDescription("The number of entries in the memOutputConfigTable.")
+memOutputConfigTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4))
+if mibBuilder.loadTexts: memOutputConfigTable.setDescription("Allows for getting output configuration information.")
+memOutputConfigEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1)).setIndexNames((0, "PowerNet-MIB", "memOutputConfigModuleNumber"), (0, "PowerNet-MIB", "memOutputConfigOutputNumber"))
+if mibBuilder.loadTexts: memOutputConfigEntry.setDescription("The unit to get data from.")
+memOutputConfigModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputConfigModuleNumber.setDescription("The number of the module that the output is attached to.")
+memOutputConfigOutputNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutputConfigOutputNumber.setDescription("The number of this output on the module.")
+memOutputName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 3), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutputName.setDescription("The name of the output.")
+memOutputLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 4), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutputLocation.setDescription("The location of the output.")
+memOutputNormalState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,)).subtype(namedValues=NamedValues(("memOutputClosed", 1), ("memOutputOpen", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutputNormalState.setDescription("The state of the output that will not generate an alarm.")
+memOutputAction = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 4, 4, 1, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("memActionClose", 1), ("memActionOpen", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutputAction.setDescription("Manual control actions for the output. SNMP get command will return the state\nof the output, SNMP set of this OID controls the output.")
+memOutlets = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5))
+memOutletStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletStatusTableSize.setDescription("The number of entries in the memOutletStatusTable.")
+memOutletStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2))
+if mibBuilder.loadTexts: memOutletStatusTable.setDescription("Allows for getting outlet status information.")
+memOutletStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1)).setIndexNames((0, "PowerNet-MIB", "memOutletStatusModuleNumber"), (0, "PowerNet-MIB", "memOutletStatusOutletNumber"))
+if mibBuilder.loadTexts: memOutletStatusEntry.setDescription("The unit to get data from.")
+memOutletStatusModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletStatusModuleNumber.setDescription("The number of the module that the outlet is attached to.")
+memOutletStatusOutletNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletStatusOutletNumber.setDescription("The number of this outlet on the module.")
+memOutletStatusOutletName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletStatusOutletName.setDescription("The outlet name.")
+memOutletStatusOutletLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletStatusOutletLocation.setDescription("The location of the outlet.")
+memOutletStatusCurrentState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("off", 1), ("on", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletStatusCurrentState.setDescription("The state of the outlet.")
+memOutletConfigTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletConfigTableSize.setDescription("The number of entries in the memOutletConfigTable.")
+memOutletConfigTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4))
+if mibBuilder.loadTexts: memOutletConfigTable.setDescription("Allows for getting outlet configuration information.")
+memOutletConfigEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1)).setIndexNames((0, "PowerNet-MIB", "memOutletConfigModuleNumber"), (0, "PowerNet-MIB", "memOutletConfigOutletNumber"))
+if mibBuilder.loadTexts: memOutletConfigEntry.setDescription("The unit to get data from.")
+memOutletConfigModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletConfigModuleNumber.setDescription("The number of the module that the Outlet is attached to.")
+memOutletConfigOutletNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memOutletConfigOutletNumber.setDescription("The number of this Outlet on the module.")
+memOutletName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 3), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutletName.setDescription("The name of the Outlet.")
+memOutletLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 4), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutletLocation.setDescription("The location of the Outlet.")
+memOutletNormalState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("off", 1), ("on", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutletNormalState.setDescription("The state of the Outlet that will not generate an alarm.")
+memOutletAction = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 5, 4, 1, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("turnOff", 1), ("turnOn", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memOutletAction.setDescription("Manual control actions for the Outlet.  Get displays state\nof outlet, set controls outlet.")
+memBeacons = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6))
+memBeaconStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconStatusTableSize.setDescription("The number of entries in the memBeaconStatusTable.")
+memBeaconStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2))
+if mibBuilder.loadTexts: memBeaconStatusTable.setDescription("Allows for getting beacon status information.")
+memBeaconStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1)).setIndexNames((0, "PowerNet-MIB", "memBeaconStatusModuleNumber"), (0, "PowerNet-MIB", "memBeaconStatusBeaconNumber"))
+if mibBuilder.loadTexts: memBeaconStatusEntry.setDescription("The unit to get data from.")
+memBeaconStatusModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconStatusModuleNumber.setDescription("The number of the module that the beacon is attached to.")
+memBeaconStatusBeaconNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconStatusBeaconNumber.setDescription("The number of this beacon on the module.")
+memBeaconStatusBeaconName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconStatusBeaconName.setDescription("The beacon name.")
+memBeaconStatusBeaconLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconStatusBeaconLocation.setDescription("The location of the beacon.")
+memBeaconStatusCurrentState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("off", 1), ("on", 2), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconStatusCurrentState.setDescription("The state of the beacon.")
+memBeaconConfigTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 3), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconConfigTableSize.setDescription("The number of entries in the memBeaconConfigTable.")
+memBeaconConfigTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4))
+if mibBuilder.loadTexts: memBeaconConfigTable.setDescription("Allows for getting beacon configuration information.")
+memBeaconConfigEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1)).setIndexNames((0, "PowerNet-MIB", "memBeaconConfigModuleNumber"), (0, "PowerNet-MIB", "memBeaconConfigBeaconNumber"))
+if mibBuilder.loadTexts: memBeaconConfigEntry.setDescription("The unit to get data from.")
+memBeaconConfigModuleNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconConfigModuleNumber.setDescription("The number of the module that the beacon is attached to.")
+memBeaconConfigBeaconNumber = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: memBeaconConfigBeaconNumber.setDescription("The number of this beacon on the module.")
+memBeaconConfigName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 3), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memBeaconConfigName.setDescription("The name of the beacon.")
+memBeaconConfigLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 4), DisplayString()).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memBeaconConfigLocation.setDescription("The location of the beacon.")
+memBeaconAction = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 10, 4, 6, 4, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,)).subtype(namedValues=NamedValues(("turnOff", 1), ("turnOn", 2), ))).setMaxAccess("readwrite")
+if mibBuilder.loadTexts: memBeaconAction.setDescription("Control action (on/off) for the beacon. Setting this OID will turn the\nbeacon on/off.  Getting this OID will respond with the current state.")
+universalInputOutput = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 25))
+uioSensor = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1))
+uioSensorStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusTableSize.setDescription("The number of entries in the uioSensorStatusTable.")
+uioSensorStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2))
+if mibBuilder.loadTexts: uioSensorStatusTable.setDescription("Allows for getting sensor status information.")
+uioSensorStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1)).setIndexNames((0, "PowerNet-MIB", "uioSensorStatusPortID"), (0, "PowerNet-MIB", "uioSensorStatusSensorID"))
+if mibBuilder.loadTexts: uioSensorStatusEntry.setDescription("The unit from which to get data.")
+uioSensorStatusPortID = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusPortID.setDescription("The ID of the Universal IO port to which the sensor is attached.")
+uioSensorStatusSensorID = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusSensorID.setDescription("The ID of the sensor.")
+uioSensorStatusSensorName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusSensorName.setDescription("The sensor name.")
+uioSensorStatusSensorLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusSensorLocation.setDescription("The location of the sensor.")
+uioSensorStatusTemperatureDegF = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 5), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusTemperatureDegF.setDescription("The sensor's current temperature reading in tenths of degrees Fahrenheit.")
+uioSensorStatusTemperatureDegC = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 6), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusTemperatureDegC.setDescription("The sensor's current temperature reading in tenths of degrees Celsius.")
+uioSensorStatusHumidity = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 7), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusHumidity.setDescription("The current humidity reading in tenths of percent from the sensor.")
+uioSensorStatusViolationStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 8), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusViolationStatus.setDescription("The violation status of the sensor.  This integer should be interpreted\nas a bit map, with each bit representing the presence or absence of\nthe specific alarm conditions listed below.  The bit will be '1' if\nthe condition is present, and '0' if the condition is not present.\n\nBit  Hex. Value  Description\n1    0x0001      Maximum temperature exceeded.\n2    0x0002      High temperature exceeded.\n3    0x0004      Low temperature exceeded.\n4    0x0008      Minimum temperature exceeded.\n5    0x0010      Short-term increasing temperature rate exceeded (Not used).\n6    0x0020      Short-term decreasing temperature rate exceeded (Not used).\n7    0x0040      Long-term increasing temperature rate exceeded (Not used).\n8    0x0080      Long-term decreasing temperature rate exceeded (Not used).\n9    0x0100      Maximum humidity exceeded.\n10   0x0200      High humidity exceeded.\n11   0x0400      Low humidity exceeded.\n12   0x0800      Minimum humidity exceeded.")
+uioSensorStatusAlarmStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 9), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,3,4,)).subtype(namedValues=NamedValues(("uioNormal", 1), ("uioWarning", 2), ("uioCritical", 3), ("sensorStatusNotApplicable", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusAlarmStatus.setDescription("The alarm status of the sensor.")
+uioSensorStatusCommStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 1, 2, 1, 10), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("notInstalled", 1), ("commsOK", 2), ("commsLost", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioSensorStatusCommStatus.setDescription("The communications status of the sensor.")
+uioInputContact = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2))
+uioInputContactStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusTableSize.setDescription("The number of entries in the uioInputContactStatusTable.")
+uioInputContactStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2))
+if mibBuilder.loadTexts: uioInputContactStatusTable.setDescription("Allows for getting input contact status information.")
+uioInputContactStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1)).setIndexNames((0, "PowerNet-MIB", "uioInputContactStatusPortID"), (0, "PowerNet-MIB", "uioInputContactStatusContactID"))
+if mibBuilder.loadTexts: uioInputContactStatusEntry.setDescription("The input contact from which to get data.")
+uioInputContactStatusPortID = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusPortID.setDescription("The ID of the port to which the input contact is attached.")
+uioInputContactStatusContactID = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusContactID.setDescription("The ID of the input contact on the module.")
+uioInputContactStatusContactName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusContactName.setDescription("The input contact name.")
+uioInputContactStatusContactLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusContactLocation.setDescription("The location of the input contact.")
+uioInputContactStatusCurrentState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(1,2,3,4,)).subtype(namedValues=NamedValues(("uioInputClosed", 1), ("uioInputOpen", 2), ("uioInputDisabled", 3), ("inputStateNotApplicable", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusCurrentState.setDescription("The current state of the input contact. ")
+uioInputContactStatusAlarmStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,4,3,)).subtype(namedValues=NamedValues(("uioNormal", 1), ("uioWarning", 2), ("uioCritical", 3), ("inputStatusNotApplicable", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusAlarmStatus.setDescription("The alarm status of the input contact.")
+uioInputContactStatusCommStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 2, 2, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("notInstalled", 1), ("commsOK", 2), ("commsLost", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioInputContactStatusCommStatus.setDescription("The communications status of the input contact.")
+uioOutputRelay = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3))
+uioOutputRelayStatusTableSize = MibScalar((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusTableSize.setDescription("The number of entries in the uioOutputRelayStatusTable.")
+uioOutputRelayStatusTable = MibTable((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2))
+if mibBuilder.loadTexts: uioOutputRelayStatusTable.setDescription("Allows for getting output relay status information.")
+uioOutputRelayStatusEntry = MibTableRow((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1)).setIndexNames((0, "PowerNet-MIB", "uioOutputRelayStatusPortID"), (0, "PowerNet-MIB", "uioOutputRelayStatusRelayID"))
+if mibBuilder.loadTexts: uioOutputRelayStatusEntry.setDescription("The unit from which to get data.")
+uioOutputRelayStatusPortID = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 1), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusPortID.setDescription("The ID of the module to which the output relay is attached.")
+uioOutputRelayStatusRelayID = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 2), Integer32()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusRelayID.setDescription("The ID of the output relay on the module.")
+uioOutputRelayStatusRelayName = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 3), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusRelayName.setDescription("The output relay name.")
+uioOutputRelayStatusRelayLocation = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 4), DisplayString()).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusRelayLocation.setDescription("The location of the output relay.")
+uioOutputRelayStatusCurrentState = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 5), Integer().subtype(subtypeSpec=SingleValueConstraint(3,2,1,)).subtype(namedValues=NamedValues(("uioOutputClosed", 1), ("uioOutputOpen", 2), ("outputStateNotApplicable", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusCurrentState.setDescription("The current state of the output relay.")
+uioOutputRelayStatusAlarmStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 6), Integer().subtype(subtypeSpec=SingleValueConstraint(2,1,4,3,)).subtype(namedValues=NamedValues(("uioNormal", 1), ("uioWarning", 2), ("uioCritical", 3), ("inputStatusNotApplicable", 4), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusAlarmStatus.setDescription("The alarm status of the output relay.")
+uioOutputRelayStatusCommStatus = MibTableColumn((1, 3, 6, 1, 4, 1, 318, 1, 1, 25, 3, 2, 1, 7), Integer().subtype(subtypeSpec=SingleValueConstraint(1,3,2,)).subtype(namedValues=NamedValues(("notInstalled", 1), ("commsOK", 2), ("commsLost", 3), ))).setMaxAccess("readonly")
+if mibBuilder.loadTexts: uioOutputRelayStatusCommStatus.setDescription("The communications status of the output relay.")
+system = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 3))
+monitors = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 3, 8))
+mem = MibIdentifier((1, 3, 6, 1, 4, 1, 318, 1, 3, 8, 4))
+
+# Exports
+
+# Types
+
+# Objects
+mibBuilder.exportSymbols("PowerNet-MIB", apc=apc, products=products, hardware=hardware, ups=ups, upsIdent=upsIdent, upsBasicIdent=upsBasicIdent, upsBasicIdentModel=upsBasicIdentModel, upsBasicIdentName=upsBasicIdentName, upsAdvIdent=upsAdvIdent, upsAdvIdentFirmwareRevision=upsAdvIdentFirmwareRevision, upsAdvIdentDateOfManufacture=upsAdvIdentDateOfManufacture, upsAdvIdentSerialNumber=upsAdvIdentSerialNumber, upsAdvIdentFirmwareRevision2=upsAdvIdentFirmwareRevision2, upsAdvIdentSkuNumber=upsAdvIdentSkuNumber, upsBattery=upsBattery, upsBasicBattery=upsBasicBattery, upsBasicBatteryStatus=upsBasicBatteryStatus, upsBasicBatteryTimeOnBattery=upsBasicBatteryTimeOnBattery, upsBasicBatteryLastReplaceDate=upsBasicBatteryLastReplaceDate, upsAdvBattery=upsAdvBattery, upsAdvBatteryCapacity=upsAdvBatteryCapacity, upsAdvBatteryTemperature=upsAdvBatteryTemperature, upsAdvBatteryRunTimeRemaining=upsAdvBatteryRunTimeRemaining, upsAdvBatteryReplaceIndicator=upsAdvBatteryReplaceIndicator, upsAdvBatteryNumOfBattPacks=upsAdvBatteryNumOfBattPacks, upsAdvBatteryNumOfBadBattPacks=upsAdvBatteryNumOfBadBattPacks, upsAdvBatteryNominalVoltage=upsAdvBatteryNominalVoltage, upsAdvBatteryActualVoltage=upsAdvBatteryActualVoltage, upsAdvBatteryCurrent=upsAdvBatteryCurrent, upsAdvTotalDCCurrent=upsAdvTotalDCCurrent, upsAdvBatteryFullCapacity=upsAdvBatteryFullCapacity, upsAdvBatteryActualVoltageTable=upsAdvBatteryActualVoltageTable, upsAdvBatteryActualVoltageEntry=upsAdvBatteryActualVoltageEntry, upsAdvBatteryActualVoltageTableIndex=upsAdvBatteryActualVoltageTableIndex, upsAdvBatteryActualVoltagePolarity=upsAdvBatteryActualVoltagePolarity, upsAdvBatteryFrameActualVoltage=upsAdvBatteryFrameActualVoltage, upsAdvTotalDCCurrentTable=upsAdvTotalDCCurrentTable, upsAdvTotalDCCurrentEntry=upsAdvTotalDCCurrentEntry, upsAdvTotalDCCurrentTableIndex=upsAdvTotalDCCurrentTableIndex, upsAdvTotalDCCurrentPolarity=upsAdvTotalDCCurrentPolarity, upsAdvTotalFrameDCCurrent=upsAdvTotalFrameDCCurrent, upsAdvBatteryCurrentTable=upsAdvBatteryCurrentTable, upsAdvBatteryCurrentEntry=upsAdvBatteryCurrentEntry, upsAdvBatteryCurrentTableIndex=upsAdvBatteryCurrentTableIndex, upsAdvBatteryCurrentIndex=upsAdvBatteryCurrentIndex, upsAdvBatteryCurrentPolarity=upsAdvBatteryCurrentPolarity, upsAdvBatteryFrameCurrent=upsAdvBatteryFrameCurrent, upsAdvBatteryEstimatedChargeTime=upsAdvBatteryEstimatedChargeTime, upsAdvBatteryPower=upsAdvBatteryPower, upsAdvBatteryChargerStatus=upsAdvBatteryChargerStatus, upsAdvBatteryInternalSKU=upsAdvBatteryInternalSKU, upsAdvBatteryExternalSKU=upsAdvBatteryExternalSKU, upsAdvBatteryRecommendedReplaceDate=upsAdvBatteryRecommendedReplaceDate, upsHighPrecBattery=upsHighPrecBattery, upsHighPrecBatteryCapacity=upsHighPrecBatteryCapacity, upsHighPrecBatteryTemperature=upsHighPrecBatteryTemperature, upsHighPrecBatteryNominalVoltage=upsHighPrecBatteryNominalVoltage, upsHighPrecBatteryActualVoltage=upsHighPrecBatteryActualVoltage, upsHighPrecBatteryCurrent=upsHighPrecBatteryCurrent, upsHighPrecTotalDCCurrent=upsHighPrecTotalDCCurrent, upsHighPrecBatteryActualVoltageTable=upsHighPrecBatteryActualVoltageTable, upsHighPrecBatteryActualVoltageEntry=upsHighPrecBatteryActualVoltageEntry, upsHighPrecBatteryActualVoltageTableIndex=upsHighPrecBatteryActualVoltageTableIndex, upsHighPrecBatteryActualVoltagePolarity=upsHighPrecBatteryActualVoltagePolarity, upsHighPrecBatteryVoltage=upsHighPrecBatteryVoltage, upsHighPrecTotalDCCurrentTable=upsHighPrecTotalDCCurrentTable, upsHighPrecTotalDCCurrentEntry=upsHighPrecTotalDCCurrentEntry, upsHighPrecTotalDCCurrentTableIndex=upsHighPrecTotalDCCurrentTableIndex, upsHighPrecTotalDCCurrentPolarity=upsHighPrecTotalDCCurrentPolarity, upsHighPrecTotalDCFrameCurrent=upsHighPrecTotalDCFrameCurrent, upsHighPrecBatteryCurrentTable=upsHighPrecBatteryCurrentTable, upsHighPrecBatteryCurrentEntry=upsHighPrecBatteryCurrentEntry, upsHighPrecBatteryCurrentTableIndex=upsHighPrecBatteryCurrentTableIndex, upsHighPrecBatteryCurrentIndex=upsHighPrecBatteryCurrentIndex, upsHighPrecBatteryCurrentPolarity=upsHighPrecBatteryCurrentPolarity, upsHighPrecBatteryFrameCurrent=upsHighPrecBatteryFrameCurrent, upsHighPrecBatteryPacks=upsHighPrecBatteryPacks, upsHighPrecBatteryPackTableSize=upsHighPrecBatteryPackTableSize, upsHighPrecBatteryPackTable=upsHighPrecBatteryPackTable, upsHighPrecBatteryPackEntry=upsHighPrecBatteryPackEntry, upsHighPrecBatteryPackIndex=upsHighPrecBatteryPackIndex, upsHighPrecBatteryCartridgeIndex=upsHighPrecBatteryCartridgeIndex, upsHighPrecBatteryPackFirmwareRevision=upsHighPrecBatteryPackFirmwareRevision, upsHighPrecBatteryPackSerialNumber=upsHighPrecBatteryPackSerialNumber, upsHighPrecBatteryPackTemperature=upsHighPrecBatteryPackTemperature, upsHighPrecBatteryPackStatus=upsHighPrecBatteryPackStatus, upsHighPrecBatteryPackCartridgeHealth=upsHighPrecBatteryPackCartridgeHealth, upsHighPrecBatteryPackCartridgeReplaceDate=upsHighPrecBatteryPackCartridgeReplaceDate, upsHighPrecBatteryPackCartridgeInstallDate=upsHighPrecBatteryPackCartridgeInstallDate, upsHighPrecBatteryPackCartridgeStatus=upsHighPrecBatteryPackCartridgeStatus, upsInput=upsInput, upsBasicInput=upsBasicInput, upsBasicInputPhase=upsBasicInputPhase, upsAdvInput=upsAdvInput, upsAdvInputLineVoltage=upsAdvInputLineVoltage, upsAdvInputMaxLineVoltage=upsAdvInputMaxLineVoltage, upsAdvInputMinLineVoltage=upsAdvInputMinLineVoltage, upsAdvInputFrequency=upsAdvInputFrequency, upsAdvInputLineFailCause=upsAdvInputLineFailCause, upsAdvInputNominalFrequency=upsAdvInputNominalFrequency)
+mibBuilder.exportSymbols("PowerNet-MIB", upsAdvInputNominalVoltage=upsAdvInputNominalVoltage, upsAdvInputBypassNominalFrequency=upsAdvInputBypassNominalFrequency, upsAdvInputBypassNominalVoltage=upsAdvInputBypassNominalVoltage, upsAdvInputStatisticsTable=upsAdvInputStatisticsTable, upsAdvInputStatisticsEntry=upsAdvInputStatisticsEntry, upsAdvInputStatisticsIndex=upsAdvInputStatisticsIndex, upsAdvInputApparentPower=upsAdvInputApparentPower, upsAdvInputVoltageTHD=upsAdvInputVoltageTHD, upsAdvInputBypassVoltageTHD=upsAdvInputBypassVoltageTHD, upsAdvInputPeakCurrent=upsAdvInputPeakCurrent, upsAdvInputBypassPeakCurrent=upsAdvInputBypassPeakCurrent, upsAdvInputActivePower=upsAdvInputActivePower, upsAdvInputTotalApparentPower=upsAdvInputTotalApparentPower, upsAdvInputTotalActivePower=upsAdvInputTotalActivePower, upsAdvInputBypassTotalApparentPower=upsAdvInputBypassTotalApparentPower, upsAdvInputBypassTotalActivePower=upsAdvInputBypassTotalActivePower, upsHighPrecInput=upsHighPrecInput, upsHighPrecInputLineVoltage=upsHighPrecInputLineVoltage, upsHighPrecInputMaxLineVoltage=upsHighPrecInputMaxLineVoltage, upsHighPrecInputMinLineVoltage=upsHighPrecInputMinLineVoltage, upsHighPrecInputFrequency=upsHighPrecInputFrequency, upsHighPrecInputEnergyUsage=upsHighPrecInputEnergyUsage, upsHighPrecInputBypassVoltage=upsHighPrecInputBypassVoltage, upsHighPrecInputBypassFrequency=upsHighPrecInputBypassFrequency, upsOutput=upsOutput, upsBasicOutput=upsBasicOutput, upsBasicOutputStatus=upsBasicOutputStatus, upsBasicOutputPhase=upsBasicOutputPhase, upsBasicSystemStatus=upsBasicSystemStatus, upsBasicSystemInternalTemperature=upsBasicSystemInternalTemperature, upsBasicSystemInverterStatus=upsBasicSystemInverterStatus, upsBasicSystemPFCStatus=upsBasicSystemPFCStatus, upsBasicOutputACwiringConfiguration=upsBasicOutputACwiringConfiguration, upsAdvOutput=upsAdvOutput, upsAdvOutputVoltage=upsAdvOutputVoltage, upsAdvOutputFrequency=upsAdvOutputFrequency, upsAdvOutputLoad=upsAdvOutputLoad, upsAdvOutputCurrent=upsAdvOutputCurrent, upsAdvOutputRedundancy=upsAdvOutputRedundancy, upsAdvOutputKVACapacity=upsAdvOutputKVACapacity, upsAdvOutputNominalFrequency=upsAdvOutputNominalFrequency, upsAdvOutputActivePower=upsAdvOutputActivePower, upsAdvOutputApparentPower=upsAdvOutputApparentPower, upsAdvOutputStatisticsTable=upsAdvOutputStatisticsTable, upsAdvOutputStatisticsEntry=upsAdvOutputStatisticsEntry, upsAdvOutputStatisticsIndex=upsAdvOutputStatisticsIndex, upsAdvOutputPeakCurrent=upsAdvOutputPeakCurrent, upsAdvOutputCurrentTHD=upsAdvOutputCurrentTHD, upsAdvOutputCrestFactor=upsAdvOutputCrestFactor, upsAdvOutputNeutralCurrent=upsAdvOutputNeutralCurrent, upsHighPrecOutput=upsHighPrecOutput, upsHighPrecOutputVoltage=upsHighPrecOutputVoltage, upsHighPrecOutputFrequency=upsHighPrecOutputFrequency, upsHighPrecOutputLoad=upsHighPrecOutputLoad, upsHighPrecOutputCurrent=upsHighPrecOutputCurrent, upsHighPrecOutputEfficiency=upsHighPrecOutputEfficiency, upsHighPrecOutputEnergyUsage=upsHighPrecOutputEnergyUsage, upsConfig=upsConfig, upsBasicConfig=upsBasicConfig, upsBasicConfigNumDevices=upsBasicConfigNumDevices, upsBasicConfigDeviceTable=upsBasicConfigDeviceTable, upsBasicConfigDeviceEntry=upsBasicConfigDeviceEntry, upsAdvConfig=upsAdvConfig, upsAdvConfigRatedOutputVoltage=upsAdvConfigRatedOutputVoltage, upsAdvConfigHighTransferVolt=upsAdvConfigHighTransferVolt, upsAdvConfigLowTransferVolt=upsAdvConfigLowTransferVolt, upsAdvConfigAlarm=upsAdvConfigAlarm, upsAdvConfigAlarmTimer=upsAdvConfigAlarmTimer, upsAdvConfigMinReturnCapacity=upsAdvConfigMinReturnCapacity, upsAdvConfigSensitivity=upsAdvConfigSensitivity, upsAdvConfigLowBatteryRunTime=upsAdvConfigLowBatteryRunTime, upsAdvConfigReturnDelay=upsAdvConfigReturnDelay, upsAdvConfigShutoffDelay=upsAdvConfigShutoffDelay, upsAdvConfigUpsSleepTime=upsAdvConfigUpsSleepTime, upsAdvConfigSetEEPROMDefaults=upsAdvConfigSetEEPROMDefaults, upsAdvConfigDipSwitchTable=upsAdvConfigDipSwitchTable, upsAdvConfigDipSwitchEntry=upsAdvConfigDipSwitchEntry, upsAdvConfigBattExhaustThresh=upsAdvConfigBattExhaustThresh, upsAdvConfigPassword=upsAdvConfigPassword, upsAdvConfigAllowedSetTable=upsAdvConfigAllowedSetTable, upsAdvConfigAllowedSetEntry=upsAdvConfigAllowedSetEntry, upsAdvConfigBattCabAmpHour=upsAdvConfigBattCabAmpHour, upsAdvConfigPositionSelector=upsAdvConfigPositionSelector, upsAdvConfigOutputFreqRange=upsAdvConfigOutputFreqRange, upsAdvConfigUPSFail=upsAdvConfigUPSFail, upsAdvConfigAlarmRedundancy=upsAdvConfigAlarmRedundancy, upsAdvConfigAlarmLoadOver=upsAdvConfigAlarmLoadOver, upsAdvConfigAlarmRuntimeUnder=upsAdvConfigAlarmRuntimeUnder, upsAdvConfigVoutReporting=upsAdvConfigVoutReporting, upsAdvConfigNumExternalBatteries=upsAdvConfigNumExternalBatteries, upsAdvConfigSimpleSignalShutdowns=upsAdvConfigSimpleSignalShutdowns, upsAdvConfigMaxShutdownTime=upsAdvConfigMaxShutdownTime, upsAsiUpsControlServerRequestShutdown=upsAsiUpsControlServerRequestShutdown, upsAdvConfigMinReturnRuntime=upsAdvConfigMinReturnRuntime, upsAdvConfigBasicSignalLowBatteryDuration=upsAdvConfigBasicSignalLowBatteryDuration, upsAdvConfigBypassPhaseLockRequired=upsAdvConfigBypassPhaseLockRequired, upsAdvConfigOutputFreqSlewRate=upsAdvConfigOutputFreqSlewRate, upsAdvConfigChargerLevel=upsAdvConfigChargerLevel, upsAdvConfigBypassToleranceSetting=upsAdvConfigBypassToleranceSetting, upsAdvConfigMainsSetting=upsAdvConfigMainsSetting)
+mibBuilder.exportSymbols("PowerNet-MIB", upsAdvConfigACWiringSetting=upsAdvConfigACWiringSetting, upsAdvConfigUpperOutputVoltTolerance=upsAdvConfigUpperOutputVoltTolerance, upsAdvConfigLowerOutputVoltTolerance=upsAdvConfigLowerOutputVoltTolerance, upsAdvConfigUpperBypassVoltTolerance=upsAdvConfigUpperBypassVoltTolerance, upsAdvConfigLowerBypassVoltTolerance=upsAdvConfigLowerBypassVoltTolerance, upsAdvConfigOutofSyncBypassTransferDelay=upsAdvConfigOutofSyncBypassTransferDelay, upsAdvConfigWarningAlarmDelay=upsAdvConfigWarningAlarmDelay, upsAdvConfigInformationalAlarmDelay=upsAdvConfigInformationalAlarmDelay, upsAdvConfigGreenMode=upsAdvConfigGreenMode, upsAdvConfigLCDLocalLanguage=upsAdvConfigLCDLocalLanguage, upsAdvConfigLCDLockOut=upsAdvConfigLCDLockOut, upsAdvConfigChargerRate=upsAdvConfigChargerRate, upsAdvConfigBatterySelection=upsAdvConfigBatterySelection, upsAdvConfigBatteryHealthAlarmWarningTime=upsAdvConfigBatteryHealthAlarmWarningTime, upsAdvConfigBatteryHealthAlarmSleepTime=upsAdvConfigBatteryHealthAlarmSleepTime, upsControl=upsControl, upsBasicControl=upsBasicControl, upsBasicControlConserveBattery=upsBasicControlConserveBattery, upsAdvControl=upsAdvControl, upsAdvControlUpsOff=upsAdvControlUpsOff, upsAdvControlRebootShutdownUps=upsAdvControlRebootShutdownUps, upsAdvControlUpsSleep=upsAdvControlUpsSleep, upsAdvControlSimulatePowerFail=upsAdvControlSimulatePowerFail, upsAdvControlFlashAndBeep=upsAdvControlFlashAndBeep, upsAdvControlTurnOnUPS=upsAdvControlTurnOnUPS, upsAdvControlBypassSwitch=upsAdvControlBypassSwitch, upsAdvControlRebootUpsWithOrWithoutAC=upsAdvControlRebootUpsWithOrWithoutAC, upsAdvControlFirmwareUpdate=upsAdvControlFirmwareUpdate, upsTest=upsTest, upsBasicTest=upsBasicTest, upsAdvTest=upsAdvTest, upsAdvTestDiagnosticSchedule=upsAdvTestDiagnosticSchedule, upsAdvTestDiagnostics=upsAdvTestDiagnostics, upsAdvTestDiagnosticsResults=upsAdvTestDiagnosticsResults, upsAdvTestLastDiagnosticsDate=upsAdvTestLastDiagnosticsDate, upsAdvTestRuntimeCalibration=upsAdvTestRuntimeCalibration, upsAdvTestCalibrationResults=upsAdvTestCalibrationResults, upsAdvTestCalibrationDate=upsAdvTestCalibrationDate, upsAdvTestDiagnosticTime=upsAdvTestDiagnosticTime, upsAdvTestDiagnosticDay=upsAdvTestDiagnosticDay, upsComm=upsComm, upsCommStatus=upsCommStatus, upsPhase=upsPhase, upsPhaseResetValues=upsPhaseResetValues, upsPhaseResetMaxMinValues=upsPhaseResetMaxMinValues, upsPhaseInput=upsPhaseInput, upsPhaseNumInputs=upsPhaseNumInputs, upsPhaseInputTable=upsPhaseInputTable, upsPhaseInputEntry=upsPhaseInputEntry, upsPhaseInputTableIndex=upsPhaseInputTableIndex, upsPhaseNumInputPhases=upsPhaseNumInputPhases, upsPhaseInputVoltageOrientation=upsPhaseInputVoltageOrientation, upsPhaseInputFrequency=upsPhaseInputFrequency, upsPhaseInputType=upsPhaseInputType, upsPhaseInputName=upsPhaseInputName, upsPhaseInputPhaseTable=upsPhaseInputPhaseTable, upsPhaseInputPhaseEntry=upsPhaseInputPhaseEntry, upsPhaseInputPhaseTableIndex=upsPhaseInputPhaseTableIndex, upsPhaseInputPhaseIndex=upsPhaseInputPhaseIndex, upsPhaseInputVoltage=upsPhaseInputVoltage, upsPhaseInputMaxVoltage=upsPhaseInputMaxVoltage, upsPhaseInputMinVoltage=upsPhaseInputMinVoltage, upsPhaseInputCurrent=upsPhaseInputCurrent, upsPhaseInputMaxCurrent=upsPhaseInputMaxCurrent, upsPhaseInputMinCurrent=upsPhaseInputMinCurrent, upsPhaseInputPower=upsPhaseInputPower, upsPhaseInputMaxPower=upsPhaseInputMaxPower, upsPhaseInputMinPower=upsPhaseInputMinPower, upsPhaseInputApparentPower=upsPhaseInputApparentPower, upsPhaseInputPowerFactor=upsPhaseInputPowerFactor, upsPhaseOutput=upsPhaseOutput, upsPhaseNumOutputs=upsPhaseNumOutputs, upsPhaseOutputTable=upsPhaseOutputTable, upsPhaseOutputEntry=upsPhaseOutputEntry, upsPhaseOutputTableIndex=upsPhaseOutputTableIndex, upsPhaseNumOutputPhases=upsPhaseNumOutputPhases, upsPhaseOutputVoltageOrientation=upsPhaseOutputVoltageOrientation, upsPhaseOutputFrequency=upsPhaseOutputFrequency, upsPhaseOutputPhaseTable=upsPhaseOutputPhaseTable, upsPhaseOutputPhaseEntry=upsPhaseOutputPhaseEntry, upsPhaseOutputPhaseTableIndex=upsPhaseOutputPhaseTableIndex, upsPhaseOutputPhaseIndex=upsPhaseOutputPhaseIndex, upsPhaseOutputVoltage=upsPhaseOutputVoltage, upsPhaseOutputCurrent=upsPhaseOutputCurrent, upsPhaseOutputMaxCurrent=upsPhaseOutputMaxCurrent, upsPhaseOutputMinCurrent=upsPhaseOutputMinCurrent, upsPhaseOutputLoad=upsPhaseOutputLoad, upsPhaseOutputMaxLoad=upsPhaseOutputMaxLoad, upsPhaseOutputMinLoad=upsPhaseOutputMinLoad, upsPhaseOutputPercentLoad=upsPhaseOutputPercentLoad, upsPhaseOutputMaxPercentLoad=upsPhaseOutputMaxPercentLoad, upsPhaseOutputMinPercentLoad=upsPhaseOutputMinPercentLoad, upsPhaseOutputPower=upsPhaseOutputPower, upsPhaseOutputMaxPower=upsPhaseOutputMaxPower, upsPhaseOutputMinPower=upsPhaseOutputMinPower, upsPhaseOutputPercentPower=upsPhaseOutputPercentPower, upsPhaseOutputMaxPercentPower=upsPhaseOutputMaxPercentPower, upsPhaseOutputMinPercentPower=upsPhaseOutputMinPercentPower, upsPhaseOutputPowerFactor=upsPhaseOutputPowerFactor, upsSyncCtrlGroup=upsSyncCtrlGroup)
+mibBuilder.exportSymbols("PowerNet-MIB", upsSyncCtrlGroupConfig=upsSyncCtrlGroupConfig, upsSCGMembershipGroupNumber=upsSCGMembershipGroupNumber, upsSCGActiveMembershipStatus=upsSCGActiveMembershipStatus, upsSCGPowerSynchronizationDelayTime=upsSCGPowerSynchronizationDelayTime, upsSCGReturnBatteryCapacityOffset=upsSCGReturnBatteryCapacityOffset, upsSCGMultiCastIP=upsSCGMultiCastIP, upsSyncCtrlGroupStatus=upsSyncCtrlGroupStatus, upsSCGNumOfGroupMembers=upsSCGNumOfGroupMembers, upsSCGStatusTable=upsSCGStatusTable, upsSCGStatusEntry=upsSCGStatusEntry, upsSCGStatusTableIndex=upsSCGStatusTableIndex, upsSCGMemberIP=upsSCGMemberIP, upsSCGACInputStatus=upsSCGACInputStatus, upsSCGACOutputStatus=upsSCGACOutputStatus, upsState=upsState, upsBasicState=upsBasicState, upsBasicStateOutputState=upsBasicStateOutputState, upsAdvState=upsAdvState, upsAdvStateAbnormalConditions=upsAdvStateAbnormalConditions, upsAdvStateSymmetra3PhaseSpecificFaults=upsAdvStateSymmetra3PhaseSpecificFaults, upsAdvStateDP300ESpecificFaults=upsAdvStateDP300ESpecificFaults, upsAdvStateSymmetraSpecificFaults=upsAdvStateSymmetraSpecificFaults, upsAdvStateSmartUPSSpecificFaults=upsAdvStateSmartUPSSpecificFaults, upsAdvStateSystemMessages=upsAdvStateSystemMessages, upsAdvStateTotaltimeonbattery=upsAdvStateTotaltimeonbattery, upsAdvStateTotaltimeonbypass=upsAdvStateTotaltimeonbypass, upsAdvStateTotaltimeonNormal=upsAdvStateTotaltimeonNormal, upsAdvStateNumberoftimesonbattery=upsAdvStateNumberoftimesonbattery, upsAdvStateNumberoftimesbypass=upsAdvStateNumberoftimesbypass, upsAdvStateNumberoftimesNormal=upsAdvStateNumberoftimesNormal, upsAdvStateEcomode=upsAdvStateEcomode, upsOutletGroups=upsOutletGroups, upsOutletGroupStatus=upsOutletGroupStatus, upsOutletGroupStatusTableSize=upsOutletGroupStatusTableSize, upsOutletGroupStatusTable=upsOutletGroupStatusTable, upsOutletGroupStatusEntry=upsOutletGroupStatusEntry, upsOutletGroupStatusIndex=upsOutletGroupStatusIndex, upsOutletGroupStatusName=upsOutletGroupStatusName, upsOutletGroupStatusGroupState=upsOutletGroupStatusGroupState, upsOutletGroupStatusCommandPending=upsOutletGroupStatusCommandPending, upsOutletGroupStatusOutletType=upsOutletGroupStatusOutletType, upsOutletGroupConfig=upsOutletGroupConfig, upsOutletGroupConfigTableSize=upsOutletGroupConfigTableSize, upsOutletGroupConfigTable=upsOutletGroupConfigTable, upsOutletGroupConfigEntry=upsOutletGroupConfigEntry, upsOutletGroupConfigIndex=upsOutletGroupConfigIndex, upsOutletGroupConfigName=upsOutletGroupConfigName, upsOutletGroupConfigPowerOnDelay=upsOutletGroupConfigPowerOnDelay, upsOutletGroupConfigPowerOffDelay=upsOutletGroupConfigPowerOffDelay, upsOutletGroupConfigRebootDuration=upsOutletGroupConfigRebootDuration, upsOutletGroupConfigMinReturnRuntime=upsOutletGroupConfigMinReturnRuntime, upsOutletGroupConfigOutletType=upsOutletGroupConfigOutletType, upsOutletGroupConfigLoadShedControlSkipOffDelay=upsOutletGroupConfigLoadShedControlSkipOffDelay, upsOutletGroupConfigLoadShedControlAutoRestart=upsOutletGroupConfigLoadShedControlAutoRestart, upsOutletGroupConfigLoadShedControlTimeOnBattery=upsOutletGroupConfigLoadShedControlTimeOnBattery, upsOutletGroupConfigLoadShedControlRuntimeRemaining=upsOutletGroupConfigLoadShedControlRuntimeRemaining, upsOutletGroupConfigLoadShedControlInOverload=upsOutletGroupConfigLoadShedControlInOverload, upsOutletGroupConfigLoadShedTimeOnBattery=upsOutletGroupConfigLoadShedTimeOnBattery, upsOutletGroupConfigLoadShedRuntimeRemaining=upsOutletGroupConfigLoadShedRuntimeRemaining, upsOutletGroupControl=upsOutletGroupControl, upsOutletGroupControlTableSize=upsOutletGroupControlTableSize, upsOutletGroupControlTable=upsOutletGroupControlTable, upsOutletGroupControlEntry=upsOutletGroupControlEntry, upsOutletGroupControlIndex=upsOutletGroupControlIndex, upsOutletGroupControlName=upsOutletGroupControlName, upsOutletGroupControlCommand=upsOutletGroupControlCommand, upsOutletGroupControlOutletType=upsOutletGroupControlOutletType, upsDiagnostics=upsDiagnostics, upsDiagnosticIM=upsDiagnosticIM, upsDiagIMTableSize=upsDiagIMTableSize, upsDiagIMTable=upsDiagIMTable, upsDiagIMEntry=upsDiagIMEntry, upsDiagIMIndex=upsDiagIMIndex, upsDiagIMType=upsDiagIMType, upsDiagIMStatus=upsDiagIMStatus, upsDiagIMFirmwareRev=upsDiagIMFirmwareRev, upsDiagIMSlaveFirmwareRev=upsDiagIMSlaveFirmwareRev, upsDiagIMHardwareRev=upsDiagIMHardwareRev, upsDiagIMSerialNum=upsDiagIMSerialNum, upsDiagIMManufactureDate=upsDiagIMManufactureDate, upsDiagnosticPowerModules=upsDiagnosticPowerModules, upsDiagPMTableSize=upsDiagPMTableSize, upsDiagPMTable=upsDiagPMTable, upsDiagPMEntry=upsDiagPMEntry, upsDiagPMIndex=upsDiagPMIndex, upsDiagPMStatus=upsDiagPMStatus, upsDiagPMFirmwareRev=upsDiagPMFirmwareRev, upsDiagPMHardwareRev=upsDiagPMHardwareRev, upsDiagPMSerialNum=upsDiagPMSerialNum, upsDiagPMManufactureDate=upsDiagPMManufactureDate, upsDiagPMLifetimeInfoTable=upsDiagPMLifetimeInfoTable, upsDiagPMLifetimeInfoEntry=upsDiagPMLifetimeInfoEntry, upsDiagPMLifetimeInfoIndex=upsDiagPMLifetimeInfoIndex, upsDiagPMLifetimeStatus=upsDiagPMLifetimeStatus, upsDiagPMEstmtdLifetimeRmng=upsDiagPMEstmtdLifetimeRmng, upsDiagPMEstmtdLifetimeRmngPct=upsDiagPMEstmtdLifetimeRmngPct, upsDiagPMFanLifetimeStatus=upsDiagPMFanLifetimeStatus, upsDiagPMFanEstmtdLifetimeRmng=upsDiagPMFanEstmtdLifetimeRmng, upsDiagPMFanEstmtdLifetimeRmngPct=upsDiagPMFanEstmtdLifetimeRmngPct, upsDiagPMEnclDoorFltrTableSize=upsDiagPMEnclDoorFltrTableSize)
+mibBuilder.exportSymbols("PowerNet-MIB", upsDiagPMEnclDoorFltrTable=upsDiagPMEnclDoorFltrTable, upsDiagPMEnclDoorFltrEntry=upsDiagPMEnclDoorFltrEntry, upsDiagPMEnclIndex=upsDiagPMEnclIndex, upsDiagPMEnclDoorFltrLifetime=upsDiagPMEnclDoorFltrLifetime, upsDiagPMEnclDoorFltrStatus=upsDiagPMEnclDoorFltrStatus, upsDiagPMEnclDoorFltrEstmtdLifetimeRmng=upsDiagPMEnclDoorFltrEstmtdLifetimeRmng, upsDiagPMEnclDoorFltrEstmtdLifetimeRmngPct=upsDiagPMEnclDoorFltrEstmtdLifetimeRmngPct, upsDiagnosticBatteries=upsDiagnosticBatteries, upsDiagBatteryTableSize=upsDiagBatteryTableSize, upsDiagBatteryTable=upsDiagBatteryTable, upsDiagBatteryEntry=upsDiagBatteryEntry, upsDiagBatteryFrameIndex=upsDiagBatteryFrameIndex, upsDiagBatteryIndex=upsDiagBatteryIndex, upsDiagBatteryStatus=upsDiagBatteryStatus, upsDiagBatterySerialNumber=upsDiagBatterySerialNumber, upsDiagBatteryFirmwareRev=upsDiagBatteryFirmwareRev, upsDiagBatteryManufactureDate=upsDiagBatteryManufactureDate, upsDiagBatteryType=upsDiagBatteryType, upsDiagBatteryFramePresent=upsDiagBatteryFramePresent, upsDiagBatteryFrameTemperature=upsDiagBatteryFrameTemperature, upsDiagnosticSubsystem=upsDiagnosticSubsystem, upsDiagSubSysFrameTableSize=upsDiagSubSysFrameTableSize, upsDiagSubSysFrameTable=upsDiagSubSysFrameTable, upsDiagSubSysFrameEntry=upsDiagSubSysFrameEntry, upsDiagSubSysFrameIndex=upsDiagSubSysFrameIndex, upsDiagSubSysFrameType=upsDiagSubSysFrameType, upsDiagSubSysFrameFirmwareRev=upsDiagSubSysFrameFirmwareRev, upsDiagSubSysFrameHardwareRev=upsDiagSubSysFrameHardwareRev, upsDiagSubSysFrameSerialNum=upsDiagSubSysFrameSerialNum, upsDiagSubSysFrameManufactureDate=upsDiagSubSysFrameManufactureDate, upsDiagSubSysIntBypSwitchTableSize=upsDiagSubSysIntBypSwitchTableSize, upsDiagSubSysIntBypSwitchTable=upsDiagSubSysIntBypSwitchTable, upsDiagSubSysIntBypSwitchEntry=upsDiagSubSysIntBypSwitchEntry, upsDiagSubSysIntBypSwitchFrameIndex=upsDiagSubSysIntBypSwitchFrameIndex, upsDiagSubSysIntBypSwitchIndex=upsDiagSubSysIntBypSwitchIndex, upsDiagSubSysIntBypSwitchStatus=upsDiagSubSysIntBypSwitchStatus, upsDiagSubSysIntBypSwitchFirmwareRev=upsDiagSubSysIntBypSwitchFirmwareRev, upsDiagSubSysIntBypSwitchHardwareRev=upsDiagSubSysIntBypSwitchHardwareRev, upsDiagSubSysIntBypSwitchSerialNum=upsDiagSubSysIntBypSwitchSerialNum, upsDiagSubSysIntBypSwitchManufactureDate=upsDiagSubSysIntBypSwitchManufactureDate, upsDiagSubSysBattMonitorTableSize=upsDiagSubSysBattMonitorTableSize, upsDiagSubSysBattMonitorTable=upsDiagSubSysBattMonitorTable, upsDiagSubSysBattMonitorEntry=upsDiagSubSysBattMonitorEntry, upsDiagSubSysBattMonitorFrameIndex=upsDiagSubSysBattMonitorFrameIndex, upsDiagSubSysBattMonitorIndex=upsDiagSubSysBattMonitorIndex, upsDiagSubSysBattMonitorStatus=upsDiagSubSysBattMonitorStatus, upsDiagSubSysBattMonitorFirmwareRev=upsDiagSubSysBattMonitorFirmwareRev, upsDiagSubSysBattMonitorHardwareRev=upsDiagSubSysBattMonitorHardwareRev, upsDiagSubSysBattMonitorSerialNum=upsDiagSubSysBattMonitorSerialNum, upsDiagSubSysBattMonitorManufactureDate=upsDiagSubSysBattMonitorManufactureDate, upsDiagSubSysExternalSwitchGearTableSize=upsDiagSubSysExternalSwitchGearTableSize, upsDiagSubSysExternalSwitchGearTable=upsDiagSubSysExternalSwitchGearTable, upsDiagSubSysExternalSwitchGearEntry=upsDiagSubSysExternalSwitchGearEntry, upsDiagSubSysExternalSwitchGearFrameIndex=upsDiagSubSysExternalSwitchGearFrameIndex, upsDiagSubSysExternalSwitchGearIndex=upsDiagSubSysExternalSwitchGearIndex, upsDiagSubSysExternalSwitchGearStatus=upsDiagSubSysExternalSwitchGearStatus, upsDiagSubSysExternalSwitchGearFirmwareRev=upsDiagSubSysExternalSwitchGearFirmwareRev, upsDiagSubSysExternalSwitchGearHardwareRev=upsDiagSubSysExternalSwitchGearHardwareRev, upsDiagSubSysExternalSwitchGearSerialNum=upsDiagSubSysExternalSwitchGearSerialNum, upsDiagSubSysExternalSwitchGearManufactureDate=upsDiagSubSysExternalSwitchGearManufactureDate, upsDiagSubSysDisplayInterfaceCardTableSize=upsDiagSubSysDisplayInterfaceCardTableSize, upsDiagSubSysDisplayInterfaceCardTable=upsDiagSubSysDisplayInterfaceCardTable, upsDiagSubSysDisplayInterfaceCardEntry=upsDiagSubSysDisplayInterfaceCardEntry, upsDiagSubSysDisplayInterfaceCardFrameIndex=upsDiagSubSysDisplayInterfaceCardFrameIndex, upsDiagSubSysDisplayInterfaceCardIndex=upsDiagSubSysDisplayInterfaceCardIndex, upsDiagSubSysDisplayInterfaceCardStatus=upsDiagSubSysDisplayInterfaceCardStatus, upsDiagSubSysDCCircuitBreakerTableSize=upsDiagSubSysDCCircuitBreakerTableSize, upsDiagSubSysDCCircuitBreakerTable=upsDiagSubSysDCCircuitBreakerTable, upsDiagSubSysDCCircuitBreakerEntry=upsDiagSubSysDCCircuitBreakerEntry, upsDiagSubSysDCCircuitBreakerFrameIndex=upsDiagSubSysDCCircuitBreakerFrameIndex, upsDiagSubSysDCCircuitBreakerIndex=upsDiagSubSysDCCircuitBreakerIndex, upsDiagSubSysDCCircuitBreakerStatus=upsDiagSubSysDCCircuitBreakerStatus, upsDiagSubSysSystemPowerSupplyTableSize=upsDiagSubSysSystemPowerSupplyTableSize, upsDiagSubSysSystemPowerSupplyTable=upsDiagSubSysSystemPowerSupplyTable, upsDiagSubSysSystemPowerSupplyEntry=upsDiagSubSysSystemPowerSupplyEntry, upsDiagSubSysSystemPowerSupplyFrameIndex=upsDiagSubSysSystemPowerSupplyFrameIndex, upsDiagSubSysSystemPowerSupplyIndex=upsDiagSubSysSystemPowerSupplyIndex, upsDiagSubSysSystemPowerSupplyStatus=upsDiagSubSysSystemPowerSupplyStatus, upsDiagSubSysSystemPowerSupplyFirmwareRev=upsDiagSubSysSystemPowerSupplyFirmwareRev, upsDiagSubSysSystemPowerSupplyHardwareRev=upsDiagSubSysSystemPowerSupplyHardwareRev, upsDiagSubSysSystemPowerSupplySerialNum=upsDiagSubSysSystemPowerSupplySerialNum, upsDiagSubSysSystemPowerSupplyManufactureDate=upsDiagSubSysSystemPowerSupplyManufactureDate, upsDiagSubSysXRCommunicationCardTableSize=upsDiagSubSysXRCommunicationCardTableSize, upsDiagSubSysXRCommunicationCardTable=upsDiagSubSysXRCommunicationCardTable, upsDiagSubSysXRCommunicationCardEntry=upsDiagSubSysXRCommunicationCardEntry, upsDiagSubSysXRCommunicationCardFrameIndex=upsDiagSubSysXRCommunicationCardFrameIndex, upsDiagSubSysXRCommunicationCardIndex=upsDiagSubSysXRCommunicationCardIndex, upsDiagSubSysXRCommunicationCardStatus=upsDiagSubSysXRCommunicationCardStatus, upsDiagSubSysXRCommunicationCardFirmwareRev=upsDiagSubSysXRCommunicationCardFirmwareRev, upsDiagSubSysXRCommunicationCardSerialNum=upsDiagSubSysXRCommunicationCardSerialNum, upsDiagSubSysExternalPowerFrameBoardTableSize=upsDiagSubSysExternalPowerFrameBoardTableSize, upsDiagSubSysExternalPowerFrameBoardTable=upsDiagSubSysExternalPowerFrameBoardTable, upsDiagSubSysExternalPowerFrameBoardEntry=upsDiagSubSysExternalPowerFrameBoardEntry, upsDiagSubSysExternalPowerFrameBoardFrameIndex=upsDiagSubSysExternalPowerFrameBoardFrameIndex, upsDiagSubSysExternalPowerFrameBoardIndex=upsDiagSubSysExternalPowerFrameBoardIndex, upsDiagSubSysExternalPowerFrameBoardStatus=upsDiagSubSysExternalPowerFrameBoardStatus, upsDiagSubSysChargerTableSize=upsDiagSubSysChargerTableSize, upsDiagSubSysChargerTable=upsDiagSubSysChargerTable, upsDiagSubSysChargerEntry=upsDiagSubSysChargerEntry, upsDiagSubSysChargerFrameIndex=upsDiagSubSysChargerFrameIndex)
+mibBuilder.exportSymbols("PowerNet-MIB", upsDiagSubSysChargerIndex=upsDiagSubSysChargerIndex, upsDiagSubSysChargerStatus=upsDiagSubSysChargerStatus, upsDiagSubSysInverterTableSize=upsDiagSubSysInverterTableSize, upsDiagSubSysInverterTable=upsDiagSubSysInverterTable, upsDiagSubSysInverterEntry=upsDiagSubSysInverterEntry, upsDiagSubSysInverterFrameIndex=upsDiagSubSysInverterFrameIndex, upsDiagSubSysInverterIndex=upsDiagSubSysInverterIndex, upsDiagSubSysInverterStatus=upsDiagSubSysInverterStatus, upsDiagSubSysInverterFirmwareRev=upsDiagSubSysInverterFirmwareRev, upsDiagSubSysInverterHardwareRev=upsDiagSubSysInverterHardwareRev, upsDiagSubSysInverterSerialNum=upsDiagSubSysInverterSerialNum, upsDiagSubSysInverterManufactureDate=upsDiagSubSysInverterManufactureDate, upsDiagSubSysPowerFactorCorrectionTableSize=upsDiagSubSysPowerFactorCorrectionTableSize, upsDiagSubSysPowerFactorCorrectionTable=upsDiagSubSysPowerFactorCorrectionTable, upsDiagSubSysPowerFactorCorrectionEntry=upsDiagSubSysPowerFactorCorrectionEntry, upsDiagSubSysPowerFactorCorrectionFrameIndex=upsDiagSubSysPowerFactorCorrectionFrameIndex, upsDiagSubSysPowerFactorCorrectionIndex=upsDiagSubSysPowerFactorCorrectionIndex, upsDiagSubSysPowerFactorCorrectionStatus=upsDiagSubSysPowerFactorCorrectionStatus, upsDiagSubSysPowerFactorCorrectionFirmwareRev=upsDiagSubSysPowerFactorCorrectionFirmwareRev, upsDiagSubSysPowerFactorCorrectionHardwareRev=upsDiagSubSysPowerFactorCorrectionHardwareRev, upsDiagSubSysPowerFactorCorrectionSerialNum=upsDiagSubSysPowerFactorCorrectionSerialNum, upsDiagSubSysPowerFactorCorrectionManufactureDate=upsDiagSubSysPowerFactorCorrectionManufactureDate, upsDiagSubSysNetworkComCardTableSize=upsDiagSubSysNetworkComCardTableSize, upsDiagSubSysNetworkComCardTable=upsDiagSubSysNetworkComCardTable, upsDiagSubSysNetworkComCardEntry=upsDiagSubSysNetworkComCardEntry, upsDiagSubSysNetworkComCardIndex=upsDiagSubSysNetworkComCardIndex, upsDiagSubSysNetworkComCardModelNumber=upsDiagSubSysNetworkComCardModelNumber, upsDiagSubSysNetworkComCardSerialNumber=upsDiagSubSysNetworkComCardSerialNumber, upsDiagSubSysNetworkComCardDateOfManufacture=upsDiagSubSysNetworkComCardDateOfManufacture, upsDiagSubSysNetworkComCardHardwareRev=upsDiagSubSysNetworkComCardHardwareRev, upsDiagSubSysNetworkComCardFirmwareAppRev=upsDiagSubSysNetworkComCardFirmwareAppRev, upsDiagSubSysNetworkComCardFirmwareAppOSRev=upsDiagSubSysNetworkComCardFirmwareAppOSRev, upsDiagnosticExternalDevices=upsDiagnosticExternalDevices, upsDiagSwitchGear=upsDiagSwitchGear, upsDiagSwitchGearStatus=upsDiagSwitchGearStatus, upsDiagSwitchGearInputSwitchStatus=upsDiagSwitchGearInputSwitchStatus, upsDiagSwitchGearOutputSwitchStatus=upsDiagSwitchGearOutputSwitchStatus, upsDiagSwitchGearBypassSwitchStatus=upsDiagSwitchGearBypassSwitchStatus, upsDiagSwitchGearBypassInputSwitchStatus=upsDiagSwitchGearBypassInputSwitchStatus, upsDiagSwitchGearBreakerTableSize=upsDiagSwitchGearBreakerTableSize, upsDiagSwitchGearBreakerTable=upsDiagSwitchGearBreakerTable, upsDiagSwitchGearBreakerEntry=upsDiagSwitchGearBreakerEntry, upsDiagSubFeedBreakerTableSize=upsDiagSubFeedBreakerTableSize, upsDiagSubFeedBreakerTable=upsDiagSubFeedBreakerTable, upsDiagSubFeedBreakerEntry=upsDiagSubFeedBreakerEntry, upsDiagSwitchGearInstallationLoadPct=upsDiagSwitchGearInstallationLoadPct, upsDiagSubFeedPhaseTable=upsDiagSubFeedPhaseTable, upsDiagSubFeedPhaseEntry=upsDiagSubFeedPhaseEntry, upsDiagSubFeedBreakerIndex=upsDiagSubFeedBreakerIndex, upsDiagSubFeedPhaseIndex=upsDiagSubFeedPhaseIndex, upsDiagSubFeedPhaseCurrent=upsDiagSubFeedPhaseCurrent, upsDiagSubFeedPhaseCurrentAlternate=upsDiagSubFeedPhaseCurrentAlternate, upsDiagSwitchgearSerialNumber=upsDiagSwitchgearSerialNumber, upsDiagMCCBBox=upsDiagMCCBBox, upsDiagMCCBBoxStatus=upsDiagMCCBBoxStatus, upsDiagTransformer=upsDiagTransformer, upsDiagTransformerStatus=upsDiagTransformerStatus, upsDiagFlyWheel=upsDiagFlyWheel, upsDiagFlyWheelStatus=upsDiagFlyWheelStatus, upsDiagnosticComBus=upsDiagnosticComBus, upsDiagComBusInternalMIMStatus=upsDiagComBusInternalMIMStatus, upsDiagComBusInternalRIMStatus=upsDiagComBusInternalRIMStatus, upsDiagComBusMIMtoRIMStatus=upsDiagComBusMIMtoRIMStatus, upsDiagComBusExternalMIMStatus=upsDiagComBusExternalMIMStatus, upsDiagComBusExternalRIMStatus=upsDiagComBusExternalRIMStatus, upsParallelSystem=upsParallelSystem, upsParallelSysLocalAddress=upsParallelSysLocalAddress, upsParallelSysRemoteAddress=upsParallelSysRemoteAddress, upsParallelSysRedundancy=upsParallelSysRedundancy, upsParallelInputMaximumCurrent=upsParallelInputMaximumCurrent, upsParallelTotalOutputPower=upsParallelTotalOutputPower, upsParallelTotalOutputApparentPower=upsParallelTotalOutputApparentPower, upsParallelInputPhaseTable=upsParallelInputPhaseTable, upsParallelInputPhaseEntry=upsParallelInputPhaseEntry, upsParallelInputPhaseTableIndex=upsParallelInputPhaseTableIndex, upsParallelInputPhaseIndex=upsParallelInputPhaseIndex, upsParallelInputCurrent=upsParallelInputCurrent, upsParallelInputActivePower=upsParallelInputActivePower, upsParallelInputApparentPower=upsParallelInputApparentPower, upsParallelInputVoltage=upsParallelInputVoltage, upsParallelInputMaxVoltage=upsParallelInputMaxVoltage, upsParallelInputMaxCurrent=upsParallelInputMaxCurrent, upsParallelInputTotalActivePower=upsParallelInputTotalActivePower, upsParallelInputTotalApparentPower=upsParallelInputTotalApparentPower, upsParallelOutputPhaseTable=upsParallelOutputPhaseTable, upsParallelOutputPhaseEntry=upsParallelOutputPhaseEntry, upsParallelOutputPhaseTableIndex=upsParallelOutputPhaseTableIndex, upsParallelOutputPhaseIndex=upsParallelOutputPhaseIndex, upsParallelOutputCurrent=upsParallelOutputCurrent, upsParallelOutputLoad=upsParallelOutputLoad, upsParallelOutputPercentLoad=upsParallelOutputPercentLoad, upsParallelOutputPower=upsParallelOutputPower, upsParallelOutputApparentPowerTable=upsParallelOutputApparentPowerTable, upsParallelOutputApparentPowerEntry=upsParallelOutputApparentPowerEntry, upsParallelOutputApparentPowerTableIndex=upsParallelOutputApparentPowerTableIndex, upsParallelOutputApparentPower=upsParallelOutputApparentPower, upsParallelDiagSubSysBreakerTable=upsParallelDiagSubSysBreakerTable, upsParallelDiagSubSysBreakerEntry=upsParallelDiagSubSysBreakerEntry, upsParallelDiagSubSysBreakerFrameIndex=upsParallelDiagSubSysBreakerFrameIndex, upsParallelDiagSubSysBreakerIndex=upsParallelDiagSubSysBreakerIndex)
+mibBuilder.exportSymbols("PowerNet-MIB", upsParallelDiagSubSysBreakerStatus=upsParallelDiagSubSysBreakerStatus, upsParallelDiagSubSysBreakerName=upsParallelDiagSubSysBreakerName, upsParallelOutputTotalPercentLoad=upsParallelOutputTotalPercentLoad, upsParallelOutputActivePowerTable=upsParallelOutputActivePowerTable, upsParallelOutputActivePowerEntry=upsParallelOutputActivePowerEntry, upsParallelOutputActivePowerTableIndex=upsParallelOutputActivePowerTableIndex, upsParallelOutputActivePower=upsParallelOutputActivePower, upsParallelSysSwitchGearInstallationLoadPct=upsParallelSysSwitchGearInstallationLoadPct, upsParallelSysRedundancyStatus=upsParallelSysRedundancyStatus, upsParallelSysName=upsParallelSysName, upsPhysicalLayout=upsPhysicalLayout, upsIOFrameLayoutPositionID=upsIOFrameLayoutPositionID, upsBottomFeedFrameLayoutPositionID=upsBottomFeedFrameLayoutPositionID, upsSwitchGearLayoutPositionID=upsSwitchGearLayoutPositionID, upsBatteryFrameLayoutTableSize=upsBatteryFrameLayoutTableSize, upsBatteryFrameLayoutTable=upsBatteryFrameLayoutTable, upsBatteryFrameLayoutEntry=upsBatteryFrameLayoutEntry, upsSideCarFrameLayoutTableSize=upsSideCarFrameLayoutTableSize, upsSideCarFrameLayoutTable=upsSideCarFrameLayoutTable, upsSideCarFrameLayoutEntry=upsSideCarFrameLayoutEntry, upsPowerFrameLayoutTableSize=upsPowerFrameLayoutTableSize, upsPowerFrameLayoutTable=upsPowerFrameLayoutTable, upsPowerFrameLayoutEntry=upsPowerFrameLayoutEntry, upsIntegratedATS=upsIntegratedATS, upsIntegratedATSSelectedSource=upsIntegratedATSSelectedSource, upsIntegratedATSPreferredSource=upsIntegratedATSPreferredSource, upsIntegratedATSUpsReturnStaggering=upsIntegratedATSUpsReturnStaggering, upsIntegratedATSSourceTableSize=upsIntegratedATSSourceTableSize, upsIntegratedATSSourceTable=upsIntegratedATSSourceTable, upsIntegratedATSSourceEntry=upsIntegratedATSSourceEntry, upsIntegratedATSSourceIndex=upsIntegratedATSSourceIndex, upsIntegratedATSSourceName=upsIntegratedATSSourceName, upsIntegratedATSSourceStatus=upsIntegratedATSSourceStatus, upsIntegratedATSLineFailDelay=upsIntegratedATSLineFailDelay, upsIntegratedATSLineStabilityDelay=upsIntegratedATSLineStabilityDelay, upsDCOutput=upsDCOutput, upsDCOutputStatus=upsDCOutputStatus, upsDCOutputStatusTableSize=upsDCOutputStatusTableSize, upsDCOutputStatusTable=upsDCOutputStatusTable, upsDCOutputStatusEntry=upsDCOutputStatusEntry, upsDCOutputStatusTableIndex=upsDCOutputStatusTableIndex, upsDCOutputStatusVoltageNominal=upsDCOutputStatusVoltageNominal, upsDCOutputStatusCurrentRating=upsDCOutputStatusCurrentRating, upsDCOutputStatusVoltage=upsDCOutputStatusVoltage, upsDCOutputStatusCurrent=upsDCOutputStatusCurrent, upsDCOutputStatusAbnormalConditions=upsDCOutputStatusAbnormalConditions, environmentalMonitor=environmentalMonitor, integrated=integrated, iemIdent=iemIdent, iemIdentHardwareRevision=iemIdentHardwareRevision, iemConfig=iemConfig, iemConfigProbesNumProbes=iemConfigProbesNumProbes, iemConfigProbesTable=iemConfigProbesTable, iemConfigProbesEntry=iemConfigProbesEntry, iemConfigProbeNumber=iemConfigProbeNumber, iemConfigProbeName=iemConfigProbeName, iemConfigProbeHighTempThreshold=iemConfigProbeHighTempThreshold, iemConfigProbeLowTempThreshold=iemConfigProbeLowTempThreshold, iemConfigProbeTempUnits=iemConfigProbeTempUnits, iemConfigProbeHighHumidThreshold=iemConfigProbeHighHumidThreshold, iemConfigProbeLowHumidThreshold=iemConfigProbeLowHumidThreshold, iemConfigProbeHighTempEnable=iemConfigProbeHighTempEnable, iemConfigProbeLowTempEnable=iemConfigProbeLowTempEnable, iemConfigProbeHighHumidEnable=iemConfigProbeHighHumidEnable, iemConfigProbeLowHumidEnable=iemConfigProbeLowHumidEnable, iemConfigProbeMaxTempThreshold=iemConfigProbeMaxTempThreshold, iemConfigProbeMinTempThreshold=iemConfigProbeMinTempThreshold, iemConfigProbeMaxHumidThreshold=iemConfigProbeMaxHumidThreshold, iemConfigProbeMinHumidThreshold=iemConfigProbeMinHumidThreshold, iemConfigProbeMaxTempEnable=iemConfigProbeMaxTempEnable, iemConfigProbeMinTempEnable=iemConfigProbeMinTempEnable, iemConfigProbeMaxHumidEnable=iemConfigProbeMaxHumidEnable, iemConfigProbeMinHumidEnable=iemConfigProbeMinHumidEnable, iemConfigProbeTempHysteresis=iemConfigProbeTempHysteresis, iemConfigProbeHumidHysteresis=iemConfigProbeHumidHysteresis, iemConfigProbeLocation=iemConfigProbeLocation, iemConfigContactsNumContacts=iemConfigContactsNumContacts, iemConfigContactsTable=iemConfigContactsTable, iemConfigContactsEntry=iemConfigContactsEntry, iemConfigContactNumber=iemConfigContactNumber, iemConfigContactName=iemConfigContactName, iemConfigContactEnable=iemConfigContactEnable, iemConfigContactSeverity=iemConfigContactSeverity, iemConfigContactNormalState=iemConfigContactNormalState, iemConfigContactLocation=iemConfigContactLocation, iemConfigConfigRelaysNumRelays=iemConfigConfigRelaysNumRelays, iemConfigRelaysTable=iemConfigRelaysTable, iemConfigRelaysEntry=iemConfigRelaysEntry, iemConfigRelayNumber=iemConfigRelayNumber, iemConfigRelayName=iemConfigRelayName, iemConfigRelayNormalState=iemConfigRelayNormalState, iemConfigRelayFaultCondition=iemConfigRelayFaultCondition, iemStatus=iemStatus, iemStatusProbesNumProbes=iemStatusProbesNumProbes, iemStatusProbesTable=iemStatusProbesTable, iemStatusProbesEntry=iemStatusProbesEntry, iemStatusProbeNumber=iemStatusProbeNumber, iemStatusProbeName=iemStatusProbeName, iemStatusProbeStatus=iemStatusProbeStatus, iemStatusProbeCurrentTemp=iemStatusProbeCurrentTemp)
+mibBuilder.exportSymbols("PowerNet-MIB", iemStatusProbeTempUnits=iemStatusProbeTempUnits, iemStatusProbeCurrentHumid=iemStatusProbeCurrentHumid, iemStatusProbeHighTempViolation=iemStatusProbeHighTempViolation, iemStatusProbeLowTempViolation=iemStatusProbeLowTempViolation, iemStatusProbeHighHumidViolation=iemStatusProbeHighHumidViolation, iemStatusProbeLowHumidViolation=iemStatusProbeLowHumidViolation, iemStatusProbeMaxTempViolation=iemStatusProbeMaxTempViolation, iemStatusProbeMinTempViolation=iemStatusProbeMinTempViolation, iemStatusProbeMaxHumidViolation=iemStatusProbeMaxHumidViolation, iemStatusProbeMinHumidViolation=iemStatusProbeMinHumidViolation, iemStatusProbeLocation=iemStatusProbeLocation, iemStatusContactsNumContacts=iemStatusContactsNumContacts, iemStatusContactsTable=iemStatusContactsTable, iemStatusContactsEntry=iemStatusContactsEntry, iemStatusContactNumber=iemStatusContactNumber, iemStatusContactName=iemStatusContactName, iemStatusContactStatus=iemStatusContactStatus, iemStatusRelaysNumRelays=iemStatusRelaysNumRelays, iemStatusRelaysTable=iemStatusRelaysTable, iemStatusRelaysEntry=iemStatusRelaysEntry, iemStatusRelayNumber=iemStatusRelayNumber, iemStatusRelayName=iemStatusRelayName, iemStatusRelayStatus=iemStatusRelayStatus, modEnvMgr=modEnvMgr, memModules=memModules, memModulesStatusTableSize=memModulesStatusTableSize, memModulesStatusTable=memModulesStatusTable, memModulesStatusEntry=memModulesStatusEntry, memModulesStatusModuleNumber=memModulesStatusModuleNumber, memModulesStatusModuleName=memModulesStatusModuleName, memModulesStatusModuleLocation=memModulesStatusModuleLocation, memModulesStatusModelNumber=memModulesStatusModelNumber, memModulesStatusSerialNumber=memModulesStatusSerialNumber, memModulesStatusFirmwareRev=memModulesStatusFirmwareRev, memModulesStatusHardwareRev=memModulesStatusHardwareRev, memModulesConfigTableSize=memModulesConfigTableSize, memModulesConfigTable=memModulesConfigTable, memModulesConfigEntry=memModulesConfigEntry, memModulesConfigModuleNumber=memModulesConfigModuleNumber, memModulesConfigModuleName=memModulesConfigModuleName, memModulesConfigModuleLocation=memModulesConfigModuleLocation, memSensors=memSensors, memSensorsStatusSysTempUnits=memSensorsStatusSysTempUnits, memSensorsStatusTableSize=memSensorsStatusTableSize, memSensorsStatusTable=memSensorsStatusTable, memSensorsStatusEntry=memSensorsStatusEntry, memSensorsStatusModuleNumber=memSensorsStatusModuleNumber, memSensorsStatusSensorNumber=memSensorsStatusSensorNumber, memSensorsStatusSensorName=memSensorsStatusSensorName, memSensorsStatusSensorLocation=memSensorsStatusSensorLocation, memSensorsTemperature=memSensorsTemperature, memSensorsHumidity=memSensorsHumidity, memSensorsCommStatus=memSensorsCommStatus, memSensorsAlarmStatus=memSensorsAlarmStatus, memSensorsConfigTableSize=memSensorsConfigTableSize, memSensorsConfigTable=memSensorsConfigTable, memSensorsConfigEntry=memSensorsConfigEntry, memSensorsConfigModuleNumber=memSensorsConfigModuleNumber, memSensorsConfigSensorNumber=memSensorsConfigSensorNumber, memSensorsName=memSensorsName, memSensorsLocation=memSensorsLocation, memSensorsAlarmGeneration=memSensorsAlarmGeneration, memSensorsTempMaxThresh=memSensorsTempMaxThresh, memSensorsTempHighThresh=memSensorsTempHighThresh, memSensorsTempLowThresh=memSensorsTempLowThresh, memSensorsTempMinThresh=memSensorsTempMinThresh, memSensorsTempThreshHysteresis=memSensorsTempThreshHysteresis, memSensorsTempShortDecRateThreshValue=memSensorsTempShortDecRateThreshValue, memSensorsTempShortDecRateThreshTime=memSensorsTempShortDecRateThreshTime, memSensorsTempShortIncRateThreshValue=memSensorsTempShortIncRateThreshValue, memSensorsTempShortIncRateThreshTime=memSensorsTempShortIncRateThreshTime, memSensorsTempLongDecRateThreshValue=memSensorsTempLongDecRateThreshValue, memSensorsTempLongDecRateThreshTime=memSensorsTempLongDecRateThreshTime, memSensorsTempLongIncRateThreshValue=memSensorsTempLongIncRateThreshValue, memSensorsTempLongIncRateThreshTime=memSensorsTempLongIncRateThreshTime, memSensorsHumidityMaxThresh=memSensorsHumidityMaxThresh, memSensorsHumidityHighThresh=memSensorsHumidityHighThresh, memSensorsHumidityLowThresh=memSensorsHumidityLowThresh, memSensorsHumidityMinThresh=memSensorsHumidityMinThresh, memSensorsHumidityThreshHysteresis=memSensorsHumidityThreshHysteresis, memInputs=memInputs, memInputsStatusTableSize=memInputsStatusTableSize, memInputsStatusTable=memInputsStatusTable, memInputsStatusEntry=memInputsStatusEntry, memInputsStatusModuleNumber=memInputsStatusModuleNumber, memInputsStatusInputNumber=memInputsStatusInputNumber, memInputsStatusInputName=memInputsStatusInputName, memInputsStatusInputLocation=memInputsStatusInputLocation, memInputsStatusCurrentState=memInputsStatusCurrentState, memInputsStatusCurrentAnalogValue=memInputsStatusCurrentAnalogValue, memInputsStatusAlarmStatus=memInputsStatusAlarmStatus, memInputsCommStatus=memInputsCommStatus, memInputsConfigTableSize=memInputsConfigTableSize, memInputsConfigTable=memInputsConfigTable, memInputsConfigEntry=memInputsConfigEntry, memInputsConfigModuleNumber=memInputsConfigModuleNumber, memInputsConfigInputNumber=memInputsConfigInputNumber, memInputName=memInputName, memInputLocation=memInputLocation, memInputType=memInputType)
+mibBuilder.exportSymbols("PowerNet-MIB", memInputAlarmGeneration=memInputAlarmGeneration, memInputNormalState=memInputNormalState, memInputAbnormalSeverity=memInputAbnormalSeverity, memInputNumberCalibrationPoints=memInputNumberCalibrationPoints, memInputAnalogCalibrationPoint1=memInputAnalogCalibrationPoint1, memInputAnalogCalibrationPoint2=memInputAnalogCalibrationPoint2, memInputAnalogCalibrationPoint3=memInputAnalogCalibrationPoint3, memInputAnalogCalibrationPoint4=memInputAnalogCalibrationPoint4, memInputAnalogCalibrationPoint5=memInputAnalogCalibrationPoint5, memInputAnalogCalibrationPoint1Value=memInputAnalogCalibrationPoint1Value, memInputAnalogCalibrationPoint2Value=memInputAnalogCalibrationPoint2Value, memInputAnalogCalibrationPoint3Value=memInputAnalogCalibrationPoint3Value, memInputAnalogCalibrationPoint4Value=memInputAnalogCalibrationPoint4Value, memInputAnalogCalibrationPoint5Value=memInputAnalogCalibrationPoint5Value, memInputAnalogMeasurementUnits=memInputAnalogMeasurementUnits, memInputAnalogMaxThresh=memInputAnalogMaxThresh, memInputAnalogHighThresh=memInputAnalogHighThresh, memInputAnalogLowThresh=memInputAnalogLowThresh, memInputAnalogMinThresh=memInputAnalogMinThresh, memInputAnalogThreshHysteresis=memInputAnalogThreshHysteresis, memOutputs=memOutputs, memOutputStatusTableSize=memOutputStatusTableSize, memOutputStatusTable=memOutputStatusTable, memOutputStatusEntry=memOutputStatusEntry, memOutputStatusModuleNumber=memOutputStatusModuleNumber, memOutputStatusOutputNumber=memOutputStatusOutputNumber, memOutputStatusOutputName=memOutputStatusOutputName, memOutputStatusOutputLocation=memOutputStatusOutputLocation, memOutputStatusCurrentState=memOutputStatusCurrentState, memOutputConfigTableSize=memOutputConfigTableSize, memOutputConfigTable=memOutputConfigTable, memOutputConfigEntry=memOutputConfigEntry, memOutputConfigModuleNumber=memOutputConfigModuleNumber, memOutputConfigOutputNumber=memOutputConfigOutputNumber, memOutputName=memOutputName, memOutputLocation=memOutputLocation, memOutputNormalState=memOutputNormalState, memOutputAction=memOutputAction, memOutlets=memOutlets, memOutletStatusTableSize=memOutletStatusTableSize, memOutletStatusTable=memOutletStatusTable, memOutletStatusEntry=memOutletStatusEntry, memOutletStatusModuleNumber=memOutletStatusModuleNumber, memOutletStatusOutletNumber=memOutletStatusOutletNumber, memOutletStatusOutletName=memOutletStatusOutletName, memOutletStatusOutletLocation=memOutletStatusOutletLocation, memOutletStatusCurrentState=memOutletStatusCurrentState, memOutletConfigTableSize=memOutletConfigTableSize, memOutletConfigTable=memOutletConfigTable, memOutletConfigEntry=memOutletConfigEntry, memOutletConfigModuleNumber=memOutletConfigModuleNumber, memOutletConfigOutletNumber=memOutletConfigOutletNumber, memOutletName=memOutletName, memOutletLocation=memOutletLocation, memOutletNormalState=memOutletNormalState, memOutletAction=memOutletAction, memBeacons=memBeacons, memBeaconStatusTableSize=memBeaconStatusTableSize, memBeaconStatusTable=memBeaconStatusTable, memBeaconStatusEntry=memBeaconStatusEntry, memBeaconStatusModuleNumber=memBeaconStatusModuleNumber, memBeaconStatusBeaconNumber=memBeaconStatusBeaconNumber, memBeaconStatusBeaconName=memBeaconStatusBeaconName, memBeaconStatusBeaconLocation=memBeaconStatusBeaconLocation, memBeaconStatusCurrentState=memBeaconStatusCurrentState, memBeaconConfigTableSize=memBeaconConfigTableSize, memBeaconConfigTable=memBeaconConfigTable, memBeaconConfigEntry=memBeaconConfigEntry, memBeaconConfigModuleNumber=memBeaconConfigModuleNumber, memBeaconConfigBeaconNumber=memBeaconConfigBeaconNumber, memBeaconConfigName=memBeaconConfigName, memBeaconConfigLocation=memBeaconConfigLocation, memBeaconAction=memBeaconAction, universalInputOutput=universalInputOutput, uioSensor=uioSensor, uioSensorStatusTableSize=uioSensorStatusTableSize, uioSensorStatusTable=uioSensorStatusTable, uioSensorStatusEntry=uioSensorStatusEntry, uioSensorStatusPortID=uioSensorStatusPortID, uioSensorStatusSensorID=uioSensorStatusSensorID, uioSensorStatusSensorName=uioSensorStatusSensorName, uioSensorStatusSensorLocation=uioSensorStatusSensorLocation, uioSensorStatusTemperatureDegF=uioSensorStatusTemperatureDegF, uioSensorStatusTemperatureDegC=uioSensorStatusTemperatureDegC, uioSensorStatusHumidity=uioSensorStatusHumidity, uioSensorStatusViolationStatus=uioSensorStatusViolationStatus, uioSensorStatusAlarmStatus=uioSensorStatusAlarmStatus, uioSensorStatusCommStatus=uioSensorStatusCommStatus, uioInputContact=uioInputContact, uioInputContactStatusTableSize=uioInputContactStatusTableSize, uioInputContactStatusTable=uioInputContactStatusTable, uioInputContactStatusEntry=uioInputContactStatusEntry, uioInputContactStatusPortID=uioInputContactStatusPortID, uioInputContactStatusContactID=uioInputContactStatusContactID, uioInputContactStatusContactName=uioInputContactStatusContactName, uioInputContactStatusContactLocation=uioInputContactStatusContactLocation, uioInputContactStatusCurrentState=uioInputContactStatusCurrentState, uioInputContactStatusAlarmStatus=uioInputContactStatusAlarmStatus, uioInputContactStatusCommStatus=uioInputContactStatusCommStatus, uioOutputRelay=uioOutputRelay)
+mibBuilder.exportSymbols("PowerNet-MIB", uioOutputRelayStatusTableSize=uioOutputRelayStatusTableSize, uioOutputRelayStatusTable=uioOutputRelayStatusTable, uioOutputRelayStatusEntry=uioOutputRelayStatusEntry, uioOutputRelayStatusPortID=uioOutputRelayStatusPortID, uioOutputRelayStatusRelayID=uioOutputRelayStatusRelayID, uioOutputRelayStatusRelayName=uioOutputRelayStatusRelayName, uioOutputRelayStatusRelayLocation=uioOutputRelayStatusRelayLocation, uioOutputRelayStatusCurrentState=uioOutputRelayStatusCurrentState, uioOutputRelayStatusAlarmStatus=uioOutputRelayStatusAlarmStatus, uioOutputRelayStatusCommStatus=uioOutputRelayStatusCommStatus, system=system, monitors=monitors, mem=mem)
@@ -1,28 +1,65 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import array
+import collections
 import hashlib
+import math
 import os
-import random
+import socket
+import threading
 import time
 
 from pysnmp.entity.rfc3413.oneliner import cmdgen
 from pysnmp.smi import builder, view, error
-from pysnmp.proto import rfc1902, rfc1905
+from pysnmp.proto import errind, rfc1902, rfc1905
 
-from pyasn1.type import univ
+from pyasn1.type import namedval, univ
+
+from ups_apc_snmp import mibindex
 
 # Snmp version constants
 V1 = 0
 V2 = V2C = 1
 
+# Error status returned by agents when a response would not fit into one PDU
+TOO_BIG = 1
+
+# Upper bound of varbinds requested in a single GET by SnmpClient.getmany
+MAX_OIDS_PER_PDU = 60
+
+# Number of rows requested per GETBULK when walking tables, until more or less has been learned for a host
+MAX_REPETITIONS = 25
+
+# Upper bound of rows per GETBULK learned for fast agents
+MAX_REPETITIONS_LIMIT = 100
+
+# GETBULK responses faster than this many seconds let the number of rows per request grow
+FAST_RESPONSE_TIME = 0.1
+
+# Lower bound of the retransmit timeout learned from the response times of an agent, in seconds
+MIN_RETRANSMIT_TIMEOUT = 0.5
+
+# Seconds a resolved host address is used by all clients of a process, the system resolver does not tell the DNS TTL
+RESOLVE_TTL = 300
+
+# Number of translations kept by each of the nodeid, nodename and nodeinfo caches
+TRANSLATION_CACHE_SIZE = 4096
+
+# Objects queried to detect whether an agent is alive
+HANDSHAKE_OIDS = ('SNMPv2-MIB::sysName.0', 'SNMPv2-MIB::sysDescr.0')
+
 # The internal mib builder
 __mibBuilder = builder.MibBuilder()
 __mibViewController = view.MibViewController(__mibBuilder)
 
 
-def add_mib_path(path):
-	"""Add a directory to the MIB search path"""
+def add_mib_path(path, cache_dir=None):
+	"""Add a directory to the MIB search path
+
+	With a cache_dir, complete MIB modules in the directory which differ from
+	the ones the precompiled index was built from are used for translations
+	instead, parsed once and cached in cache_dir by their hash."""
 	if not os.path.isdir(path):
 		return
 
@@ -33,6 +70,12 @@ def add_mib_path(path):
 
 	__mibBuilder.setMibSources(*(__mibBuilder.getMibSources() + (builder.DirMibSource(path), )))
 
+	if cache_dir is not None:
+		for mibname in mibindex.FILE_MIBS:
+			if os.path.exists(os.path.join(path, mibname + '.py')):
+				mibindex.load_mib(os.path.join(path, mibname + '.py'), cache_dir)
+		clear_translation_caches()
+
 
 def load_mibs(*modules):
 	"""Load one or more mibs"""
@@ -43,18 +86,26 @@ def load_mibs(*modules):
 			if 'already exported' in str(e):
 				continue
 			raise
+	# names resolved before may now be found at more specific nodes
+	clear_translation_caches()
 
 
 def get_namedvalues(mibname, objectname):
+	pairs = mibindex.lookup_namedvalues(mibname, objectname)
+	if pairs is not None:
+		return namedval.NamedValues(*pairs)
 	return __mibBuilder.mibSymbols[mibname][objectname].syntax.getNamedValues()
 
 
 def snmp_auth_data(community, version=V2C, snmp_id=None):
+	"""Credentials of a community, configured once per community and version in a shared SNMP engine
+
+	An engine with several entries for the same community matches responses to
+	the wrong one and drops them, so the default snmp_id is derived from both."""
 	if snmp_id is None:
 		sha_256 = hashlib.sha256()  # pylint: disable=E1101
 		sha_256.update(community.encode('ascii'))
-		sha_256.update(str(time.time() * 1000).encode('ascii'))
-		sha_256.update(str(random.random()).encode('ascii'))
+		sha_256.update(str(version).encode('ascii'))
 		snmp_id = sha_256.hexdigest()[:32]
 	return cmdgen.CommunityData(snmp_id, community, version)
 
@@ -67,6 +118,23 @@ def snmp_auth_data_v2c(community, version=V2C, snmp_id=None):
 	return snmp_auth_data(community, version, snmp_id)
 
 
+def is_missing(value):
+	"""Check whether a varbind value is one of the SNMPv2 exception values"""
+	return value.isSameTypeWith(rfc1905.noSuchObject) or value.isSameTypeWith(rfc1905.noSuchInstance) or value.isSameTypeWith(rfc1905.endOfMibView)
+
+
+def plain_value(value, oid=None):
+	"""Convert a varbind value to the matching Python type"""
+	if isinstance(value, univ.OctetString):
+		return str(value)
+	elif isinstance(value, univ.Integer):
+		return int(value)
+	elif isinstance(value, univ.ObjectIdentifier):
+		return str(value)
+	else:
+		raise AssertionError("Unknown type %s encountered for oid %s" % (value.__class__.__name__, oid))
+
+
 class SnmpError(Exception):
 	def __init__(self, msg, error_indication, error_status, error_index, varbinds):  # pylint: disable=R0913
 		self.msg = msg
@@ -80,10 +148,87 @@ class SnmpError(Exception):
 		return "%s - with error indication %s and error status %s" % (self.msg, str(self.error_indication), str(self.error_status))
 
 
+class DeadlineExceeded(Exception):
+	"""The time given to a client ran out before a request could be answered"""
+
+
+class Deadline(object):
+	"""Point in time by which all requests of one or more clients have to be done"""
+
+	def __init__(self, seconds):
+		self.seconds = seconds
+		self.expires = time.time() + seconds
+
+	def __repr__(self):
+		return "Deadline(seconds=%r, remaining=%.1f)" % (self.seconds, self.remaining())
+
+	def remaining(self):
+		return max(0.0, self.expires - time.time())
+
+
+class LruCache(object):
+	"""Bounded, thread safe memo evicting the least recently used entry, counting hits and misses"""
+
+	def __init__(self, maxsize=TRANSLATION_CACHE_SIZE):
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self.__entries = collections.OrderedDict()
+		self.__lock = threading.Lock()
+
+	def get(self, key, compute):
+		"""Return the cached value of key, calling compute(key) on a miss"""
+		with self.__lock:
+			try:
+				value = self.__entries.pop(key)
+			except KeyError:
+				self.misses += 1
+			else:
+				self.hits += 1
+				self.__entries[key] = value
+				return value
+		value = compute(key)
+		with self.__lock:
+			self.__entries[key] = value
+			while len(self.__entries) > self.maxsize:
+				self.__entries.popitem(last=False)
+		return value
+
+	def clear(self):
+		with self.__lock:
+			self.__entries.clear()
+			self.hits = 0
+			self.misses = 0
+
+	def stats(self):
+		return dict(hits=self.hits, misses=self.misses, size=len(self.__entries), maxsize=self.maxsize)
+
+
+_nodeid_cache = LruCache()
+_nodename_cache = LruCache()
+_nodeinfo_cache = LruCache()
+
+
+def translation_cache_stats():
+	"""Hit and miss counters of the oid translation caches, for diagnostics"""
+	return dict(nodeid=_nodeid_cache.stats(), nodename=_nodename_cache.stats(), nodeinfo=_nodeinfo_cache.stats())
+
+
+def clear_translation_caches():
+	"""Forget all memoized oid translations, needed after loading further MIBs"""
+	for cache in (_nodeid_cache, _nodename_cache, _nodeinfo_cache):
+		cache.clear()
+
+
 def nodeinfo(oid):
 	"""Translate dotted-decimal oid to a tuple with symbolic info"""
 	if isinstance(oid, str):
 		oid = rfc1902.ObjectName(oid)
+	return _nodeinfo_cache.get(tuple(oid), _nodeinfo)
+
+
+def _nodeinfo(oid):
+	oid = rfc1902.ObjectName(oid)
 	return __mibViewController.getNodeLocation(oid), __mibViewController.getNodeName(oid)
 
 
@@ -91,15 +236,25 @@ def nodeinfos(*oids):
 	return [nodeinfo(oid) for oid in oids]
 
 
+def split_column(oid):
+	"""Split an oid tuple into the symbolic name of its MIB object and the index tuple below it"""
+	location = mibindex.lookup_location(tuple(oid))
+	if location is None:
+		location = __mibViewController.getNodeLocation(rfc1902.ObjectName(oid))
+	return '::'.join(location[:-1]), tuple(location[-1])
+
+
 def nodename(oid):
 	"""Translate dotted-decimal oid or oid tuple to symbolic name"""
 	if isinstance(oid, str):
 		oid = rfc1902.ObjectName(oid)
-	oid = __mibViewController.getNodeLocation(oid)  # pylint:disable=R0204
-	name = '::'.join(oid[:-1])
-	noid = '.'.join([str(x) for x in oid[-1]])
-	if noid:
-		name += '.' + noid
+	return _nodename_cache.get(tuple(oid), _nodename)
+
+
+def _nodename(oid):
+	name, index = split_column(oid)
+	if index:
+		name += '.' + '.'.join([str(x) for x in index])
 	return name
 
 
@@ -114,22 +269,27 @@ def nodeid(oid):
 	elif isinstance(oid, rfc1902.ObjectName):
 		return oid
 	elif isinstance(oid, str):
-		ids = oid.split('.')
-		try:
-			ids_num = [int(x) for x in ids]
-		except ValueError:
-			symbols = ids[0].split('::')
-			ids = tuple([int(x) for x in ids[1:]])
-			mibnode, = __mibBuilder.importSymbols(*symbols)
-			oid = mibnode.getName() + ids
-			return oid
-		else:
-			return tuple(ids_num)
-
+		return _nodeid_cache.get(oid, _nodeid)
 	else:
 		raise AssertionError("Unknown oid format for %r encountered" % oid)
 
 
+def _nodeid(oid):
+	ids = oid.split('.')
+	try:
+		ids_num = [int(x) for x in ids]
+	except ValueError:
+		symbols = ids[0].split('::')
+		ids = tuple([int(x) for x in ids[1:]])
+		base = mibindex.lookup_oid(*symbols)
+		if base is None:
+			mibnode, = __mibBuilder.importSymbols(*symbols)
+			base = mibnode.getName()
+		return tuple(base) + ids
+	else:
+		return tuple(ids_num)
+
+
 def nodeids(oids):
 	oids_list = []
 	for oid in oids:
@@ -138,38 +298,296 @@ def nodeids(oids):
 	return tuple(set(oids_list))
 
 
+class PduBudget(object):
+	"""Learned PDU limits of an agent
+
+	The number of oids per GET and rows per GETBULK shrink when the agent
+	answers tooBig, and the rows per GETBULK grow while responses are fast."""
+
+	def __init__(self, max_oids=MAX_OIDS_PER_PDU, max_repetitions=MAX_REPETITIONS, repetitions_ceiling=MAX_REPETITIONS_LIMIT):
+		self.max_oids = max_oids
+		self.max_repetitions = max_repetitions
+		self.repetitions_ceiling = repetitions_ceiling
+
+	def __repr__(self):
+		return "PduBudget(max_oids=%d, max_repetitions=%d, repetitions_ceiling=%d)" % (self.max_oids, self.max_repetitions, self.repetitions_ceiling)
+
+	def shrink_oids(self, size):
+		"""A GET of size oids was too big"""
+		self.max_oids = max(1, min(self.max_oids, size // 2))
+
+	def shrink_repetitions(self, too_big=True):
+		"""A GETBULK with max_repetitions rows was too big or timed out"""
+		if too_big:
+			self.repetitions_ceiling = max(1, self.max_repetitions - 1)
+		self.max_repetitions = max(1, self.max_repetitions // 2)
+
+	def grow_repetitions(self):
+		"""A GETBULK with max_repetitions rows was answered fast"""
+		self.max_repetitions = min(self.repetitions_ceiling, self.max_repetitions + max(1, self.max_repetitions // 4))
+
+	def to_dict(self):
+		return dict(max_oids=self.max_oids, max_repetitions=self.max_repetitions, repetitions_ceiling=self.repetitions_ceiling)
+
+	@classmethod
+	def from_dict(cls, data):
+		return cls(**dict((key, int(value)) for key, value in data.items() if key in ('max_oids', 'max_repetitions', 'repetitions_ceiling')))
+
+
+_pdu_budgets = {}
+
+
+def get_pdu_budget(host, port=161, saved=None):
+	"""The PDU budget of an agent shared by all clients of this process, initialized from a saved dict if given"""
+	key = (host, port)
+	if key not in _pdu_budgets:
+		_pdu_budgets[key] = PduBudget.from_dict(saved) if saved else PduBudget()
+	return _pdu_budgets[key]
+
+
+class RttEstimator(object):
+	"""Smoothed response time of an agent and its variation, as used by TCP to derive retransmit timeouts (RFC 6298)"""
+
+	ALPHA = 1.0 / 8
+	BETA = 1.0 / 4
+
+	def __init__(self, srtt=None, rttvar=None):
+		self.srtt = srtt
+		self.rttvar = rttvar
+
+	def __repr__(self):
+		return "RttEstimator(srtt=%r, rttvar=%r)" % (self.srtt, self.rttvar)
+
+	def sample(self, rtt):
+		"""A request was answered after rtt seconds without being retransmitted"""
+		if self.srtt is None:
+			self.srtt = rtt
+			self.rttvar = rtt / 2.0
+		else:
+			self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+			self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+
+	def backoff(self):
+		"""A request timed out, make the timeout of the next ones longer"""
+		if self.srtt is not None:
+			self.rttvar = max(self.rttvar * 2, self.srtt)
+
+	def timeout(self, upper):
+		"""Retransmit timeout in seconds, in tenths to limit the targets pysnmp has to configure, at most upper"""
+		if self.srtt is None:
+			return upper
+		# rounded first, so float noise does not add a tenth
+		timeout = math.ceil(round((self.srtt + 4 * self.rttvar) * 10, 6)) / 10.0
+		return min(upper, max(MIN_RETRANSMIT_TIMEOUT, timeout))
+
+	def to_dict(self):
+		return dict(srtt=self.srtt, rttvar=self.rttvar)
+
+	@classmethod
+	def from_dict(cls, data):
+		try:
+			return cls(float(data['srtt']), float(data['rttvar']))
+		except (KeyError, TypeError, ValueError):
+			return cls()
+
+
+_rtt_estimators = {}
+
+
+def get_rtt_estimator(host, port=161, saved=None):
+	"""The response time estimate of an agent shared by all clients of this process, initialized from a saved dict if given"""
+	key = (host, port)
+	if key not in _rtt_estimators:
+		_rtt_estimators[key] = RttEstimator.from_dict(saved) if saved else RttEstimator()
+	return _rtt_estimators[key]
+
+
+_addresses = {}
+
+
+def load_address(host, port=161, saved=None):
+	"""Use the address of a host saved with address_entry until it expires, unless it is resolved already"""
+	try:
+		address, expires = (str(saved['address'][0]), int(saved['address'][1])), float(saved['expires'])
+	except (KeyError, IndexError, TypeError, ValueError):
+		return
+	if (host, port) not in _addresses and expires > time.time():
+		_addresses[(host, port)] = (address, expires)
+
+
+def address_entry(host, port=161):
+	"""The resolved address of a host as dict to save, None if it was not resolved"""
+	if (host, port) not in _addresses:
+		return None
+	address, expires = _addresses[(host, port)]
+	return dict(address=list(address), expires=expires)
+
+
+def cached_address(host, port=161):
+	"""The address a host was resolved to, None if it was not resolved or has expired"""
+	address, expires = _addresses.get((host, port), (None, 0))
+	return address if expires > time.time() else None
+
+
+def cache_address(host, port, address):
+	_addresses[(host, port)] = (tuple(address), time.time() + RESOLVE_TTL)
+
+
+def resolve(host, port=161):
+	"""IPv4 address and port of a host, resolved once per RESOLVE_TTL for all clients of this process
+
+	Hosts that cannot be resolved are returned as they are, for pysnmp to report the error."""
+	address = cached_address(host, port)
+	if address is None:
+		try:
+			address = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)[0][4][:2]
+		except socket.gaierror:
+			return (host, port)
+		cache_address(host, port, address)
+	return address
+
+
+def _record_packet(snmp_engine, execpoint, variables, timer):  # pylint: disable=W0613
+	if execpoint == 'rfc3412.sendPdu':
+		timer['sent'].append(time.time())
+	else:
+		timer['received'] = time.time()
+
+
+def request_timer(snmp_engine):
+	"""When the packets of the last request through an SNMP engine were sent and its response was received
+
+	The times are taken by the engine itself, so configuring it and resolving
+	oids for a request is not counted as response time of the agent."""
+	timer = snmp_engine.getUserContext('ups_apc_snmp_timer')
+	if timer is None:
+		timer = dict(sent=[], received=None)
+		snmp_engine.observer.registerObserver(_record_packet, 'rfc3412.sendPdu', 'rfc3412.receiveMessage:response', cbCtx=timer)
+		snmp_engine.setUserContext(ups_apc_snmp_timer=timer)
+	return timer
+
+
+def is_too_big(error_indication, error_status):
+	return not error_indication and error_status and int(error_status) == TOO_BIG
+
+
+class TableWalk(object):
+	"""State of a GETBULK walk over table columns, ending every column exactly at the end of its subtree"""
+
+	def __init__(self, oids_trans, max_rows=None):
+		self.bases = [rfc1902.ObjectName(oid) for oid in oids_trans]
+		self.columns = [[] for _ in self.bases]
+		self.current = list(self.bases)
+		self.active = list(range(len(self.bases)))
+		self.max_rows = max_rows
+		self.pdus = 0
+
+	def done(self):
+		return not self.active
+
+	def next_oids(self):
+		"""The oids to continue the walk of all unfinished columns with"""
+		return [self.current[column] for column in self.active]
+
+	def feed(self, varbindtable):
+		"""Add the rows of one GETBULK response, which requested next_oids()"""
+		self.pdus += 1
+		finished = set()
+		advanced = set()
+		for row in varbindtable:
+			for column, (oid, value) in zip(self.active, row):
+				if column in finished:
+					continue
+				oid = rfc1902.ObjectName(oid)
+				if value.isSameTypeWith(rfc1905.endOfMibView) or not self.bases[column].isPrefixOf(oid) or oid <= self.current[column]:
+					finished.add(column)
+					continue
+				self.columns[column].append((oid, value))
+				self.current[column] = oid
+				advanced.add(column)
+				if self.max_rows is not None and len(self.columns[column]) >= self.max_rows:
+					finished.add(column)
+		# columns without progress would request the same oids forever
+		self.active = [column for column in self.active if column in advanced and column not in finished]
+
+	def rows(self):
+		"""The fetched varbinds as list of rows, in the format of pysnmp varbind tables"""
+		rows = []
+		for position in range(max([len(column) for column in self.columns] + [0])):
+			rows.append([column[position] for column in self.columns if position < len(column)])
+		return rows
+
+
 class SnmpClient(object):  # pylint: disable=R0902
 	"""Easy access to an snmp deamon on a host"""
 
-	def __init__(self, host, auth, port=161, timeout=2, retries=3):  # pylint: disable=R0913
-		"""Set up the client and detect the community to use"""
+	def __init__(self, host, auth, port=161, timeout=2, retries=3, snmp_engine=None, pdu_budget=None, lazy=False, rtt_estimator=None, deadline=None):  # pylint: disable=R0913
+		"""Set up the client and detect whether the agent is alive
+
+		A lazy client sends no request of its own for that: sysName and sysDescr are
+		requested together with the first getmany, alive is None until then.
+		With an rtt_estimator the timeout of each request is derived from the
+		response times of the agent, timeout is only its upper bound. With a
+		deadline no request waits past it, DeadlineExceeded is raised instead."""
 		self.host = host
 		self.port = port
-		self.alive = False
+		self.alive = None if lazy else False
 		self.sysname = None
 		self.sysdescr = None
 		self.auth = auth
 		self.timeout = timeout
 		self.retries = retries
+		self.requests = 0
+		self.last_walk_pdus = 0
+		self.pdu_budget = pdu_budget if pdu_budget is not None else get_pdu_budget(host, port)
+		self.rtt_estimator = rtt_estimator
+		self.deadline = deadline
 		self.error_indication = self.error_status = self.error_index = self.error_varbinds = None
 
-		(error_indication, error_status, error_index, varbinds) = cmdgen.CommandGenerator().getCmd(
-			auth,
-			cmdgen.UdpTransportTarget(
-				(self.host, self.port),
-				timeout=timeout,
-				retries=retries
-			),
-			nodeid('SNMPv2-MIB::sysName.0'),
-			nodeid('SNMPv2-MIB::sysDescr.0')
-		)
+		# engine and transport are kept for the whole lifetime of the client, so the
+		# socket is opened only once. A long running process can also pass in an
+		# engine to share it between clients, hostnames are resolved for all of them.
+		self.__own_engine = snmp_engine is None
+		self.__cmdgen = cmdgen.CommandGenerator(snmp_engine)
+		self.__transport = cmdgen.UdpTransportTarget(resolve(self.host, self.port), timeout=timeout, retries=retries)
+		self.address = self.__transport.transportAddr
+
+		if not lazy:
+			self.open()
+
+	def open(self):
+		"""Query sysName and sysDescr to detect whether the agent is alive"""
+		(error_indication, error_status, error_index, varbinds) = self.__command(self.__cmdgen.getCmd, *nodeids(HANDSHAKE_OIDS))
 		if error_indication or error_status:
 			self.__set_error(error_indication, error_status, error_index, varbinds)
+			self.alive = False
 		else:
 			assert len(varbinds) == 2
-			self.sysname = varbinds[0][1]
-			self.sysdescr = varbinds[1][1]
-			self.alive = True
+			self.__handshake_done(varbinds)
+
+	def __require_alive(self):
+		"""Do the handshake of a lazy client that has not sent any request yet"""
+		if self.alive is None:
+			self.open()
+			if not self.alive:
+				raise SnmpError("SNMP agent on %s is not reachable" % self.host, self.error_indication, self.error_status, self.error_index, self.error_varbinds)
+		assert self.alive is True
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		"""Release the SNMP engine and its transport sockets, unless the engine is shared"""
+		if self.__cmdgen is None:
+			return
+		dispatcher = self.__cmdgen.snmpEngine.transportDispatcher
+		if self.__own_engine and dispatcher is not None:
+			dispatcher.closeDispatcher()
+		self.__cmdgen = None
+		self.alive = False
 
 	def __set_error(self, error_indication, error_status, error_index, varbinds):
 		self.error_indication = error_indication
@@ -177,33 +595,157 @@ class SnmpClient(object):  # pylint: disable=R0902
 		self.error_index = error_index
 		self.error_varbinds = varbinds
 
+	def __command(self, command, *args, **kwargs):
+		"""Send a request with the retransmit timeout learned for the agent, once more with the full timeout if that was too short"""
+		timeout = self.rtt_estimator.timeout(self.timeout) if self.rtt_estimator is not None else self.timeout
+		result = self.__send(command, timeout, self.retries, args, kwargs)
+		if timeout < self.timeout and isinstance(result[0], errind.RequestTimedOut):
+			self.rtt_estimator.backoff()
+			result = self.__send(command, self.timeout, 0, args, kwargs)
+		return result
+
+	def __send(self, command, timeout, retries, args, kwargs):  # pylint: disable=R0913
+		capped = False
+		if self.deadline is not None:
+			# fewer retransmissions first, then a shorter timeout, in tenths like the learned ones
+			remaining = math.floor(self.deadline.remaining() * 10) / 10.0
+			if remaining <= 0:
+				raise DeadlineExceeded("Deadline of %ss reached before sending a request to %s" % (self.deadline.seconds, self.host))
+			capped = timeout * (retries + 1) > remaining
+			retries = min(retries, max(0, int(remaining / timeout) - 1))
+			timeout = min(timeout, remaining)
+
+		self.requests += 1
+		self.__transport.timeout = timeout
+		self.__transport.retries = retries
+		timer = request_timer(self.__cmdgen.snmpEngine) if self.rtt_estimator is not None else None
+		if timer is not None:
+			timer['sent'] = []
+			timer['received'] = None
+		result = command(self.auth, self.__transport, *args, **kwargs)
+		# responses to retransmissions would skew the estimate
+		if timer is not None and not result[0] and len(timer['sent']) == 1 and timer['received'] is not None:
+			self.rtt_estimator.sample(timer['received'] - timer['sent'][0])
+		if capped and isinstance(result[0], errind.RequestTimedOut):
+			raise DeadlineExceeded("Deadline of %ss reached waiting for a response from %s" % (self.deadline.seconds, self.host))
+		return result
+
 	def set_auth_data(self, community, version=V2C, community_index=None):
 		self.auth = cmdgen.CommunityData(community_index, community, version)
 
 	def get(self, *oids):
 		"""Get a specific node in the tree"""
-		assert self.alive is True
+		self.__require_alive()
 		# print "oids is", oids
 		oids_trans = nodeids(oids)
 		# print "oids_trans are", oids_trans
-		(error_indication, error_status, error_index, varbinds) = cmdgen.CommandGenerator().getCmd(self.auth, cmdgen.UdpTransportTarget((self.host, self.port), timeout=self.timeout, retries=self.retries), *oids_trans)
+		(error_indication, error_status, error_index, varbinds) = self.__command(self.__cmdgen.getCmd, *oids_trans)
 		if error_indication or error_status:
 			self.__set_error(error_indication, error_status, error_index, varbinds)
 			raise SnmpError("SNMP get command on %s of oid %r failed" % (self.host, oids), error_indication, error_status, error_index, varbinds)
 		return SnmpVarBinds(varbinds)
 
-	def gettable(self, *oids):
-		"""Get a complete subtable"""
-		assert self.alive is True
+	def getmany(self, oids, max_oids=None):
+		"""Get many nodes using as few requests as the agent accepts
+
+		The first call on a lazy client also does the handshake, if that fails alive
+		is False and SnmpError is raised."""
+		handshake = self.alive is None
+		assert self.alive is True or handshake
 		oids_trans = nodeids(oids)
-		(error_indication, error_status, error_index, varbinds) = cmdgen.CommandGenerator().bulkCmd(self.auth, cmdgen.UdpTransportTarget((self.host, self.port), timeout=self.timeout, retries=self.retries), 0, 25, *oids_trans)
+		extra = ()
+		if handshake:
+			# first, so the handshake is answered by the first request
+			handshake_trans = nodeids(HANDSHAKE_OIDS)
+			handshake_names = set(rfc1902.ObjectName(oid) for oid in handshake_trans)
+			extra = handshake_names - set(rfc1902.ObjectName(oid) for oid in oids_trans)
+			oids_trans = handshake_trans + tuple(oid for oid in oids_trans if rfc1902.ObjectName(oid) not in handshake_names)
+		varbinds = []
+		try:
+			start = 0
+			while start < len(oids_trans):
+				# the budget shrinks as soon as a chunk was too big, the next ones use the new size
+				size = min(max_oids or self.pdu_budget.max_oids, self.pdu_budget.max_oids)
+				varbinds.extend(self.__get_chunk(oids, oids_trans[start:start + size]))
+				start += size
+		except SnmpError:
+			if handshake:
+				self.__handshake_done(varbinds)
+			raise
+		if handshake:
+			self.__handshake_done(varbinds)
+			varbinds = [(oid, value) for oid, value in varbinds if rfc1902.ObjectName(oid) not in extra]
+		return SnmpVarBinds(varbinds)
+
+	def __handshake_done(self, varbinds):
+		"""Take sysName and sysDescr from the varbinds of the handshake, the agent is alive if they were answered"""
+		values = dict((rfc1902.ObjectName(oid), value) for oid, value in varbinds)
+		sysname, sysdescr = [rfc1902.ObjectName(nodeid(oid)) for oid in HANDSHAKE_OIDS]
+		if sysname not in values or sysdescr not in values:
+			self.alive = False
+			return
+		self.sysname = values[sysname]
+		self.sysdescr = values[sysdescr]
+		self.alive = True
+
+	def __get_chunk(self, oids, oids_trans):
+		"""Get a list of translated oids in one request, splitting it in halves if the agent answers tooBig"""
+		(error_indication, error_status, error_index, varbinds) = self.__command(self.__cmdgen.getCmd, *oids_trans)
+		if is_too_big(error_indication, error_status) and len(oids_trans) > 1:
+			self.pdu_budget.shrink_oids(len(oids_trans))
+			half = len(oids_trans) // 2
+			return self.__get_chunk(oids, oids_trans[:half]) + self.__get_chunk(oids, oids_trans[half:])
 		if error_indication or error_status:
 			self.__set_error(error_indication, error_status, error_index, varbinds)
-			raise SnmpError("SNMP getnext on %s of oid %r failed" % (self.host, oids), error_indication, error_status, error_index, varbinds)
-		return SnmpVarBinds(varbinds)
+			raise SnmpError("SNMP get command on %s of oid %r failed" % (self.host, oids), error_indication, error_status, error_index, varbinds)
+		return list(varbinds)
+
+	def __walk(self, oids, max_rows=None, max_pdus=None):
+		"""Walk the columns below oids, adapting the GETBULK size to the agent"""
+		# in the order given, getcolumns names the walked columns by position
+		walk = TableWalk([nodeid(oid) for oid in oids], max_rows)
+		retried_timeout = False
+		while not walk.done() and (max_pdus is None or walk.pdus < max_pdus):
+			max_repetitions = self.pdu_budget.max_repetitions
+			started = time.time()
+			# single GETBULK steps, TableWalk decides where each column ends
+			(error_indication, error_status, error_index, varbindtable) = self.__command(self.__cmdgen.bulkCmd, 0, max_repetitions, *walk.next_oids(), lexicographicMode=True, maxCalls=1)
+			elapsed = time.time() - started
+			if max_repetitions > 1 and is_too_big(error_indication, error_status):
+				self.pdu_budget.shrink_repetitions()
+				continue
+			if max_repetitions > 1 and isinstance(error_indication, errind.RequestTimedOut) and not retried_timeout:
+				# small agents may drop large GETBULK requests instead of answering tooBig
+				retried_timeout = True
+				self.pdu_budget.shrink_repetitions(too_big=False)
+				continue
+			if error_indication or error_status:
+				self.__set_error(error_indication, error_status, error_index, varbindtable)
+				raise SnmpError("SNMP getnext on %s of oid %r failed" % (self.host, oids), error_indication, error_status, error_index, varbindtable)
+			walk.feed(varbindtable)
+			if elapsed < FAST_RESPONSE_TIME and len(varbindtable) >= max_repetitions:
+				self.pdu_budget.grow_repetitions()
+		self.last_walk_pdus = walk.pdus
+		return walk
+
+	def gettable(self, *oids, **kwargs):
+		"""Get a complete subtable as SnmpTable keyed by MIB symbols, optionally limited to max_rows rows per column and max_pdus requests
+
+		The number of requests used is available as last_walk_pdus afterwards."""
+		self.__require_alive()
+		walk = self.__walk(oids, **kwargs)
+		return SnmpTable.from_walk(walk.bases, walk.columns)
+
+	def getcolumns(self, *columns, **kwargs):
+		"""Get only the given columns of a table, walking them in parallel
+
+		Returns an SnmpTable with the columns keyed by their names as given."""
+		self.__require_alive()
+		walk = self.__walk(columns, **kwargs)
+		return SnmpTable.from_walk(walk.bases, walk.columns, columns)
 
 	def set(self, *oidvalues):
-		assert self.alive is True
+		self.__require_alive()
 		oidvalues_trans = []
 		for oid, value in oidvalues:
 			if isinstance(oid, tuple):
@@ -228,7 +770,7 @@ class SnmpClient(object):  # pylint: disable=R0902
 				oidvalues_trans.append((nodeid(oid), value))
 
 		(error_indication, error_status, error_index, varbinds) = \
-			cmdgen.CommandGenerator().setCmd(self.auth, cmdgen.UdpTransportTarget((self.host, self.port), timeout=self.timeout, retries=self.retries), *oidvalues_trans)  # pylint: disable=W0612
+			self.__command(self.__cmdgen.setCmd, *oidvalues_trans)  # pylint: disable=W0612
 		if error_indication or error_status:
 			self.__set_error(error_indication, error_status, error_index, varbinds)
 			raise SnmpError("SNMP set command on %s of oid values %r failed" % (self.host, oidvalues_trans), error_indication, error_status, error_index, varbinds)
@@ -237,33 +779,10 @@ class SnmpClient(object):  # pylint: disable=R0902
 	def matchtables(self, index, *tables):
 		"""Match a list of tables using either a specific index table or the
 		common tail of the OIDs in the tables"""
-		assert self.alive is True
-		oid_to_index = {}
-		result = {}
-		indexlen = 1
+		self.__require_alive()
 		if index:
-			#  Use the index if available
-			varbinds = self.gettable(index)
-			for entry in varbinds.get_varbinds():
-				oid, index = entry[0]
-				oid_to_index[oid[-indexlen:]] = index
-				result[index] = []
-		else:
-			# Generate an index from the first table
-			baselen = len(nodeid(tables[0]))
-			varbinds = self.gettable(tables[0])
-			for oid, value in varbinds.get_varbinds():
-				indexlen = len(oid) - baselen
-				oid_to_index[oid[-indexlen:]] = oid[-indexlen:]
-				result[oid[-indexlen:]] = [value]
-			tables = tables[1:]
-		# Fetch the tables and match indices
-		res = self.gettable(*tables)
-		for entry in res.get_varbinds():
-			for oid, value in entry:
-				index = oid_to_index[oid[-indexlen:]]
-				result[index].append(value)
-		return result
+			return self.getcolumns(index, *tables).reindex(index)
+		return self.getcolumns(*tables)
 
 
 class SnmpVarBinds(object):
@@ -286,11 +805,11 @@ class SnmpVarBinds(object):
 				if isinstance(entry, list):
 					for oid, value in entry:
 						# always store internal data using rfc1902.ObjectNames, which are pyasn1 ObjectIdentifiers, which behave like tuples
-						if not value.isSameTypeWith(rfc1905.noSuchObject):
+						if not is_missing(value):
 							self.__varbinds_dict[rfc1902.ObjectName(oid)] = value
 				else:
 					oid, value = entry
-					if not value.isSameTypeWith(rfc1905.noSuchObject):
+					if not is_missing(value):
 						self.__varbinds_dict[rfc1902.ObjectName(oid)] = value
 
 	def get_by_dict(self, oid):
@@ -320,11 +839,19 @@ class SnmpVarBinds(object):
 		return self.get_by_dict(oid)
 
 	def get_named_value(self, oid=None):
-		name = nodename(list(self.get_dict().keys())[0]).split("::")
+		value = self.get_by_dict(oid)
+		if oid is None:
+			oid = list(self.get_dict().keys())[0]
+		name = nodename(nodeid(oid)).split("::")
 		mibname = name[0]
 		objectname = name[1].split(".0")[0]
 		namedvalues = get_namedvalues(mibname, objectname)
-		return namedvalues.getName(self.get_by_dict(oid))
+		return namedvalues.getName(value)
+
+	def has_value(self, oid):
+		"""Check whether the agent returned a value for the oid"""
+		self.dictify()
+		return rfc1902.ObjectName(nodeid(oid)) in self.__varbinds_dict
 
 	def get_varbinds(self):
 		return self.__varbinds
@@ -336,15 +863,7 @@ class SnmpVarBinds(object):
 	def __get_json(self, keytype=str):
 		json = {}
 		for key, value in list(self.get_dict().items()):
-			if isinstance(value, univ.OctetString):
-				value = str(value)
-			elif isinstance(value, univ.Integer):
-				value = int(value)  # pylint:disable=R0204
-			elif isinstance(value, univ.ObjectIdentifier):
-				value = str(value)
-			else:
-				raise AssertionError("Unknown type %s encountered for oid %s" % (value.__class__.__name__, key))
-			json[keytype(key)] = value
+			json[keytype(key)] = plain_value(value, key)
 		return json
 
 	def get_json_oid(self):
@@ -352,3 +871,75 @@ class SnmpVarBinds(object):
 
 	def get_json_name(self):
 		return self.__get_json(keytype=nodename)
+
+
+def _pack_column(values):
+	"""Store a column holding only integers as array, any other column as list"""
+	if values and all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+		try:
+			return array.array('l', values)
+		except OverflowError:
+			pass
+	return values
+
+
+class SnmpTable(object):
+	"""Rows of a table walk, with row indices decoded once and values stored by column
+
+	Every column is a sequence aligned with indices, holding plain Python
+	values and None for cells the agent did not return."""
+
+	def __init__(self, indices, columns):
+		self.indices = indices
+		self.columns = columns
+		self.__positions = None
+
+	@classmethod
+	def from_walk(cls, bases, walked, names=None):
+		"""Decode the varbinds walked below bases, keyed by names of the walked columns or else by the MIB symbols found"""
+		cells = collections.OrderedDict((name, {}) for name in names or [])
+		for position, varbinds in enumerate(walked):
+			baselen = len(bases[position])
+			for oid, value in varbinds:
+				if names is None:
+					column, index = split_column(oid)
+				else:
+					column, index = names[position], tuple(oid[baselen:])
+				cells.setdefault(column, {})[index] = plain_value(value, oid)
+		indices = sorted(set(index for values in cells.values() for index in values))
+		columns = collections.OrderedDict((column, _pack_column([values.get(index) for index in indices])) for column, values in cells.items())
+		return cls(indices, columns)
+
+	def __len__(self):
+		return len(self.indices)
+
+	def __repr__(self):
+		return "SnmpTable(%d rows, columns %r)" % (len(self.indices), list(self.columns.keys()))
+
+	def column(self, name):
+		return self.columns[name]
+
+	def row(self, index):
+		"""The cells of the row with the given index as dict of column name to value"""
+		if self.__positions is None:
+			self.__positions = dict((row_index, position) for position, row_index in enumerate(self.indices))
+		position = self.__positions[index]
+		return dict((name, values[position]) for name, values in self.columns.items() if values[position] is not None)
+
+	def rows(self, *names):
+		"""Iterate over (index, row) pairs, rows as dict of column name to value, projected to names if given"""
+		names = names or list(self.columns.keys())
+		columns = [self.columns[name] for name in names]
+		for position, index in enumerate(self.indices):
+			yield index, dict((name, values[position]) for name, values in zip(names, columns) if values[position] is not None)
+
+	def project(self, *names):
+		"""Table of only the named columns, sharing their storage"""
+		return SnmpTable(self.indices, collections.OrderedDict((name, self.columns[name]) for name in names))
+
+	def reindex(self, name):
+		"""Table indexed by the values of a column instead of the row indices, without that column"""
+		keys = self.columns[name]
+		positions = [position for position, key in enumerate(keys) if key is not None]
+		columns = collections.OrderedDict((other, _pack_column([values[position] for position in positions])) for other, values in self.columns.items() if other != name)
+		return SnmpTable([keys[position] for position in positions], columns)
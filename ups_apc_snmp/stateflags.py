@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Decoder of the upsBasicStateOutputState flag string of PowerNet-MIB
+
+The string holds 64 characters '0' or '1', flag 1 first, and encodes the
+states otherwise read from upsBasicOutputStatus, upsBasicBatteryStatus and
+upsAdvBatteryReplaceIndicator in a single varbind."""
+
+STATE_FLAGS_OID = 'PowerNet-MIB::upsBasicStateOutputState.0'
+
+# Names of the flags by position, as documented in PowerNet-MIB, None for unused flags
+STATE_FLAGS = (
+	'abnormalCondition', 'onBattery', 'lowBattery', 'onLine',
+	'replaceBattery', 'serialCommunication', 'avrBoost', 'avrTrim',
+	'overload', 'runtimeCalibration', 'batteriesDischarged', 'manualBypass',
+	'softwareBypass', 'bypassInternalFault', 'bypassSupplyFailure', 'bypassFanFailure',
+	'sleepingOnTimer', 'sleepingUntilPowerReturn', 'on', 'rebooting',
+	'batteryCommunicationLost', 'gracefulShutdownInitiated', 'boostTrimFault', 'badOutputVoltage',
+	'batteryChargerFailure', 'highBatteryTemperature', 'warningBatteryTemperature', 'criticalBatteryTemperature',
+	'selfTestInProgress', 'lowBatteryOnBattery', 'shutdownByUpstream', 'shutdownByDownstream',
+	'noBatteriesAttached', 'synchronizedCommand', 'synchronizedSleeping', 'synchronizedRebooting',
+	'inverterDcImbalance', 'transferRelayFailure', 'shutdownOrUnableToTransfer', 'lowBatteryShutdown',
+	'fanFailure', 'mainRelayFailure', 'bypassRelayFailure', 'temporaryBypass',
+	'highInternalTemperature', 'batteryTemperatureSensorFault', 'inputOutOfRangeForBypass', 'dcBusOvervoltage',
+	'pfcFailure', 'criticalHardwareFault', 'ecoMode', 'hotStandby',
+	'epoActivated', 'loadAlarmViolation', 'bypassPhaseFault', 'internalCommunicationFailure',
+	'efficiencyBoosterMode', 'off', 'standby', None,
+	None, None, None, None,
+)
+
+# Flags mapped to upsBasicOutputStatus values, the first flag set decides
+OUTPUT_STATUS_FLAGS = (
+	('off', 'off'),
+	('rebooting', 'rebooting'),
+	('sleepingOnTimer', 'timedSleeping'),
+	('sleepingUntilPowerReturn', 'sleepingUntilPowerReturn'),
+	('bypassInternalFault', 'hardwareFailureBypass'),
+	('bypassSupplyFailure', 'hardwareFailureBypass'),
+	('bypassFanFailure', 'hardwareFailureBypass'),
+	('manualBypass', 'switchedBypass'),
+	('softwareBypass', 'softwareBypass'),
+	('onBattery', 'onBattery'),
+	('avrBoost', 'onSmartBoost'),
+	('avrTrim', 'onSmartTrim'),
+	('ecoMode', 'ecoMode'),
+	('hotStandby', 'hotStandby'),
+	('onLine', 'onLine'),
+)
+
+# Flags reported by upsBasicBatteryStatus as batteryInFaultCondition
+BATTERY_FAULT_FLAGS = frozenset(['batteryChargerFailure', 'noBatteriesAttached'])
+
+
+def decode_state_flags(value):
+	"""Set of the names of the flags set in a flag string, None if the agent did not report valid flags"""
+	value = str(value)
+	if len(value) != len(STATE_FLAGS) or value.strip('01'):
+		return None
+	return frozenset(name for name, flag in zip(STATE_FLAGS, value) if flag == '1' and name is not None)
+
+
+def derive_states(flags):
+	"""Values of the output_status, battery_status and battery_replace_indicator metrics, None if the flags do not tell the output status"""
+	for flag, status in OUTPUT_STATUS_FLAGS:
+		if flag in flags:
+			output_status = status
+			break
+	else:
+		return None
+
+	if flags & BATTERY_FAULT_FLAGS:
+		battery_status = 'batteryInFaultCondition'
+	elif 'lowBattery' in flags:
+		battery_status = 'batteryLow'
+	else:
+		battery_status = 'batteryNormal'
+
+	return dict(output_status=output_status, battery_status=battery_status, battery_replace_indicator='replaceBattery' not in flags)